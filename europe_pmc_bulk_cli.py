@@ -41,6 +41,9 @@ Usage:
     # Import with limit
     python europe_pmc_bulk_cli.py import --output-dir ~/europepmc --limit 5
 
+    # Bulk import: parse packages in 4 processes, larger COPY batches
+    python europe_pmc_bulk_cli.py import --output-dir ~/europepmc --parser-processes 4 --batch-size 2000
+
     # Show import status
     python europe_pmc_bulk_cli.py import-status --output-dir ~/europepmc
 
@@ -375,7 +378,8 @@ def cmd_import(args: argparse.Namespace) -> int:
         importer = EuropePMCImporter(
             packages_dir=packages_dir,
             batch_size=args.batch_size,
-            update_existing=not args.no_update
+            update_existing=not args.no_update,
+            ingest_mode=args.ingest_mode
         )
 
         packages = importer.list_packages()
@@ -397,7 +401,8 @@ def cmd_import(args: argparse.Namespace) -> int:
 
         result = importer.import_all_packages(
             progress_callback=progress_callback,
-            limit=args.limit
+            limit=args.limit,
+            parser_processes=args.parser_processes
         )
 
         print("\n" + "=" * 70)
@@ -409,6 +414,14 @@ def cmd_import(args: argparse.Namespace) -> int:
         print(f"Articles skipped: {result['skipped_articles']}")
         print(f"Articles failed: {result['failed_articles']}")
 
+        if result['package_stats']:
+            print("\nPer-package results:")
+            for pkg in result['package_stats']:
+                print(
+                    f"  {pkg['package']}: {pkg['articles']} articles, "
+                    f"{pkg['failed']} failed, {pkg['articles_per_second']:,.0f} articles/sec"
+                )
+
         if result['errors']:
             print(f"\nErrors: {result['errors']}")
             print("Recent errors:")
@@ -677,6 +690,18 @@ def main() -> int:
         action='store_true',
         help='Skip updating existing records (only insert new)'
     )
+    import_parser.add_argument(
+        '--ingest-mode',
+        choices=['copy', 'row'],
+        default='copy',
+        help='Write strategy: COPY + set-based merge per batch (default) or one upsert per article'
+    )
+    import_parser.add_argument(
+        '--parser-processes',
+        type=int,
+        default=0,
+        help='Parse packages in N parallel processes (default: 0, sequential import)'
+    )
 
     # Import status command
     import_status_parser = subparsers.add_parser(
@@ -82,6 +82,7 @@ def cmd_import(args: argparse.Namespace) -> int:
     print(f"Year: {year}")
     print(f"Include supplementary concepts: {include_supplementary}")
     print(f"Download directory: {args.download_dir or 'default'}")
+    print(f"Ingest mode: {args.ingest_mode}")
     print()
 
     if not args.yes:
@@ -95,6 +96,7 @@ def cmd_import(args: argparse.Namespace) -> int:
         importer = MeSHImporter(
             download_dir=download_dir,
             keep_downloads=not args.delete_downloads,
+            ingest_mode=args.ingest_mode,
         )
 
         def progress_callback(phase: str, processed: int, total: int) -> None:
@@ -402,6 +404,12 @@ Examples:
         action="store_true",
         help="Delete downloaded files after import",
     )
+    import_parser.add_argument(
+        "--ingest-mode",
+        choices=["copy", "row"],
+        default="copy",
+        help="Descriptor load strategy: COPY + set-based merge (default) or one INSERT per row",
+    )
     import_parser.add_argument(
         "-y", "--yes",
         action="store_true",
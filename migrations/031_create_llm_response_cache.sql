@@ -0,0 +1,25 @@
+-- Migration 031: LLM response cache table
+--
+-- Backing store for the "postgres" backend of bmlibrarian.llm.response_cache.
+-- Responses are keyed by a SHA-256 hash of (model, messages, generation
+-- options) so identical agent requests from any worker can be replayed
+-- without a model call. Rows past expires_at are ignored on read and
+-- replaced on write; PostgresResponseCacheBackend.purge_expired() deletes
+-- them.
+--
+-- Idempotent: CREATE ... IF NOT EXISTS. No migration-tracking statements
+-- (handled by MigrationManager).
+
+CREATE TABLE IF NOT EXISTS public.llm_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    expires_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires_at
+    ON public.llm_response_cache (expires_at)
+    WHERE expires_at IS NOT NULL;
+
+COMMENT ON TABLE public.llm_response_cache IS
+    'Cached LLM chat responses keyed by request hash (bmlibrarian.llm.response_cache)';
@@ -0,0 +1,288 @@
+-- Migration 032: Document search functions that accept a query embedding
+--
+-- semantic_search_document(), semantic.chunksearch_document() and
+-- semantic.hybrid_chunksearch_document() call ollama_embedding() on every
+-- invocation. SemanticQueryAgent retries the same query at several
+-- thresholds (and document Q&A re-runs it for diagnostics), so the server
+-- embedded identical text over and over. The *_by_embedding variants below
+-- take the query vector from the client, which embeds each query once and
+-- reuses it for every retry. Results are identical to the text functions
+-- given the same embedding model.
+--
+-- Idempotent: DROP FUNCTION IF EXISTS + CREATE OR REPLACE. No
+-- migration-tracking statements (handled by MigrationManager).
+
+DROP FUNCTION IF EXISTS semantic_search_document_by_embedding(INTEGER, vector, FLOAT, INTEGER);
+DROP FUNCTION IF EXISTS semantic.chunksearch_document_by_embedding(INTEGER, vector, FLOAT, INTEGER);
+DROP FUNCTION IF EXISTS semantic.hybrid_chunksearch_document_by_embedding(INTEGER, vector, TEXT, FLOAT, INTEGER, FLOAT, INTEGER);
+
+-- ============================================================================
+-- Abstract chunks (emb_1024)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION semantic_search_document_by_embedding(
+    p_document_id INTEGER,
+    p_query_embedding vector,
+    threshold FLOAT DEFAULT 0.7,
+    result_limit INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+    chunk_id INTEGER,
+    chunk_no INTEGER,
+    score FLOAT,
+    chunk_text TEXT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_document_id IS NULL THEN
+        RAISE EXCEPTION 'document_id cannot be null';
+    END IF;
+
+    IF p_query_embedding IS NULL THEN
+        RAISE EXCEPTION 'query_embedding cannot be null';
+    END IF;
+
+    IF threshold < 0.0 OR threshold > 1.0 THEN
+        RAISE EXCEPTION 'threshold must be between 0.0 and 1.0';
+    END IF;
+
+    IF result_limit < 1 THEN
+        RAISE EXCEPTION 'result_limit must be at least 1';
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        e.chunk_id,
+        c.chunk_no,
+        (1 - (e.embedding <=> p_query_embedding))::FLOAT AS similarity_score,
+        c.text AS chunk_text
+    FROM
+        emb_1024 e
+        JOIN chunks c ON e.chunk_id = c.id
+    WHERE
+        c.document_id = p_document_id
+        AND (1 - (e.embedding <=> p_query_embedding)) >= threshold
+    ORDER BY
+        e.embedding <=> p_query_embedding
+    LIMIT result_limit;
+END;
+$$;
+
+COMMENT ON FUNCTION semantic_search_document_by_embedding(INTEGER, vector, FLOAT, INTEGER) IS
+'Same as semantic_search_document() but takes a precomputed query embedding
+(snowflake-arctic-embed2, 1024 dimensions) instead of query text.
+
+Example:
+  SELECT * FROM semantic_search_document_by_embedding(12345, $1::vector, 0.7, 5);';
+
+-- ============================================================================
+-- Full-text chunks (semantic.chunks)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION semantic.chunksearch_document_by_embedding(
+    p_document_id INTEGER,
+    p_query_embedding vector,
+    threshold FLOAT DEFAULT 0.7,
+    result_limit INTEGER DEFAULT 5
+)
+RETURNS TABLE (
+    chunk_id INTEGER,
+    chunk_no INTEGER,
+    score FLOAT,
+    chunk_text TEXT
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_document_id IS NULL THEN
+        RAISE EXCEPTION 'document_id cannot be null';
+    END IF;
+
+    IF p_query_embedding IS NULL THEN
+        RAISE EXCEPTION 'query_embedding cannot be null';
+    END IF;
+
+    IF threshold < 0.0 OR threshold > 1.0 THEN
+        RAISE EXCEPTION 'threshold must be between 0.0 and 1.0';
+    END IF;
+
+    IF result_limit < 1 THEN
+        RAISE EXCEPTION 'result_limit must be at least 1';
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        c.id AS chunk_id,
+        c.chunk_no,
+        (1 - (c.embedding <=> p_query_embedding))::FLOAT AS similarity_score,
+        substr(d.full_text, c.start_pos + 1, c.end_pos - c.start_pos + 1) AS chunk_text
+    FROM
+        semantic.chunks c
+        JOIN public.document d ON c.document_id = d.id
+    WHERE
+        c.document_id = p_document_id
+        AND d.withdrawn_date IS NULL
+        AND d.full_text IS NOT NULL
+        AND (1 - (c.embedding <=> p_query_embedding)) >= threshold
+    ORDER BY
+        c.embedding <=> p_query_embedding
+    LIMIT result_limit;
+END;
+$$;
+
+COMMENT ON FUNCTION semantic.chunksearch_document_by_embedding(INTEGER, vector, FLOAT, INTEGER) IS
+'Same as semantic.chunksearch_document() but takes a precomputed query
+embedding instead of query text, so callers retrying one query at several
+thresholds embed it only once.
+
+Example:
+  SELECT * FROM semantic.chunksearch_document_by_embedding(12345, $1::vector, 0.5, 10);';
+
+-- ============================================================================
+-- Hybrid (semantic + keyword, RRF) on full-text chunks
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION semantic.hybrid_chunksearch_document_by_embedding(
+    p_document_id INTEGER,
+    p_query_embedding vector,
+    p_query_text TEXT,
+    p_semantic_threshold FLOAT DEFAULT 0.3,
+    p_max_results INTEGER DEFAULT 10,
+    p_semantic_weight FLOAT DEFAULT 0.6,
+    p_rrf_k INTEGER DEFAULT 60
+)
+RETURNS TABLE (
+    chunk_id INTEGER,
+    chunk_no INTEGER,
+    score FLOAT,
+    chunk_text TEXT,
+    semantic_score FLOAT,
+    keyword_score FLOAT,
+    match_source TEXT
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    ts_query tsquery;
+    text_config REGCONFIG;
+BEGIN
+    IF p_document_id IS NULL THEN
+        RAISE EXCEPTION 'document_id cannot be null';
+    END IF;
+
+    IF p_query_embedding IS NULL THEN
+        RAISE EXCEPTION 'query_embedding cannot be null';
+    END IF;
+
+    IF p_query_text IS NULL OR p_query_text = '' THEN
+        RAISE EXCEPTION 'query_text cannot be null or empty';
+    END IF;
+
+    IF p_semantic_threshold < 0.0 OR p_semantic_threshold > 1.0 THEN
+        RAISE EXCEPTION 'semantic_threshold must be between 0.0 and 1.0';
+    END IF;
+
+    IF p_semantic_weight < 0.0 OR p_semantic_weight > 1.0 THEN
+        RAISE EXCEPTION 'semantic_weight must be between 0.0 and 1.0';
+    END IF;
+
+    IF p_max_results < 1 THEN
+        RAISE EXCEPTION 'max_results must be at least 1';
+    END IF;
+
+    text_config := COALESCE(
+        current_setting('bmlibrarian.text_config', true)::REGCONFIG,
+        'english'::REGCONFIG
+    );
+
+    -- The keyword side still needs the query text
+    ts_query := websearch_to_tsquery(text_config, p_query_text);
+
+    RETURN QUERY
+    WITH
+    semantic_results AS (
+        SELECT
+            c.id AS chunk_id,
+            c.chunk_no,
+            (1 - (c.embedding <=> p_query_embedding))::FLOAT AS sem_score,
+            ROW_NUMBER() OVER (ORDER BY c.embedding <=> p_query_embedding) AS sem_rank
+        FROM semantic.chunks c
+        WHERE c.document_id = p_document_id
+          AND (1 - (c.embedding <=> p_query_embedding)) >= p_semantic_threshold
+        ORDER BY c.embedding <=> p_query_embedding
+        LIMIT p_max_results * 3  -- Get extra for fusion
+    ),
+    keyword_results AS (
+        SELECT
+            c.id AS chunk_id,
+            c.chunk_no,
+            ts_rank_cd(c.ts_vector, ts_query)::FLOAT AS kw_score,
+            ROW_NUMBER() OVER (ORDER BY ts_rank_cd(c.ts_vector, ts_query) DESC) AS kw_rank
+        FROM semantic.chunks c
+        WHERE c.document_id = p_document_id
+          AND c.ts_vector IS NOT NULL
+          AND c.ts_vector @@ ts_query
+        ORDER BY ts_rank_cd(c.ts_vector, ts_query) DESC
+        LIMIT p_max_results * 3  -- Get extra for fusion
+    ),
+    -- RRF: score = semantic_weight/(k + sem_rank) + (1 - semantic_weight)/(k + kw_rank)
+    combined AS (
+        SELECT
+            COALESCE(s.chunk_id, k.chunk_id) AS chunk_id,
+            COALESCE(s.chunk_no, k.chunk_no) AS chunk_no,
+            COALESCE(s.sem_score, 0.0) AS semantic_score,
+            COALESCE(k.kw_score, 0.0) AS keyword_score,
+            (
+                CASE WHEN s.sem_rank IS NOT NULL
+                     THEN p_semantic_weight * (1.0 / (p_rrf_k + s.sem_rank))
+                     ELSE 0.0 END
+                +
+                CASE WHEN k.kw_rank IS NOT NULL
+                     THEN (1.0 - p_semantic_weight) * (1.0 / (p_rrf_k + k.kw_rank))
+                     ELSE 0.0 END
+            )::FLOAT AS combined_score,
+            CASE
+                WHEN s.chunk_id IS NOT NULL AND k.chunk_id IS NOT NULL THEN 'both'
+                WHEN s.chunk_id IS NOT NULL THEN 'semantic'
+                ELSE 'keyword'
+            END AS source
+        FROM semantic_results s
+        FULL OUTER JOIN keyword_results k ON s.chunk_id = k.chunk_id
+    )
+    SELECT
+        co.chunk_id,
+        co.chunk_no,
+        co.combined_score AS score,
+        substr(d.full_text, c.start_pos + 1, c.end_pos - c.start_pos + 1) AS chunk_text,
+        co.semantic_score,
+        co.keyword_score,
+        co.source AS match_source
+    FROM combined co
+    JOIN semantic.chunks c ON co.chunk_id = c.id
+    JOIN public.document d ON c.document_id = d.id
+    WHERE d.withdrawn_date IS NULL
+      AND d.full_text IS NOT NULL
+    ORDER BY co.combined_score DESC
+    LIMIT p_max_results;
+END;
+$$;
+
+COMMENT ON FUNCTION semantic.hybrid_chunksearch_document_by_embedding(INTEGER, vector, TEXT, FLOAT, INTEGER, FLOAT, INTEGER) IS
+'Same as semantic.hybrid_chunksearch_document() but takes a precomputed
+query embedding for the semantic side. p_query_text is still required for
+the keyword (websearch_to_tsquery) side.
+
+Example:
+  SELECT * FROM semantic.hybrid_chunksearch_document_by_embedding(
+    12345, $1::vector, ''heart rate during exercise'', 0.3, 10, 0.6, 60
+  );';
+
+-- ============================================================================
+-- Grant permissions
+-- ============================================================================
+
+-- Public documents only; see migration 018 for the rationale.
+GRANT EXECUTE ON FUNCTION semantic_search_document_by_embedding(INTEGER, vector, FLOAT, INTEGER) TO PUBLIC;
+GRANT EXECUTE ON FUNCTION semantic.chunksearch_document_by_embedding(INTEGER, vector, FLOAT, INTEGER) TO PUBLIC;
+GRANT EXECUTE ON FUNCTION semantic.hybrid_chunksearch_document_by_embedding(INTEGER, vector, TEXT, FLOAT, INTEGER, FLOAT, INTEGER) TO PUBLIC;
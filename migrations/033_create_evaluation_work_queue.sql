@@ -0,0 +1,55 @@
+-- Migration 033: Distributed work queue for evaluation runs
+--
+-- Lets several worker processes (on one or many machines) share a single
+-- evaluations.evaluation_runs row. The coordinator enqueues the document ids
+-- a run still has to evaluate; workers claim them with
+-- SELECT ... FOR UPDATE SKIP LOCKED, hold a time-limited lease that they
+-- renew with heartbeats, and write results through
+-- EvaluationStore.save_evaluations_batch(). Leases that expire (crashed or
+-- disconnected worker) are handed back by RunWorkQueue.recover_abandoned_leases().
+--
+-- Idempotent: CREATE ... IF NOT EXISTS. No migration-tracking statements
+-- (handled by MigrationManager).
+
+CREATE TABLE IF NOT EXISTS evaluations.run_work_items (
+    run_id BIGINT NOT NULL REFERENCES evaluations.evaluation_runs(run_id) ON DELETE CASCADE,
+    document_id BIGINT NOT NULL,
+    evaluation_type VARCHAR(50) NOT NULL,
+
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN (
+        'pending',   -- waiting for a worker
+        'claimed',   -- leased by worker_id until lease_expires_at
+        'done',      -- evaluation saved in document_evaluations
+        'failed'     -- gave up after max attempts
+    )),
+
+    worker_id TEXT,
+    lease_expires_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (run_id, evaluation_type, document_id)
+);
+
+-- Claim path: pending items of one run/type in document order
+CREATE INDEX IF NOT EXISTS idx_run_work_items_pending
+    ON evaluations.run_work_items (run_id, evaluation_type, document_id)
+    WHERE status = 'pending';
+
+-- Heartbeat and lease recovery paths
+CREATE INDEX IF NOT EXISTS idx_run_work_items_claimed
+    ON evaluations.run_work_items (run_id, lease_expires_at)
+    WHERE status = 'claimed';
+
+CREATE INDEX IF NOT EXISTS idx_run_work_items_worker
+    ON evaluations.run_work_items (worker_id)
+    WHERE status = 'claimed';
+
+COMMENT ON TABLE evaluations.run_work_items IS
+    'Per-document work items shared by distributed workers of an evaluation run (bmlibrarian.evaluations.work_queue)';
+COMMENT ON COLUMN evaluations.run_work_items.lease_expires_at IS
+    'Claim is abandoned after this time unless renewed by a heartbeat';
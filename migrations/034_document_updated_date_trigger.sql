@@ -0,0 +1,30 @@
+-- Migration 034: Keep document.updated_date current on every update
+--
+-- bmlibrarian.db_documents caches document rows per process and serves a
+-- cached row only while its updated_date still matches the database. Most
+-- writers already set updated_date = CURRENT_TIMESTAMP, but not all of them
+-- do; this trigger bumps it for any UPDATE that leaves it unchanged, so a
+-- changed row can never look fresh.
+--
+-- Idempotent: CREATE OR REPLACE / DROP ... IF EXISTS. No migration-tracking
+-- statements (handled by MigrationManager).
+
+CREATE OR REPLACE FUNCTION public.touch_document_updated_date()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.updated_date IS NOT DISTINCT FROM OLD.updated_date THEN
+        NEW.updated_date := CURRENT_TIMESTAMP;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_document_touch_updated_date ON public.document;
+
+CREATE TRIGGER trg_document_touch_updated_date
+BEFORE UPDATE ON public.document
+FOR EACH ROW
+EXECUTE FUNCTION public.touch_document_updated_date();
+
+COMMENT ON FUNCTION public.touch_document_updated_date() IS
+    'Sets document.updated_date on UPDATE unless the statement set it explicitly (cache invalidation for bmlibrarian.db_documents)';
@@ -19,6 +19,12 @@ Usage:
     # Import only baseline files
     python pubmed_bulk_cli.py import --type baseline
 
+    # Bulk ingest: COPY each batch into a staging table, merge set-based
+    python pubmed_bulk_cli.py import --bulk --batch-size 5000
+
+    # Parse files in 6 processes, store with 2 writer threads
+    python pubmed_bulk_cli.py import --bulk --parser-processes 6 --writers 2
+
     # Show download/import status
     python pubmed_bulk_cli.py status
 
@@ -31,7 +37,12 @@ import logging
 import sys
 from pathlib import Path
 
-from src.bmlibrarian.importers.pubmed_bulk_importer import PubMedBulkImporter, DownloadTracker
+from src.bmlibrarian.importers.pubmed_bulk_importer import (
+    PubMedBulkImporter,
+    DownloadTracker,
+    INGEST_MODE_COPY,
+    INGEST_MODE_ROW,
+)
 
 
 def setup_logging(verbose: bool = False):
@@ -53,6 +64,31 @@ def format_bytes(bytes_val: int) -> str:
     return f"{bytes_val:.1f} PB"
 
 
+def get_ingest_mode(args) -> str:
+    """Return the importer ingest mode selected on the command line."""
+    return INGEST_MODE_COPY if getattr(args, 'bulk', False) else INGEST_MODE_ROW
+
+
+def run_import(importer: PubMedBulkImporter, args, file_type=None) -> dict:
+    """Import downloaded files, in parallel if parser processes were requested."""
+    if args.parser_processes:
+        stats = importer.import_all_files_parallel(
+            file_type=file_type,
+            progress_callback=print,
+            batch_size=args.batch_size,
+            parser_processes=args.parser_processes,
+            writer_threads=args.writers
+        )
+        pipeline = stats['pipeline']
+        print(f"Parse throughput: {pipeline['parse_rows_per_second']:,.0f} rows/sec "
+              f"({pipeline['parse_rows_per_second_per_worker']:,.0f} per process)")
+        print(f"Write throughput: {pipeline['write_rows_per_second']:,.0f} rows/sec "
+              f"({pipeline['write_rows_per_second_per_worker']:,.0f} per writer)")
+        print(f"Max writer queue depth: {pipeline['max_queue_depth']}")
+        return stats
+    return importer.import_all_files(file_type=file_type, batch_size=args.batch_size)
+
+
 def cmd_download_baseline(args):
     """Download PubMed baseline files."""
     print("=" * 70)
@@ -135,22 +171,27 @@ def cmd_import(args):
     else:
         print("Import type: All (baseline + updates)")
     print(f"Batch size: {args.batch_size}")
+    print(f"Ingest mode: {get_ingest_mode(args)}")
+    if args.parser_processes:
+        print(f"Parser processes: {args.parser_processes}, writers: {args.writers}")
     print("=" * 70)
 
     try:
         importer = PubMedBulkImporter(
             data_dir=args.data_dir,
-            use_tracking=not args.no_tracking
+            use_tracking=not args.no_tracking,
+            ingest_mode=get_ingest_mode(args)
         )
 
         print("\nStarting import...")
-        stats = importer.import_all_files(file_type=args.type)
+        stats = run_import(importer, args, file_type=args.type)
 
         print("\n" + "=" * 70)
         print("Import Complete!")
         print("=" * 70)
         print(f"Files processed: {stats['files_processed']}")
         print(f"Total articles: {stats['total_articles']}")
+        print(f"Throughput: {stats['rows_per_second']:,.0f} rows/sec")
         print(f"Errors: {stats['total_errors']}")
         print("=" * 70)
 
@@ -279,7 +320,8 @@ def cmd_sync(args):
     try:
         importer = PubMedBulkImporter(
             data_dir=args.data_dir,
-            use_tracking=not args.no_tracking
+            use_tracking=not args.no_tracking,
+            ingest_mode=get_ingest_mode(args)
         )
 
         # Download phase
@@ -307,13 +349,14 @@ def cmd_sync(args):
         elif args.updates_only:
             import_type = 'update'
 
-        stats = importer.import_all_files(file_type=import_type)
+        stats = run_import(importer, args, file_type=import_type)
 
         print("\n" + "=" * 70)
         print("Sync Complete!")
         print("=" * 70)
         print(f"Files processed: {stats['files_processed']}")
         print(f"Total articles: {stats['total_articles']}")
+        print(f"Throughput: {stats['rows_per_second']:,.0f} rows/sec")
         print(f"Errors: {stats['total_errors']}")
         print("=" * 70)
 
@@ -396,6 +439,24 @@ def main():
         default=100,
         help='Articles per database batch (default: 100)'
     )
+    import_parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Bulk ingest: COPY batches into a staging table and merge them '
+             'set-based (use with a larger --batch-size, e.g. 5000)'
+    )
+    import_parser.add_argument(
+        '--parser-processes',
+        type=int,
+        default=0,
+        help='Parse files in N parallel processes (default: 0, sequential import)'
+    )
+    import_parser.add_argument(
+        '--writers',
+        type=int,
+        default=1,
+        help='DB writer threads for parallel import (default: 1)'
+    )
 
     # Status command
     status_parser = subparsers.add_parser(
@@ -428,6 +489,29 @@ def main():
         action='store_true',
         help='Re-download existing files'
     )
+    sync_parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Bulk ingest: COPY batches into a staging table and merge them set-based'
+    )
+    sync_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=100,
+        help='Articles per database batch (default: 100)'
+    )
+    sync_parser.add_argument(
+        '--parser-processes',
+        type=int,
+        default=0,
+        help='Parse files in N parallel processes (default: 0, sequential import)'
+    )
+    sync_parser.add_argument(
+        '--writers',
+        type=int,
+        default=1,
+        help='DB writer threads for parallel import (default: 1)'
+    )
     sync_parser.add_argument(
         '-y', '--yes',
         action='store_true',
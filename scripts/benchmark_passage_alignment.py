@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exhaustive vs pruned fuzzy passage alignment on real abstracts.
+
+Samples abstracts from the knowledgebase (or a file), quotes one sentence
+from each with light LLM-style edits, and aligns it back with both the
+exhaustive SequenceMatcher scan and bmlibrarian's pruned search. Reports
+time and windows scored per citation, and checks both searches agree on
+every accepted match.
+
+Usage:
+    uv run python scripts/benchmark_passage_alignment.py --abstracts 20
+    uv run python scripts/benchmark_passage_alignment.py --file abstracts.txt
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List
+
+from bmlibrarian.agents.utils.passage_alignment import exhaustive_best_window, find_best_window
+
+DEFAULT_ABSTRACTS = 10
+DEFAULT_MIN_SIMILARITY = 0.95
+MIN_ABSTRACT_CHARS = 800
+MIN_PASSAGE_CHARS = 60
+
+
+def load_abstracts_from_db(limit: int) -> List[str]:
+    """Fetch a random sample of non-trivial abstracts from the database."""
+    from bmlibrarian.database import get_db_manager
+
+    with get_db_manager().get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                SELECT abstract FROM document TABLESAMPLE SYSTEM (1)
+                WHERE length(abstract) >= %s
+                LIMIT %s
+                """,
+                (MIN_ABSTRACT_CHARS, limit),
+            )
+            return [row['abstract'] for row in cur.fetchall()]
+
+
+def load_abstracts_from_file(path: str) -> List[str]:
+    """Read abstracts separated by blank lines."""
+    with open(path, encoding='utf-8') as f:
+        return [block.strip() for block in f.read().split('\n\n') if block.strip()]
+
+
+def make_passage(abstract: str, rng: random.Random) -> str:
+    """Quote one sentence with small punctuation edits, as LLMs tend to."""
+    sentences = [s for s in re.split(r'(?<=\.)\s+', abstract) if len(s) >= MIN_PASSAGE_CHARS]
+    passage = rng.choice(sentences) if sentences else abstract[:MIN_PASSAGE_CHARS]
+    return passage.replace(', ', '; ', 1).rstrip('.')
+
+
+def main() -> int:
+    """Run both alignments and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--abstracts", type=int, default=DEFAULT_ABSTRACTS)
+    parser.add_argument("--file", help="Read abstracts from a file instead of the database")
+    parser.add_argument("--min-similarity", type=float, default=DEFAULT_MIN_SIMILARITY)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    abstracts = (
+        load_abstracts_from_file(args.file)[:args.abstracts]
+        if args.file else load_abstracts_from_db(args.abstracts)
+    )
+    rng = random.Random(args.seed)
+
+    totals = {'exhaustive': [0.0, 0], 'pruned': [0.0, 0]}
+    accepted = mismatches = 0
+    for abstract in abstracts:
+        text = ' '.join(abstract.lower().split())
+        passage = ' '.join(make_passage(abstract, rng).lower().split())
+
+        start = time.perf_counter()
+        expected = exhaustive_best_window(passage, text)
+        totals['exhaustive'][0] += time.perf_counter() - start
+        totals['exhaustive'][1] += expected.windows_scored
+
+        start = time.perf_counter()
+        actual = find_best_window(passage, text, args.min_similarity)
+        totals['pruned'][0] += time.perf_counter() - start
+        totals['pruned'][1] += actual.windows_scored
+
+        if expected.score >= args.min_similarity:
+            accepted += 1
+            if (actual.score, actual.start, actual.length) != (expected.score, expected.start, expected.length):
+                mismatches += 1
+
+    count = len(abstracts)
+    print(f"{count} abstracts, mean {sum(map(len, abstracts)) // max(count, 1)} chars")
+    print(f"{'search':<11} {'ms/citation':>12} {'windows/citation':>17}")
+    for name, (seconds, windows) in totals.items():
+        print(f"{name:<11} {1000 * seconds / count:>12.1f} {windows // count:>17}")
+    print(f"Speedup: {totals['exhaustive'][0] / totals['pruned'][0]:.0f}x; "
+          f"accepted matches: {accepted}, mismatches: {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
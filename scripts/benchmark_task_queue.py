@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: agent task queue claim throughput and dispatch latency.
+
+Drains a file-backed QueueManager with single-task claims (get_next_task)
+and with batched claims (get_next_tasks), then measures how long an idle
+AgentOrchestrator worker takes to pick up newly submitted work.
+
+Usage:
+    uv run python scripts/benchmark_task_queue.py
+    uv run python scripts/benchmark_task_queue.py --tasks 20000 --batch-size 32
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from bmlibrarian.agents import AgentOrchestrator, QueueManager, TaskStatus
+from bmlibrarian.agents.queue_manager import DEFAULT_CLAIM_BATCH_SIZE
+
+DEFAULT_TASKS = 5000
+DEFAULT_LATENCY_SAMPLES = 50
+# Poll interval for the dispatch-latency run; wakeups should make it irrelevant
+DISPATCH_POLLING_INTERVAL = 1.0
+AGENT_TYPE = "benchmark_agent"
+
+
+class _NoOpAgent:
+    """Agent whose task method returns immediately."""
+
+    def run(self, index: int) -> dict:
+        return {"index": index}
+
+
+def time_drain(queue: QueueManager, tasks: int, batch_size: int) -> float:
+    """Enqueue ``tasks`` tasks and time claiming and completing all of them."""
+    queue.add_batch_tasks(AGENT_TYPE, "run", [{"index": i} for i in range(tasks)])
+    start = time.perf_counter()
+    while True:
+        if batch_size == 1:
+            task = queue.get_next_task(AGENT_TYPE)
+            claimed = [task] if task else []
+        else:
+            claimed = queue.get_next_tasks(AGENT_TYPE, limit=batch_size)
+        if not claimed:
+            break
+        for task in claimed:
+            queue.complete_task(task.id, {"index": task.data["index"]})
+    return time.perf_counter() - start
+
+
+def time_dispatch_latency(queue: QueueManager, samples: int) -> list:
+    """Return submit-to-completion seconds for tasks sent to an idle worker."""
+    orchestrator = AgentOrchestrator(queue, polling_interval=DISPATCH_POLLING_INTERVAL)
+    orchestrator.register_agent(AGENT_TYPE, _NoOpAgent())
+    orchestrator.start_processing()
+    latencies = []
+    try:
+        for index in range(samples):
+            start = time.perf_counter()
+            task_id = orchestrator.submit_task(AGENT_TYPE, "run", {"index": index})
+            while queue.get_task_status(task_id).status != TaskStatus.COMPLETED:
+                time.sleep(0.0005)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        orchestrator.stop_processing()
+    return latencies
+
+
+def main() -> int:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_CLAIM_BATCH_SIZE)
+    parser.add_argument("--latency-samples", type=int, default=DEFAULT_LATENCY_SAMPLES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{args.tasks} tasks, file-backed queue (WAL)")
+        print(f"{'claim':<12} {'tasks/s':>10}")
+        for label, batch_size in (("single", 1), (f"batch={args.batch_size}", args.batch_size)):
+            queue = QueueManager(str(Path(tmp) / f"queue_{batch_size}.db"))
+            seconds = time_drain(queue, args.tasks, batch_size)
+            queue.close()
+            print(f"{label:<12} {args.tasks / seconds:>10.0f}")
+
+        queue = QueueManager(str(Path(tmp) / "dispatch.db"))
+        latencies = time_dispatch_latency(queue, args.latency_samples)
+        queue.close()
+        print(f"Idle dispatch latency ms (poll interval {DISPATCH_POLLING_INTERVAL:.0f}s): "
+              f"median {1000 * statistics.median(latencies):.2f}, "
+              f"max {1000 * max(latencies):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
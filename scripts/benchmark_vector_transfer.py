@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: text vs binary transfer of pgvector embeddings.
+
+Compares the client-side cost and payload size of sending 1024-dim
+embeddings as '[...]' text literals versus pgvector's binary format
+(bmlibrarian.db_vector). With --db it also times a round trip of
+SELECT %s::vector against the configured PostgreSQL database, where the
+server's parse cost shows up as well.
+
+Usage:
+    uv run python scripts/benchmark_vector_transfer.py
+    uv run python scripts/benchmark_vector_transfer.py --vectors 5000 --db
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from bmlibrarian.db_vector import (
+    encode_vector_binary,
+    format_vector_literal,
+    register_vector_adapters,
+    to_vector_array,
+)
+
+DEFAULT_VECTORS = 2000
+DEFAULT_DIMENSIONS = 1024
+DEFAULT_DB_ROUND_TRIPS = 200
+
+
+def time_encoding(vectors: list, encode) -> tuple:
+    """Return (seconds, total payload bytes) for encoding every vector."""
+    start = time.perf_counter()
+    total_bytes = 0
+    for vector in vectors:
+        payload = encode(vector)
+        total_bytes += len(payload)
+    return time.perf_counter() - start, total_bytes
+
+
+def time_db_round_trips(vectors: list, binary: bool) -> float:
+    """Time SELECT %s::vector round trips with text or binary parameters."""
+    import psycopg
+
+    from bmlibrarian.db_conninfo import build_conninfo
+
+    conninfo = build_conninfo(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=os.getenv("POSTGRES_PORT", "5432"),
+        user=os.getenv("POSTGRES_USER"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+        dbname=os.getenv("POSTGRES_DB", "knowledgebase"),
+    )
+    with psycopg.connect(conninfo) as conn:
+        if binary and not register_vector_adapters(conn):
+            raise SystemExit("pgvector extension not installed in this database")
+        with conn.cursor() as cur:
+            start = time.perf_counter()
+            for vector in vectors:
+                param = to_vector_array(vector) if binary else format_vector_literal(vector)
+                cur.execute("SELECT vector_dims(%s::vector)", (param,))
+                cur.fetchone()
+            return time.perf_counter() - start
+
+
+def main() -> int:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=int, default=DEFAULT_VECTORS)
+    parser.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument(
+        "--db", action="store_true",
+        help="Also time database round trips (needs POSTGRES_* env vars)",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    # Embedding backends hand back Python float lists
+    vectors = [row.tolist() for row in rng.standard_normal((args.vectors, args.dimensions))]
+
+    text_s, text_bytes = time_encoding(vectors, lambda v: format_vector_literal(v).encode())
+    bin_s, bin_bytes = time_encoding(vectors, encode_vector_binary)
+
+    print(f"{args.vectors} vectors x {args.dimensions} dims")
+    print(f"{'format':<8} {'encode ms/vec':>14} {'bytes/vec':>10}")
+    print(f"{'text':<8} {1000 * text_s / args.vectors:>14.3f} {text_bytes // args.vectors:>10}")
+    print(f"{'binary':<8} {1000 * bin_s / args.vectors:>14.3f} {bin_bytes // args.vectors:>10}")
+    print(f"Encode speedup: {text_s / bin_s:.1f}x, payload: {text_bytes / bin_bytes:.1f}x smaller")
+
+    if args.db:
+        sample = vectors[:DEFAULT_DB_ROUND_TRIPS]
+        text_rt = time_db_round_trips(sample, binary=False)
+        bin_rt = time_db_round_trips(sample, binary=True)
+        print(f"DB round trip ms/vec: text {1000 * text_rt / len(sample):.3f}, "
+              f"binary {1000 * bin_rt / len(sample):.3f} ({text_rt / bin_rt:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -18,6 +18,11 @@ Usage:
     # Custom chunk parameters
     uv run python chunk_worker.py process --chunk-size 500 --overlap 75
 
+    # Several workers (processes or hosts) can drain the queue together;
+    # claims use FOR UPDATE SKIP LOCKED so no document is processed twice
+    uv run python chunk_worker.py process --continuous --embed-batch-size 128 &
+    uv run python chunk_worker.py process --continuous --embed-batch-size 128 &
+
     # Queue a specific document for processing
     uv run python chunk_worker.py queue 12345
 
@@ -38,6 +43,7 @@ logger = logging.getLogger(__name__)
 
 # Constants (aligned with chunk_embedder defaults)
 DEFAULT_BATCH_SIZE = 100
+DEFAULT_EMBED_BATCH_SIZE = 64
 DEFAULT_CHUNK_SIZE = 1800
 DEFAULT_CHUNK_OVERLAP = 320
 CONTINUOUS_POLL_INTERVAL_SECONDS = 30
@@ -80,6 +86,7 @@ def cmd_process(args: argparse.Namespace) -> int:
     print(f"Batch size: {args.batch_size}")
     print(f"Chunk size: {args.chunk_size}")
     print(f"Chunk overlap: {args.overlap}")
+    print(f"Embed batch size: {args.embed_batch_size}")
     print(f"Continuous mode: {args.continuous}")
     print("=" * 70)
 
@@ -111,6 +118,7 @@ def cmd_process(args: argparse.Namespace) -> int:
                 batch_size=args.batch_size,
                 chunk_size=args.chunk_size,
                 overlap=args.overlap,
+                embed_batch_size=args.embed_batch_size,
             )
 
             total_processed += processed
@@ -402,6 +410,12 @@ def main() -> int:
         default=DEFAULT_CHUNK_OVERLAP,
         help=f"Chunk overlap in characters (default: {DEFAULT_CHUNK_OVERLAP})",
     )
+    process_parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=DEFAULT_EMBED_BATCH_SIZE,
+        help=f"Chunks per embedding call, across documents (default: {DEFAULT_EMBED_BATCH_SIZE})",
+    )
     process_parser.add_argument(
         "--continuous",
         action="store_true",
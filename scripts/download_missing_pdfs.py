@@ -22,6 +22,9 @@ Usage:
 
     # Custom timeout per PDF
     python download_missing_pdfs.py --timeout 60
+
+    # Four concurrent downloads, at most one request per host every 2 seconds
+    python download_missing_pdfs.py --workers 4 --min-host-interval 2
 """
 
 import argparse
@@ -35,7 +38,8 @@ import psycopg
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from bmlibrarian.utils.pdf_manager import PDFManager
+from bmlibrarian.utils.pdf_manager import DEFAULT_DOWNLOAD_WORKERS, PDFManager
+from bmlibrarian.utils.rate_limit import DEFAULT_MIN_HOST_INTERVAL
 
 
 def print_banner():
@@ -205,6 +209,21 @@ def main():
         help='Download timeout in seconds per PDF (default: 30)'
     )
 
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f'Concurrent downloads (default: {DEFAULT_DOWNLOAD_WORKERS}, sequential)'
+    )
+
+    parser.add_argument(
+        '--min-host-interval',
+        type=float,
+        default=DEFAULT_MIN_HOST_INTERVAL,
+        help='Minimum seconds between requests to one host when --workers > 1 '
+             f'(default: {DEFAULT_MIN_HOST_INTERVAL}, 0 disables)'
+    )
+
     parser.add_argument(
         '--check-only',
         action='store_true',
@@ -265,6 +284,9 @@ def main():
     else:
         print(f"  Max batches: unlimited")
     print(f"  Timeout: {args.timeout} seconds per PDF")
+    print(f"  Workers: {args.workers}")
+    if args.workers > 1:
+        print(f"  Min host interval: {args.min_host_interval} seconds")
     print(f"  Update database: {not args.no_db_update}")
     print()
 
@@ -279,7 +301,9 @@ def main():
             max_batches=args.max_batches,
             timeout=args.timeout,
             update_database=not args.no_db_update,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            max_workers=args.workers,
+            min_host_interval=args.min_host_interval
         )
 
         elapsed_time = time.time() - start_time
@@ -11,13 +11,16 @@ Provides common functionality for all AI agents including:
 - Performance metrics tracking (execution time, token usage)
 """
 
+import itertools
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional, Callable, Dict, Any, TYPE_CHECKING
+from typing import Optional, Callable, Dict, Any, List, TYPE_CHECKING
 from abc import ABC, abstractmethod
 
+from ..llm.response_cache import is_agent_cache_enabled
 from ..llm import (
     LLMClient,
     LLMMessage,
@@ -238,8 +241,18 @@ class BaseAgent(ABC):
             ollama_host=host,
         )
 
-        # Initialize performance metrics tracking
+        # Extra clients for round-robin across Ollama hosts (see set_ollama_hosts)
+        self._host_clients: List[LLMClient] = [self._llm_client]
+        self._host_cycle = itertools.cycle(self._host_clients)
+        self._host_lock = threading.Lock()
+
+        # LLM response cache opt-in; None resolves from the "llm_cache"
+        # config on first request (see _response_cache_enabled)
+        self.use_response_cache: Optional[bool] = None
+
+        # Initialize performance metrics tracking (requests may run concurrently)
         self._metrics = PerformanceMetrics()
+        self._metrics_lock = threading.Lock()
 
         # Display model information if requested
         if show_model_info:
@@ -257,6 +270,57 @@ class BaseAgent(ABC):
         """
         return self._llm_client
 
+    def set_ollama_hosts(self, hosts: List[str]) -> None:
+        """
+        Distribute LLM requests round-robin across several Ollama hosts.
+
+        Useful with concurrent batch processing, where each host serves
+        its own share of in-flight requests. The first host replaces the
+        agent's current host.
+
+        Args:
+            hosts: Ollama server URLs (duplicates are ignored)
+        """
+        unique_hosts = list(dict.fromkeys(h for h in hosts if h))
+        if not unique_hosts or unique_hosts == [self.host]:
+            return
+
+        clients = [
+            LLMClient(
+                default_provider=Provider.OLLAMA,
+                fallback_provider=Provider.OLLAMA,
+                fallback_model=self.fallback_model,
+                track_usage=True,
+                ollama_host=host,
+            )
+            for host in unique_hosts
+        ]
+        with self._host_lock:
+            self.host = unique_hosts[0]
+            self._llm_client = clients[0]
+            self._host_clients = clients
+            self._host_cycle = itertools.cycle(clients)
+        if len(clients) > 1:
+            logger.info(f"{self.get_agent_type()} using {len(clients)} Ollama hosts: {', '.join(unique_hosts)}")
+
+    def _response_cache_enabled(self) -> bool:
+        """
+        Whether this agent's requests use the LLM response cache.
+
+        Opt-in per agent type via ``llm_cache.agents`` in config, or by
+        setting ``use_response_cache`` on the instance.
+        """
+        if self.use_response_cache is None:
+            self.use_response_cache = is_agent_cache_enabled(self.get_agent_type())
+        return self.use_response_cache
+
+    def _next_llm_client(self) -> LLMClient:
+        """Get the client for the next request (round-robin across hosts)."""
+        if len(self._host_clients) == 1:
+            return self._llm_client
+        with self._host_lock:
+            return next(self._host_cycle)
+
     def _display_model_info(self) -> None:
         """Display model information to terminal."""
         agent_type = self.get_agent_type() if hasattr(self, 'get_agent_type') else "Agent"
@@ -304,6 +368,8 @@ class BaseAgent(ABC):
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
         think: Optional[bool] = None,
+        use_cache: Optional[bool] = None,
+        refresh_cache: bool = False,
         **llm_options
     ) -> str:
         """
@@ -324,6 +390,9 @@ class BaseAgent(ABC):
             think: Request a reasoning trace from the provider. Left None the
                 option is not sent (whether a model accepts it is the
                 provider's business).
+            use_cache: Use the LLM response cache; None follows the agent's
+                opt-in (see _response_cache_enabled)
+            refresh_cache: Bypass the cache lookup but store the new response
             **llm_options: Additional LLM options (max_tokens, json_mode, etc.)
 
         Returns:
@@ -368,7 +437,7 @@ class BaseAgent(ABC):
             think_kwargs = {} if think is None else {'think': think}
 
             # Make request via LLM client
-            response: LLMResponse = self._llm_client.chat(
+            response: LLMResponse = self._next_llm_client().chat(
                 messages=llm_messages,
                 model=effective_model,
                 system_prompt=system_prompt,
@@ -379,6 +448,8 @@ class BaseAgent(ABC):
                 fallback_model=self.fallback_model,
                 max_retries=max_retries,
                 retry_delay=retry_delay,
+                use_cache=self._response_cache_enabled() if use_cache is None else use_cache,
+                refresh_cache=refresh_cache,
                 **think_kwargs,
             )
 
@@ -390,14 +461,15 @@ class BaseAgent(ABC):
             response_time = (time.time() - start_time) * 1000
 
             # Track performance metrics from response
-            self._metrics.add_request_metrics(
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                wall_time_seconds=response.duration_seconds,
-                model_time_ns=0,  # Not available from LLMResponse
-                prompt_eval_ns=0,  # Not available from LLMResponse
-                retries=0
-            )
+            with self._metrics_lock:
+                self._metrics.add_request_metrics(
+                    prompt_tokens=response.prompt_tokens,
+                    completion_tokens=response.completion_tokens,
+                    wall_time_seconds=response.duration_seconds,
+                    model_time_ns=0,  # Not available from LLMResponse
+                    prompt_eval_ns=0,  # Not available from LLMResponse
+                    retries=0
+                )
 
             agent_logger.info(f"LLM response received in {response_time:.2f}ms", extra={'structured_data': {
                 'event_type': 'agent_llm_response',
@@ -471,6 +543,8 @@ class BaseAgent(ABC):
         model: Optional[str] = None,
         temperature: Optional[float] = None,
         top_p: Optional[float] = None,
+        use_cache: Optional[bool] = None,
+        refresh_cache: bool = False,
         **llm_options
     ) -> str:
         """
@@ -487,6 +561,9 @@ class BaseAgent(ABC):
             temperature: Per-call temperature override; falls back to
                 ``self.temperature`` when None
             top_p: Per-call top_p override; falls back to ``self.top_p`` when None
+            use_cache: Use the LLM response cache; None follows the agent's
+                opt-in (see _response_cache_enabled)
+            refresh_cache: Bypass the cache lookup but store the new response
             **llm_options: Additional LLM options (max_tokens, json_mode, etc.)
 
         Note:
@@ -530,7 +607,7 @@ class BaseAgent(ABC):
             json_mode = llm_options.pop('json_mode', False)
 
             # Make request via LLM client
-            response: LLMResponse = self._llm_client.generate(
+            response: LLMResponse = self._next_llm_client().generate(
                 prompt=prompt,
                 model=effective_model,
                 temperature=effective_temperature,
@@ -540,6 +617,8 @@ class BaseAgent(ABC):
                 fallback_model=self.fallback_model,
                 max_retries=max_retries,
                 retry_delay=retry_delay,
+                use_cache=self._response_cache_enabled() if use_cache is None else use_cache,
+                refresh_cache=refresh_cache,
             )
 
             content = response.content
@@ -550,14 +629,15 @@ class BaseAgent(ABC):
             response_time = (time.time() - start_time) * 1000
 
             # Track performance metrics from response
-            self._metrics.add_request_metrics(
-                prompt_tokens=response.prompt_tokens,
-                completion_tokens=response.completion_tokens,
-                wall_time_seconds=response.duration_seconds,
-                model_time_ns=0,
-                prompt_eval_ns=0,
-                retries=0
-            )
+            with self._metrics_lock:
+                self._metrics.add_request_metrics(
+                    prompt_tokens=response.prompt_tokens,
+                    completion_tokens=response.completion_tokens,
+                    wall_time_seconds=response.duration_seconds,
+                    model_time_ns=0,
+                    prompt_eval_ns=0,
+                    retries=0
+                )
 
             agent_logger.info(f"LLM response received in {response_time:.2f}ms", extra={'structured_data': {
                 'event_type': 'agent_llm_response',
@@ -919,8 +999,10 @@ class BaseAgent(ABC):
                         f"(previous parse failed)"
                     )
 
-                # Generate response from LLM
-                llm_response = self._generate_from_prompt(prompt, **ollama_options)
+                # Generate response from LLM (a retry must not replay a cached answer)
+                llm_response = self._generate_from_prompt(
+                    prompt, refresh_cache=attempt > 0, **ollama_options
+                )
 
                 # Try to parse as JSON
                 try:
@@ -1032,10 +1114,11 @@ class BaseAgent(ABC):
                         f"(previous parse failed)"
                     )
 
-                # Generate chat response from LLM
+                # Generate chat response from LLM (a retry must not replay a cached answer)
                 llm_response = self._make_ollama_request(
                     messages=messages,
                     system_prompt=system_prompt,
+                    refresh_cache=attempt > 0,
                     **ollama_options
                 )
 
@@ -14,6 +14,7 @@ import psycopg
 
 from .base import BaseAgent
 from .queue_manager import QueueManager, TaskPriority, TaskStatus
+from .utils.passage_alignment import find_best_window, normalized_offsets
 
 logger = logging.getLogger(__name__)
 
@@ -134,8 +135,6 @@ class CitationFinderAgent(BaseAgent):
             - similarity_score: Best match similarity (1.0 = perfect)
             - exact_text_from_abstract: The actual text from abstract (None if invalid)
         """
-        from difflib import SequenceMatcher
-
         # Normalize whitespace for comparison
         passage_norm = ' '.join(llm_passage.lower().split())
         abstract_norm = ' '.join(abstract.lower().split())
@@ -153,44 +152,17 @@ class CitationFinderAgent(BaseAgent):
                 logger.debug(f"Found exact match in abstract (similarity=1.0)")
                 return True, 1.0, exact_text
 
-        # Fuzzy match with sliding window to find best matching substring
-        best_match_score = 0.0
-        best_match_start = 0
-        best_match_len = len(llm_passage)
-
-        passage_len_chars = len(passage_norm)
-
-        # Try different window sizes (±20% of passage length)
-        for window_len in range(
-            int(passage_len_chars * 0.8),
-            int(passage_len_chars * 1.2) + 1
-        ):
-            if window_len > len(abstract_norm):
-                continue
-
-            # Slide window across abstract
-            for i in range(len(abstract_norm) - window_len + 1):
-                window = abstract_norm[i:i + window_len]
-                similarity = SequenceMatcher(None, passage_norm, window).ratio()
-
-                if similarity > best_match_score:
-                    best_match_score = similarity
-                    best_match_start = i
-                    best_match_len = window_len
+        # Fuzzy match: best SequenceMatcher window (±20% of passage length),
+        # scoring only windows whose character-count bound could win
+        match = find_best_window(passage_norm, abstract_norm, min_similarity)
+        best_match_score = match.score
+        best_match_start = match.start
 
         # If we found a good match, extract the original text from abstract
         if best_match_score >= min_similarity:
-            # Map normalized position back to original abstract
-            # We need to find where character N in normalized text appears in original
-            char_count = 0
-            orig_start = 0
-
-            for orig_pos, char in enumerate(abstract):
-                if char.strip():  # Count non-whitespace characters
-                    if char_count == best_match_start:
-                        orig_start = orig_pos
-                        break
-                    char_count += 1
+            # Map the normalized match start back to the original abstract
+            offsets = normalized_offsets(abstract)
+            orig_start = offsets[best_match_start] if best_match_start < len(offsets) else 0
 
             # Estimate length in original text (account for whitespace)
             # Use a generous buffer to capture full sentences
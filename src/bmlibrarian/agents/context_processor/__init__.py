@@ -27,6 +27,13 @@ Usage:
 
     processor = MyProcessor()
     result = processor.process(items, query="What are the key findings?")
+
+    # Pack batches by real token counts and extract 4 batches at a time
+    config = ProcessingConfig(
+        max_context_tokens=6000,
+        token_counter=create_hf_token_counter("google/gemma-3-4b-it"),
+        max_concurrent_batches=4,
+    )
 """
 
 from .base import IterativeContextProcessor, ProgressCallback
@@ -40,12 +47,19 @@ from .data_types import (
     OversizedItemStrategy,
     ConsolidationStrategy,
     # Constants
+    DEFAULT_MAX_CONCURRENT_BATCHES,
     DEFAULT_MAX_CONTEXT_CHARS,
     DEFAULT_MAX_RECURSION_DEPTH,
     DEFAULT_MIN_ITEMS_FOR_RECURSION,
     DEFAULT_OVERLAP_CHARS,
     DEFAULT_SEPARATOR,
 )
+from .token_counting import (
+    TokenCounter,
+    create_gguf_token_counter,
+    create_hf_token_counter,
+    estimate_token_count,
+)
 from .semantic_chunk_processor import (
     SemanticChunkProcessor,
     SemanticChunk,
@@ -69,10 +83,16 @@ __all__ = [
     "ProcessingResult",
     "ProcessingStatus",
     "ProgressInfo",
+    # Token counting
+    "TokenCounter",
+    "create_gguf_token_counter",
+    "create_hf_token_counter",
+    "estimate_token_count",
     # Strategy enums
     "OversizedItemStrategy",
     "ConsolidationStrategy",
     # Constants
+    "DEFAULT_MAX_CONCURRENT_BATCHES",
     "DEFAULT_MAX_CONTEXT_CHARS",
     "DEFAULT_MAX_RECURSION_DEPTH",
     "DEFAULT_MIN_ITEMS_FOR_RECURSION",
@@ -11,6 +11,10 @@ context limits by:
 2. Extracting relevant information from each batch
 3. Recursively consolidating extracted results until they fit
 
+Batches are sized by characters, or by real tokenizer counts when the
+config carries a token_counter. The map step (extraction) is independent
+per batch and can run with bounded concurrency via max_concurrent_batches.
+
 This is a generalization of patterns found in:
 - Citation extraction (processing documents iteratively)
 - Semantic search consolidation (combining chunk results)
@@ -21,6 +25,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from ..utils.concurrency import ordered_concurrent_map
 from .data_types import (
     Batch,
     ConsolidationStrategy,
@@ -38,6 +43,10 @@ logger = logging.getLogger(__name__)
 # Type alias for progress callbacks
 ProgressCallback = Callable[[ProgressInfo], None]
 
+# Re-splits of an oversized item when character-sized pieces still exceed
+# the token limit (a cut can land mid-word and add tokens)
+MAX_SPLIT_REFINEMENTS = 3
+
 
 class IterativeContextProcessor(ABC):
     """
@@ -50,7 +59,9 @@ class IterativeContextProcessor(ABC):
 
     The processing algorithm:
     1. Format and batch items to fit within max_context_chars
+       (or max_context_tokens when a token_counter is configured)
     2. Extract from each batch → yields list of ExtractionResults
+       (up to max_concurrent_batches at a time, results kept in batch order)
     3. If results fit in single context → return consolidated
     4. Otherwise, recursively process the results as new items
 
@@ -261,6 +272,28 @@ class IterativeContextProcessor(ABC):
             except Exception as e:
                 logger.warning(f"Progress callback failed: {e}")
 
+    def _measure(self, text: str, config: ProcessingConfig) -> int:
+        """
+        Measure text in the unit batches are limited by.
+
+        Args:
+            text: Text to measure.
+            config: Processing configuration.
+
+        Returns:
+            Token count if the config batches by tokens, else character count.
+        """
+        if config.uses_tokens:
+            return config.token_counter(text)
+        return len(text)
+
+    @staticmethod
+    def _context_limit(config: ProcessingConfig) -> int:
+        """Get the per-batch size limit in the unit returned by _measure()."""
+        if config.uses_tokens:
+            return config.max_context_tokens
+        return config.max_context_chars
+
     def _create_batches(
         self,
         items: List[Any],
@@ -268,11 +301,13 @@ class IterativeContextProcessor(ABC):
         skipped_items: Optional[List[int]] = None,
     ) -> List[Batch]:
         """
-        Group items into batches that fit within max_context_chars.
+        Group items into batches that fit within the context limit.
 
         Uses greedy bin-packing: add items to current batch until
         the limit would be exceeded. Handles oversized items according
-        to the configured strategy.
+        to the configured strategy. The limit is max_context_tokens
+        (measured with the configured token_counter) when set, otherwise
+        max_context_chars.
 
         Args:
             items: List of items to batch.
@@ -288,26 +323,33 @@ class IterativeContextProcessor(ABC):
         if not items:
             return []
 
+        limit = self._context_limit(config)
         batches: List[Batch] = []
         current_items: List[Any] = []
         current_indices: List[int] = []
         current_chars = 0
+        current_size = 0
         separator_len = len(config.separator)
+        separator_size = self._measure(config.separator, config)
 
         # Pre-process items to handle oversized ones
         processed_items: List[Tuple[int, Any]] = []  # (original_idx, item)
 
         for idx, item in enumerate(items):
-            # Use estimate_item_size() for performance (avoids expensive formatting)
-            item_chars = self.estimate_item_size(item)
+            if config.uses_tokens:
+                # Character estimates cannot bound token counts
+                item_size = self._measure(self.format_item(item, 0), config)
+            else:
+                # Use estimate_item_size() for performance (avoids expensive formatting)
+                item_size = self.estimate_item_size(item)
 
             # Check if item is oversized (larger than max context on its own)
-            if item_chars > config.max_context_chars:
+            if item_size > limit:
                 processed_items.extend(
                     self._handle_oversized_item(
                         item=item,
                         original_idx=idx,
-                        item_chars=item_chars,
+                        item_size=item_size,
                         config=config,
                         skipped_items=skipped_items,
                     )
@@ -315,51 +357,51 @@ class IterativeContextProcessor(ABC):
             else:
                 processed_items.append((idx, item))
 
+        def close_batch() -> None:
+            batches.append(
+                Batch(
+                    items=current_items,
+                    item_indices=current_indices,
+                    total_chars=current_chars,
+                    batch_index=len(batches),
+                    total_tokens=current_size if config.uses_tokens else None,
+                )
+            )
+
         # Now batch the processed items
         for original_idx, item in processed_items:
             formatted = self.format_item(item, len(current_items))
             item_chars = len(formatted)
+            item_size = self._measure(formatted, config)
 
             # Account for separator if not first item in batch
-            separator_cost = separator_len if current_items else 0
-            total_new_chars = item_chars + separator_cost
+            separator_chars = separator_len if current_items else 0
+            separator_cost = separator_size if current_items else 0
 
             # Would this item exceed the limit?
-            if current_chars + total_new_chars > config.max_context_chars:
+            if current_size + item_size + separator_cost > limit:
                 # Save current batch (if not empty) and start new one
                 if current_items:
-                    batches.append(
-                        Batch(
-                            items=current_items,
-                            item_indices=current_indices,
-                            total_chars=current_chars,
-                            batch_index=len(batches),
-                        )
-                    )
+                    close_batch()
                 # Start new batch with this item
                 current_items = [item]
                 current_indices = [original_idx]
                 current_chars = item_chars
+                current_size = item_size
             else:
                 # Add to current batch
                 current_items.append(item)
                 current_indices.append(original_idx)
-                current_chars += total_new_chars
+                current_chars += item_chars + separator_chars
+                current_size += item_size + separator_cost
 
         # Don't forget the last batch
         if current_items:
-            batches.append(
-                Batch(
-                    items=current_items,
-                    item_indices=current_indices,
-                    total_chars=current_chars,
-                    batch_index=len(batches),
-                )
-            )
+            close_batch()
 
         logger.debug(
             f"Created {len(batches)} batches from {len(items)} items "
-            f"(max_chars={config.max_context_chars})"
+            f"(limit={limit} {'tokens' if config.uses_tokens else 'chars'})"
         )
 
         return batches
@@ -368,7 +410,7 @@ class IterativeContextProcessor(ABC):
         self,
         item: Any,
         original_idx: int,
-        item_chars: int,
+        item_size: int,
         config: ProcessingConfig,
         skipped_items: Optional[List[int]],
     ) -> List[Tuple[int, Any]]:
@@ -378,7 +420,8 @@ class IterativeContextProcessor(ABC):
         Args:
             item: The oversized item.
             original_idx: Original index of the item.
-            item_chars: Character count of the formatted item.
+            item_size: Size of the formatted item (tokens or characters,
+                see _measure()).
             config: Processing configuration.
             skipped_items: List to track skipped items (modified in place).
 
@@ -389,45 +432,47 @@ class IterativeContextProcessor(ABC):
             ValueError: If strategy is FAIL.
         """
         strategy = config.oversized_item_strategy
+        limit = self._context_limit(config)
+        unit = "tokens" if config.uses_tokens else "chars"
+        size_desc = f"{item_size} {unit} > {limit} max"
+
+        if config.uses_tokens:
+            # Convert the token budget to characters at this item's own ratio
+            formatted_len = len(self.format_item(item, 0))
+            max_chars = max(1, formatted_len * limit // item_size)
+        else:
+            max_chars = config.max_context_chars
 
         if strategy == OversizedItemStrategy.FAIL:
             raise ValueError(
-                f"Item {original_idx} is oversized ({item_chars} chars > "
-                f"{config.max_context_chars} max). Use a different "
+                f"Item {original_idx} is oversized ({size_desc}). Use a different "
                 f"oversized_item_strategy to handle this."
             )
 
         elif strategy == OversizedItemStrategy.SKIP:
-            logger.warning(
-                f"Skipping oversized item {original_idx} "
-                f"({item_chars} chars > {config.max_context_chars} max)"
-            )
+            logger.warning(f"Skipping oversized item {original_idx} ({size_desc})")
             if skipped_items is not None:
                 skipped_items.append(original_idx)
             return []
 
         elif strategy == OversizedItemStrategy.TRUNCATE:
-            logger.warning(
-                f"Truncating oversized item {original_idx} "
-                f"({item_chars} chars > {config.max_context_chars} max)"
-            )
+            logger.warning(f"Truncating oversized item {original_idx} ({size_desc})")
             # Truncate the formatted content
             formatted = self.format_item(item, 0)
-            truncated = formatted[: config.max_context_chars]
+            truncated = formatted[:max_chars]
             # Return truncated string as new item (loses original type)
             return [(original_idx, truncated)]
 
         elif strategy == OversizedItemStrategy.SPLIT:
-            logger.info(
-                f"Splitting oversized item {original_idx} "
-                f"({item_chars} chars > {config.max_context_chars} max)"
-            )
+            logger.info(f"Splitting oversized item {original_idx} ({size_desc})")
             try:
                 pieces = self.split_oversized_item(
                     item=item,
-                    max_chars=config.max_context_chars,
+                    max_chars=max_chars,
                     overlap=config.overlap_chars,
                 )
+                if config.uses_tokens:
+                    pieces = self._refit_pieces_to_tokens(item, pieces, max_chars, config)
                 # All pieces share the same original index
                 return [(original_idx, piece) for piece in pieces]
             except NotImplementedError as e:
@@ -441,6 +486,39 @@ class IterativeContextProcessor(ABC):
             logger.error(f"Unknown oversized item strategy: {strategy}")
             return []
 
+    def _refit_pieces_to_tokens(
+        self,
+        item: Any,
+        pieces: List[Any],
+        max_chars: int,
+        config: ProcessingConfig,
+    ) -> List[Any]:
+        """
+        Re-split an item until every piece fits within max_context_tokens.
+
+        Args:
+            item: The oversized item.
+            pieces: Pieces from the first split.
+            max_chars: Character size used for the first split.
+            config: Processing configuration (token mode).
+
+        Returns:
+            Pieces that fit, or the last attempt after MAX_SPLIT_REFINEMENTS.
+        """
+        limit = config.max_context_tokens
+        for _ in range(MAX_SPLIT_REFINEMENTS):
+            largest = max(self._measure(self.format_item(p, 0), config) for p in pieces)
+            if largest <= limit or max_chars <= 1:
+                break
+            # Shrink by the worst piece's overshoot
+            max_chars = max(1, max_chars * limit // largest)
+            pieces = self.split_oversized_item(
+                item=item,
+                max_chars=max_chars,
+                overlap=config.overlap_chars,
+            )
+        return pieces
+
     def _format_batch_content(
         self,
         batch: Batch,
@@ -625,6 +703,25 @@ class IterativeContextProcessor(ABC):
 
         return config.separator.join(unique_contents)
 
+    def _measure_results(
+        self,
+        results: List[ExtractionResult],
+        config: ProcessingConfig,
+    ) -> int:
+        """
+        Measure the combined content of results joined by the separator.
+
+        Args:
+            results: Extraction results to measure.
+            config: Processing configuration.
+
+        Returns:
+            Total size in the unit returned by _measure().
+        """
+        content_size = sum(self._measure(r.content, config) for r in results)
+        separator_size = self._measure(config.separator, config)
+        return content_size + separator_size * max(0, len(results) - 1)
+
     def _process_level(
         self,
         items: List[Any],
@@ -661,85 +758,95 @@ class IterativeContextProcessor(ABC):
             message=f"Created {len(batches)} batches from {len(items)} items",
         )
 
-        # Extract from each batch
+        # Extract from each batch. Batches are independent, so up to
+        # max_concurrent_batches run at once; results come back in batch
+        # order so consolidation stays deterministic.
         extraction_results: List[ExtractionResult] = []
         successful_count = 0
 
-        for batch in batches:
-            self._report_progress(
-                stage="extracting",
-                current_batch=batch.batch_index + 1,
-                total_batches=len(batches),
-                recursion_level=recursion_level,
-                message=f"Processing batch {batch.batch_index + 1}/{len(batches)}",
-            )
-
-            batch_content = self._format_batch_content(batch, config)
+        def extract(batch: Batch) -> ExtractionResult:
             batch_metadata = {
                 "batch_index": batch.batch_index,
                 "item_count": batch.size,
                 "total_chars": batch.total_chars,
+                "total_tokens": batch.total_tokens,
                 "item_indices": batch.item_indices,
                 "recursion_level": recursion_level,
             }
+            return self.extract_from_batch(
+                batch_content=self._format_batch_content(batch, config),
+                query=query,
+                batch_metadata=batch_metadata,
+            )
 
-            try:
-                result = self.extract_from_batch(
-                    batch_content=batch_content,
-                    query=query,
-                    batch_metadata=batch_metadata,
-                )
+        extractions = ordered_concurrent_map(
+            extract,
+            batches,
+            max_in_flight=config.max_concurrent_batches,
+            thread_name_prefix="context-extract",
+        )
+        for batch, result, error in extractions:
+            self._report_progress(
+                stage="extracting",
+                current_batch=batch.batch_index + 1,
+                total_batches=len(batches),
+                recursion_level=recursion_level,
+                message=f"Processed batch {batch.batch_index + 1}/{len(batches)}",
+            )
+
+            if error is None:
                 result.batch_index = batch.batch_index
                 result.recursion_level = recursion_level
                 result.source_indices = batch.item_indices
                 extraction_results.append(result)
                 successful_count += 1
+                continue
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(
-                    f"Extraction failed for batch {batch.batch_index} "
-                    f"at level {recursion_level}: {error_msg}"
-                )
+            error_msg = str(error)
+            logger.error(
+                f"Extraction failed for batch {batch.batch_index} "
+                f"at level {recursion_level}: {error_msg}"
+            )
 
-                # Track failed batch
-                if failed_batches is not None:
-                    failed_batches.append(batch.batch_index)
-
-                # Check if we should continue or fail fast
-                if not config.continue_on_error:
-                    # Fail fast - raise the exception
-                    raise RuntimeError(
-                        f"Batch {batch.batch_index} extraction failed: {error_msg}"
-                    ) from e
-
-                # Create an error result to preserve partial progress
-                extraction_results.append(
-                    ExtractionResult(
-                        content="",
-                        metadata={"error": error_msg},
-                        source_indices=batch.item_indices,
-                        confidence=0.0,
-                        batch_index=batch.batch_index,
-                        recursion_level=recursion_level,
-                        is_error=True,
-                        error_message=error_msg,
-                    )
+            # Track failed batch
+            if failed_batches is not None:
+                failed_batches.append(batch.batch_index)
+
+            # Check if we should continue or fail fast
+            if not config.continue_on_error:
+                # Fail fast - stop consuming (queued batches are cancelled)
+                extractions.close()
+                raise RuntimeError(
+                    f"Batch {batch.batch_index} extraction failed: {error_msg}"
+                ) from error
+
+            # Create an error result to preserve partial progress
+            extraction_results.append(
+                ExtractionResult(
+                    content="",
+                    metadata={"error": error_msg},
+                    source_indices=batch.item_indices,
+                    confidence=0.0,
+                    batch_index=batch.batch_index,
+                    recursion_level=recursion_level,
+                    is_error=True,
+                    error_message=error_msg,
                 )
+            )
 
         # Store intermediate results if requested
         if intermediate_results is not None:
             intermediate_results.append(extraction_results)
 
+        # Record batch count for statistics
+        self._processing_stats.setdefault("batches_per_level", []).append(len(batches))
+
         # Check if consolidation is needed (only count valid results)
         valid_results = [r for r in extraction_results if r.is_valid]
-        total_content_length = sum(len(r.content) for r in valid_results)
-        total_with_separators = total_content_length + (
-            len(config.separator) * max(0, len(valid_results) - 1)
+        needs_recursion = (
+            self._measure_results(valid_results, config) > self._context_limit(config)
         )
 
-        needs_recursion = total_with_separators > config.max_context_chars
-
         return extraction_results, needs_recursion, successful_count
 
     def process(
@@ -824,13 +931,7 @@ class IterativeContextProcessor(ABC):
                 )
 
                 total_successful += successful_count
-
-                # Track statistics
-                batches_at_level = len(
-                    self._create_batches(current_items, config, None)
-                )
-                self._processing_stats["batches_per_level"].append(batches_at_level)
-                total_batches += batches_at_level
+                total_batches += self._processing_stats["batches_per_level"][-1]
 
                 # Check if we're done
                 if not needs_recursion:
@@ -844,18 +945,17 @@ class IterativeContextProcessor(ABC):
                     valid_results = [r for r in results if r.is_valid]
                     remaining_items = len(valid_results)
                     remaining_content_chars = sum(len(r.content) for r in valid_results)
-                    remaining_with_separators = remaining_content_chars + (
-                        len(config.separator) * max(0, remaining_items - 1)
-                    )
-                    overflow_chars = remaining_with_separators - config.max_context_chars
+                    limit = self._context_limit(config)
+                    overflow = self._measure_results(valid_results, config) - limit
+                    unit = "tokens" if config.uses_tokens else "chars"
 
                     logger.warning(
                         f"Max recursion depth ({config.max_recursion_depth}) reached. "
                         f"Returning truncated result. "
                         f"Remaining: {remaining_items} items, "
                         f"{remaining_content_chars:,} chars content "
-                        f"({overflow_chars:+,} chars over context limit of "
-                        f"{config.max_context_chars:,})"
+                        f"({overflow:+,} {unit} over context limit of "
+                        f"{limit:,})"
                     )
                     status = ProcessingStatus.TRUNCATED
                     final_result = self._merge_results(results, config, recursion_level)
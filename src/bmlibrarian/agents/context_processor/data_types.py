@@ -10,7 +10,7 @@ fit within the target context size.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from enum import Enum
 
 
@@ -48,6 +48,7 @@ DEFAULT_OVERLAP_CHARS = 0
 DEFAULT_MAX_RECURSION_DEPTH = 5
 DEFAULT_MIN_ITEMS_FOR_RECURSION = 2
 DEFAULT_SEPARATOR = "\n\n---\n\n"
+DEFAULT_MAX_CONCURRENT_BATCHES = 1  # Sequential extraction unless configured
 
 
 @dataclass
@@ -76,6 +77,13 @@ class ProcessingConfig:
             If False, fail immediately on first error.
         min_confidence_threshold: Minimum confidence score to include a result
             in consolidation. Results below this are filtered out.
+        max_context_tokens: Maximum tokens per batch. When set (together with
+            token_counter), batches are packed by token count and
+            max_context_chars is only used as a fallback split size.
+        token_counter: Function returning the token count of a string,
+            e.g. from create_hf_token_counter(). Required with max_context_tokens.
+        max_concurrent_batches: Number of batches extracted concurrently at
+            each level. Results are always merged in batch order.
     """
 
     max_context_chars: int = DEFAULT_MAX_CONTEXT_CHARS
@@ -88,6 +96,16 @@ class ProcessingConfig:
     consolidation_strategy: ConsolidationStrategy = ConsolidationStrategy.CONCATENATE
     continue_on_error: bool = True
     min_confidence_threshold: float = 0.0
+    max_context_tokens: Optional[int] = None
+    token_counter: Optional[Callable[[str], int]] = field(
+        default=None, repr=False, compare=False
+    )
+    max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES
+
+    @property
+    def uses_tokens(self) -> bool:
+        """Check if batches are sized by token count instead of characters."""
+        return self.max_context_tokens is not None
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
@@ -112,6 +130,18 @@ class ProcessingConfig:
                 f"min_confidence_threshold must be between 0.0 and 1.0, "
                 f"got {self.min_confidence_threshold}"
             )
+        if self.max_context_tokens is not None:
+            if self.max_context_tokens <= 0:
+                raise ValueError(
+                    f"max_context_tokens must be positive, got {self.max_context_tokens}"
+                )
+            if self.token_counter is None:
+                raise ValueError("max_context_tokens requires a token_counter")
+        if self.max_concurrent_batches < 1:
+            raise ValueError(
+                f"max_concurrent_batches must be at least 1, "
+                f"got {self.max_concurrent_batches}"
+            )
 
 
 @dataclass
@@ -181,12 +211,14 @@ class Batch:
         item_indices: Original indices of items in the source list.
         total_chars: Total character count of formatted items in batch.
         batch_index: Sequential index of this batch in the processing run.
+        total_tokens: Total token count of the batch when batching by tokens.
     """
 
     items: List[Any]
     item_indices: List[int] = field(default_factory=list)
     total_chars: int = 0
     batch_index: int = 0
+    total_tokens: Optional[int] = None
 
     @property
     def size(self) -> int:
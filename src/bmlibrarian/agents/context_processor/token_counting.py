@@ -0,0 +1,121 @@
+"""
+Token Counting for Context Batching
+
+Character counts are a poor proxy for how much of a model's context a
+batch uses: the chars-per-token ratio varies from ~2 for reference lists
+and numeric tables to ~5 for plain English prose. Sizing batches by
+characters therefore either wastes context (conservative limits) or
+overflows it (optimistic limits).
+
+This module provides token counters that can be passed to
+ProcessingConfig(token_counter=..., max_context_tokens=...) so batches
+are packed by the model's real tokenizer:
+
+- create_gguf_token_counter(): the exact vocabulary of a GGUF model file,
+  e.g. the blob an Ollama model is stored in (requires llama-cpp-python)
+- create_hf_token_counter(): a Hugging Face tokenizer by name or path
+  (requires transformers, installed with sentence-transformers)
+- estimate_token_count(): dependency-free heuristic fallback
+
+Usage:
+    from bmlibrarian.agents.context_processor import (
+        ProcessingConfig,
+        create_hf_token_counter,
+    )
+
+    config = ProcessingConfig(
+        max_context_tokens=6000,
+        token_counter=create_hf_token_counter("google/gemma-3-4b-it"),
+    )
+"""
+
+import logging
+import math
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+# Type alias for token counters: text -> number of tokens
+TokenCounter = Callable[[str], int]
+
+# Conservative characters-per-token ratio for English biomedical text
+DEFAULT_CHARS_PER_TOKEN = 4
+
+
+def estimate_token_count(text: str) -> int:
+    """
+    Estimate the token count of text without a tokenizer.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Estimated token count (characters / DEFAULT_CHARS_PER_TOKEN, rounded up).
+    """
+    return math.ceil(len(text) / DEFAULT_CHARS_PER_TOKEN)
+
+
+def create_hf_token_counter(tokenizer_name: str) -> TokenCounter:
+    """
+    Create a token counter backed by a Hugging Face tokenizer.
+
+    Args:
+        tokenizer_name: Model id on the Hugging Face hub or local path.
+
+    Returns:
+        Function returning the number of tokens in a string
+        (special tokens excluded).
+
+    Raises:
+        ImportError: If transformers is not installed.
+    """
+    try:
+        from transformers import AutoTokenizer
+    except ImportError as e:
+        raise ImportError(
+            "create_hf_token_counter() requires the 'transformers' package "
+            "(installed with sentence-transformers)"
+        ) from e
+
+    tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+    logger.debug(f"Loaded Hugging Face tokenizer '{tokenizer_name}' for batching")
+
+    def count_tokens(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+
+    return count_tokens
+
+
+def create_gguf_token_counter(model_path: str) -> TokenCounter:
+    """
+    Create a token counter from the vocabulary of a GGUF model file.
+
+    Only the vocabulary is loaded (no weights), so this is cheap even
+    for large models. Pointing it at the blob Ollama serves a model from
+    gives exact counts for that model.
+
+    Args:
+        model_path: Path to a .gguf model file.
+
+    Returns:
+        Function returning the number of tokens in a string
+        (BOS token excluded).
+
+    Raises:
+        ImportError: If llama-cpp-python is not installed.
+    """
+    try:
+        from llama_cpp import Llama
+    except ImportError as e:
+        raise ImportError(
+            "create_gguf_token_counter() requires the 'llama-cpp-python' package"
+        ) from e
+
+    vocab = Llama(model_path=model_path, vocab_only=True, verbose=False)
+    logger.debug(f"Loaded GGUF vocabulary from {model_path} for batching")
+
+    def count_tokens(text: str) -> int:
+        return len(vocab.tokenize(text.encode("utf-8"), add_bos=False, special=False))
+
+    return count_tokens
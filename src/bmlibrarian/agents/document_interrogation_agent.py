@@ -10,12 +10,16 @@ Can work with both:
 2. Pre-chunked documents from database (reuses existing chunks/embeddings)
 """
 
+import hashlib
 import json
 import logging
-from typing import List, Optional, Callable, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Callable, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from .base import BaseAgent
 from .text_chunking import TextChunker, TextChunk, DEFAULT_CHUNK_SIZE, DEFAULT_CHUNK_OVERLAP
 
@@ -27,6 +31,36 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Documents whose chunk embedding matrices an agent keeps, so follow-up
+# questions on the same document only embed the question
+CHUNK_EMBEDDING_CACHE_DOCUMENTS = 16
+
+
+def _unit_vector(vector: Any) -> np.ndarray:
+    """Return ``vector`` as a unit-length float32 array (zero stays zero)."""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    return array / norm if norm > 0 else array
+
+
+def _top_k_above_threshold(scores: np.ndarray, threshold: float, k: int) -> List[int]:
+    """
+    Indices of the k highest scores that reach ``threshold``, best first.
+
+    Ties keep the lower index first, as a stable sort would.
+    """
+    candidates = np.flatnonzero(scores >= threshold)
+    if k <= 0 or candidates.size == 0:
+        return []
+    if candidates.size > k:
+        candidate_scores = scores[candidates]
+        # O(n) selection of the k-th best score; keep everything reaching it
+        # so ties at the boundary are resolved by index below
+        kth = candidate_scores[np.argpartition(-candidate_scores, k - 1)[k - 1]]
+        candidates = candidates[candidate_scores >= kth]
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:k].tolist()
+
 
 class ProcessingMode(Enum):
     """Processing modes for document interrogation."""
@@ -155,6 +189,11 @@ class DocumentInterrogationAgent(BaseAgent):
         # for the attribute's existence.
         self._db_chunks: Optional[List[DatabaseChunk]] = None
 
+        # Unit-normalized float32 chunk embeddings (one row per chunk) per
+        # document, keyed by ("document", id) or ("text", sha256). LRU.
+        self._chunk_cache_key: Optional[Hashable] = None
+        self._chunk_embeddings: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+
         self.agent_type = "document_interrogation_agent"
 
     def get_agent_type(self) -> str:
@@ -431,6 +470,9 @@ class DocumentInterrogationAgent(BaseAgent):
             # current chunks by index, so stale entries silently score this
             # document against a previous one.
             self._db_chunks = None
+            self._chunk_cache_key = (
+                "text", hashlib.sha256(document_text.encode("utf-8")).hexdigest()
+            )
 
         else:  # document_id provided
             self._call_callback("document_interrogation_start",
@@ -454,6 +496,7 @@ class DocumentInterrogationAgent(BaseAgent):
             }
             # Store db_chunks for later use in embedding mode
             self._db_chunks = db_chunks
+            self._chunk_cache_key = ("document", document_id)
 
         self._call_callback("chunking_complete",
                           f"Created {len(chunks)} chunks (size={self.chunk_size}, overlap={self.chunk_overlap})")
@@ -534,6 +577,8 @@ class DocumentInterrogationAgent(BaseAgent):
         capture the semantic relationship well.
 
         When database chunks are used, reuses pre-computed embeddings for efficiency.
+        Chunk embeddings are cached per document, so follow-up questions only
+        embed the question.
 
         Args:
             chunks: List of text chunks to process
@@ -543,49 +588,23 @@ class DocumentInterrogationAgent(BaseAgent):
         Returns:
             List of relevant sections from semantically similar chunks
         """
-        # Get embeddings for question
-        self._call_callback("embedding_question", "Generating question embedding")
-        question_embedding = self._get_embedding(question)
-
-        # Check if we have pre-computed embeddings from database
-        use_db_embeddings = bool(self._db_chunks)
-
-        # Get embeddings for all chunks and calculate similarity
-        chunk_similarities = []
-        for i, chunk in enumerate(chunks):
-            # Use pre-computed embedding if available, otherwise generate
-            if use_db_embeddings and i < len(self._db_chunks):
-                db_chunk = self._db_chunks[i]
-                if db_chunk.embedding:
-                    self._call_callback("using_cached_embedding",
-                                      f"Using cached embedding for chunk {chunk.chunk_index + 1}/{chunk.total_chunks}")
-                    chunk_embedding = db_chunk.embedding
-                else:
-                    # Fallback: generate embedding if not in database
-                    self._call_callback("embedding_chunk",
-                                      f"Generating embedding for chunk {chunk.chunk_index + 1}/{chunk.total_chunks}")
-                    chunk_embedding = self._get_embedding(chunk.content)
-            else:
-                # Generate embedding on-the-fly
-                self._call_callback("embedding_chunk",
-                                  f"Embedding chunk {chunk.chunk_index + 1}/{chunk.total_chunks}")
-                chunk_embedding = self._get_embedding(chunk.content)
-
-            similarity = self._cosine_similarity(question_embedding, chunk_embedding)
+        question_vector, chunk_matrix = self._embed_question_and_chunks(chunks, question)
 
-            if similarity >= self.embedding_threshold:
-                chunk_similarities.append((chunk, similarity))
-
-        # Sort by similarity
-        chunk_similarities.sort(key=lambda x: x[1], reverse=True)
+        # Rows are unit length, so one matrix-vector product gives every
+        # cosine similarity
+        similarities = chunk_matrix @ question_vector
+        chunk_similarities = [
+            (chunks[i], float(similarities[i]))
+            for i in _top_k_above_threshold(similarities, self.embedding_threshold, max_sections)
+        ]
 
         self._call_callback("embedding_selection_complete",
-                          f"Selected {len(chunk_similarities)} chunks above threshold "
-                          f"{self.embedding_threshold:.2f}")
+                          f"Selected {int(np.count_nonzero(similarities >= self.embedding_threshold))} "
+                          f"chunks above threshold {self.embedding_threshold:.2f}")
 
         # Process only the most similar chunks
         relevant_sections = []
-        for chunk, similarity in chunk_similarities[:max_sections]:
+        for chunk, similarity in chunk_similarities:
             self._call_callback("processing_relevant_chunk",
                               f"Processing chunk {chunk.chunk_index + 1} (similarity: {similarity:.2f})")
 
@@ -596,6 +615,83 @@ class DocumentInterrogationAgent(BaseAgent):
         relevant_sections.sort(key=lambda s: s.relevance_score, reverse=True)
         return relevant_sections[:max_sections]
 
+    def _embed_question_and_chunks(self,
+                                   chunks: List[TextChunk],
+                                   question: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get unit-normalized embeddings for the question and every chunk.
+
+        Chunk embeddings come from the per-document cache, else from the
+        database chunks, else from the embedding model. The question and all
+        chunks still missing an embedding are embedded in one embed_batch()
+        call.
+
+        Args:
+            chunks: Text chunks of the current document
+            question: The question to answer
+
+        Returns:
+            Tuple of (question vector, chunk matrix with one row per chunk)
+
+        Raises:
+            ValueError: If embedding dimensions do not match
+        """
+        # Vectors from different embedding models live in different spaces,
+        # so the model is part of the cache key
+        key = (
+            (self.embedding_model, self._chunk_cache_key)
+            if self._chunk_cache_key is not None else None
+        )
+        cached = self._chunk_embeddings.get(key) if key is not None else None
+        if cached is not None and cached.shape[0] == len(chunks):
+            self._chunk_embeddings.move_to_end(key)
+            self._call_callback("using_cached_embedding",
+                              f"Using cached embeddings for {len(chunks)} chunks")
+            self._call_callback("embedding_question", "Generating question embedding")
+            response = self._llm_client.embed_batch([question], model=self.embedding_model)
+            return _unit_vector(response.embeddings[0]), cached
+
+        stored: List[Optional[Any]] = [None] * len(chunks)
+        if self._db_chunks:
+            for i, db_chunk in enumerate(self._db_chunks[:len(chunks)]):
+                if db_chunk.embedding is not None and len(db_chunk.embedding) > 0:
+                    stored[i] = db_chunk.embedding
+        missing = [i for i, vector in enumerate(stored) if vector is None]
+
+        if len(missing) < len(chunks):
+            self._call_callback("using_cached_embedding",
+                              f"Using stored embeddings for {len(chunks) - len(missing)} chunks")
+        self._call_callback("embedding_question", "Generating question embedding")
+        if missing:
+            self._call_callback("embedding_chunk",
+                              f"Embedding {len(missing)} chunks in one batch")
+        response = self._llm_client.embed_batch(
+            [question] + [chunks[i].content for i in missing],
+            model=self.embedding_model,
+        )
+        question_vector = _unit_vector(response.embeddings[0])
+
+        matrix = np.empty((len(chunks), question_vector.shape[0]), dtype=np.float32)
+        for i, vector in enumerate(stored):
+            if vector is not None:
+                if len(vector) != matrix.shape[1]:
+                    raise ValueError(
+                        f"Chunk {i} embedding has {len(vector)} dimensions, "
+                        f"question embedding has {matrix.shape[1]}"
+                    )
+                matrix[i] = vector
+        if missing:
+            matrix[missing] = np.asarray(response.embeddings[1:], dtype=np.float32)
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        if key is not None:
+            self._chunk_embeddings[key] = matrix
+            while len(self._chunk_embeddings) > CHUNK_EMBEDDING_CACHE_DOCUMENTS:
+                self._chunk_embeddings.popitem(last=False)
+        return question_vector, matrix
+
     def _process_hybrid(self,
                        chunks: List[TextChunk],
                        question: str,
@@ -797,55 +893,6 @@ Return JSON format: {{"answer": "...", "confidence": 0.0-1.0}}"""
             logger.error(f"Error synthesizing answer: {e}")
             return f"Error generating answer: {str(e)}", 0.0
 
-    def _get_embedding(self, text: str) -> List[float]:
-        """
-        Get embedding vector for text using Ollama.
-
-        Reuses the BaseAgent._generate_embedding() method which handles
-        logging and error handling consistently with other agents.
-
-        Args:
-            text: The text to embed
-
-        Returns:
-            Embedding vector as list of floats
-
-        Raises:
-            Exception: If embedding generation fails
-        """
-        # Use BaseAgent's _generate_embedding method with our embedding_model
-        return self._generate_embedding(text, model=self.embedding_model)
-
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """
-        Calculate cosine similarity between two vectors.
-
-        Args:
-            vec1: First vector
-            vec2: Second vector
-
-        Returns:
-            Cosine similarity score between -1 and 1
-
-        Raises:
-            ValueError: If vectors have different lengths
-        """
-        if len(vec1) != len(vec2):
-            raise ValueError(f"Vectors must have same length: {len(vec1)} vs {len(vec2)}")
-
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(vec1, vec2))
-
-        # Calculate magnitudes
-        mag1 = sum(a * a for a in vec1) ** 0.5
-        mag2 = sum(b * b for b in vec2) ** 0.5
-
-        # Avoid division by zero
-        if mag1 == 0 or mag2 == 0:
-            return 0.0
-
-        return dot_product / (mag1 * mag2)
-
     def test_connection(self) -> bool:
         """
         Test connection to Ollama server and verify models are available.
@@ -12,7 +12,9 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import time
 
-from .queue_manager import QueueManager, TaskStatus, TaskPriority, QueueTask
+from .queue_manager import (
+    DEFAULT_CLAIM_BATCH_SIZE, QueueManager, TaskStatus, TaskPriority, QueueTask
+)
 from .base import BaseAgent
 
 
@@ -97,18 +99,24 @@ class AgentOrchestrator:
     def __init__(self, 
                  queue_manager: Optional[QueueManager] = None,
                  max_workers: int = 4,
-                 polling_interval: float = 1.0):
+                 polling_interval: float = 1.0,
+                 claim_batch_size: int = DEFAULT_CLAIM_BATCH_SIZE):
         """
         Initialize orchestrator.
         
         Args:
             queue_manager: Queue manager instance. Creates default if None.
             max_workers: Maximum number of concurrent agent workers
-            polling_interval: How often to poll for new tasks (seconds)
+            polling_interval: How often to poll for new tasks (seconds). Idle
+                workers are woken immediately by tasks submitted in this
+                process, so this only bounds the delay for tasks queued by
+                other processes.
+            claim_batch_size: Maximum tasks an agent worker claims per dequeue
         """
         self.queue = queue_manager or QueueManager()
         self.max_workers = max_workers
         self.polling_interval = polling_interval
+        self.claim_batch_size = max(1, claim_batch_size)
         
         # Agent registry
         self.agents: Dict[str, BaseAgent] = {}
@@ -336,6 +344,8 @@ class AgentOrchestrator:
     def stop_processing(self, timeout: float = 30.0):
         """Stop background processing threads."""
         self._stop_processing.set()
+        # Wake workers blocked waiting for new tasks so they see the stop flag
+        self.queue.notify_task_available()
         
         # Wait for threads to finish
         for thread in self._processing_threads:
@@ -347,66 +357,93 @@ class AgentOrchestrator:
         logger.info("Stopped agent processing")
     
     def _process_agent_tasks(self, agent_type: str, agent: BaseAgent):
-        """Process tasks for a specific agent type."""
+        """Process tasks for a specific agent type.
+
+        Claims up to ``claim_batch_size`` tasks per dequeue and, when the
+        queue is empty, blocks on the queue's wakeup signal instead of
+        sleeping for a fixed interval.
+        """
         logger.info(f"Started processing tasks for agent: {agent_type}")
         
         while not self._stop_processing.is_set():
             try:
-                task = self.queue.get_next_task(agent_type)
-                if task is None:
-                    time.sleep(self.polling_interval)
-                    continue
-                
-                self._notify_progress("task_started", f"Processing task {task.id}", {
-                    "task_id": task.id,
-                    "agent_type": agent_type,
-                    "method_name": task.method_name
-                })
-                
-                # Execute the task
-                method = getattr(agent, task.method_name, None)
-                if method is None:
-                    error_msg = f"Method {task.method_name} not found on agent {agent_type}"
-                    logger.error(error_msg)
-                    self.queue.fail_task(task.id, error_msg, retry=False)
+                # Read before claiming so a task added after an empty claim
+                # still wakes the wait below.
+                generation = self.queue.get_task_generation()
+                tasks = self.queue.get_next_tasks(agent_type, limit=self.claim_batch_size)
+                if not tasks:
+                    self.queue.wait_for_tasks(self.polling_interval, since_generation=generation)
                     continue
                 
+                unstarted = [task.id for task in tasks]
                 try:
-                    # Call the agent method with task data
-                    result = method(**task.data)
-                    
-                    # Handle different result types
-                    if hasattr(result, '__dict__'):
-                        # Convert dataclass/object to dict
-                        result_dict = result.__dict__ if hasattr(result, '__dict__') else {}
-                    elif isinstance(result, dict):
-                        result_dict = result
-                    else:
-                        # Wrap primitive results
-                        result_dict = {"result": result}
-                    
-                    self.queue.complete_task(task.id, result_dict)
-                    
-                    self._notify_progress("task_completed", f"Task {task.id} completed", {
-                        "task_id": task.id,
-                        "agent_type": agent_type,
-                        "result": result_dict
-                    })
-                    
-                except Exception as e:
-                    error_msg = f"Task execution failed: {str(e)}"
-                    logger.error(f"Task {task.id} failed: {error_msg}")
-                    self.queue.fail_task(task.id, error_msg)
-                    
-                    self._notify_progress("task_failed", f"Task {task.id} failed", {
-                        "task_id": task.id,
-                        "agent_type": agent_type,
-                        "error": error_msg
-                    })
+                    for task in tasks:
+                        if self._stop_processing.is_set():
+                            break
+                        unstarted.pop(0)
+                        if not self.queue.start_task(task.id):
+                            logger.warning(
+                                f"Task {task.id} was reclaimed before it started; skipping"
+                            )
+                            continue
+                        self._execute_task(agent_type, agent, task)
+                finally:
+                    # Hand claimed tasks we will not run back to other workers
+                    if unstarted:
+                        self.queue.release_tasks(unstarted)
             
             except Exception as e:
                 logger.error(f"Error in task processing loop for {agent_type}: {e}")
-                time.sleep(self.polling_interval * 2)  # Back off on errors
+                self._stop_processing.wait(self.polling_interval * 2)  # Back off on errors
+
+    def _execute_task(self, agent_type: str, agent: BaseAgent, task: QueueTask):
+        """Run one claimed task on its agent and record the outcome."""
+        self._notify_progress("task_started", f"Processing task {task.id}", {
+            "task_id": task.id,
+            "agent_type": agent_type,
+            "method_name": task.method_name
+        })
+        
+        # Execute the task
+        method = getattr(agent, task.method_name, None)
+        if method is None:
+            error_msg = f"Method {task.method_name} not found on agent {agent_type}"
+            logger.error(error_msg)
+            self.queue.fail_task(task.id, error_msg, retry=False)
+            return
+        
+        try:
+            # Call the agent method with task data
+            result = method(**task.data)
+            
+            # Handle different result types
+            if hasattr(result, '__dict__'):
+                # Convert dataclass/object to dict
+                result_dict = result.__dict__ if hasattr(result, '__dict__') else {}
+            elif isinstance(result, dict):
+                result_dict = result
+            else:
+                # Wrap primitive results
+                result_dict = {"result": result}
+            
+            self.queue.complete_task(task.id, result_dict)
+            
+            self._notify_progress("task_completed", f"Task {task.id} completed", {
+                "task_id": task.id,
+                "agent_type": agent_type,
+                "result": result_dict
+            })
+            
+        except Exception as e:
+            error_msg = f"Task execution failed: {str(e)}"
+            logger.error(f"Task {task.id} failed: {error_msg}")
+            self.queue.fail_task(task.id, error_msg)
+            
+            self._notify_progress("task_failed", f"Task {task.id} failed", {
+                "task_id": task.id,
+                "agent_type": agent_type,
+                "error": error_msg
+            })
     
     def wait_for_completion(self, task_ids: List[str], timeout: Optional[float] = None) -> Dict[str, QueueTask]:
         """
@@ -108,6 +108,7 @@ from .validators import (
     add_validation_to_dimension_score,
     search_chunks_by_query,
     get_all_document_chunks,
+    DocumentChunkCache,
     DEFAULT_EMBEDDING_MODEL,
     DEFAULT_SIMILARITY_THRESHOLD,
     MIN_SIMILARITY_THRESHOLD,
@@ -188,6 +189,7 @@ __all__ = [
     "add_validation_to_dimension_score",
     "search_chunks_by_query",
     "get_all_document_chunks",
+    "DocumentChunkCache",
     "DEFAULT_EMBEDDING_MODEL",
     "DEFAULT_SIMILARITY_THRESHOLD",
     "MIN_SIMILARITY_THRESHOLD",
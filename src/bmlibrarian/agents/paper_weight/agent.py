@@ -15,11 +15,14 @@ all assessment components. The actual implementations are in separate modules:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Dict, List, Any, TYPE_CHECKING
 
 from ..base import BaseAgent
+from ..utils.concurrency import ordered_concurrent_map
 from ...config import get_model, get_agent_config, get_ollama_host
 
 # Import data models
@@ -65,6 +68,7 @@ from .db import (
 
 # Import validators for LLM validation of rule-based extractions
 from .validators import (
+    DocumentChunkCache,
     ValidationResult,
     validate_study_type_extraction,
     validate_sample_size_extraction,
@@ -94,6 +98,8 @@ DEFAULT_CONFIG = {
     'max_tokens': 3000,
     'version': '1.0.0',
     'validate_extractions': True,  # Enable LLM validation of rule-based extractions
+    'max_concurrent_dimensions': 4,  # Independent dimensions assessed at once per paper
+    'max_concurrent_papers': 1,  # Papers in the LLM stage at once in assess_papers()
     'dimension_weights': {
         'study_design': 0.25,
         'sample_size': 0.15,
@@ -135,6 +141,20 @@ DEFAULT_CONFIG = {
 }
 
 
+# Task name for the legacy-mode LLM validation of rule-based extractions
+_VALIDATION_TASK = 'extraction_validation'
+
+
+@dataclass
+class _PreparedPaper:
+    """Output of the database stage of one assessment."""
+
+    document_id: int
+    cached: Optional[PaperWeightResult] = None
+    document: Optional[dict] = None
+    chunk_cache: Optional[DocumentChunkCache] = None
+
+
 def merge_config_with_defaults(config: dict, defaults: dict) -> dict:
     """
     Deep merge config with defaults (config takes precedence).
@@ -209,6 +229,8 @@ class PaperWeightAssessmentAgent(BaseAgent):
         top_p = self.config.get('top_p', 0.9)
         self.max_tokens = self.config.get('max_tokens', 3000)
         self.version = self.config.get('version', '1.0.0')
+        self.max_concurrent_dimensions = max(1, self.config.get('max_concurrent_dimensions', 4))
+        self.max_concurrent_papers = max(1, self.config.get('max_concurrent_papers', 1))
 
         super().__init__(
             model=model,
@@ -401,6 +423,7 @@ class PaperWeightAssessmentAgent(BaseAgent):
         study_design_score: DimensionScore,
         sample_size_score: DimensionScore,
         document: Optional[dict] = None,
+        chunk_cache: Optional[DocumentChunkCache] = None,
     ) -> List[str]:
         """
         Validate rule-based extractions using LLM.
@@ -415,6 +438,7 @@ class PaperWeightAssessmentAgent(BaseAgent):
             study_design_score: Study design DimensionScore from rule-based extraction
             sample_size_score: Sample size DimensionScore from rule-based extraction
             document: Optional document dict with 'full_text', 'abstract' fields
+            chunk_cache: Optional shared DocumentChunkCache for this document
 
         Returns:
             List of conflict descriptions (empty if no conflicts)
@@ -422,7 +446,7 @@ class PaperWeightAssessmentAgent(BaseAgent):
         conflicts = []
 
         # Check if document has chunks available
-        chunks = get_all_document_chunks(document_id, limit=5)
+        chunks = get_all_document_chunks(document_id, limit=5, chunk_cache=chunk_cache)
 
         # If no chunks, try to use full_text directly
         if not chunks and document:
@@ -466,6 +490,7 @@ class PaperWeightAssessmentAgent(BaseAgent):
                 llm_client=self._llm_client,
                 model=model,
                 fallback_chunks=chunks,
+                chunk_cache=chunk_cache,
             )
 
             if study_validation.has_conflict:
@@ -490,6 +515,7 @@ class PaperWeightAssessmentAgent(BaseAgent):
                 llm_client=self._llm_client,
                 model=model,
                 fallback_chunks=chunks,
+                chunk_cache=chunk_cache,
             )
 
             if sample_validation.has_conflict:
@@ -542,142 +568,317 @@ class PaperWeightAssessmentAgent(BaseAgent):
             3. Otherwise, perform full assessment:
                a. Fetch document from database
                b. Ensure embeddings exist (create if full_text available but no chunks)
-               c. Extract study type using LLM + semantic search
-               d. Extract sample size using LLM + semantic search
-               e. Assess methodological quality (LLM)
-               f. Assess risk of bias (LLM)
-               g. Check replication status (database query)
-               h. Compute final weight
-               i. Store in database
+               c. Fetch the document's chunks once, shared by all dimensions
+               d. Concurrently (up to max_concurrent_dimensions at once):
+                  - Extract study type using LLM + semantic search
+                  - Extract sample size using LLM + semantic search
+                  - Assess methodological quality (LLM)
+                  - Assess risk of bias (LLM)
+                  - Check replication status (database query)
+               e. Compute final weight
+               f. Store in database
             4. Return result
 
         Workflow (legacy mode):
             Uses keyword/regex extraction with LLM validation fallback.
         """
         try:
-            # Check cache
-            if not force_reassess:
-                cached = get_cached_assessment(document_id, self.version)
-                if cached:
-                    logger.info(f"Using cached assessment for document {document_id} (version {self.version})")
-                    return cached
+            prepared = self._prepare_assessment(document_id, force_reassess, use_llm_extraction)
+            return self._complete_assessment(prepared, study_assessment, use_llm_extraction)
 
-            logger.info(f"Performing fresh assessment for document {document_id}...")
+        except Exception as e:
+            logger.error(f"Error assessing paper {document_id}: {e}")
+            return self._create_error_result(document_id, str(e))
 
-            # Fetch document
-            document = get_document(document_id)
+    def assess_papers(
+        self,
+        document_ids: List[int],
+        force_reassess: bool = False,
+        study_assessments: Optional[Dict[int, dict]] = None,
+        use_llm_extraction: bool = True,
+        max_concurrent_papers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[PaperWeightResult]:
+        """
+        Assess many papers with database work pipelined behind LLM calls.
 
-            # Step 1: Ensure embeddings exist if document has full_text
-            # This enables semantic search for LLM-first extraction
-            # Full text documents MUST be properly chunked and embedded - no fallback to synthetic chunks
-            if use_llm_extraction:
-                has_full_text = bool(document.get('full_text'))
-                if has_full_text:
-                    embeddings_ready = ensure_document_embeddings(
-                        document_id=document_id,
-                        document=document,
-                    )
-                    if embeddings_ready:
-                        logger.info(f"Document {document_id} embeddings ready for semantic search")
-                    else:
-                        raise ValueError(
-                            f"Document {document_id} has full_text but embedding creation failed. "
-                            "Full text documents must be properly chunked and embedded before assessment."
-                        )
-
-            # Get config values
-            hierarchy_config = self.config.get('study_type_hierarchy')
-            scoring_config = self.config.get('sample_size_scoring')
-
-            # Step 2: Extract study type and sample size
-            if use_llm_extraction:
-                # LLM-first extraction with semantic search
-                logger.info("Using LLM-first extraction with semantic search")
-
-                study_design_score = extract_study_type_llm(
-                    document_id=document_id,
-                    llm_client=self._llm_client,
-                    model=self.model,
-                    document=document,
-                    hierarchy_config=hierarchy_config,
-                )
+        Two stages run as a pipeline: the database stage (cache lookup,
+        document fetch, embedding check, chunk fetch) runs ahead on a
+        background thread while the LLM stage assesses earlier papers, each
+        with its dimensions running concurrently. Failures are isolated per
+        paper and returned as error results.
 
-                sample_size_score = extract_sample_size_llm(
-                    document_id=document_id,
-                    llm_client=self._llm_client,
-                    model=self.model,
-                    document=document,
-                    scoring_config=scoring_config,
-                )
+        Args:
+            document_ids: Database IDs of documents to assess
+            force_reassess: If True, skip cache and re-assess
+            study_assessments: Optional StudyAssessmentAgent outputs keyed by document ID
+            use_llm_extraction: See assess_paper()
+            max_concurrent_papers: Papers in the LLM stage at once; None uses
+                the 'max_concurrent_papers' config value
+            progress_callback: Optional callback(completed, total), called on
+                the calling thread as each result is ready
+
+        Returns:
+            List of PaperWeightResult in the same order as document_ids
+        """
+        if max_concurrent_papers is None:
+            max_concurrent_papers = self.max_concurrent_papers
+        max_concurrent_papers = max(1, max_concurrent_papers)
+        study_assessments = study_assessments or {}
+        total = len(document_ids)
+
+        # One paper more than the LLM stage can take is prepared ahead, so
+        # the next paper's DB/embedding work overlaps the current LLM calls
+        prepared = ordered_concurrent_map(
+            lambda document_id: self._prepare_assessment(
+                document_id, force_reassess, use_llm_extraction
+            ),
+            document_ids,
+            max_in_flight=max_concurrent_papers + 1,
+            thread_name_prefix="paper-weight-fetch",
+        )
 
-                # No validation conflicts in LLM-first mode (LLM is primary)
-                validation_conflicts = []
+        def complete(item: tuple) -> PaperWeightResult:
+            document_id, paper, error = item
+            if error is not None:
+                raise error
+            return self._complete_assessment(
+                paper, study_assessments.get(document_id), use_llm_extraction
+            )
 
-            else:
-                # Legacy: keyword/regex extraction with LLM validation
-                logger.info("Using legacy keyword/regex extraction with LLM validation")
+        results: List[PaperWeightResult] = []
+        for (document_id, _, _), result, error in ordered_concurrent_map(
+            complete,
+            prepared,
+            max_in_flight=max_concurrent_papers,
+            thread_name_prefix="paper-weight-assess",
+        ):
+            if error is not None:
+                logger.error(f"Error assessing paper {document_id}: {error}")
+                result = self._create_error_result(document_id, str(error))
+            results.append(result)
+            if progress_callback:
+                progress_callback(len(results), total)
 
-                keywords_config = self.config.get('study_type_keywords')
+        return results
 
-                study_design_score = extract_study_type(
-                    document, keywords_config, hierarchy_config, STUDY_TYPE_PRIORITY
+    def _prepare_assessment(
+        self,
+        document_id: int,
+        force_reassess: bool,
+        use_llm_extraction: bool,
+    ) -> _PreparedPaper:
+        """
+        Database stage of an assessment: cache, document, embeddings, chunks.
+
+        Args:
+            document_id: Database ID of document to assess
+            force_reassess: If True, skip cache lookup
+            use_llm_extraction: Whether embeddings are required (LLM-first mode)
+
+        Returns:
+            _PreparedPaper holding either the cached result or the document
+            and its loaded chunk cache
+
+        Raises:
+            ValueError: If a full-text document could not be embedded
+        """
+        # Check cache
+        if not force_reassess:
+            cached = get_cached_assessment(document_id, self.version)
+            if cached:
+                logger.info(f"Using cached assessment for document {document_id} (version {self.version})")
+                return _PreparedPaper(document_id=document_id, cached=cached)
+
+        logger.info(f"Performing fresh assessment for document {document_id}...")
+
+        # Fetch document
+        document = get_document(document_id)
+        has_full_text = bool(document.get('full_text'))
+
+        # Ensure embeddings exist if document has full_text
+        # This enables semantic search for LLM-first extraction
+        # Full text documents MUST be properly chunked and embedded - no fallback to synthetic chunks
+        if use_llm_extraction and has_full_text:
+            embeddings_ready = ensure_document_embeddings(
+                document_id=document_id,
+                document=document,
+            )
+            if embeddings_ready:
+                logger.info(f"Document {document_id} embeddings ready for semantic search")
+            else:
+                raise ValueError(
+                    f"Document {document_id} has full_text but embedding creation failed. "
+                    "Full text documents must be properly chunked and embedded before assessment."
                 )
-                sample_size_score = extract_sample_size_dimension(document, scoring_config)
 
-                # Validate rule-based extractions with LLM if enabled
-                validation_conflicts = []
-                if self.config.get('validate_extractions', True):
-                    validation_conflicts = self._validate_extractions(
-                        document_id,
-                        study_design_score,
-                        sample_size_score,
-                        document=document,
-                    )
+        # Fetch chunk texts once; every dimension reads from this cache
+        chunk_cache = DocumentChunkCache(document_id)
+        if has_full_text:
+            chunk_cache.load()
+
+        return _PreparedPaper(
+            document_id=document_id,
+            document=document,
+            chunk_cache=chunk_cache,
+        )
+
+    def _complete_assessment(
+        self,
+        paper: _PreparedPaper,
+        study_assessment: Optional[dict],
+        use_llm_extraction: bool,
+    ) -> PaperWeightResult:
+        """
+        LLM stage of an assessment: run the dimensions, weight and store.
+
+        Args:
+            paper: Output of _prepare_assessment()
+            study_assessment: Optional StudyAssessmentAgent output to leverage
+            use_llm_extraction: See assess_paper()
+
+        Returns:
+            PaperWeightResult (the cached one if the database stage found it)
+        """
+        if paper.cached is not None:
+            return paper.cached
 
-            # Step 3: LLM assessments (same for both modes)
-            methodological_quality_score = self._assess_methodological_quality(document, study_assessment)
-            risk_of_bias_score = self._assess_risk_of_bias(document, study_assessment)
-            replication_status_score = check_replication_status(document_id)
-
-            # Compute final weight
-            dimension_scores = {
-                DIMENSION_STUDY_DESIGN: study_design_score,
-                DIMENSION_SAMPLE_SIZE: sample_size_score,
-                DIMENSION_METHODOLOGICAL_QUALITY: methodological_quality_score,
-                DIMENSION_RISK_OF_BIAS: risk_of_bias_score,
-                DIMENSION_REPLICATION_STATUS: replication_status_score
-            }
-            final_weight = self._compute_final_weight(dimension_scores)
-
-            # Extract metadata from dimension scores
-            study_type = get_extracted_study_type(study_design_score)
-            sample_size_n = get_extracted_sample_size(sample_size_score)
-
-            # Create result
-            result = PaperWeightResult(
+        document_id = paper.document_id
+        document = paper.document
+        chunk_cache = paper.chunk_cache
+
+        # Get config values
+        hierarchy_config = self.config.get('study_type_hierarchy')
+        scoring_config = self.config.get('sample_size_scoring')
+
+        # Independent dimensions; the study design/sample size tasks come
+        # first so the slowest LLM calls start first
+        tasks: Dict[str, Callable[[], Any]] = {}
+        validation_conflicts: List[str] = []
+
+        if use_llm_extraction:
+            # LLM-first extraction with semantic search
+            logger.info("Using LLM-first extraction with semantic search")
+
+            tasks[DIMENSION_STUDY_DESIGN] = lambda: extract_study_type_llm(
                 document_id=document_id,
-                assessor_version=self.version,
-                assessed_at=datetime.now(),
-                study_design=study_design_score,
-                sample_size=sample_size_score,
-                methodological_quality=methodological_quality_score,
-                risk_of_bias=risk_of_bias_score,
-                replication_status=replication_status_score,
-                final_weight=final_weight,
-                dimension_weights=self.get_dimension_weights(),
-                study_type=study_type,
-                sample_size_n=sample_size_n,
-                validation_conflicts=validation_conflicts,
+                llm_client=self._llm_client,
+                model=self.model,
+                document=document,
+                hierarchy_config=hierarchy_config,
+                chunk_cache=chunk_cache,
             )
+            tasks[DIMENSION_SAMPLE_SIZE] = lambda: extract_sample_size_llm(
+                document_id=document_id,
+                llm_client=self._llm_client,
+                model=self.model,
+                document=document,
+                scoring_config=scoring_config,
+                chunk_cache=chunk_cache,
+            )
+            # No validation conflicts in LLM-first mode (LLM is primary)
 
-            # Store in database
-            store_assessment(result)
+        else:
+            # Legacy: keyword/regex extraction with LLM validation
+            logger.info("Using legacy keyword/regex extraction with LLM validation")
 
-            return result
+            keywords_config = self.config.get('study_type_keywords')
 
-        except Exception as e:
-            logger.error(f"Error assessing paper {document_id}: {e}")
-            return self._create_error_result(document_id, str(e))
+            study_design_score = extract_study_type(
+                document, keywords_config, hierarchy_config, STUDY_TYPE_PRIORITY
+            )
+            sample_size_score = extract_sample_size_dimension(document, scoring_config)
+
+            # Validate rule-based extractions with LLM if enabled
+            if self.config.get('validate_extractions', True):
+                tasks[_VALIDATION_TASK] = lambda: self._validate_extractions(
+                    document_id,
+                    study_design_score,
+                    sample_size_score,
+                    document=document,
+                    chunk_cache=chunk_cache,
+                )
+
+        # LLM assessments (same for both modes)
+        tasks[DIMENSION_METHODOLOGICAL_QUALITY] = lambda: self._assess_methodological_quality(
+            document, study_assessment
+        )
+        tasks[DIMENSION_RISK_OF_BIAS] = lambda: self._assess_risk_of_bias(document, study_assessment)
+        tasks[DIMENSION_REPLICATION_STATUS] = lambda: check_replication_status(document_id)
+
+        outcomes = self._run_dimension_tasks(tasks)
+
+        if use_llm_extraction:
+            study_design_score = outcomes[DIMENSION_STUDY_DESIGN]
+            sample_size_score = outcomes[DIMENSION_SAMPLE_SIZE]
+        else:
+            validation_conflicts = outcomes.get(_VALIDATION_TASK, [])
+        methodological_quality_score = outcomes[DIMENSION_METHODOLOGICAL_QUALITY]
+        risk_of_bias_score = outcomes[DIMENSION_RISK_OF_BIAS]
+        replication_status_score = outcomes[DIMENSION_REPLICATION_STATUS]
+
+        # Compute final weight
+        dimension_scores = {
+            DIMENSION_STUDY_DESIGN: study_design_score,
+            DIMENSION_SAMPLE_SIZE: sample_size_score,
+            DIMENSION_METHODOLOGICAL_QUALITY: methodological_quality_score,
+            DIMENSION_RISK_OF_BIAS: risk_of_bias_score,
+            DIMENSION_REPLICATION_STATUS: replication_status_score
+        }
+        final_weight = self._compute_final_weight(dimension_scores)
+
+        # Extract metadata from dimension scores
+        study_type = get_extracted_study_type(study_design_score)
+        sample_size_n = get_extracted_sample_size(sample_size_score)
+
+        # Create result
+        result = PaperWeightResult(
+            document_id=document_id,
+            assessor_version=self.version,
+            assessed_at=datetime.now(),
+            study_design=study_design_score,
+            sample_size=sample_size_score,
+            methodological_quality=methodological_quality_score,
+            risk_of_bias=risk_of_bias_score,
+            replication_status=replication_status_score,
+            final_weight=final_weight,
+            dimension_weights=self.get_dimension_weights(),
+            study_type=study_type,
+            sample_size_n=sample_size_n,
+            validation_conflicts=validation_conflicts,
+        )
+
+        # Store in database
+        store_assessment(result)
+
+        return result
+
+    def _run_dimension_tasks(self, tasks: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run independent dimension tasks with bounded concurrency.
+
+        With max_concurrent_dimensions <= 1 the tasks run inline, in order.
+        If a task raises, tasks not yet started are cancelled and the
+        exception propagates.
+
+        Args:
+            tasks: Mapping of task name to zero-argument callable
+
+        Returns:
+            Mapping of task name to the callable's return value
+        """
+        max_workers = min(self.max_concurrent_dimensions, len(tasks))
+        if max_workers <= 1:
+            return {name: task() for name, task in tasks.items()}
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="paper-weight-dimension"
+        )
+        try:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+            return {name: future.result() for name, future in futures.items()}
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     def assess_full_paper(
         self,
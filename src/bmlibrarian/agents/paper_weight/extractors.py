@@ -11,7 +11,10 @@ All functions are stateless and can be tested in isolation.
 
 import re
 import math
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Tuple
+
+from ..utils.keyword_matcher import KeywordMatcher
 
 from .models import (
     DimensionScore,
@@ -140,6 +143,25 @@ CI_PATTERNS = [
     r'\(\s*\d+\.?\d*\s*-\s*\d+\.?\d*\s*\)',  # (1.2-3.4)
 ]
 
+# Each pattern list compiled once into a single alternation, so a text is
+# scanned once rather than once per pattern. Sample size patterns share
+# their number with any pattern overlapping them, so non-overlapping
+# matching finds the same set of sizes.
+_SAMPLE_SIZE_REGEX = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in SAMPLE_SIZE_PATTERNS), re.IGNORECASE
+)
+_CI_REGEX = re.compile("|".join(f"(?:{pattern})" for pattern in CI_PATTERNS), re.IGNORECASE)
+_POWER_CALCULATION_MATCHER = KeywordMatcher(POWER_CALCULATION_KEYWORDS)
+
+# Study type keyword matchers cached per keyword set
+STUDY_TYPE_MATCHER_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=STUDY_TYPE_MATCHER_CACHE_SIZE)
+def _get_study_type_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    """Compile (once per keyword set) a matcher for lowercase study type keywords."""
+    return KeywordMatcher(keywords)
+
 
 def extract_text_context(text: str, keyword: str, context_chars: int = 50) -> str:
     """
@@ -214,13 +236,12 @@ def find_sample_size(text: str, min_n: int = 5, max_n: int = 1000000) -> Optiona
     """
     found_sizes = []
 
-    for pattern in SAMPLE_SIZE_PATTERNS:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
-            size = int(match.group(1))
-            # Filter out unrealistic values
-            if min_n <= size <= max_n:
-                found_sizes.append(size)
+    for match in _SAMPLE_SIZE_REGEX.finditer(text):
+        # Exactly one pattern's number group participates in each match
+        size = int(next(group for group in match.groups() if group is not None))
+        # Filter out unrealistic values
+        if min_n <= size <= max_n:
+            found_sizes.append(size)
 
     if not found_sizes:
         return None
@@ -259,8 +280,7 @@ def has_power_calculation(text: str) -> bool:
     Returns:
         True if power calculation mentioned
     """
-    text_lower = text.lower()
-    return any(keyword in text_lower for keyword in POWER_CALCULATION_KEYWORDS)
+    return _POWER_CALCULATION_MATCHER.search(text.lower()) is not None
 
 
 def find_power_calc_context(text: str) -> str:
@@ -290,17 +310,15 @@ def has_ci_reporting(text: str) -> bool:
     Returns:
         True if confidence intervals are reported
     """
-    for pattern in CI_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _CI_REGEX.search(text) is not None
 
 
 def has_exclusion_pattern(
     text: str,
     keyword: str,
     exclusion_patterns: List[str],
-    context_window: int = EXCLUSION_CONTEXT_WINDOW
+    context_window: int = EXCLUSION_CONTEXT_WINDOW,
+    keyword_pos: Optional[int] = None
 ) -> bool:
     """
     Check if any exclusion pattern appears near the keyword match.
@@ -313,12 +331,15 @@ def has_exclusion_pattern(
         keyword: The matched keyword (lowercase)
         exclusion_patterns: List of patterns that should invalidate the match
         context_window: Number of characters before keyword to check
+        keyword_pos: Position of the keyword's first occurrence, if already
+            known (avoids searching for it again)
 
     Returns:
         True if an exclusion pattern is found, False otherwise
     """
     # Find the keyword position
-    keyword_pos = text.find(keyword)
+    if keyword_pos is None:
+        keyword_pos = text.find(keyword)
     if keyword_pos == -1:
         return False
 
@@ -377,6 +398,18 @@ def extract_study_type(
     # Get text to search (uses full_text when available, falls back to abstract + methods)
     search_text = prepare_extractor_search_text(document).lower()
 
+    # Find every configured keyword in one pass; the priority walk below
+    # then only looks up first positions
+    matcher = _get_study_type_matcher(tuple(sorted({
+        keyword.lower()
+        for keywords in keywords_config.values()
+        for keyword in keywords
+    })))
+    first_positions = {
+        keyword: positions[0]
+        for keyword, positions in matcher.find_all(search_text).items()
+    }
+
     # Try each study type in priority order
     for study_type in priority_order:
         keywords = keywords_config.get(study_type, [])
@@ -384,10 +417,11 @@ def extract_study_type(
 
         for keyword in keywords:
             keyword_lower = keyword.lower()
-            if keyword_lower in search_text:
+            if keyword_lower in first_positions:
                 # Check for exclusion patterns before accepting the match
                 if exclusions and has_exclusion_pattern(
-                    search_text, keyword_lower, exclusions
+                    search_text, keyword_lower, exclusions,
+                    keyword_pos=first_positions[keyword_lower]
                 ):
                     # Exclusion pattern found - skip this keyword
                     continue
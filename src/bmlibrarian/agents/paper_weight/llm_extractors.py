@@ -29,6 +29,7 @@ from .extractors import (
     calculate_sample_size_score,
 )
 from .validators import (
+    DocumentChunkCache,
     search_chunks_by_query,
     get_all_document_chunks,
     DEFAULT_SIMILARITY_THRESHOLD,
@@ -166,6 +167,7 @@ def extract_study_type_llm(
     model: str,
     document: Optional[Dict[str, Any]] = None,
     hierarchy_config: Optional[Dict[str, float]] = None,
+    chunk_cache: Optional[DocumentChunkCache] = None,
 ) -> DimensionScore:
     """
     Extract study type using LLM with semantic search context.
@@ -179,6 +181,7 @@ def extract_study_type_llm(
         model: LLM model name to use
         document: Optional document dict (used for fallback if no chunks)
         hierarchy_config: Optional dict mapping study types to scores
+        chunk_cache: Optional shared DocumentChunkCache for this document
 
     Returns:
         DimensionScore for study design with audit trail
@@ -195,12 +198,13 @@ def extract_study_type_llm(
         similarity_threshold=DEFAULT_SIMILARITY_THRESHOLD,
         min_threshold=MIN_SIMILARITY_THRESHOLD,
         threshold_decrement=THRESHOLD_DECREMENT,
+        chunk_cache=chunk_cache,
     )
 
     # Fall back to positional chunks if semantic search returns nothing
     if not chunks:
         logger.info(f"No semantic search results for document {document_id}, falling back to positional chunks")
-        chunks = get_all_document_chunks(document_id, limit=5)
+        chunks = get_all_document_chunks(document_id, limit=5, chunk_cache=chunk_cache)
 
     # If still no chunks, try using abstract only (full_text should already be chunked)
     #
@@ -349,6 +353,7 @@ def extract_sample_size_llm(
     model: str,
     document: Optional[Dict[str, Any]] = None,
     scoring_config: Optional[Dict[str, float]] = None,
+    chunk_cache: Optional[DocumentChunkCache] = None,
 ) -> DimensionScore:
     """
     Extract sample size using LLM with semantic search context.
@@ -362,6 +367,7 @@ def extract_sample_size_llm(
         model: LLM model name to use
         document: Optional document dict (used for fallback if no chunks)
         scoring_config: Optional scoring configuration
+        chunk_cache: Optional shared DocumentChunkCache for this document
 
     Returns:
         DimensionScore for sample size with audit trail
@@ -386,12 +392,13 @@ def extract_sample_size_llm(
         similarity_threshold=DEFAULT_SIMILARITY_THRESHOLD,
         min_threshold=MIN_SIMILARITY_THRESHOLD,
         threshold_decrement=THRESHOLD_DECREMENT,
+        chunk_cache=chunk_cache,
     )
 
     # Fall back to positional chunks if semantic search returns nothing
     if not chunks:
         logger.info(f"No semantic search results for document {document_id}, falling back to positional chunks")
-        chunks = get_all_document_chunks(document_id, limit=5)
+        chunks = get_all_document_chunks(document_id, limit=5, chunk_cache=chunk_cache)
 
     # If still no chunks, try using abstract only (full_text should already be chunked)
     #
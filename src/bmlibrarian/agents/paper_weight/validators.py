@@ -9,8 +9,9 @@ When conflicts are detected, they are flagged for user review.
 """
 
 import logging
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from .models import DimensionScore
 
@@ -64,6 +65,7 @@ def search_chunks_by_query(
     similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
     min_threshold: float = MIN_SIMILARITY_THRESHOLD,
     threshold_decrement: float = THRESHOLD_DECREMENT,
+    chunk_cache: Optional["DocumentChunkCache"] = None,
 ) -> List[Dict[str, Any]]:
     """
     Search document chunks using semantic similarity with dynamic threshold reduction.
@@ -86,6 +88,8 @@ def search_chunks_by_query(
         similarity_threshold: Starting similarity score threshold (0.0-1.0)
         min_threshold: Minimum threshold to try before giving up (0.0-1.0)
         threshold_decrement: Amount to reduce threshold on each retry
+        chunk_cache: Optional DocumentChunkCache for this document; when given
+            the search is answered (and memoized) by the shared cache
 
     Returns:
         List of chunk dicts with 'chunk_no', 'chunk_text', 'similarity'
@@ -96,6 +100,14 @@ def search_chunks_by_query(
     # Input validation
     if document_id <= 0:
         raise ValueError(f"document_id must be positive, got {document_id}")
+    if chunk_cache is not None:
+        return chunk_cache.search(
+            query,
+            max_chunks=max_chunks,
+            similarity_threshold=similarity_threshold,
+            min_threshold=min_threshold,
+            threshold_decrement=threshold_decrement,
+        )
     if not query or not query.strip():
         raise ValueError("query cannot be empty")
     if max_chunks <= 0:
@@ -186,6 +198,7 @@ DEFAULT_CHUNK_LIMIT = 20  # Default limit for get_all_document_chunks
 def get_all_document_chunks(
     document_id: int,
     limit: int = DEFAULT_CHUNK_LIMIT,
+    chunk_cache: Optional["DocumentChunkCache"] = None,
 ) -> List[Dict[str, Any]]:
     """
     Get all chunks for a document ordered by position.
@@ -195,6 +208,8 @@ def get_all_document_chunks(
     Args:
         document_id: Database ID of the document (must be positive)
         limit: Maximum chunks to retrieve (must be positive)
+        chunk_cache: Optional DocumentChunkCache for this document; when given
+            the chunks come from its single fetch
 
     Returns:
         List of chunk dicts with 'chunk_no', 'chunk_text'
@@ -207,6 +222,8 @@ def get_all_document_chunks(
         raise ValueError(f"document_id must be positive, got {document_id}")
     if limit <= 0:
         raise ValueError(f"limit must be positive, got {limit}")
+    if chunk_cache is not None:
+        return chunk_cache.get_all(limit)
 
     from ...database import get_db_manager
 
@@ -240,6 +257,189 @@ def get_all_document_chunks(
         return []
 
 
+class DocumentChunkCache:
+    """
+    Per-assessment view of one document's chunks, shared by all dimensions.
+
+    The chunk texts are fetched once (a single query over semantic.chunks),
+    and each semantic search only ranks chunk numbers by similarity, so the
+    study type and sample size extractors (and the legacy validators) do not
+    each re-read the document. Searches are memoized by their arguments and
+    run the dynamic threshold reduction of search_chunks_by_query() over a
+    single ranking query instead of one query per threshold step.
+
+    Thread-safe: dimensions running concurrently may share one instance.
+    """
+
+    def __init__(self, document_id: int):
+        """
+        Initialize the cache.
+
+        Args:
+            document_id: Database ID of the document (must be positive)
+
+        Raises:
+            ValueError: If document_id is not positive
+        """
+        if document_id <= 0:
+            raise ValueError(f"document_id must be positive, got {document_id}")
+        self.document_id = document_id
+        self._lock = threading.Lock()
+        self._chunks: Optional[List[Dict[str, Any]]] = None
+        self._searches: Dict[Tuple, List[Dict[str, Any]]] = {}
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all chunk texts for the document (once).
+
+        Returns:
+            List of chunk dicts with 'chunk_no', 'chunk_text' ordered by position
+        """
+        with self._lock:
+            if self._chunks is None:
+                self._chunks = self._fetch_chunks()
+            return self._chunks
+
+    def get_all(self, limit: int = DEFAULT_CHUNK_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Cached equivalent of get_all_document_chunks().
+
+        Args:
+            limit: Maximum chunks to return (must be positive)
+
+        Returns:
+            List of chunk dicts with 'chunk_no', 'chunk_text'
+
+        Raises:
+            ValueError: If limit is not positive
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        return [dict(chunk) for chunk in self.load()[:limit]]
+
+    def search(
+        self,
+        query: str,
+        max_chunks: int = DEFAULT_MAX_CHUNKS,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        min_threshold: float = MIN_SIMILARITY_THRESHOLD,
+        threshold_decrement: float = THRESHOLD_DECREMENT,
+    ) -> List[Dict[str, Any]]:
+        """
+        Cached equivalent of search_chunks_by_query() for this document.
+
+        Args:
+            query: Natural language query for semantic matching (non-empty)
+            max_chunks: Maximum chunks to retrieve (must be positive)
+            similarity_threshold: Starting similarity score threshold (0.0-1.0)
+            min_threshold: Minimum threshold to try before giving up (0.0-1.0)
+            threshold_decrement: Amount to reduce threshold on each retry
+
+        Returns:
+            List of chunk dicts with 'chunk_no', 'chunk_text', 'similarity'
+
+        Raises:
+            ValueError: If inputs are invalid
+        """
+        if not query or not query.strip():
+            raise ValueError("query cannot be empty")
+        if max_chunks <= 0:
+            raise ValueError(f"max_chunks must be positive, got {max_chunks}")
+        if not 0.0 <= similarity_threshold <= 1.0:
+            raise ValueError(f"similarity_threshold must be 0.0-1.0, got {similarity_threshold}")
+        if not 0.0 <= min_threshold <= 1.0:
+            raise ValueError(f"min_threshold must be 0.0-1.0, got {min_threshold}")
+        if min_threshold > similarity_threshold:
+            min_threshold = similarity_threshold  # Avoid infinite loop
+
+        key = (query, max_chunks, similarity_threshold, min_threshold, threshold_decrement)
+        with self._lock:
+            cached = self._searches.get(key)
+        if cached is not None:
+            return [dict(chunk) for chunk in cached]
+
+        ranked = self._rank_chunks(query, max_chunks, min_threshold)
+        texts = {chunk['chunk_no']: chunk['chunk_text'] for chunk in self.load()}
+
+        # Same step-down as search_chunks_by_query(): the first threshold with
+        # any hit wins. Rows arrive ordered by similarity, so the hits at that
+        # threshold are exactly what a query at that threshold would return.
+        results: List[Dict[str, Any]] = []
+        current_threshold = similarity_threshold
+        while ranked and current_threshold >= min_threshold:
+            hits = [(no, sim) for no, sim in ranked if sim >= current_threshold]
+            if hits:
+                results = [
+                    {'chunk_no': no, 'chunk_text': texts.get(no, ''), 'similarity': sim}
+                    for no, sim in hits
+                ]
+                break
+            current_threshold -= threshold_decrement
+
+        logger.info(
+            f"Semantic search found {len(results)} relevant chunks for document "
+            f"{self.document_id} (threshold: {current_threshold:.2f})"
+        )
+        with self._lock:
+            self._searches[key] = results
+        return [dict(chunk) for chunk in results]
+
+    def _fetch_chunks(self) -> List[Dict[str, Any]]:
+        """Read every chunk text of the document in one query."""
+        from ...database import get_db_manager
+
+        try:
+            with get_db_manager().get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT
+                            c.chunk_no,
+                            substr(d.full_text, c.start_pos + 1, c.end_pos - c.start_pos + 1) as chunk_text
+                        FROM semantic.chunks c
+                        JOIN public.document d ON c.document_id = d.id
+                        WHERE c.document_id = %s
+                        ORDER BY c.chunk_no
+                    """, (self.document_id,))
+                    return [
+                        {'chunk_no': row[0], 'chunk_text': row[1] or ''}
+                        for row in cur.fetchall()
+                    ]
+        except Exception as e:
+            logger.warning(f"Error getting document chunks: {e}")
+            return []
+
+    def _rank_chunks(
+        self,
+        query: str,
+        max_chunks: int,
+        min_threshold: float,
+    ) -> List[Tuple[int, float]]:
+        """Rank chunk numbers by similarity to the query, best first."""
+        from ...database import get_db_manager
+
+        try:
+            with get_db_manager().get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        WITH query_embedding AS (
+                            SELECT ollama_embedding(%s) AS embedding
+                        )
+                        SELECT
+                            c.chunk_no,
+                            (1 - (c.embedding <=> qe.embedding))::FLOAT AS similarity
+                        FROM semantic.chunks c
+                        CROSS JOIN query_embedding qe
+                        WHERE c.document_id = %s
+                          AND (1 - (c.embedding <=> qe.embedding)) >= %s
+                        ORDER BY c.embedding <=> qe.embedding
+                        LIMIT %s
+                    """, (query, self.document_id, min_threshold, max_chunks))
+                    return [(row[0], row[1]) for row in cur.fetchall()]
+        except Exception as e:
+            logger.warning(f"Error in semantic chunk search: {e}")
+            return []
+
+
 def _build_study_type_validation_prompt(
     rule_based_type: str,
     rule_based_evidence: str,
@@ -355,6 +555,7 @@ def validate_study_type_extraction(
     llm_client: Any,
     model: str,
     fallback_chunks: Optional[List[Dict[str, Any]]] = None,
+    chunk_cache: Optional[DocumentChunkCache] = None,
 ) -> ValidationResult:
     """
     Validate study type extraction using LLM with semantic search context.
@@ -365,6 +566,7 @@ def validate_study_type_extraction(
         llm_client: LLM client (bmlibrarian.llm.LLMClient)
         model: LLM model name to use
         fallback_chunks: Optional pre-computed chunks to use if semantic search unavailable
+        chunk_cache: Optional shared DocumentChunkCache for this document
 
     Returns:
         ValidationResult with validation details and conflict flags
@@ -390,11 +592,12 @@ def validate_study_type_extraction(
         document_id=document_id,
         query="study design methodology randomized controlled trial cohort retrospective prospective systematic review meta-analysis",
         max_chunks=DEFAULT_MAX_CHUNKS,
+        chunk_cache=chunk_cache,
     )
 
     if not chunks:
         # Fall back to getting first few chunks from database
-        chunks = get_all_document_chunks(document_id, limit=5)
+        chunks = get_all_document_chunks(document_id, limit=5, chunk_cache=chunk_cache)
 
     if not chunks and fallback_chunks:
         # Use provided fallback chunks (e.g., synthetic chunks from full_text)
@@ -471,6 +674,7 @@ def validate_sample_size_extraction(
     llm_client: Any,
     model: str,
     fallback_chunks: Optional[List[Dict[str, Any]]] = None,
+    chunk_cache: Optional[DocumentChunkCache] = None,
 ) -> ValidationResult:
     """
     Validate sample size extraction using LLM with semantic search context.
@@ -481,6 +685,7 @@ def validate_sample_size_extraction(
         llm_client: LLM client (bmlibrarian.llm.LLMClient)
         model: LLM model name to use
         fallback_chunks: Optional pre-computed chunks to use if semantic search unavailable
+        chunk_cache: Optional shared DocumentChunkCache for this document
 
     Returns:
         ValidationResult with validation details and conflict flags
@@ -510,11 +715,12 @@ def validate_sample_size_extraction(
         document_id=document_id,
         query="sample size participants subjects patients enrolled recruited n= N= total number",
         max_chunks=DEFAULT_MAX_CHUNKS,
+        chunk_cache=chunk_cache,
     )
 
     if not chunks:
         # Fall back to getting first few chunks (methods section usually early)
-        chunks = get_all_document_chunks(document_id, limit=5)
+        chunks = get_all_document_chunks(document_id, limit=5, chunk_cache=chunk_cache)
 
     if not chunks and fallback_chunks:
         # Use provided fallback chunks (e.g., synthetic chunks from full_text)
@@ -682,6 +888,7 @@ def add_validation_to_dimension_score(
 
 __all__ = [
     'ValidationResult',
+    'DocumentChunkCache',
     'search_chunks_by_query',
     'get_all_document_chunks',
     'validate_study_type_extraction',
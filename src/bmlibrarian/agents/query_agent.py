@@ -42,7 +42,8 @@ class QueryAgent(BaseAgent):
         orchestrator: Optional["AgentOrchestrator"] = None,
         show_model_info: bool = True,
         use_thesaurus: bool = False,
-        thesaurus_max_expansions: int = 10
+        thesaurus_max_expansions: int = 10,
+        thesaurus_query_log: Optional[str] = None
     ):
         """
         Initialize the QueryAgent.
@@ -58,6 +59,8 @@ class QueryAgent(BaseAgent):
             show_model_info: Whether to display model information on initialization
             use_thesaurus: Whether to use medical thesaurus for term expansion (default: False)
             thesaurus_max_expansions: Maximum term expansions per term (default: 10)
+            thesaurus_query_log: Optional query log (one to_tsquery per line) whose
+                most frequent terms preload the thesaurus cache on first use
         """
         super().__init__(model, host, temperature, top_p, callback, orchestrator, show_model_info)
 
@@ -72,6 +75,7 @@ class QueryAgent(BaseAgent):
         # Thesaurus configuration
         self.use_thesaurus = use_thesaurus
         self.thesaurus_max_expansions = thesaurus_max_expansions
+        self.thesaurus_query_log = thesaurus_query_log
         self._thesaurus_expander: Optional[ThesaurusExpander] = None
         
         # System prompt for biomedical query conversion
@@ -191,6 +195,11 @@ to_tsquery: "statin & cholesterol & !(children | pediatric | paediatric)"
             self._thesaurus_expander = ThesaurusExpander(
                 max_expansions_per_term=self.thesaurus_max_expansions
             )
+            if self.thesaurus_query_log:
+                try:
+                    self._thesaurus_expander.warm_cache_from_log(self.thesaurus_query_log)
+                except OSError as e:
+                    logger.warning(f"Could not warm thesaurus cache from query log: {e}")
         return self._thesaurus_expander
 
     def expand_query_with_thesaurus(self, ts_query: str) -> str:
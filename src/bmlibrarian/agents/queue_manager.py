@@ -12,6 +12,8 @@ import threading
 import os
 import signal
 import atexit
+import weakref
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Optional, Dict, Any, List, Iterator, Callable
@@ -32,6 +34,12 @@ MIN_SQLITE_VERSION: tuple = (3, 35, 0)
 # instead of briefly blocking and retrying.
 QUEUE_BUSY_TIMEOUT_MS: int = 30_000
 
+# Default number of tasks a worker claims per dequeue. Claiming several rows
+# in one UPDATE ... RETURNING amortises the write transaction (and its WAL
+# fsync) over the batch; keep it small so one worker does not hoard work
+# that other processes sharing the queue could be running.
+DEFAULT_CLAIM_BATCH_SIZE: int = 8
+
 
 class TaskStatus(Enum):
     """Task processing status."""
@@ -118,6 +126,19 @@ class QueueManager:
         self._persistent_conn = None
         if self.db_path == ":memory:":
             self._persistent_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+
+        # File-based databases keep one connection per thread rather than
+        # opening (and re-applying PRAGMAs on) a new one for every call.
+        # Keyed weakly by thread so a finished thread's connection is released.
+        self._thread_connections: "weakref.WeakKeyDictionary[threading.Thread, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._thread_connections_lock = threading.Lock()
+
+        # In-process wakeup for idle workers: bumped and broadcast whenever
+        # tasks become pending, so waiters need not poll the database.
+        self._task_available = threading.Condition()
+        self._task_generation = 0
         
         # Track this process for cleanup
         self.process_id = os.getpid()
@@ -142,9 +163,91 @@ class QueueManager:
         """
         if self._persistent_conn:
             return self._persistent_conn
-        conn = sqlite3.connect(self.db_path)
+        # Per-thread connections are closed from close(), possibly on another
+        # thread; each is still only used by the thread that owns it.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.execute(f"PRAGMA busy_timeout = {QUEUE_BUSY_TIMEOUT_MS}")
         return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Return the calling thread's persistent connection, opening it once.
+
+        Connections are not shared across a fork: a child process opens its own.
+        """
+        thread = threading.current_thread()
+        pid = os.getpid()
+        with self._thread_connections_lock:
+            entry = self._thread_connections.get(thread)
+        if entry is not None and entry[0] == pid:
+            return entry[1]
+
+        conn = self._get_connection()
+        with self._thread_connections_lock:
+            self._thread_connections[thread] = (pid, conn)
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Yield a reusable connection, rolling back if the caller raises.
+
+        The connection outlives the call, so an exception must not leave a
+        transaction (and the database write lock) open behind it.
+        """
+        conn = self._persistent_conn or self._thread_connection()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+
+    def close(self):
+        """Close all per-thread connections held by this queue manager."""
+        with self._thread_connections_lock:
+            entries = list(self._thread_connections.values())
+            self._thread_connections.clear()
+        for _, conn in entries:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    def notify_task_available(self):
+        """Wake threads blocked in :meth:`wait_for_tasks`."""
+        with self._task_available:
+            self._task_generation += 1
+            self._task_available.notify_all()
+
+    def get_task_generation(self) -> int:
+        """Return a counter that increases whenever tasks become pending.
+
+        Read it before an empty dequeue and pass it to :meth:`wait_for_tasks`
+        so a task added in between wakes the waiter immediately.
+        """
+        with self._task_available:
+            return self._task_generation
+
+    def wait_for_tasks(self, timeout: Optional[float] = None,
+                       since_generation: Optional[int] = None) -> bool:
+        """
+        Block until tasks are added in this process, or until timeout.
+
+        Only producers sharing this QueueManager signal the wakeup; tasks
+        enqueued by other processes are picked up once the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+            since_generation: Value from :meth:`get_task_generation`; returns
+                immediately if tasks were added since it was read.
+
+        Returns:
+            True if woken by new tasks, False on timeout
+        """
+        with self._task_available:
+            if since_generation is None:
+                since_generation = self._task_generation
+            return self._task_available.wait_for(
+                lambda: self._task_generation != since_generation, timeout
+            )
     
     def _init_database(self):
         """Initialize SQLite database with required tables."""
@@ -249,7 +352,12 @@ class QueueManager:
             self._do_mark_process_tasks_as_failed(error_message)
 
     def _do_mark_process_tasks_as_failed(self, error_message: str):
-        """Perform the failed-task update. Caller manages locking."""
+        """Perform the failed-task update. Caller manages locking.
+
+        Uses a fresh connection for file-based databases: the signal handler
+        may have interrupted this thread mid-transaction on its persistent
+        connection, and committing there would persist a half-done write.
+        """
         conn = self._get_connection()
         needs_close = not self._persistent_conn
         try:
@@ -280,9 +388,7 @@ class QueueManager:
         cutoff_time = datetime.now(timezone.utc) - timedelta(minutes=stuck_timeout_minutes)
         
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 # Find stuck tasks
                 cursor = conn.execute("""
                     SELECT id, process_id FROM queue_tasks 
@@ -324,11 +430,10 @@ class QueueManager:
                     recovered_count += 1
                 
                 conn.commit()
-                return recovered_count
-                
-            finally:
-                if needs_close:
-                    conn.close()
+
+        if recovered_count:
+            self.notify_task_available()
+        return recovered_count
     
     def cleanup_dead_process_tasks(self) -> int:
         """
@@ -338,9 +443,7 @@ class QueueManager:
             Number of tasks cleaned up
         """
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 # Find all processing tasks with process IDs
                 cursor = conn.execute("""
                     SELECT DISTINCT process_id FROM queue_tasks 
@@ -374,9 +477,6 @@ class QueueManager:
                 conn.commit()
                 return cleaned_count
                 
-            finally:
-                if needs_close:
-                    conn.close()
     
     def get_queue_health(self) -> Dict[str, Any]:
         """
@@ -385,9 +485,7 @@ class QueueManager:
         Returns:
             Dictionary with queue health metrics
         """
-        conn = self._get_connection()
-        needs_close = not self._persistent_conn
-        try:
+        with self._connection() as conn:
             # Basic stats
             cursor = conn.execute("""
                 SELECT status, COUNT(*) FROM queue_tasks GROUP BY status
@@ -442,9 +540,6 @@ class QueueManager:
                 "queue_database": self.db_path
             }
             
-        finally:
-            if needs_close:
-                conn.close()
     
     def add_task(self, 
                  target_agent: str,
@@ -478,9 +573,7 @@ class QueueManager:
         )
         
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 conn.execute("""
                     INSERT INTO queue_tasks (
                         id, source_agent, target_agent, method_name, data,
@@ -492,10 +585,8 @@ class QueueManager:
                     task.retry_count, task.max_retries, task.created_at.isoformat()
                 ))
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
         
+        self.notify_task_available()
         return task.id
     
     def add_batch_tasks(self,
@@ -526,9 +617,7 @@ class QueueManager:
             ))
         
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 conn.executemany("""
                     INSERT INTO queue_tasks (
                         id, source_agent, target_agent, method_name, data,
@@ -536,10 +625,9 @@ class QueueManager:
                     ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, tasks_data)
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
         
+        if task_ids:
+            self.notify_task_available()
         return task_ids
     
     def get_next_task(self, target_agent: str) -> Optional[QueueTask]:
@@ -554,53 +642,128 @@ class QueueManager:
         Returns:
             Next task or None if no pending tasks
         """
+        tasks = self.get_next_tasks(target_agent, limit=1)
+        return tasks[0] if tasks else None
+
+    def get_next_tasks(self, target_agent: str,
+                       limit: int = DEFAULT_CLAIM_BATCH_SIZE) -> List[QueueTask]:
+        """
+        Claim up to ``limit`` pending tasks for an agent in one transaction.
+
+        Tasks are returned in dequeue order: priority (high to low), then
+        creation time (oldest first). Every returned task is already marked
+        PROCESSING for this process, with ``started_at`` set to the claim
+        time; call :meth:`start_task` as each one actually starts and hand
+        back any the caller does not run with :meth:`release_tasks`.
+
+        Args:
+            target_agent: Agent type to get tasks for
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            Claimed tasks (empty if none are pending)
+        """
+        if limit < 1:
+            return []
+
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 started_at = datetime.now(timezone.utc).isoformat()
                 worker_id = f"{self.process_id}-{threading.current_thread().ident}"
 
-                # Claim the highest-priority pending task in a single atomic
+                # Claim the highest-priority pending tasks in a single atomic
                 # statement. The in-process threading.Lock does not coordinate
                 # separate processes (each with its own SQLite connection), so a
                 # SELECT-then-UPDATE could let two workers claim the same row.
-                # UPDATE ... WHERE id = (SELECT ... LIMIT 1) RETURNING * runs as
+                # UPDATE ... WHERE id IN (SELECT ... LIMIT n) RETURNING * runs as
                 # one write transaction, so at most one worker claims each task.
                 cursor = conn.execute("""
                     UPDATE queue_tasks
                     SET status = ?, started_at = ?, process_id = ?, worker_id = ?
-                    WHERE id = (
+                    WHERE id IN (
                         SELECT id FROM queue_tasks
                         WHERE target_agent = ? AND status = ?
                         ORDER BY priority DESC, created_at ASC
-                        LIMIT 1
+                        LIMIT ?
                     )
                     RETURNING *
                 """, (
                     TaskStatus.PROCESSING.value, started_at, self.process_id, worker_id,
-                    target_agent, TaskStatus.PENDING.value
+                    target_agent, TaskStatus.PENDING.value, limit
                 ))
 
-                row = cursor.fetchone()
+                rows = cursor.fetchall()
                 conn.commit()
 
-                if row:
-                    # The returned row already reflects the claimed state
-                    # (status=PROCESSING, started_at, process_id, worker_id).
-                    return self._row_to_task(row)
-            finally:
-                if needs_close:
-                    conn.close()
+        # The returned rows already reflect the claimed state, but RETURNING
+        # gives no ordering guarantee, so restore the dequeue order here.
+        tasks = [self._row_to_task(row) for row in rows]
+        tasks.sort(key=lambda task: (-task.priority.value, task.created_at))
+        return tasks
+
+    def start_task(self, task_id: str) -> bool:
+        """
+        Mark a claimed task as starting now.
+
+        A batch-claimed task can wait behind the others in its batch, so
+        ``started_at`` is reset here; otherwise :meth:`recover_stuck_tasks`
+        would count that wait as processing time.
+
+        Args:
+            task_id: ID of a task previously returned by :meth:`get_next_tasks`
+
+        Returns:
+            True if this process still holds the claim; False if the task
+            was recovered or released meanwhile and must not be run
+        """
+        with self.lock:
+            with self._connection() as conn:
+                cursor = conn.execute("""
+                    UPDATE queue_tasks
+                    SET started_at = ?
+                    WHERE id = ? AND status = ? AND process_id = ?
+                """, (datetime.now(timezone.utc).isoformat(), task_id,
+                      TaskStatus.PROCESSING.value, self.process_id))
+                started = cursor.rowcount == 1
+                conn.commit()
+        return started
+
+    def release_tasks(self, task_ids: List[str]) -> int:
+        """
+        Return claimed-but-unstarted tasks to the pending state.
+
+        Only tasks still PROCESSING under this process are released, and
+        their retry count is left untouched.
+
+        Args:
+            task_ids: IDs of tasks previously returned by :meth:`get_next_tasks`
+
+        Returns:
+            Number of tasks released
+        """
+        if not task_ids:
+            return 0
+
+        placeholders = ", ".join("?" for _ in task_ids)
+        with self.lock:
+            with self._connection() as conn:
+                cursor = conn.execute(f"""
+                    UPDATE queue_tasks
+                    SET status = ?, started_at = NULL, process_id = NULL, worker_id = NULL
+                    WHERE id IN ({placeholders}) AND status = ? AND process_id = ?
+                """, [TaskStatus.PENDING.value, *task_ids,
+                      TaskStatus.PROCESSING.value, self.process_id])
+                released = cursor.rowcount
+                conn.commit()
 
-        return None
+        if released:
+            self.notify_task_available()
+        return released
     
     def complete_task(self, task_id: str, result: Dict[str, Any]):
         """Mark a task as completed with result."""
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 completed_at = datetime.now(timezone.utc).isoformat()
                 conn.execute("""
                     UPDATE queue_tasks 
@@ -608,9 +771,6 @@ class QueueManager:
                     WHERE id = ?
                 """, (TaskStatus.COMPLETED.value, json.dumps(result), completed_at, task_id))
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
     
     def fail_task(self, task_id: str, error_message: str, retry: bool = True):
         """
@@ -622,9 +782,7 @@ class QueueManager:
             retry: Whether to retry if retries remain
         """
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 # Get current task state
                 cursor = conn.execute("""
                     SELECT retry_count, max_retries FROM queue_tasks WHERE id = ?
@@ -637,7 +795,8 @@ class QueueManager:
                 retry_count, max_retries = row
                 new_retry_count = retry_count + 1
                 
-                if retry and new_retry_count <= max_retries:
+                requeued = retry and new_retry_count <= max_retries
+                if requeued:
                     # Reset to pending for retry
                     conn.execute("""
                         UPDATE queue_tasks 
@@ -654,29 +813,22 @@ class QueueManager:
                     """, (TaskStatus.FAILED.value, new_retry_count, error_message, completed_at, task_id))
                 
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
+
+        if requeued:
+            self.notify_task_available()
     
     def get_task_status(self, task_id: str) -> Optional[QueueTask]:
         """Get current status of a specific task."""
-        conn = self._get_connection()
-        needs_close = not self._persistent_conn
-        try:
+        with self._connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM queue_tasks WHERE id = ?
             """, (task_id,))
             row = cursor.fetchone()
             return self._row_to_task(row) if row else None
-        finally:
-            if needs_close:
-                conn.close()
     
     def get_queue_stats(self, target_agent: Optional[str] = None) -> Dict[str, int]:
         """Get queue statistics."""
-        conn = self._get_connection()
-        needs_close = not self._persistent_conn
-        try:
+        with self._connection() as conn:
             where_clause = "WHERE target_agent = ?" if target_agent else ""
             params = (target_agent,) if target_agent else ()
             
@@ -691,9 +843,6 @@ class QueueManager:
                 stats[status] = count
             
             return stats
-        finally:
-            if needs_close:
-                conn.close()
     
     def cleanup_completed_tasks(self, older_than_hours: int = 24):
         """Remove completed/failed tasks older than specified hours."""
@@ -706,17 +855,12 @@ class QueueManager:
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
         
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 conn.execute("""
                     DELETE FROM queue_tasks 
                     WHERE status IN (?, ?) AND completed_at < ?
                 """, (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value, cutoff_time.isoformat()))
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
     
     def cancel_tasks(self, target_agent: Optional[str] = None, source_agent: Optional[str] = None):
         """Cancel pending tasks matching criteria."""
@@ -732,18 +876,13 @@ class QueueManager:
             params.append(source_agent)
         
         with self.lock:
-            conn = self._get_connection()
-            needs_close = not self._persistent_conn
-            try:
+            with self._connection() as conn:
                 conn.execute(f"""
                     UPDATE queue_tasks 
                     SET status = ?, completed_at = ?
                     WHERE {' AND '.join(conditions)}
                 """, [TaskStatus.CANCELLED.value, datetime.now(timezone.utc).isoformat()] + params)
                 conn.commit()
-            finally:
-                if needs_close:
-                    conn.close()
     
     def _row_to_task(self, row) -> QueueTask:
         """Convert database row to QueueTask object."""
@@ -778,15 +917,7 @@ class QueueManager:
             Batches of tasks
         """
         while True:
-            batch = []
-            for _ in range(batch_size):
-                task = self.get_next_task(target_agent)
-                if task:
-                    batch.append(task)
-                else:
-                    break
-            
+            batch = self.get_next_tasks(target_agent, limit=batch_size)
             if not batch:
                 break
-                
-            yield batch
\ No newline at end of file
+            yield batch
@@ -16,6 +16,7 @@ import psycopg
 
 from .base import BaseAgent
 from .citation_agent import Citation
+from .utils.concurrency import ordered_concurrent_map
 
 logger = logging.getLogger(__name__)
 
@@ -277,11 +278,16 @@ class ReportingAgent(BaseAgent):
                 'map_passage_max_length',
                 self.MAP_PASSAGE_MAX_LENGTH
             )
+            self.map_max_concurrent = config.get(
+                'map_max_concurrent',
+                self.MAP_MAX_CONCURRENT
+            )
 
             logger.debug(
                 f"Map-reduce config loaded: threshold={self.map_reduce_citation_threshold}, "
                 f"batch_size={self.map_batch_size}, context_limit={self.effective_context_limit}, "
-                f"passage_max_length={self.map_passage_max_length}"
+                f"passage_max_length={self.map_passage_max_length}, "
+                f"max_concurrent={self.map_max_concurrent}"
             )
 
         except Exception as e:
@@ -291,6 +297,7 @@ class ReportingAgent(BaseAgent):
             self.map_batch_size = self.MAP_BATCH_SIZE
             self.effective_context_limit = 6000
             self.map_passage_max_length = self.MAP_PASSAGE_MAX_LENGTH
+            self.map_max_concurrent = self.MAP_MAX_CONCURRENT
 
     def create_references(self, citations: List[Citation]) -> List[Reference]:
         """
@@ -505,6 +512,7 @@ class ReportingAgent(BaseAgent):
     MAP_REDUCE_CITATION_THRESHOLD = 15  # Use map-reduce when citations exceed this
     MAP_BATCH_SIZE = 8  # Number of citations per batch in map phase
     MAP_PASSAGE_MAX_LENGTH = 500  # Max characters per passage in map phase (full passage used in reduce)
+    MAP_MAX_CONCURRENT = 1  # Map-phase batches summarized in parallel (match OLLAMA_NUM_PARALLEL)
 
     def _validate_reference_numbers(self, content: str, valid_numbers: set) -> None:
         """
@@ -1030,20 +1038,32 @@ Write a professional medical report that synthesizes all evidence."""
 
         logger.info(f"Split into {len(batches)} batches of up to {batch_size} citations")
 
-        # MAP PHASE: Process each batch using UUID references
+        # MAP PHASE: Process each batch using UUID references. Batches are
+        # independent, so up to map_max_concurrent are summarized at once;
+        # summaries are collected in batch order.
+        max_concurrent = getattr(self, 'map_max_concurrent', self.MAP_MAX_CONCURRENT)
+        summaries = ordered_concurrent_map(
+            lambda numbered: self._map_phase_summarize_batch(
+                user_question=user_question,
+                batch_citation_refs=numbered[1],
+                batch_number=numbered[0],
+                total_batches=len(batches)
+            ),
+            list(enumerate(batches, 1)),
+            max_in_flight=max_concurrent,
+            thread_name_prefix="report-map",
+        )
+
         batch_summaries = []
-        for batch_num, batch in enumerate(batches, 1):
+        for (batch_num, _), batch_summary, error in summaries:
             self._call_callback(
                 "map_phase_progress",
-                f"Processing citation batch {batch_num}/{len(batches)}"
+                f"Processed citation batch {batch_num}/{len(batches)}"
             )
 
-            batch_summary = self._map_phase_summarize_batch(
-                user_question=user_question,
-                batch_citation_refs=batch,
-                batch_number=batch_num,
-                total_batches=len(batches)
-            )
+            if error is not None:
+                logger.error(f"Map phase batch {batch_num} failed: {error}")
+                batch_summary = None
 
             if batch_summary:
                 batch_summaries.append(batch_summary)
@@ -12,6 +12,7 @@ import psycopg
 
 from .base import BaseAgent
 from .queue_manager import TaskPriority
+from .utils.concurrency import DeferredCallbacks, ordered_concurrent_map
 
 
 logger = logging.getLogger(__name__)
@@ -40,7 +41,9 @@ class DocumentScoringAgent(BaseAgent):
         callback: Optional[Callable[[str, str], None]] = None,
         orchestrator: Optional["AgentOrchestrator"] = None,
         show_model_info: bool = True,
-        audit_conn: Optional[psycopg.Connection] = None
+        audit_conn: Optional[psycopg.Connection] = None,
+        max_concurrent_requests: int = 1,
+        ollama_hosts: Optional[List[str]] = None
     ):
         """
         Initialize the DocumentScoringAgent.
@@ -54,9 +57,20 @@ class DocumentScoringAgent(BaseAgent):
             orchestrator: Optional orchestrator for queue-based processing
             show_model_info: Whether to display model information on initialization
             audit_conn: Optional database connection for audit tracking
+            max_concurrent_requests: Documents scored in parallel by
+                batch_evaluate_documents() (default: 1, sequential)
+            ollama_hosts: Optional Ollama hosts to round-robin requests across
+                (the first replaces ``host``)
         """
         super().__init__(model, host, temperature, top_p, callback, orchestrator, show_model_info)
 
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        if ollama_hosts:
+            self.set_ollama_hosts(ollama_hosts)
+
+        # Per-document events of concurrent batches, replayed in input order
+        self._deferred_callbacks = DeferredCallbacks()
+
         # Audit tracking (optional)
         self.audit_conn = audit_conn
         self._document_tracker = None
@@ -118,6 +132,11 @@ Example Response:
     def get_agent_type(self) -> str:
         """Get the agent type identifier."""
         return "document_scoring_agent"
+
+    def _call_callback(self, step: str, data: str) -> None:
+        """Call the callback, deferring events raised by batch worker threads."""
+        if not self._deferred_callbacks.capture(step, data):
+            super()._call_callback(step, data)
     
     def evaluate_document(
         self,
@@ -340,18 +359,26 @@ Please evaluate how well this document addresses the user's question and provide
     def batch_evaluate_documents(
         self,
         user_question: str,
-        documents: list[Dict]
+        documents: list[Dict],
+        max_concurrent: Optional[int] = None
     ) -> list[tuple[Dict, ScoringResult]]:
         """
         Evaluate multiple documents against a user question.
-        
+
+        Up to ``max_concurrent`` documents are scored at once (Ollama serves
+        parallel requests with ``OLLAMA_NUM_PARALLEL``; see also
+        ``ollama_hosts``). Results and per-document callbacks are delivered
+        on the calling thread in input order regardless of completion order.
+
         Args:
             user_question: The user's question or information need
             documents: List of document dictionaries from database
-            
+            max_concurrent: Documents scored in parallel; None uses
+                ``self.max_concurrent_requests``
+
         Returns:
             List of tuples containing (document, scoring_result) pairs
-            
+
         Examples:
             >>> agent = DocumentScoringAgent()
             >>> docs = [doc1, doc2, doc3]  # List of document dicts
@@ -361,34 +388,43 @@ Please evaluate how well this document addresses the user's question and provide
         """
         if not user_question or not user_question.strip():
             raise ValueError("User question cannot be empty")
-        
+
         if not documents or not isinstance(documents, list):
             raise ValueError("Documents must be a non-empty list")
-        
+
+        if max_concurrent is None:
+            max_concurrent = self.max_concurrent_requests
+
         results = []
-        
+
         self._call_callback("batch_evaluation_started", f"Evaluating {len(documents)} documents")
-        
-        for i, doc in enumerate(documents):
-            try:
-                self._call_callback("document_evaluation_progress", f"Document {i+1}/{len(documents)}")
-                
-                scoring_result = self.evaluate_document(user_question, doc)
-                results.append((doc, scoring_result))
-                
-            except Exception as e:
-                logger.error(f"Failed to evaluate document {i+1}: {e}")
+
+        evaluations = ordered_concurrent_map(
+            self._deferred_callbacks.wrap(
+                lambda doc: self.evaluate_document(user_question, doc)
+            ),
+            documents,
+            max_in_flight=max_concurrent,
+            thread_name_prefix="scoring",
+        )
+        for i, (doc, (scoring_result, error, events), _) in enumerate(evaluations):
+            for step, data in events:
+                self._call_callback(step, data)
+            self._call_callback("document_evaluation_progress", f"Document {i+1}/{len(documents)}")
+
+            if error is not None:
+                logger.error(f"Failed to evaluate document {i+1}: {error}")
                 # Continue with other documents, append error result
-                error_result: ScoringResult = {
+                scoring_result = {
                     'score': 0,
-                    'reasoning': f"Evaluation failed: {str(e)}"
+                    'reasoning': f"Evaluation failed: {str(error)}"
                 }
-                results.append((doc, error_result))
-        
+            results.append((doc, scoring_result))
+
         self._call_callback("batch_evaluation_completed", f"Evaluated {len(documents)} documents")
-        
+
         return results
-    
+
     def get_top_documents(
         self,
         user_question: str,
@@ -7,6 +7,8 @@ Provides adaptive semantic search with:
 - Hybrid search combining semantic similarity with keyword matching (RRF)
 - Query expansion for better retrieval of factual/numeric data
 - Configurable retry limits and threshold bounds
+- Client-side query embeddings, computed once per query text and reused for
+  every threshold retry (the *_by_embedding SQL functions, migration 032)
 
 This agent is designed to be reusable across modules that need semantic search,
 including document Q&A, citation finding, and literature search.
@@ -40,10 +42,15 @@ Example usage:
 """
 
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Callable, TYPE_CHECKING
+from typing import Dict, List, Optional, Callable, Sequence, TYPE_CHECKING
 
+import numpy as np
+from psycopg.errors import UndefinedFunction
+
+from ..db_vector import to_vector_array, vector_param
 from ..llm import DEFAULT_OLLAMA_HOST
 from .base import BaseAgent
 from .utils.query_syntax import strip_preamble
@@ -80,6 +87,12 @@ DEFAULT_EXPANSION_TEMPERATURE = 0.3  # Low, so keyword extraction stays stable
 REPHRASING_MAX_TOKENS = 800
 EXPANSION_MAX_TOKENS = 1000
 
+# Query embeddings are computed client-side and passed to the
+# *_by_embedding search functions. The model must be the one the server's
+# ollama_embedding() uses, or scores would not be comparable.
+DEFAULT_QUERY_EMBEDDING_MODEL = "snowflake-arctic-embed2:latest"
+QUERY_EMBEDDING_CACHE_SIZE = 64  # Query texts whose vectors an agent keeps
+
 
 class SearchMode(Enum):
     """Search mode selection."""
@@ -181,6 +194,7 @@ class SemanticQueryAgent(BaseAgent):
         semantic_weight: float = DEFAULT_SEMANTIC_WEIGHT,
         rrf_k: int = DEFAULT_RRF_K,
         hybrid_threshold: float = DEFAULT_HYBRID_THRESHOLD,
+        embedding_model: Optional[str] = None,
     ) -> None:
         """
         Initialize the semantic query agent.
@@ -199,6 +213,8 @@ class SemanticQueryAgent(BaseAgent):
             semantic_weight: Weight for semantic vs keyword in hybrid (0.0-1.0).
             rrf_k: RRF constant k (lower = more weight on top ranks).
             hybrid_threshold: Lower threshold for hybrid search.
+            embedding_model: Ollama model for query embeddings. Must match
+                the model of the stored chunk embeddings.
         """
         self.initial_threshold = initial_threshold
         self.min_threshold = min_threshold
@@ -220,8 +236,12 @@ class SemanticQueryAgent(BaseAgent):
             resolved_host = ollama_host or ollama_config.get(
                 "host", DEFAULT_OLLAMA_HOST
             )
+            resolved_embedding_model = embedding_model or config.get(
+                "embeddings", {}
+            ).get("model", DEFAULT_QUERY_EMBEDDING_MODEL)
         except ImportError:
             resolved_host = ollama_host or DEFAULT_OLLAMA_HOST
+            resolved_embedding_model = embedding_model or DEFAULT_QUERY_EMBEDDING_MODEL
 
         # The rephrasing model/temperature are the agent's LLM defaults; the
         # keyword-expansion call overrides temperature per call.
@@ -238,6 +258,13 @@ class SemanticQueryAgent(BaseAgent):
         self.rephrasing_temperature = self.temperature
         self.ollama_host = resolved_host
 
+        # Query text -> embedding, so threshold retries, repeated searches and
+        # expanded/original query pairs embed each text once. The flag drops
+        # to the text functions when migration 032 is not applied.
+        self.embedding_model = resolved_embedding_model
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_functions_available = True
+
         logger.info(
             f"SemanticQueryAgent initialized: threshold={initial_threshold}, "
             f"range=[{min_threshold}, {max_threshold}], "
@@ -249,6 +276,44 @@ class SemanticQueryAgent(BaseAgent):
         """Return the stable identifier for this agent."""
         return "semantic_query_agent"
 
+    def embed_queries(self, queries: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Embed query texts, reusing vectors computed earlier by this agent.
+
+        Texts not embedded yet are sent in a single embed_batch() call.
+
+        Args:
+            queries: Query texts.
+
+        Returns:
+            Mapping of query text to float32 embedding. Texts that could not
+            be embedded are missing; callers fall back to server-side
+            embedding for them.
+        """
+        embeddings: Dict[str, np.ndarray] = {}
+        missing: List[str] = []
+        for query in queries:
+            if query in self._query_embeddings:
+                self._query_embeddings.move_to_end(query)
+                embeddings[query] = self._query_embeddings[query]
+            elif query and query not in missing:
+                missing.append(query)
+
+        if missing:
+            try:
+                response = self._llm_client.embed_batch(missing, model=self.embedding_model)
+            except Exception as e:
+                logger.warning(f"Query embedding failed, using server-side embedding: {e}")
+                return embeddings
+
+            for query, vector in zip(missing, response.embeddings):
+                embeddings[query] = to_vector_array(vector)
+                self._query_embeddings[query] = embeddings[query]
+            while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+
+        return embeddings
+
     def search_document(
         self,
         document_id: int,
@@ -394,6 +459,9 @@ class SemanticQueryAgent(BaseAgent):
         best_result: Optional[SemanticSearchResult] = None
         direction = 0  # -1 = lowering, +1 = raising, 0 = undetermined
 
+        # Embed once; every threshold step reuses the vector
+        query_embedding = self.embed_queries([query]).get(query)
+
         for iteration in range(self.max_threshold_iterations):
             thresholds_tried.append(threshold)
 
@@ -407,6 +475,7 @@ class SemanticQueryAgent(BaseAgent):
                 db_manager=db_manager,
                 search_mode=search_mode,
                 semantic_weight=semantic_weight,
+                query_embedding=query_embedding,
             )
 
             result = SemanticSearchResult(
@@ -501,10 +570,15 @@ class SemanticQueryAgent(BaseAgent):
         db_manager: "DatabaseManager",
         search_mode: SearchMode = SearchMode.SEMANTIC,
         semantic_weight: float = DEFAULT_SEMANTIC_WEIGHT,
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[ChunkResult]:
         """
         Execute the actual search query (semantic or hybrid).
 
+        With a query embedding the *_by_embedding functions are used, so the
+        server does not re-embed the query; without one (or before migration
+        032) the text functions embed it server-side.
+
         Args:
             document_id: Document to search.
             query: Search query.
@@ -514,65 +588,81 @@ class SemanticQueryAgent(BaseAgent):
             db_manager: Database manager.
             search_mode: SEMANTIC or HYBRID.
             semantic_weight: Weight for semantic vs keyword in hybrid (0.0-1.0).
+            query_embedding: Precomputed embedding of ``query``, if any.
 
         Returns:
             List of ChunkResult objects.
         """
+        if query_embedding is not None and self._embedding_functions_available:
+            try:
+                return self._query_chunks(
+                    document_id, query, threshold, max_results, use_fulltext,
+                    db_manager, search_mode, semantic_weight, query_embedding,
+                )
+            except UndefinedFunction:
+                logger.warning(
+                    "Embedding search functions not installed (migration 032); "
+                    "falling back to server-side query embedding"
+                )
+                self._embedding_functions_available = False
+            except Exception as e:
+                logger.error(f"Search failed (mode={search_mode.value}): {e}", exc_info=True)
+                return []
+
         try:
-            with db_manager.get_connection() as conn:
-                with conn.cursor() as cur:
-                    if search_mode == SearchMode.HYBRID and use_fulltext:
-                        # Hybrid search (semantic + keyword with RRF)
-                        cur.execute(
-                            """
-                            SELECT chunk_id, chunk_no, score, chunk_text,
-                                   semantic_score, keyword_score, match_source
-                            FROM semantic.hybrid_chunksearch_document(%s, %s, %s, %s, %s, %s)
-                            ORDER BY score DESC
-                            """,
-                            (
-                                document_id,
-                                query,
-                                threshold,
-                                max_results,
-                                semantic_weight,
-                                self.rrf_k,
-                            ),
-                        )
-                        rows = cur.fetchall()
-                        return [
-                            ChunkResult(
-                                chunk_id=row[0],
-                                chunk_no=row[1],
-                                score=row[2],
-                                text=row[3],
-                                semantic_score=row[4],
-                                keyword_score=row[5],
-                                match_source=row[6],
-                            )
-                            for row in rows
-                        ]
-                    elif use_fulltext:
-                        # Pure semantic search on semantic.chunks (full-text)
-                        cur.execute(
-                            """
-                            SELECT chunk_id, chunk_no, score, chunk_text
-                            FROM semantic.chunksearch_document(%s, %s, %s, %s)
-                            ORDER BY score DESC
-                            """,
-                            (document_id, query, threshold, max_results),
-                        )
-                    else:
-                        # Search emb_1024 (abstract) - semantic only
-                        cur.execute(
-                            """
-                            SELECT chunk_id, chunk_no, score, chunk_text
-                            FROM semantic_search_document(%s, %s, %s, %s)
-                            ORDER BY score DESC
-                            """,
-                            (document_id, query, threshold, max_results),
-                        )
+            return self._query_chunks(
+                document_id, query, threshold, max_results, use_fulltext,
+                db_manager, search_mode, semantic_weight, None,
+            )
+        except Exception as e:
+            logger.error(f"Search failed (mode={search_mode.value}): {e}", exc_info=True)
+            return []
 
+    def _query_chunks(
+        self,
+        document_id: int,
+        query: str,
+        threshold: float,
+        max_results: int,
+        use_fulltext: bool,
+        db_manager: "DatabaseManager",
+        search_mode: SearchMode,
+        semantic_weight: float,
+        query_embedding: Optional[np.ndarray],
+    ) -> List[ChunkResult]:
+        """Run one search function call; see _execute_search() for arguments."""
+        with db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                if query_embedding is not None:
+                    # The *_by_embedding functions take the vector in place
+                    # of the query text (hybrid also needs the text)
+                    query_args = (vector_param(conn, query_embedding),)
+                    suffix = "_by_embedding"
+                    if search_mode == SearchMode.HYBRID and use_fulltext:
+                        query_args += (query,)
+                else:
+                    query_args = (query,)
+                    suffix = ""
+
+                if search_mode == SearchMode.HYBRID and use_fulltext:
+                    # Hybrid search (semantic + keyword with RRF)
+                    placeholders = ", ".join(["%s"] * (len(query_args) + 5))
+                    cur.execute(
+                        f"""
+                        SELECT chunk_id, chunk_no, score, chunk_text,
+                               semantic_score, keyword_score, match_source
+                        FROM semantic.hybrid_chunksearch_document{suffix}({placeholders})
+                        ORDER BY score DESC
+                        """,
+                        (
+                            document_id,
+                            *query_args,
+                            threshold,
+                            max_results,
+                            semantic_weight,
+                            self.rrf_k,
+                        ),
+                    )
                     rows = cur.fetchall()
                     return [
                         ChunkResult(
@@ -580,13 +670,43 @@ class SemanticQueryAgent(BaseAgent):
                             chunk_no=row[1],
                             score=row[2],
                             text=row[3],
+                            semantic_score=row[4],
+                            keyword_score=row[5],
+                            match_source=row[6],
                         )
                         for row in rows
                     ]
+                elif use_fulltext:
+                    # Pure semantic search on semantic.chunks (full-text)
+                    cur.execute(
+                        f"""
+                        SELECT chunk_id, chunk_no, score, chunk_text
+                        FROM semantic.chunksearch_document{suffix}(%s, %s, %s, %s)
+                        ORDER BY score DESC
+                        """,
+                        (document_id, *query_args, threshold, max_results),
+                    )
+                else:
+                    # Search emb_1024 (abstract) - semantic only
+                    cur.execute(
+                        f"""
+                        SELECT chunk_id, chunk_no, score, chunk_text
+                        FROM semantic_search_document{suffix}(%s, %s, %s, %s)
+                        ORDER BY score DESC
+                        """,
+                        (document_id, *query_args, threshold, max_results),
+                    )
 
-        except Exception as e:
-            logger.error(f"Search failed (mode={search_mode.value}): {e}", exc_info=True)
-            return []
+                rows = cur.fetchall()
+                return [
+                    ChunkResult(
+                        chunk_id=row[0],
+                        chunk_no=row[1],
+                        score=row[2],
+                        text=row[3],
+                    )
+                    for row in rows
+                ]
 
     def _generate_query_variation(
         self,
@@ -763,8 +883,11 @@ Now analyze the query:"""
         # Use hybrid mode by default for expanded search
         mode = search_mode or SearchMode.HYBRID
 
-        # Try expanded query first (better keyword coverage)
+        # Embed both variants in one round trip; the searches below reuse them
         expanded_query = expansion.get("expanded", query)
+        self.embed_queries([expanded_query, query])
+
+        # Try expanded query first (better keyword coverage)
         if expanded_query and expanded_query != query:
             logger.info(f"[SemanticQueryAgent] Trying expanded query: '{expanded_query}'")
             result = self.search_document(
@@ -925,4 +1048,5 @@ __all__ = [
     "DEFAULT_SEMANTIC_WEIGHT",
     "DEFAULT_RRF_K",
     "DEFAULT_HYBRID_THRESHOLD",
+    "DEFAULT_QUERY_EMBEDDING_MODEL",
 ]
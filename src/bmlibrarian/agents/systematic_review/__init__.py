@@ -16,6 +16,7 @@ Main Components:
 - InclusionEvaluator: LLM-based inclusion/exclusion evaluation (Phase 3)
 - RelevanceScorer: Relevance scoring with batch support (Phase 3)
 - CompositeScorer: Weighted composite scoring for ranking (Phase 3)
+- DistributedScoringWorker: Relevance scoring worker sharing a run's queue
 - QualityAssessor: Quality assessment orchestrator (Phase 4)
 
 Data Models:
@@ -238,6 +239,10 @@ from .scorer import (
     ScoringResult,
     BatchScoringResult,
 )
+from .distributed import (
+    DistributedScoringWorker,
+    DistributedScoringResult,
+)
 
 # Phase 4: Quality Assessment
 from .quality import (
@@ -412,6 +417,8 @@ __all__ = [
     "CompositeScorer",
     "ScoringResult",
     "BatchScoringResult",
+    "DistributedScoringWorker",
+    "DistributedScoringResult",
     # Phase 4: Quality Assessment
     "QualityAssessor",
     "QualityAssessmentResult",
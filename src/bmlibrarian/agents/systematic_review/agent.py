@@ -34,6 +34,7 @@ from .config import (
     SystematicReviewConfig,
     get_systematic_review_config,
     AGENT_TYPE,
+    CRITERIA_SNAPSHOT_KEY,
     CHECKPOINT_TITLE_TRUNCATE_LENGTH,
     CHECKPOINT_SAMPLE_TITLES_COUNT,
 )
@@ -71,6 +72,7 @@ if TYPE_CHECKING:
     from ..orchestrator import AgentOrchestrator
     from .executor import AggregatedResults, PhasedSearchResults
     from .scorer import RelevanceScorer, CompositeScorer
+    from .distributed import DistributedScoringResult
     from .quality import QualityAssessor
     from .reporter import Reporter
     from bmlibrarian.database import DatabaseManager
@@ -285,6 +287,8 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
             "top_p": self.config.top_p,
             "relevance_threshold": self.config.relevance_threshold,
             "weights": self._weights.to_dict() if self._weights else None,
+            # Lets distributed workers joining the run score like this agent
+            CRITERIA_SNAPSHOT_KEY: self._criteria.to_dict(),
         }
 
         self._evaluation_run = self._evaluation_store.create_run(
@@ -320,18 +324,7 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
         if not self._evaluation_run:
             raise ValueError("No active evaluation run")
 
-        evaluation_data = {
-            "score": scored_paper.relevance_score,
-            "rationale": scored_paper.relevance_rationale,
-        }
-
-        if scored_paper.inclusion_decision:
-            evaluation_data["inclusion_decision"] = scored_paper.inclusion_decision.status.value
-            if scored_paper.inclusion_decision.rationale:
-                evaluation_data["inclusion_rationale"] = scored_paper.inclusion_decision.rationale
-
-        if scored_paper.relevant_citations:
-            evaluation_data["citation_count"] = len(scored_paper.relevant_citations)
+        evaluation_data = scored_paper.to_evaluation_data()
 
         try:
             logger.info(
@@ -360,6 +353,62 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
             )
             raise RuntimeError(f"Failed to save scored paper: {e}") from e
 
+    def _score_papers_distributed(
+        self,
+        papers: List[PaperData],
+        scorer: "RelevanceScorer",
+    ) -> "DistributedScoringResult":
+        """
+        Score papers through the run's shared work queue.
+
+        Enqueues the papers and scores them with a local worker. Workers in
+        other processes or on other machines can join the same run (see
+        DistributedScoringWorker.from_run) and share the queue. Returns once
+        every enqueued paper is done or failed; results are read back with
+        get_scored_papers().
+
+        Args:
+            papers: Papers still needing a relevance score.
+            scorer: RelevanceScorer configured for this review.
+
+        Returns:
+            DistributedScoringResult for the local worker.
+
+        Raises:
+            ValueError: If no active evaluation run exists.
+        """
+        from .distributed import DistributedScoringWorker
+        from .distributed import load_papers as load_papers_from_db
+
+        if not self._evaluation_run:
+            raise ValueError("No active evaluation run")
+
+        paper_map = {p.document_id: p for p in papers}
+
+        def load_papers(document_ids: List[int]) -> Dict[int, PaperData]:
+            found = {d: paper_map[d] for d in document_ids if d in paper_map}
+            missing = [d for d in document_ids if d not in paper_map]
+            if missing:
+                found.update(load_papers_from_db(missing))
+            return found
+
+        worker = DistributedScoringWorker(
+            store=self._evaluation_store,
+            run_id=self._evaluation_run.run_id,
+            scorer=scorer,
+            evaluator_id=self._evaluator_id,
+            config=self.config,
+            callback=self.callback,
+            paper_loader=load_papers,
+        )
+        enqueued = worker.enqueue(list(paper_map))
+        logger.info(
+            f"Distributed scoring: enqueued {enqueued} papers for run "
+            f"{self._evaluation_run.run_id}; other workers can join with "
+            f"--join-run {self._evaluation_run.run_id}"
+        )
+        return worker.run(wait_for_others=True)
+
     def _save_assessed_paper(
         self,
         assessed_paper: AssessedPaper,
@@ -1030,7 +1079,21 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
                 input_summary=f"Scoring {len(papers_to_score)} papers for relevance ({cached_count} cached)",
                 decision_rationale="Assessing relevance to research question using LLM",
             ) as timer:
-                if papers_to_score:
+                if papers_to_score and self.config.distributed_scoring:
+                    distributed_result = self._score_papers_distributed(
+                        papers_to_score, scorer
+                    )
+                    timer.set_output(
+                        f"Scored {distributed_result.scored} papers locally "
+                        f"through the shared run queue ({cached_count} cached)"
+                    )
+                    timer.add_metrics({
+                        "papers_scored": distributed_result.scored,
+                        "papers_cached": cached_count,
+                        "failed_scoring": distributed_result.failed,
+                        "distributed": distributed_result.to_dict(),
+                    })
+                elif papers_to_score:
                     # Pass save callback to persist each evaluation immediately
                     # This ensures progress is saved even if the process is interrupted
                     scoring_result = scorer.score_batch(
@@ -1840,7 +1903,7 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
         """Get or create DocumentScoringAgent instance."""
         if self._scoring_agent is None:
             from ..scoring_agent import DocumentScoringAgent
-            from ...config import get_model, get_ollama_host, get_agent_config
+            from ...config import get_model, get_ollama_host, get_ollama_hosts, get_agent_config
 
             model = get_model("scoring_agent")
             config = get_agent_config("scoring")
@@ -1853,6 +1916,8 @@ class SystematicReviewAgent(CheckpointResumeMixin, BaseAgent):
                 callback=self.callback,
                 orchestrator=self.orchestrator,
                 show_model_info=False,
+                max_concurrent_requests=config.get("max_concurrent_requests", 1),
+                ollama_hosts=get_ollama_hosts(),
             )
         return self._scoring_agent
 
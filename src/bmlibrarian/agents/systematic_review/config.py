@@ -66,6 +66,16 @@ DEFAULT_EXCLUSION_CRITERIA = [
 DEFAULT_BATCH_SIZE = 50
 DEFAULT_MAX_RETRIES = 3
 
+# Distributed scoring defaults (several workers sharing one evaluation run)
+DEFAULT_DISTRIBUTED_SCORING = False
+DEFAULT_WORKER_CLAIM_BATCH_SIZE = 8
+DEFAULT_WORKER_LEASE_SECONDS = 300
+DEFAULT_WORKER_POLL_INTERVAL = 5.0
+
+# evaluation_runs.config_snapshot key holding the review's SearchCriteria,
+# read by distributed workers joining the run
+CRITERIA_SNAPSHOT_KEY = "criteria"
+
 # Checkpoint defaults
 DEFAULT_CHECKPOINT_ENABLED = True
 DEFAULT_CHECKPOINT_DIR = "~/.bmlibrarian/checkpoints"
@@ -104,6 +114,13 @@ class SystematicReviewConfig:
         batch_size: Papers to process per batch
         max_retries: Maximum retry attempts for failed operations
 
+        distributed_scoring: Score through the shared run work queue so
+            other worker processes can join the run
+        worker_claim_batch_size: Papers a worker claims per round trip
+        worker_lease_seconds: Seconds a claim survives without a heartbeat
+        worker_poll_interval: Seconds an idle worker waits for other
+            workers' claims to finish or expire
+
         scoring_weights: Weights for composite score calculation
         checkpoint_enabled: Whether to save checkpoints
         checkpoint_dir: Directory for checkpoint files
@@ -132,6 +149,12 @@ class SystematicReviewConfig:
     batch_size: int = DEFAULT_BATCH_SIZE
     max_retries: int = DEFAULT_MAX_RETRIES
 
+    # Distributed scoring settings
+    distributed_scoring: bool = DEFAULT_DISTRIBUTED_SCORING
+    worker_claim_batch_size: int = DEFAULT_WORKER_CLAIM_BATCH_SIZE
+    worker_lease_seconds: int = DEFAULT_WORKER_LEASE_SECONDS
+    worker_poll_interval: float = DEFAULT_WORKER_POLL_INTERVAL
+
     # Scoring settings
     scoring_weights: ScoringWeights = field(default_factory=ScoringWeights)
 
@@ -192,6 +215,10 @@ class SystematicReviewConfig:
             "quality_threshold": self.quality_threshold,
             "batch_size": self.batch_size,
             "max_retries": self.max_retries,
+            "distributed_scoring": self.distributed_scoring,
+            "worker_claim_batch_size": self.worker_claim_batch_size,
+            "worker_lease_seconds": self.worker_lease_seconds,
+            "worker_poll_interval": self.worker_poll_interval,
             "scoring_weights": self.scoring_weights.to_dict(),
             "checkpoint_enabled": self.checkpoint_enabled,
             "checkpoint_dir": self.checkpoint_dir,
@@ -245,6 +272,12 @@ class SystematicReviewConfig:
             quality_threshold=data.get("quality_threshold", DEFAULT_QUALITY_THRESHOLD),
             batch_size=data.get("batch_size", DEFAULT_BATCH_SIZE),
             max_retries=data.get("max_retries", DEFAULT_MAX_RETRIES),
+            distributed_scoring=data.get("distributed_scoring", DEFAULT_DISTRIBUTED_SCORING),
+            worker_claim_batch_size=data.get(
+                "worker_claim_batch_size", DEFAULT_WORKER_CLAIM_BATCH_SIZE
+            ),
+            worker_lease_seconds=data.get("worker_lease_seconds", DEFAULT_WORKER_LEASE_SECONDS),
+            worker_poll_interval=data.get("worker_poll_interval", DEFAULT_WORKER_POLL_INTERVAL),
             scoring_weights=scoring_weights,
             checkpoint_enabled=data.get("checkpoint_enabled", DEFAULT_CHECKPOINT_ENABLED),
             checkpoint_dir=data.get("checkpoint_dir", DEFAULT_CHECKPOINT_DIR),
@@ -333,6 +366,22 @@ class SystematicReviewConfig:
                 ),
                 batch_size=agent_config.get("batch_size", DEFAULT_BATCH_SIZE),
                 max_retries=agent_config.get("max_retries", DEFAULT_MAX_RETRIES),
+                distributed_scoring=agent_config.get(
+                    "distributed_scoring",
+                    DEFAULT_DISTRIBUTED_SCORING
+                ),
+                worker_claim_batch_size=agent_config.get(
+                    "worker_claim_batch_size",
+                    DEFAULT_WORKER_CLAIM_BATCH_SIZE
+                ),
+                worker_lease_seconds=agent_config.get(
+                    "worker_lease_seconds",
+                    DEFAULT_WORKER_LEASE_SECONDS
+                ),
+                worker_poll_interval=agent_config.get(
+                    "worker_poll_interval",
+                    DEFAULT_WORKER_POLL_INTERVAL
+                ),
                 scoring_weights=scoring_weights,
                 checkpoint_enabled=agent_config.get(
                     "checkpoint_enabled",
@@ -412,6 +461,17 @@ class SystematicReviewConfig:
         if self.batch_size < 1:
             errors.append(f"Batch size must be at least 1, got {self.batch_size}")
 
+        # Validate distributed scoring settings
+        if self.worker_claim_batch_size < 1:
+            errors.append(
+                f"Worker claim batch size must be at least 1, "
+                f"got {self.worker_claim_batch_size}"
+            )
+        if self.worker_lease_seconds < 1:
+            errors.append(
+                f"Worker lease must be at least 1 second, got {self.worker_lease_seconds}"
+            )
+
         # Validate max_search_results
         if self.max_search_results < 1:
             errors.append(
@@ -461,6 +521,10 @@ DEFAULT_SYSTEMATIC_REVIEW_CONFIG: Dict[str, Any] = {
     "quality_threshold": DEFAULT_QUALITY_THRESHOLD,
     "batch_size": DEFAULT_BATCH_SIZE,
     "max_retries": DEFAULT_MAX_RETRIES,
+    "distributed_scoring": DEFAULT_DISTRIBUTED_SCORING,
+    "worker_claim_batch_size": DEFAULT_WORKER_CLAIM_BATCH_SIZE,
+    "worker_lease_seconds": DEFAULT_WORKER_LEASE_SECONDS,
+    "worker_poll_interval": DEFAULT_WORKER_POLL_INTERVAL,
     "checkpoint_enabled": DEFAULT_CHECKPOINT_ENABLED,
     "checkpoint_dir": DEFAULT_CHECKPOINT_DIR,
     "output_dir": DEFAULT_OUTPUT_DIR,
@@ -1260,6 +1260,28 @@ class ScoredPaper:
             "processing_time_ms": self.processing_time_ms,
         }
 
+    def to_evaluation_data(self) -> Dict[str, Any]:
+        """
+        Build the relevance_score evaluation_data stored in EvaluationStore.
+
+        Returns:
+            Dictionary matching the RelevanceScoreData schema
+        """
+        evaluation_data: Dict[str, Any] = {
+            "score": self.relevance_score,
+            "rationale": self.relevance_rationale,
+        }
+
+        if self.inclusion_decision:
+            evaluation_data["inclusion_decision"] = self.inclusion_decision.status.value
+            if self.inclusion_decision.rationale:
+                evaluation_data["inclusion_rationale"] = self.inclusion_decision.rationale
+
+        if self.relevant_citations:
+            evaluation_data["citation_count"] = len(self.relevant_citations)
+
+        return evaluation_data
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ScoredPaper":
         """
@@ -0,0 +1,414 @@
+"""
+Distributed Relevance Scoring for SystematicReviewAgent
+
+Lets several worker processes, on one or many machines, score the papers of
+a single systematic review run. Throughput then grows with the number of
+LLM hosts attached instead of being bound to one process.
+
+The coordinating SystematicReviewAgent enqueues the papers that still need
+a relevance score into the run's work queue (evaluations.work_queue) and
+then scores alongside any other workers. Every DistributedScoringWorker:
+
+1. Claims a small batch of document ids (FOR UPDATE SKIP LOCKED)
+2. Loads the papers and scores them with RelevanceScorer
+3. Saves the scores through EvaluationStore.save_evaluations_batch()
+4. Marks the batch done, while a heartbeat keeps its leases alive
+
+Workers whose leases expire (crash, lost connection) are recovered by
+whichever worker next finds the queue empty.
+
+Example:
+    >>> store = EvaluationStore(DatabaseManager())
+    >>> worker = DistributedScoringWorker.from_run(store, run_id=42)
+    >>> result = worker.run()
+    >>> print(f"Scored {result.scored} papers in {result.batches} batches")
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from .config import (
+    SystematicReviewConfig,
+    get_systematic_review_config,
+    CRITERIA_SNAPSHOT_KEY,
+)
+from .data_models import PaperData, ScoredPaper, SearchCriteria
+from .scorer import RelevanceScorer
+
+if TYPE_CHECKING:
+    from bmlibrarian.evaluations import EvaluationStore, RunWorkQueue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DistributedScoringResult:
+    """
+    Outcome of one worker's participation in a distributed scoring run.
+
+    Attributes:
+        worker_id: Worker that produced this result
+        scored: Papers this worker scored and saved
+        failed: Papers this worker handed back after an error
+        batches: Claim batches processed
+        recovered_leases: Abandoned claims this worker returned to the queue
+        execution_time_seconds: Wall time spent in run()
+    """
+
+    worker_id: str
+    scored: int = 0
+    failed: int = 0
+    batches: int = 0
+    recovered_leases: int = 0
+    execution_time_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to dictionary for serialization.
+
+        Returns:
+            Dictionary representation
+        """
+        return {
+            "worker_id": self.worker_id,
+            "scored": self.scored,
+            "failed": self.failed,
+            "batches": self.batches,
+            "recovered_leases": self.recovered_leases,
+            "execution_time_seconds": round(self.execution_time_seconds, 2),
+        }
+
+
+def load_papers(document_ids: List[int]) -> Dict[int, PaperData]:
+    """
+    Load PaperData for document ids from the database.
+
+    Args:
+        document_ids: Documents to load
+
+    Returns:
+        Dictionary mapping document_id to PaperData (missing ids are absent)
+    """
+    from bmlibrarian.database import fetch_documents_by_ids
+
+    papers: Dict[int, PaperData] = {}
+    for row in fetch_documents_by_ids(set(document_ids), compact=True):
+        try:
+            paper = PaperData.from_database_row(row)
+        except Exception as e:
+            logger.warning(f"Failed to convert document {row.get('id')}: {e}")
+            continue
+        papers[paper.document_id] = paper
+    return papers
+
+
+class DistributedScoringWorker:
+    """
+    Relevance scoring worker for a shared evaluation run.
+
+    Any number of these can run against the same run_id, in the
+    coordinating agent's process or in separate processes and machines.
+
+    Attributes:
+        run_id: Evaluation run being scored
+        scorer: RelevanceScorer used for the claimed papers
+        queue: Work queue shared by all workers of the run
+    """
+
+    def __init__(
+        self,
+        store: "EvaluationStore",
+        run_id: int,
+        scorer: RelevanceScorer,
+        evaluator_id: Optional[int] = None,
+        config: Optional[SystematicReviewConfig] = None,
+        worker_id: Optional[str] = None,
+        callback: Optional[Callable[[str, str], None]] = None,
+        paper_loader: Optional[Callable[[List[int]], Dict[int, PaperData]]] = None,
+    ) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            store: EvaluationStore for the shared database
+            run_id: Evaluation run to work on
+            scorer: RelevanceScorer configured for the run's research question
+            evaluator_id: Evaluator recorded on saved evaluations
+            config: Configuration (claim batch size, lease, poll interval)
+            worker_id: Unique worker id (generated if not provided)
+            callback: Optional progress callback(event, data)
+            paper_loader: Optional function mapping document ids to PaperData
+                (defaults to loading from the database)
+        """
+        from bmlibrarian.evaluations import RunWorkQueue
+
+        self._config = config or get_systematic_review_config()
+        self.store = store
+        self.run_id = run_id
+        self.scorer = scorer
+        self.evaluator_id = evaluator_id
+        self.callback = callback
+        self._paper_loader = paper_loader or load_papers
+        self.queue: "RunWorkQueue" = RunWorkQueue(
+            store,
+            worker_id=worker_id,
+            lease_seconds=self._config.worker_lease_seconds,
+        )
+
+    @classmethod
+    def from_run(
+        cls,
+        store: "EvaluationStore",
+        run_id: int,
+        config: Optional[SystematicReviewConfig] = None,
+        worker_id: Optional[str] = None,
+        callback: Optional[Callable[[str, str], None]] = None,
+    ) -> "DistributedScoringWorker":
+        """
+        Create a worker for an existing run, e.g. on another machine.
+
+        The research question, inclusion criteria and evaluator are taken
+        from the run, so every worker scores exactly like the coordinator.
+
+        Args:
+            store: EvaluationStore for the shared database
+            run_id: Evaluation run to join
+            config: Optional configuration for this worker
+            worker_id: Unique worker id (generated if not provided)
+            callback: Optional progress callback(event, data)
+
+        Returns:
+            DistributedScoringWorker ready to run()
+
+        Raises:
+            ValueError: If the run does not exist or is not in progress
+        """
+        run = store.get_run(run_id)
+        if run is None:
+            raise ValueError(f"Evaluation run {run_id} not found")
+        if not run.is_resumable:
+            raise ValueError(f"Evaluation run {run_id} is {run.status}, cannot join")
+
+        config = config or get_systematic_review_config()
+        snapshot = run.config_snapshot or {}
+
+        criteria: Optional[SearchCriteria] = None
+        if snapshot.get(CRITERIA_SNAPSHOT_KEY):
+            criteria = SearchCriteria.from_dict(snapshot[CRITERIA_SNAPSHOT_KEY])
+        if "relevance_threshold" in snapshot:
+            config.relevance_threshold = snapshot["relevance_threshold"]
+
+        scorer = RelevanceScorer(
+            research_question=run.research_question_text or "",
+            config=config,
+            callback=callback,
+            criteria=criteria,
+        )
+
+        return cls(
+            store=store,
+            run_id=run_id,
+            scorer=scorer,
+            evaluator_id=run.evaluator_id,
+            config=config,
+            worker_id=worker_id,
+            callback=callback,
+        )
+
+    @property
+    def worker_id(self) -> str:
+        """Get this worker's id."""
+        return self.queue.worker_id
+
+    def _call_callback(self, event: str, data: str) -> None:
+        """Call progress callback if registered."""
+        if self.callback:
+            try:
+                self.callback(event, data)
+            except Exception as e:
+                logger.warning(f"Callback error: {e}")
+
+    def enqueue(self, document_ids: List[int]) -> int:
+        """
+        Add documents to the run's work queue (coordinator side).
+
+        Args:
+            document_ids: Documents to score
+
+        Returns:
+            Number of newly enqueued documents
+        """
+        from bmlibrarian.evaluations import EvaluationType
+
+        return self.queue.enqueue_documents(
+            self.run_id, document_ids, EvaluationType.RELEVANCE_SCORE
+        )
+
+    def run(
+        self,
+        wait_for_others: bool = True,
+        stop_event: Optional[threading.Event] = None,
+    ) -> DistributedScoringResult:
+        """
+        Claim and score papers until the run's queue is drained.
+
+        Args:
+            wait_for_others: If True, keep waiting (and recovering expired
+                leases) while other workers still hold claims, so that on
+                return every enqueued paper is done or failed. If False,
+                return as soon as nothing is left to claim.
+            stop_event: Optional event that ends the loop after the
+                current batch
+
+        Returns:
+            DistributedScoringResult for this worker
+        """
+        from bmlibrarian.evaluations import EvaluationType, LeaseHeartbeat
+
+        evaluation_type = EvaluationType.RELEVANCE_SCORE
+        result = DistributedScoringResult(worker_id=self.worker_id)
+        start_time = time.time()
+
+        self._call_callback("distributed_scoring_started", f"Worker {self.worker_id}")
+        logger.info(f"Worker {self.worker_id} joined run {self.run_id}")
+
+        with LeaseHeartbeat(self.queue, run_id=self.run_id):
+            while not (stop_event and stop_event.is_set()):
+                document_ids = self.queue.claim_documents(
+                    self.run_id,
+                    evaluation_type,
+                    limit=self._config.worker_claim_batch_size,
+                )
+
+                if document_ids:
+                    scored, failed = self._process_claim(document_ids)
+                    result.scored += scored
+                    result.failed += failed
+                    result.batches += 1
+                    status = self.queue.sync_run_progress(self.run_id, evaluation_type)
+                    self._call_callback(
+                        "scoring_progress",
+                        f"{status.done + status.failed}/{status.total} | "
+                        f"Worker {self.worker_id} scored {scored} papers"
+                    )
+                    continue
+
+                recovery = self.queue.recover_abandoned_leases(self.run_id, evaluation_type)
+                result.recovered_leases += recovery.total
+                if recovery.requeued:
+                    continue
+
+                status = self.queue.get_status(self.run_id, evaluation_type)
+                if not status.pending and (status.is_drained or not wait_for_others):
+                    break
+
+                # Pending rows that could not be claimed are row-locked by
+                # another worker's claim (SKIP LOCKED); otherwise other workers
+                # still hold live claims. Either way, wait before retrying
+                # rather than spinning on the database.
+                if stop_event:
+                    stop_event.wait(self._config.worker_poll_interval)
+                else:
+                    time.sleep(self._config.worker_poll_interval)
+
+        result.execution_time_seconds = time.time() - start_time
+        self._call_callback(
+            "distributed_scoring_completed",
+            f"Worker {self.worker_id}: scored {result.scored}, failed {result.failed}"
+        )
+        logger.info(
+            f"Worker {self.worker_id} finished run {self.run_id}: "
+            f"{result.scored} scored, {result.failed} failed in "
+            f"{result.batches} batches ({result.execution_time_seconds:.2f}s)"
+        )
+        return result
+
+    def _process_claim(self, document_ids: List[int]) -> Tuple[int, int]:
+        """
+        Score one claimed batch and persist the results.
+
+        Args:
+            document_ids: Claimed documents
+
+        Returns:
+            Tuple of (scored, failed) counts
+        """
+        from bmlibrarian.evaluations import EvaluationType
+
+        evaluation_type = EvaluationType.RELEVANCE_SCORE
+
+        try:
+            papers = self._paper_loader(document_ids)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} failed to load papers: {e}")
+            self.queue.release_documents(
+                self.run_id, evaluation_type, document_ids, error=f"Load failed: {e}"
+            )
+            return 0, len(document_ids)
+
+        missing = [doc_id for doc_id in document_ids if doc_id not in papers]
+        if missing:
+            logger.warning(f"Documents not found for scoring: {missing}")
+            self.queue.release_documents(
+                self.run_id, evaluation_type, missing, error="Document not found"
+            )
+
+        to_score = [papers[doc_id] for doc_id in document_ids if doc_id in papers]
+        if not to_score:
+            return 0, len(missing)
+
+        batch_result = self.scorer.score_batch(to_score, evaluate_inclusion=True)
+
+        evaluations = [
+            self._to_evaluation(scored_paper)
+            for scored_paper in batch_result.scored_papers
+        ]
+        try:
+            self.queue.complete_documents(self.run_id, evaluation_type, evaluations)
+        except Exception as e:
+            logger.error(
+                f"Worker {self.worker_id} failed to save {len(evaluations)} scores: {e}",
+                exc_info=True
+            )
+            self.queue.release_documents(
+                self.run_id,
+                evaluation_type,
+                [paper.document_id for paper in to_score],
+                error=f"Save failed: {e}",
+            )
+            return 0, len(document_ids)
+
+        failed_ids = [paper.document_id for paper, _ in batch_result.failed_papers]
+        if failed_ids:
+            self.queue.release_documents(
+                self.run_id,
+                evaluation_type,
+                failed_ids,
+                error=batch_result.failed_papers[0][1],
+            )
+
+        return len(evaluations), len(failed_ids) + len(missing)
+
+    def _to_evaluation(self, scored_paper: ScoredPaper) -> Dict[str, Any]:
+        """
+        Convert a ScoredPaper to a save_evaluations_batch() entry.
+
+        Args:
+            scored_paper: Scored paper
+
+        Returns:
+            Evaluation dict
+        """
+        return {
+            "document_id": scored_paper.paper.document_id,
+            "evaluation_data": scored_paper.to_evaluation_data(),
+            "primary_score": float(scored_paper.relevance_score),
+            "evaluator_id": self.evaluator_id,
+            "reasoning": scored_paper.relevance_rationale,
+            "processing_time_ms": scored_paper.processing_time_ms,
+        }
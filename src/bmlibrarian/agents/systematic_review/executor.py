@@ -933,7 +933,7 @@ class SearchExecutor:
         try:
             from bmlibrarian.database import fetch_documents_by_ids
 
-            documents = fetch_documents_by_ids(document_ids)
+            documents = fetch_documents_by_ids(document_ids, compact=True)
 
             papers = []
             for doc in documents:
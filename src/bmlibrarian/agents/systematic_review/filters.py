@@ -21,9 +21,11 @@ from __future__ import annotations
 
 import json
 import logging
+import multiprocessing
 import re
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime
 from enum import Enum
 from functools import lru_cache
@@ -31,6 +33,7 @@ from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, TYP
 
 
 from ...llm import LLMClient, LLMMessage
+from ..utils.keyword_matcher import KeywordMatcher
 from .data_models import (
     SearchCriteria,
     PaperData,
@@ -151,8 +154,17 @@ DEFINITIVE_TITLE_PATTERNS: List[Tuple[Pattern, str]] = [
     for pattern, description in _DEFINITIVE_TITLE_PATTERN_DEFS
 ]
 
+# All title patterns as one alternation: a single search rules out the
+# common case (no match) before the ordered per-pattern check
+_ANY_DEFINITIVE_TITLE_PATTERN: Pattern = re.compile(
+    "|".join(f"(?:{pattern})" for pattern, _ in _DEFINITIVE_TITLE_PATTERN_DEFS)
+)
+
 # Context patterns that indicate exclusion keywords are NOT describing the paper itself
 # e.g., "we excluded case reports" should NOT exclude the paper
+# Apart from the keyword, patterns only span word characters and whitespace,
+# so a match never crosses punctuation; checks search just that run around
+# each keyword hit (see _CONTEXT_RUN).
 NEGATIVE_CONTEXT_PATTERNS: List[str] = [
     # Exclusion statements in methods (with optional words between)
     r"(?:we |were |was )?exclud(?:ed|ing)\s+(?:\w+\s+)*{keyword}",
@@ -194,6 +206,12 @@ MAX_AUTHORS_TO_DISPLAY = 5  # Maximum authors to include in evaluation prompts
 # Pattern cache size for performance optimization
 PATTERN_CACHE_SIZE = 256  # Maximum cached pattern compilations
 
+# Run of characters a negative context match can span (outside the keyword)
+_CONTEXT_RUN: Pattern = re.compile(r"[\w\s]*")
+
+# Parallel batch filtering
+DEFAULT_FILTER_CHUNK_SIZE = 1000  # Papers sent to a worker process per task
+
 
 # =============================================================================
 # Cached Pattern Compilation Helpers
@@ -221,6 +239,68 @@ def _compile_negative_context_pattern(pattern_template: str, keyword: str) -> Pa
     return re.compile(pattern_str)
 
 
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def _compile_negative_context_matcher(
+    pattern_templates: Tuple[str, ...],
+    keyword: str,
+) -> Optional[Pattern]:
+    """
+    Compile all negative context patterns for a keyword into one alternation.
+
+    Templates that fail to compile are logged and left out.
+
+    Args:
+        pattern_templates: Pattern templates with {keyword} placeholder
+        keyword: Keyword to substitute (will be escaped)
+
+    Returns:
+        Compiled alternation, or None if no template compiled
+    """
+    parts: List[str] = []
+    for pattern_template in pattern_templates:
+        try:
+            parts.append(_compile_negative_context_pattern(pattern_template, keyword).pattern)
+        except re.error as e:
+            logger.warning(
+                f"Invalid regex pattern template '{pattern_template}' "
+                f"with keyword '{keyword}': {e}"
+            )
+    if not parts:
+        return None
+    return re.compile("|".join(f"(?:{part})" for part in parts))
+
+
+# =============================================================================
+# Process Pool Helpers
+# =============================================================================
+
+# Per-process filter, built once by the pool initializer
+_process_filter: Optional["InitialFilter"] = None
+
+
+def _init_filter_process(
+    criteria: SearchCriteria,
+    custom_exclusion_keywords: List[str],
+) -> None:
+    """ProcessPoolExecutor initializer: build this worker's InitialFilter."""
+    global _process_filter
+    _process_filter = InitialFilter(criteria, custom_exclusion_keywords)
+
+
+def _filter_chunk_in_process(papers: List[PaperData]) -> List[Optional[str]]:
+    """
+    Filter a chunk of papers in a worker process.
+
+    Returns:
+        Rejection reason per paper, None for papers that passed
+    """
+    results = []
+    for paper in papers:
+        result = _process_filter.filter_paper(paper)
+        results.append(None if result.passed else result.reason)
+    return results
+
+
 # =============================================================================
 # Data Types
 # =============================================================================
@@ -339,6 +419,7 @@ class InitialFilter:
         """
         self.criteria = criteria
         self.callback = callback
+        self._custom_exclusion_keywords: List[str] = list(custom_exclusion_keywords or [])
 
         # Build exclusion keyword set
         self._exclusion_keywords: Set[str] = set(DEFAULT_EXCLUSION_KEYWORDS)
@@ -361,6 +442,10 @@ class InitialFilter:
                     keywords = STUDY_TYPE_KEYWORDS.get(study_type, [])
                     self._allowed_study_keywords.update(keywords)
 
+        # Compile each keyword set once; a paper is then scanned in one pass
+        self._exclusion_matcher = KeywordMatcher(self._exclusion_keywords)
+        self._study_type_matcher = KeywordMatcher(self._allowed_study_keywords)
+
         logger.info(
             f"InitialFilter initialized: "
             f"{len(self._exclusion_keywords)} exclusion keywords, "
@@ -515,33 +600,57 @@ class InitialFilter:
         self,
         papers: List[PaperData],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        processes: int = 0,
+        chunk_size: int = DEFAULT_FILTER_CHUNK_SIZE,
     ) -> BatchFilterResult:
         """
         Apply filtering to a batch of papers.
 
+        With processes > 1 and more than one chunk of papers, chunks are
+        filtered in a pool of worker processes, each holding its own
+        InitialFilter built from the same criteria. Results are identical
+        to the in-process path and keep the input order.
+
         Args:
             papers: List of papers to filter
-            progress_callback: Optional callback(current, total) for progress
+            progress_callback: Optional callback(current, total) for progress;
+                called per chunk when filtering in worker processes
+            processes: Worker processes (0 or 1 filters in this process)
+            chunk_size: Papers per worker task
 
         Returns:
             BatchFilterResult with passed and rejected papers
+
+        Raises:
+            ValueError: If chunk_size is not positive
         """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
         self._call_callback("filter_started", f"Filtering {len(papers)} papers")
         start_time = time.time()
 
         passed: List[PaperData] = []
         rejected: List[Tuple[PaperData, str]] = []
 
-        for i, paper in enumerate(papers):
-            result = self.filter_paper(paper)
+        if processes > 1 and len(papers) > chunk_size:
+            reasons = self._filter_in_processes(papers, processes, chunk_size, progress_callback)
+            for paper, reason in zip(papers, reasons):
+                if reason is None:
+                    passed.append(paper)
+                else:
+                    rejected.append((paper, reason))
+        else:
+            for i, paper in enumerate(papers):
+                result = self.filter_paper(paper)
 
-            if result.passed:
-                passed.append(paper)
-            else:
-                rejected.append((paper, result.reason))
+                if result.passed:
+                    passed.append(paper)
+                else:
+                    rejected.append((paper, result.reason))
 
-            if progress_callback:
-                progress_callback(i + 1, len(papers))
+                if progress_callback:
+                    progress_callback(i + 1, len(papers))
 
         execution_time = time.time() - start_time
 
@@ -562,6 +671,50 @@ class InitialFilter:
             execution_time_seconds=execution_time,
         )
 
+    def _filter_in_processes(
+        self,
+        papers: List[PaperData],
+        processes: int,
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Filter papers in a process pool.
+
+        Full text is not used by any check and is not sent to the workers.
+
+        Args:
+            papers: Papers to filter
+            processes: Number of worker processes
+            chunk_size: Papers per worker task
+            progress_callback: Optional callback(current, total) per chunk
+
+        Returns:
+            Rejection reason per paper (None if passed), in input order
+        """
+        chunks = [
+            [replace(paper, full_text=None) for paper in papers[i:i + chunk_size]]
+            for i in range(0, len(papers), chunk_size)
+        ]
+        logger.info(
+            f"Filtering {len(papers)} papers in {len(chunks)} chunks "
+            f"across {processes} processes"
+        )
+
+        reasons: List[Optional[str]] = []
+        with ProcessPoolExecutor(
+            max_workers=min(processes, len(chunks)),
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_filter_process,
+            initargs=(self.criteria, self._custom_exclusion_keywords),
+        ) as executor:
+            for chunk_reasons in executor.map(_filter_chunk_in_process, chunks):
+                reasons.extend(chunk_reasons)
+                if progress_callback:
+                    progress_callback(len(reasons), len(papers))
+
+        return reasons
+
     # =========================================================================
     # Individual Filter Checks
     # =========================================================================
@@ -605,12 +758,11 @@ class InitialFilter:
         if not self._allowed_study_keywords:
             return None  # No study type filter
 
-        # Check title and abstract for study type keywords
+        # Check title and abstract for study type keywords (single pass)
         text_to_check = f"{paper.title} {paper.abstract or ''}".lower()
 
-        for keyword in self._allowed_study_keywords:
-            if keyword in text_to_check:
-                return None  # Found a matching study type keyword
+        if self._study_type_matcher.search(text_to_check):
+            return None  # Found a matching study type keyword
 
         # No study type keyword found - but this is a soft filter
         # We return None to pass the paper through for LLM evaluation
@@ -645,16 +797,19 @@ class InitialFilter:
             return f"Title indicates excluded study type: '{title_match}'"
 
         # Tier 2: Context-aware keyword checking
+        # All keyword hits come from one pass over title + abstract, checked
+        # in order of first occurrence
         full_text = f"{title_lower} {abstract_lower}"
+        hits = self._exclusion_matcher.find_all(full_text)
 
-        for keyword in self._exclusion_keywords:
-            if keyword not in full_text:
-                continue
-
-            # Check if keyword appears in title (strong signal)
-            in_title = keyword in title_lower
+        for keyword, positions in hits.items():
+            # Check if keyword appears in title (strong signal); the title
+            # is the start of full_text, so the first hit decides
+            in_title = positions[0] + len(keyword) <= len(title_lower)
             # Check if keyword has protective/negative context
-            has_negative_context = self._has_negative_context(full_text, keyword)
+            has_negative_context = self._has_negative_context(
+                full_text, keyword, positions
+            )
 
             if in_title and not has_negative_context:
                 # Keyword in title without protective context - high confidence exclusion
@@ -690,43 +845,60 @@ class InitialFilter:
         Returns:
             Matched pattern description if excluded, None if passes
         """
+        if not _ANY_DEFINITIVE_TITLE_PATTERN.search(title):
+            return None
         for compiled_pattern, description in DEFINITIVE_TITLE_PATTERNS:
             if compiled_pattern.search(title):
                 return description
         return None
 
-    def _has_negative_context(self, text: str, keyword: str) -> bool:
+    def _has_negative_context(
+        self,
+        text: str,
+        keyword: str,
+        positions: Optional[List[int]] = None,
+    ) -> bool:
         """
         Check if keyword appears in a protective/negative context.
 
         Negative context indicates the paper is NOT of that type, but merely
         mentions excluding or comparing to such papers.
 
-        Uses cached compiled patterns for performance.
+        All NEGATIVE_CONTEXT_PATTERNS for the keyword are searched as one
+        cached alternation, and only within the run of words around each
+        keyword hit (a match cannot extend past punctuation), which gives
+        the same answer as searching the whole text.
 
         Args:
             text: Full text to check (lowercase)
             keyword: Exclusion keyword to check context for
+            positions: Start positions of the keyword in text (found if None)
 
         Returns:
             True if keyword has protective context, False otherwise
         """
-        for pattern_template in NEGATIVE_CONTEXT_PATTERNS:
-            try:
-                # Use cached pattern compilation
-                compiled_pattern = _compile_negative_context_pattern(
-                    pattern_template, keyword
-                )
-                if compiled_pattern.search(text):
-                    logger.debug(
-                        f"Found negative context for '{keyword}' matching pattern: {pattern_template}"
-                    )
-                    return True
-            except re.error as e:
-                logger.warning(
-                    f"Invalid regex pattern template '{pattern_template}' "
-                    f"with keyword '{keyword}': {e}"
+        compiled_pattern = _compile_negative_context_matcher(
+            tuple(NEGATIVE_CONTEXT_PATTERNS), keyword
+        )
+        if compiled_pattern is None:
+            return False
+
+        if positions is None:
+            positions = [m.start() for m in re.finditer(f"(?={re.escape(keyword)})", text)]
+        # The run's left edge is found by matching forward in the reversed text
+        reversed_text = text[::-1]
+        text_length = len(text)
+
+        for start in positions:
+            left = text_length - _CONTEXT_RUN.match(reversed_text, text_length - start).end()
+            right = _CONTEXT_RUN.match(text, start + len(keyword)).end()
+
+            match = compiled_pattern.search(text, left, right)
+            if match:
+                logger.debug(
+                    f"Found negative context for '{keyword}': '{match.group(0)}'"
                 )
+                return True
 
         return False
 
@@ -91,6 +91,7 @@ class CheckpointResumeMixin:
         - _save_checkpoint_file(): Save checkpoint to file
         - _build_empty_result(): Build empty result
         - _save_scored_paper(): Save scored paper to database
+        - _score_papers_distributed(): Score through the shared run work queue
         - _save_assessed_paper(): Save assessed paper to database
         - get_scored_papers(): Get scored papers from database
         - get_assessed_papers(): Get assessed papers from database
@@ -406,7 +407,7 @@ class CheckpointResumeMixin:
         paper_ids = checkpoint_data.get("paper_document_ids", [])
         if paper_ids:
             logger.info(f"Re-fetching {len(paper_ids)} papers from database...")
-            documents = fetch_documents_by_ids(set(paper_ids))
+            documents = fetch_documents_by_ids(set(paper_ids), compact=True)
 
             self._all_papers = []
             for doc in documents:
@@ -430,21 +431,28 @@ class CheckpointResumeMixin:
             paper_lookup = {p.document_id: p for p in self._all_papers}
             self._rejected_initial_filter = []
 
+            # Re-fetch papers missing from the lookup in one batch
+            missing_ids = {
+                item.get("document_id") for item in rejected_initial_data
+                if item.get("document_id") not in paper_lookup
+            }
+            if missing_ids:
+                try:
+                    for doc in fetch_documents_by_ids(missing_ids, compact=True):
+                        try:
+                            paper = PaperData.from_database_row(doc)
+                            paper_lookup[paper.document_id] = paper
+                        except Exception as e:
+                            logger.warning(f"Failed to restore rejected paper {doc.get('id')}: {e}")
+                except Exception as e:
+                    logger.warning(f"Failed to restore {len(missing_ids)} rejected papers: {e}")
+
             for item in rejected_initial_data:
                 doc_id = item.get("document_id")
                 reason = item.get("reason", "Unknown reason")
 
                 if doc_id in paper_lookup:
                     self._rejected_initial_filter.append((paper_lookup[doc_id], reason))
-                else:
-                    # Need to re-fetch this paper from database
-                    try:
-                        docs = fetch_documents_by_ids({doc_id})
-                        if docs:
-                            paper = PaperData.from_database_row(docs[0])
-                            self._rejected_initial_filter.append((paper, reason))
-                    except Exception as e:
-                        logger.warning(f"Failed to restore rejected paper {doc_id}: {e}")
 
             logger.info(f"Restored {len(self._rejected_initial_filter)} papers rejected in initial filter")
 
@@ -456,7 +464,7 @@ class CheckpointResumeMixin:
                 # Re-fetch papers if needed
                 paper_ids = checkpoint_data.get("paper_document_ids", [])
                 if paper_ids:
-                    documents = fetch_documents_by_ids(set(paper_ids))
+                    documents = fetch_documents_by_ids(set(paper_ids), compact=True)
                     self._all_papers = []
                     for doc in documents:
                         try:
@@ -1203,25 +1211,39 @@ class CheckpointResumeMixin:
             input_summary=f"Scoring {len(passed_filter)} papers for relevance",
             decision_rationale="Assessing relevance to research question using LLM",
         ) as timer:
-            # Get paper sources for scoring
-            paper_sources = {p.document_id: ["resumed"] for p in passed_filter}
-
-            scoring_result = scorer.score_batch(
-                papers=passed_filter,
-                evaluate_inclusion=True,
-                paper_sources=paper_sources,
-                save_callback=self._save_scored_paper,  # Save immediately after each paper
-            )
-            scored_papers = scoring_result.scored_papers
+            if self.config.distributed_scoring:
+                # Re-enqueue through the shared run queue; documents already
+                # evaluated before the interruption are skipped, and other
+                # workers can rejoin the run
+                distributed_result = self._score_papers_distributed(passed_filter, scorer)
+                scored_papers = self.get_scored_papers()
+                average_score = (
+                    sum(sp.relevance_score for sp in scored_papers) / len(scored_papers)
+                    if scored_papers else 0.0
+                )
+                failed_count = distributed_result.failed
+            else:
+                # Get paper sources for scoring
+                paper_sources = {p.document_id: ["resumed"] for p in passed_filter}
+
+                scoring_result = scorer.score_batch(
+                    papers=passed_filter,
+                    evaluate_inclusion=True,
+                    paper_sources=paper_sources,
+                    save_callback=self._save_scored_paper,  # Save immediately after each paper
+                )
+                scored_papers = scoring_result.scored_papers
+                average_score = scoring_result.average_score
+                failed_count = len(scoring_result.failed_papers)
 
             timer.set_output(
-                f"Scored {len(scoring_result.scored_papers)} papers, "
-                f"avg score: {scoring_result.average_score:.2f}"
+                f"Scored {len(scored_papers)} papers, "
+                f"avg score: {average_score:.2f}"
             )
             timer.add_metrics({
-                "papers_scored": len(scoring_result.scored_papers),
-                "average_score": round(scoring_result.average_score, 2),
-                "failed_scoring": len(scoring_result.failed_papers),
+                "papers_scored": len(scored_papers),
+                "average_score": round(average_score, 2),
+                "failed_scoring": failed_count,
             })
 
         # Apply relevance threshold
@@ -1245,7 +1267,7 @@ class CheckpointResumeMixin:
                 "total_scored": len(scored_papers),
                 "above_threshold": len(relevant_papers),
                 "below_threshold": len(below_threshold),
-                "average_score": scoring_result.average_score,
+                "average_score": average_score,
             },
             interactive=interactive,
             checkpoint_callback=checkpoint_callback,
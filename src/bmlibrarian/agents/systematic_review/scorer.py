@@ -45,6 +45,7 @@ from .config import (
     DEFAULT_BATCH_SIZE,
 )
 from .filters import InclusionEvaluator
+from ..utils.concurrency import DeferredCallbacks, ordered_concurrent_map
 
 if TYPE_CHECKING:
     from ..scoring_agent import DocumentScoringAgent
@@ -192,6 +193,7 @@ class RelevanceScorer:
         callback: Optional[Callable[[str, str], None]] = None,
         orchestrator: Optional["AgentOrchestrator"] = None,
         criteria: Optional[SearchCriteria] = None,
+        max_concurrent: Optional[int] = None,
     ) -> None:
         """
         Initialize the RelevanceScorer.
@@ -202,11 +204,14 @@ class RelevanceScorer:
             callback: Optional progress callback
             orchestrator: Optional orchestrator for queue-based processing
             criteria: Optional full search criteria for inclusion evaluation
+            max_concurrent: Papers scored in parallel by score_batch(); None
+                uses agents.scoring.max_concurrent_requests from config
         """
         self.research_question = research_question
         self.callback = callback
         self.orchestrator = orchestrator
         self.criteria = criteria
+        self.max_concurrent = max_concurrent
 
         # Load config
         self._config = config or get_systematic_review_config()
@@ -214,13 +219,16 @@ class RelevanceScorer:
         # Lazy-loaded scoring agent
         self._scoring_agent: Optional["DocumentScoringAgent"] = None
 
+        # Per-paper events of concurrent batches, replayed in input order
+        self._deferred_callbacks = DeferredCallbacks()
+
         # Optional inclusion evaluator
         self._inclusion_evaluator: Optional[InclusionEvaluator] = None
         if criteria:
             self._inclusion_evaluator = InclusionEvaluator(
                 criteria=criteria,
                 config=self._config,
-                callback=callback,
+                callback=self._call_callback,
             )
 
         logger.info(
@@ -230,7 +238,13 @@ class RelevanceScorer:
         )
 
     def _call_callback(self, event: str, data: str) -> None:
-        """Call progress callback if registered."""
+        """Call progress callback if registered.
+
+        Events raised while score_batch() workers score a paper are held
+        back and replayed on the calling thread in input order.
+        """
+        if self._deferred_callbacks.capture(event, data):
+            return
         if self.callback:
             try:
                 self.callback(event, data)
@@ -246,7 +260,7 @@ class RelevanceScorer:
         """
         if self._scoring_agent is None:
             from ..scoring_agent import DocumentScoringAgent
-            from ...config import get_model, get_ollama_host, get_agent_config
+            from ...config import get_model, get_ollama_host, get_ollama_hosts, get_agent_config
 
             # Use scoring agent model from config
             model = get_model("scoring_agent")
@@ -258,13 +272,23 @@ class RelevanceScorer:
                 host=host,
                 temperature=agent_config.get("temperature", 0.1),
                 top_p=agent_config.get("top_p", 0.9),
-                callback=self.callback,
+                callback=self._call_callback,
                 orchestrator=self.orchestrator,
                 show_model_info=False,
+                max_concurrent_requests=agent_config.get("max_concurrent_requests", 1),
+                ollama_hosts=get_ollama_hosts(),
             )
 
         return self._scoring_agent
 
+    def _get_max_concurrent(self) -> int:
+        """Get the number of papers to score in parallel."""
+        if self.max_concurrent is None:
+            from ...config import get_agent_config
+
+            self.max_concurrent = get_agent_config("scoring").get("max_concurrent_requests", 1)
+        return max(1, self.max_concurrent)
+
     # =========================================================================
     # Main Scoring Methods
     # =========================================================================
@@ -371,6 +395,10 @@ class RelevanceScorer:
         """
         Score a batch of papers for relevance.
 
+        Papers are scored concurrently (see ``max_concurrent``), but
+        results, callbacks and ``save_callback`` are handled on the calling
+        thread in input order, exactly as in sequential scoring.
+
         Args:
             papers: List of papers to score
             evaluate_inclusion: Whether to run inclusion/exclusion evaluation
@@ -394,9 +422,23 @@ class RelevanceScorer:
         failed_papers: List[Tuple[PaperData, str]] = []
         total_score = 0.0
 
-        for i, paper in enumerate(papers):
+        # Create the agent here rather than racing to lazily create it in workers
+        self._get_scoring_agent()
+
+        scorings = ordered_concurrent_map(
+            self._deferred_callbacks.wrap(
+                lambda paper: self.score_paper(paper, evaluate_inclusion)
+            ),
+            papers,
+            max_in_flight=self._get_max_concurrent(),
+            thread_name_prefix="relevance-scoring",
+        )
+        for i, (paper, (scored_paper, scoring_error, events), _) in enumerate(scorings):
+            for event, data in events:
+                self._call_callback(event, data)
             try:
-                scored_paper = self.score_paper(paper, evaluate_inclusion)
+                if scoring_error is not None:
+                    raise scoring_error
 
                 # Add source provenance if available
                 if paper_sources and paper.document_id in paper_sources:
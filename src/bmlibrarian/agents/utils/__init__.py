@@ -16,6 +16,9 @@ from .citation_validation import (
     assess_counter_evidence_strength
 )
 from .database_search import search_with_retry
+from .concurrency import DeferredCallbacks, ordered_concurrent_map
+from .keyword_matcher import KeywordMatcher
+from .passage_alignment import find_best_window
 
 __all__ = [
     'fix_tsquery_syntax',
@@ -24,5 +27,9 @@ __all__ = [
     'strip_preamble',
     'validate_citation_supports_counterfactual',
     'assess_counter_evidence_strength',
-    'search_with_retry'
+    'search_with_retry',
+    'ordered_concurrent_map',
+    'DeferredCallbacks',
+    'KeywordMatcher',
+    'find_best_window'
 ]
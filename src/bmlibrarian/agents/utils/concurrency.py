@@ -0,0 +1,122 @@
+"""
+Bounded-concurrency helpers for LLM-bound agent work.
+
+Local Ollama servers can serve several requests at once
+(``OLLAMA_NUM_PARALLEL``), so per-document LLM calls such as relevance
+scoring spend most of their time waiting when issued one at a time. These
+helpers keep a fixed number of calls in flight while handing results back
+in input order, so callers can keep their per-item callbacks and
+persistence logic on the calling thread.
+"""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_concurrent_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_in_flight: int,
+    thread_name_prefix: str = "agent-worker",
+) -> Iterator[Tuple[T, Optional[R], Optional[Exception]]]:
+    """Apply ``func`` to items with at most ``max_in_flight`` calls running.
+
+    Results are yielded in input order as ``(item, result, error)``; exactly
+    one of ``result``/``error`` is meaningful. An item whose call raised is
+    yielded with the exception instead of aborting the whole map. With
+    ``max_in_flight <= 1`` items are processed inline on the calling thread.
+
+    If the consumer stops iterating early, calls not yet started are
+    cancelled; calls already running finish in the background.
+
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+        max_in_flight: Maximum number of concurrent calls
+        thread_name_prefix: Prefix for worker thread names
+
+    Yields:
+        Tuples of (item, result, error) in input order
+    """
+    if max_in_flight <= 1:
+        for item in items:
+            try:
+                yield item, func(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_in_flight, thread_name_prefix=thread_name_prefix
+    )
+    pending: Deque[Tuple[T, Future]] = deque()
+    try:
+        for item in items:
+            pending.append((item, executor.submit(func, item)))
+            if len(pending) >= max_in_flight:
+                yield _resolve(*pending.popleft())
+        while pending:
+            yield _resolve(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _resolve(item: T, future: Future) -> Tuple[T, Optional[R], Optional[Exception]]:
+    """Wait for one call and convert its outcome to (item, result, error)."""
+    try:
+        return item, future.result(), None
+    except Exception as e:
+        return item, None, e
+
+
+class DeferredCallbacks:
+    """Hold back progress events raised inside ordered_concurrent_map workers.
+
+    Callbacks fired from worker threads would reach listeners (often GUI
+    code) off the calling thread and in completion order. A function wrapped
+    with :meth:`wrap` records the events routed through :meth:`capture` on
+    its own thread and returns them with its outcome, so the consumer can
+    replay them in input order on the calling thread.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def capture(self, event: str, data: str) -> bool:
+        """Record an event if the current thread is running a wrapped call.
+
+        Returns:
+            True if the event was recorded, False if it should be emitted now
+        """
+        events = getattr(self._local, "events", None)
+        if events is None:
+            return False
+        events.append((event, data))
+        return True
+
+    def wrap(
+        self, func: Callable[[T], R]
+    ) -> Callable[[T], Tuple[Optional[R], Optional[Exception], List[Tuple[str, str]]]]:
+        """Wrap ``func`` to return ``(result, error, events)`` instead of raising."""
+
+        def run(item: T) -> Tuple[Optional[R], Optional[Exception], List[Tuple[str, str]]]:
+            events: List[Tuple[str, str]] = []
+            self._local.events = events
+            try:
+                return func(item), None, events
+            except Exception as e:
+                return None, e, events
+            finally:
+                self._local.events = None
+
+        return run
@@ -142,7 +142,8 @@ def embed_documents(
     """
     Generate embeddings for multiple documents.
 
-    Uses the shared LLM abstraction's embed() method for vector generation.
+    Uses the shared LLM abstraction's embed_batch() method, so all
+    documents are embedded in a single provider round trip.
 
     Args:
         documents: List of text documents to embed
@@ -160,28 +161,24 @@ def embed_documents(
     if callback:
         callback("hyde_embedding", f"Generating embeddings for {len(documents)} documents...")
 
-    embeddings = []
+    try:
+        response = client.embed_batch(documents, model=embedding_model)
+    except Exception as e:
+        logger.error(f"Failed to embed {len(documents)} documents: {e}")
+        raise ConnectionError(f"Failed to generate embedding: {e}")
 
-    for i, doc in enumerate(documents):
-        try:
-            response = client.embed(
-                text=doc,
-                model=embedding_model,
-            )
-
-            embedding = response.embedding
-            if not embedding:
-                raise ValueError(f"Empty embedding for document {i+1}")
-
-            embeddings.append(embedding)
-            logger.info(f"Generated embedding {i+1}/{len(documents)} (dim={len(embedding)})")
-
-            if callback:
-                callback("hyde_embedding", f"Embedded document {i+1}/{len(documents)}")
+    embeddings = response.embeddings
+    for i, embedding in enumerate(embeddings):
+        if not embedding:
+            logger.error(f"Empty embedding for document {i+1}")
+            raise ConnectionError(f"Failed to generate embedding: Empty embedding for document {i+1}")
 
-        except Exception as e:
-            logger.error(f"Failed to embed document {i+1}: {e}")
-            raise ConnectionError(f"Failed to generate embedding: {e}")
+    logger.info(
+        f"Generated {len(embeddings)} embeddings in one batch "
+        f"(dim={len(embeddings[0]) if embeddings else 0})"
+    )
+    if callback:
+        callback("hyde_embedding", f"Embedded {len(embeddings)} documents")
 
     return embeddings
 
@@ -227,6 +224,38 @@ def search_with_embedding(
     return results
 
 
+def search_with_embeddings(
+    embeddings: List[List[float]],
+    max_results: int
+) -> List[List[Tuple[int, str, float]]]:
+    """
+    Search database with several embedding vectors in one statement.
+
+    Batched counterpart of search_with_embedding(), via the database
+    manager's search_by_embeddings().
+
+    Args:
+        embeddings: The query embedding vectors
+        max_results: Maximum number of results per vector
+
+    Returns:
+        One list of (document_id, title, similarity_score) tuples per
+        embedding, in input order
+    """
+    from ...database import search_by_embeddings
+
+    results_lists = search_by_embeddings(
+        embeddings=embeddings,
+        max_results=max_results,
+        model_id=DEFAULT_EMBEDDING_MODEL_ID  # snowflake-arctic-embed2:latest
+    )
+
+    return [
+        [(doc['id'], doc['title'], doc['similarity']) for doc in results_dicts]
+        for results_dicts in results_lists
+    ]
+
+
 def reciprocal_rank_fusion(
     ranked_lists: List[List[Tuple[int, str, float]]],
     k: int = DEFAULT_RRF_K
@@ -283,8 +312,8 @@ def hyde_search(
 
     Main entry point for HyDE search. Orchestrates the full pipeline:
     1. Generate hypothetical documents (via the LLM abstraction)
-    2. Embed hypothetical documents (via the LLM abstraction)
-    3. Search with each embedding (via database manager)
+    2. Embed hypothetical documents in one batch (via the LLM abstraction)
+    3. Search with all embeddings in one statement (via database manager)
     4. Fuse results using RRF
     5. Filter by similarity threshold
 
@@ -327,7 +356,7 @@ def hyde_search(
         callback=callback
     )
 
-    # Step 2: Generate embeddings for hypothetical documents (ollama library)
+    # Step 2: Embed all hypothetical documents in one batch request
     logger.info(f"Generating embeddings for {len(hypothetical_docs)} documents...")
     embeddings = embed_documents(
         documents=hypothetical_docs,
@@ -336,18 +365,16 @@ def hyde_search(
         callback=callback
     )
 
-    # Step 3: Search with each embedding (database manager)
+    # Step 3: Search with every embedding in a single statement (database manager)
     logger.info(f"Searching database with {len(embeddings)} embeddings...")
     if callback:
         callback("hyde_search", f"Searching with {len(embeddings)} embeddings...")
 
-    all_results = []
-    for i, embedding in enumerate(embeddings):
-        results = search_with_embedding(
-            embedding=embedding,
-            max_results=max_results
-        )
-        all_results.append(results)
+    all_results = search_with_embeddings(
+        embeddings=embeddings,
+        max_results=max_results
+    )
+    for i, results in enumerate(all_results):
         logger.info(f"Search {i+1}/{len(embeddings)}: found {len(results)} documents")
 
     # Step 4: Fuse results using RRF
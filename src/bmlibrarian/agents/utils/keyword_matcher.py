@@ -0,0 +1,161 @@
+"""
+Single-pass matching of a fixed keyword set.
+
+Heuristic filters ask "which of these N keywords occur in this text, and
+where?" once per paper. Testing each keyword with ``in`` (or a regex per
+keyword) rescans the text N times. ``KeywordMatcher`` compiles the keyword
+set once into a trie-shaped regex (common prefixes factored out, so the
+engine never backtracks across keywords). One left-to-right scan finds
+every keyword occurrence, including overlapping ones: after a hit the scan
+resumes one character past the hit's start rather than past its end.
+
+At each position the trie regex matches the longest keyword starting
+there; shorter keywords that are prefixes of it are reported from a table
+precomputed at build time. Matching is literal and case-sensitive:
+callers lowercase keywords and text themselves, as the substring checks
+this replaces did.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+# Trie node key marking the end of a keyword
+_END = ""
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, dict]:
+    """Build a character trie of the keywords."""
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[_END] = {}
+    return root
+
+
+def _trie_to_regex(node: Dict[str, dict]) -> str:
+    """
+    Render a trie node as a regex matching the longest keyword from it.
+
+    Branches start with distinct characters, so there is at most one viable
+    branch at each step; a keyword ending inside a longer one becomes a
+    greedy optional group, which prefers the longer keyword.
+    """
+    branches = [
+        re.escape(char) + _trie_to_regex(child)
+        for char, child in sorted(node.items())
+        if char != _END
+    ]
+    if not branches:
+        return ""
+    if _END in node:
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class KeywordMatcher:
+    """
+    Pre-compiled matcher finding all occurrences of a keyword set in one pass.
+
+    Build once per keyword set (e.g. per SearchCriteria) and reuse for every
+    text. Instances are immutable and picklable.
+
+    Attributes:
+        keywords: The (deduplicated, sorted) keywords matched
+
+    Example:
+        >>> matcher = KeywordMatcher(["case report", "case reports", "rat model"])
+        >>> matcher.find_all("two case reports and a rat model")
+        {'case reports': [4], 'case report': [4], 'rat model': [23]}
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        """
+        Compile the matcher.
+
+        Args:
+            keywords: Keywords to match literally; empty strings are ignored
+        """
+        self.keywords: Tuple[str, ...] = tuple(sorted({kw for kw in keywords if kw}))
+
+        # For each keyword, itself and every other keyword that is a prefix
+        # of it, longest first: all of them occur wherever it occurs
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            keyword: tuple(sorted(
+                (other for other in self.keywords if keyword.startswith(other)),
+                key=len,
+                reverse=True,
+            ))
+            for keyword in self.keywords
+        }
+
+        self._pattern: Optional[Pattern[str]] = None
+        if self.keywords:
+            self._pattern = re.compile(_trie_to_regex(_build_trie(self.keywords)))
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords)"
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield every keyword occurrence in the text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start, keyword) tuples ordered by start; at the same start,
+            longer keywords come first
+        """
+        if self._pattern is None:
+            return
+        search = self._pattern.search
+        prefixes = self._prefixes
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            for keyword in prefixes[match.group()]:
+                yield start, keyword
+            match = search(text, start + 1)
+
+    def find_all(self, text: str) -> Dict[str, List[int]]:
+        """
+        Map each keyword present in the text to its start positions.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Dict of keyword -> ascending start positions, in order of each
+            keyword's first occurrence (empty if none match)
+        """
+        hits: Dict[str, List[int]] = {}
+        for start, keyword in self.finditer(text):
+            hits.setdefault(keyword, []).append(start)
+        return hits
+
+    def search(self, text: str) -> Optional[Tuple[int, str]]:
+        """
+        Find the first keyword occurrence in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (start, keyword) of the leftmost (then longest) occurrence, or None
+        """
+        if self._pattern is None:
+            return None
+        match = self._pattern.search(text)
+        if match is None:
+            return None
+        return match.start(), match.group()
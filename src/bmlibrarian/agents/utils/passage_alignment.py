@@ -0,0 +1,170 @@
+"""
+Fuzzy alignment of a quoted passage against its source text.
+
+Citation validation looks for the window of the source (±20% of the
+passage length) with the highest ``difflib.SequenceMatcher`` ratio. Scoring
+every window is O(window lengths x offsets) SequenceMatcher runs, which is
+seconds of CPU per citation on a normal abstract.
+
+``find_best_window`` returns exactly the window an exhaustive scan would
+pick, but only scores windows that could win. It uses the character-multiset
+bound behind ``SequenceMatcher.quick_ratio()``: matching blocks pair equal
+characters, so ``ratio() <= 2 * |chars(a) & chars(b)| / (len(a) + len(b))``.
+Window character counts come from per-character prefix sums (numpy). Then:
+
+1. Offsets whose widest window cannot reach ``min_similarity`` are dropped.
+2. The remaining windows are scored best-bound-first. The search stops once
+   no unscored window's bound can beat (or tie) the best ratio found.
+
+Ties keep the exhaustive scan's choice: the shortest window, then the
+leftmost offset.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Window lengths scanned, relative to the passage length
+WINDOW_MIN_RATIO = 0.8
+WINDOW_MAX_RATIO = 1.2
+
+# Windows always scored, even if none can reach min_similarity, so a
+# rejected passage still reports a meaningful best similarity
+MIN_SCORED_WINDOWS = 16
+
+
+@dataclass
+class WindowMatch:
+    """Best-matching window of a normalized source text.
+
+    Attributes:
+        score: SequenceMatcher ratio of the passage against the window
+        start: Window start offset in the normalized text
+        length: Window length in characters
+        windows_scored: Number of SequenceMatcher ratios computed
+    """
+    score: float
+    start: int
+    length: int
+    windows_scored: int = 0
+
+
+def window_length_range(passage_len: int) -> range:
+    """Return the window lengths scanned for a passage of ``passage_len`` chars."""
+    return range(int(passage_len * WINDOW_MIN_RATIO), int(passage_len * WINDOW_MAX_RATIO) + 1)
+
+
+def normalized_offsets(text: str) -> List[int]:
+    """Map each character of ``' '.join(text.lower().split())`` to ``text``.
+
+    Entry k is the offset in ``text`` of normalized character k. A joining
+    space maps to the whitespace just before the next word. The map lets a
+    match in normalized text be located in the original in O(1).
+    """
+    offsets: List[int] = []
+    for word in re.finditer(r"\S+", text):
+        if offsets:
+            offsets.append(word.start() - 1)
+        # lower() can lengthen a word (e.g. 'İ'); clamp to the word's end
+        last = word.end() - 1
+        offsets.extend(min(word.start() + k, last) for k in range(len(word.group().lower())))
+    return offsets
+
+
+def exhaustive_best_window(passage: str, text: str) -> WindowMatch:
+    """Score every window with SequenceMatcher (reference implementation).
+
+    Args:
+        passage: Normalized passage
+        text: Normalized source text
+
+    Returns:
+        The first window (by length, then offset) with the highest ratio
+    """
+    best = WindowMatch(score=0.0, start=0, length=len(passage))
+    for window_len in window_length_range(len(passage)):
+        if window_len > len(text):
+            continue
+        for i in range(len(text) - window_len + 1):
+            best.windows_scored += 1
+            similarity = SequenceMatcher(None, passage, text[i:i + window_len]).ratio()
+            if similarity > best.score:
+                best.score, best.start, best.length = similarity, i, window_len
+    return best
+
+
+def find_best_window(passage: str, text: str, min_similarity: float) -> WindowMatch:
+    """Find the window of ``text`` most similar to ``passage``.
+
+    Returns the same window and score as :func:`exhaustive_best_window`
+    whenever that score is at least ``min_similarity``. Below the threshold
+    the windows that could not reach it are skipped, so ``score`` is the best
+    of the windows actually scored (a lower bound on the exhaustive score).
+
+    Args:
+        passage: Normalized passage
+        text: Normalized source text
+        min_similarity: Score needed for the match to be usable
+
+    Returns:
+        WindowMatch for the best window found
+    """
+    passage_len = len(passage)
+    lengths = np.array(
+        [w for w in window_length_range(passage_len) if w <= len(text)], dtype=np.int64
+    )
+    best = WindowMatch(score=0.0, start=0, length=passage_len)
+    if lengths.size == 0:
+        return best
+
+    text_codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    chars, char_counts = np.unique(
+        np.frombuffer(passage.encode("utf-32-le"), dtype=np.uint32), return_counts=True
+    )
+    # prefix[c, k] = occurrences of chars[c] in text[:k]
+    prefix = np.zeros((chars.size, text_codes.size + 1), dtype=np.int32)
+    np.cumsum(text_codes[None, :] == chars[:, None], axis=1, out=prefix[:, 1:])
+    caps = char_counts[:, None]
+
+    # Stage 1: a window's shared-character count never exceeds that of the
+    # widest window at the same offset, so bound each offset once.
+    max_len, min_len = int(lengths[-1]), int(lengths[0])
+    offsets = np.arange(text_codes.size - min_len + 1)
+    ends = np.minimum(offsets + max_len, text_codes.size)
+    widest_shared = np.minimum(prefix[:, ends] - prefix[:, offsets], caps).sum(axis=0)
+    offset_bound = 2.0 * widest_shared / (passage_len + min_len)
+    keep = offset_bound >= min_similarity
+    if keep.sum() < MIN_SCORED_WINDOWS:
+        keep[np.argsort(-offset_bound, kind="stable")[:MIN_SCORED_WINDOWS]] = True
+    offsets = offsets[keep]
+
+    # Stage 2: exact multiset bound for every (offset, length) still in play
+    starts = np.repeat(offsets, lengths.size)
+    widths = np.tile(lengths, offsets.size)
+    valid = starts + widths <= text_codes.size
+    starts, widths = starts[valid], widths[valid]
+    shared = np.minimum(prefix[:, starts + widths] - prefix[:, starts], caps).sum(axis=0)
+    bounds = 2.0 * shared / (passage_len + widths)
+
+    best_key = None
+    for index in np.argsort(-bounds, kind="stable"):
+        bound = bounds[index]
+        if best.windows_scored >= MIN_SCORED_WINDOWS and (
+            bound < best.score or bound < min_similarity
+        ):
+            break
+        start, width = int(starts[index]), int(widths[index])
+        best.windows_scored += 1
+        similarity = SequenceMatcher(None, passage, text[start:start + width]).ratio()
+        key = (width, start)
+        if similarity > best.score or (similarity == best.score and best_key is not None and key < best_key):
+            best.score, best.start, best.length = similarity, start, width
+            best_key = key
+
+    return best
@@ -319,7 +319,8 @@ DEFAULT_CONFIG = {
     "ollama": {
         "host": "http://localhost:11434",
         "timeout": 120,
-        "max_retries": 3
+        "max_retries": 3,
+        "hosts": []  # Additional hosts; concurrent batch scoring round-robins across host + hosts
     },
     "agents": {
         "counterfactual": {
@@ -332,7 +333,8 @@ DEFAULT_CONFIG = {
             "temperature": 0.1,
             "top_p": 0.9,
             "max_tokens": 300,
-            "min_relevance_score": 3
+            "min_relevance_score": 3,
+            "max_concurrent_requests": 1  # Documents scored in parallel (match OLLAMA_NUM_PARALLEL x hosts)
         },
         "query": {
             "temperature": 0.1,
@@ -353,7 +355,8 @@ DEFAULT_CONFIG = {
             "map_reduce_citation_threshold": 15,  # Use map-reduce above this many citations
             "map_batch_size": 8,  # Citations per batch in map phase
             "effective_context_limit": 6000,  # Estimated token limit for citations
-            "map_passage_max_length": 500  # Max chars per passage in map phase (prevents context overflow)
+            "map_passage_max_length": 500,  # Max chars per passage in map phase (prevents context overflow)
+            "map_max_concurrent": 1  # Map-phase batches summarized in parallel (match OLLAMA_NUM_PARALLEL)
         },
         "editor": {
             "temperature": 0.1,
@@ -405,6 +408,8 @@ DEFAULT_CONFIG = {
             "top_p": 0.9,
             "max_tokens": 3000,
             "version": "1.0.0",  # Increment when methodology changes
+            "max_concurrent_dimensions": 4,  # Independent dimensions assessed at once per paper
+            "max_concurrent_papers": 1,  # Papers in the LLM stage at once in batch mode (match OLLAMA_NUM_PARALLEL)
             "dimension_weights": {
                 "study_design": 0.25,
                 "sample_size": 0.15,
@@ -484,7 +489,11 @@ DEFAULT_CONFIG = {
                 "semantic_limit": 50,  # Maximum documents from semantic search
                 "hyde_limit": 50,  # Maximum documents from HyDE search
                 "keyword_limit": 50,  # Maximum documents from keyword search
-                "max_deduplicated": 100  # Maximum unique documents after deduplication
+                "max_deduplicated": 100,  # Maximum unique documents after deduplication
+                "parallel_strategies": True  # Run semantic, HyDE and keyword searches concurrently
+            },
+            "batch": {
+                "max_concurrent_abstracts": 1  # Abstracts checked at once in batch mode
             },
             "citation": {
                 "min_score": 3,  # Minimum score for citation extraction
@@ -575,6 +584,10 @@ DEFAULT_CONFIG = {
             "num_hypothetical_docs": 3,  # Number of hypothetical documents to generate
             "similarity_threshold": 0.7   # Cosine similarity threshold (0-1)
         },
+        "execution": {
+            "parallel": True,  # Run enabled strategies concurrently
+            "strategy_timeout_seconds": 60.0  # Drop strategies slower than this (partial results)
+        },
         "reranking": {
             # Re-ranking method for combining results from multiple strategies
             "method": "sum_scores",  # Options: sum_scores, rrf, max_score, weighted
@@ -615,7 +628,23 @@ DEFAULT_CONFIG = {
         "chunk_overlap": 100,  # Overlap between chunks
         "batch_size": 32,  # Batch size for embedding generation
         "n_ctx": 8192,  # Context window size (for llama_cpp backend)
-        "device": "auto"  # Device for sentence_transformers: "auto", "cpu", "cuda", "mps"
+        "device": "auto",  # Device for sentence_transformers: "auto", "cpu", "cuda", "mps"
+        # Persistent on-disk cache of vectors keyed by (model, normalized text hash)
+        "cache_enabled": False,
+        "cache_path": "",  # Empty uses ~/.bmlibrarian/embedding_cache.sqlite
+        "cache_max_entries": 250000,  # LRU bound on cached vectors
+        "cache_max_mb": 1024  # LRU bound on total vector bytes
+    },
+    "llm_cache": {
+        # Replay identical LLM requests (model, messages, options) from a cache.
+        # Opt-in per agent: only agent types listed in "agents" use it, so
+        # agents that rely on sampling at temperature > 0 are unaffected.
+        "enabled": False,
+        "backend": "sqlite",  # Options: "memory", "sqlite", "postgres" (table from migration 031)
+        "path": "",  # SQLite file; empty uses ~/.bmlibrarian/llm_response_cache.sqlite
+        "ttl_seconds": 604800,  # Entry lifetime (7 days); 0 = never expire
+        "max_entries": 100000,  # LRU bound (memory and sqlite backends)
+        "agents": []  # Agent types to cache, e.g. ["document_scoring_agent"]
     }
 }
 
@@ -1154,6 +1183,12 @@ def get_ollama_host() -> str:
     """Get Ollama host URL."""
     return get_config().get_ollama_config()["host"]
 
+def get_ollama_hosts() -> List[str]:
+    """Get all Ollama host URLs: the primary host followed by any extra 'hosts'."""
+    ollama_config = get_config().get_ollama_config()
+    hosts = [ollama_config["host"]] + list(ollama_config.get("hosts") or [])
+    return list(dict.fromkeys(hosts))
+
 def get_search_config() -> Dict[str, Any]:
     """Get search configuration."""
     return get_config().get_search_config()
@@ -1348,6 +1383,10 @@ def get_embeddings_config() -> Dict[str, Any]:
         - batch_size (int): Batch size for embedding generation
         - n_ctx (int): Context window size (for llama_cpp)
         - device (str): Device for sentence_transformers ("auto", "cpu", "cuda", "mps")
+        - cache_enabled (bool): Cache vectors on disk across runs
+        - cache_path (str): Cache database file (empty for the default location)
+        - cache_max_entries (int): Maximum cached vectors before LRU eviction
+        - cache_max_mb (int): Maximum cached vector megabytes before LRU eviction
     """
     return get_config().get("embeddings", DEFAULT_CONFIG["embeddings"])
 
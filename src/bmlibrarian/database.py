@@ -1,10 +1,13 @@
 """Database access layer for BMLibrarian with connection pooling."""
 
 import os
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from contextlib import contextmanager
-from typing import Dict, Generator, Optional, List, Tuple, Union, cast, LiteralString, Any
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, Optional, List, Tuple, Union, cast, LiteralString, Any
 from datetime import date
 
 import psycopg
@@ -14,6 +17,7 @@ from dotenv import load_dotenv
 from pathlib import Path
 
 from bmlibrarian.db_conninfo import build_conninfo
+from bmlibrarian.db_vector import vector_param
 
 # Load environment variables from .env file
 # Check ~/.bmlibrarian/.env first (primary user configuration location),
@@ -351,6 +355,109 @@ def build_pagination_clause(max_rows: int, offset: int) -> Tuple[str, List[int]]
     return clause, params
 
 
+@dataclass(frozen=True)
+class SearchPosition:
+    """
+    Keyset position of a row in find_abstracts() result order.
+
+    Pass the position of the last row of a page as ``after=`` to get the
+    next page. The database seeks past it instead of scanning and
+    discarding ``OFFSET`` rows, so page 1000 costs the same as page 2.
+
+    Attributes:
+        document_id: ID of the last row seen (final tie-breaker)
+        publication_date: Its publication date (None sorts last)
+        rank_score: Its rank_score (only for use_ranking=True searches)
+    """
+
+    document_id: int
+    publication_date: Optional[date] = None
+    rank_score: Optional[float] = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "SearchPosition":
+        """Build the position of a row yielded by find_abstracts()."""
+        pub_date = row.get('publication_date')
+        if isinstance(pub_date, str):
+            pub_date = date.fromisoformat(pub_date[:10])
+        rank_score = row.get('rank_score')
+        return cls(
+            document_id=int(row['id']),
+            publication_date=pub_date,
+            rank_score=float(rank_score) if rank_score is not None else None,
+        )
+
+    def to_token(self) -> str:
+        """Encode as an opaque page token (e.g. for a CLI ``--after`` option)."""
+        rank = '' if self.rank_score is None else repr(self.rank_score)
+        pub_date = '' if self.publication_date is None else self.publication_date.isoformat()
+        return f"{rank}|{pub_date}|{self.document_id}"
+
+    @classmethod
+    def from_token(cls, token: str) -> "SearchPosition":
+        """
+        Decode a page token produced by to_token().
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            rank, pub_date, document_id = token.split('|')
+            return cls(
+                document_id=int(document_id),
+                publication_date=date.fromisoformat(pub_date) if pub_date else None,
+                rank_score=float(rank) if rank else None,
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid search page token: {token!r}") from e
+
+
+def build_keyset_clause(
+    after: SearchPosition,
+    rank_expression: Optional[str] = None,
+    rank_param: Any = None,
+) -> Tuple[str, List[Any]]:
+    """Build the ``AND ...`` filter selecting rows after a keyset position.
+
+    Mirrors the find_abstracts() sort order: rank_score DESC (when ranking),
+    then publication_date DESC NULLS LAST, then id ASC.
+
+    Args:
+        after: Position of the last row already returned
+        rank_expression: SQL for the rank (containing one ``%s``) when
+            results are ordered by rank; None otherwise
+        rank_param: Value bound to the ``%s`` in ``rank_expression``
+
+    Returns:
+        A ``(clause, params)`` tuple; ``params`` are in placeholder order
+
+    Raises:
+        ValueError: If ranking is requested but the position has no rank
+    """
+    if after.publication_date is not None:
+        date_clause = (
+            "(d.publication_date < %s"
+            " OR (d.publication_date = %s AND d.id > %s)"
+            " OR d.publication_date IS NULL)"
+        )
+        date_params: List[Any] = [after.publication_date, after.publication_date, after.document_id]
+    else:
+        date_clause = "(d.publication_date IS NULL AND d.id > %s)"
+        date_params = [after.document_id]
+
+    if rank_expression is None:
+        return f"AND {date_clause}", date_params
+
+    if after.rank_score is None:
+        raise ValueError("Keyset position for a ranked search must include rank_score")
+    # rank_score is float4; compare as float4 so the boundary row matches exactly
+    clause = (
+        f"AND ({rank_expression} < %s::real"
+        f" OR ({rank_expression} = %s::real AND {date_clause}))"
+    )
+    return clause, [rank_param, after.rank_score, rank_param, after.rank_score] + date_params
+
+
 def find_abstracts(
     ts_query_str: str,
     max_rows: int = 100,
@@ -362,10 +469,20 @@ def find_abstracts(
     to_date: Optional[date] = None,
     batch_size: int = 50,
     use_ranking: bool = False,
-    offset: int = 0
+    offset: int = 0,
+    stream: bool = False,
+    after: Optional[SearchPosition] = None,
+    rank_top_k: bool = False
 ) -> Generator[Dict, None, None]:
     """
     Find documents using PostgreSQL text search with optional date and source filtering.
+
+    With ``stream=True`` rows are read through a named server-side cursor
+    ``batch_size`` rows at a time. The server then prefers plans that
+    return the first rows quickly (e.g. walking the publication_date index)
+    instead of materializing the full result, so the first document arrives
+    before the query has finished. Deep pages should use ``after=`` (keyset
+    pagination) rather than ``offset``.
     
     Args:
         ts_query_str: Text search query string
@@ -379,6 +496,12 @@ def find_abstracts(
         batch_size: Number of rows to fetch in each database round trip (default: 50)
         use_ranking: If True, calculate and order by relevance ranking (default: False for speed)
         offset: Number of rows to skip before returning results (default: 0)
+        stream: If True, read rows through a server-side cursor (default: False)
+        after: Keyset position (SearchPosition.from_row(last_row)) to continue
+            after; same order as offset paging but without scanning skipped rows
+        rank_top_k: With use_ranking and max_rows > 0, rank and cut to
+            max_rows on (id, rank) pairs first and read full rows only for the
+            winners, instead of sorting every matching full row (default: False)
         
     Yields:
         Dict containing document information with keys:
@@ -408,6 +531,12 @@ def find_abstracts(
         >>> from datetime import date
         >>> for doc in find_abstracts("covid", from_date=date(2020, 1, 1), to_date=date(2021, 12, 31)):
         ...     print(f"{doc['title']} - {doc['publication_date']}")
+
+        Streaming keyset pages:
+        >>> page = list(find_abstracts("covid", max_rows=50, stream=True))
+        >>> next_page = list(find_abstracts(
+        ...     "covid", max_rows=50, stream=True, after=SearchPosition.from_row(page[-1])
+        ... ))
     """
     # Log query start
     start_time = time.time()
@@ -431,7 +560,10 @@ def find_abstracts(
         'from_date': from_date.isoformat() if from_date else None,
         'to_date': to_date.isoformat() if to_date else None,
         'batch_size': batch_size,
-        'use_ranking': use_ranking
+        'use_ranking': use_ranking,
+        'stream': stream,
+        'after': after.to_token() if after else None,
+        'rank_top_k': rank_top_k
     }
     
     logger.debug(f"Search parameters", extra={'structured_data': {
@@ -491,15 +623,39 @@ def find_abstracts(
         source_id_placeholders = ','.join(['%s'] * len(source_ids))
         source_filter = f"AND d.source_id IN ({source_id_placeholders})"
     
+    # Keyset pagination: seek past the last row of the previous page
+    rank_expression = f"ts_rank_cd(d.search_vector, {tsquery_func}('english', %s))"
+    keyset_filter = ""
+    keyset_params: List[Any] = []
+    if after is not None:
+        if use_ranking:
+            keyset_filter, keyset_params = build_keyset_clause(after, rank_expression, ts_query_str)
+        else:
+            keyset_filter, keyset_params = build_keyset_clause(after)
+
     # Build query with optional ranking
     # IMPORTANT: Always include d.id in ORDER BY to ensure stable ordering for OFFSET
-    if use_ranking:
+    use_top_k = use_ranking and rank_top_k and max_rows > 0
+    if use_top_k:
+        # Rank only (id, date, rank) tuples, cut to max_rows, then read the
+        # full rows of the winners; the LIMIT applies inside the subquery.
+        ranked_query = f"""
+        SELECT d.id, d.publication_date, {rank_expression} AS rank_score
+        FROM document d
+        WHERE d.search_vector @@ {tsquery_func}('english', %s)
+        {source_filter}
+        {date_filter}
+        {keyset_filter}
+        ORDER BY rank_score DESC, d.publication_date DESC NULLS LAST, d.id ASC
+        """
+    elif use_ranking:
         base_query = f"""
-        SELECT d.*, ts_rank_cd(d.search_vector, {tsquery_func}('english', %s)) AS rank_score
+        SELECT d.*, {rank_expression} AS rank_score
         FROM document d
         WHERE d.search_vector @@ {tsquery_func}('english', %s)
         {source_filter}
         {date_filter}
+        {keyset_filter}
         ORDER BY rank_score DESC, d.publication_date DESC NULLS LAST, d.id ASC
         """
     else:
@@ -509,12 +665,21 @@ def find_abstracts(
         WHERE d.search_vector @@ {tsquery_func}('english', %s)
         {source_filter}
         {date_filter}
+        {keyset_filter}
         ORDER BY d.publication_date DESC NULLS LAST, d.id ASC
         """
     
     # Add limit and offset as bound parameters (never interpolate into SQL).
     pagination_clause, pagination_params = build_pagination_clause(max_rows, offset)
-    query = base_query + pagination_clause
+    if use_top_k:
+        query = f"""
+        SELECT d.*, r.rank_score
+        FROM ({ranked_query}{pagination_clause}) r
+        JOIN document d ON d.id = r.id
+        ORDER BY r.rank_score DESC, r.publication_date DESC NULLS LAST, r.id ASC
+        """
+    else:
+        query = base_query + pagination_clause
     
     # Prepare query parameters based on ranking and filtering. Heterogeneous
     # (tsquery strings, source ids, dates, pagination ints) — bound positionally.
@@ -532,9 +697,9 @@ def find_abstracts(
         else:
             query_params = [ts_query_str] + source_ids + date_params
 
-    # LIMIT/OFFSET placeholders come last in the SQL, so their bound values go
-    # at the end of the positional parameter list.
-    query_params = query_params + pagination_params
+    # Keyset then LIMIT/OFFSET placeholders come last in the SQL, so their
+    # bound values go at the end of the positional parameter list.
+    query_params = query_params + keyset_params + pagination_params
 
     # Log the final query and parameters
     logger.info(f"Executing database query", extra={'structured_data': {
@@ -549,9 +714,15 @@ def find_abstracts(
     total_rows = 0
     
     with db_manager.get_connection() as conn:
-        with conn.cursor(row_factory=dict_row) as cur:
+        # A named cursor lives on the server: rows are fetched batch_size at a
+        # time and the planner favours fast-start plans (cursor_tuple_fraction).
+        # Rows are not kept for the debug results log in this mode.
+        cursor_name = "find_abstracts_stream" if stream else ""
+        with conn.cursor(name=cursor_name, row_factory=dict_row) as cur:
             # Set cursor arraysize for efficient batching
             cur.arraysize = batch_size
+            if stream:
+                cur.itersize = batch_size
             
             # Execute the query with parameters
             query_start = time.time()
@@ -610,7 +781,8 @@ def find_abstracts(
                                 row[field] = str(row[field])
                     
                     row_dict = dict(row)
-                    all_results.append(row_dict)  # Store for logging
+                    if not stream:
+                        all_results.append(row_dict)  # Store for logging
                     total_rows += 1
                     
                     yield row_dict
@@ -745,20 +917,28 @@ def find_abstract_ids(
 
 def fetch_documents_by_ids(
     document_ids: set[int],
-    batch_size: int = 50
+    batch_size: int = 50,
+    compact: bool = False,
 ) -> list[Dict[str, Any]]:
     """
     Fetch full document details for given IDs.
 
     Designed for multi-query workflows: collect IDs from multiple queries,
-    de-duplicate them, then fetch full documents once.
+    de-duplicate them, then fetch full documents once. Rows come from the
+    shared DocumentFetcher (see bmlibrarian.db_documents): all batches go to
+    the server in one pipelined round trip, and recently fetched rows are
+    served from a process-local cache while their updated_date is unchanged.
 
     Args:
         document_ids: Set of document IDs to fetch
-        batch_size: Number of documents per database query (prevents param limits)
+        batch_size: Number of ids per ``= ANY(%s)`` statement
+        compact: Return read-only DocumentRow mappings instead of dict
+            copies. Use for read-only callers; mutate-and-pass-on callers
+            should keep the default.
 
     Returns:
-        List of document dictionaries (same format as find_abstracts)
+        List of document dictionaries (same format as find_abstracts),
+        newest publication first
 
     Example:
         >>> ids = {123, 456, 789}
@@ -770,40 +950,23 @@ def fetch_documents_by_ids(
         logger.debug("No document IDs provided, returning empty list")
         return []
 
-    logger.info(f"Fetching {len(document_ids)} documents in batches of {batch_size}")
+    from bmlibrarian.db_documents import get_document_fetcher
 
-    db_manager = get_db_manager()
-    documents = []
-
-    # Convert set to list for batching
-    id_list = list(document_ids)
-
-    # Fetch in batches to avoid PostgreSQL parameter limits
-    for i in range(0, len(id_list), batch_size):
-        batch_ids = id_list[i:i + batch_size]
-
-        logger.debug(f"Fetching batch {i // batch_size + 1}: {len(batch_ids)} documents")
-
-        # Simple query - authors are stored as text array in document table
-        sql = """
-            SELECT
-                d.*,
-                s.name as source_name
-            FROM document d
-            LEFT JOIN sources s ON d.source_id = s.id
-            WHERE d.id = ANY(%s)
-            ORDER BY d.publication_date DESC NULLS LAST
-        """
+    logger.info(f"Fetching {len(document_ids)} documents")
 
-        with db_manager.get_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cur:
-                cur.execute(sql, [batch_ids])
-                batch_docs = cur.fetchall()
-                documents.extend(batch_docs)
+    rows = list(get_document_fetcher().fetch_rows(document_ids, chunk_size=batch_size).values())
 
-    logger.info(f"Fetched {len(documents)} documents")
+    # Same order as the former ORDER BY publication_date DESC NULLS LAST
+    dated = [row for row in rows if row.get('publication_date') is not None]
+    undated = [row for row in rows if row.get('publication_date') is None]
+    dated.sort(key=lambda row: row['publication_date'], reverse=True)
+    rows = dated + undated
 
-    return documents
+    logger.info(f"Fetched {len(rows)} documents")
+
+    if compact:
+        return rows
+    return [row.to_dict() for row in rows]
 
 
 def search_by_embedding(
@@ -838,7 +1001,8 @@ def search_by_embedding(
 
     # Query using pgvector cosine distance
     # <=> operator returns cosine distance (0 = identical, 2 = opposite)
-    # So similarity = 1 - distance gives us a 0-1 score
+    # So similarity = 1 - distance gives us a 0-1 score. The query vector is
+    # sent as binary float32 (see db_vector) rather than a float8[] to cast.
     sql = """
         SELECT DISTINCT c.document_id AS id,
                d.title,
@@ -854,13 +1018,90 @@ def search_by_embedding(
     results = []
     with db_manager.get_connection() as conn:
         with conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(sql, (embedding, model_id, max_results))
+            cur.execute(sql, (vector_param(conn, embedding), model_id, max_results))
             results = cur.fetchall()
 
     logger.info(f"Vector search found {len(results)} documents")
     return results
 
 
+def search_by_embeddings(
+    embeddings: List[List[float]],
+    max_results: int = 100,
+    model_id: int = 1
+) -> List[List[Dict[str, Any]]]:
+    """
+    Run several vector similarity searches in one statement.
+
+    Each embedding becomes one row of a VALUES list, and a LATERAL subquery
+    runs a nearest-neighbour scan (HNSW index order) per row. This costs
+    one round trip and one connection checkout instead of one per vector,
+    e.g. for the hypothetical documents of a HyDE search. The statement
+    does the work of one query per vector under a single statement_timeout,
+    so if it is cancelled the vectors are searched again one query each.
+
+    Args:
+        embeddings: Query embedding vectors
+        max_results: Maximum number of results per embedding (default: 100)
+        model_id: Embedding model ID in emb_1024 table (default: 1)
+
+    Returns:
+        One result list per embedding, in input order. Each list holds
+        dictionaries with keys id, title and similarity, most similar first,
+        as returned by search_by_embedding().
+    """
+    if not embeddings:
+        return []
+
+    db_manager = get_db_manager()
+    values = ", ".join("(%s, %s::vector)" for _ in embeddings)
+    sql = f"""
+        SELECT q.ord, r.id, r.title, r.similarity
+        FROM (VALUES {values}) AS q(ord, embedding)
+        CROSS JOIN LATERAL (
+            SELECT c.document_id AS id,
+                   d.title,
+                   1 - (e.embedding <=> q.embedding) AS similarity
+            FROM emb_1024 e
+            JOIN chunks c ON e.chunk_id = c.id
+            JOIN document d ON c.document_id = d.id
+            WHERE e.model_id = %s
+            ORDER BY e.embedding <=> q.embedding
+            LIMIT %s
+        ) r
+        ORDER BY q.ord, r.similarity DESC
+    """
+
+    results: List[List[Dict[str, Any]]] = [[] for _ in embeddings]
+    try:
+        with db_manager.get_connection() as conn:
+            params: List[Any] = []
+            for index, embedding in enumerate(embeddings):
+                params.extend((index, vector_param(conn, embedding)))
+            params.extend((model_id, max_results))
+            with conn.cursor(row_factory=dict_row) as cur:
+                cur.execute(cast(LiteralString, sql), params)
+                for row in cur.fetchall():
+                    results[row.pop('ord')].append(row)
+    except psycopg.errors.QueryCanceled as e:
+        if len(embeddings) == 1:
+            raise
+        logger.warning(
+            f"Vector search for {len(embeddings)} embeddings was cancelled ({e}); "
+            f"searching one embedding per query"
+        )
+        results = [
+            search_by_embedding(embedding, max_results=max_results, model_id=model_id)
+            for embedding in embeddings
+        ]
+
+    logger.info(
+        f"Vector search for {len(embeddings)} embeddings found "
+        f"{sum(len(r) for r in results)} documents"
+    )
+    return results
+
+
 def search_with_bm25(
     query_text: str,
     max_results: int = 100,
@@ -1151,6 +1392,163 @@ def _apply_rrf_reranking(documents: List[Dict], strategies_used: List[str], k: i
         doc['_combined_score'] = rrf_score
 
 
+# Strategies merged by search_hybrid(), in priority order: the first strategy
+# to return a document supplies its fields
+HYBRID_STRATEGY_ORDER = ('semantic', 'bm25', 'fulltext')
+
+# Default per-strategy time limit when strategies run concurrently (seconds)
+DEFAULT_STRATEGY_TIMEOUT_SECONDS = 60.0
+
+# Threads shared by concurrent hybrid searches; each running strategy holds a
+# pooled connection, so this stays below the pool's max_size (10)
+HYBRID_SEARCH_MAX_WORKERS = 6
+
+# Per-strategy score extraction (bm25_score/fulltext_score are future-proof,
+# the SQL functions currently return 'rank')
+_STRATEGY_SCORE_GETTERS: Dict[str, Callable[[Dict], Any]] = {
+    'semantic': lambda doc: doc.get('semantic_score', 0),
+    'bm25': lambda doc: doc.get('bm25_score', doc.get('rank', 0)),
+    'fulltext': lambda doc: doc.get('fulltext_score', doc.get('rank', 0)),
+}
+
+_strategy_executor: Optional[ThreadPoolExecutor] = None
+_strategy_executor_lock = threading.Lock()
+
+
+@dataclass
+class _StrategyOutcome:
+    """Result of running one hybrid search strategy."""
+
+    status: str  # 'ok', 'failed' or 'timeout'
+    seconds: float
+    documents: List[Dict] = field(default_factory=list)
+    params: Optional[Dict[str, Any]] = None
+
+
+def _get_strategy_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool for concurrent search strategies."""
+    global _strategy_executor
+    with _strategy_executor_lock:
+        if _strategy_executor is None:
+            _strategy_executor = ThreadPoolExecutor(
+                max_workers=HYBRID_SEARCH_MAX_WORKERS,
+                thread_name_prefix='hybrid-search',
+            )
+        return _strategy_executor
+
+
+def _run_semantic_strategy(search_text: str, config: Dict[str, Any]) -> Tuple[List[Dict], Dict[str, Any]]:
+    """Run semantic search and return (documents, search params)."""
+    threshold = config.get('similarity_threshold', 0.7)
+    max_results = config.get('max_results', 100)
+    logger.info(f"Executing semantic search (threshold={threshold}, max={max_results})")
+
+    documents = list(search_with_semantic(search_text, threshold, max_results))
+    return documents, {
+        'model': config.get('embedding_model', 'snowflake-arctic-embed2:latest'),
+        'threshold': threshold,
+        'max_results': max_results,
+        'documents_found': len(documents)
+    }
+
+
+def _run_bm25_strategy(
+    query_text: str,
+    config: Dict[str, Any],
+    use_pubmed: bool,
+    use_medrxiv: bool,
+    use_others: bool
+) -> Tuple[List[Dict], Dict[str, Any]]:
+    """Run BM25 search and return (documents, search params)."""
+    max_results = config.get('max_results', 100)
+    k1 = config.get('k1', 1.2)
+    b = config.get('b', 0.75)
+    logger.info(f"Executing BM25 search (k1={k1}, b={b}, max={max_results})")
+
+    documents = list(search_with_bm25(query_text, max_results, use_pubmed, use_medrxiv, use_others))
+    return documents, {
+        'k1': k1,
+        'b': b,
+        'max_results': max_results,
+        'query_expression': query_text,
+        'documents_found': len(documents)
+    }
+
+
+def _run_fulltext_strategy(
+    query_text: str,
+    config: Dict[str, Any],
+    use_pubmed: bool,
+    use_medrxiv: bool,
+    use_others: bool
+) -> Tuple[List[Dict], Dict[str, Any]]:
+    """Run fulltext search and return (documents, search params)."""
+    max_results = config.get('max_results', 100)
+    logger.info(f"Executing fulltext search (max={max_results})")
+
+    documents = list(search_with_fulltext_function(query_text, max_results, use_pubmed, use_medrxiv, use_others))
+    return documents, {
+        'max_results': max_results,
+        'query_expression': query_text,
+        'documents_found': len(documents)
+    }
+
+
+def _timed_strategy(name: str, runner: Callable[[], Tuple[List[Dict], Dict[str, Any]]]) -> _StrategyOutcome:
+    """Run one strategy, converting errors into a 'failed' outcome."""
+    start = time.perf_counter()
+    try:
+        documents, params = runner()
+    except Exception as e:
+        logger.error(f"{name} search failed: {e}", exc_info=True)
+        return _StrategyOutcome('failed', time.perf_counter() - start)
+    return _StrategyOutcome('ok', time.perf_counter() - start, documents, params)
+
+
+def _execute_strategies(
+    runners: Dict[str, Callable[[], Tuple[List[Dict], Dict[str, Any]]]],
+    parallel: bool,
+    timeout: Optional[float]
+) -> Dict[str, _StrategyOutcome]:
+    """Run search strategies sequentially or concurrently.
+
+    In parallel mode all strategies share one deadline of ``timeout`` seconds
+    from submission. A strategy that misses it is reported as 'timeout' and
+    its results are dropped, so the caller proceeds with partial results; the
+    abandoned query finishes in the background and returns its connection to
+    the pool.
+
+    Args:
+        runners: Strategy name -> callable returning (documents, params)
+        parallel: Run strategies concurrently on the shared thread pool
+        timeout: Per-strategy time limit in seconds (None or <= 0: no limit)
+
+    Returns:
+        Strategy name -> outcome
+    """
+    if not parallel:
+        return {name: _timed_strategy(name, runner) for name, runner in runners.items()}
+
+    start = time.perf_counter()
+    executor = _get_strategy_executor()
+    futures = {
+        name: executor.submit(_timed_strategy, name, runner)
+        for name, runner in runners.items()
+    }
+    deadline = start + timeout if timeout and timeout > 0 else None
+
+    outcomes = {}
+    for name, future in futures.items():
+        remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+        try:
+            outcomes[name] = future.result(timeout=remaining)
+        except FuturesTimeoutError:
+            future.cancel()
+            logger.warning(f"{name} search timed out after {timeout}s; continuing without it")
+            outcomes[name] = _StrategyOutcome('timeout', time.perf_counter() - start)
+    return outcomes
+
+
 def search_hybrid(
     search_text: str,
     query_text: str,
@@ -1166,6 +1564,12 @@ def search_hybrid(
     configuration, merges results, deduplicates by document ID, and returns
     both the merged document list and metadata about which strategies were used.
 
+    When more than one strategy is enabled they run concurrently (each on its
+    own pooled connection) unless ``search_config['execution']['parallel']`` is
+    False. A strategy that fails or exceeds ``strategy_timeout_seconds`` is
+    dropped and the remaining results are returned. Per-strategy timings are
+    recorded in ``strategy_metadata['strategy_timings']``.
+
     Args:
         search_text: Original natural language question
         query_text: Generated PostgreSQL tsquery expression
@@ -1217,110 +1621,67 @@ def search_hybrid(
     logger.info(f"  Search text: '{search_text}'")
     logger.info(f"  Query text: '{query_text}'")
 
-    # Priority order: semantic -> BM25 -> fulltext
-    # 1. Semantic Search (if enabled)
-    semantic_config = search_config.get('semantic', {})
-    if semantic_config.get('enabled', False):
-        try:
-            threshold = semantic_config.get('similarity_threshold', 0.7)
-            max_results = semantic_config.get('max_results', 100)
-            embedding_model = semantic_config.get('embedding_model', 'snowflake-arctic-embed2:latest')
-
-            logger.info(f"Executing semantic search (threshold={threshold}, max={max_results})")
-
-            semantic_count = 0
-            for doc in search_with_semantic(search_text, threshold, max_results):
-                doc_id = doc['id']
-                if doc_id not in all_documents:
-                    all_documents[doc_id] = doc
-                    all_documents[doc_id]['_search_scores'] = {}
-                all_documents[doc_id]['_search_scores']['semantic'] = doc.get('semantic_score', 0)
-                semantic_count += 1
-
-            strategies_used.append('semantic')
-            strategy_metadata['semantic_search_params'] = {
-                'model': embedding_model,
-                'threshold': threshold,
-                'max_results': max_results,
-                'documents_found': semantic_count
-            }
-
-            logger.info(f"  Semantic search found {semantic_count} documents")
-
-        except Exception as e:
-            logger.error(f"Semantic search failed: {e}", exc_info=True)
-
-    # 2. BM25 Search (if enabled)
-    bm25_config = search_config.get('bm25', {})
-    if bm25_config.get('enabled', False):
-        try:
-            max_results = bm25_config.get('max_results', 100)
-            k1 = bm25_config.get('k1', 1.2)
-            b = bm25_config.get('b', 0.75)
-
-            logger.info(f"Executing BM25 search (k1={k1}, b={b}, max={max_results})")
-
-            bm25_count = 0
-            for doc in search_with_bm25(query_text, max_results, use_pubmed, use_medrxiv, use_others):
-                doc_id = doc['id']
-                if doc_id not in all_documents:
-                    all_documents[doc_id] = doc
-                    all_documents[doc_id]['_search_scores'] = {}
-                # Use bm25_score if available (future-proof), fallback to rank field
-                all_documents[doc_id]['_search_scores']['bm25'] = doc.get('bm25_score', doc.get('rank', 0))
-                bm25_count += 1
-
-            strategies_used.append('bm25')
-            strategy_metadata['bm25_search_params'] = {
-                'k1': k1,
-                'b': b,
-                'max_results': max_results,
-                'query_expression': query_text,
-                'documents_found': bm25_count
-            }
-
-            logger.info(f"  BM25 search found {bm25_count} documents")
-
-        except Exception as e:
-            logger.error(f"BM25 search failed: {e}", exc_info=True)
-
-    # 3. Fulltext Search (if enabled) - fallback to keyword if neither semantic nor BM25
-    # Try 'fulltext' first, fall back to 'keyword' for backward compatibility
+    # Priority order: semantic -> BM25 -> fulltext. Each runner materialises
+    # its strategy's results so the strategies can run concurrently, each on
+    # its own pooled connection; results are merged in priority order below
+    # so the output does not depend on which strategy finishes first.
     fulltext_config = search_config.get('fulltext', search_config.get('keyword', {}))
-    fulltext_enabled = fulltext_config.get('enabled', False)
-
-    # Enable fulltext as fallback if no other strategies are enabled
-    if not strategies_used:
-        fulltext_enabled = True
-        logger.info("No search strategies enabled - using fulltext as fallback")
-
-    if fulltext_enabled:
-        try:
-            max_results = fulltext_config.get('max_results', 100)
-
-            logger.info(f"Executing fulltext search (max={max_results})")
-
-            fulltext_count = 0
-            for doc in search_with_fulltext_function(query_text, max_results, use_pubmed, use_medrxiv, use_others):
-                doc_id = doc['id']
-                if doc_id not in all_documents:
-                    all_documents[doc_id] = doc
-                    all_documents[doc_id]['_search_scores'] = {}
-                # Use fulltext_score if available (future-proof), fallback to rank field
-                all_documents[doc_id]['_search_scores']['fulltext'] = doc.get('fulltext_score', doc.get('rank', 0))
-                fulltext_count += 1
-
-            strategies_used.append('fulltext')
-            strategy_metadata['fulltext_search_params'] = {
-                'max_results': max_results,
-                'query_expression': query_text,
-                'documents_found': fulltext_count
-            }
-
-            logger.info(f"  Fulltext search found {fulltext_count} documents")
+    runners = {}
+    if search_config.get('semantic', {}).get('enabled', False):
+        runners['semantic'] = lambda: _run_semantic_strategy(search_text, search_config['semantic'])
+    if search_config.get('bm25', {}).get('enabled', False):
+        runners['bm25'] = lambda: _run_bm25_strategy(
+            query_text, search_config['bm25'], use_pubmed, use_medrxiv, use_others
+        )
+    if fulltext_config.get('enabled', False):
+        runners['fulltext'] = lambda: _run_fulltext_strategy(
+            query_text, fulltext_config, use_pubmed, use_medrxiv, use_others
+        )
 
-        except Exception as e:
-            logger.error(f"Fulltext search failed: {e}", exc_info=True)
+    execution_config = search_config.get('execution', {})
+    parallel = execution_config.get('parallel', True) and len(runners) > 1
+    timeout = execution_config.get('strategy_timeout_seconds', DEFAULT_STRATEGY_TIMEOUT_SECONDS)
+
+    outcomes = _execute_strategies(runners, parallel, timeout)
+
+    # Fulltext is the fallback when no other strategy produced results
+    if 'fulltext' not in runners and not any(o.status == 'ok' for o in outcomes.values()):
+        logger.info("No search strategies succeeded - using fulltext as fallback")
+        outcomes.update(_execute_strategies(
+            {'fulltext': lambda: _run_fulltext_strategy(
+                query_text, fulltext_config, use_pubmed, use_medrxiv, use_others
+            )},
+            parallel=False,
+            timeout=timeout,
+        ))
+
+    strategy_metadata['execution_mode'] = 'parallel' if parallel else 'sequential'
+    strategy_metadata['strategy_timings'] = {}
+    for name in HYBRID_STRATEGY_ORDER:
+        outcome = outcomes.get(name)
+        if outcome is None:
+            continue
+        strategy_metadata['strategy_timings'][name] = {
+            'seconds': round(outcome.seconds, 4),
+            'status': outcome.status,
+        }
+        if outcome.status != 'ok':
+            continue
+
+        score_of = _STRATEGY_SCORE_GETTERS[name]
+        for doc in outcome.documents:
+            doc_id = doc['id']
+            if doc_id not in all_documents:
+                all_documents[doc_id] = doc
+                all_documents[doc_id]['_search_scores'] = {}
+            all_documents[doc_id]['_search_scores'][name] = score_of(doc)
+
+        strategies_used.append(name)
+        strategy_metadata[f'{name}_search_params'] = outcome.params
+        logger.info(
+            f"  {name} search found {len(outcome.documents)} documents "
+            f"in {outcome.seconds:.2f}s"
+        )
 
     # Update strategy metadata
     strategy_metadata['strategies_used'] = strategies_used
@@ -1370,6 +1731,81 @@ def search_hybrid(
     return documents, strategy_metadata
 
 
+def _format_document_details(row: Any) -> Dict[str, Any]:
+    """
+    Build the get_document_details() dictionary from a document row.
+
+    Args:
+        row: Mapping with the columns of ``public.document`` plus source_name
+
+    Returns:
+        Formatted document dictionary (see get_document_details)
+    """
+    pub_date = row.get('publication_date')
+
+    # Format authors from array to string
+    authors_list = row.get('authors') or []
+    authors = None
+    if isinstance(authors_list, list) and authors_list:
+        if len(authors_list) > 3:
+            authors = ', '.join(authors_list[:3]) + ', et al.'
+        else:
+            authors = ', '.join(authors_list)
+
+    # Extract PMID from external_id for PubMed sources
+    # source_id=1 is typically PubMed
+    external_id = row.get('external_id', '')
+    pmid = None
+    if external_id:
+        if row.get('source_id') == 1:
+            # PubMed source - external_id is the PMID
+            pmid = external_id
+        elif external_id.isdigit():
+            # Simple numeric ID
+            pmid = external_id
+        elif 'pmid:' in external_id.lower():
+            # Handle "PMID:12345678" format
+            import re
+            pmid_match = re.search(r'pmid:(\d+)', external_id.lower())
+            if pmid_match:
+                pmid = pmid_match.group(1)
+
+    # Convert publication_date to ISO string
+    if pub_date is not None and hasattr(pub_date, 'isoformat'):
+        publication_date = pub_date.isoformat()
+    elif pub_date is not None:
+        publication_date = str(pub_date)
+    else:
+        publication_date = None
+
+    full_text = row.get('full_text')
+
+    return {
+        'id': row.get('id'),
+        'title': row.get('title'),
+        'abstract': row.get('abstract'),
+        'authors': authors,
+        'journal': row.get('publication'),
+        'publication_date': publication_date,
+        'year': getattr(pub_date, 'year', None),
+        'doi': row.get('doi'),
+        'pmid': pmid,
+        'external_id': external_id,
+        'source_id': row.get('source_id'),
+        'url': row.get('url'),
+        'pdf_url': row.get('pdf_url'),
+        'pdf_filename': row.get('pdf_filename'),
+        'full_text': full_text,
+        # Ensure list fields are not None
+        'keywords': row.get('keywords') or [],
+        'mesh_terms': row.get('mesh_terms') or [],
+        'source_name': row.get('source_name'),
+        'authors_list': authors_list,
+        # Add convenience boolean for full text availability
+        'has_full_text': bool(full_text and full_text.strip()),
+    }
+
+
 def get_document_details(document_id: int) -> Optional[Dict[str, Any]]:
     """
     Fetch comprehensive document details by ID.
@@ -1412,98 +1848,49 @@ def get_document_details(document_id: int) -> Optional[Dict[str, Any]]:
         ...     print(f"{doc['title']} by {doc['authors']}")
         ...     print(f"Published in {doc['journal']} ({doc['year']})")
     """
-    db_manager = get_db_manager()
-
     try:
-        with db_manager.get_connection() as conn:
-            with conn.cursor(row_factory=dict_row) as cur:
-                cur.execute(
-                    """
-                    SELECT
-                        d.id,
-                        d.title,
-                        d.abstract,
-                        d.authors,
-                        d.publication as journal,
-                        d.publication_date,
-                        EXTRACT(YEAR FROM d.publication_date)::INTEGER as year,
-                        d.doi,
-                        d.external_id,
-                        d.source_id,
-                        d.url,
-                        d.pdf_url,
-                        d.pdf_filename,
-                        d.full_text,
-                        d.keywords,
-                        d.mesh_terms,
-                        s.name as source_name
-                    FROM public.document d
-                    LEFT JOIN sources s ON d.source_id = s.id
-                    WHERE d.id = %s
-                    """,
-                    (document_id,),
-                )
-                row = cur.fetchone()
+        rows = get_document_details_batch([document_id])
+    except Exception as e:
+        logger.error(f"Error fetching document details for {document_id}: {e}")
+        return None
 
-                if not row:
-                    logger.debug(f"Document {document_id} not found")
-                    return None
+    doc = rows.get(document_id)
+    if doc is None:
+        logger.debug(f"Document {document_id} not found")
+        return None
 
-                # Convert to dict and process fields
-                doc = dict(row)
+    logger.debug(f"Fetched document details for {document_id}: {(doc.get('title') or 'untitled')[:50]}")
+    return doc
 
-                # Format authors from array to string
-                authors_list = doc.get('authors') or []
-                if isinstance(authors_list, list) and authors_list:
-                    if len(authors_list) > 3:
-                        doc['authors'] = ', '.join(authors_list[:3]) + ', et al.'
-                    else:
-                        doc['authors'] = ', '.join(authors_list)
-                else:
-                    doc['authors'] = None
-                doc['authors_list'] = authors_list
-
-                # Extract PMID from external_id for PubMed sources
-                # source_id=1 is typically PubMed
-                external_id = doc.get('external_id', '')
-                pmid = None
-                if external_id:
-                    if doc.get('source_id') == 1:
-                        # PubMed source - external_id is the PMID
-                        pmid = external_id
-                    elif external_id.isdigit():
-                        # Simple numeric ID
-                        pmid = external_id
-                    elif 'pmid:' in external_id.lower():
-                        # Handle "PMID:12345678" format
-                        import re
-                        pmid_match = re.search(r'pmid:(\d+)', external_id.lower())
-                        if pmid_match:
-                            pmid = pmid_match.group(1)
-                doc['pmid'] = pmid
 
-                # Convert publication_date to ISO string
-                pub_date = doc.get('publication_date')
-                if pub_date is not None and hasattr(pub_date, 'isoformat'):
-                    doc['publication_date'] = pub_date.isoformat()
-                elif pub_date is not None:
-                    doc['publication_date'] = str(pub_date)
+def get_document_details_batch(document_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Fetch get_document_details() dictionaries for many documents at once.
 
-                # Ensure list fields are not None
-                for field in ['keywords', 'mesh_terms']:
-                    if doc.get(field) is None:
-                        doc[field] = []
+    Use this when rendering several documents (reports, citation lists,
+    result cards) instead of calling get_document_details() per id: all
+    rows arrive in one round trip and repeat lookups are served from the
+    process-local row cache (see bmlibrarian.db_documents).
 
-                # Add convenience boolean for full text availability
-                full_text = doc.get('full_text')
-                doc['has_full_text'] = bool(full_text and full_text.strip())
+    Args:
+        document_ids: Database IDs of the documents
 
-                logger.debug(f"Fetched document details for {document_id}: {doc.get('title', 'untitled')[:50]}")
-                return doc
+    Returns:
+        Dictionary mapping document ID to its formatted details; IDs that
+        do not exist are absent
 
-    except Exception as e:
-        logger.error(f"Error fetching document details for {document_id}: {e}")
-        return None
+    Raises:
+        RuntimeError: If the database query fails
+    """
+    from bmlibrarian.db_documents import get_document_fetcher
+
+    try:
+        rows = get_document_fetcher().fetch_rows(document_ids)
+    except psycopg.Error as e:
+        logger.error(f"Database error fetching document details: {e}")
+        raise RuntimeError(f"Database error fetching document details: {e}") from e
+
+    return {doc_id: _format_document_details(row) for doc_id, row in rows.items()}
 
 
 def resolve_pdf_path(doc: Dict[str, Any]) -> Optional[str]:
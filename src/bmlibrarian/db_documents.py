@@ -0,0 +1,405 @@
+"""Batched, cached document row fetching.
+
+Report rendering, citation formatting and document cards ask for the same
+document rows over and over, often one id at a time. This module fetches
+``public.document`` rows by id with:
+
+- ``= ANY(%s)`` array parameters, so any number of ids is one statement
+  with one reusable plan instead of per-id queries
+- prepared statements (``prepare=True``), so repeat fetches skip parsing
+  and planning on the server
+- psycopg pipeline mode, so the freshness check for cached rows and the
+  fetch of missing rows share a single network round trip
+- a process-local LRU of rows keyed by document id. A cached row is served
+  only while its ``updated_date`` still matches the database; changed rows
+  are re-fetched and deleted rows evicted
+- compact, read-only :class:`DocumentRow` objects (a tuple of values plus
+  a shared column layout) instead of one dict per row
+
+Usage:
+    from bmlibrarian.db_documents import get_document_fetcher
+
+    rows = get_document_fetcher().fetch_rows([123, 456])
+    title = rows[123]["title"]
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple,
+)
+
+import psycopg
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DEFAULT_CACHE_SIZE",
+    "DEFAULT_CHUNK_SIZE",
+    "DocumentFetcher",
+    "DocumentRow",
+    "DocumentRowCache",
+    "compact_row",
+    "get_document_fetcher",
+    "invalidate_documents",
+]
+
+# Rows kept per process. Rows include full_text, so this bounds memory
+# rather than aiming for a high hit rate on bulk workloads.
+DEFAULT_CACHE_SIZE = 1024
+
+# Ids per ``= ANY(%s)`` statement; chunks of one fetch are pipelined
+DEFAULT_CHUNK_SIZE = 500
+
+# Same row shape as the historical fetch_documents_by_ids() query
+_ROWS_SQL = """
+    SELECT
+        d.*,
+        s.name AS source_name
+    FROM document d
+    LEFT JOIN sources s ON d.source_id = s.id
+    WHERE d.id = ANY(%s)
+"""
+
+_FRESHNESS_SQL = """
+    SELECT id, updated_date
+    FROM document
+    WHERE id = ANY(%s)
+"""
+
+
+class _RowLayout:
+    """Column names and name-to-position index shared by rows of one shape."""
+
+    __slots__ = ("names", "index")
+
+    def __init__(self, names: Tuple[str, ...]):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+
+
+_layouts: Dict[Tuple[str, ...], _RowLayout] = {}
+_layouts_lock = threading.Lock()
+
+
+def _layout_for(names: Tuple[str, ...]) -> _RowLayout:
+    """Return the shared layout for a column tuple."""
+    layout = _layouts.get(names)
+    if layout is None:
+        with _layouts_lock:
+            layout = _layouts.setdefault(names, _RowLayout(names))
+    return layout
+
+
+class DocumentRow(Mapping[str, Any]):
+    """
+    Read-only document row.
+
+    Behaves like a ``Mapping`` (``row["title"]``, ``row.get("doi")``,
+    ``dict(row)``) but stores only a tuple of values; column names live in
+    a layout shared by every row of the same query. Use :meth:`to_dict`
+    when a mutable copy is needed.
+    """
+
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout: _RowLayout, values: Tuple[Any, ...]):
+        self._layout = layout
+        self._values = values
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "DocumentRow":
+        """Build a row from any mapping (e.g. a dict from another query)."""
+        return cls(_layout_for(tuple(data.keys())), tuple(data.values()))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._layout.index[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        i = self._layout.index.get(key)
+        return default if i is None else self._values[i]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.names)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __repr__(self) -> str:
+        return f"DocumentRow(id={self.get('id')!r}, title={str(self.get('title'))[:40]!r})"
+
+    @property
+    def id(self) -> Optional[int]:
+        """Document id."""
+        return self.get("id")
+
+    @property
+    def updated_date(self) -> Any:
+        """Value of document.updated_date when the row was read."""
+        return self.get("updated_date")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable dict copy of the row."""
+        return dict(zip(self._layout.names, self._values))
+
+
+def compact_row(cursor: "psycopg.Cursor[Any]") -> Callable[[Sequence[Any]], DocumentRow]:
+    """
+    psycopg row factory producing :class:`DocumentRow` objects.
+
+    Usage:
+        with conn.cursor(row_factory=compact_row) as cur:
+            ...
+    """
+    description = cursor.description
+    names = tuple(col.name for col in description) if description else ()
+    layout = _layout_for(names)
+
+    def make_row(values: Sequence[Any]) -> DocumentRow:
+        return DocumentRow(layout, tuple(values))
+
+    return make_row
+
+
+class DocumentRowCache:
+    """Thread-safe LRU of document rows keyed by document id."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of rows kept (0 disables caching)
+        """
+        self.max_size = max(0, max_size)
+        self._rows: "OrderedDict[int, DocumentRow]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get_many(self, document_ids: Iterable[int]) -> Dict[int, DocumentRow]:
+        """Return cached rows for the ids that are present, marking them recent."""
+        found: Dict[int, DocumentRow] = {}
+        with self._lock:
+            for doc_id in document_ids:
+                row = self._rows.get(doc_id)
+                if row is None:
+                    self.misses += 1
+                    continue
+                self._rows.move_to_end(doc_id)
+                found[doc_id] = row
+            self.hits += len(found)
+        return found
+
+    def put_many(self, rows: Iterable[DocumentRow]) -> None:
+        """Insert or replace rows, evicting the least recently used beyond max_size."""
+        if not self.max_size:
+            return
+        with self._lock:
+            for row in rows:
+                self._rows[row.id] = row
+                self._rows.move_to_end(row.id)
+            while len(self._rows) > self.max_size:
+                self._rows.popitem(last=False)
+
+    def invalidate(self, document_ids: Optional[Iterable[int]] = None) -> None:
+        """Drop the given ids, or everything when ``document_ids`` is None."""
+        with self._lock:
+            if document_ids is None:
+                self._rows.clear()
+                return
+            for doc_id in document_ids:
+                self._rows.pop(doc_id, None)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache size and hit/miss/stale counters."""
+        return {
+            "size": len(self._rows),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+        }
+
+
+def _chunks(ids: List[int], size: int) -> Iterator[List[int]]:
+    """Split ids into lists of at most ``size``."""
+    for i in range(0, len(ids), size):
+        yield ids[i:i + size]
+
+
+class DocumentFetcher:
+    """
+    Fetches document rows by id through a :class:`DocumentRowCache`.
+
+    One :meth:`fetch_rows` call costs a single round trip in the common
+    case (freshness check of cached ids and fetch of missing ids,
+    pipelined), plus a second only when cached rows turned out stale.
+    """
+
+    def __init__(
+        self,
+        db_manager: Any = None,
+        cache: Optional[DocumentRowCache] = None,
+        validate_cached: bool = True,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Initialize the fetcher.
+
+        Args:
+            db_manager: DatabaseManager (defaults to the global manager)
+            cache: Row cache (defaults to a new DocumentRowCache)
+            validate_cached: Check updated_date of cached rows on every fetch.
+                Disable only for read-mostly workloads that tolerate stale rows.
+            chunk_size: Ids per ``= ANY(%s)`` statement
+        """
+        self._db_manager = db_manager
+        self.cache = cache if cache is not None else DocumentRowCache()
+        self.validate_cached = validate_cached
+        self.chunk_size = max(1, chunk_size)
+
+    def _get_db_manager(self) -> Any:
+        if self._db_manager is None:
+            from bmlibrarian.database import get_db_manager
+            self._db_manager = get_db_manager()
+        return self._db_manager
+
+    def fetch_rows(
+        self,
+        document_ids: Iterable[int],
+        chunk_size: Optional[int] = None,
+    ) -> Dict[int, DocumentRow]:
+        """
+        Fetch rows for document ids.
+
+        Args:
+            document_ids: Ids to fetch (duplicates are ignored)
+            chunk_size: Ids per statement (defaults to self.chunk_size)
+
+        Returns:
+            Dictionary mapping id to DocumentRow, in first-seen id order;
+            ids that do not exist are absent
+        """
+        ids = list(dict.fromkeys(int(doc_id) for doc_id in document_ids))
+        if not ids:
+            return {}
+        chunk_size = max(1, chunk_size or self.chunk_size)
+
+        cached = self.cache.get_many(ids)
+        missing = [doc_id for doc_id in ids if doc_id not in cached]
+        to_validate = list(cached) if self.validate_cached else []
+
+        fetched: Dict[int, DocumentRow] = {}
+        if missing or to_validate:
+            with self._get_db_manager().get_connection() as conn:
+                current, fetched = self._fetch_and_validate(
+                    conn, to_validate, missing, chunk_size
+                )
+
+                stale = []
+                for doc_id in to_validate:
+                    if doc_id not in current:
+                        # Deleted since it was cached
+                        del cached[doc_id]
+                    elif current[doc_id] != cached[doc_id].updated_date:
+                        stale.append(doc_id)
+                        del cached[doc_id]
+
+                if stale:
+                    self.cache.stale += len(stale)
+                    _, refreshed = self._fetch_and_validate(conn, [], stale, chunk_size)
+                    fetched.update(refreshed)
+
+            deleted = [doc_id for doc_id in to_validate if doc_id not in current]
+            if deleted:
+                self.cache.invalidate(deleted)
+            self.cache.put_many(fetched.values())
+
+        rows = {}
+        for doc_id in ids:
+            row = cached.get(doc_id) or fetched.get(doc_id)
+            if row is not None:
+                rows[doc_id] = row
+        return rows
+
+    def _fetch_and_validate(
+        self,
+        conn: "psycopg.Connection[Any]",
+        to_validate: List[int],
+        missing: List[int],
+        chunk_size: int,
+    ) -> Tuple[Dict[int, Any], Dict[int, DocumentRow]]:
+        """
+        Run the freshness check and the missing-row fetch in one pipeline.
+
+        Returns:
+            Tuple of (current updated_date by id, fetched rows by id)
+        """
+        fresh_cursors = []
+        row_cursors = []
+
+        def queue_statements() -> None:
+            for chunk in _chunks(to_validate, chunk_size):
+                cur = conn.cursor()
+                cur.execute(_FRESHNESS_SQL, (chunk,), prepare=True)
+                fresh_cursors.append(cur)
+            for chunk in _chunks(missing, chunk_size):
+                cur = conn.cursor(row_factory=compact_row)
+                cur.execute(_ROWS_SQL, (chunk,), prepare=True)
+                row_cursors.append(cur)
+
+        if psycopg.Pipeline.is_supported():
+            with conn.pipeline():
+                queue_statements()
+        else:
+            queue_statements()
+
+        current: Dict[int, Any] = {}
+        for cur in fresh_cursors:
+            current.update(cur.fetchall())
+            cur.close()
+
+        fetched: Dict[int, DocumentRow] = {}
+        for cur in row_cursors:
+            for row in cur.fetchall():
+                fetched[row.id] = row
+            cur.close()
+
+        logger.debug(
+            f"Document fetch: validated {len(to_validate)} cached, "
+            f"fetched {len(fetched)}/{len(missing)} missing"
+        )
+        return current, fetched
+
+    def invalidate(self, document_ids: Optional[Iterable[int]] = None) -> None:
+        """Drop cached rows, e.g. after writing to them in this process."""
+        self.cache.invalidate(document_ids)
+
+
+_fetcher: Optional[DocumentFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_document_fetcher() -> DocumentFetcher:
+    """Return the process-wide DocumentFetcher (created on first use)."""
+    global _fetcher
+    if _fetcher is None:
+        with _fetcher_lock:
+            if _fetcher is None:
+                _fetcher = DocumentFetcher()
+    return _fetcher
+
+
+def invalidate_documents(document_ids: Optional[Iterable[int]] = None) -> None:
+    """Drop rows from the process-wide cache (all rows when ids is None)."""
+    if _fetcher is not None:
+        _fetcher.invalidate(document_ids)
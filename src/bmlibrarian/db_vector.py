@@ -0,0 +1,226 @@
+"""Binary transfer of pgvector embeddings over psycopg.
+
+Formatting a 1024-dim embedding as ``'[0.0123, ...]'`` text and having the
+server parse it back costs client CPU, server CPU and roughly three times
+the bytes of the binary representation. This module registers a psycopg
+binary dumper for the pgvector ``vector`` type so embeddings are sent in
+pgvector's binary wire format, both as query parameters and in
+``COPY ... (FORMAT BINARY)``.
+
+Only :class:`VectorParam` values (as returned by :func:`vector_param`) and
+COPY columns declared ``vector`` use the dumper; plain numpy arrays keep
+psycopg's default adaptation, so other code on a pooled connection can
+still send arrays as ``float8[]``/``int[]``.
+
+The ``vector`` type OID differs per database (it comes from the extension),
+so adapters are registered per connection on first use by
+:func:`register_vector_adapters`. Lookups are cached per database, and the
+registration itself stays on the (pooled) connection.
+
+pgvector binary format: ``int16 dim``, ``int16 unused``, then ``dim``
+big-endian float32 values.
+
+Usage:
+    from bmlibrarian.db_vector import vector_param
+
+    with db_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT id FROM semantic.chunks ORDER BY embedding <=> %s LIMIT 10",
+                (vector_param(conn, embedding),),
+            )
+"""
+
+import logging
+import struct
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import psycopg
+from psycopg.adapt import Dumper
+from psycopg.pq import Format
+from psycopg.types import TypeInfo
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "VECTOR_TYPE_NAME",
+    "VectorParam",
+    "encode_vector_binary",
+    "format_vector_literal",
+    "register_vector_adapters",
+    "reset_vector_type_cache",
+    "to_vector_array",
+    "vector_param",
+]
+
+# Postgres type name created by the pgvector extension
+VECTOR_TYPE_NAME = "vector"
+
+# Header: dimensions and an unused (reserved) field, both big-endian int16
+_VECTOR_HEADER = struct.Struct(">HH")
+
+# pgvector's wire format is big-endian float32
+_WIRE_DTYPE = np.dtype(">f4")
+
+# Largest dimension count the int16 header can carry (pgvector limit is 16000)
+MAX_VECTOR_DIMENSIONS = 16000
+
+VectorLike = Union[Sequence[float], np.ndarray]
+
+# TypeInfo per database (None when the extension is absent), keyed by
+# (host, port, dbname) so different databases never share an OID
+_type_info_cache: Dict[Tuple[str, str, str], Optional[TypeInfo]] = {}
+_type_info_lock = threading.Lock()
+
+
+def to_vector_array(embedding: VectorLike) -> np.ndarray:
+    """Convert an embedding to a contiguous 1-D float32 array.
+
+    Args:
+        embedding: List of floats or numpy array
+
+    Returns:
+        float32 numpy array
+
+    Raises:
+        ValueError: If the embedding is not one-dimensional or too long
+    """
+    array = np.ascontiguousarray(embedding, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Expected a 1-D embedding, got shape {array.shape}")
+    if array.shape[0] > MAX_VECTOR_DIMENSIONS:
+        raise ValueError(
+            f"Embedding has {array.shape[0]} dimensions, "
+            f"pgvector supports at most {MAX_VECTOR_DIMENSIONS}"
+        )
+    return array
+
+
+def encode_vector_binary(embedding: VectorLike) -> bytes:
+    """Encode an embedding in pgvector's binary wire format.
+
+    Args:
+        embedding: List of floats or numpy array
+
+    Returns:
+        Bytes suitable for a binary ``vector`` parameter or COPY field
+    """
+    array = to_vector_array(embedding)
+    return _VECTOR_HEADER.pack(array.shape[0], 0) + array.astype(_WIRE_DTYPE).tobytes()
+
+
+def format_vector_literal(embedding: VectorLike) -> str:
+    """Format an embedding as a pgvector text literal (``'[1,2,3]'``).
+
+    Fallback for databases where binary adapters could not be registered.
+
+    Args:
+        embedding: List of floats or numpy array
+
+    Returns:
+        Text literal accepted by the ``vector`` input function
+    """
+    return "[" + ",".join(map(str, embedding)) + "]"
+
+
+class VectorParam:
+    """An embedding marked for sending as a binary pgvector ``vector``.
+
+    Attributes:
+        array: The embedding as a contiguous float32 array
+    """
+
+    __slots__ = ("array",)
+
+    def __init__(self, embedding: VectorLike) -> None:
+        self.array = to_vector_array(embedding)
+
+    def __repr__(self) -> str:
+        return f"VectorParam(dimensions={self.array.shape[0]})"
+
+
+class _VectorBinaryDumper(Dumper):
+    """Dump VectorParams (and, for COPY, float sequences) as binary vectors.
+
+    Subclassed per database by register_vector_adapters() to carry the
+    extension's type OID.
+    """
+
+    format = Format.BINARY
+
+    def dump(self, obj: Any) -> bytes:
+        if isinstance(obj, VectorParam):
+            obj = obj.array
+        return encode_vector_binary(obj)
+
+
+def _fetch_type_info(conn: psycopg.Connection) -> Optional[TypeInfo]:
+    """Look up (and cache) the vector TypeInfo for this connection's database."""
+    key = (conn.info.host, str(conn.info.port), conn.info.dbname)
+    with _type_info_lock:
+        if key in _type_info_cache:
+            return _type_info_cache[key]
+
+    info = TypeInfo.fetch(conn, VECTOR_TYPE_NAME)
+    if info is None:
+        logger.warning(
+            "pgvector 'vector' type not found; embeddings will be sent as text"
+        )
+
+    with _type_info_lock:
+        _type_info_cache[key] = info
+    return info
+
+
+def register_vector_adapters(conn: psycopg.Connection) -> bool:
+    """Register the binary vector dumper on a connection (idempotent).
+
+    After registration, VectorParam query parameters are sent as binary
+    ``vector`` values, and ``copy.set_types([... "vector"])`` works for
+    ``COPY ... (FORMAT BINARY)``. Other types' adaptation is unchanged.
+
+    Args:
+        conn: psycopg connection (pooled connections keep the registration)
+
+    Returns:
+        True if binary vectors can be used on this connection
+    """
+    if conn.adapters.types.get(VECTOR_TYPE_NAME) is not None:
+        return True
+
+    info = _fetch_type_info(conn)
+    if info is None:
+        return False
+
+    info.register(conn)
+    dumper = type(
+        "VectorBinaryDumper", (_VectorBinaryDumper,), {"oid": info.oid}
+    )
+    conn.adapters.register_dumper(VectorParam, dumper)
+    # Registered by OID too, for COPY after set_types()
+    conn.adapters.register_dumper(None, dumper)
+    return True
+
+
+def vector_param(conn: psycopg.Connection, embedding: VectorLike) -> Any:
+    """Prepare an embedding for use as a ``%s`` query parameter.
+
+    Args:
+        conn: Connection the query will run on
+        embedding: List of floats or numpy array
+
+    Returns:
+        A VectorParam sent in binary when the adapters are available,
+        otherwise a text literal
+    """
+    if register_vector_adapters(conn):
+        return VectorParam(embedding)
+    return format_vector_literal(embedding)
+
+
+def reset_vector_type_cache() -> None:
+    """Forget cached vector type lookups (e.g. after installing pgvector)."""
+    with _type_info_lock:
+        _type_info_cache.clear()
@@ -64,6 +64,8 @@ from .resolvers import (
     CrossRefTitleResolver
 )
 
+from .resolver_cache import ResolverCache
+
 from .full_text_finder import (
     FullTextFinder,
     discover_full_text,
@@ -119,6 +121,7 @@ __all__ = [
     'UnpaywallResolver',
     'OpenAthensResolver',
     'CrossRefTitleResolver',
+    'ResolverCache',
     # Main classes
     'FullTextFinder',
     'PMCPackageDownloader',
@@ -11,6 +11,7 @@ Supports a two-phase download approach:
 import logging
 import time
 import ftplib
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 from urllib.parse import urlparse
@@ -19,12 +20,14 @@ import requests
 
 from .data_types import (
     PDFSource, DiscoveryResult, DownloadResult, DocumentIdentifiers,
-    ResolutionStatus, SourceType, AccessType
+    ResolutionResult, ResolutionStatus, SourceType, AccessType
 )
 from .resolvers import (
     BaseResolver, DirectURLResolver, DOIResolver,
-    PMCResolver, UnpaywallResolver, OpenAthensResolver
+    PMCResolver, UnpaywallResolver, OpenAthensResolver,
+    create_resolver_session
 )
+from .resolver_cache import ResolverCache
 from ..utils.url_validation import get_validated_openathens_url
 from ..utils.pdf_validation import is_pdf_content
 from ..utils.download_utils import (
@@ -53,6 +56,11 @@ class FullTextFinder:
     3. DOI resolution (CrossRef, doi.org)
     4. Direct URL (from database)
     5. OpenAthens proxy (institutional access, if configured)
+
+    Resolvers share one pooled HTTP session. With concurrent discovery
+    they all start at once and are merged in the order above, so the
+    result is the same as a sequential run but costs the slowest
+    resolver's latency rather than the sum.
     """
 
     def __init__(
@@ -62,7 +70,9 @@ class FullTextFinder:
         openathens_auth: Optional[Any] = None,
         timeout: int = DEFAULT_TIMEOUT,
         prefer_open_access: bool = True,
-        skip_resolvers: Optional[List[str]] = None
+        skip_resolvers: Optional[List[str]] = None,
+        concurrent_discovery: bool = False,
+        resolver_cache: Optional[ResolverCache] = None
     ):
         """Initialize FullTextFinder.
 
@@ -73,31 +83,41 @@ class FullTextFinder:
             timeout: HTTP request timeout in seconds
             prefer_open_access: If True, prioritize OA sources over others
             skip_resolvers: List of resolver names to skip
+            concurrent_discovery: If True, discover() runs all resolvers at
+                once by default instead of one after another
+            resolver_cache: Optional on-disk cache of resolver results
         """
         self.timeout = timeout
         self.prefer_open_access = prefer_open_access
         self.openathens_auth = openathens_auth
         self.skip_resolvers = set(skip_resolvers or [])
+        self.concurrent_discovery = concurrent_discovery
+        self.resolver_cache = resolver_cache
+
+        # One pooled session for all resolver API calls, so keep-alive
+        # connections are reused across resolvers and documents
+        self._resolver_session = create_resolver_session()
+        session = self._resolver_session
 
         # Initialize resolvers in priority order
         self.resolvers: List[BaseResolver] = []
 
         # PMC - highest priority for OA
         if 'pmc' not in self.skip_resolvers:
-            self.resolvers.append(PMCResolver(timeout=timeout))
+            self.resolvers.append(PMCResolver(timeout=timeout, session=session))
 
         # Unpaywall - excellent OA coverage
         if 'unpaywall' not in self.skip_resolvers:
             email = unpaywall_email or DEFAULT_UNPAYWALL_EMAIL
-            self.resolvers.append(UnpaywallResolver(email=email, timeout=timeout))
+            self.resolvers.append(UnpaywallResolver(email=email, timeout=timeout, session=session))
 
         # DOI resolution
         if 'doi' not in self.skip_resolvers:
-            self.resolvers.append(DOIResolver(timeout=timeout))
+            self.resolvers.append(DOIResolver(timeout=timeout, session=session))
 
         # Direct URL from database
         if 'direct_url' not in self.skip_resolvers:
-            self.resolvers.append(DirectURLResolver(timeout=timeout))
+            self.resolvers.append(DirectURLResolver(timeout=timeout, session=session))
 
         # OpenAthens proxy/redirector - detect the type of URL provided
         # Types:
@@ -137,7 +157,8 @@ class FullTextFinder:
                 # The OpenAthensResolver handles format detection internally
                 self.resolvers.append(OpenAthensResolver(
                     proxy_base_url=openathens_proxy_url,
-                    timeout=timeout
+                    timeout=timeout,
+                    session=session
                 ))
                 if is_redirector:
                     logger.info(f"OpenAthens Redirector configured: {openathens_proxy_url}")
@@ -164,7 +185,8 @@ class FullTextFinder:
         self,
         identifiers: DocumentIdentifiers,
         stop_on_first_oa: bool = True,
-        progress_callback: Optional[Callable[[str, str], None]] = None
+        progress_callback: Optional[Callable[[str, str], None]] = None,
+        concurrent: Optional[bool] = None
     ) -> DiscoveryResult:
         """Discover PDF sources for a document.
 
@@ -172,6 +194,10 @@ class FullTextFinder:
             identifiers: Document identifiers (DOI, PMID, etc.)
             stop_on_first_oa: Stop searching after finding first OA source
             progress_callback: Optional callback(resolver_name, status)
+            concurrent: Run all resolvers at once (None uses the
+                concurrent_discovery setting). Results are merged in
+                priority order either way; with stop_on_first_oa, results
+                of resolvers after the first OA hit are discarded.
 
         Returns:
             DiscoveryResult with all found sources
@@ -189,39 +215,31 @@ class FullTextFinder:
             result.total_duration_ms = (time.time() - start_time) * 1000
             return result
 
-        # Run each resolver
-        for resolver in self.resolvers:
-            if progress_callback:
-                progress_callback(resolver.name, "resolving")
-
-            try:
-                resolution = resolver.resolve(identifiers)
-                result.resolution_results.append(resolution)
-
-                if resolution.status == ResolutionStatus.SUCCESS:
-                    # Add sources, avoiding duplicates
-                    for source in resolution.sources:
-                        if not self._is_duplicate_source(source, result.sources):
-                            result.sources.append(source)
-
-                    # Check if we should stop early
-                    if stop_on_first_oa and self.prefer_open_access:
-                        oa_sources = [s for s in resolution.sources
-                                     if s.access_type == AccessType.OPEN]
-                        if oa_sources:
-                            logger.info(f"Found OA source via {resolver.name}, stopping search")
-                            if progress_callback:
-                                progress_callback(resolver.name, "found_oa")
-                            break
+        if concurrent is None:
+            concurrent = self.concurrent_discovery
 
+        if concurrent and len(self.resolvers) > 1:
+            self._discover_concurrently(
+                identifiers, result, stop_on_first_oa, progress_callback
+            )
+        else:
+            # Run each resolver
+            for resolver in self.resolvers:
                 if progress_callback:
-                    status = "found" if resolution.sources else "not_found"
-                    progress_callback(resolver.name, status)
+                    progress_callback(resolver.name, "resolving")
 
-            except Exception as e:
-                logger.error(f"Resolver {resolver.name} failed: {e}")
-                if progress_callback:
-                    progress_callback(resolver.name, "error")
+                try:
+                    resolution = self._resolve(resolver, identifiers)
+                except Exception as e:
+                    logger.error(f"Resolver {resolver.name} failed: {e}")
+                    if progress_callback:
+                        progress_callback(resolver.name, "error")
+                    continue
+
+                if self._merge_resolution(
+                    result, resolver, resolution, stop_on_first_oa, progress_callback
+                ):
+                    break
 
         # Sort sources by priority
         result.sources.sort(key=lambda s: s.priority)
@@ -232,6 +250,128 @@ class FullTextFinder:
 
         return result
 
+    def _discover_concurrently(
+        self,
+        identifiers: DocumentIdentifiers,
+        result: DiscoveryResult,
+        stop_on_first_oa: bool,
+        progress_callback: Optional[Callable[[str, str], None]]
+    ) -> None:
+        """Run all resolvers at once and merge their results in priority order.
+
+        Waiting on the futures in resolver order keeps the merged sources
+        identical to a sequential run. Every resolver starts immediately,
+        so once one yields an OA source (and stop_on_first_oa applies) the
+        later ones are not cancelled: their requests finish in the
+        background (bounded by the HTTP timeout) and the results are
+        ignored.
+
+        Args:
+            identifiers: Document identifiers
+            result: DiscoveryResult to merge into
+            stop_on_first_oa: Stop after the first resolver with an OA source
+            progress_callback: Optional callback(resolver_name, status)
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.resolvers), thread_name_prefix="resolver"
+        )
+        futures: List[Future] = []
+        try:
+            for resolver in self.resolvers:
+                if progress_callback:
+                    progress_callback(resolver.name, "resolving")
+                futures.append(executor.submit(self._resolve, resolver, identifiers))
+
+            for resolver, future in zip(self.resolvers, futures):
+                try:
+                    resolution = future.result()
+                except Exception as e:
+                    logger.error(f"Resolver {resolver.name} failed: {e}")
+                    if progress_callback:
+                        progress_callback(resolver.name, "error")
+                    continue
+
+                if self._merge_resolution(
+                    result, resolver, resolution, stop_on_first_oa, progress_callback
+                ):
+                    break
+        finally:
+            executor.shutdown(wait=False)
+
+    def _resolve(
+        self, resolver: BaseResolver, identifiers: DocumentIdentifiers
+    ) -> ResolutionResult:
+        """Run one resolver, answering from the resolver cache when possible.
+
+        Args:
+            resolver: Resolver to run
+            identifiers: Document identifiers
+
+        Returns:
+            ResolutionResult from the cache or the resolver
+        """
+        use_cache = self.resolver_cache is not None and resolver.cacheable
+        if use_cache:
+            cached = self.resolver_cache.get(resolver.name, identifiers)
+            if cached is not None:
+                logger.debug(f"Resolver cache hit for {resolver.name}")
+                return cached
+
+        resolution = resolver.resolve(identifiers)
+
+        if use_cache:
+            try:
+                self.resolver_cache.put(identifiers, resolution)
+            except Exception as e:
+                # A cache write failure must not lose the resolved sources
+                logger.warning(f"Failed to cache {resolver.name} result: {e}")
+
+        return resolution
+
+    def _merge_resolution(
+        self,
+        result: DiscoveryResult,
+        resolver: BaseResolver,
+        resolution: ResolutionResult,
+        stop_on_first_oa: bool,
+        progress_callback: Optional[Callable[[str, str], None]]
+    ) -> bool:
+        """Add one resolver's result to the discovery result.
+
+        Args:
+            result: DiscoveryResult to update
+            resolver: Resolver that produced the resolution
+            resolution: ResolutionResult to merge
+            stop_on_first_oa: Stop after the first resolver with an OA source
+            progress_callback: Optional callback(resolver_name, status)
+
+        Returns:
+            True if discovery should stop here
+        """
+        result.resolution_results.append(resolution)
+
+        if resolution.status == ResolutionStatus.SUCCESS:
+            # Add sources, avoiding duplicates
+            for source in resolution.sources:
+                if not self._is_duplicate_source(source, result.sources):
+                    result.sources.append(source)
+
+            # Check if we should stop early
+            if stop_on_first_oa and self.prefer_open_access:
+                oa_sources = [s for s in resolution.sources
+                             if s.access_type == AccessType.OPEN]
+                if oa_sources:
+                    logger.info(f"Found OA source via {resolver.name}, stopping search")
+                    if progress_callback:
+                        progress_callback(resolver.name, "found_oa")
+                    return True
+
+        if progress_callback:
+            status = "found" if resolution.sources else "not_found"
+            progress_callback(resolver.name, status)
+
+        return False
+
     def discover_and_download(
         self,
         identifiers: DocumentIdentifiers,
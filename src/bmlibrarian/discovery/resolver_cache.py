@@ -0,0 +1,241 @@
+"""On-disk cache of resolver results.
+
+Each resolver call costs one or more HTTP round trips (and an API quota
+hit for Unpaywall and CrossRef). Re-running discovery over a corpus, or
+retrying documents whose download failed, asks the same resolvers about
+the same DOIs again. ResolverCache stores each resolver's answer in a
+local SQLite file keyed by resolver name and document identifiers, and
+expires it after a TTL so that newly opened papers (embargo ends,
+repository deposits) are eventually picked up.
+
+Only definitive answers (SUCCESS and NOT_FOUND) are cached; errors and
+timeouts are always retried.
+
+Usage:
+    from bmlibrarian.discovery import FullTextFinder, ResolverCache
+
+    finder = FullTextFinder(
+        unpaywall_email="you@example.com",
+        resolver_cache=ResolverCache(ttl_seconds=7 * 24 * 3600),
+    )
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .data_types import (
+    AccessType, DocumentIdentifiers, PDFSource, ResolutionResult,
+    ResolutionStatus, SourceType
+)
+
+logger = logging.getLogger(__name__)
+
+# Default cache file name under the bmlibrarian config directory
+DEFAULT_CACHE_FILENAME = "resolver_cache.sqlite"
+
+# Default time-to-live for cached resolver results (14 days)
+DEFAULT_TTL_SECONDS = 14 * 24 * 3600
+
+# Milliseconds a SQLite writer waits on a lock held by another process
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# Statuses worth remembering; anything else is retried on the next call
+CACHEABLE_STATUSES = (ResolutionStatus.SUCCESS, ResolutionStatus.NOT_FOUND)
+
+# Bump when the key derivation or stored payload changes
+CACHE_KEY_VERSION = 1
+
+
+def make_cache_key(resolver_name: str, identifiers: DocumentIdentifiers) -> str:
+    """Derive the cache key for one resolver and one document.
+
+    The database ID is excluded: the same DOI/PMID resolves the same way
+    whichever row it came from.
+
+    Args:
+        resolver_name: Resolver name (e.g. "unpaywall")
+        identifiers: Document identifiers
+
+    Returns:
+        Hex SHA-256 digest of the canonical key description
+    """
+    payload = {
+        "v": CACHE_KEY_VERSION,
+        "resolver": resolver_name,
+        "doi": identifiers.doi.strip().lower() if identifiers.doi else None,
+        "pmid": identifiers.pmid,
+        "pmcid": identifiers.pmcid,
+        "title": identifiers.title,
+        "pdf_url": identifiers.pdf_url,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _source_to_dict(source: PDFSource) -> Dict[str, Any]:
+    """Serialize a PDFSource to JSON-compatible types."""
+    return {
+        "url": source.url,
+        "source_type": source.source_type.value,
+        "access_type": source.access_type.value,
+        "priority": source.priority,
+        "license": source.license,
+        "version": source.version,
+        "is_best_oa": source.is_best_oa,
+        "host_type": source.host_type,
+        "metadata": source.metadata,
+    }
+
+
+def _dict_to_source(data: Dict[str, Any]) -> PDFSource:
+    """Rebuild a PDFSource from _source_to_dict() output."""
+    return PDFSource(
+        url=data["url"],
+        source_type=SourceType(data["source_type"]),
+        access_type=AccessType(data["access_type"]),
+        priority=data.get("priority", 0),
+        license=data.get("license"),
+        version=data.get("version"),
+        is_best_oa=data.get("is_best_oa", False),
+        host_type=data.get("host_type"),
+        metadata=data.get("metadata") or {},
+    )
+
+
+def _result_to_payload(result: ResolutionResult) -> str:
+    """Serialize the reusable fields of a resolution result."""
+    return json.dumps({
+        "resolver_name": result.resolver_name,
+        "status": result.status.value,
+        "sources": [_source_to_dict(s) for s in result.sources],
+        "error_message": result.error_message,
+        "metadata": result.metadata,
+    })
+
+
+def _payload_to_result(payload: str) -> ResolutionResult:
+    """Rebuild a cached resolution result (metadata marked ``cached``)."""
+    data = json.loads(payload)
+    metadata = dict(data.get("metadata") or {})
+    metadata["cached"] = True
+    return ResolutionResult(
+        resolver_name=data["resolver_name"],
+        status=ResolutionStatus(data["status"]),
+        sources=[_dict_to_source(s) for s in data.get("sources", [])],
+        error_message=data.get("error_message"),
+        duration_ms=0.0,
+        metadata=metadata,
+    )
+
+
+class ResolverCache:
+    """TTL cache of resolver results in a local SQLite file.
+
+    Runs in WAL mode so several processes (e.g. parallel download
+    workers) can share one cache file. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file; parent directories are created.
+                None uses resolver_cache.sqlite in the config directory.
+            ttl_seconds: Lifetime of an entry; 0 or None keeps entries forever
+        """
+        if path is None:
+            from ..utils.path_utils import get_config_dir
+
+            path = get_config_dir() / DEFAULT_CACHE_FILENAME
+        self.path = Path(path).expanduser()
+        self.ttl_seconds = ttl_seconds
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resolver_cache (
+                cache_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires_at REAL
+            ) WITHOUT ROWID
+            """
+        )
+
+    def get(self, resolver_name: str, identifiers: DocumentIdentifiers) -> Optional[ResolutionResult]:
+        """Return the cached result, or None if missing or expired."""
+        key = make_cache_key(resolver_name, identifiers)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM resolver_cache "
+                "WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return _payload_to_result(row[0])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable resolver cache entry: {e}")
+            return None
+
+    def put(self, identifiers: DocumentIdentifiers, result: ResolutionResult) -> bool:
+        """Store a result if its status is definitive.
+
+        Args:
+            identifiers: Identifiers the result was resolved from
+            result: Resolver result
+
+        Returns:
+            True if the result was stored
+        """
+        if result.status not in CACHEABLE_STATUSES:
+            return False
+        key = make_cache_key(result.resolver_name, identifiers)
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO resolver_cache (cache_key, payload, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, _result_to_payload(result), expires_at),
+            )
+        return True
+
+    def purge_expired(self) -> int:
+        """Delete expired entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM resolver_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        """Remove every stored entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM resolver_cache")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -11,6 +11,7 @@ from typing import Optional, List, Dict, Any
 from urllib.parse import urlparse, quote
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .data_types import (
     PDFSource, ResolutionResult, ResolutionStatus,
@@ -29,22 +30,56 @@ USER_AGENT = (
     'Chrome/131.0.0.0 Safari/537.36'
 )
 
+# Keep-alive connections per host in a resolver session (requests' default
+# is 10, which concurrent discovery can exhaust for api.crossref.org etc.)
+DEFAULT_POOL_MAXSIZE = 32
+
+
+def create_resolver_session(pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> requests.Session:
+    """Create an HTTP session configured for resolver API calls.
+
+    One session can be shared by several resolvers (and threads) so that
+    keep-alive connections to doi.org, CrossRef, NCBI and Unpaywall are
+    reused across documents.
+
+    Args:
+        pool_maxsize: Maximum pooled connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/json, text/html, application/pdf, */*'
+    })
+    return session
+
 
 class BaseResolver(ABC):
     """Abstract base class for PDF source resolvers."""
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    # Whether results are worth caching across runs; False for resolvers
+    # that only rewrite identifiers locally without any network call.
+    cacheable: bool = True
+
+    def __init__(
+        self,
+        timeout: int = DEFAULT_TIMEOUT,
+        session: Optional[requests.Session] = None
+    ):
         """Initialize resolver.
 
         Args:
             timeout: HTTP request timeout in seconds
+            session: Shared HTTP session (see create_resolver_session);
+                a private one is created if None
         """
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': USER_AGENT,
-            'Accept': 'application/json, text/html, application/pdf, */*'
-        })
+        self.session = session if session is not None else create_resolver_session()
 
     @property
     @abstractmethod
@@ -86,6 +121,8 @@ class BaseResolver(ABC):
 class DirectURLResolver(BaseResolver):
     """Resolver that uses existing PDF URL from database."""
 
+    cacheable = False
+
     @property
     def name(self) -> str:
         return "direct_url"
@@ -566,14 +603,20 @@ class UnpaywallResolver(BaseResolver):
 
     API_URL = "https://api.unpaywall.org/v2"
 
-    def __init__(self, email: str, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        email: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        session: Optional[requests.Session] = None
+    ):
         """Initialize Unpaywall resolver.
 
         Args:
             email: Email address for Unpaywall API (required)
             timeout: HTTP request timeout
+            session: Shared HTTP session (a private one is created if None)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, session)
         self.email = email
 
     @property
@@ -703,15 +746,17 @@ class CrossRefTitleResolver(BaseResolver):
     def __init__(
         self,
         timeout: int = DEFAULT_TIMEOUT,
-        min_similarity: float = 0.85
+        min_similarity: float = 0.85,
+        session: Optional[requests.Session] = None
     ):
         """Initialize CrossRef title resolver.
 
         Args:
             timeout: HTTP request timeout in seconds
             min_similarity: Minimum title similarity score to accept (0-1)
+            session: Shared HTTP session (a private one is created if None)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, session)
         self.min_similarity = min_similarity
 
     @property
@@ -975,13 +1020,17 @@ class OpenAthensResolver(BaseResolver):
        - Used by institutions with EZProxy-style systems
     """
 
+    # Only rewrites URLs locally; nothing to gain from caching
+    cacheable = False
+
     # OpenAthens Redirector base URL
     REDIRECTOR_BASE = "go.openathens.net/redirector"
 
     def __init__(
         self,
         proxy_base_url: str,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        session: Optional[requests.Session] = None
     ):
         """Initialize OpenAthens resolver.
 
@@ -991,8 +1040,9 @@ class OpenAthensResolver(BaseResolver):
                 - Proxy URL: "https://proxy.openathens.net"
                 - Domain only: "jcu.edu.au" (will use redirector)
             timeout: HTTP request timeout
+            session: Shared HTTP session (a private one is created if None)
         """
-        super().__init__(timeout)
+        super().__init__(timeout, session)
         self.proxy_base_url = self._normalize_url(proxy_base_url)
         self.is_redirector = self.REDIRECTOR_BASE in self.proxy_base_url.lower()
 
@@ -12,6 +12,7 @@ from .chunk_embedder import (
     DEFAULT_CHUNK_SIZE,
     DEFAULT_CHUNK_OVERLAP,
 )
+from .chunk_queue_worker import ChunkQueueWorker
 from .adaptive_chunker import adaptive_chunker
 from .fast_sentence_chunker import fast_sentence_chunker
 
@@ -22,6 +23,7 @@ __all__ = [
     'chunk_text',
     'DEFAULT_CHUNK_SIZE',
     'DEFAULT_CHUNK_OVERLAP',
+    'ChunkQueueWorker',
     'adaptive_chunker',
     'fast_sentence_chunker',
 ]
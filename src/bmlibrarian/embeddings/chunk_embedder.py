@@ -34,6 +34,7 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional, Callable, Literal
 
 from bmlibrarian.database import get_db_manager
+from bmlibrarian.db_vector import vector_param
 from bmlibrarian.embeddings.adaptive_chunker_optimized import adaptive_chunker_with_positions
 
 from ..config import get_ollama_host
@@ -850,7 +851,6 @@ class ChunkEmbedder:
 
                         # Store chunk with embedding
                         try:
-                            embedding_str = "[" + ",".join(map(str, embedding)) + "]"
                             cur.execute(
                                 """
                                 INSERT INTO semantic.chunks (
@@ -872,7 +872,7 @@ class ChunkEmbedder:
                                     chunk_pos.chunk_no,
                                     chunk_pos.start_pos,
                                     chunk_pos.end_pos,
-                                    embedding_str,
+                                    vector_param(conn, embedding),
                                 ),
                             )
                             chunks_created += 1
@@ -895,98 +895,45 @@ class ChunkEmbedder:
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         overlap: int = DEFAULT_CHUNK_OVERLAP,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        embed_batch_size: Optional[int] = None,
     ) -> Tuple[int, int]:
         """
         Process documents from the chunk queue.
 
+        Runs a ChunkQueueWorker: claiming, chunking, embedding and writing
+        overlap on separate threads, chunks from several documents share
+        embedding calls, and chunks are written with COPY. Documents are
+        claimed with FOR UPDATE SKIP LOCKED leases, so several worker
+        processes or hosts can drain the queue concurrently.
+
         Args:
             batch_size: Maximum number of documents to process.
             chunk_size: Chunk size to use.
             overlap: Chunk overlap to use.
             progress_callback: Optional callback(stage, current, total) for progress.
+            embed_batch_size: Chunk texts per embedding call
+                (default: ChunkQueueWorker's default).
 
         Returns:
             Tuple of (processed_count, failed_count).
         """
-        # Get queued documents
-        with self.db_manager.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT document_id
-                    FROM semantic.chunk_queue
-                    WHERE attempts < %s
-                    ORDER BY priority DESC, queued_at ASC
-                    LIMIT %s
-                    """,
-                    (MAX_RETRY_ATTEMPTS, batch_size),
-                )
-                queued_docs = [row[0] for row in cur.fetchall()]
-
-        if not queued_docs:
-            logger.info("No documents in chunk queue")
-            return (0, 0)
-
-        total_docs = len(queued_docs)
-        logger.info(f"Processing {total_docs} documents from queue")
-
-        processed = 0
-        failed = 0
-
-        for i, document_id in enumerate(queued_docs):
-            if progress_callback:
-                progress_callback("chunking", i + 1, total_docs)
-
-            try:
-                num_chunks = self.chunk_and_embed(
-                    document_id=document_id,
-                    chunk_size=chunk_size,
-                    overlap=overlap,
-                    overwrite=True,
-                )
-
-                if num_chunks > 0:
-                    # Success - remove from queue
-                    self._remove_from_queue(document_id)
-                    processed += 1
-                else:
-                    # No chunks created (e.g., no full_text)
-                    self._update_queue_error(
-                        document_id, "No chunks created (empty full_text?)"
-                    )
-                    failed += 1
-
-            except Exception as e:
-                logger.error(f"Failed to process document {document_id}: {e}")
-                self._update_queue_error(document_id, str(e))
-                failed += 1
-
-        logger.info(f"Queue processing complete: {processed} processed, {failed} failed")
-        return (processed, failed)
+        from bmlibrarian.embeddings.chunk_queue_worker import (
+            ChunkQueueWorker,
+            DEFAULT_EMBED_BATCH_SIZE,
+        )
 
-    def _remove_from_queue(self, document_id: int) -> None:
-        """Remove document from chunk queue after successful processing."""
-        with self.db_manager.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "DELETE FROM semantic.chunk_queue WHERE document_id = %s",
-                    (document_id,),
-                )
+        worker = ChunkQueueWorker(
+            self,
+            chunk_size=chunk_size,
+            overlap=overlap,
+            embed_batch_size=embed_batch_size or DEFAULT_EMBED_BATCH_SIZE,
+            max_attempts=MAX_RETRY_ATTEMPTS,
+        )
+        stats = worker.run(max_documents=batch_size, progress_callback=progress_callback)
 
-    def _update_queue_error(self, document_id: int, error: str) -> None:
-        """Update queue entry with error information."""
-        with self.db_manager.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    UPDATE semantic.chunk_queue
-                    SET attempts = attempts + 1,
-                        last_error = %s,
-                        last_attempt_at = NOW()
-                    WHERE document_id = %s
-                    """,
-                    (error[:1000], document_id),  # Truncate error to avoid overflow
-                )
+        if stats["claimed"] == 0:
+            logger.info("No documents in chunk queue")
+        return (stats["processed"], stats["failed"])
 
     def rechunk_all(
         self,
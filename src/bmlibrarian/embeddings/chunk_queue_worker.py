@@ -0,0 +1,683 @@
+"""
+Pipelined worker for draining semantic.chunk_queue.
+
+Processing the queue one document at a time leaves the embedding backend
+idle during database I/O and chunking, and the database idle during
+embedding. This worker splits the job into four stages connected by
+bounded queues, each running on its own thread:
+
+1. Claim: lease a handful of queued documents with
+   ``SELECT ... FOR UPDATE SKIP LOCKED`` and fetch their full text in
+   one query.
+2. Chunk: split each document with the adaptive sentence-aware chunker.
+3. Embed: pack chunks from several documents into full embedding batches.
+4. Write: replace the chunks of a group of finished documents with one
+   ``COPY`` into semantic.chunks and remove them from the queue in the
+   same transaction.
+
+Claims are leases, not long-lived row locks: a claimed entry has its
+last_attempt_at set to NOW() and is skipped by other claimers until the
+lease expires. Several worker processes, on one host or many, can
+therefore drain the queue together. A worker that dies leaves its leases
+to expire, after which the documents are picked up again. A worker whose
+pipeline stops early releases the leases it still holds, so unprocessed
+documents are immediately claimable by others.
+
+Example:
+    from bmlibrarian.embeddings import ChunkEmbedder, ChunkQueueWorker
+
+    embedder = ChunkEmbedder()
+    worker = ChunkQueueWorker(embedder, chunk_size=1000, overlap=100)
+    stats = worker.run(max_documents=500)
+    print(f"{stats['processed']} documents, {stats['chunks_created']} chunks")
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+
+from bmlibrarian.db_vector import (
+    VECTOR_TYPE_NAME,
+    format_vector_literal,
+    register_vector_adapters,
+    to_vector_array,
+)
+from bmlibrarian.embeddings.adaptive_chunker_optimized import (
+    ChunkWithPosition,
+    adaptive_chunker_with_positions,
+)
+
+if TYPE_CHECKING:
+    from bmlibrarian.embeddings.chunk_embedder import ChunkEmbedder
+
+logger = logging.getLogger(__name__)
+
+# Documents leased per claim query
+DEFAULT_CLAIM_SIZE = 16
+
+# Chunk texts per embedding backend call (across documents)
+DEFAULT_EMBED_BATCH_SIZE = 64
+
+# Documents written per COPY transaction
+DEFAULT_WRITE_BATCH_DOCUMENTS = 32
+
+# Items buffered between stages; bounds memory and applies backpressure
+DEFAULT_STAGE_QUEUE_DEPTH = 64
+
+# Seconds a claimed document stays invisible to other workers. Must exceed
+# the time a document spends in the pipeline; expired leases are re-claimed.
+DEFAULT_LEASE_SECONDS = 900
+
+# Queue entries with this many failed attempts are no longer claimed
+# (matches ChunkEmbedder's retry limit)
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Seconds a stage waits for more input before flushing a partial batch
+BATCH_FLUSH_WAIT_SECONDS = 0.05
+
+# Longest error message stored in chunk_queue.last_error
+MAX_ERROR_LENGTH = 1000
+
+NO_CHUNKS_ERROR = "No chunks created (empty full_text?)"
+
+CHUNK_COPY_COLUMNS = (
+    "document_id", "model_id", "chunk_size", "chunk_overlap",
+    "chunk_no", "start_pos", "end_pos", "embedding",
+)
+# Binary COPY needs exact column types (all integer columns are int4)
+CHUNK_COPY_TYPES = ["int4"] * 7 + [VECTOR_TYPE_NAME]
+
+# Marks the end of a stage's output
+_END = object()
+
+
+@dataclass
+class _QueuedDocument:
+    """A claimed document moving through the pipeline."""
+
+    document_id: int
+    full_text: Optional[str]
+    chunks: List[ChunkWithPosition] = field(default_factory=list)
+    embeddings: List[Optional[List[float]]] = field(default_factory=list)
+    pending: int = 0
+    failed: bool = False
+
+
+class ChunkQueueWorker:
+    """
+    Four-stage claim/chunk/embed/write pipeline over semantic.chunk_queue.
+
+    Uses the embedder's backend (create_embeddings_batch), database
+    manager and model ID, so results match ChunkEmbedder.chunk_and_embed
+    with overwrite=True.
+    """
+
+    def __init__(
+        self,
+        embedder: "ChunkEmbedder",
+        chunk_size: int,
+        overlap: int,
+        embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
+        claim_size: int = DEFAULT_CLAIM_SIZE,
+        write_batch_documents: int = DEFAULT_WRITE_BATCH_DOCUMENTS,
+        queue_depth: int = DEFAULT_STAGE_QUEUE_DEPTH,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        """
+        Initialize the worker.
+
+        Args:
+            embedder: ChunkEmbedder providing the backend, DB and model ID.
+            chunk_size: Target chunk size in characters.
+            overlap: Overlap between consecutive chunks.
+            embed_batch_size: Chunk texts per embedding call.
+            claim_size: Documents leased per claim query.
+            write_batch_documents: Documents written per transaction.
+            queue_depth: Capacity of each inter-stage queue.
+            lease_seconds: How long a claim hides a document from other workers.
+            max_attempts: Skip queue entries that failed this many times.
+
+        Raises:
+            ValueError: If chunk parameters or sizes are invalid.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        if overlap < 0:
+            raise ValueError(f"overlap cannot be negative, got {overlap}")
+        if overlap >= chunk_size:
+            raise ValueError(f"overlap ({overlap}) must be less than chunk_size ({chunk_size})")
+        for name, value in (
+            ("embed_batch_size", embed_batch_size),
+            ("claim_size", claim_size),
+            ("write_batch_documents", write_batch_documents),
+            ("queue_depth", queue_depth),
+            ("lease_seconds", lease_seconds),
+        ):
+            if value <= 0:
+                raise ValueError(f"{name} must be positive, got {value}")
+
+        self.embedder = embedder
+        self.db_manager = embedder.db_manager
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.embed_batch_size = embed_batch_size
+        self.claim_size = claim_size
+        self.write_batch_documents = write_batch_documents
+        self.queue_depth = queue_depth
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._stage_errors: List[BaseException] = []
+        self._processed = 0
+        self._failed = 0
+        self._claimed = 0
+        self._chunks_created = 0
+        self._embed_calls = 0
+        # Claimed documents not yet written or recorded as failed
+        self._outstanding: Set[int] = set()
+
+    # ------------------------------------------------------------------
+    # Database operations
+    # ------------------------------------------------------------------
+
+    def claim_documents(self, limit: int) -> List[Tuple[int, Optional[str]]]:
+        """
+        Lease up to ``limit`` queued documents and fetch their full text.
+
+        Rows locked by a concurrent claimer are skipped rather than waited
+        on, and rows leased within the last ``lease_seconds`` are not
+        eligible, so concurrent workers never claim the same document.
+
+        Args:
+            limit: Maximum documents to claim.
+
+        Returns:
+            (document_id, full_text) pairs in queue order; full_text is
+            None for documents without text.
+        """
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    WITH claimed AS (
+                        SELECT document_id
+                        FROM semantic.chunk_queue
+                        WHERE attempts < %s
+                          AND (last_attempt_at IS NULL
+                               OR last_attempt_at < NOW() - make_interval(secs => %s))
+                        ORDER BY priority DESC, queued_at ASC
+                        LIMIT %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    UPDATE semantic.chunk_queue q
+                    SET last_attempt_at = NOW()
+                    FROM claimed
+                    WHERE q.document_id = claimed.document_id
+                    RETURNING q.document_id, q.priority, q.queued_at
+                    """,
+                    (self.max_attempts, self.lease_seconds, limit),
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    return []
+                # UPDATE ... RETURNING does not preserve the CTE's order
+                rows.sort(key=lambda row: (-row[1], row[2]))
+                document_ids = [row[0] for row in rows]
+
+                cur.execute(
+                    """
+                    SELECT id, full_text FROM public.document
+                    WHERE id = ANY(%s) AND full_text IS NOT NULL AND full_text != ''
+                    """,
+                    (document_ids,),
+                )
+                texts = dict(cur.fetchall())
+
+        return [(doc_id, texts.get(doc_id)) for doc_id in document_ids]
+
+    def write_documents(self, documents: List[_QueuedDocument]) -> int:
+        """
+        Replace stored chunks for documents and dequeue them atomically.
+
+        Existing chunks with the same model and chunk parameters are
+        deleted, the new chunks are streamed in with one COPY, and the
+        queue entries are removed, all in one transaction. Embeddings are
+        sent as binary float32 when pgvector's adapters are available.
+
+        Args:
+            documents: Documents with at least one embedded chunk.
+
+        Returns:
+            Number of chunk rows written.
+        """
+        document_ids = [doc.document_id for doc in documents]
+        model_id = self.embedder.model_id
+        written = 0
+
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    DELETE FROM semantic.chunks
+                    WHERE document_id = ANY(%s)
+                      AND model_id = %s AND chunk_size = %s AND chunk_overlap = %s
+                    """,
+                    (document_ids, model_id, self.chunk_size, self.overlap),
+                )
+                binary = register_vector_adapters(conn)
+                copy_sql = (
+                    f"COPY semantic.chunks ({', '.join(CHUNK_COPY_COLUMNS)}) FROM STDIN"
+                    + (" (FORMAT BINARY)" if binary else "")
+                )
+                with cur.copy(copy_sql) as copy:
+                    if binary:
+                        copy.set_types(CHUNK_COPY_TYPES)
+                    for doc in documents:
+                        for chunk, embedding in zip(doc.chunks, doc.embeddings):
+                            if not embedding:
+                                continue
+                            copy.write_row((
+                                doc.document_id,
+                                model_id,
+                                self.chunk_size,
+                                self.overlap,
+                                chunk.chunk_no,
+                                chunk.start_pos,
+                                chunk.end_pos,
+                                to_vector_array(embedding) if binary
+                                else format_vector_literal(embedding),
+                            ))
+                            written += 1
+                cur.execute(
+                    "DELETE FROM semantic.chunk_queue WHERE document_id = ANY(%s)",
+                    (document_ids,),
+                )
+
+        return written
+
+    def record_failure(self, document_id: int, error: str) -> None:
+        """
+        Count a failed attempt against a queue entry.
+
+        The entry keeps its lease timestamp, so it is retried once the
+        lease expires (until max_attempts is reached).
+
+        Args:
+            document_id: Queue entry to update.
+            error: Error message to store.
+        """
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE semantic.chunk_queue
+                    SET attempts = attempts + 1,
+                        last_error = %s,
+                        last_attempt_at = NOW()
+                    WHERE document_id = %s
+                    """,
+                    (error[:MAX_ERROR_LENGTH], document_id),
+                )
+        with self._lock:
+            self._failed += 1
+
+    def release_documents(self, document_ids: List[int]) -> None:
+        """
+        Return claimed documents to the queue without counting an attempt.
+
+        Clears the lease so the documents can be claimed again at once,
+        instead of after ``lease_seconds``.
+
+        Args:
+            document_ids: Queue entries leased by this worker.
+        """
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    UPDATE semantic.chunk_queue
+                    SET last_attempt_at = NULL
+                    WHERE document_id = ANY(%s)
+                    """,
+                    (document_ids,),
+                )
+
+    # ------------------------------------------------------------------
+    # Pipeline
+    # ------------------------------------------------------------------
+
+    def run(
+        self,
+        max_documents: Optional[int] = None,
+        progress_callback: Optional[Callable[[str, int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Drain the queue until it is empty or ``max_documents`` are claimed.
+
+        Args:
+            max_documents: Maximum documents to claim (None for no limit).
+            progress_callback: Optional callback(stage, current, total),
+                called with stage "chunking" as documents finish. total is
+                max_documents, or the number claimed so far without a limit.
+
+        A failed embedding call is recorded against the documents in its
+        batch and the run continues. If a stage crashes, documents that
+        were claimed but not finished are released before raising.
+
+        Returns:
+            Statistics dictionary with processed, failed, claimed, released,
+            chunks_created, embed_calls, elapsed_seconds and
+            chunks_per_second.
+
+        Raises:
+            RuntimeError: If a pipeline stage crashed; the first stage
+                error is chained.
+        """
+        start = time.perf_counter()
+        self._stop.clear()
+        self._stage_errors.clear()
+        with self._lock:
+            self._outstanding.clear()
+
+        docs_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_depth)
+        chunked_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_depth)
+        embedded_q: "queue.Queue[Any]" = queue.Queue(maxsize=self.queue_depth)
+
+        def report() -> None:
+            if progress_callback:
+                with self._lock:
+                    done = self._processed + self._failed
+                    total = max_documents if max_documents is not None else self._claimed
+                progress_callback("chunking", done, total)
+
+        stages = [
+            ("claim", self._claim_stage, (docs_q, max_documents)),
+            ("chunk", self._chunk_stage, (docs_q, chunked_q)),
+            ("embed", self._embed_stage, (chunked_q, embedded_q)),
+            ("write", self._write_stage, (embedded_q, report)),
+        ]
+        threads = [
+            threading.Thread(
+                target=self._run_stage, args=(name, target, args, out_q),
+                name=f"chunk-queue-{name}", daemon=True,
+            )
+            for (name, target, args), out_q in zip(
+                stages, [docs_q, chunked_q, embedded_q, None]
+            )
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        released = self._release_outstanding()
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            stats = {
+                "processed": self._processed,
+                "failed": self._failed,
+                "claimed": self._claimed,
+                "released": released,
+                "chunks_created": self._chunks_created,
+                "embed_calls": self._embed_calls,
+                "elapsed_seconds": elapsed,
+                "chunks_per_second": self._chunks_created / elapsed if elapsed > 0 else 0.0,
+            }
+
+        if self._stage_errors:
+            raise RuntimeError(
+                f"Chunk queue pipeline stage failed: {self._stage_errors[0]}"
+            ) from self._stage_errors[0]
+
+        logger.info(
+            f"Queue processing complete: {stats['processed']} processed, "
+            f"{stats['failed']} failed, {stats['chunks_created']} chunks "
+            f"({stats['chunks_per_second']:.1f} chunks/sec)"
+        )
+        return stats
+
+    def _release_outstanding(self) -> int:
+        """
+        Release leases on claimed documents the pipeline did not finish.
+
+        Returns:
+            Number of documents released (0 if the release itself failed;
+            their leases then expire as usual).
+        """
+        with self._lock:
+            unfinished = sorted(self._outstanding)
+            self._outstanding.clear()
+        if not unfinished:
+            return 0
+        try:
+            self.release_documents(unfinished)
+        except Exception as e:
+            logger.error(
+                f"Failed to release {len(unfinished)} unprocessed documents; "
+                f"their leases expire after {self.lease_seconds}s: {e}"
+            )
+            return 0
+        logger.warning(f"Released {len(unfinished)} claimed but unprocessed documents")
+        return len(unfinished)
+
+    def _fail_document(self, document_id: int, error: str) -> None:
+        """Record a failed attempt for a claimed document and settle it."""
+        self.record_failure(document_id, error)
+        with self._lock:
+            self._outstanding.discard(document_id)
+
+    def _run_stage(
+        self,
+        name: str,
+        target: Callable[..., None],
+        args: tuple,
+        out_q: "Optional[queue.Queue[Any]]",
+    ) -> None:
+        """Run a stage, stopping the pipeline and closing its output on exit."""
+        try:
+            target(*args)
+        except BaseException as e:
+            logger.error(f"Chunk queue {name} stage failed: {e}", exc_info=True)
+            with self._lock:
+                self._stage_errors.append(e)
+            self._stop.set()
+        finally:
+            if out_q is not None:
+                self._put(out_q, _END, force=True)
+
+    def _put(self, out_q: "queue.Queue[Any]", item: Any, force: bool = False) -> bool:
+        """
+        Put with backpressure, giving up if the pipeline is stopping.
+
+        Args:
+            out_q: Destination queue.
+            item: Item to enqueue.
+            force: Keep trying after a stop (used for end markers, which
+                downstream stages still drain).
+
+        Returns:
+            True if the item was enqueued.
+        """
+        while True:
+            try:
+                out_q.put(item, timeout=BATCH_FLUSH_WAIT_SECONDS)
+                return True
+            except queue.Full:
+                if self._stop.is_set() and not force:
+                    return False
+
+    def _claim_stage(
+        self, docs_q: "queue.Queue[Any]", max_documents: Optional[int]
+    ) -> None:
+        """Lease documents until the queue is empty or the limit is reached."""
+        while not self._stop.is_set():
+            with self._lock:
+                remaining = (
+                    self.claim_size if max_documents is None
+                    else min(self.claim_size, max_documents - self._claimed)
+                )
+            if remaining <= 0:
+                return
+
+            claimed = self.claim_documents(remaining)
+            if not claimed:
+                return
+            with self._lock:
+                self._claimed += len(claimed)
+                self._outstanding.update(document_id for document_id, _ in claimed)
+
+            for document_id, full_text in claimed:
+                if not self._put(docs_q, _QueuedDocument(document_id, full_text)):
+                    return
+
+    def _chunk_stage(
+        self, docs_q: "queue.Queue[Any]", chunked_q: "queue.Queue[Any]"
+    ) -> None:
+        """Split each document's full text into positioned chunks."""
+        while True:
+            doc = docs_q.get()
+            if doc is _END:
+                return
+            if self._stop.is_set():
+                continue
+
+            if doc.full_text:
+                try:
+                    doc.chunks = adaptive_chunker_with_positions(
+                        doc.full_text, max_chars=self.chunk_size, overlap_chars=self.overlap
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to chunk document {doc.document_id}: {e}")
+                    self._fail_document(doc.document_id, str(e))
+                    continue
+            # Text is no longer needed once positions are known
+            doc.full_text = None
+
+            if not doc.chunks:
+                self._fail_document(doc.document_id, NO_CHUNKS_ERROR)
+                continue
+
+            doc.embeddings = [None] * len(doc.chunks)
+            doc.pending = len(doc.chunks)
+            self._put(chunked_q, doc)
+
+    def _embed_stage(
+        self, chunked_q: "queue.Queue[Any]", embedded_q: "queue.Queue[Any]"
+    ) -> None:
+        """Embed chunks in full batches that may span several documents."""
+        # (document, chunk index) pairs awaiting embedding, in arrival order
+        pending: List[Tuple[_QueuedDocument, int]] = []
+        upstream_done = False
+
+        while not upstream_done or pending:
+            # Fill up to a full batch; flush a partial batch once input stalls
+            while not upstream_done and len(pending) < self.embed_batch_size:
+                try:
+                    doc = chunked_q.get(
+                        timeout=BATCH_FLUSH_WAIT_SECONDS if pending else None
+                    )
+                except queue.Empty:
+                    break
+                if doc is _END:
+                    upstream_done = True
+                elif not self._stop.is_set():
+                    pending.extend((doc, i) for i in range(len(doc.chunks)))
+
+            if self._stop.is_set():
+                pending.clear()
+                continue
+            if not pending:
+                continue
+
+            batch = pending[:self.embed_batch_size]
+            del pending[:self.embed_batch_size]
+            try:
+                embeddings = self.embedder.create_embeddings_batch(
+                    [doc.chunks[i].text for doc, i in batch]
+                )
+            except Exception as e:
+                # Fail the documents in this batch; the rest keep going
+                logger.error(f"Embedding call for {len(batch)} chunks failed: {e}")
+                for doc, _ in batch:
+                    if not doc.failed:
+                        doc.failed = True
+                        self._fail_document(doc.document_id, f"Embedding failed: {e}")
+                pending = [(doc, i) for doc, i in pending if not doc.failed]
+                continue
+            with self._lock:
+                self._embed_calls += 1
+
+            for (doc, i), embedding in zip(batch, embeddings):
+                doc.embeddings[i] = embedding
+                doc.pending -= 1
+                if doc.pending == 0:
+                    self._put(embedded_q, doc)
+
+    def _write_stage(
+        self, embedded_q: "queue.Queue[Any]", report: Callable[[], None]
+    ) -> None:
+        """Write finished documents in multi-document transactions."""
+        upstream_done = False
+        while not upstream_done:
+            group: List[_QueuedDocument] = []
+            while len(group) < self.write_batch_documents:
+                try:
+                    doc = embedded_q.get(
+                        timeout=BATCH_FLUSH_WAIT_SECONDS if group else None
+                    )
+                except queue.Empty:
+                    break
+                if doc is _END:
+                    upstream_done = True
+                    break
+                group.append(doc)
+
+            if self._stop.is_set():
+                continue
+
+            writable = []
+            for doc in group:
+                if any(doc.embeddings):
+                    writable.append(doc)
+                else:
+                    self._fail_document(doc.document_id, "All chunk embeddings failed")
+            if writable:
+                self._write_group(writable)
+            if group:
+                report()
+
+    def _write_group(self, documents: List[_QueuedDocument]) -> None:
+        """Write a group, falling back to per-document writes on failure."""
+        try:
+            written = self.write_documents(documents)
+        except Exception as e:
+            if len(documents) == 1:
+                logger.error(
+                    f"Failed to store chunks for document {documents[0].document_id}: {e}"
+                )
+                self._fail_document(documents[0].document_id, str(e))
+                return
+            # Isolate the offending document instead of failing the group
+            logger.warning(f"Group write of {len(documents)} documents failed: {e}")
+            for doc in documents:
+                self._write_group([doc])
+            return
+
+        for doc in documents:
+            missing = sum(1 for embedding in doc.embeddings if not embedding)
+            if missing:
+                logger.warning(
+                    f"Document {doc.document_id}: {missing}/{len(doc.chunks)} "
+                    f"chunk embeddings failed"
+                )
+        with self._lock:
+            self._processed += len(documents)
+            self._chunks_created += written
+            self._outstanding.difference_update(doc.document_id for doc in documents)
@@ -19,6 +19,7 @@ from pathlib import Path
 
 from bmlibrarian.config import get_ollama_host
 from bmlibrarian.database import get_db_manager
+from bmlibrarian.db_vector import vector_param
 from bmlibrarian.llm import LLMClient, list_ollama_models
 
 logger = logging.getLogger(__name__)
@@ -313,11 +314,10 @@ class DocumentEmbedder:
                         return chunk_id
 
                     # Insert embedding
-                    embedding_str = '[' + ','.join(map(str, embedding)) + ']'
                     cur.execute(f"""
                         INSERT INTO {embedding_table} (chunk_id, model_id, embedding)
                         VALUES (%s, %s, %s)
-                    """, (chunk_id, self.model_id, embedding_str))
+                    """, (chunk_id, self.model_id, vector_param(conn, embedding)))
 
                     logger.debug(f"Stored embedding for chunk {chunk_id}")
                     return chunk_id
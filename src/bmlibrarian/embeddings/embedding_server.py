@@ -29,6 +29,8 @@ from dataclasses import dataclass
 
 import requests
 
+from bmlibrarian.llm.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 # Default configuration
@@ -70,6 +72,7 @@ class EmbeddingServer:
     - Configurable timeouts
     - Connection health checking
     - Detailed error logging
+    - Persistent embedding cache (when enabled in config)
     """
 
     def __init__(
@@ -78,6 +81,7 @@ class EmbeddingServer:
         model: str = DEFAULT_MODEL,
         timeout: float = DEFAULT_TIMEOUT_SECONDS,
         connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        use_embedding_cache: bool = True,
     ) -> None:
         """
         Initialize the embedding server client.
@@ -87,6 +91,8 @@ class EmbeddingServer:
             model: Embedding model name (default: snowflake-arctic-embed2:latest).
             timeout: Request timeout in seconds (default: 120).
             connect_timeout: Connection timeout in seconds (default: 5).
+            use_embedding_cache: Consult the global embedding cache (if
+                enabled in config) before calling the server.
         """
         self.config = EmbeddingServerConfig(
             base_url=base_url.rstrip("/"),
@@ -95,6 +101,9 @@ class EmbeddingServer:
             connect_timeout=connect_timeout,
         )
         self._session = requests.Session()
+        self._embedding_cache: Optional[EmbeddingCache] = (
+            get_embedding_cache() if use_embedding_cache else None
+        )
         logger.info(
             f"EmbeddingServer initialized: {self.config.base_url} "
             f"model={self.config.model}"
@@ -160,6 +169,8 @@ class EmbeddingServer:
         This is more efficient than calling embed() multiple times as it
         uses Ollama's native batch embedding support.
 
+        Texts already in the embedding cache are not sent to the server.
+
         Args:
             texts: List of texts to embed.
 
@@ -170,6 +181,22 @@ class EmbeddingServer:
         if not texts:
             return []
 
+        if self._embedding_cache is not None:
+            return self._embedding_cache.get_or_compute(
+                self.config.model, texts, self._embed_batch_uncached
+            )
+        return self._embed_batch_uncached(texts)
+
+    def _embed_batch_uncached(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed texts with one request to the server, bypassing the cache.
+
+        Args:
+            texts: List of texts to embed.
+
+        Returns:
+            List of embedding vectors (or None for failed/empty texts).
+        """
         # Track valid texts and their indices
         valid_texts: List[str] = []
         valid_indices: List[int] = []
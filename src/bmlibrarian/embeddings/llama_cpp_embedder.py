@@ -22,6 +22,8 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 
+from bmlibrarian.llm.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 # Default model path - can be overridden
@@ -49,6 +51,7 @@ class LlamaCppEmbedder:
         n_batch: int = 512,
         n_threads: Optional[int] = None,
         verbose: bool = False,
+        use_embedding_cache: bool = True,
     ) -> None:
         """
         Initialize the LlamaCpp embedder.
@@ -59,6 +62,8 @@ class LlamaCppEmbedder:
             n_batch: Batch size for prompt processing.
             n_threads: Number of CPU threads (None = auto-detect).
             verbose: Enable verbose llama.cpp output.
+            use_embedding_cache: Consult the global embedding cache (if
+                enabled in config) before running the model.
 
         Raises:
             ImportError: If llama-cpp-python is not installed.
@@ -89,6 +94,11 @@ class LlamaCppEmbedder:
 
         self.model_path = model_path
         self.n_ctx = n_ctx
+        self._embedding_cache: Optional[EmbeddingCache] = (
+            get_embedding_cache() if use_embedding_cache else None
+        )
+        # Keyed by GGUF file name, which for Ollama blobs is the weights' hash
+        self._cache_model_key = f"llama_cpp:{model_file.name}"
         logger.info(f"LlamaCpp embedder initialized (n_ctx={n_ctx})")
 
     def embed(self, text: str) -> Optional[List[float]]:
@@ -105,6 +115,15 @@ class LlamaCppEmbedder:
             logger.warning("Cannot embed empty text")
             return None
 
+        if self._embedding_cache is not None:
+            return self._embedding_cache.get_or_compute(
+                self._cache_model_key, [text],
+                lambda batch: [self._embed_uncached(batch[0])],
+            )[0]
+        return self._embed_uncached(text)
+
+    def _embed_uncached(self, text: str) -> Optional[List[float]]:
+        """Run the model on one non-empty text, bypassing the cache."""
         try:
             # llama-cpp-python's embed() method
             embedding = self.model.embed(text)
@@ -138,11 +157,19 @@ class LlamaCppEmbedder:
         if not texts:
             return []
 
+        if self._embedding_cache is not None:
+            return self._embedding_cache.get_or_compute(
+                self._cache_model_key, texts, self._embed_batch_uncached
+            )
+        return self._embed_batch_uncached(texts)
+
+    def _embed_batch_uncached(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Embed texts one model call at a time, bypassing the cache."""
         results: List[Optional[List[float]]] = []
 
         for text in texts:
             if text and text.strip():
-                embedding = self.embed(text)
+                embedding = self._embed_uncached(text)
                 results.append(embedding)
             else:
                 results.append(None)
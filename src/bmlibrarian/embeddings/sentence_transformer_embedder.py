@@ -21,6 +21,8 @@ Usage:
 import logging
 from typing import List, Optional
 
+from bmlibrarian.llm.embedding_cache import EmbeddingCache, get_embedding_cache
+
 logger = logging.getLogger(__name__)
 
 # Default model - snowflake-arctic-embed2 large variant
@@ -43,6 +45,7 @@ class SentenceTransformerEmbedder:
         model_name: str = DEFAULT_ST_MODEL,
         device: Optional[str] = None,
         trust_remote_code: bool = True,
+        use_embedding_cache: bool = True,
     ) -> None:
         """
         Initialize the sentence-transformers embedder.
@@ -51,6 +54,8 @@ class SentenceTransformerEmbedder:
             model_name: HuggingFace model name or path.
             device: Device to use ('cpu', 'cuda', 'mps', or None for auto).
             trust_remote_code: Whether to trust remote code (required for some models).
+            use_embedding_cache: Consult the global embedding cache (if
+                enabled in config) before running the model.
 
         Raises:
             ImportError: If sentence-transformers is not installed.
@@ -72,6 +77,12 @@ class SentenceTransformerEmbedder:
 
         self.model_name = model_name
         self._embedding_dim = self.model.get_sentence_embedding_dimension()
+        self._embedding_cache: Optional[EmbeddingCache] = (
+            get_embedding_cache() if use_embedding_cache else None
+        )
+        # Vectors can differ slightly from Ollama's for the same weights,
+        # so sentence-transformers entries get their own cache namespace
+        self._cache_model_key = f"sentence_transformers:{model_name}"
 
         logger.info(
             f"SentenceTransformerEmbedder initialized: {model_name} "
@@ -92,6 +103,15 @@ class SentenceTransformerEmbedder:
             logger.warning("Cannot embed empty text")
             return None
 
+        if self._embedding_cache is not None:
+            return self._embedding_cache.get_or_compute(
+                self._cache_model_key, [text],
+                lambda batch: [self._embed_uncached(batch[0])],
+            )[0]
+        return self._embed_uncached(text)
+
+    def _embed_uncached(self, text: str) -> Optional[List[float]]:
+        """Run the model on one non-empty text, bypassing the cache."""
         try:
             # encode() returns numpy array, convert to list
             embedding = self.model.encode(text, convert_to_numpy=True)
@@ -116,6 +136,14 @@ class SentenceTransformerEmbedder:
         if not texts:
             return []
 
+        if self._embedding_cache is not None:
+            return self._embedding_cache.get_or_compute(
+                self._cache_model_key, texts, self._embed_batch_uncached
+            )
+        return self._embed_batch_uncached(texts)
+
+    def _embed_batch_uncached(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """Encode texts in one model call, bypassing the cache."""
         # Track which texts are valid
         valid_texts = []
         valid_indices = []
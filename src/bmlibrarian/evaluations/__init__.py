@@ -103,6 +103,16 @@ from .store import (
     EvaluationStore,
 )
 
+# Distributed work queue
+from .work_queue import (
+    WorkItemStatus,
+    WorkQueueStatus,
+    LeaseRecovery,
+    RunWorkQueue,
+    LeaseHeartbeat,
+    make_worker_id,
+)
+
 __all__ = [
     # Enums
     "EvaluationType",
@@ -135,4 +145,12 @@ __all__ = [
     "DocumentEvaluation",
     "Checkpoint",
     "EvaluationStore",
+
+    # Distributed work queue
+    "WorkItemStatus",
+    "WorkQueueStatus",
+    "LeaseRecovery",
+    "RunWorkQueue",
+    "LeaseHeartbeat",
+    "make_worker_id",
 ]
@@ -576,12 +576,18 @@ class EvaluationStore:
         """
         Save multiple evaluations in a batch.
 
+        All evaluations are written on one connection and committed together,
+        so a batch is either fully persisted or not at all. Distributed
+        workers (see work_queue.RunWorkQueue) rely on this when they mark
+        their claimed documents done after the batch is saved.
+
         Args:
             run_id: Parent run ID
             evaluations: List of evaluation dicts with keys:
                 - document_id (required)
                 - evaluation_data (required)
                 - primary_score (optional)
+                - evaluator_id (optional)
                 - confidence (optional)
                 - reasoning (optional)
                 - processing_time_ms (optional)
@@ -589,22 +595,85 @@ class EvaluationStore:
             validate: Whether to validate each evaluation
 
         Returns:
-            List of evaluation IDs
+            List of evaluation IDs, in input order
+
+        Raises:
+            ValueError: If any evaluation_data fails validation
+            RuntimeError: If database operation fails
         """
-        eval_ids = []
+        if not evaluations:
+            return []
+
+        eval_type_str = (
+            evaluation_type.value
+            if isinstance(evaluation_type, EvaluationType)
+            else evaluation_type
+        )
+
+        rows = []
         for eval_dict in evaluations:
-            eval_id = self.save_evaluation(
-                run_id=run_id,
-                document_id=eval_dict["document_id"],
-                evaluation_type=evaluation_type,
-                evaluation_data=eval_dict["evaluation_data"],
-                primary_score=eval_dict.get("primary_score"),
-                confidence=eval_dict.get("confidence"),
-                reasoning=eval_dict.get("reasoning"),
-                processing_time_ms=eval_dict.get("processing_time_ms"),
-                validate=validate,
+            evaluation_data = eval_dict["evaluation_data"]
+            if validate:
+                is_valid, error = validate_evaluation_data(eval_type_str, evaluation_data)
+                if not is_valid:
+                    raise ValueError(
+                        f"Invalid evaluation data for doc={eval_dict['document_id']}: {error}"
+                    )
+
+            primary_score = eval_dict.get("primary_score")
+            if primary_score is None:
+                primary_score = extract_primary_score(eval_type_str, evaluation_data)
+
+            evaluator_id = eval_dict.get("evaluator_id")
+            confidence = eval_dict.get("confidence")
+            processing_time_ms = eval_dict.get("processing_time_ms")
+            rows.append((
+                int(run_id),
+                int(eval_dict["document_id"]),
+                eval_type_str,
+                float(primary_score) if primary_score is not None else None,
+                json.dumps(evaluation_data, cls=DateTimeEncoder),
+                int(evaluator_id) if evaluator_id is not None else None,
+                float(confidence) if confidence is not None else None,
+                eval_dict.get("reasoning"),
+                int(processing_time_ms) if processing_time_ms is not None else None,
+            ))
+
+        query = """
+            SELECT evaluations.save_evaluation(
+                %s::BIGINT,
+                %s::BIGINT,
+                %s::VARCHAR,
+                %s::NUMERIC,
+                %s::JSONB,
+                %s::INTEGER,
+                %s::NUMERIC,
+                %s::TEXT,
+                %s::INTEGER
+            )
+        """
+
+        eval_ids: List[int] = []
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    for row in rows:
+                        cur.execute(query, row)
+                        result = cur.fetchone()
+                        if result is None:
+                            raise RuntimeError(
+                                f"save_evaluation function returned NULL for "
+                                f"run={run_id}, doc={row[1]}"
+                            )
+                        eval_ids.append(result[0])
+                conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to save evaluation batch for run={run_id} "
+                f"({len(rows)} documents): {e}",
+                exc_info=True
             )
-            eval_ids.append(eval_id)
+            raise RuntimeError(f"Database error saving evaluation batch: {e}") from e
 
         logger.info(f"Saved batch of {len(eval_ids)} evaluations for run {run_id}")
         return eval_ids
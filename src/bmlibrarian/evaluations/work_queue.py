@@ -0,0 +1,676 @@
+"""
+RunWorkQueue: Distributed work queue for evaluation runs.
+
+Lets several worker processes, on one or many machines, share a single
+evaluation run. The coordinating process enqueues the document ids that
+still need an evaluation; every worker then:
+
+1. Claims a small batch of ids with ``FOR UPDATE SKIP LOCKED`` so that
+   concurrent workers never block on, or double-claim, the same rows
+2. Holds a time-limited lease on its claims, renewed by heartbeats
+   (see LeaseHeartbeat)
+3. Writes results through EvaluationStore.save_evaluations_batch() and
+   marks the claimed ids done
+
+A worker that crashes or loses its connection simply stops renewing its
+lease. recover_abandoned_leases() hands expired claims back to the queue,
+using the same "already evaluated?" test as checkpoint resume
+(evaluations.get_unevaluated_documents) so that work saved just before a
+crash is not repeated.
+
+Backed by evaluations.run_work_items (migration 033).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from .schemas import EvaluationType, CheckpointType
+
+if TYPE_CHECKING:
+    from .store import EvaluationStore
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a claim stays valid without a heartbeat
+DEFAULT_LEASE_SECONDS = 300
+
+# Heartbeats per lease period; renewing well before expiry tolerates a
+# missed beat or two (slow database, GC pause) without losing the lease
+HEARTBEATS_PER_LEASE = 3
+
+# Claims per worker round trip
+DEFAULT_CLAIM_BATCH_SIZE = 8
+
+# Claims of one document before it is marked failed instead of re-queued
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class WorkItemStatus(Enum):
+    """Status of a document in the run work queue."""
+    PENDING = "pending"
+    CLAIMED = "claimed"
+    DONE = "done"
+    FAILED = "failed"
+
+
+def make_worker_id() -> str:
+    """
+    Generate a worker id that is unique across hosts and processes.
+
+    Returns:
+        Worker id of the form "<hostname>:<pid>:<random>"
+    """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@dataclass
+class WorkQueueStatus:
+    """Snapshot of a run's work queue."""
+    pending: int = 0
+    claimed: int = 0
+    done: int = 0
+    failed: int = 0
+    expired_leases: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of enqueued documents."""
+        return self.pending + self.claimed + self.done + self.failed
+
+    @property
+    def remaining(self) -> int:
+        """Documents not yet finished (pending or claimed)."""
+        return self.pending + self.claimed
+
+    @property
+    def is_drained(self) -> bool:
+        """Check if every enqueued document is done or failed."""
+        return self.remaining == 0
+
+
+@dataclass
+class LeaseRecovery:
+    """Outcome of recovering abandoned leases."""
+    requeued: int = 0
+    completed: int = 0
+    failed: int = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of recovered claims."""
+        return self.requeued + self.completed + self.failed
+
+
+class RunWorkQueue:
+    """
+    PostgreSQL-backed work queue shared by workers of one evaluation run.
+
+    Each instance represents one worker (identified by ``worker_id``).
+    Instances are thread-safe as long as the underlying DatabaseManager
+    hands out a connection per call.
+
+    Usage:
+        from bmlibrarian.evaluations import EvaluationStore, EvaluationType
+        from bmlibrarian.evaluations.work_queue import RunWorkQueue, LeaseHeartbeat
+
+        store = EvaluationStore(db)
+        queue = RunWorkQueue(store)
+
+        # Coordinator
+        queue.enqueue_documents(run_id, doc_ids, EvaluationType.RELEVANCE_SCORE)
+
+        # Every worker
+        with LeaseHeartbeat(queue):
+            while True:
+                doc_ids = queue.claim_documents(run_id, EvaluationType.RELEVANCE_SCORE)
+                if not doc_ids:
+                    break
+                evaluations = [...]  # evaluate the claimed documents
+                queue.complete_documents(
+                    run_id, EvaluationType.RELEVANCE_SCORE, evaluations
+                )
+    """
+
+    def __init__(
+        self,
+        store: "EvaluationStore",
+        worker_id: Optional[str] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Initialize the work queue for one worker.
+
+        Args:
+            store: EvaluationStore used for saving evaluations
+            worker_id: Unique worker id (generated if not provided)
+            lease_seconds: Seconds a claim stays valid without a heartbeat
+            max_attempts: Claims of one document before it is marked failed
+
+        Raises:
+            ValueError: If lease_seconds or max_attempts is not positive
+        """
+        if lease_seconds <= 0:
+            raise ValueError(f"lease_seconds must be positive, got {lease_seconds}")
+        if max_attempts <= 0:
+            raise ValueError(f"max_attempts must be positive, got {max_attempts}")
+
+        self.store = store
+        self.db = store.db
+        self.worker_id = worker_id or make_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    @staticmethod
+    def _type_str(evaluation_type: EvaluationType) -> str:
+        """Get the string value of an evaluation type."""
+        return (
+            evaluation_type.value
+            if isinstance(evaluation_type, EvaluationType)
+            else evaluation_type
+        )
+
+    # =========================================================================
+    # Coordinator
+    # =========================================================================
+
+    def enqueue_documents(
+        self,
+        run_id: int,
+        document_ids: List[int],
+        evaluation_type: EvaluationType,
+    ) -> int:
+        """
+        Add documents to a run's work queue.
+
+        Documents that already have an evaluation of this type in the run are
+        skipped, and documents already in the queue are left untouched, so
+        calling this again after a restart is safe.
+
+        Args:
+            run_id: Run ID
+            document_ids: Documents to evaluate
+            evaluation_type: Evaluation type the workers will produce
+
+        Returns:
+            Number of newly enqueued documents
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        if not document_ids:
+            return 0
+
+        query = """
+            INSERT INTO evaluations.run_work_items (run_id, evaluation_type, document_id)
+            SELECT %s, %s, u.document_id
+            FROM evaluations.get_unevaluated_documents(
+                %s::BIGINT, %s::BIGINT[], %s::VARCHAR
+            ) AS u(document_id)
+            ON CONFLICT (run_id, evaluation_type, document_id) DO NOTHING
+        """
+
+        eval_type_str = self._type_str(evaluation_type)
+        doc_ids = sorted({int(doc_id) for doc_id in document_ids})
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (
+                        int(run_id), eval_type_str,
+                        int(run_id), doc_ids, eval_type_str,
+                    ))
+                    inserted = cur.rowcount
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to enqueue documents for run={run_id}: {e}")
+            raise RuntimeError(f"Database error enqueueing documents: {e}") from e
+
+        logger.info(
+            f"Enqueued {inserted} of {len(doc_ids)} documents for run={run_id}, "
+            f"type={eval_type_str}"
+        )
+        return inserted
+
+    def get_status(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+    ) -> WorkQueueStatus:
+        """
+        Count a run's work items by status.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+
+        Returns:
+            WorkQueueStatus snapshot
+        """
+        query = """
+            SELECT status, COUNT(*),
+                   COUNT(*) FILTER (WHERE lease_expires_at < NOW())
+            FROM evaluations.run_work_items
+            WHERE run_id = %s AND evaluation_type = %s
+            GROUP BY status
+        """
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (int(run_id), self._type_str(evaluation_type)))
+                rows = cur.fetchall()
+
+        status = WorkQueueStatus()
+        for item_status, count, expired in rows:
+            if item_status == WorkItemStatus.CLAIMED.value:
+                status.expired_leases = expired
+            setattr(status, item_status, count)
+        return status
+
+    def sync_run_progress(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+    ) -> WorkQueueStatus:
+        """
+        Copy queue progress into the run's documents_processed counter.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+
+        Returns:
+            WorkQueueStatus snapshot used for the update
+        """
+        status = self.get_status(run_id, evaluation_type)
+        self.store.update_run_progress(
+            run_id,
+            documents_processed=status.done + status.failed,
+        )
+        return status
+
+    # =========================================================================
+    # Workers
+    # =========================================================================
+
+    def claim_documents(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+        limit: int = DEFAULT_CLAIM_BATCH_SIZE,
+    ) -> List[int]:
+        """
+        Claim up to ``limit`` pending documents for this worker.
+
+        Rows locked by another worker's in-flight claim are skipped rather
+        than waited on, so any number of workers can claim concurrently.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+            limit: Maximum number of documents to claim
+
+        Returns:
+            Claimed document IDs in ascending order (empty when nothing is pending)
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        if limit <= 0:
+            return []
+
+        query = """
+            WITH next_items AS (
+                SELECT document_id
+                FROM evaluations.run_work_items
+                WHERE run_id = %s AND evaluation_type = %s AND status = 'pending'
+                ORDER BY document_id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE evaluations.run_work_items w
+            SET status = 'claimed',
+                worker_id = %s,
+                lease_expires_at = NOW() + make_interval(secs => %s),
+                heartbeat_at = NOW(),
+                attempts = w.attempts + 1,
+                updated_at = NOW()
+            FROM next_items
+            WHERE w.run_id = %s
+              AND w.evaluation_type = %s
+              AND w.document_id = next_items.document_id
+            RETURNING w.document_id
+        """
+
+        eval_type_str = self._type_str(evaluation_type)
+
+        try:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, (
+                        int(run_id), eval_type_str, int(limit),
+                        self.worker_id, self.lease_seconds,
+                        int(run_id), eval_type_str,
+                    ))
+                    claimed = sorted(row[0] for row in cur.fetchall())
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id} failed to claim documents: {e}")
+            raise RuntimeError(f"Database error claiming documents: {e}") from e
+
+        if claimed:
+            logger.debug(
+                f"Worker {self.worker_id} claimed {len(claimed)} documents "
+                f"for run={run_id}"
+            )
+        return claimed
+
+    def heartbeat(self, run_id: Optional[int] = None) -> int:
+        """
+        Renew the lease on every claim held by this worker.
+
+        Args:
+            run_id: Optional run ID to restrict renewal to
+
+        Returns:
+            Number of claims renewed
+        """
+        conditions = ["worker_id = %s", "status = 'claimed'"]
+        params: List[Any] = [self.lease_seconds, self.worker_id]
+        if run_id is not None:
+            conditions.append("run_id = %s")
+            params.append(int(run_id))
+
+        query = f"""
+            UPDATE evaluations.run_work_items
+            SET lease_expires_at = NOW() + make_interval(secs => %s),
+                heartbeat_at = NOW()
+            WHERE {' AND '.join(conditions)}
+        """
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, tuple(params))
+                renewed = cur.rowcount
+            conn.commit()
+        return renewed
+
+    def complete_documents(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+        evaluations: List[Dict[str, Any]],
+        validate: bool = True,
+    ) -> List[int]:
+        """
+        Save evaluations for claimed documents and mark them done.
+
+        Evaluations are written first, through
+        EvaluationStore.save_evaluations_batch(). If the worker dies before
+        the items are marked done, recover_abandoned_leases() finds the saved
+        evaluations and marks the items done instead of re-queueing them.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+            evaluations: Evaluation dicts as accepted by save_evaluations_batch()
+            validate: Whether to validate each evaluation
+
+        Returns:
+            List of evaluation IDs
+
+        Raises:
+            ValueError: If any evaluation fails validation
+            RuntimeError: If database operation fails
+        """
+        if not evaluations:
+            return []
+
+        eval_ids = self.store.save_evaluations_batch(
+            run_id=run_id,
+            evaluations=evaluations,
+            evaluation_type=evaluation_type,
+            validate=validate,
+        )
+
+        query = """
+            UPDATE evaluations.run_work_items
+            SET status = 'done', lease_expires_at = NULL, last_error = NULL,
+                updated_at = NOW()
+            WHERE run_id = %s AND evaluation_type = %s AND document_id = ANY(%s)
+        """
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (
+                    int(run_id),
+                    self._type_str(evaluation_type),
+                    [int(e["document_id"]) for e in evaluations],
+                ))
+            conn.commit()
+
+        return eval_ids
+
+    def release_documents(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+        document_ids: List[int],
+        error: Optional[str] = None,
+    ) -> int:
+        """
+        Hand claims held by this worker back to the queue.
+
+        Documents that have used up ``max_attempts`` are marked failed
+        instead of pending.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+            document_ids: Claimed documents to release
+            error: Optional reason, stored in last_error
+
+        Returns:
+            Number of claims released
+        """
+        if not document_ids:
+            return 0
+
+        query = """
+            UPDATE evaluations.run_work_items
+            SET status = CASE WHEN attempts >= %s THEN 'failed' ELSE 'pending' END,
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                last_error = COALESCE(%s, last_error),
+                updated_at = NOW()
+            WHERE run_id = %s AND evaluation_type = %s
+              AND document_id = ANY(%s)
+              AND worker_id = %s AND status = 'claimed'
+        """
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (
+                    self.max_attempts,
+                    error,
+                    int(run_id),
+                    self._type_str(evaluation_type),
+                    [int(doc_id) for doc_id in document_ids],
+                    self.worker_id,
+                ))
+                released = cur.rowcount
+            conn.commit()
+        return released
+
+    def recover_abandoned_leases(
+        self,
+        run_id: int,
+        evaluation_type: EvaluationType,
+    ) -> LeaseRecovery:
+        """
+        Hand expired claims of crashed or disconnected workers back to the queue.
+
+        An expired claim whose document already has an evaluation in the run
+        (saved just before the worker died) is marked done. Others are
+        re-queued, or marked failed once they have used up ``max_attempts``.
+        Each recovery is recorded as a run checkpoint.
+
+        Args:
+            run_id: Run ID
+            evaluation_type: Evaluation type
+
+        Returns:
+            LeaseRecovery with per-outcome counts
+        """
+        query = """
+            WITH expired AS (
+                SELECT document_id
+                FROM evaluations.run_work_items
+                WHERE run_id = %s AND evaluation_type = %s
+                  AND status = 'claimed' AND lease_expires_at < NOW()
+                FOR UPDATE SKIP LOCKED
+            ),
+            unevaluated AS (
+                SELECT u.document_id
+                FROM evaluations.get_unevaluated_documents(
+                    %s::BIGINT,
+                    ARRAY(SELECT document_id FROM expired),
+                    %s::VARCHAR
+                ) AS u(document_id)
+            )
+            UPDATE evaluations.run_work_items w
+            SET status = CASE
+                    WHEN w.document_id NOT IN (SELECT document_id FROM unevaluated)
+                        THEN 'done'
+                    WHEN w.attempts >= %s THEN 'failed'
+                    ELSE 'pending'
+                END,
+                last_error = CASE
+                    WHEN w.document_id IN (SELECT document_id FROM unevaluated)
+                        THEN 'lease expired (worker ' || COALESCE(w.worker_id, '?') || ')'
+                    ELSE w.last_error
+                END,
+                worker_id = NULL,
+                lease_expires_at = NULL,
+                updated_at = NOW()
+            FROM expired
+            WHERE w.run_id = %s AND w.evaluation_type = %s
+              AND w.document_id = expired.document_id
+            RETURNING w.status
+        """
+
+        eval_type_str = self._type_str(evaluation_type)
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, (
+                    int(run_id), eval_type_str,
+                    int(run_id), eval_type_str,
+                    self.max_attempts,
+                    int(run_id), eval_type_str,
+                ))
+                statuses = [row[0] for row in cur.fetchall()]
+            conn.commit()
+
+        recovery = LeaseRecovery(
+            requeued=statuses.count(WorkItemStatus.PENDING.value),
+            completed=statuses.count(WorkItemStatus.DONE.value),
+            failed=statuses.count(WorkItemStatus.FAILED.value),
+        )
+
+        if recovery.total:
+            logger.warning(
+                f"Recovered {recovery.total} abandoned leases for run={run_id}: "
+                f"{recovery.requeued} re-queued, {recovery.completed} already "
+                f"evaluated, {recovery.failed} failed"
+            )
+            self.store.save_checkpoint(
+                run_id=run_id,
+                checkpoint_type=CheckpointType.CUSTOM,
+                checkpoint_data={
+                    "event": "lease_recovery",
+                    "evaluation_type": eval_type_str,
+                    "recovered_by": self.worker_id,
+                    "requeued": recovery.requeued,
+                    "completed": recovery.completed,
+                    "failed": recovery.failed,
+                },
+            )
+
+        return recovery
+
+
+class LeaseHeartbeat:
+    """
+    Background thread that renews a worker's leases while work is in progress.
+
+    Use as a context manager around the claim/evaluate/complete loop:
+
+        with LeaseHeartbeat(queue, run_id=run_id):
+            ...
+    """
+
+    def __init__(
+        self,
+        queue: RunWorkQueue,
+        run_id: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        """
+        Initialize the heartbeat.
+
+        Args:
+            queue: Work queue whose leases to renew
+            run_id: Optional run ID to restrict renewal to
+            interval: Seconds between heartbeats (default: lease / HEARTBEATS_PER_LEASE)
+        """
+        self.queue = queue
+        self.run_id = run_id
+        self.interval = interval or queue.lease_seconds / HEARTBEATS_PER_LEASE
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        """Renew leases until stopped."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.queue.heartbeat(self.run_id)
+            except Exception as e:
+                # Keep beating: a transient database error must not let
+                # every lease of this worker expire
+                logger.warning(f"Heartbeat failed for worker {self.queue.worker_id}: {e}")
+
+    def start(self) -> None:
+        """Start the heartbeat thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"lease-heartbeat-{self.queue.worker_id}",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat thread and wait for it to exit."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "LeaseHeartbeat":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
@@ -36,6 +36,12 @@ Usage:
 
  
 
+    # Reuse resolver answers from earlier runs for up to 7 days
+
+    uv run python fulltext_discovery_cli.py --resolver-cache --resolver-cache-ttl 7 batch
+
+ 
+
     # Show statistics
 
     uv run python fulltext_discovery_cli.py status
@@ -74,10 +80,12 @@ from bmlibrarian.discovery import (
 
     FullTextFinder, DocumentIdentifiers, DiscoveryResult,
 
-    SourceType, AccessType
+    SourceType, AccessType, ResolverCache
 
 )
 
+from bmlibrarian.discovery.resolver_cache import DEFAULT_TTL_SECONDS
+
  
 
 # Configure logging
@@ -244,6 +252,26 @@ def print_discovery_result(result: DiscoveryResult, verbose: bool = False):
 
  
 
+def build_resolver_cache(args) -> Optional[ResolverCache]:
+
+    """Create the resolver cache requested on the command line, if any."""
+
+    if not (args.resolver_cache or args.resolver_cache_path):
+
+        return None
+
+    return ResolverCache(
+
+        path=args.resolver_cache_path,
+
+        ttl_seconds=args.resolver_cache_ttl * 24 * 3600
+
+    )
+
+ 
+
+ 
+
 def cmd_discover(args):
 
     """Handle discover command."""
@@ -280,7 +308,9 @@ def cmd_discover(args):
 
         openathens_proxy_url=args.openathens_url,
 
-        timeout=args.timeout
+        timeout=args.timeout,
+
+        resolver_cache=build_resolver_cache(args)
 
     )
 
@@ -470,7 +500,9 @@ def cmd_download(args):
 
         openathens_auth=openathens_auth,
 
-        timeout=args.timeout
+        timeout=args.timeout,
+
+        resolver_cache=build_resolver_cache(args)
 
     )
 
@@ -582,7 +614,7 @@ def cmd_batch(args):
 
  
 
-    # Create finder
+    # Create finder (all resolvers run at once for each document)
 
     finder = FullTextFinder(
 
@@ -590,7 +622,11 @@ def cmd_batch(args):
 
         openathens_proxy_url=args.openathens_url,
 
-        timeout=args.timeout
+        timeout=args.timeout,
+
+        concurrent_discovery=True,
+
+        resolver_cache=build_resolver_cache(args)
 
     )
 
@@ -996,6 +1032,48 @@ def main():
 
     )
 
+    parser.add_argument(
+
+        '--resolver-cache',
+
+        action='store_true',
+
+        help='Cache resolver results in resolver_cache.sqlite in the config directory'
+
+    )
+
+ 
+
+    parser.add_argument(
+
+        '--resolver-cache-path',
+
+        metavar='PATH',
+
+        help='Cache resolver results in this SQLite file (implies --resolver-cache)'
+
+    )
+
+ 
+
+    parser.add_argument(
+
+        '--resolver-cache-ttl',
+
+        type=float,
+
+        default=DEFAULT_TTL_SECONDS / (24 * 3600),
+
+        metavar='DAYS',
+
+        help='Days a cached resolver result stays valid; 0 keeps them forever '
+
+             f'(default: {DEFAULT_TTL_SECONDS // (24 * 3600)})'
+
+    )
+
+ 
+
     parser.add_argument(
 
         '-v', '--verbose',
@@ -589,7 +589,9 @@ class DocumentProcessor:
                 0, 1,
             )
 
-            ingestor = PDFIngestor()
+            # Convert in the shared sandboxed extraction pool so a PyMuPDF
+            # crash on a malformed PDF cannot take down the GUI
+            ingestor = PDFIngestor(use_extraction_pool=True)
 
             # Progress wrapper for ingestor
             def ingestor_progress(stage_name: str, current: int, total: int) -> None:
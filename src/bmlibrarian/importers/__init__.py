@@ -5,15 +5,23 @@ Importers for external data sources (medRxiv, PubMed, MeSH, etc.)
 from .medrxiv_importer import MedRxivImporter
 from .pubmed_importer import PubMedImporter
 from .pubmed_bulk_importer import PubMedBulkImporter
+from .pubmed_bulk_pipeline import ParallelImportPipeline, PipelineStats
 from .mesh_importer import MeSHImporter, ImportStats as MeSHImportStats
 from .pdf_matcher import PDFMatcher, DocumentStatus, ExtractedIdentifiers
 from .pdf_converter import (
     PDFConverter,
     PyMuPDFConverter,
+    PyMuPDF4LLMConverter,
     ConversionResult,
     get_converter,
     list_converters,
 )
+from .pdf_extraction_pool import (
+    PDFExtractionPool,
+    PDFExtractionResult,
+    ExtractionStatus as PDFExtractionStatus,
+    get_extraction_pool,
+)
 from .pdf_ingestor import (
     PDFIngestor,
     IngestResult,
@@ -39,6 +47,8 @@ __all__ = [
     'MedRxivImporter',
     'PubMedImporter',
     'PubMedBulkImporter',
+    'ParallelImportPipeline',
+    'PipelineStats',
     'MeSHImporter',
     'MeSHImportStats',
     'PDFMatcher',
@@ -46,9 +56,14 @@ __all__ = [
     'ExtractedIdentifiers',
     'PDFConverter',
     'PyMuPDFConverter',
+    'PyMuPDF4LLMConverter',
     'ConversionResult',
     'get_converter',
     'list_converters',
+    'PDFExtractionPool',
+    'PDFExtractionResult',
+    'PDFExtractionStatus',
+    'get_extraction_pool',
     'PDFIngestor',
     'IngestResult',
     'EuropePMCBulkDownloader',
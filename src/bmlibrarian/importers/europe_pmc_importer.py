@@ -28,15 +28,28 @@ Usage:
     # Check status
     status = importer.get_status()
     print(f"Total: {status['total_articles']}, Imported: {status['imported']}")
+
+    # Bulk mode: COPY + set-based merge, packages parsed in 4 processes
+    importer = EuropePMCImporter(packages_dir=Path('~/europepmc/packages'),
+                                 batch_size=2000, ingest_mode='copy')
+    stats = importer.import_all_packages(parser_processes=4)
+    for pkg in stats['package_stats']:
+        print(pkg['package'], pkg['articles_per_second'], pkg['failed'])
 """
 
 import gzip
 import json
 import logging
+import multiprocessing
+import queue
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
 
@@ -53,6 +66,122 @@ EUROPE_PMC_SOURCE_NAME = 'europepmc'
 # transaction (see bmlibrarian.importers.transaction_utils.record_savepoint)
 EUROPE_PMC_ARTICLE_SAVEPOINT = "europe_pmc_article_record"
 
+# Ingest modes for EuropePMCImporter
+INGEST_MODE_ROW = 'row'    # SELECT + INSERT/UPDATE per article, each in a SAVEPOINT
+INGEST_MODE_COPY = 'copy'  # COPY into a staging table + one set-based merge per batch
+INGEST_MODES = (INGEST_MODE_ROW, INGEST_MODE_COPY)
+
+# Session-local staging table used by the COPY ingest mode. Temporary
+# tables are never WAL-logged, and ON COMMIT DELETE ROWS empties it at the
+# end of every batch transaction so a pooled connection can reuse it.
+STAGING_TABLE = 'europe_pmc_staging'
+
+STAGING_COLUMNS = (
+    'seq', 'pmcid', 'doi', 'title', 'abstract', 'authors', 'journal',
+    'publication_date', 'full_text', 'keywords', 'mesh_terms', 'url',
+)
+
+STAGING_COLUMN_TYPES = (
+    'integer', 'text', 'text', 'text', 'text', 'text[]', 'text',
+    'date', 'text', 'text[]', 'text[]', 'text',
+)
+
+# Merges one staged batch into document, reproducing _upsert_article():
+# - PMCID already imported: update (COALESCE metadata, replace full_text)
+#   only if update_existing and the new full text is longer
+# - DOI already present from another source: fill that record's full_text
+#   if it has none
+# - otherwise: insert
+# If a PMCID is staged more than once, the last occurrence wins. Returns
+# one row: (inserted, updated), counted like the per-article path.
+_MERGE_STAGED_SQL = f"""
+    WITH batch AS (
+        SELECT DISTINCT ON (s.pmcid) s.*
+        FROM {STAGING_TABLE} s
+        ORDER BY s.pmcid, s.seq DESC
+    ),
+    classified AS (
+        SELECT
+            b.*,
+            e.id AS existing_id,
+            COALESCE(length(e.full_text), 0) AS existing_length,
+            CASE WHEN e.id IS NULL AND b.doi IS NOT NULL THEN (
+                SELECT d.id FROM document d
+                WHERE d.doi = b.doi AND d.source_id <> %(source_id)s
+                LIMIT 1
+            ) END AS doi_match_id
+        FROM batch b
+        LEFT JOIN document e
+            ON e.source_id = %(source_id)s AND e.external_id = b.pmcid
+    ),
+    updated_existing AS (
+        UPDATE document d SET
+            doi = COALESCE(c.doi, d.doi),
+            title = COALESCE(c.title, d.title),
+            abstract = COALESCE(c.abstract, d.abstract),
+            authors = COALESCE(c.authors, d.authors),
+            publication = COALESCE(c.journal, d.publication),
+            publication_date = COALESCE(c.publication_date, d.publication_date),
+            full_text = c.full_text,
+            keywords = COALESCE(c.keywords, d.keywords),
+            mesh_terms = COALESCE(c.mesh_terms, d.mesh_terms),
+            updated_date = CURRENT_TIMESTAMP
+        FROM classified c
+        WHERE %(update_existing)s
+            AND d.id = c.existing_id
+            AND length(c.full_text) > c.existing_length
+        RETURNING d.id
+    ),
+    filled_by_doi AS (
+        UPDATE document d SET
+            full_text = c.full_text,
+            updated_date = CURRENT_TIMESTAMP
+        FROM classified c
+        WHERE %(update_existing)s
+            AND d.id = c.doi_match_id
+            AND c.full_text <> ''
+            AND (d.full_text IS NULL OR d.full_text = '')
+        RETURNING d.id
+    ),
+    inserted AS (
+        INSERT INTO document (
+            source_id, external_id, doi, title, abstract,
+            authors, publication, publication_date, full_text,
+            keywords, mesh_terms, url
+        )
+        SELECT
+            %(source_id)s, c.pmcid, c.doi, c.title, c.abstract,
+            c.authors, c.journal, c.publication_date, c.full_text,
+            c.keywords, c.mesh_terms, c.url
+        FROM classified c
+        WHERE c.existing_id IS NULL AND c.doi_match_id IS NULL
+        ON CONFLICT (source_id, external_id) DO NOTHING
+        RETURNING id
+    )
+    SELECT
+        (SELECT count(*) FROM inserted),
+        (SELECT count(*) FROM updated_existing)
+            + (SELECT count(*) FROM classified c
+               WHERE %(update_existing)s
+                   AND c.doi_match_id IS NOT NULL
+                   AND c.full_text <> '')
+"""
+
+# Parsed batches buffered between parser processes and the writer
+# before parsers block (backpressure)
+DEFAULT_QUEUE_DEPTH = 16
+
+# Seconds the writer waits on the parser queue before re-checking parser health
+_POLL_INTERVAL_SECONDS = 0.5
+
+# Message kinds on the parser -> writer queue
+_MSG_BATCH = 'batch'
+_MSG_DONE = 'done'
+
+# Queue onto which parser processes put their messages; set once per
+# parser process by _init_parser_process()
+_parser_out_queue: Optional[Any] = None
+
 
 @dataclass
 class ArticleMetadata:
@@ -750,6 +879,105 @@ class EuropePMCXMLParser:
         return f"![{alt_text}]({graphic_ref})"
 
 
+def _validate_article(article: ArticleMetadata) -> Optional[str]:
+    """Find values that would make an article fail to load.
+
+    Used by the COPY ingest mode instead of per-article savepoints: rows
+    rejected here are counted as failed, and the rest of the batch is
+    merged in one statement.
+
+    Args:
+        article: Parsed article
+
+    Returns:
+        Reason the article cannot be stored, or None if it is valid
+    """
+    if not article.pmcid:
+        return "missing PMCID"
+
+    # PostgreSQL text values cannot contain NUL characters
+    for name in ('pmcid', 'doi', 'title', 'abstract', 'journal', 'full_text'):
+        value = getattr(article, name)
+        if value and '\x00' in value:
+            return f"NUL character in {name}"
+    for name in ('authors', 'keywords', 'mesh_terms'):
+        if any(value and '\x00' in value for value in getattr(article, name)):
+            return f"NUL character in {name}"
+
+    # JATS dates are assembled from separate fields and may not exist (e.g. Feb 30)
+    if article.publication_date:
+        try:
+            date.fromisoformat(article.publication_date)
+        except ValueError:
+            return f"invalid publication_date {article.publication_date!r}"
+
+    return None
+
+
+def _init_parser_process(out_queue: Any) -> None:
+    """ProcessPoolExecutor initializer: remember the shared output queue."""
+    global _parser_out_queue
+    _parser_out_queue = out_queue
+
+
+def _parse_package_in_process(package_path: str, batch_size: int) -> None:
+    """Parse one package inside a parser process.
+
+    Sends (_MSG_BATCH, package_path, articles) for every batch and finishes
+    with (_MSG_DONE, package_path, result) where result holds the article
+    count, parse time and an error description (or None).
+
+    Args:
+        package_path: Path to the .xml.gz package
+        batch_size: Number of articles per emitted batch
+    """
+    parser = EuropePMCXMLParser()
+    start_time = time.perf_counter()
+    article_count = 0
+    error: Optional[str] = None
+
+    try:
+        with gzip.open(package_path, 'rb') as f:
+            batch: List[ArticleMetadata] = []
+            for article in parser.parse_package_streaming(f):
+                article_count += 1
+                batch.append(article)
+                if len(batch) >= batch_size:
+                    _parser_out_queue.put((_MSG_BATCH, package_path, batch))
+                    batch = []
+            if batch:
+                _parser_out_queue.put((_MSG_BATCH, package_path, batch))
+    except Exception as e:
+        error = str(e)
+
+    result = {
+        'articles': article_count,
+        'error': error,
+        'parse_seconds': time.perf_counter() - start_time,
+    }
+    _parser_out_queue.put((_MSG_DONE, package_path, result))
+
+
+def _shutdown_parsers(executor: ProcessPoolExecutor, out_queue: Any) -> None:
+    """Shut down the parser pool, draining the queue so no parser blocks on put()."""
+    stop = threading.Event()
+
+    def drain() -> None:
+        while not stop.is_set():
+            try:
+                out_queue.get(timeout=_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                pass
+
+    drainer = threading.Thread(target=drain, name="EuropePMC-ParserDrain", daemon=True)
+    drainer.start()
+    try:
+        executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        stop.set()
+        drainer.join()
+
+
 class EuropePMCImporter:
     """Imports Europe PMC XML packages into the BMLibrarian database.
 
@@ -764,7 +992,8 @@ class EuropePMCImporter:
         self,
         packages_dir: Path,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        update_existing: bool = True
+        update_existing: bool = True,
+        ingest_mode: str = INGEST_MODE_ROW
     ):
         """Initialize the importer.
 
@@ -772,7 +1001,19 @@ class EuropePMCImporter:
             packages_dir: Directory containing downloaded .xml.gz packages
             batch_size: Number of articles per database commit
             update_existing: If True, update existing records with new full_text
+            ingest_mode: 'row' for per-article upserts (default) or 'copy' to
+                stream each batch into a staging table with COPY and merge it
+                with one set-based statement
+
+        Raises:
+            ValueError: If ingest_mode is not one of INGEST_MODES
         """
+        if ingest_mode not in INGEST_MODES:
+            raise ValueError(
+                f"Invalid ingest_mode '{ingest_mode}', expected one of {INGEST_MODES}"
+            )
+        self.ingest_mode = ingest_mode
+
         self.packages_dir = Path(packages_dir).expanduser()
         self.batch_size = batch_size
         self.update_existing = update_existing
@@ -790,6 +1031,9 @@ class EuropePMCImporter:
         # Source ID (loaded on first use)
         self._source_id: Optional[int] = None
 
+        # Per-package throughput/failure reports from the current run
+        self.package_stats: List[Dict[str, Any]] = []
+
         logger.info(
             f"Europe PMC Importer initialized with packages_dir: {self.packages_dir}"
         )
@@ -893,26 +1137,35 @@ class EuropePMCImporter:
     def import_all_packages(
         self,
         progress_callback: Optional[Callable[[str, int, int, int], None]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        parser_processes: int = 0
     ) -> Dict[str, Any]:
         """Import all downloaded packages.
 
         Args:
             progress_callback: Callback(package_name, pkg_num, total_pkgs, articles_imported)
             limit: Maximum number of packages to import
+            parser_processes: If > 0, parse packages in this many processes
+                while this process writes their batches (packages then
+                complete, and are reported, in completion order)
 
         Returns:
-            Import statistics
+            Import statistics, with a per-package report (articles, counts,
+            elapsed_seconds, articles_per_second) under 'package_stats'
         """
         from bmlibrarian.database import get_db_manager
 
+        self.package_stats = []
+
         packages = self.list_packages()
         if limit:
             packages = packages[:limit]
 
         if not packages:
             logger.info("No packages to import")
-            return self.get_status()
+            status = self.get_status()
+            status['package_stats'] = []
+            return status
 
         self.progress.total_packages = len(packages)
         if not self.progress.start_time:
@@ -923,37 +1176,197 @@ class EuropePMCImporter:
 
         logger.info(f"Importing {len(packages)} packages...")
 
-        for pkg_num, package_path in enumerate(packages, 1):
-            if progress_callback:
-                progress_callback(
-                    package_path.name,
-                    pkg_num,
-                    len(packages),
-                    self.progress.imported_articles
-                )
+        if parser_processes > 0:
+            self._import_packages_parallel(
+                packages, db_manager, source_id, parser_processes, progress_callback
+            )
+        else:
+            for pkg_num, package_path in enumerate(packages, 1):
+                if progress_callback:
+                    progress_callback(
+                        package_path.name,
+                        pkg_num,
+                        len(packages),
+                        self.progress.imported_articles
+                    )
 
-            try:
-                stats = self._import_package(package_path, db_manager, source_id)
-                self.progress.imported_packages += 1
-                self.progress.imported_articles += stats['inserted']
-                self.progress.updated_articles += stats['updated']
-                self.progress.skipped_articles += stats['skipped']
-                self.progress.failed_articles += stats['failed']
-                self._save_state()
-
-                logger.info(
-                    f"[{pkg_num}/{len(packages)}] {package_path.name}: "
-                    f"{stats['inserted']} new, {stats['updated']} updated, "
-                    f"{stats['skipped']} skipped, {stats['failed']} failed"
-                )
+                try:
+                    start_time = time.perf_counter()
+                    stats = self._import_package(package_path, db_manager, source_id)
+                    self._record_package(
+                        package_path.name,
+                        stats,
+                        articles=sum(stats.values()),
+                        elapsed=time.perf_counter() - start_time,
+                        label=f"[{pkg_num}/{len(packages)}] "
+                    )
 
-            except Exception as e:
-                error_msg = f"Failed to import {package_path.name}: {e}"
-                logger.error(error_msg)
-                self.progress.errors.append(error_msg)
-                self._save_state()
+                except Exception as e:
+                    error_msg = f"Failed to import {package_path.name}: {e}"
+                    logger.error(error_msg)
+                    self.progress.errors.append(error_msg)
+                    self._save_state()
+
+        status = self.get_status()
+        status['package_stats'] = list(self.package_stats)
+        return status
 
-        return self.get_status()
+    def _record_package(
+        self,
+        package_name: str,
+        stats: Dict[str, int],
+        articles: int,
+        elapsed: float,
+        label: str = ""
+    ) -> Dict[str, Any]:
+        """Add a finished package to the progress counters and report it.
+
+        Args:
+            package_name: Package file name
+            stats: inserted/updated/skipped/failed counts
+            articles: Number of articles parsed from the package
+            elapsed: Seconds spent on the package
+            label: Prefix for the log line (e.g. "[3/10] ")
+
+        Returns:
+            The per-package report appended to self.package_stats
+        """
+        self.progress.imported_packages += 1
+        self.progress.imported_articles += stats['inserted']
+        self.progress.updated_articles += stats['updated']
+        self.progress.skipped_articles += stats['skipped']
+        self.progress.failed_articles += stats['failed']
+        self._save_state()
+
+        report = {
+            'package': package_name,
+            'articles': articles,
+            'inserted': stats['inserted'],
+            'updated': stats['updated'],
+            'skipped': stats['skipped'],
+            'failed': stats['failed'],
+            'elapsed_seconds': elapsed,
+            'articles_per_second': articles / elapsed if elapsed > 0 else 0.0,
+        }
+        self.package_stats.append(report)
+
+        logger.info(
+            f"{label}{package_name}: "
+            f"{stats['inserted']} new, {stats['updated']} updated, "
+            f"{stats['skipped']} skipped, {stats['failed']} failed "
+            f"in {elapsed:.1f}s ({report['articles_per_second']:,.0f} articles/sec)"
+        )
+        return report
+
+    def _import_packages_parallel(
+        self,
+        packages: List[Path],
+        db_manager,
+        source_id: int,
+        parser_processes: int,
+        progress_callback: Optional[Callable[[str, int, int, int], None]] = None
+    ) -> None:
+        """Parse packages in worker processes and write their batches here.
+
+        Parser processes run parse_package_streaming() and put article
+        batches on a bounded queue; this process upserts each batch as it
+        arrives (with self.ingest_mode). Batches of different packages may
+        interleave. A package is recorded once its parser has reported done
+        and all its batches have been written.
+
+        Args:
+            packages: Package paths to import
+            db_manager: Database manager
+            source_id: Source ID for Europe PMC
+            parser_processes: Number of parser processes
+            progress_callback: Callback(package_name, pkg_num, total_pkgs, articles_imported),
+                called as each package completes
+
+        Raises:
+            RuntimeError: If a parser process dies without reporting its package
+        """
+        # Spawn rather than fork: this process holds pooled database connections
+        mp_context = multiprocessing.get_context('spawn')
+        out_queue = mp_context.Queue(maxsize=DEFAULT_QUEUE_DEPTH)
+
+        logger.info(
+            f"Parsing {len(packages)} packages in {parser_processes} processes "
+            f"(ingest mode: {self.ingest_mode})"
+        )
+
+        states: Dict[str, Dict[str, Any]] = {}
+        completed = 0
+
+        executor = ProcessPoolExecutor(
+            max_workers=parser_processes,
+            mp_context=mp_context,
+            initializer=_init_parser_process,
+            initargs=(out_queue,),
+        )
+        try:
+            futures: Dict[str, Future] = {
+                str(path): executor.submit(_parse_package_in_process, str(path), self.batch_size)
+                for path in packages
+            }
+
+            while futures:
+                try:
+                    kind, package_path, payload = out_queue.get(timeout=_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    self._check_parsers(futures)
+                    continue
+
+                state = states.setdefault(package_path, {
+                    'stats': {'inserted': 0, 'updated': 0, 'skipped': 0, 'failed': 0},
+                    'start_time': time.perf_counter(),
+                })
+
+                if kind == _MSG_BATCH:
+                    batch_stats = self._upsert_batch(payload, db_manager, source_id)
+                    for key in state['stats']:
+                        state['stats'][key] += batch_stats[key]
+                    continue
+
+                futures.pop(package_path, None)
+                del states[package_path]
+                completed += 1
+                package_name = Path(package_path).name
+                stats = state['stats']
+
+                if payload['error']:
+                    error_msg = f"Failed to process {package_name}: {payload['error']}"
+                    logger.error(error_msg)
+                    self.progress.errors.append(error_msg)
+                    stats['failed'] += 1
+
+                self.progress.total_articles += payload['articles']
+                self._record_package(
+                    package_name,
+                    stats,
+                    articles=payload['articles'],
+                    elapsed=time.perf_counter() - state['start_time'],
+                    label=f"[{completed}/{len(packages)}] "
+                )
+
+                if progress_callback:
+                    progress_callback(
+                        package_name,
+                        completed,
+                        len(packages),
+                        self.progress.imported_articles
+                    )
+        finally:
+            _shutdown_parsers(executor, out_queue)
+
+    @staticmethod
+    def _check_parsers(futures: Dict[str, Future]) -> None:
+        """Raise if a parser process died without reporting its package."""
+        for future in list(futures.values()):
+            if future.done() and future.exception() is not None:
+                error = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    raise RuntimeError(f"Parser process pool broke: {error}") from error
+                raise error
 
     def _import_package(
         self,
@@ -1018,7 +1431,27 @@ class EuropePMCImporter:
         db_manager,
         source_id: int
     ) -> Dict[str, int]:
-        """Insert or update a batch of articles.
+        """Insert or update a batch of articles using the configured ingest mode.
+
+        Args:
+            articles: List of ArticleMetadata
+            db_manager: Database manager
+            source_id: Source ID
+
+        Returns:
+            Stats dict
+        """
+        if self.ingest_mode == INGEST_MODE_COPY:
+            return self._upsert_batch_copy(articles, db_manager, source_id)
+        return self._upsert_batch_rows(articles, db_manager, source_id)
+
+    def _upsert_batch_rows(
+        self,
+        articles: List[ArticleMetadata],
+        db_manager,
+        source_id: int
+    ) -> Dict[str, int]:
+        """Insert or update a batch one article at a time, each in a SAVEPOINT.
 
         Args:
             articles: List of ArticleMetadata
@@ -1050,6 +1483,120 @@ class EuropePMCImporter:
 
         return stats
 
+    @staticmethod
+    def _staging_row(seq: int, article: ArticleMetadata) -> Tuple:
+        """Build one COPY row for the staging table from a validated article.
+
+        Empty lists become NULL so the merge's COALESCE keeps existing
+        values, mirroring the per-article path.
+
+        Args:
+            seq: Position of the article within its batch (later wins).
+            article: Article that passed _validate_article().
+
+        Returns:
+            Tuple of values in STAGING_COLUMNS order.
+        """
+        return (
+            seq,
+            article.pmcid,
+            article.doi,
+            article.title,
+            article.abstract,
+            article.authors if article.authors else None,
+            article.journal,
+            date.fromisoformat(article.publication_date) if article.publication_date else None,
+            article.full_text,
+            article.keywords if article.keywords else None,
+            article.mesh_terms if article.mesh_terms else None,
+            f"https://europepmc.org/article/PMC/{article.pmcid.replace('PMC', '')}",
+        )
+
+    def _ensure_staging_table(self, cur: Any) -> None:
+        """Create the session-local staging table if this connection lacks it."""
+        columns = ',\n'.join(
+            f'{name} {col_type}'
+            for name, col_type in zip(STAGING_COLUMNS, STAGING_COLUMN_TYPES)
+        )
+        cur.execute(f"""
+            CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+                {columns}
+            ) ON COMMIT DELETE ROWS
+        """)
+
+    def _upsert_batch_copy(
+        self,
+        articles: List[ArticleMetadata],
+        db_manager,
+        source_id: int
+    ) -> Dict[str, int]:
+        """Insert or update a batch via COPY into staging and a set-based merge.
+
+        Articles that would fail to load are rejected up front by
+        _validate_article() and counted as failed; the rest are streamed
+        into the staging table with COPY and merged with a single statement
+        (see _MERGE_STAGED_SQL). If the merge fails anyway, the transaction
+        is rolled back and the batch is retried through the per-article
+        savepoint path, so one unexpected bad row cannot lose the batch.
+
+        Args:
+            articles: List of ArticleMetadata
+            db_manager: Database manager
+            source_id: Source ID
+
+        Returns:
+            Stats dict
+        """
+        stats = {'inserted': 0, 'updated': 0, 'skipped': 0, 'failed': 0}
+
+        valid: List[ArticleMetadata] = []
+        for article in articles:
+            error = _validate_article(article)
+            if error:
+                logger.debug(f"Rejected {article.pmcid or 'article without PMCID'}: {error}")
+                stats['failed'] += 1
+            else:
+                valid.append(article)
+
+        if not valid:
+            return stats
+
+        try:
+            with db_manager.get_connection() as conn:
+                with conn.cursor() as cur:
+                    self._ensure_staging_table(cur)
+
+                    with cur.copy(
+                        f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN"
+                    ) as copy:
+                        copy.set_types(list(STAGING_COLUMN_TYPES))
+                        for seq, article in enumerate(valid):
+                            copy.write_row(self._staging_row(seq, article))
+
+                    cur.execute(_MERGE_STAGED_SQL, {
+                        'source_id': source_id,
+                        'update_existing': self.update_existing,
+                    })
+                    inserted, updated = cur.fetchone()
+
+                conn.commit()
+
+        except Exception as e:
+            logger.warning(
+                f"Set-based merge of {len(valid)} articles failed ({e}); "
+                f"retrying the batch per article"
+            )
+            row_mode_stats = self._upsert_batch_rows(valid, db_manager, source_id)
+            for key in stats:
+                stats[key] += row_mode_stats[key]
+            return stats
+
+        stats['inserted'] += inserted
+        stats['updated'] += updated
+        # Duplicates within the batch and rows left unchanged
+        stats['skipped'] += len(valid) - inserted - updated
+        return stats
+
     def _upsert_article(
         self,
         cursor,
@@ -1184,7 +1731,10 @@ class EuropePMCImporter:
         db_manager = get_db_manager()
         source_id = self._get_source_id(db_manager)
 
+        start_time = time.perf_counter()
         stats = self._import_package(package_path, db_manager, source_id)
+        elapsed = time.perf_counter() - start_time
+        total = sum(stats.values())
 
         return {
             'package': package_path.name,
@@ -1192,7 +1742,9 @@ class EuropePMCImporter:
             'updated': stats['updated'],
             'skipped': stats['skipped'],
             'failed': stats['failed'],
-            'total': sum(stats.values())
+            'total': total,
+            'elapsed_seconds': elapsed,
+            'articles_per_second': total / elapsed if elapsed > 0 else 0.0
         }
 
     def get_status(self) -> Dict[str, Any]:
@@ -32,6 +32,9 @@ Usage:
 
     # Check status
     status = downloader.get_status()
+
+    # Convert downloaded PDFs to text (sandboxed, concurrent)
+    results = downloader.extract_texts(['PMC123456', 'PMC234567'])
 """
 
 import json
@@ -47,6 +50,8 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
+from bmlibrarian.importers.pdf_converter import DEFAULT_CONVERTER
+from bmlibrarian.importers.pdf_extraction_pool import PDFExtractionResult, get_extraction_pool
 from bmlibrarian.utils.path_utils import is_safe_archive_member
 
 logger = logging.getLogger(__name__)
@@ -1103,6 +1108,41 @@ class EuropePMCPDFDownloader:
 
         return pdf_path if pdf_path.exists() else None
 
+    def extract_texts(
+        self,
+        pmcids: List[str],
+        converter_name: str = DEFAULT_CONVERTER
+    ) -> Dict[str, PDFExtractionResult]:
+        """Convert downloaded PDFs to text in the shared extraction pool.
+
+        Conversions run concurrently in sandboxed worker processes, so a
+        malformed PDF cannot crash the caller.
+
+        Args:
+            pmcids: PMCIDs (with or without 'PMC' prefix)
+            converter_name: PDF converter to use (see pdf_converter.list_converters)
+
+        Returns:
+            Mapping of PMCID (as given) to extraction result, for PMCIDs
+            whose PDF has been downloaded
+
+        Raises:
+            ValueError: If a PMCID is invalid
+        """
+        paths = {}
+        for pmcid in pmcids:
+            pdf_path = self.get_pdf_path(pmcid)
+            if pdf_path is not None:
+                paths[pmcid] = pdf_path
+
+        if not paths:
+            return {}
+
+        results = get_extraction_pool().extract_batch(
+            list(paths.values()), converter_name=converter_name
+        )
+        return dict(zip(paths.keys(), results))
+
     def _format_bytes(self, size: int) -> str:
         """Format bytes as human-readable string."""
         for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
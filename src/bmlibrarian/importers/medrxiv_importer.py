@@ -34,6 +34,8 @@ from pathlib import Path
 from bmlibrarian.database import get_db_manager
 from bmlibrarian.utils.pdf_validation import is_pdf_file
 from bmlibrarian.importers.transaction_utils import record_savepoint
+from bmlibrarian.importers.pdf_converter import CONVERTER_PYMUPDF4LLM
+from bmlibrarian.importers.pdf_extraction_pool import PDFExtractionResult, get_extraction_pool
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -61,6 +63,10 @@ EXTRACTION_STRATEGIES = ('auto', 'pdf_only', 'web_only')
 # Default extraction priority for 'auto' strategy
 DEFAULT_EXTRACTION_PRIORITY = ['text', 'html', 'jats_xml', 'pdf']
 
+# PDFs fetch_missing_pdfs() downloads before converting and saving them, so
+# an interrupted run loses at most one chunk of work
+MISSING_PDF_CHUNK_SIZE = 16
+
 # SAVEPOINT name used to isolate each paper's writes within a batch
 # transaction (see bmlibrarian.importers.transaction_utils.record_savepoint)
 MEDRXIV_PAPER_SAVEPOINT = "medrxiv_paper_record"
@@ -74,25 +80,6 @@ except RuntimeError:
     pass
 
 
-def _extract_pdf_in_subprocess(pdf_path: str, result_queue: multiprocessing.Queue) -> None:
-    """
-    Worker function to extract PDF content in a subprocess.
-
-    This isolates potential segfaults in pymupdf4llm from crashing the main process.
-
-    Args:
-        pdf_path: Full path to the PDF file
-        result_queue: Queue to put the result (markdown text or empty string on error)
-    """
-    try:
-        import pymupdf4llm
-        markdown_text = pymupdf4llm.to_markdown(pdf_path)
-        result_queue.put(markdown_text)
-    except Exception as e:
-        # Log error and return empty string
-        result_queue.put("")
-
-
 class MedRxivImporter:
     """
     Importer for medRxiv biomedical preprints.
@@ -524,9 +511,11 @@ class MedRxivImporter:
         """
         Extract content from PDF as markdown using subprocess isolation.
 
-        This method runs pymupdf4llm in a separate subprocess to prevent segfaults
-        from crashing the main process. This is necessary because PyMuPDF can
-        occasionally crash on malformed PDFs, especially on macOS ARM.
+        Conversion runs in the shared PDF extraction pool (long-lived worker
+        processes), so a pymupdf4llm segfault cannot crash the main process.
+        This is necessary because PyMuPDF can occasionally crash on malformed
+        PDFs, especially on macOS ARM. PDFs that time out or crash their
+        worker are moved to the 'failed' subdirectory.
 
         Args:
             filename: Filename of the PDF (not full path)
@@ -535,72 +524,88 @@ class MedRxivImporter:
         Returns:
             Markdown formatted text extracted from the PDF or empty string if conversion fails
         """
+        return self.extract_full_text_batch([filename], timeout_seconds).get(filename, "")
+
+    def extract_full_text_batch(
+        self,
+        filenames: List[str],
+        timeout_seconds: int = PDF_EXTRACTION_TIMEOUT_SECONDS
+    ) -> Dict[str, str]:
+        """
+        Extract markdown from several PDFs concurrently via the extraction pool.
+
+        Args:
+            filenames: Filenames of the PDFs (not full paths)
+            timeout_seconds: Maximum time to spend on each conversion
+
+        Returns:
+            Dictionary mapping each filename to its markdown text (empty
+            string if conversion failed)
+        """
+        texts = {filename: "" for filename in filenames}
+
         if not pymupdf4llm:
             logger.warning("pymupdf4llm not available. Cannot extract text from PDF.")
-            return ""
+            return texts
 
-        pdf_path = self.pdf_base_dir / filename
+        pending = []
+        for filename in texts:
+            pdf_path = self.pdf_base_dir / filename
+            if not pdf_path.exists():
+                logger.error(f"PDF file not found: {pdf_path}")
+                continue
+            pending.append(filename)
 
-        if not pdf_path.exists():
-            logger.error(f"PDF file not found: {pdf_path}")
-            return ""
+        if not pending:
+            return texts
 
         try:
+            results = get_extraction_pool().extract_batch(
+                [self.pdf_base_dir / filename for filename in pending],
+                converter_name=CONVERTER_PYMUPDF4LLM,
+                timeout=timeout_seconds
+            )
+        except Exception as e:
+            logger.error(f"Error extracting text from {len(pending)} PDFs: {e}")
+            return texts
+
+        for filename, result in zip(pending, results):
+            texts[filename] = self._handle_extraction_result(filename, result)
+        return texts
+
+    def _handle_extraction_result(self, filename: str, result: PDFExtractionResult) -> str:
+        """
+        Return the text of an extraction result, quarantining problem PDFs.
+
+        Args:
+            filename: Filename of the PDF (not full path)
+            result: Result from the extraction pool
+
+        Returns:
+            Markdown text, or empty string if extraction failed
+        """
+        if result.killed_worker:
+            # Move problematic PDF to 'failed' subdirectory
             import shutil
 
-            # Use subprocess to isolate potential segfaults
-            result_queue: multiprocessing.Queue = multiprocessing.Queue()
-            process = multiprocessing.Process(
-                target=_extract_pdf_in_subprocess,
-                args=(str(pdf_path), result_queue)
-            )
-            process.start()
-            process.join(timeout=timeout_seconds)
-
-            if process.is_alive():
-                # Process timed out - terminate it
-                logger.warning(f"PDF processing timed out after {timeout_seconds} seconds for {filename}")
-                process.terminate()
-                process.join(timeout=5)  # Give it 5 seconds to terminate gracefully
-                if process.is_alive():
-                    process.kill()  # Force kill if still alive
-                    process.join()
-
-                # Move problematic PDF to 'failed' subdirectory
-                failed_dir = self.pdf_base_dir / 'failed'
+            pdf_path = self.pdf_base_dir / filename
+            failed_dir = self.pdf_base_dir / 'failed'
+            try:
                 failed_dir.mkdir(exist_ok=True)
-                failed_path = failed_dir / filename
                 if pdf_path.exists():  # Check it wasn't already moved
-                    shutil.move(str(pdf_path), str(failed_path))
+                    shutil.move(str(pdf_path), str(failed_dir / filename))
                     logger.info(f"Moved problematic PDF {filename} to {failed_dir}")
-                return ""
-
-            # Check if process crashed (non-zero exit code indicates crash/segfault)
-            if process.exitcode != 0:
-                logger.warning(f"PDF extraction subprocess crashed (exit code {process.exitcode}) for {filename}")
-                # Move problematic PDF to 'failed' subdirectory
-                failed_dir = self.pdf_base_dir / 'failed'
-                failed_dir.mkdir(exist_ok=True)
-                failed_path = failed_dir / filename
-                if pdf_path.exists():
-                    shutil.move(str(pdf_path), str(failed_path))
-                    logger.info(f"Moved problematic PDF {filename} to {failed_dir}")
-                return ""
-
-            # Get result from queue
-            try:
-                markdown_text = result_queue.get_nowait()
-                if markdown_text:
-                    logger.debug(f"Successfully converted {filename} to markdown")
-                return markdown_text
-            except Exception:
-                logger.warning(f"No result from PDF extraction subprocess for {filename}")
-                return ""
+            except OSError as e:
+                logger.error(f"Could not move problematic PDF {filename}: {e}")
+            return ""
 
-        except Exception as e:
-            logger.error(f"Error extracting text from {filename}: {e}")
+        if not result.success:
+            logger.warning(f"PDF extraction failed for {filename}: {result.error_message}")
             return ""
 
+        logger.debug(f"Successfully converted {filename} to markdown")
+        return result.text
+
     def extract_full_text_multi_format(
         self,
         doi: str,
@@ -961,7 +966,8 @@ class MedRxivImporter:
             List of preprints without downloaded PDFs
         """
         query = """
-            SELECT d.id, d.doi, d.title, d.publication_date, d.pdf_url
+            SELECT d.id, d.doi, d.title, d.publication_date, d.pdf_url,
+                   (d.full_text IS NOT NULL AND d.full_text <> '') AS has_full_text
             FROM document d
             WHERE d.source_id = %s
             AND (d.pdf_filename = '' OR d.pdf_filename IS NULL)
@@ -984,14 +990,21 @@ class MedRxivImporter:
                 return results
 
     def fetch_missing_pdfs(self, max_retries: int = 5, limit: Optional[int] = None,
-                          convert_to_markdown: bool = True) -> int:
+                          convert_to_markdown: bool = True,
+                          chunk_size: int = MISSING_PDF_CHUNK_SIZE) -> int:
         """
         Fetch missing PDF files for papers in the database.
 
+        PDFs are converted and recorded every ``chunk_size`` downloads, so
+        memory stays bounded and an interrupted run keeps earlier chunks.
+        PDFs already on disk from an interrupted run are converted too when
+        their record has no full text yet.
+
         Args:
             max_retries: Maximum number of retry attempts for failed downloads
             limit: Maximum number of PDFs to fetch (None for no limit)
             convert_to_markdown: Whether to convert PDFs to markdown text
+            chunk_size: Number of PDFs converted and saved together
 
         Returns:
             Number of successfully downloaded PDFs
@@ -1005,6 +1018,8 @@ class MedRxivImporter:
         logger.info(f"Found {len(records)} papers without downloaded PDFs")
 
         success_count = 0
+        # (doi, filename, needs_conversion) awaiting conversion and UPDATE
+        chunk: List[Tuple[str, str, bool]] = []
 
         if tqdm:
             progress = tqdm(records, desc="Downloading PDFs", unit="paper")
@@ -1037,28 +1052,60 @@ class MedRxivImporter:
             filename, was_downloaded = self.download_pdf(paper)
 
             if filename:
-                full_text = ""
-                if was_downloaded and convert_to_markdown:
-                    full_text = self.extract_full_text(filename)
+                needs_conversion = convert_to_markdown and (
+                    was_downloaded or not record.get('has_full_text')
+                )
+                chunk.append((doi, filename, needs_conversion))
 
-                # Update database
-                try:
-                    with self.db_manager.get_connection() as conn:
-                        with conn.cursor() as cur:
-                            cur.execute("""
-                                UPDATE document
-                                SET pdf_filename = %s, full_text = %s, updated_date = CURRENT_TIMESTAMP
-                                WHERE source_id = %s AND doi = %s
-                            """, (filename, full_text, self.source_id, doi))
+            if len(chunk) >= chunk_size:
+                success_count += self._save_fetched_pdfs(chunk)
+                chunk = []
 
-                    success_count += 1
-                    logger.debug(f"Updated PDF path for {doi}")
-                except Exception as e:
-                    logger.error(f"Error updating PDF path for {doi}: {e}")
+        if chunk:
+            success_count += self._save_fetched_pdfs(chunk)
 
         logger.info(f"Downloaded {success_count} missing PDFs")
         return success_count
 
+    def _save_fetched_pdfs(self, fetched: List[Tuple[str, str, bool]]) -> int:
+        """
+        Convert a chunk of fetched PDFs and record them in the database.
+
+        Conversions run concurrently in the extraction pool. A failed
+        conversion never overwrites full text the record already has.
+
+        Args:
+            fetched: (doi, filename, needs_conversion) tuples
+
+        Returns:
+            Number of records updated
+        """
+        to_convert = [filename for _, filename, needs_conversion in fetched if needs_conversion]
+        texts = self.extract_full_text_batch(to_convert) if to_convert else {}
+
+        updated = 0
+        for doi, filename, _ in fetched:
+            full_text = texts.get(filename, "")
+
+            # Update database
+            try:
+                with self.db_manager.get_connection() as conn:
+                    with conn.cursor() as cur:
+                        cur.execute("""
+                            UPDATE document
+                            SET pdf_filename = %s,
+                                full_text = COALESCE(NULLIF(%s, ''), full_text),
+                                updated_date = CURRENT_TIMESTAMP
+                            WHERE source_id = %s AND doi = %s
+                        """, (filename, full_text, self.source_id, doi))
+
+                updated += 1
+                logger.debug(f"Updated PDF path for {doi}")
+            except Exception as e:
+                logger.error(f"Error updating PDF path for {doi}: {e}")
+
+        return updated
+
     def get_preprints_without_fulltext(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get medRxiv preprints without extracted full text.
@@ -15,6 +15,9 @@ Example usage:
 
     # Import supplementary concepts only
     stats = importer.import_supplementary_concepts(year=2025)
+
+    # Per-descriptor statements instead of the default COPY + set-based merge
+    importer = MeSHImporter(ingest_mode="row")
 """
 
 import gzip
@@ -25,7 +28,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Iterator, Callable, IO
+from typing import Optional, List, Dict, Any, Iterator, Callable, IO, Tuple
 from urllib.parse import urljoin
 import requests
 
@@ -49,6 +52,7 @@ DEFAULT_DOWNLOAD_DIR = Path.home() / ".bmlibrarian" / "downloads" / "mesh"
 
 # Batch sizes for database operations
 DESCRIPTOR_BATCH_SIZE = 100
+BULK_DESCRIPTOR_BATCH_SIZE = 2000
 TERM_BATCH_SIZE = 1000
 SCR_BATCH_SIZE = 500
 
@@ -58,6 +62,40 @@ REQUEST_CHUNK_SIZE = 8192
 MAX_RETRIES = 3
 RETRY_DELAY_SECONDS = 5
 
+# Ingest modes for descriptor imports
+INGEST_MODE_ROW = "row"    # One INSERT per descriptor, tree number, concept and term
+INGEST_MODE_COPY = "copy"  # COPY into temp staging tables + set-based merges per batch
+INGEST_MODES = (INGEST_MODE_ROW, INGEST_MODE_COPY)
+
+# Session-local staging tables for the COPY ingest mode: name -> (columns, types).
+# seq is the position of the descriptor in the file; the last occurrence wins.
+STAGING_TABLES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "mesh_descriptor_staging": (
+        ("seq", "descriptor_ui", "descriptor_name", "scope_note", "annotation",
+         "history_note", "public_mesh_note", "nlm_classification",
+         "date_created", "date_revised", "date_established"),
+        ("integer", "text", "text", "text", "text",
+         "text", "text", "text",
+         "date", "date", "date"),
+    ),
+    "mesh_tree_staging": (
+        ("descriptor_ui", "tree_number", "tree_level"),
+        ("text", "text", "integer"),
+    ),
+    "mesh_concept_staging": (
+        ("seq", "descriptor_ui", "concept_ui", "concept_name", "is_preferred",
+         "scope_note", "cas_registry_number"),
+        ("integer", "text", "text", "text", "boolean",
+         "text", "text"),
+    ),
+    "mesh_term_staging": (
+        ("seq", "concept_ui", "term_ui", "term_text", "is_preferred",
+         "is_permuted", "lexical_tag", "entry_combination", "sort_version"),
+        ("integer", "text", "text", "text", "boolean",
+         "boolean", "text", "text", "text"),
+    ),
+}
+
 
 @dataclass
 class MeSHDescriptor:
@@ -146,6 +184,7 @@ class MeSHImporter:
         self,
         download_dir: Optional[Path] = None,
         keep_downloads: bool = True,
+        ingest_mode: str = INGEST_MODE_COPY,
     ) -> None:
         """
         Initialize MeSH importer.
@@ -153,7 +192,18 @@ class MeSHImporter:
         Args:
             download_dir: Directory for downloaded files (default: ~/.bmlibrarian/downloads/mesh)
             keep_downloads: Whether to keep downloaded files after import
+            ingest_mode: 'copy' (default) to stage descriptor batches with COPY
+                and merge them with set-based statements, or 'row' for one
+                INSERT per descriptor, tree number, concept and term
+
+        Raises:
+            ValueError: If ingest_mode is not one of INGEST_MODES
         """
+        if ingest_mode not in INGEST_MODES:
+            raise ValueError(
+                f"Invalid ingest_mode '{ingest_mode}', expected one of {INGEST_MODES}"
+            )
+        self.ingest_mode = ingest_mode
         self.db_manager = get_db_manager()
         self.download_dir = download_dir or DEFAULT_DOWNLOAD_DIR
         self.download_dir.mkdir(parents=True, exist_ok=True)
@@ -486,6 +536,41 @@ class MeSHImporter:
                     # Clear element to save memory
                     elem.clear()
 
+    def _iter_xml_records_with_position(
+        self,
+        file_path: Path,
+        record_tag: str,
+    ) -> Iterator[Tuple[ET.Element, int, int]]:
+        """
+        Iterate over XML records together with the read position in the file.
+
+        Lets callers report progress from a single pass instead of counting
+        records first. For gzipped files the position is in compressed bytes.
+
+        Args:
+            file_path: Path to XML or XML.gz file
+            record_tag: XML tag name for records
+
+        Yields:
+            Tuples of (record element, bytes read so far, total file bytes)
+        """
+        total_bytes = file_path.stat().st_size
+        with self._open_xml_file(file_path) as f:
+            raw = getattr(f, "fileobj", f)
+            context = ET.iterparse(f, events=("end",))
+            for event, elem in context:
+                if elem.tag == record_tag:
+                    yield elem, raw.tell(), total_bytes
+                    # Clear element to save memory
+                    elem.clear()
+
+    @staticmethod
+    def _estimate_total(processed: int, bytes_read: int, total_bytes: int) -> int:
+        """Extrapolate the total record count from the byte position."""
+        if bytes_read <= 0:
+            return 0
+        return max(processed, int(processed * total_bytes / bytes_read))
+
     def _store_descriptor(
         self,
         descriptor: MeSHDescriptor,
@@ -610,6 +695,174 @@ class MeSHImporter:
 
         return terms_count
 
+    def _ensure_staging_tables(self, cur: Any) -> None:
+        """Create the session-local staging tables if this connection lacks them."""
+        for table, (columns, types) in STAGING_TABLES.items():
+            column_defs = ", ".join(f"{name} {col_type}" for name, col_type in zip(columns, types))
+            cur.execute(f"CREATE TEMP TABLE IF NOT EXISTS {table} ({column_defs})")
+        cur.execute(f"TRUNCATE {', '.join(STAGING_TABLES)}")
+
+    def _stage_descriptor_batch(
+        self,
+        cur: Any,
+        batch: List[Tuple[int, MeSHDescriptor]],
+    ) -> None:
+        """
+        COPY a batch of descriptors and their children into the staging tables.
+
+        Args:
+            cur: Cursor on the importing connection
+            batch: (file position, descriptor) pairs
+        """
+        rows: Dict[str, List[Tuple[Any, ...]]] = {table: [] for table in STAGING_TABLES}
+        for seq, descriptor in batch:
+            ui = descriptor.descriptor_ui
+            rows["mesh_descriptor_staging"].append((
+                seq,
+                ui,
+                descriptor.descriptor_name,
+                descriptor.scope_note,
+                descriptor.annotation,
+                descriptor.history_note,
+                descriptor.public_mesh_note,
+                descriptor.nlm_classification,
+                self._parse_date(descriptor.date_created),
+                self._parse_date(descriptor.date_revised),
+                self._parse_date(descriptor.date_established),
+            ))
+            for tree_num in descriptor.tree_numbers:
+                rows["mesh_tree_staging"].append((ui, tree_num, tree_num.count(".") + 1))
+            for concept in descriptor.concepts:
+                rows["mesh_concept_staging"].append((
+                    seq,
+                    ui,
+                    concept["concept_ui"],
+                    concept["concept_name"],
+                    concept["is_preferred"],
+                    concept.get("scope_note"),
+                    concept.get("cas_registry_number"),
+                ))
+                for term in concept.get("terms", []):
+                    rows["mesh_term_staging"].append((
+                        seq,
+                        concept["concept_ui"],
+                        term["term_ui"],
+                        term["term_text"],
+                        term["is_preferred"],
+                        term["is_permuted"],
+                        term.get("lexical_tag"),
+                        term.get("entry_combination"),
+                        term.get("sort_version"),
+                    ))
+
+        for table, (columns, types) in STAGING_TABLES.items():
+            if not rows[table]:
+                continue
+            with cur.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                copy.set_types(list(types))
+                for row in rows[table]:
+                    copy.write_row(row)
+
+    def _merge_descriptor_batch(self, cur: Any, mesh_year: int) -> None:
+        """
+        Merge the staged batch into the mesh tables with set-based statements.
+
+        Same semantics as _store_descriptor(): descriptors and concepts are
+        upserted, each descriptor's tree numbers are replaced, and terms are
+        added to their concepts. Terms already present on the concept (same
+        term_ui) are not inserted again, so re-imports do not duplicate them.
+
+        Args:
+            cur: Cursor on the connection holding the staging tables
+            mesh_year: MeSH year
+        """
+        cur.execute(
+            """
+            INSERT INTO mesh.descriptors (
+                descriptor_ui, descriptor_name, scope_note, annotation,
+                history_note, public_mesh_note, nlm_classification,
+                date_created, date_revised, date_established, mesh_year
+            )
+            SELECT DISTINCT ON (s.descriptor_ui)
+                s.descriptor_ui, s.descriptor_name, s.scope_note, s.annotation,
+                s.history_note, s.public_mesh_note, s.nlm_classification,
+                s.date_created, s.date_revised, s.date_established, %s
+            FROM mesh_descriptor_staging s
+            ORDER BY s.descriptor_ui, s.seq DESC
+            ON CONFLICT (descriptor_ui) DO UPDATE SET
+                descriptor_name = EXCLUDED.descriptor_name,
+                scope_note = EXCLUDED.scope_note,
+                annotation = EXCLUDED.annotation,
+                history_note = EXCLUDED.history_note,
+                public_mesh_note = EXCLUDED.public_mesh_note,
+                nlm_classification = EXCLUDED.nlm_classification,
+                date_revised = EXCLUDED.date_revised,
+                mesh_year = EXCLUDED.mesh_year,
+                updated_at = NOW()
+            """,
+            (mesh_year,),
+        )
+
+        # Replace tree numbers of every descriptor in the batch
+        cur.execute(
+            """
+            DELETE FROM mesh.tree_numbers t
+            USING mesh.descriptors d
+            WHERE t.descriptor_id = d.id
+              AND d.descriptor_ui IN (SELECT descriptor_ui FROM mesh_descriptor_staging)
+            """
+        )
+        cur.execute(
+            """
+            INSERT INTO mesh.tree_numbers (descriptor_id, tree_number, tree_level)
+            SELECT d.id, s.tree_number, s.tree_level
+            FROM mesh_tree_staging s
+            JOIN mesh.descriptors d ON d.descriptor_ui = s.descriptor_ui
+            ON CONFLICT (descriptor_id, tree_number) DO NOTHING
+            """
+        )
+
+        cur.execute(
+            """
+            INSERT INTO mesh.concepts (
+                concept_ui, concept_name, descriptor_id, is_preferred,
+                scope_note, cas_registry_number
+            )
+            SELECT DISTINCT ON (s.concept_ui)
+                s.concept_ui, s.concept_name, d.id, s.is_preferred,
+                s.scope_note, s.cas_registry_number
+            FROM mesh_concept_staging s
+            JOIN mesh.descriptors d ON d.descriptor_ui = s.descriptor_ui
+            ORDER BY s.concept_ui, s.seq DESC
+            ON CONFLICT (concept_ui) DO UPDATE SET
+                concept_name = EXCLUDED.concept_name,
+                is_preferred = EXCLUDED.is_preferred,
+                scope_note = EXCLUDED.scope_note
+            """
+        )
+
+        cur.execute(
+            """
+            INSERT INTO mesh.terms (
+                term_ui, term_text, concept_id, is_preferred,
+                is_permuted, lexical_tag, entry_combination, sort_version
+            )
+            SELECT DISTINCT ON (c.id, s.term_ui)
+                s.term_ui, s.term_text, c.id, s.is_preferred,
+                s.is_permuted, s.lexical_tag, s.entry_combination, s.sort_version
+            FROM mesh_term_staging s
+            JOIN mesh.concepts c ON c.concept_ui = s.concept_ui
+            WHERE NOT EXISTS (
+                SELECT 1 FROM mesh.terms t
+                WHERE t.concept_id = c.id AND t.term_ui = s.term_ui
+            )
+            ORDER BY c.id, s.term_ui, s.seq DESC
+            ON CONFLICT DO NOTHING
+            """
+        )
+
+        cur.execute(f"TRUNCATE {', '.join(STAGING_TABLES)}")
+
     def _parse_date(self, year_str: Optional[str]) -> Optional[str]:
         """
         Parse a year string to a date.
@@ -636,41 +889,70 @@ class MeSHImporter:
         """
         Import MeSH descriptors from XML file.
 
+        Reads the file once. In 'copy' mode descriptors are staged in batches
+        of BULK_DESCRIPTOR_BATCH_SIZE and merged with a handful of set-based
+        statements per batch; in 'row' mode each record is stored with
+        _store_descriptor().
+
         Args:
             file_path: Path to descriptor XML file
             mesh_year: MeSH year
-            progress_callback: Optional callback(processed, total)
+            progress_callback: Optional callback(processed, total). Until the
+                final call, total is estimated from the position in the file.
 
         Returns:
             Import statistics
         """
         stats = ImportStats(mesh_year=mesh_year, import_type="full")
+        bulk = self.ingest_mode == INGEST_MODE_COPY
+        batch_size = BULK_DESCRIPTOR_BATCH_SIZE if bulk else DESCRIPTOR_BATCH_SIZE
 
         try:
-            # Count total records first (for progress)
-            total_records = sum(1 for _ in self._iter_xml_records(file_path, "DescriptorRecord"))
-            logger.info(f"Found {total_records:,} descriptor records")
-
-            # Process records
+            # Single pass; progress is extrapolated from the file position
             with self.db_manager.get_connection() as conn:
-                for i, elem in enumerate(self._iter_xml_records(file_path, "DescriptorRecord")):
-                    descriptor = self._parse_descriptor(elem)
-                    terms_count = self._store_descriptor(descriptor, mesh_year, conn)
-
-                    stats.descriptors += 1
-                    stats.concepts += len(descriptor.concepts)
-                    stats.terms += terms_count
-                    stats.tree_numbers += len(descriptor.tree_numbers)
+                with conn.cursor() as cur:
+                    if bulk:
+                        self._ensure_staging_tables(cur)
 
-                    if progress_callback and (i + 1) % 100 == 0:
-                        progress_callback(i + 1, total_records)
+                    batch: List[Tuple[int, MeSHDescriptor]] = []
+                    bytes_read, total_bytes = 0, 0
+                    for i, (elem, bytes_read, total_bytes) in enumerate(
+                        self._iter_xml_records_with_position(file_path, "DescriptorRecord")
+                    ):
+                        descriptor = self._parse_descriptor(elem)
+                        stats.descriptors += 1
+                        stats.concepts += len(descriptor.concepts)
+                        stats.tree_numbers += len(descriptor.tree_numbers)
+
+                        if bulk:
+                            stats.terms += sum(len(c.get("terms", [])) for c in descriptor.concepts)
+                            batch.append((i, descriptor))
+                            if len(batch) >= batch_size:
+                                self._stage_descriptor_batch(cur, batch)
+                                self._merge_descriptor_batch(cur, mesh_year)
+                                batch = []
+                        else:
+                            stats.terms += self._store_descriptor(descriptor, mesh_year, conn)
+
+                        if progress_callback and (i + 1) % DESCRIPTOR_BATCH_SIZE == 0:
+                            progress_callback(
+                                i + 1, self._estimate_total(i + 1, bytes_read, total_bytes)
+                            )
+
+                    if batch:
+                        self._stage_descriptor_batch(cur, batch)
+                        self._merge_descriptor_batch(cur, mesh_year)
 
                 conn.commit()
 
+            if progress_callback:
+                progress_callback(stats.descriptors, stats.descriptors)
+
             stats.mark_completed()
             logger.info(
                 f"Imported {stats.descriptors:,} descriptors, "
-                f"{stats.concepts:,} concepts, {stats.terms:,} terms"
+                f"{stats.concepts:,} concepts, {stats.terms:,} terms "
+                f"({self.ingest_mode} mode)"
             )
 
         except Exception as e:
@@ -756,7 +1038,8 @@ class MeSHImporter:
         Args:
             file_path: Path to supplementary XML file
             mesh_year: MeSH year
-            progress_callback: Optional callback(processed, total)
+            progress_callback: Optional callback(processed, total), with total
+                estimated from the position in the file
 
         Returns:
             Import statistics
@@ -764,16 +1047,11 @@ class MeSHImporter:
         stats = ImportStats(mesh_year=mesh_year, import_type="supplementary")
 
         try:
-            # Count total records
-            total_records = sum(
-                1 for _ in self._iter_xml_records(file_path, "SupplementalRecord")
-            )
-            logger.info(f"Found {total_records:,} supplementary records")
-
+            # Single pass; progress is extrapolated from the file position
             with self.db_manager.get_connection() as conn:
                 with conn.cursor() as cur:
-                    for i, elem in enumerate(
-                        self._iter_xml_records(file_path, "SupplementalRecord")
+                    for i, (elem, bytes_read, total_bytes) in enumerate(
+                        self._iter_xml_records_with_position(file_path, "SupplementalRecord")
                     ):
                         scr = self._parse_supplementary(elem)
 
@@ -807,7 +1085,9 @@ class MeSHImporter:
                         stats.supplementary_concepts += 1
 
                         if progress_callback and (i + 1) % 1000 == 0:
-                            progress_callback(i + 1, total_records)
+                            progress_callback(
+                                i + 1, self._estimate_total(i + 1, bytes_read, total_bytes)
+                            )
 
                 conn.commit()
 
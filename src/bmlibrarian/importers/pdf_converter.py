@@ -25,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 # Supported converter names
 CONVERTER_PYMUPDF = "pymupdf"
+CONVERTER_PYMUPDF4LLM = "pymupdf4llm"
 DEFAULT_CONVERTER = CONVERTER_PYMUPDF
 
 
@@ -273,11 +274,92 @@ class PyMuPDFConverter(PDFConverter):
             )
 
 
+class PyMuPDF4LLMConverter(PDFConverter):
+    """
+    PDF converter producing markdown via pymupdf4llm.
+
+    Used by the medRxiv importer, whose full_text column holds markdown.
+    pymupdf4llm can crash the interpreter on malformed PDFs, so callers
+    should normally run it through PDFExtractionPool rather than inline.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the pymupdf4llm converter."""
+        try:
+            import fitz
+            import pymupdf4llm
+            self._fitz = fitz
+            self._pymupdf4llm = pymupdf4llm
+        except ImportError as e:
+            raise ImportError(
+                "pymupdf4llm is required for markdown PDF conversion. "
+                "Install with: pip install pymupdf4llm"
+            ) from e
+
+    @property
+    def name(self) -> str:
+        """Return the converter name."""
+        return CONVERTER_PYMUPDF4LLM
+
+    @property
+    def version(self) -> str:
+        """Return the pymupdf4llm version."""
+        return getattr(self._pymupdf4llm, "__version__", "") or self._fitz.version[0]
+
+    def convert(self, pdf_path: Path) -> ConversionResult:
+        """
+        Convert PDF to markdown using pymupdf4llm.
+
+        Args:
+            pdf_path: Path to the PDF file.
+
+        Returns:
+            ConversionResult with markdown text. pymupdf4llm converts the
+            document as a whole, so converted_pages is either all or none.
+        """
+        self.validate_pdf_path(pdf_path)
+
+        page_count = 0
+        try:
+            doc = self._fitz.open(str(pdf_path))
+            try:
+                page_count = len(doc)
+                markdown = self._pymupdf4llm.to_markdown(doc)
+            finally:
+                doc.close()
+
+            return ConversionResult(
+                success=True,
+                text=markdown,
+                format="markdown",
+                page_count=page_count,
+                converted_pages=page_count,
+                char_count=len(markdown),
+                converter_name=self.name,
+                converter_version=self.version,
+            )
+
+        except Exception as e:
+            error_msg = f"PDF conversion failed: {e}"
+            logger.error(f"PDF conversion failed for {pdf_path}: {error_msg}")
+            return ConversionResult(
+                success=False,
+                text="",
+                format="markdown",
+                page_count=page_count,
+                converted_pages=0,
+                char_count=0,
+                converter_name=self.name,
+                converter_version=self.version,
+                error_message=error_msg,
+            )
+
+
 # Registry of available converters
 _CONVERTER_REGISTRY: Dict[str, type] = {
     CONVERTER_PYMUPDF: PyMuPDFConverter,
+    CONVERTER_PYMUPDF4LLM: PyMuPDF4LLMConverter,
     # Future converters can be added here:
-    # "pymupdf4llm": PyMuPDF4LLMConverter,  # When stable
     # "docling": DoclingConverter,
     # "marker": MarkerConverter,
 }
@@ -288,7 +370,7 @@ def get_converter(name: str = DEFAULT_CONVERTER) -> PDFConverter:
     Factory function to get a PDF converter by name.
 
     Args:
-        name: Converter name. Currently supported: "pymupdf".
+        name: Converter name. Currently supported: "pymupdf", "pymupdf4llm".
 
     Returns:
         Initialized PDFConverter instance.
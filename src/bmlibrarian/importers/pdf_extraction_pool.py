@@ -0,0 +1,635 @@
+"""
+Shared, sandboxed PDF text extraction service for BMLibrarian.
+
+PyMuPDF and pymupdf4llm occasionally segfault on malformed PDFs, so PDF
+conversion must not run in the calling process. Starting a brand-new
+process per PDF (and re-importing PyMuPDF in it) costs more than converting
+a typical preprint, so this module keeps a pool of long-lived worker
+processes instead:
+
+- Each worker imports a converter once and reuses it until it has handled
+  ``max_tasks_per_worker`` documents; it then exits and is replaced, which
+  bounds leaks in the native libraries.
+- A worker that crashes, or overruns the per-task timeout, is killed and
+  replaced. Only the task it was running fails (status CRASHED / TIMEOUT);
+  queued tasks are unaffected.
+- Workers run under an address-space limit (RLIMIT_AS) where the platform
+  supports it, so a pathological document fails with MemoryError instead
+  of exhausting the machine.
+- Extracted text is written to a spool file; only its path travels back
+  over the pipe, and the parent reads and deletes it.
+
+Any thread may submit work. Tasks from all callers (medRxiv importer,
+PDFIngestor, the Qt document processor, Europe PMC PDF conversion) share
+the same workers through get_extraction_pool().
+
+Usage:
+    from bmlibrarian.importers.pdf_extraction_pool import get_extraction_pool
+
+    pool = get_extraction_pool()
+    for result in pool.extract_batch(pdf_paths, converter_name="pymupdf4llm"):
+        if result.success:
+            print(result.pdf_path, result.conversion.char_count)
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .pdf_converter import DEFAULT_CONVERTER, ConversionResult, PDFConverter, get_converter
+
+logger = logging.getLogger(__name__)
+
+# Default number of worker processes (PDF conversion is CPU-bound; leave
+# a core for the caller and cap it, since each worker holds its own PyMuPDF)
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+# Documents a worker converts before it is replaced by a fresh process
+DEFAULT_MAX_TASKS_PER_WORKER = 100
+
+# Seconds a single conversion may take before its worker is killed
+DEFAULT_TASK_TIMEOUT_SECONDS = 60.0
+
+# Address-space limit per worker in MB (0 disables the limit)
+DEFAULT_MEMORY_LIMIT_MB = 2048
+
+# Seconds a retiring worker gets to exit cleanly before it is killed
+_WORKER_EXIT_GRACE_SECONDS = 5.0
+
+# Spool files carry converter output verbatim, including lone surrogates
+_SPOOL_ENCODING = "utf-8"
+_SPOOL_ERRORS = "surrogatepass"
+
+
+class ExtractionStatus(Enum):
+    """Outcome of one task in the extraction pool."""
+
+    OK = "ok"  # The converter returned a ConversionResult (which may itself report failure)
+    FAILED = "failed"  # The converter raised (missing file, missing dependency, MemoryError, ...)
+    TIMEOUT = "timeout"  # The task overran its timeout; the worker was killed
+    CRASHED = "crashed"  # The worker process died while converting
+
+
+@dataclass
+class PDFExtractionResult:
+    """
+    Result of one PDF submitted to the extraction pool.
+
+    Attributes:
+        pdf_path: PDF that was converted.
+        status: Pool-level outcome of the task.
+        converter_name: Converter the task was run with.
+        conversion: Converter output, or None unless status is OK.
+        error_message: Reason for failure, if any.
+        elapsed_seconds: Wall-clock time from dispatch to result.
+        worker_pid: PID of the worker process that ran the task.
+    """
+
+    pdf_path: Path
+    status: ExtractionStatus
+    converter_name: str = DEFAULT_CONVERTER
+    conversion: Optional[ConversionResult] = None
+    error_message: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    worker_pid: Optional[int] = None
+
+    @property
+    def success(self) -> bool:
+        """True if the converter ran and reported success."""
+        return (
+            self.status is ExtractionStatus.OK
+            and self.conversion is not None
+            and self.conversion.success
+        )
+
+    @property
+    def text(self) -> str:
+        """Extracted text, or an empty string on failure."""
+        return self.conversion.text if self.success and self.conversion else ""
+
+    @property
+    def killed_worker(self) -> bool:
+        """True if the PDF timed out or crashed its worker (a problem file)."""
+        return self.status in (ExtractionStatus.TIMEOUT, ExtractionStatus.CRASHED)
+
+    def to_conversion_result(self) -> ConversionResult:
+        """
+        Return the result in the PDFConverter interface.
+
+        Timeouts, crashes and converter exceptions become a failed
+        ConversionResult carrying the error message.
+        """
+        if self.conversion is not None:
+            return self.conversion
+        return ConversionResult(
+            success=False,
+            text="",
+            format="",
+            page_count=0,
+            converted_pages=0,
+            char_count=0,
+            converter_name=self.converter_name,
+            error_message=self.error_message,
+        )
+
+
+@dataclass
+class _Task:
+    """A queued conversion request."""
+
+    pdf_path: Path
+    converter_name: str
+    timeout: float
+    future: "Future[PDFExtractionResult]"
+
+
+# ============================================================================
+# Worker process side
+# ============================================================================
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    """Cap this process's address space (soft RLIMIT_AS) where supported."""
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return
+
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError, AttributeError) as e:
+        # macOS does not enforce RLIMIT_AS; carry on without a limit
+        logger.debug(f"Could not set PDF worker memory limit: {e}")
+
+
+def _worker_main(conn: Connection, spool_dir: str, memory_limit_mb: int) -> None:
+    """
+    Worker process loop: convert PDFs received over the pipe until told to stop.
+
+    Receives (pdf_path, converter_name) tuples; None (or a closed pipe) ends
+    the loop. Replies with (conversion, text_path, error_message) where the
+    converted text is in the spool file at text_path rather than in the
+    pickled ConversionResult.
+
+    Args:
+        conn: Worker end of the pipe to the pool.
+        spool_dir: Directory for text spool files.
+        memory_limit_mb: Address-space limit in MB (0 for none).
+    """
+    _limit_memory(memory_limit_mb)
+    converters: Dict[str, PDFConverter] = {}
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+
+        pdf_path, converter_name = task
+        try:
+            converter = converters.get(converter_name)
+            if converter is None:
+                converter = converters[converter_name] = get_converter(converter_name)
+            conversion = converter.convert(Path(pdf_path))
+
+            text_path: Optional[str] = None
+            if conversion.text:
+                fd, text_path = tempfile.mkstemp(dir=spool_dir, suffix=".txt")
+                with os.fdopen(fd, "w", encoding=_SPOOL_ENCODING, errors=_SPOOL_ERRORS) as f:
+                    f.write(conversion.text)
+                conversion.text = ""
+            reply: Tuple[Any, ...] = (conversion, text_path, None)
+        except Exception as e:
+            reply = (None, None, f"{type(e).__name__}: {e}")
+
+        conn.send(reply)
+
+
+# ============================================================================
+# Pool (parent) side
+# ============================================================================
+
+class _Worker:
+    """A worker process and the pool's end of its pipe."""
+
+    def __init__(
+        self,
+        mp_context: Any,
+        spool_dir: str,
+        memory_limit_mb: int,
+        name: str,
+    ) -> None:
+        parent_conn, child_conn = mp_context.Pipe(duplex=True)
+        self.process = mp_context.Process(
+            target=_worker_main,
+            args=(child_conn, spool_dir, memory_limit_mb),
+            name=name,
+            daemon=True,
+        )
+        self.process.start()
+        # Close our copy of the child's end so a dead worker reads as EOF
+        child_conn.close()
+        self.conn: Connection = parent_conn
+        self.tasks_done = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        """PID of the worker process."""
+        return self.process.pid
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(_WORKER_EXIT_GRACE_SECONDS)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> Optional[int]:
+        """Kill the worker (if still alive) and return its exit code."""
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+        return self.process.exitcode
+
+
+class PDFExtractionPool:
+    """
+    Pool of long-lived, sandboxed PDF conversion worker processes.
+
+    One dispatcher thread per worker takes tasks from a shared queue, so up
+    to ``workers`` PDFs convert concurrently regardless of how many callers
+    submit. Workers (and the spool directory) are created on first use.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        max_tasks_per_worker: int = DEFAULT_MAX_TASKS_PER_WORKER,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT_SECONDS,
+        memory_limit_mb: int = DEFAULT_MEMORY_LIMIT_MB,
+        default_converter: str = DEFAULT_CONVERTER,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of worker processes.
+            max_tasks_per_worker: Conversions before a worker is recycled.
+            task_timeout: Default per-task timeout in seconds.
+            memory_limit_mb: Per-worker address-space limit in MB (0 disables).
+            default_converter: Converter used when a task names none.
+
+        Raises:
+            ValueError: If workers, max_tasks_per_worker or task_timeout is not positive.
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if max_tasks_per_worker < 1:
+            raise ValueError(f"max_tasks_per_worker must be >= 1, got {max_tasks_per_worker}")
+        if task_timeout <= 0:
+            raise ValueError(f"task_timeout must be > 0, got {task_timeout}")
+
+        self.workers = workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.task_timeout = task_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.default_converter = default_converter
+
+        # Spawn rather than fork: callers run threads and hold pooled
+        # database connections
+        self._mp_context = multiprocessing.get_context('spawn')
+        self._tasks: "queue.Queue[Optional[_Task]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._spool_dir: Optional[str] = None
+        self._closed = False
+        self._counters: Dict[str, int] = {
+            'submitted': 0,
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'crashes': 0,
+            'workers_started': 0,
+        }
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    @property
+    def closed(self) -> bool:
+        """True once close() has been called."""
+        return self._closed
+
+    def submit(
+        self,
+        pdf_path: Union[str, Path],
+        converter_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> "Future[PDFExtractionResult]":
+        """
+        Queue a PDF for conversion.
+
+        Args:
+            pdf_path: PDF to convert.
+            converter_name: Converter to use (default: the pool's default_converter).
+            timeout: Per-task timeout in seconds (default: the pool's task_timeout).
+
+        Returns:
+            Future resolving to a PDFExtractionResult. The future never
+            raises for conversion problems; check result.status instead.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        future: "Future[PDFExtractionResult]" = Future()
+        task = _Task(
+            pdf_path=Path(pdf_path),
+            converter_name=converter_name or self.default_converter,
+            timeout=timeout or self.task_timeout,
+            future=future,
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PDFExtractionPool is closed")
+            self._start_locked()
+            self._counters['submitted'] += 1
+            self._tasks.put(task)
+        return future
+
+    def extract(
+        self,
+        pdf_path: Union[str, Path],
+        converter_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> PDFExtractionResult:
+        """Convert one PDF and wait for the result (see submit())."""
+        return self.submit(pdf_path, converter_name, timeout).result()
+
+    def extract_batch(
+        self,
+        pdf_paths: Iterable[Union[str, Path]],
+        converter_name: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> List[PDFExtractionResult]:
+        """
+        Convert several PDFs concurrently.
+
+        Args:
+            pdf_paths: PDFs to convert.
+            converter_name: Converter to use for all of them.
+            timeout: Per-task timeout in seconds.
+
+        Returns:
+            Results in the same order as pdf_paths.
+        """
+        futures = [self.submit(path, converter_name, timeout) for path in pdf_paths]
+        return [future.result() for future in futures]
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the pool's task and worker counters."""
+        with self._lock:
+            return dict(self._counters)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Shut the pool down.
+
+        Queued tasks that have not started are cancelled; running tasks
+        finish. Safe to call more than once.
+
+        Args:
+            wait: If True, wait for running tasks and workers to finish and
+                  remove the spool directory.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task is not None:
+                task.future.cancel()
+
+        for _ in threads:
+            self._tasks.put(None)
+
+        if wait:
+            for thread in threads:
+                thread.join()
+            if self._spool_dir:
+                shutil.rmtree(self._spool_dir, ignore_errors=True)
+
+    def __enter__(self) -> 'PDFExtractionPool':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _start_locked(self) -> None:
+        """Create the spool directory and dispatcher threads (lock held)."""
+        if self._threads:
+            return
+        self._spool_dir = tempfile.mkdtemp(prefix="bmlibrarian_pdf_")
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._dispatch_loop,
+                args=(index,),
+                name=f"PDFExtraction-Dispatcher-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _spawn_worker(self, index: int) -> _Worker:
+        """Start a fresh worker process for dispatcher slot ``index``."""
+        assert self._spool_dir is not None
+        worker = _Worker(
+            self._mp_context,
+            self._spool_dir,
+            self.memory_limit_mb,
+            name=f"PDFExtraction-Worker-{index}",
+        )
+        self._count('workers_started')
+        logger.debug(f"Started PDF extraction worker {worker.pid} (slot {index})")
+        return worker
+
+    def _dispatch_loop(self, index: int) -> None:
+        """Feed queued tasks to one worker, replacing it as needed."""
+        worker: Optional[_Worker] = None
+        try:
+            while True:
+                task = self._tasks.get()
+                if task is None:
+                    return
+                if not task.future.set_running_or_notify_cancel():
+                    continue
+
+                try:
+                    if worker is None:
+                        worker = self._spawn_worker(index)
+                    result, worker_usable = self._run_task(worker, task)
+                except Exception as e:
+                    logger.error(f"PDF extraction dispatch failed for {task.pdf_path}: {e}")
+                    if worker is not None:
+                        worker.kill()
+                    worker = None
+                    task.future.set_exception(e)
+                    continue
+
+                if not worker_usable:
+                    worker = None
+                elif worker.tasks_done >= self.max_tasks_per_worker:
+                    logger.debug(
+                        f"Recycling PDF extraction worker {worker.pid} "
+                        f"after {worker.tasks_done} documents"
+                    )
+                    worker.stop()
+                    worker = None
+
+                self._count('completed' if result.success else 'failed')
+                task.future.set_result(result)
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    def _run_task(self, worker: _Worker, task: _Task) -> Tuple[PDFExtractionResult, bool]:
+        """
+        Run one task on a worker.
+
+        Returns:
+            (result, worker_usable). worker_usable is False if the worker
+            was killed (timeout) or died (crash) and must be replaced.
+        """
+        started = time.monotonic()
+
+        def finish(
+            status: ExtractionStatus,
+            conversion: Optional[ConversionResult] = None,
+            error_message: Optional[str] = None,
+        ) -> PDFExtractionResult:
+            return PDFExtractionResult(
+                pdf_path=task.pdf_path,
+                status=status,
+                converter_name=task.converter_name,
+                conversion=conversion,
+                error_message=error_message,
+                elapsed_seconds=time.monotonic() - started,
+                worker_pid=worker.pid,
+            )
+
+        try:
+            worker.conn.send((str(task.pdf_path), task.converter_name))
+            if not worker.conn.poll(task.timeout):
+                worker.kill()
+                self._count('timeouts')
+                logger.warning(
+                    f"PDF extraction timed out after {task.timeout} seconds for {task.pdf_path}"
+                )
+                return finish(
+                    ExtractionStatus.TIMEOUT,
+                    error_message=f"PDF extraction timed out after {task.timeout} seconds",
+                ), False
+            conversion, text_path, error_message = worker.conn.recv()
+        except (EOFError, OSError):
+            exitcode = worker.kill()
+            self._count('crashes')
+            logger.warning(
+                f"PDF extraction worker crashed (exit code {exitcode}) for {task.pdf_path}"
+            )
+            return finish(
+                ExtractionStatus.CRASHED,
+                error_message=f"PDF extraction worker crashed (exit code {exitcode})",
+            ), False
+
+        worker.tasks_done += 1
+        if conversion is None:
+            return finish(ExtractionStatus.FAILED, error_message=error_message), True
+
+        if text_path:
+            conversion.text = self._read_spool(text_path)
+        return finish(ExtractionStatus.OK, conversion, conversion.error_message), True
+
+    @staticmethod
+    def _read_spool(text_path: str) -> str:
+        """Read and delete a worker's spool file."""
+        try:
+            with open(text_path, "r", encoding=_SPOOL_ENCODING, errors=_SPOOL_ERRORS) as f:
+                return f.read()
+        finally:
+            try:
+                os.unlink(text_path)
+            except OSError:
+                pass
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+
+# ============================================================================
+# Shared pool
+# ============================================================================
+
+_shared_pool: Optional[PDFExtractionPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> PDFExtractionPool:
+    """
+    Return the process-wide extraction pool, creating it on first use.
+
+    Returns:
+        The shared PDFExtractionPool (default settings).
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool.closed:
+            _shared_pool = PDFExtractionPool()
+        return _shared_pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Close the shared pool, if one was created (registered with atexit)."""
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_extraction_pool)
@@ -26,13 +26,20 @@ Example usage:
 
     # Or just ingest without immediate embedding (will be queued)
     result = ingestor.ingest_pdf(document_id=12345, pdf_path=Path("/path/to/paper.pdf"))
+
+    # Several PDFs, converted concurrently in the shared extraction pool
+    results = ingestor.ingest_pdf_batch([(12345, path_a), (12346, path_b)])
+
+PDF conversion runs in the shared, sandboxed PDFExtractionPool by default,
+so a converter crash cannot take down the caller (e.g. the Qt GUI). Pass
+use_extraction_pool=False to convert in-process.
 """
 
 import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Sequence, Tuple
 
 from bmlibrarian.database import get_db_manager
 from bmlibrarian.importers.pdf_converter import (
@@ -40,6 +47,7 @@ from bmlibrarian.importers.pdf_converter import (
     ConversionResult,
     DEFAULT_CONVERTER,
 )
+from bmlibrarian.importers.pdf_extraction_pool import get_extraction_pool
 from bmlibrarian.embeddings.chunk_embedder import (
     ChunkEmbedder,
     DEFAULT_CHUNK_SIZE,
@@ -109,6 +117,7 @@ class PDFIngestor:
         converter_name: str = DEFAULT_CONVERTER,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
         chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        use_extraction_pool: bool = True,
     ) -> None:
         """
         Initialize the PDF ingestor.
@@ -119,6 +128,8 @@ class PDFIngestor:
             converter_name: Name of PDF converter to use (default: "pymupdf").
             chunk_size: Default chunk size for text chunking.
             chunk_overlap: Default overlap between chunks.
+            use_extraction_pool: If True, convert PDFs in the shared sandboxed
+                                 extraction pool; if False, convert in-process.
         """
         self.db_manager = get_db_manager()
 
@@ -130,6 +141,7 @@ class PDFIngestor:
         # Initialize converter
         self.converter_name = converter_name
         self._converter = None  # Lazy initialization
+        self.use_extraction_pool = use_extraction_pool
 
         # Chunking parameters
         self.chunk_size = chunk_size
@@ -150,6 +162,22 @@ class PDFIngestor:
             self._converter = get_converter(self.converter_name)
         return self._converter
 
+    def _convert(self, pdf_path: Path) -> ConversionResult:
+        """
+        Convert a PDF with the configured converter.
+
+        Args:
+            pdf_path: Path to the PDF file.
+
+        Returns:
+            ConversionResult (a failed one if the pool worker timed out or crashed).
+        """
+        if not self.use_extraction_pool:
+            return self.converter.convert(pdf_path)
+        return get_extraction_pool().extract(
+            pdf_path, converter_name=self.converter_name
+        ).to_conversion_result()
+
     @property
     def embedder(self) -> ChunkEmbedder:
         """Lazy-load the chunk embedder."""
@@ -361,6 +389,7 @@ class PDFIngestor:
         store_pdf: bool = True,
         extract_text: bool = True,
         store_full_text: bool = True,
+        conversion_result: Optional[ConversionResult] = None,
     ) -> IngestResult:
         """
         Ingest a PDF for a document (text extraction only, no embedding).
@@ -374,6 +403,8 @@ class PDFIngestor:
             store_pdf: If True, copy PDF to storage location.
             extract_text: If True, extract text from PDF.
             store_full_text: If True, store extracted text in database.
+            conversion_result: Already-converted text for pdf_path (used by
+                              ingest_pdf_batch); skips conversion if given.
 
         Returns:
             IngestResult with details of the operation.
@@ -410,10 +441,10 @@ class PDFIngestor:
                 warnings.append("Failed to store PDF to standard location")
 
         # Step 2: Extract text
-        conversion_result: Optional[ConversionResult] = None
         if extract_text:
             try:
-                conversion_result = self.converter.convert(pdf_path)
+                if conversion_result is None:
+                    conversion_result = self._convert(pdf_path)
                 result.conversion_result = conversion_result
 
                 if conversion_result.success:
@@ -462,6 +493,50 @@ class PDFIngestor:
         result.warnings = warnings
         return result
 
+    def ingest_pdf_batch(
+        self,
+        items: Sequence[Tuple[int, Path]],
+        store_pdf: bool = True,
+        store_full_text: bool = True,
+    ) -> List[IngestResult]:
+        """
+        Ingest several PDFs, converting them concurrently.
+
+        All conversions are submitted to the extraction pool up front; each
+        document is then stored as its conversion completes, in input order.
+        Without the pool this is equivalent to calling ingest_pdf() in a loop.
+
+        Args:
+            items: (document_id, pdf_path) pairs.
+            store_pdf: If True, copy PDFs to storage location.
+            store_full_text: If True, store extracted text in database.
+
+        Returns:
+            One IngestResult per item, in input order.
+        """
+        futures = [None] * len(items)
+        if self.use_extraction_pool:
+            pool = get_extraction_pool()
+            futures = [
+                pool.submit(pdf_path, converter_name=self.converter_name)
+                if pdf_path.exists() else None
+                for _, pdf_path in items
+            ]
+
+        results: List[IngestResult] = []
+        for (document_id, pdf_path), future in zip(items, futures):
+            results.append(self.ingest_pdf(
+                document_id=document_id,
+                pdf_path=pdf_path,
+                store_pdf=store_pdf,
+                extract_text=True,
+                store_full_text=store_full_text,
+                conversion_result=(
+                    future.result().to_conversion_result() if future is not None else None
+                ),
+            ))
+        return results
+
     def ingest_pdf_immediate(
         self,
         document_id: int,
@@ -32,6 +32,10 @@ Usage:
 
     # Import downloaded files
     importer.import_files()
+
+    # Bulk ingest mode: COPY into a staging table, then one set-based merge
+    importer = PubMedBulkImporter(data_dir='/path/to/pubmed_data', ingest_mode='copy')
+    importer.import_all_files(batch_size=5000)
 """
 
 import ftplib
@@ -46,7 +50,7 @@ import time
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Dict, List, Tuple, Callable
+from typing import Any, Optional, Dict, Iterator, List, Tuple, Callable
 import backoff
 
 from bmlibrarian.database import get_db_manager
@@ -59,6 +63,28 @@ ProgressCallback = Callable[[str], None]
 # Type alias for cancel check: () -> bool
 CancelCheck = Callable[[], bool]
 
+# Ingest modes for PubMedBulkImporter
+INGEST_MODE_ROW = 'row'    # SELECT + single-row INSERT/UPDATE per article
+INGEST_MODE_COPY = 'copy'  # COPY into a temp staging table + set-based merge
+INGEST_MODES = (INGEST_MODE_ROW, INGEST_MODE_COPY)
+
+# Session-local staging table used by the COPY ingest mode. ON COMMIT DELETE
+# ROWS empties it at the end of every batch transaction, so a pooled
+# connection can reuse it for the next batch without an explicit TRUNCATE.
+STAGING_TABLE = 'pubmed_bulk_staging'
+
+STAGING_COLUMNS = (
+    'seq', 'external_id', 'doi', 'title', 'abstract', 'authors',
+    'publication', 'publication_date', 'url', 'mesh_terms', 'keywords',
+    'grants', 'publication_types', 'is_retracted', 'author_affiliations',
+)
+
+STAGING_COLUMN_TYPES = (
+    'integer', 'text', 'text', 'text', 'text', 'text[]',
+    'text', 'date', 'text', 'text[]', 'text[]',
+    'jsonb', 'text[]', 'boolean', 'jsonb',
+)
+
 
 class DownloadTracker:
     """Tracks PubMed file downloads and processing status in PostgreSQL."""
@@ -345,14 +371,33 @@ class PubMedBulkImporter:
     BASELINE_PATH = '/pubmed/baseline'
     UPDATE_PATH = '/pubmed/updatefiles'
 
-    def __init__(self, data_dir: Optional[str] = None, use_tracking: bool = True):
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        use_tracking: bool = True,
+        ingest_mode: str = INGEST_MODE_ROW
+    ):
         """
         Initialize PubMed bulk importer.
 
         Args:
             data_dir: Directory for storing downloaded files (default: ~/knowledgebase/pubmed_data)
             use_tracking: Whether to use database tracking (default: True)
+            ingest_mode: 'row' for per-article upserts (default) or 'copy' to
+                stream each batch into a staging table with COPY and merge it
+                with one set-based INSERT ... ON CONFLICT
+
+        Raises:
+            ValueError: If ingest_mode is not one of INGEST_MODES
         """
+        if ingest_mode not in INGEST_MODES:
+            raise ValueError(
+                f"Invalid ingest_mode '{ingest_mode}', expected one of {INGEST_MODES}"
+            )
+        self.ingest_mode = ingest_mode
+        # Cached result of the transparency schema probe (COPY mode only)
+        self._transparency_schema_exists: Optional[bool] = None
+
         self.data_dir = Path(data_dir or os.path.expanduser('~/knowledgebase/pubmed_data'))
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1045,6 +1090,9 @@ class PubMedBulkImporter:
         if not articles:
             return 0
 
+        if self.ingest_mode == INGEST_MODE_COPY:
+            return self._store_article_batch_copy(articles)
+
         inserted = 0
         updated = 0
 
@@ -1255,6 +1303,220 @@ class PubMedBulkImporter:
 
         return stored
 
+    @staticmethod
+    def _staging_row(seq: int, article: Dict) -> Tuple:
+        """Build one COPY row for the staging table from a parsed article.
+
+        Empty strings become NULL so the merge's COALESCE keeps existing
+        values, mirroring the per-row UPDATE path. The jsonb columns get the
+        Python objects themselves: COPY's jsonb dumper serializes them, so a
+        pre-serialized string would be stored as a JSON string scalar.
+
+        Args:
+            seq: Position of the article within its batch (later wins).
+            article: Parsed article dict from _parse_article().
+
+        Returns:
+            Tuple of values in STAGING_COLUMNS order.
+        """
+        metadata = article.get('transparency_metadata') or {}
+        grants = metadata.get('grants')
+        affiliations = metadata.get('author_affiliations')
+        return (
+            seq,
+            article['pmid'],
+            article.get('doi') or None,
+            article.get('title'),
+            article.get('abstract') or None,
+            article.get('authors', []),
+            article.get('publication') or None,
+            article.get('publication_date') or None,
+            article.get('url'),
+            article.get('mesh_terms', []),
+            article.get('keywords', []),
+            grants or None,
+            metadata.get('publication_types') or None,
+            bool(metadata.get('is_retracted', False)),
+            affiliations or None,
+        )
+
+    def _ensure_staging_table(self, cur: Any) -> None:
+        """Create the session-local staging table if this connection lacks it."""
+        columns = ',\n'.join(
+            f'{name} {col_type}'
+            for name, col_type in zip(STAGING_COLUMNS, STAGING_COLUMN_TYPES)
+        )
+        cur.execute(f"""
+            CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} (
+                {columns}
+            ) ON COMMIT DELETE ROWS
+        """)
+
+    def _check_transparency_schema(self, cur: Any) -> bool:
+        """Return whether transparency.document_metadata exists (cached)."""
+        if self._transparency_schema_exists is None:
+            cur.execute("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_schema = 'transparency'
+                    AND table_name = 'document_metadata'
+                )
+            """)
+            self._transparency_schema_exists = bool(cur.fetchone()[0])
+        return self._transparency_schema_exists
+
+    def _store_article_batch_copy(self, articles: List[Dict]) -> int:
+        """Store batch of articles via COPY into staging and a set-based merge.
+
+        The batch is streamed into a temporary staging table with COPY, then
+        merged into document with a single INSERT ... ON CONFLICT
+        (source_id, external_id) DO UPDATE. Column semantics match the
+        per-row path: title, authors, MeSH terms and keywords are replaced,
+        while doi, abstract, publication and publication_date keep their
+        existing values when the new record has none. If a PMID appears more
+        than once in the batch, the last occurrence wins.
+
+        Transparency metadata is merged from the same staging rows inside a
+        savepoint, so a failure there never rolls back the document merge.
+
+        Args:
+            articles: Parsed article dicts from _parse_article().
+
+        Returns:
+            Number of documents inserted or updated.
+        """
+        inserted = 0
+        updated = 0
+
+        with self.db_manager.get_connection() as conn:
+            with conn.cursor() as cur:
+                self._ensure_staging_table(cur)
+
+                with cur.copy(
+                    f"COPY {STAGING_TABLE} ({', '.join(STAGING_COLUMNS)}) FROM STDIN"
+                ) as copy:
+                    copy.set_types(list(STAGING_COLUMN_TYPES))
+                    for seq, article in enumerate(articles):
+                        copy.write_row(self._staging_row(seq, article))
+
+                cur.execute(f"""
+                    INSERT INTO document (
+                        source_id, external_id, doi, title, abstract,
+                        authors, publication, publication_date,
+                        url, mesh_terms, keywords
+                    )
+                    SELECT DISTINCT ON (s.external_id)
+                        %s, s.external_id, s.doi, s.title, s.abstract,
+                        s.authors, s.publication, s.publication_date,
+                        s.url, s.mesh_terms, s.keywords
+                    FROM {STAGING_TABLE} s
+                    ORDER BY s.external_id, s.seq DESC
+                    ON CONFLICT (source_id, external_id) DO UPDATE SET
+                        doi = COALESCE(EXCLUDED.doi, document.doi),
+                        title = EXCLUDED.title,
+                        abstract = COALESCE(EXCLUDED.abstract, document.abstract),
+                        authors = EXCLUDED.authors,
+                        publication = COALESCE(EXCLUDED.publication, document.publication),
+                        publication_date = COALESCE(EXCLUDED.publication_date, document.publication_date),
+                        mesh_terms = EXCLUDED.mesh_terms,
+                        keywords = EXCLUDED.keywords,
+                        updated_date = CURRENT_TIMESTAMP
+                    RETURNING (xmax = 0)
+                """, (self.source_id,))
+                for (was_inserted,) in cur.fetchall():
+                    if was_inserted:
+                        inserted += 1
+                    else:
+                        updated += 1
+
+                stored_metadata = self._merge_transparency_metadata_staged(conn, cur)
+
+            conn.commit()
+
+        logger.debug(
+            f"Batch merged: {inserted} inserted, {updated} updated, "
+            f"{stored_metadata} transparency records"
+        )
+        return inserted + updated
+
+    def _merge_transparency_metadata_staged(self, conn: Any, cur: Any) -> int:
+        """Merge staged transparency metadata into transparency.document_metadata.
+
+        Runs inside a savepoint on the batch transaction; like the per-row
+        path, metadata storage is best-effort and never fails the import.
+
+        Args:
+            conn: Connection holding the populated staging table.
+            cur: Cursor on that connection.
+
+        Returns:
+            Number of metadata records inserted or updated.
+        """
+        try:
+            with conn.transaction():
+                if not self._check_transparency_schema(cur):
+                    logger.debug("transparency.document_metadata table not found, skipping metadata storage")
+                    return 0
+
+                cur.execute(f"""
+                    INSERT INTO transparency.document_metadata (
+                        document_id, grants, publication_types,
+                        is_retracted, author_affiliations, source
+                    )
+                    SELECT DISTINCT ON (d.id)
+                        d.id, s.grants, s.publication_types,
+                        s.is_retracted, s.author_affiliations, 'pubmed_bulk'
+                    FROM {STAGING_TABLE} s
+                    JOIN document d
+                        ON d.source_id = %s AND d.external_id = s.external_id
+                    WHERE s.grants IS NOT NULL
+                        OR s.publication_types IS NOT NULL
+                        OR s.is_retracted
+                        OR s.author_affiliations IS NOT NULL
+                    ORDER BY d.id, s.seq DESC
+                    ON CONFLICT (document_id)
+                    DO UPDATE SET
+                        grants = COALESCE(EXCLUDED.grants, transparency.document_metadata.grants),
+                        publication_types = COALESCE(EXCLUDED.publication_types, transparency.document_metadata.publication_types),
+                        is_retracted = EXCLUDED.is_retracted OR transparency.document_metadata.is_retracted,
+                        author_affiliations = COALESCE(EXCLUDED.author_affiliations, transparency.document_metadata.author_affiliations),
+                        imported_at = NOW()
+                """, (self.source_id,))
+                return max(cur.rowcount, 0)
+
+        except Exception as e:
+            logger.debug(f"Transparency metadata merge skipped: {e}")
+            return 0
+
+    def _iter_parsed_articles(self, filepath: Path) -> Iterator[Optional[Dict]]:
+        """
+        Stream-parse a PubMed .xml.gz file with iterparse.
+
+        Yields one entry per PubmedArticle element, in file order: the parsed
+        article dict, or None if the article could not be parsed. Parse
+        errors of the file itself (gzip, XML, I/O) propagate to the caller.
+
+        Args:
+            filepath: Path to .xml.gz file
+
+        Yields:
+            Parsed article dicts (None for unparseable articles)
+        """
+        with gzip.open(filepath, 'rb') as gz_file:
+            # Use iterparse for memory efficiency
+            context = ET.iterparse(gz_file, events=('end',))
+
+            for event, elem in context:
+                if elem.tag == 'PubmedArticle':
+                    article = self._parse_article(elem)
+
+                    # Clear element to free memory
+                    # Note: Standard library ElementTree doesn't support getparent()/getprevious()
+                    # (those are lxml-specific methods), so we just clear the element itself
+                    elem.clear()
+
+                    yield article
+
     def import_file(
         self,
         filepath: Path,
@@ -1270,56 +1532,57 @@ class PubMedBulkImporter:
             progress_callback: Optional callback for progress messages
 
         Returns:
-            Dict with import statistics
+            Dict with import statistics, including elapsed_seconds and
+            rows_per_second (articles stored per wall-clock second)
         """
-        logger.info(f"Importing {filepath.name}")
+        logger.info(f"Importing {filepath.name} ({self.ingest_mode} mode)")
 
         stats = {
             'filename': filepath.name,
             'articles_parsed': 0,
             'articles_imported': 0,
             'articles_updated': 0,
-            'errors': 0
+            'errors': 0,
+            'elapsed_seconds': 0.0,
+            'rows_per_second': 0.0
         }
 
         batch = []
+        start_time = time.perf_counter()
 
         try:
-            with gzip.open(filepath, 'rb') as gz_file:
-                # Use iterparse for memory efficiency
-                context = ET.iterparse(gz_file, events=('end',))
-
-                for event, elem in context:
-                    if elem.tag == 'PubmedArticle':
-                        article = self._parse_article(elem)
-                        if article:
-                            batch.append(article)
-                            stats['articles_parsed'] += 1
-
-                            if len(batch) >= batch_size:
-                                count = self._store_article_batch(batch)
-                                stats['articles_imported'] += count
-                                batch = []
-
-                                if stats['articles_parsed'] % 1000 == 0:
-                                    msg = f"{filepath.name}: Processed {stats['articles_parsed']:,} articles"
-                                    logger.info(msg)
-                                    if progress_callback:
-                                        progress_callback(f"[IMPORT] {msg}")
-                        else:
-                            stats['errors'] += 1
-
-                        # Clear element to free memory
-                        # Note: Standard library ElementTree doesn't support getparent()/getprevious()
-                        # (those are lxml-specific methods), so we just clear the element itself
-                        elem.clear()
-
-                # Process remaining batch
-                if batch:
-                    count = self._store_article_batch(batch)
-                    stats['articles_imported'] += count
-
-            logger.info(f"{filepath.name}: Import complete - {stats['articles_parsed']} parsed, {stats['articles_imported']} imported")
+            for article in self._iter_parsed_articles(filepath):
+                if article:
+                    batch.append(article)
+                    stats['articles_parsed'] += 1
+
+                    if len(batch) >= batch_size:
+                        count = self._store_article_batch(batch)
+                        stats['articles_imported'] += count
+                        batch = []
+
+                        if stats['articles_parsed'] % 1000 == 0:
+                            msg = f"{filepath.name}: Processed {stats['articles_parsed']:,} articles"
+                            logger.info(msg)
+                            if progress_callback:
+                                progress_callback(f"[IMPORT] {msg}")
+                else:
+                    stats['errors'] += 1
+
+            # Process remaining batch
+            if batch:
+                count = self._store_article_batch(batch)
+                stats['articles_imported'] += count
+
+            elapsed = time.perf_counter() - start_time
+            stats['elapsed_seconds'] = elapsed
+            if elapsed > 0:
+                stats['rows_per_second'] = stats['articles_imported'] / elapsed
+
+            logger.info(
+                f"{filepath.name}: Import complete - {stats['articles_parsed']} parsed, "
+                f"{stats['articles_imported']} imported ({stats['rows_per_second']:,.0f} rows/sec)"
+            )
 
             # Mark as processed in tracker
             if self.tracker:
@@ -1352,11 +1615,33 @@ class PubMedBulkImporter:
 
         return stats
 
+    def _collect_import_files(self, file_type: Optional[str] = None) -> List[Path]:
+        """
+        List downloaded files in import order: baseline, then updates, each by name.
+
+        Args:
+            file_type: 'baseline', 'update', or None for both
+
+        Returns:
+            Files in the order they must be imported
+        """
+        dirs_to_process = []
+        if file_type in (None, 'baseline'):
+            dirs_to_process.append(self.baseline_dir)
+        if file_type in (None, 'update'):
+            dirs_to_process.append(self.update_dir)
+
+        all_files = []
+        for directory in dirs_to_process:
+            all_files.extend(sorted(directory.glob('*.xml.gz')))
+        return all_files
+
     def import_all_files(
         self,
         file_type: Optional[str] = None,
         progress_callback: Optional[ProgressCallback] = None,
-        cancel_check: Optional[CancelCheck] = None
+        cancel_check: Optional[CancelCheck] = None,
+        batch_size: int = 100
     ) -> Dict:
         """
         Import all downloaded files.
@@ -1365,27 +1650,21 @@ class PubMedBulkImporter:
             file_type: 'baseline', 'update', or None for both
             progress_callback: Optional callback for progress messages
             cancel_check: Optional callback to check if operation should be cancelled
+            batch_size: Number of articles per database batch
 
         Returns:
-            Dict with overall statistics
+            Dict with overall statistics, including elapsed_seconds and
+            rows_per_second across all imported files
         """
         overall_stats = {
             'files_processed': 0,
             'total_articles': 0,
-            'total_errors': 0
+            'total_errors': 0,
+            'elapsed_seconds': 0.0,
+            'rows_per_second': 0.0
         }
 
-        # Determine which directories to process
-        dirs_to_process = []
-        if file_type in (None, 'baseline'):
-            dirs_to_process.append(self.baseline_dir)
-        if file_type in (None, 'update'):
-            dirs_to_process.append(self.update_dir)
-
-        # Collect all files to process
-        all_files = []
-        for directory in dirs_to_process:
-            all_files.extend(sorted(directory.glob('*.xml.gz')))
+        all_files = self._collect_import_files(file_type)
         total_files = len(all_files)
 
         for idx, filepath in enumerate(all_files, 1):
@@ -1403,18 +1682,80 @@ class PubMedBulkImporter:
             if progress_callback:
                 progress_callback(f"[IMPORT] {idx}/{total_files}: {filepath.name}")
 
-            stats = self.import_file(filepath, progress_callback=progress_callback)
+            stats = self.import_file(
+                filepath, batch_size=batch_size, progress_callback=progress_callback
+            )
             overall_stats['files_processed'] += 1
             overall_stats['total_articles'] += stats['articles_imported']
             overall_stats['total_errors'] += stats['errors']
+            overall_stats['elapsed_seconds'] += stats['elapsed_seconds']
 
             if progress_callback:
                 progress_callback(
-                    f"[IMPORT] {filepath.name}: {stats['articles_imported']} articles imported"
+                    f"[IMPORT] {filepath.name}: {stats['articles_imported']} articles imported "
+                    f"({stats['rows_per_second']:,.0f} rows/sec)"
                 )
 
+        if overall_stats['elapsed_seconds'] > 0:
+            overall_stats['rows_per_second'] = (
+                overall_stats['total_articles'] / overall_stats['elapsed_seconds']
+            )
+
         return overall_stats
 
+    def import_all_files_parallel(
+        self,
+        file_type: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_check: Optional[CancelCheck] = None,
+        batch_size: int = 100,
+        parser_processes: Optional[int] = None,
+        writer_threads: Optional[int] = None
+    ) -> Dict:
+        """
+        Import all downloaded files with parallel parser processes.
+
+        Same file selection and ordering as import_all_files(), but files are
+        parsed concurrently and stored by one or more writer threads through
+        ParallelImportPipeline. A later file never overwrites a newer record
+        from an earlier one (see pubmed_bulk_pipeline for how this is kept).
+
+        Args:
+            file_type: 'baseline', 'update', or None for both
+            progress_callback: Optional callback for progress messages
+            cancel_check: Optional callback to check if operation should be cancelled
+            batch_size: Number of articles per database batch
+            parser_processes: Number of parser processes (default: CPU count - 1)
+            writer_threads: Number of DB writer threads (default: 1)
+
+        Returns:
+            Dict with overall statistics (as import_all_files) plus
+            per-stage throughput counters under 'pipeline'
+        """
+        from .pubmed_bulk_pipeline import (
+            DEFAULT_PARSER_PROCESSES,
+            DEFAULT_WRITER_THREADS,
+            ParallelImportPipeline,
+        )
+
+        files = []
+        for filepath in self._collect_import_files(file_type):
+            if self.tracker and self.tracker.is_file_processed(filepath.name):
+                logger.info(f"{filepath.name}: Already processed, skipping")
+                continue
+            files.append(filepath)
+
+        if progress_callback:
+            progress_callback(f"[IMPORT] {len(files)} files to import in parallel")
+
+        pipeline = ParallelImportPipeline(
+            self,
+            parser_processes=parser_processes or DEFAULT_PARSER_PROCESSES,
+            writer_threads=writer_threads or DEFAULT_WRITER_THREADS,
+            batch_size=batch_size
+        )
+        return pipeline.run(files, progress_callback=progress_callback, cancel_check=cancel_check)
+
     def _import_worker(
         self,
         import_queue: ImportQueue,
@@ -0,0 +1,618 @@
+"""
+Parallel parse/write pipeline for PubMed bulk imports.
+
+PubMedBulkImporter.import_file() parses and stores one file at a time on a
+single thread, so the CPU-bound iterparse/_parse_article work keeps one core
+busy while the database waits, and vice versa. This module splits the work
+into stages:
+
+    parser processes  ->  bounded queue  ->  sequencer  ->  DB writer threads
+
+- Parser processes (ProcessPoolExecutor) each take a whole .xml.gz file and
+  emit article batches onto a bounded multiprocessing queue.
+- The sequencer (the calling thread) reorders batches and releases them in
+  strict (file order, batch order). Later files may finish parsing first,
+  but they are never written before the files preceding them.
+- Writer threads store batches through PubMedBulkImporter._store_article_batch
+  (so both the 'row' and 'copy' ingest modes work). With several writers,
+  articles are sharded by PMID: every PMID always goes to the same writer,
+  and each writer consumes its queue in release order. A later update file
+  can therefore never be overwritten by an earlier one, which is the
+  guarantee ImportQueue provides for the sequential importer.
+
+A file is marked processed in the download tracker only after every writer
+has stored all of its batches. Per-stage throughput counters are exposed via
+PipelineStats.snapshot().
+
+Usage:
+    from bmlibrarian.importers import PubMedBulkImporter
+
+    importer = PubMedBulkImporter(ingest_mode='copy')
+    stats = importer.import_all_files_parallel(parser_processes=6, writer_threads=2)
+    print(stats['pipeline']['write_rows_per_second'])
+"""
+
+import gzip
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .pubmed_bulk_importer import CancelCheck, ProgressCallback, PubMedBulkImporter
+
+logger = logging.getLogger(__name__)
+
+# Default number of parser processes: leave one core for the sequencer,
+# writer threads and the database client
+DEFAULT_PARSER_PROCESSES = max(1, (os.cpu_count() or 2) - 1)
+
+# Default number of DB writer threads (each holds one pooled connection
+# while storing a batch, so keep this below the pool's max_size)
+DEFAULT_WRITER_THREADS = 1
+
+# Batches buffered between stages before producers block (backpressure)
+DEFAULT_QUEUE_DEPTH = 32
+
+# Seconds between [PIPELINE] progress reports
+PROGRESS_INTERVAL_SECONDS = 10.0
+
+# Seconds the sequencer waits on the parser queue before re-checking
+# cancellation and parser health
+_POLL_INTERVAL_SECONDS = 0.5
+
+# Message kinds on the parser -> sequencer queue
+_MSG_BATCH = 'batch'
+_MSG_DONE = 'done'
+
+# Message kinds on the sequencer -> writer queues
+_WRITE_BATCH = 'batch'
+_WRITE_END_OF_FILE = 'end'
+
+# Queue onto which parser processes put their messages; set once per
+# parser process by _init_parser_process()
+_parser_out_queue: Optional[Any] = None
+
+
+def _init_parser_process(out_queue: Any) -> None:
+    """ProcessPoolExecutor initializer: remember the shared output queue."""
+    global _parser_out_queue
+    _parser_out_queue = out_queue
+
+
+def _describe_parse_error(error: Exception) -> str:
+    """Describe a file-level parse failure like PubMedBulkImporter.import_file()."""
+    # BadGzipFile must be checked before OSError (it's a subclass)
+    if isinstance(error, gzip.BadGzipFile):
+        return f"Invalid gzip file: {error}"
+    if isinstance(error, ET.ParseError):
+        return f"Invalid XML format: {error}"
+    if isinstance(error, OSError):
+        return f"File system error: {error}"
+    return str(error)
+
+
+def _parse_file_in_process(file_seq: int, filepath: str, batch_size: int) -> None:
+    """
+    Parse one PubMed file inside a parser process.
+
+    Sends (_MSG_BATCH, file_seq, batch_index, articles) for every batch and
+    finishes with (_MSG_DONE, file_seq, batch_count, result) where result
+    holds the parse counters and an error description (or None).
+
+    Args:
+        file_seq: Position of the file in the pipeline's import order
+        filepath: Path to the .xml.gz file
+        batch_size: Number of articles per emitted batch
+    """
+    # Parsing needs no database access, so skip __init__'s DB lookups
+    parser = PubMedBulkImporter.__new__(PubMedBulkImporter)
+    start_time = time.perf_counter()
+
+    batch: List[Dict] = []
+    batch_index = 0
+    parsed = 0
+    errors = 0
+    error: Optional[str] = None
+
+    try:
+        for article in parser._iter_parsed_articles(Path(filepath)):
+            if not article:
+                errors += 1
+                continue
+
+            batch.append(article)
+            parsed += 1
+            if len(batch) >= batch_size:
+                _parser_out_queue.put((_MSG_BATCH, file_seq, batch_index, batch))
+                batch_index += 1
+                batch = []
+
+        if batch:
+            _parser_out_queue.put((_MSG_BATCH, file_seq, batch_index, batch))
+            batch_index += 1
+
+    except Exception as e:
+        error = _describe_parse_error(e)
+
+    result = {
+        'articles_parsed': parsed,
+        'errors': errors,
+        'error': error,
+        'parse_seconds': time.perf_counter() - start_time,
+    }
+    _parser_out_queue.put((_MSG_DONE, file_seq, batch_index, result))
+
+
+@dataclass
+class StageCounters:
+    """Throughput counters for one pipeline stage."""
+
+    batches: int = 0
+    articles: int = 0
+    busy_seconds: float = 0.0
+
+    def per_worker_rate(self) -> float:
+        """Articles per second of busy time, i.e. per worker of the stage."""
+        return self.articles / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+
+@dataclass
+class PipelineStats:
+    """Thread-safe per-stage counters for a ParallelImportPipeline run."""
+
+    files_total: int = 0
+    files_parsed: int = 0
+    files_written: int = 0
+    files_failed: int = 0
+    parse: StageCounters = field(default_factory=StageCounters)
+    write: StageCounters = field(default_factory=StageCounters)
+    write_errors: int = 0
+    max_queue_depth: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_parsed_batch(self, article_count: int) -> None:
+        """Count a batch received from a parser process."""
+        with self._lock:
+            self.parse.batches += 1
+            self.parse.articles += article_count
+
+    def record_parsed_file(self, parse_seconds: float) -> None:
+        """Count a file a parser process finished (successfully or not)."""
+        with self._lock:
+            self.files_parsed += 1
+            self.parse.busy_seconds += parse_seconds
+
+    def record_written_batch(self, article_count: int, seconds: float) -> None:
+        """Count a batch stored by a writer thread."""
+        with self._lock:
+            self.write.batches += 1
+            self.write.articles += article_count
+            self.write.busy_seconds += seconds
+
+    def record_write_error(self) -> None:
+        """Count a batch a writer thread failed to store."""
+        with self._lock:
+            self.write_errors += 1
+
+    def record_written_file(self, failed: bool) -> None:
+        """Count a file whose batches have all been handled by the writers."""
+        with self._lock:
+            self.files_written += 1
+            if failed:
+                self.files_failed += 1
+
+    def record_queue_depth(self, depth: int) -> None:
+        """Track the high-water mark of batches waiting for a writer."""
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a consistent copy of all counters.
+
+        Wall-clock rates (*_rows_per_second) measure pipeline throughput;
+        per-worker rates divide by the time a stage's workers were busy.
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self.started_at
+            return {
+                'elapsed_seconds': elapsed,
+                'files_total': self.files_total,
+                'files_parsed': self.files_parsed,
+                'files_written': self.files_written,
+                'files_failed': self.files_failed,
+                'parse_batches': self.parse.batches,
+                'parse_articles': self.parse.articles,
+                'parse_rows_per_second': self.parse.articles / elapsed if elapsed > 0 else 0.0,
+                'parse_rows_per_second_per_worker': self.parse.per_worker_rate(),
+                'write_batches': self.write.batches,
+                'write_articles': self.write.articles,
+                'write_errors': self.write_errors,
+                'write_rows_per_second': self.write.articles / elapsed if elapsed > 0 else 0.0,
+                'write_rows_per_second_per_worker': self.write.per_worker_rate(),
+                'max_queue_depth': self.max_queue_depth,
+            }
+
+
+@dataclass
+class _FileState:
+    """Sequencer bookkeeping for one file that has been submitted for parsing."""
+
+    filepath: Path
+    buffered: Dict[int, List[Dict]] = field(default_factory=dict)
+    next_batch: int = 0
+    expected_batches: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None
+
+
+class ParallelImportPipeline:
+    """Multi-process parse / multi-threaded write pipeline for PubMed files.
+
+    Files are imported in the order given; see the module docstring for how
+    that order is preserved across parallel parsers and writers.
+    """
+
+    def __init__(
+        self,
+        importer: PubMedBulkImporter,
+        parser_processes: int = DEFAULT_PARSER_PROCESSES,
+        writer_threads: int = DEFAULT_WRITER_THREADS,
+        batch_size: int = 100,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            importer: Importer whose _store_article_batch and tracker are used
+            parser_processes: Number of parser processes
+            writer_threads: Number of DB writer threads
+            batch_size: Number of articles per batch
+            queue_depth: Batches buffered between stages before producers block
+
+        Raises:
+            ValueError: If any size argument is less than 1
+        """
+        for name, value in (
+            ('parser_processes', parser_processes),
+            ('writer_threads', writer_threads),
+            ('batch_size', batch_size),
+            ('queue_depth', queue_depth),
+        ):
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value}")
+
+        self.importer = importer
+        self.parser_processes = parser_processes
+        self.writer_threads = writer_threads
+        self.batch_size = batch_size
+        self.queue_depth = queue_depth
+
+        # Files handed to parsers but not yet fully released to writers.
+        # Bounds how many parsed-ahead files the sequencer may buffer.
+        self.max_files_in_flight = parser_processes * 2
+
+        self.stats = PipelineStats()
+        self._writer_queues: List[queue.Queue] = []
+        self._file_lock = threading.Lock()
+        self._pending_writers: Dict[int, int] = {}
+        self._file_results: Dict[int, Dict[str, Any]] = {}
+
+    def _writer_for(self, pmid: str) -> int:
+        """Return the writer shard that owns a PMID."""
+        if self.writer_threads == 1:
+            return 0
+        if pmid.isdigit():
+            return int(pmid) % self.writer_threads
+        return zlib.crc32(pmid.encode('utf-8')) % self.writer_threads
+
+    def _dispatch_batch(self, file_seq: int, articles: List[Dict]) -> None:
+        """Release one batch to the writers, sharded by PMID."""
+        if self.writer_threads == 1:
+            shards = [articles]
+        else:
+            shards = [[] for _ in range(self.writer_threads)]
+            for article in articles:
+                shards[self._writer_for(article['pmid'])].append(article)
+
+        for writer_index, shard in enumerate(shards):
+            if shard:
+                writer_queue = self._writer_queues[writer_index]
+                writer_queue.put((_WRITE_BATCH, file_seq, shard))
+                self.stats.record_queue_depth(writer_queue.qsize())
+
+    def _dispatch_end_of_file(self, file_seq: int, state: _FileState) -> None:
+        """Tell every writer that all batches of a file have been released."""
+        with self._file_lock:
+            self._pending_writers[file_seq] = self.writer_threads
+            self._file_results[file_seq].update(
+                articles_parsed=state.result['articles_parsed'],
+                errors=state.result['errors'],
+                error=state.result['error'],
+            )
+        for writer_queue in self._writer_queues:
+            writer_queue.put((_WRITE_END_OF_FILE, file_seq, None))
+
+    def _finish_file(self, file_seq: int) -> None:
+        """Record a file once every writer has stored its share of it."""
+        with self._file_lock:
+            self._pending_writers[file_seq] -= 1
+            if self._pending_writers[file_seq] > 0:
+                return
+            del self._pending_writers[file_seq]
+            result = self._file_results[file_seq]
+
+        filepath = result['filepath']
+        error = result['error'] or result['write_error']
+        failed = error is not None
+        self.stats.record_written_file(failed)
+
+        if failed:
+            logger.error(f"{filepath.name}: Import error: {error}")
+        else:
+            logger.info(
+                f"{filepath.name}: Import complete - {result['articles_parsed']} parsed, "
+                f"{result['articles_imported']} imported"
+            )
+
+        if self.importer.tracker:
+            if failed:
+                self.importer.tracker.mark_processed(filepath.name, 0, error)
+            else:
+                self.importer.tracker.mark_processed(filepath.name, result['articles_parsed'])
+
+    def _writer_loop(self, writer_queue: queue.Queue) -> None:
+        """Writer thread: store batches in the order they were released."""
+        while True:
+            item = writer_queue.get()
+            if item is None:
+                return
+
+            kind, file_seq, articles = item
+            if kind == _WRITE_END_OF_FILE:
+                self._finish_file(file_seq)
+                continue
+
+            start_time = time.perf_counter()
+            try:
+                count = self.importer._store_article_batch(articles)
+            except Exception as e:
+                logger.error(f"Pipeline writer failed to store batch: {e}", exc_info=True)
+                self.stats.record_write_error()
+                with self._file_lock:
+                    result = self._file_results[file_seq]
+                    result['write_error'] = result['write_error'] or str(e)
+                continue
+
+            self.stats.record_written_batch(count, time.perf_counter() - start_time)
+            with self._file_lock:
+                self._file_results[file_seq]['articles_imported'] += count
+
+    def run(
+        self,
+        files: Sequence[Path],
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_check: Optional[CancelCheck] = None,
+    ) -> Dict[str, Any]:
+        """
+        Import files through the pipeline, in the given order.
+
+        Args:
+            files: Files to import; later files never overwrite earlier ones
+            progress_callback: Optional callback for progress messages
+            cancel_check: Optional callback to check if operation should be cancelled
+
+        Returns:
+            Dict with files_processed, total_articles, total_errors,
+            elapsed_seconds, rows_per_second and the per-stage counters
+            under 'pipeline'
+        """
+        files = list(files)
+        self.stats = PipelineStats(files_total=len(files))
+        self._pending_writers = {}
+        self._file_results = {}
+        self._writer_queues = [queue.Queue(maxsize=self.queue_depth) for _ in range(self.writer_threads)]
+
+        writers = [
+            threading.Thread(
+                target=self._writer_loop,
+                args=(writer_queue,),
+                name=f"PubMed-PipelineWriter-{index}",
+                daemon=True,
+            )
+            for index, writer_queue in enumerate(self._writer_queues)
+        ]
+        for writer in writers:
+            writer.start()
+
+        # Spawn rather than fork: the parent already runs writer threads and
+        # holds pooled database connections
+        mp_context = multiprocessing.get_context('spawn')
+        out_queue = mp_context.Queue(maxsize=self.queue_depth)
+
+        logger.info(
+            f"Starting parallel import of {len(files)} files: "
+            f"{self.parser_processes} parser processes, {self.writer_threads} writers"
+        )
+
+        cancelled = False
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers=self.parser_processes,
+                mp_context=mp_context,
+                initializer=_init_parser_process,
+                initargs=(out_queue,),
+            )
+            try:
+                cancelled = self._sequence(executor, out_queue, files, progress_callback, cancel_check)
+            finally:
+                self._shutdown_parsers(executor, out_queue)
+        finally:
+            for writer_queue in self._writer_queues:
+                writer_queue.put(None)
+            for writer in writers:
+                writer.join()
+
+        return self._summarize(cancelled, progress_callback)
+
+    def _sequence(
+        self,
+        executor: ProcessPoolExecutor,
+        out_queue: Any,
+        files: List[Path],
+        progress_callback: Optional[ProgressCallback],
+        cancel_check: Optional[CancelCheck],
+    ) -> bool:
+        """
+        Submit files to parsers and release their batches in order.
+
+        Returns:
+            True if cancelled, False once every file has been released
+        """
+        states: Dict[int, _FileState] = {}
+        futures: Dict[int, Future] = {}
+        next_submit = 0
+        next_release = 0
+        last_report = time.perf_counter()
+
+        while next_release < len(files):
+            if cancel_check and cancel_check():
+                if progress_callback:
+                    progress_callback("[IMPORT] Cancelled by user")
+                return True
+
+            # Keep the parsers busy without buffering unbounded parsed-ahead files
+            while next_submit < len(files) and next_submit - next_release < self.max_files_in_flight:
+                states[next_submit] = _FileState(filepath=files[next_submit])
+                with self._file_lock:
+                    self._file_results[next_submit] = {
+                        'filepath': files[next_submit],
+                        'articles_parsed': 0,
+                        'articles_imported': 0,
+                        'errors': 0,
+                        'error': None,
+                        'write_error': None,
+                    }
+                futures[next_submit] = executor.submit(
+                    _parse_file_in_process, next_submit, str(files[next_submit]), self.batch_size
+                )
+                next_submit += 1
+
+            try:
+                kind, file_seq, index, payload = out_queue.get(timeout=_POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                self._check_parsers(futures)
+                continue
+
+            state = states[file_seq]
+            if kind == _MSG_BATCH:
+                state.buffered[index] = payload
+                self.stats.record_parsed_batch(len(payload))
+            else:
+                state.expected_batches = index
+                state.result = payload
+                futures.pop(file_seq, None)
+                self.stats.record_parsed_file(payload['parse_seconds'])
+
+            # Release everything that is next in (file, batch) order
+            while next_release in states:
+                current = states[next_release]
+                while current.next_batch in current.buffered:
+                    self._dispatch_batch(next_release, current.buffered.pop(current.next_batch))
+                    current.next_batch += 1
+                if current.expected_batches is None or current.next_batch < current.expected_batches:
+                    break
+                self._dispatch_end_of_file(next_release, current)
+                del states[next_release]
+                next_release += 1
+
+            if progress_callback and time.perf_counter() - last_report >= PROGRESS_INTERVAL_SECONDS:
+                progress_callback(self._format_progress())
+                last_report = time.perf_counter()
+
+        return False
+
+    @staticmethod
+    def _shutdown_parsers(executor: ProcessPoolExecutor, out_queue: Any) -> None:
+        """
+        Shut down the parser pool without deadlocking.
+
+        After a cancel or error, running parsers may be blocked putting onto
+        the full output queue, so the queue is drained (and discarded) until
+        the pool has exited.
+        """
+        stop = threading.Event()
+
+        def drain() -> None:
+            while not stop.is_set():
+                try:
+                    out_queue.get(timeout=_POLL_INTERVAL_SECONDS)
+                except queue.Empty:
+                    pass
+
+        drainer = threading.Thread(target=drain, name="PubMed-PipelineDrain", daemon=True)
+        drainer.start()
+        try:
+            executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            stop.set()
+            drainer.join()
+
+    @staticmethod
+    def _check_parsers(futures: Dict[int, Future]) -> None:
+        """Raise if a parser process died without reporting its file."""
+        for future in list(futures.values()):
+            if future.done() and future.exception() is not None:
+                error = future.exception()
+                if isinstance(error, BrokenProcessPool):
+                    raise RuntimeError(f"Parser process pool broke: {error}") from error
+                raise error
+
+    def _format_progress(self) -> str:
+        """Format a one-line progress report from the current counters."""
+        snap = self.stats.snapshot()
+        return (
+            f"[PIPELINE] files {snap['files_written']}/{snap['files_total']} | "
+            f"parse {snap['parse_rows_per_second']:,.0f} rows/sec | "
+            f"write {snap['write_rows_per_second']:,.0f} rows/sec | "
+            f"max queue {snap['max_queue_depth']}"
+        )
+
+    def _summarize(self, cancelled: bool, progress_callback: Optional[ProgressCallback]) -> Dict[str, Any]:
+        """Build the import_all_files-compatible summary for a finished run."""
+        snap = self.stats.snapshot()
+        with self._file_lock:
+            total_errors = sum(
+                result['errors'] + (1 if result['error'] or result['write_error'] else 0)
+                for result in self._file_results.values()
+            )
+
+        summary = {
+            'files_processed': snap['files_written'],
+            'total_articles': snap['write_articles'],
+            'total_errors': total_errors,
+            'elapsed_seconds': snap['elapsed_seconds'],
+            'rows_per_second': snap['write_rows_per_second'],
+            'cancelled': cancelled,
+            'pipeline': snap,
+        }
+
+        if progress_callback:
+            progress_callback(self._format_progress())
+
+        logger.info(
+            f"Parallel import finished: {summary['files_processed']} files, "
+            f"{summary['total_articles']:,} articles, "
+            f"{summary['rows_per_second']:,.0f} rows/sec"
+        )
+        return summary
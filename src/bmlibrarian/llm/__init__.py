@@ -76,6 +76,26 @@ from .token_tracker import (
     reset_global_tracker,
 )
 
+# Persistent embedding cache
+from .embedding_cache import (
+    EmbeddingCache,
+    EmbeddingCacheStats,
+    get_embedding_cache,
+    reset_embedding_cache,
+)
+
+# Deterministic LLM response cache
+from .response_cache import (
+    ResponseCache,
+    ResponseCacheBackend,
+    ResponseCacheStats,
+    MemoryResponseCacheBackend,
+    SQLiteResponseCacheBackend,
+    PostgresResponseCacheBackend,
+    get_response_cache,
+    reset_response_cache,
+)
+
 # Constants
 from .constants import (
     DEFAULT_EMBEDDING_MODEL,
@@ -125,6 +145,20 @@ __all__ = [
     "UsageSummary",
     "get_token_tracker",
     "reset_global_tracker",
+    # Embedding cache
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "get_embedding_cache",
+    "reset_embedding_cache",
+    # Response cache
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "ResponseCacheStats",
+    "MemoryResponseCacheBackend",
+    "SQLiteResponseCacheBackend",
+    "PostgresResponseCacheBackend",
+    "get_response_cache",
+    "reset_response_cache",
     # Constants
     "DEFAULT_EMBEDDING_MODEL",
     "DEFAULT_OLLAMA_HOST",
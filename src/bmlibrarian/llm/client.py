@@ -41,6 +41,8 @@ from .data_types import (
 )
 from .model_resolver import parse_model_string, qualify_model_string
 from .token_tracker import get_token_tracker, TokenTracker
+from .embedding_cache import EmbeddingCache, get_embedding_cache
+from .response_cache import ResponseCache, get_response_cache, make_cache_key
 from .constants import (
     DEFAULT_ANTHROPIC_MAX_TOKENS,
     DEFAULT_EMBEDDING_MODEL,
@@ -72,6 +74,10 @@ class LLMClient:
         fallback_model: Model to use on fallback
         track_usage: Whether to track token usage
         ollama_host: Ollama server URL
+        use_embedding_cache: Whether embed()/embed_batch() consult the
+            persistent embedding cache
+        response_cache: Cache for chat()/generate() calls made with
+            use_cache=True (None uses the configured global cache)
     """
 
     def __init__(
@@ -81,6 +87,9 @@ class LLMClient:
         fallback_model: Optional[str] = None,
         track_usage: bool = True,
         ollama_host: Optional[str] = None,
+        use_embedding_cache: bool = True,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """
         Initialize LLM client.
@@ -91,12 +100,22 @@ class LLMClient:
             fallback_model: Model to use on fallback
             track_usage: Whether to track token usage
             ollama_host: Ollama server URL
+            use_embedding_cache: Whether embeddings consult the persistent
+                embedding cache
+            embedding_cache: Cache to use; None uses the global cache,
+                which exists only when enabled in the "embeddings" config
+            response_cache: Response cache for use_cache=True calls; None
+                uses the global cache, which exists only when enabled in
+                the "llm_cache" config
         """
         self.default_provider = default_provider
         self.fallback_provider = fallback_provider
         self.fallback_model = fallback_model
         self.track_usage = track_usage
         self.ollama_host = ollama_host
+        self.use_embedding_cache = use_embedding_cache
+        self._embedding_cache = embedding_cache
+        self.response_cache = response_cache
 
         # Create the underlying bmlib client
         self._bmlib = BmlibLLMClient(
@@ -186,6 +205,7 @@ class LLMClient:
                 prompt_tokens=response.prompt_tokens,
                 completion_tokens=response.completion_tokens,
                 operation=operation,
+                cached=response.cached,
             )
 
     def chat(
@@ -201,6 +221,8 @@ class LLMClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
         think: Optional[bool | str | int] = None,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
     ) -> LLMResponse:
         """
         Send a chat completion request.
@@ -222,11 +244,16 @@ class LLMClient:
                 whether a model accepts it is the provider's business,
                 and Ollama rejects it outright for models without
                 thinking support.
+            use_cache: Answer identical earlier requests from the response
+                cache (opt-in; only sensible when a replayed answer is
+                acceptable, typically at low temperature)
+            refresh_cache: With use_cache, bypass the lookup but store the
+                new response (replaces a stale or unusable cached answer)
 
         Returns:
             LLMResponse with generated content, and thinking set when the
             model returned a trace. A thinking-enabled request is not
-            guaranteed to return one.
+            guaranteed to return one. ``cached`` is True for cache hits.
 
         Raises:
             ConnectionError: If all providers fail
@@ -240,6 +267,7 @@ class LLMClient:
             effective_messages, model, temperature, top_p, max_tokens,
             json_mode, fallback_model, max_retries, retry_delay,
             operation="chat", think=think,
+            use_cache=use_cache, refresh_cache=refresh_cache,
         )
 
     def _chat_with_fallback(
@@ -255,6 +283,8 @@ class LLMClient:
         retry_delay: float,
         operation: str,
         think: Optional[bool | str | int] = None,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
     ) -> LLMResponse:
         """
         Execute a chat request with retries, then Ollama fallback.
@@ -271,13 +301,30 @@ class LLMClient:
             retry_delay: Initial delay between retries
             operation: Label recorded against token usage ("chat"/"generate")
             think: Reasoning-trace option, omitted when None
+            use_cache: Consult and fill the response cache
+            refresh_cache: Skip the cache lookup but still store the response
 
         Returns:
-            LLMResponse from the primary provider or the fallback
+            LLMResponse from the cache, the primary provider or the fallback
 
         Raises:
             ConnectionError: If both primary and fallback fail
         """
+        cache = self._get_response_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = make_cache_key(model, messages, {
+                "temperature": temperature,
+                "top_p": top_p,
+                "max_tokens": max_tokens,
+                "json_mode": json_mode,
+                "think": think,
+            })
+            cached = None if refresh_cache else cache.get(cache_key)
+            if cached is not None:
+                self._record_usage(cached, operation)
+                return cached
+
         # Try primary provider with retries
         try:
             response = self._chat_with_retry(
@@ -285,6 +332,8 @@ class LLMClient:
                 max_tokens, json_mode, max_retries, retry_delay, think,
             )
             self._record_usage(response, operation)
+            if cache is not None:
+                cache.put(cache_key, response)
             return response
 
         except Exception as e:
@@ -400,6 +449,8 @@ class LLMClient:
         fallback_model: Optional[str] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
         retry_delay: float = DEFAULT_RETRY_DELAY,
+        use_cache: bool = False,
+        refresh_cache: bool = False,
     ) -> LLMResponse:
         """
         Send a text generation request.
@@ -418,6 +469,10 @@ class LLMClient:
             fallback_model: Model to use on failure (Ollama)
             max_retries: Number of retry attempts
             retry_delay: Initial retry delay
+            use_cache: Answer identical earlier requests from the response
+                cache (see chat())
+            refresh_cache: With use_cache, bypass the lookup but store the
+                new response
 
         Returns:
             LLMResponse with generated content
@@ -430,8 +485,30 @@ class LLMClient:
             messages, model, temperature, top_p, max_tokens,
             json_mode, fallback_model, max_retries, retry_delay,
             operation="generate",
+            use_cache=use_cache, refresh_cache=refresh_cache,
         )
 
+    def _get_response_cache(self) -> Optional[ResponseCache]:
+        """Resolve the response cache: the client's own, else the global one."""
+        if self.response_cache is not None:
+            return self.response_cache
+        return get_response_cache()
+
+    def _get_embedding_cache(self) -> Optional[EmbeddingCache]:
+        """
+        Resolve the embedding cache on first use.
+
+        Deferred so that clients that never embed do not open the cache.
+
+        Returns:
+            The cache to consult, or None when caching is off
+        """
+        if not self.use_embedding_cache:
+            return None
+        if self._embedding_cache is None:
+            self._embedding_cache = get_embedding_cache()
+        return self._embedding_cache
+
     def embed(
         self,
         text: str,
@@ -443,6 +520,10 @@ class LLMClient:
         Note: Embeddings always use Ollama (local) for consistency
         with pgvector dimensions and to avoid costs.
 
+        Texts embedded before with the same model are served from the
+        embedding cache when one is configured; cache hits record no
+        token usage.
+
         Args:
             text: Text to embed
             model: Embedding model (Ollama only)
@@ -450,11 +531,24 @@ class LLMClient:
         Returns:
             EmbeddingResponse with embedding vector
         """
+        model_name = parse_model_string(model).model_name
+        cache = self._get_embedding_cache()
+        if cache is not None:
+            cached = cache.get(model_name, text)
+            if cached is not None:
+                return EmbeddingResponse(
+                    embedding=cached,
+                    model=model,
+                    provider=Provider.OLLAMA,
+                    dimensions=len(cached),
+                    cached=True,
+                )
+
         # Always use Ollama for embeddings (consistency + free). The prefix is
         # forced rather than merely added: embedding model names carry tags
         # (e.g. "snowflake-arctic-embed2:latest") that bmlib would otherwise
         # read as a provider name.
-        embed_model = f"{Provider.OLLAMA.value}:{parse_model_string(model).model_name}"
+        embed_model = f"{Provider.OLLAMA.value}:{model_name}"
         bmlib_resp: BmlibEmbeddingResponse = self._bmlib.embed(text=text, model=embed_model)
 
         response = EmbeddingResponse(
@@ -474,6 +568,9 @@ class LLMClient:
                 operation="embed",
             )
 
+        if cache is not None:
+            cache.put(model_name, text, response.embedding)
+
         return response
 
     def embed_batch(
@@ -497,6 +594,9 @@ class LLMClient:
         Not atomic: if a later batch fails, vectors already computed for
         earlier batches are discarded with the exception.
 
+        When an embedding cache is configured only the texts missing from
+        it are sent to the provider, still as one batched request.
+
         Args:
             texts: Texts to embed. An empty list returns an empty response
                 without contacting the provider.
@@ -522,27 +622,45 @@ class LLMClient:
         # documented on embed(): embedding model names carry tags such as
         # "snowflake-arctic-embed2:latest" that bmlib would otherwise split
         # on and read as a provider name.
-        embed_model = f"{Provider.OLLAMA.value}:{parse_model_string(model).model_name}"
+        model_name = parse_model_string(model).model_name
+        embed_model = f"{Provider.OLLAMA.value}:{model_name}"
 
         kwargs: dict[str, Any] = {}
         if max_batch_size is not None:
             kwargs["max_batch_size"] = max_batch_size
 
-        bmlib_resp = self._bmlib.embed_batch(
-            texts=texts,
-            model=embed_model,
-            **kwargs,
+        cache = self._get_embedding_cache()
+        embeddings: list[Optional[list[float]]] = (
+            cache.get_many(model_name, texts) if cache is not None else [None] * len(texts)
         )
+        missing = [i for i, vector in enumerate(embeddings) if vector is None]
+        prompt_tokens = 0
+        dimensions = len(embeddings[0]) if not missing else 0
+
+        if missing:
+            miss_texts = [texts[i] for i in missing]
+            bmlib_resp = self._bmlib.embed_batch(
+                texts=miss_texts,
+                model=embed_model,
+                **kwargs,
+            )
+            for i, vector in zip(missing, bmlib_resp.embeddings):
+                embeddings[i] = vector
+            prompt_tokens = bmlib_resp.input_tokens
+            dimensions = bmlib_resp.dimensions
+            if cache is not None:
+                cache.put_many(model_name, miss_texts, bmlib_resp.embeddings)
 
         response = BatchEmbeddingResponse(
-            embeddings=bmlib_resp.embeddings,
+            embeddings=embeddings,
             model=model,
             provider=Provider.OLLAMA,
-            dimensions=bmlib_resp.dimensions,
-            prompt_tokens=bmlib_resp.input_tokens,
+            dimensions=dimensions,
+            prompt_tokens=prompt_tokens,
+            cache_hits=len(texts) - len(missing),
         )
 
-        if self._token_tracker:
+        if self._token_tracker and missing:
             self._token_tracker.record_usage(
                 provider=Provider.OLLAMA,
                 model=model,
@@ -579,11 +697,33 @@ class LLMClient:
                 "total_completion_tokens": summary.total_completion_tokens,
                 "total_cost_usd": summary.total_cost_usd,
                 "request_count": summary.request_count,
+                "cache_hits": summary.cache_hits,
+                "cached_tokens_saved": summary.cached_tokens_saved,
                 "by_provider": summary.by_provider,
                 "by_model": summary.by_model,
             }
         return None
 
+    def get_embedding_cache_stats(self) -> Optional[dict[str, Any]]:
+        """
+        Get embedding cache hit/miss statistics.
+
+        Returns:
+            Statistics dictionary, or None if no embedding cache is in use
+        """
+        cache = self._get_embedding_cache()
+        return cache.get_stats().to_dict() if cache is not None else None
+
+    def get_response_cache_stats(self) -> Optional[dict[str, Any]]:
+        """
+        Get LLM response cache hit/miss statistics.
+
+        Returns:
+            Statistics dictionary, or None if no response cache is in use
+        """
+        cache = self._get_response_cache()
+        return cache.get_stats().to_dict() if cache is not None else None
+
     def test_provider(self, provider_type: Provider) -> bool:
         """
         Test if a provider is available.
@@ -63,6 +63,7 @@ class LLMResponse:
         thinking: The model's reasoning trace, separated from content, or
             None when the model emitted none. A thinking-enabled request
             is not guaranteed to return one.
+        cached: Whether the response was served from the response cache
     """
 
     content: str
@@ -83,6 +84,9 @@ class LLMResponse:
     # Reasoning trace, when the model emitted one separately from content
     thinking: Optional[str] = None
 
+    # Served from the LLM response cache rather than the provider
+    cached: bool = False
+
 
 @dataclass
 class BatchEmbeddingResponse:
@@ -98,6 +102,8 @@ class BatchEmbeddingResponse:
         provider: Provider that handled the request
         dimensions: Number of dimensions per vector (0 for an empty batch)
         prompt_tokens: Total input tokens across the whole batch
+        cache_hits: Vectors served from the embedding cache rather than
+            the provider
     """
 
     embeddings: list[list[float]]
@@ -105,6 +111,7 @@ class BatchEmbeddingResponse:
     provider: Provider
     dimensions: int = 0
     prompt_tokens: int = 0
+    cache_hits: int = 0
 
 
 @dataclass
@@ -118,6 +125,7 @@ class EmbeddingResponse:
         provider: Provider that handled the request
         dimensions: Number of dimensions in the embedding
         prompt_tokens: Number of tokens in the input
+        cached: Whether the vector was served from the embedding cache
     """
 
     embedding: list[float]
@@ -125,6 +133,7 @@ class EmbeddingResponse:
     provider: Provider
     dimensions: int = 0
     prompt_tokens: int = 0
+    cached: bool = False
 
 
 @dataclass
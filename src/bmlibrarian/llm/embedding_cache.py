@@ -0,0 +1,530 @@
+"""
+Persistent content-addressed embedding cache.
+
+Embedding the same text twice with the same model yields the same vector,
+yet chunk re-embedding, agent query embeddings and repeated searches all
+recompute vectors for text they have seen before. This module stores
+vectors on disk in a SQLite table keyed by (model, SHA-256 of the
+normalized text) so every embedding backend can skip the model call on a
+repeat.
+
+Vectors are stored as float32 blobs. The table is bounded by entry count
+and total vector bytes; when either bound is exceeded the least recently
+used entries are evicted. The database runs in WAL mode so parallel
+embedding workers in separate processes can share one cache file.
+
+Usage:
+    from bmlibrarian.llm.embedding_cache import EmbeddingCache
+
+    cache = EmbeddingCache("/tmp/embeddings.sqlite")
+    vectors = cache.get_or_compute(
+        "snowflake-arctic-embed2:latest",
+        ["first text", "second text"],
+        compute=backend.embed_batch,
+    )
+    print(cache.get_stats().hit_rate)
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Default cache file name under the bmlibrarian config directory
+DEFAULT_CACHE_FILENAME = "embedding_cache.sqlite"
+
+# Default bounds: 250k entries is ~1 GB of 1024-dim float32 vectors
+DEFAULT_MAX_ENTRIES = 250_000
+DEFAULT_MAX_MB = 1024
+BYTES_PER_MB = 1024 * 1024
+
+# Eviction trims down to this fraction of the bound so that a full cache
+# does not run an eviction query on every insert
+EVICTION_LOW_WATER_FRACTION = 0.9
+
+# Keys per IN (...) clause, well under SQLite's bound-parameter limit
+SQLITE_LOOKUP_CHUNK_SIZE = 500
+
+# Milliseconds a writer waits on a lock held by another process
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# Vectors are stored as little-endian float32 regardless of input precision
+VECTOR_DTYPE = np.dtype("<f4")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+EmbedFunction = Callable[[list[str]], Sequence[Optional[Sequence[float]]]]
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text before hashing it into a cache key.
+
+    Applies Unicode NFC normalization, collapses whitespace runs to a
+    single space and strips leading/trailing whitespace. Case is kept:
+    embedding models are case-sensitive.
+
+    Args:
+        text: Raw text as passed to an embedding backend
+
+    Returns:
+        Normalized text
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def text_key(text: str) -> bytes:
+    """
+    Compute the content hash used as the cache key for a text.
+
+    Args:
+        text: Raw text as passed to an embedding backend
+
+    Returns:
+        32-byte SHA-256 digest of the normalized text
+    """
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).digest()
+
+
+def _is_cacheable(text: Optional[str]) -> bool:
+    """Empty texts never reach a model, so they are never cached."""
+    return bool(text and text.strip())
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """
+    Snapshot of embedding cache activity.
+
+    Attributes:
+        hits: Lookups answered from the cache
+        misses: Lookups that had to be computed
+        writes: Vectors stored
+        evictions: Entries removed to stay within bounds
+        entries: Entries currently stored
+        size_bytes: Total vector bytes currently stored
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary, including derived fields."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": self.entries,
+            "size_bytes": self.size_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class EmbeddingCache:
+    """
+    Thread-safe, size-bounded LRU cache of embedding vectors in SQLite.
+
+    Entries are keyed by model name plus the content hash of the
+    normalized text, so the same text embedded by two models is stored
+    twice and never confused.
+
+    Example:
+        cache = EmbeddingCache(path, max_entries=10_000)
+        cache.put("model", "text", [0.1, 0.2])
+        cache.get("model", "  text ")  # -> [0.1, 0.2] (whitespace-insensitive)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_MB * BYTES_PER_MB,
+    ) -> None:
+        """
+        Open (or create) a cache database.
+
+        Args:
+            path: SQLite database file; parent directories are created
+            max_entries: Maximum number of stored vectors
+            max_bytes: Maximum total size of stored vectors in bytes
+
+        Raises:
+            ValueError: If a bound is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                model TEXT NOT NULL,
+                text_hash BLOB NOT NULL,
+                dimensions INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embedding_cache_last_access "
+            "ON embedding_cache (last_access)"
+        )
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+        self._entries, self._size_bytes = self._count_stored()
+
+    def _count_stored(self) -> tuple[int, int]:
+        """Read the stored entry count and vector bytes from the database."""
+        entries, size_bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embedding_cache"
+        ).fetchone()
+        return int(entries), int(size_bytes)
+
+    def get(self, model: str, text: str) -> Optional[list[float]]:
+        """
+        Look up the cached vector for one text.
+
+        Args:
+            model: Embedding model identifier
+            text: Text that was embedded
+
+        Returns:
+            The cached vector, or None on a miss
+        """
+        return self.get_many(model, [text])[0]
+
+    def get_many(
+        self, model: str, texts: Sequence[str]
+    ) -> list[Optional[list[float]]]:
+        """
+        Look up cached vectors for several texts.
+
+        Empty texts are returned as None and are not counted as lookups.
+
+        Args:
+            model: Embedding model identifier
+            texts: Texts that were embedded
+
+        Returns:
+            One entry per input text: the cached vector, or None on a miss
+        """
+        results: list[Optional[list[float]]] = [None] * len(texts)
+        positions: dict[bytes, list[int]] = {}
+        for i, text in enumerate(texts):
+            if _is_cacheable(text):
+                positions.setdefault(text_key(text), []).append(i)
+        if not positions:
+            return results
+
+        keys = list(positions)
+        now = time.time()
+        found = 0
+        with self._lock:
+            for start in range(0, len(keys), SQLITE_LOOKUP_CHUNK_SIZE):
+                chunk = keys[start:start + SQLITE_LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embedding_cache "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *chunk),
+                ).fetchall()
+                if not rows:
+                    continue
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=VECTOR_DTYPE).tolist()
+                    for i in positions[key]:
+                        results[i] = vector
+                        found += 1
+                hit_keys = [key for key, _ in rows]
+                self._conn.execute(
+                    f"UPDATE embedding_cache SET last_access = ? "
+                    f"WHERE model = ? AND text_hash IN ({','.join('?' * len(hit_keys))})",
+                    (now, model, *hit_keys),
+                )
+            lookups = sum(len(idx) for idx in positions.values())
+            self._hits += found
+            self._misses += lookups - found
+
+        return results
+
+    def put(self, model: str, text: str, vector: Sequence[float]) -> None:
+        """
+        Store the vector for one text.
+
+        Args:
+            model: Embedding model identifier
+            text: Text that was embedded
+            vector: Embedding vector
+        """
+        self.put_many(model, [text], [vector])
+
+    def put_many(
+        self,
+        model: str,
+        texts: Sequence[str],
+        vectors: Sequence[Optional[Sequence[float]]],
+    ) -> None:
+        """
+        Store vectors for several texts.
+
+        Pairs with an empty text or a None/empty vector (a failed
+        embedding) are skipped. Existing entries are left as they are.
+
+        Args:
+            model: Embedding model identifier
+            texts: Texts that were embedded
+            vectors: One vector (or None) per text
+
+        Raises:
+            ValueError: If texts and vectors differ in length
+        """
+        if len(texts) != len(vectors):
+            raise ValueError(
+                f"Got {len(texts)} texts but {len(vectors)} vectors"
+            )
+
+        now = time.time()
+        rows: dict[bytes, tuple[str, bytes, int, bytes, float]] = {}
+        for text, vector in zip(texts, vectors):
+            if not _is_cacheable(text) or vector is None or len(vector) == 0:
+                continue
+            blob = np.asarray(vector, dtype=VECTOR_DTYPE).tobytes()
+            key = text_key(text)
+            rows[key] = (model, key, len(vector), blob, now)
+        if not rows:
+            return
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO embedding_cache "
+                    "(model, text_hash, dimensions, vector, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    list(rows.values()),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            inserted = self._conn.total_changes - before
+            self._writes += inserted
+            self._entries += inserted
+            if inserted:
+                # Exact when nothing was ignored, an overestimate otherwise;
+                # eviction re-reads the true size before acting on it.
+                self._size_bytes += sum(len(row[3]) for row in rows.values())
+            if self._entries > self.max_entries or self._size_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used entries down to the low-water mark."""
+        # Other processes may share the file, so trust the database over
+        # this instance's running totals.
+        self._entries, self._size_bytes = self._count_stored()
+        if self._entries <= self.max_entries and self._size_bytes <= self.max_bytes:
+            return
+
+        target_entries = int(self.max_entries * EVICTION_LOW_WATER_FRACTION)
+        target_bytes = int(self.max_bytes * EVICTION_LOW_WATER_FRACTION)
+        excess_entries = max(0, self._entries - target_entries)
+        excess_bytes = max(0, self._size_bytes - target_bytes)
+        if self._entries:
+            avg_bytes = self._size_bytes / self._entries
+            excess_entries = max(excess_entries, int(excess_bytes / avg_bytes) + 1)
+
+        victims = self._conn.execute(
+            "SELECT model, text_hash, LENGTH(vector) FROM embedding_cache "
+            "ORDER BY last_access LIMIT ?",
+            (excess_entries,),
+        ).fetchall()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "DELETE FROM embedding_cache WHERE model = ? AND text_hash = ?",
+                [(model, key) for model, key, _ in victims],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+        self._evictions += len(victims)
+        self._entries -= len(victims)
+        self._size_bytes -= sum(size for _, _, size in victims)
+        logger.debug(f"Evicted {len(victims)} embeddings from {self.path}")
+
+    def get_or_compute(
+        self,
+        model: str,
+        texts: Sequence[str],
+        compute: EmbedFunction,
+    ) -> list[Optional[list[float]]]:
+        """
+        Return vectors for texts, computing and caching only the misses.
+
+        Each distinct missing text is passed to ``compute`` once, in a
+        single call, so batching backends keep their batching.
+
+        Args:
+            model: Embedding model identifier
+            texts: Texts to embed
+            compute: Backend call mapping a list of texts to one vector
+                (or None on failure) per text
+
+        Returns:
+            One vector (or None) per input text, in order
+        """
+        results = self.get_many(model, texts)
+
+        missing: dict[str, list[int]] = {}
+        for i, (text, vector) in enumerate(zip(texts, results)):
+            if vector is None:
+                missing.setdefault(text, []).append(i)
+        if not missing:
+            return results
+
+        miss_texts = list(missing)
+        computed = list(compute(miss_texts))
+        if len(computed) != len(miss_texts):
+            raise ValueError(
+                f"Embedding backend returned {len(computed)} vectors "
+                f"for {len(miss_texts)} texts"
+            )
+        self.put_many(model, miss_texts, computed)
+
+        for text, vector in zip(miss_texts, computed):
+            value = list(vector) if vector is not None else None
+            for i in missing[text]:
+                results[i] = value
+        return results
+
+    def get_stats(self) -> EmbeddingCacheStats:
+        """
+        Get a snapshot of cache activity and size.
+
+        Returns:
+            EmbeddingCacheStats for this cache instance
+        """
+        with self._lock:
+            return EmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                writes=self._writes,
+                evictions=self._evictions,
+                entries=self._entries,
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Remove every cached vector and reset statistics."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embedding_cache")
+            self._hits = self._misses = self._writes = self._evictions = 0
+            self._entries = self._size_bytes = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance, created from the "embeddings" config section
+_global_cache: Optional[EmbeddingCache] = None
+_global_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> Optional[EmbeddingCache]:
+    """
+    Get the global embedding cache, if enabled in configuration.
+
+    Reads ``cache_enabled``, ``cache_path``, ``cache_max_entries`` and
+    ``cache_max_mb`` from the "embeddings" config section on first use.
+
+    Returns:
+        The shared EmbeddingCache, or None when caching is disabled or
+        the cache file cannot be opened
+    """
+    global _global_cache, _global_cache_loaded
+    with _cache_lock:
+        if _global_cache_loaded:
+            return _global_cache
+        _global_cache_loaded = True
+
+        from ..config import get_embeddings_config
+        from ..utils.path_utils import get_config_dir
+
+        config = get_embeddings_config()
+        if not config.get("cache_enabled", False):
+            return None
+
+        path = config.get("cache_path") or get_config_dir() / DEFAULT_CACHE_FILENAME
+        try:
+            _global_cache = EmbeddingCache(
+                Path(path).expanduser(),
+                max_entries=int(config.get("cache_max_entries", DEFAULT_MAX_ENTRIES)),
+                max_bytes=int(config.get("cache_max_mb", DEFAULT_MAX_MB)) * BYTES_PER_MB,
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Embedding cache disabled, cannot open {path}: {e}")
+            _global_cache = None
+        return _global_cache
+
+
+def reset_embedding_cache() -> None:
+    """
+    Close the global embedding cache and re-read configuration on next use.
+
+    Useful for testing or after changing the "embeddings" config section.
+    """
+    global _global_cache, _global_cache_loaded
+    with _cache_lock:
+        if _global_cache is not None:
+            _global_cache.close()
+        _global_cache = None
+        _global_cache_loaded = False
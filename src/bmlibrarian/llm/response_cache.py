@@ -0,0 +1,588 @@
+"""
+Deterministic LLM response cache.
+
+Re-running a query, resuming a systematic review or repeating a benchmark
+sends the same prompt to the same model with the same options many times.
+At low temperature the answer is (for practical purposes) the same, so
+this module stores chat responses keyed by a hash of (model, messages,
+generation options) and lets LLMClient answer repeats without a model
+call.
+
+Caching is opt-in: LLMClient only consults the cache for calls made with
+``use_cache=True``, and agents opt in individually (see the "llm_cache"
+config section), so agents that rely on sampling diversity at
+temperature > 0 are never served a replayed answer.
+
+Backends are pluggable:
+    - MemoryResponseCacheBackend: per-process LRU dictionary
+    - SQLiteResponseCacheBackend: local file shared across processes
+    - PostgresResponseCacheBackend: ``llm_response_cache`` table shared by
+      every worker using the knowledge base (migration 031)
+
+Every entry may carry a TTL after which it is treated as a miss.
+
+Usage:
+    from bmlibrarian.llm.response_cache import (
+        MemoryResponseCacheBackend, ResponseCache,
+    )
+
+    cache = ResponseCache(MemoryResponseCacheBackend(), ttl_seconds=3600)
+    client = LLMClient(response_cache=cache)
+    client.chat(messages, model="gpt-oss:20b", temperature=0.0, use_cache=True)
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional, Sequence, Union
+
+from .data_types import LLMMessage, LLMResponse, Provider
+
+logger = logging.getLogger(__name__)
+
+# Default cache file name under the bmlibrarian config directory
+DEFAULT_CACHE_FILENAME = "llm_response_cache.sqlite"
+
+# Supported values for the "backend" config key
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+BACKEND_POSTGRES = "postgres"
+
+# Default bound on stored responses (memory and SQLite backends)
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Default time-to-live; 0 or None keeps entries until evicted
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Eviction trims down to this fraction of the bound so that a full cache
+# does not run an eviction query on every insert
+EVICTION_LOW_WATER_FRACTION = 0.9
+
+# Milliseconds a SQLite writer waits on a lock held by another process
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# Bump when the key derivation or stored payload changes
+CACHE_KEY_VERSION = 1
+
+
+def make_cache_key(
+    model: str,
+    messages: Sequence[LLMMessage],
+    options: dict[str, Any],
+) -> str:
+    """
+    Derive the cache key for a chat request.
+
+    Args:
+        model: Model string as passed to LLMClient (provider prefix included)
+        messages: Chat messages, system prompt already prepended
+        options: Generation options that affect the output (temperature,
+            top_p, max_tokens, json_mode, think, ...)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON request description
+    """
+    payload = {
+        "v": CACHE_KEY_VERSION,
+        "model": model,
+        "messages": [[m.role, m.content] for m in messages],
+        "options": options,
+    }
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _response_to_payload(response: LLMResponse) -> str:
+    """Serialize the reusable fields of a response."""
+    return json.dumps({
+        "content": response.content,
+        "model": response.model,
+        "provider": response.provider.value,
+        "prompt_tokens": response.prompt_tokens,
+        "completion_tokens": response.completion_tokens,
+        "total_tokens": response.total_tokens,
+        "thinking": response.thinking,
+    })
+
+
+def _payload_to_response(payload: str) -> LLMResponse:
+    """Rebuild a cached response (marked ``cached=True``)."""
+    data = json.loads(payload)
+    return LLMResponse(
+        content=data["content"],
+        model=data["model"],
+        provider=Provider(data["provider"]),
+        prompt_tokens=data.get("prompt_tokens", 0),
+        completion_tokens=data.get("completion_tokens", 0),
+        total_tokens=data.get("total_tokens", 0),
+        thinking=data.get("thinking"),
+        cached=True,
+    )
+
+
+class ResponseCacheBackend(ABC):
+    """
+    Storage for serialized responses.
+
+    Backends store opaque payload strings under hex keys with an optional
+    absolute expiry time (``time.time()`` seconds) and must be thread-safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the payload for a key, or None if missing or expired."""
+
+    @abstractmethod
+    def put(self, key: str, payload: str, expires_at: Optional[float]) -> None:
+        """Store (or replace) the payload for a key."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every stored entry."""
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class MemoryResponseCacheBackend(ResponseCacheBackend):
+    """Per-process LRU cache in a dictionary."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Args:
+            max_entries: Maximum number of stored responses
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, payload: str, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self._entries[key] = (payload, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteResponseCacheBackend(ResponseCacheBackend):
+    """
+    Size-bounded LRU cache in a local SQLite file.
+
+    Runs in WAL mode so several processes (e.g. parallel review workers)
+    can share one cache file.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Args:
+            path: SQLite database file; parent directories are created
+            max_entries: Maximum number of stored responses
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.path = Path(path)
+        self.max_entries = max_entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_response_cache_last_access "
+            "ON llm_response_cache (last_access)"
+        )
+        self._entries = self._conn.execute(
+            "SELECT COUNT(*) FROM llm_response_cache"
+        ).fetchone()[0]
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM llm_response_cache "
+                "WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_response_cache SET last_access = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            return row[0]
+
+    def put(self, key: str, payload: str, expires_at: Optional[float]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_response_cache "
+                "(cache_key, payload, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, time.time()),
+            )
+            self._entries += 1
+            if self._entries > self.max_entries:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Drop expired entries, then least recently used ones, to the low-water mark."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.execute(
+                "DELETE FROM llm_response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            )
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_response_cache").fetchone()[0]
+            excess = entries - int(self.max_entries * EVICTION_LOW_WATER_FRACTION)
+            if excess > 0 and entries > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM llm_response_cache WHERE cache_key IN ("
+                    "SELECT cache_key FROM llm_response_cache ORDER BY last_access LIMIT ?)",
+                    (excess,),
+                )
+                entries -= excess
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._entries = entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_response_cache")
+            self._entries = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresResponseCacheBackend(ResponseCacheBackend):
+    """
+    Cache in the knowledge base's ``llm_response_cache`` table.
+
+    Shared by every process and host using the database. Expired rows are
+    ignored on read and replaced on write; ``purge_expired()`` deletes them.
+    """
+
+    def __init__(self, db_manager: Optional[Any] = None) -> None:
+        """
+        Args:
+            db_manager: DatabaseManager to use; None uses the global one
+        """
+        self._db_manager = db_manager
+
+    def _get_db_manager(self) -> Any:
+        if self._db_manager is None:
+            from ..database import get_db_manager
+
+            self._db_manager = get_db_manager()
+        return self._db_manager
+
+    def get(self, key: str) -> Optional[str]:
+        with self._get_db_manager().get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT payload FROM llm_response_cache
+                    WHERE cache_key = %s AND (expires_at IS NULL OR expires_at > NOW())
+                    """,
+                    (key,),
+                )
+                row = cur.fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, payload: str, expires_at: Optional[float]) -> None:
+        with self._get_db_manager().get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    INSERT INTO llm_response_cache (cache_key, payload, expires_at)
+                    VALUES (%s, %s, to_timestamp(%s))
+                    ON CONFLICT (cache_key) DO UPDATE
+                    SET payload = EXCLUDED.payload,
+                        expires_at = EXCLUDED.expires_at,
+                        created_at = NOW()
+                    """,
+                    (key, payload, expires_at),
+                )
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired rows.
+
+        Returns:
+            Number of rows deleted
+        """
+        with self._get_db_manager().get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM llm_response_cache WHERE expires_at <= NOW()")
+                return cur.rowcount
+
+    def clear(self) -> None:
+        with self._get_db_manager().get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("TRUNCATE llm_response_cache")
+
+
+@dataclass
+class ResponseCacheStats:
+    """
+    Snapshot of response cache activity.
+
+    Attributes:
+        hits: Requests answered from the cache
+        misses: Requests that went to the model
+        writes: Responses stored
+        errors: Backend failures (treated as misses)
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary, including derived fields."""
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class ResponseCache:
+    """
+    LLM response cache over a pluggable backend.
+
+    Backend errors never fail a request: they are logged, counted and
+    treated as a miss (on read) or ignored (on write).
+
+    Example:
+        cache = ResponseCache(SQLiteResponseCacheBackend(path), ttl_seconds=86400)
+        key = make_cache_key(model, messages, options)
+        response = cache.get(key) or call_model()
+    """
+
+    def __init__(
+        self,
+        backend: ResponseCacheBackend,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Args:
+            backend: Storage backend
+            ttl_seconds: Lifetime of stored responses; 0 or None never expires
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._stats = ResponseCacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            The cached response (``cached=True``), or None on a miss
+        """
+        try:
+            payload = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            with self._lock:
+                self._stats.errors += 1
+                self._stats.misses += 1
+            return None
+
+        with self._lock:
+            if payload is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+        return _payload_to_response(payload)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_cache_key()
+            response: Response returned by the model
+        """
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        try:
+            self.backend.put(key, _response_to_payload(response), expires_at)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+            with self._lock:
+                self._stats.errors += 1
+            return
+        with self._lock:
+            self._stats.writes += 1
+
+    def get_stats(self) -> ResponseCacheStats:
+        """Get a snapshot of cache activity."""
+        with self._lock:
+            return ResponseCacheStats(**asdict(self._stats))
+
+    def clear(self) -> None:
+        """Remove every cached response and reset statistics."""
+        self.backend.clear()
+        with self._lock:
+            self._stats = ResponseCacheStats()
+
+    def close(self) -> None:
+        """Release backend resources."""
+        self.backend.close()
+
+
+# Global cache instance, created from the "llm_cache" config section
+_global_cache: Optional[ResponseCache] = None
+_global_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def create_response_cache(config: dict[str, Any]) -> ResponseCache:
+    """
+    Build a response cache from an "llm_cache" config section.
+
+    Args:
+        config: Dict with ``backend``, ``ttl_seconds``, ``max_entries``
+            and (SQLite) ``path``
+
+    Returns:
+        Configured ResponseCache
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend_name = config.get("backend", BACKEND_SQLITE)
+    max_entries = int(config.get("max_entries", DEFAULT_MAX_ENTRIES))
+
+    if backend_name == BACKEND_MEMORY:
+        backend: ResponseCacheBackend = MemoryResponseCacheBackend(max_entries)
+    elif backend_name == BACKEND_SQLITE:
+        from ..utils.path_utils import get_config_dir
+
+        path = config.get("path") or get_config_dir() / DEFAULT_CACHE_FILENAME
+        backend = SQLiteResponseCacheBackend(Path(path).expanduser(), max_entries)
+    elif backend_name == BACKEND_POSTGRES:
+        backend = PostgresResponseCacheBackend()
+    else:
+        raise ValueError(
+            f"Unknown llm_cache backend '{backend_name}' "
+            f"(expected {BACKEND_MEMORY}, {BACKEND_SQLITE} or {BACKEND_POSTGRES})"
+        )
+
+    return ResponseCache(backend, ttl_seconds=config.get("ttl_seconds", DEFAULT_TTL_SECONDS))
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the global response cache, if enabled in configuration.
+
+    Returns:
+        The shared ResponseCache, or None when caching is disabled or the
+        backend cannot be opened
+    """
+    global _global_cache, _global_cache_loaded
+    with _cache_lock:
+        if _global_cache_loaded:
+            return _global_cache
+        _global_cache_loaded = True
+
+        from ..config import get_config
+
+        config = get_config().get("llm_cache") or {}
+        if not config.get("enabled", False):
+            return None
+        try:
+            _global_cache = create_response_cache(config)
+        except (sqlite3.Error, OSError, ValueError) as e:
+            logger.warning(f"LLM response cache disabled: {e}")
+            _global_cache = None
+        return _global_cache
+
+
+def is_agent_cache_enabled(agent_type: str) -> bool:
+    """
+    Check whether an agent type has opted in to response caching.
+
+    Args:
+        agent_type: Value of the agent's get_agent_type()
+
+    Returns:
+        True when the cache is enabled and the agent is listed in
+        ``llm_cache.agents``
+    """
+    from ..config import get_config
+
+    config = get_config().get("llm_cache") or {}
+    return bool(config.get("enabled", False)) and agent_type in (config.get("agents") or [])
+
+
+def reset_response_cache() -> None:
+    """
+    Close the global response cache and re-read configuration on next use.
+
+    Useful for testing or after changing the "llm_cache" config section.
+    """
+    global _global_cache, _global_cache_loaded
+    with _cache_lock:
+        if _global_cache is not None:
+            _global_cache.close()
+        _global_cache = None
+        _global_cache_loaded = False
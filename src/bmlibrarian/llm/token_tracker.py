@@ -62,6 +62,8 @@ class UsageRecord:
         completion_tokens: Tokens in the completion
         cost_usd: Estimated cost in USD
         operation: Type of operation ("chat", "generate", "embed")
+        cached: Served from the response cache (no tokens were spent;
+            the token counts are those the original call used)
     """
 
     timestamp: datetime
@@ -71,6 +73,7 @@ class UsageRecord:
     completion_tokens: int
     cost_usd: float
     operation: str
+    cached: bool = False
 
 
 @dataclass
@@ -84,6 +87,9 @@ class UsageSummary:
         total_tokens: Total tokens across all calls
         total_cost_usd: Estimated total cost
         request_count: Number of API calls
+        cache_hits: Calls answered from the response cache (not counted
+            in the totals above)
+        cached_tokens_saved: Tokens the cached calls would have used
         by_provider: Breakdown by provider
         by_model: Breakdown by model
     """
@@ -93,6 +99,8 @@ class UsageSummary:
     total_tokens: int = 0
     total_cost_usd: float = 0.0
     request_count: int = 0
+    cache_hits: int = 0
+    cached_tokens_saved: int = 0
 
     # Per-provider breakdown
     by_provider: dict[str, dict[str, float | int]] = field(default_factory=dict)
@@ -129,6 +137,7 @@ class TokenTracker:
         prompt_tokens: int,
         completion_tokens: int,
         operation: str = "chat",
+        cached: bool = False,
     ) -> float:
         """
         Record token usage and calculate cost.
@@ -139,11 +148,15 @@ class TokenTracker:
             prompt_tokens: Number of tokens in the prompt
             completion_tokens: Number of tokens in the completion
             operation: Type of operation ("chat", "generate", "embed")
+            cached: The call was answered from the response cache; it is
+                reported as a cache hit and costs nothing
 
         Returns:
             Estimated cost in USD for this call
         """
-        cost = self._calculate_cost(provider, model, prompt_tokens, completion_tokens)
+        cost = 0.0 if cached else self._calculate_cost(
+            provider, model, prompt_tokens, completion_tokens
+        )
 
         record = UsageRecord(
             timestamp=datetime.now(),
@@ -153,6 +166,7 @@ class TokenTracker:
             completion_tokens=completion_tokens,
             cost_usd=cost,
             operation=operation,
+            cached=cached,
         )
 
         with self._lock:
@@ -223,6 +237,13 @@ class TokenTracker:
 
         with self._lock:
             for record in self._records:
+                if record.cached:
+                    summary.cache_hits += 1
+                    summary.cached_tokens_saved += (
+                        record.prompt_tokens + record.completion_tokens
+                    )
+                    continue
+
                 summary.total_prompt_tokens += record.prompt_tokens
                 summary.total_completion_tokens += record.completion_tokens
                 summary.total_tokens += record.prompt_tokens + record.completion_tokens
@@ -292,6 +313,12 @@ class TokenTracker:
             f"Estimated cost: ${summary.total_cost_usd:.4f}",
         ]
 
+        if summary.cache_hits:
+            lines.append(
+                f"Response cache hits: {summary.cache_hits} "
+                f"({summary.cached_tokens_saved:,} tokens saved)"
+            )
+
         if summary.by_provider:
             lines.append("")
             lines.append("By Provider:")
@@ -15,9 +15,12 @@ The agent orchestrates a multi-step workflow:
 7. Analyze verdicts
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, Iterator, List, Optional, Any, Callable
 import logging
 import re
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
 from psycopg.rows import dict_row
@@ -27,6 +30,7 @@ from bmlibrarian.database import get_db_manager
 from bmlibrarian.agents.orchestrator import AgentOrchestrator
 from bmlibrarian.agents.scoring_agent import DocumentScoringAgent
 from bmlibrarian.agents.citation_agent import CitationFinderAgent
+from bmlibrarian.agents.utils.concurrency import ordered_concurrent_map
 from bmlibrarian.config import get_config, get_model, get_agent_config, get_ollama_host
 
 from .data_models import (
@@ -63,6 +67,9 @@ DEFAULT_SCORING_BATCH_SIZE: int = 20
 DEFAULT_EARLY_STOP_COUNT: int = 20
 DEFAULT_EXPLANATION_TITLE_MAX_LEN: int = 100
 DEFAULT_MIN_CITATION_RELEVANCE: float = 0.7
+# Abstracts checked at once by check_abstracts_batch(); all of them share
+# one pool of scoring slots (see scoring.max_concurrent_requests)
+DEFAULT_MAX_CONCURRENT_ABSTRACTS: int = 1
 
 # Counter-report generation constants
 DEFAULT_REPORT_TEMPERATURE: float = 0.3
@@ -225,7 +232,8 @@ class PaperCheckerAgent(BaseAgent):
         search_config = self.agent_config.get("search", {})
         self.search_coordinator = SearchCoordinator(
             config=search_config,
-            db_connection=self.db.get_connection()
+            db_connection=self.db.get_connection(),
+            ollama_host=self.host
         )
 
         self.verdict_analyzer = VerdictAnalyzer(
@@ -243,6 +251,19 @@ class PaperCheckerAgent(BaseAgent):
             show_model_info=False
         )
 
+        # Scoring requests in flight across every abstract being checked.
+        # Defaults to the global scoring agent setting (OLLAMA_NUM_PARALLEL).
+        scoring_config = self.agent_config.get("scoring", {})
+        self.max_concurrent_scoring = max(1, scoring_config.get(
+            "max_concurrent_requests",
+            get_agent_config("scoring").get("max_concurrent_requests", 1)
+        ))
+        self._scoring_slots = threading.BoundedSemaphore(self.max_concurrent_scoring)
+
+        # PaperCheckDB holds a single connection; concurrent batch checks
+        # take turns saving their results
+        self._save_lock = threading.Lock()
+
         self.citation_agent = CitationFinderAgent(
             orchestrator=self.orchestrator,
             model=get_model("citation_agent"),
@@ -312,11 +333,14 @@ class PaperCheckerAgent(BaseAgent):
             raise ValueError("Abstract cannot be empty")
 
         source_metadata = source_metadata or {}
+        # Wall-clock seconds per workflow stage, summed over statements
+        stage_timings: Dict[str, float] = {}
 
         try:
             # Step 1: Extract statements
             self._report_progress(progress_callback, "Extracting statements", 0.1)
-            statements = self._extract_statements(abstract)
+            with self._stage_timer(stage_timings, "extract_statements"):
+                statements = self._extract_statements(abstract)
             logger.info(f"Extracted {len(statements)} statements")
 
             # Emit extracted statements data
@@ -330,7 +354,8 @@ class PaperCheckerAgent(BaseAgent):
 
             # Step 2: Generate counter-statements
             self._report_progress(progress_callback, "Generating counter-statements", 0.2)
-            counter_statements = self._generate_counter_statements(statements)
+            with self._stage_timer(stage_timings, "counter_statements"):
+                counter_statements = self._generate_counter_statements(statements)
 
             # Emit counter-statements data
             self._report_data(data_callback, "Generating counter-statements", {
@@ -364,7 +389,8 @@ class PaperCheckerAgent(BaseAgent):
                     f"Searching for counter-evidence ({i+1}/{num_statements})",
                     base_progress + 0.1
                 )
-                search_results = self._search_counter_evidence(counter_stmt)
+                with self._stage_timer(stage_timings, "search"):
+                    search_results = self._search_counter_evidence(counter_stmt)
                 search_results_list.append(search_results)
 
                 # Emit search results data
@@ -384,7 +410,8 @@ class PaperCheckerAgent(BaseAgent):
                     f"Scoring documents ({i+1}/{num_statements})",
                     base_progress + 0.2
                 )
-                scored_docs = self._score_documents(counter_stmt, search_results)
+                with self._stage_timer(stage_timings, "scoring"):
+                    scored_docs = self._score_documents(counter_stmt, search_results)
                 scored_docs_list.append(scored_docs)
 
                 # Emit scoring results data
@@ -405,7 +432,8 @@ class PaperCheckerAgent(BaseAgent):
                     f"Extracting citations ({i+1}/{num_statements})",
                     base_progress + 0.3
                 )
-                citations = self._extract_citations(counter_stmt, scored_docs)
+                with self._stage_timer(stage_timings, "citations"):
+                    citations = self._extract_citations(counter_stmt, scored_docs)
 
                 # Emit citations data
                 self._report_data(data_callback, "Extracting citations", {
@@ -427,9 +455,10 @@ class PaperCheckerAgent(BaseAgent):
                     f"Generating counter-report ({i+1}/{num_statements})",
                     base_progress + 0.4
                 )
-                counter_report = self._generate_counter_report(
-                    counter_stmt, citations, search_results, scored_docs
-                )
+                with self._stage_timer(stage_timings, "counter_reports"):
+                    counter_report = self._generate_counter_report(
+                        counter_stmt, citations, search_results, scored_docs
+                    )
                 counter_reports_list.append(counter_report)
 
                 # Emit counter-report data
@@ -447,7 +476,8 @@ class PaperCheckerAgent(BaseAgent):
                     f"Analyzing verdict ({i+1}/{num_statements})",
                     base_progress + 0.5
                 )
-                verdict = self._analyze_verdict(stmt, counter_report)
+                with self._stage_timer(stage_timings, "verdicts"):
+                    verdict = self._analyze_verdict(stmt, counter_report)
                 verdicts_list.append(verdict)
 
                 # Emit verdict data
@@ -461,9 +491,10 @@ class PaperCheckerAgent(BaseAgent):
 
             # Step 8: Overall assessment
             self._report_progress(progress_callback, "Generating overall assessment", 0.95)
-            overall_assessment = self._generate_overall_assessment(
-                statements, verdicts_list
-            )
+            with self._stage_timer(stage_timings, "overall_assessment"):
+                overall_assessment = self._generate_overall_assessment(
+                    statements, verdicts_list
+                )
 
             # Emit overall assessment data
             self._report_data(data_callback, "Generating overall assessment", {
@@ -491,13 +522,15 @@ class PaperCheckerAgent(BaseAgent):
                     "model": self.model,
                     "config": self.agent_config,
                     "timestamp": datetime.now().isoformat(),
-                    "processing_time_seconds": processing_time
+                    "processing_time_seconds": processing_time,
+                    "stage_timings_seconds": stage_timings
                 }
             )
 
             # Save to database
             self._report_progress(progress_callback, "Saving results", 0.99)
-            abstract_id = self.db.save_complete_result(result)
+            with self._stage_timer(stage_timings, "save"), self._save_lock:
+                abstract_id = self.db.save_complete_result(result)
             result.processing_metadata["abstract_id"] = abstract_id
 
             self._report_progress(progress_callback, "Complete", 1.0)
@@ -515,43 +548,62 @@ class PaperCheckerAgent(BaseAgent):
     def check_abstracts_batch(
         self,
         abstracts: List[Dict[str, Any]],
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        max_concurrent: Optional[int] = None
     ) -> List[PaperCheckResult]:
         """
         Check multiple abstracts in batch (queue-based processing).
 
-        Processes each abstract sequentially, continuing even if individual
-        abstracts fail. Failed abstracts are logged but don't stop the batch.
+        Up to ``max_concurrent`` abstracts are checked at once, so one
+        abstract's LLM calls overlap another's database searches. Document
+        scoring across all of them shares ``max_concurrent_scoring`` slots,
+        so the LLM server sees no more parallel scoring requests than with
+        a single abstract. Continues even if individual abstracts fail;
+        failed abstracts are logged but don't stop the batch.
 
         Args:
             abstracts: List of dicts with 'abstract' and optional 'metadata' keys
                       Example: [{"abstract": "...", "metadata": {"pmid": 123}}]
             progress_callback: Optional callback(completed, total)
-                              Called after each abstract is processed
+                              Called after each abstract is processed, in input order
+            max_concurrent: Abstracts checked at once; None uses
+                           batch.max_concurrent_abstracts from config (default 1)
 
         Returns:
-            List of PaperCheckResult objects (only successful checks)
+            List of PaperCheckResult objects (only successful checks), in input order
         """
-        logger.info(f"Starting batch check of {len(abstracts)} abstracts")
+        if max_concurrent is None:
+            max_concurrent = self.agent_config.get("batch", {}).get(
+                "max_concurrent_abstracts", DEFAULT_MAX_CONCURRENT_ABSTRACTS
+            )
+
+        logger.info(
+            f"Starting batch check of {len(abstracts)} abstracts "
+            f"({max_concurrent} at a time)"
+        )
         results: List[PaperCheckResult] = []
         total = len(abstracts)
 
-        for i, item in enumerate(abstracts, 1):
-            try:
-                result = self.check_abstract(
-                    abstract=item["abstract"],
-                    source_metadata=item.get("metadata", {})
-                )
-                results.append(result)
-
-                if progress_callback:
-                    progress_callback(i, total)
-
-            except Exception as e:
-                logger.error(f"Failed to check abstract {i}: {e}")
+        checks = ordered_concurrent_map(
+            lambda item: self.check_abstract(
+                abstract=item["abstract"],
+                source_metadata=item.get("metadata", {})
+            ),
+            abstracts,
+            max_in_flight=max_concurrent,
+            thread_name_prefix="paper-check",
+        )
+        for i, (_, result, error) in enumerate(checks, 1):
+            if error is not None:
+                logger.error(f"Failed to check abstract {i}: {error}")
                 # Continue with next abstract
                 continue
 
+            results.append(result)
+
+            if progress_callback:
+                progress_callback(i, total)
+
         logger.info(f"Batch check complete: {len(results)}/{total} successful")
         return results
 
@@ -784,28 +836,43 @@ class PaperCheckerAgent(BaseAgent):
         batch_size = scoring_config.get("batch_size", DEFAULT_SCORING_BATCH_SIZE)
         early_stop_count = scoring_config.get("early_stop_count", DEFAULT_EARLY_STOP_COUNT)
 
-        # Score documents in batches
+        # Score documents in batches; documents within a batch are scored
+        # concurrently, so early stopping still happens at batch boundaries
         scored_docs: List[ScoredDocument] = []
         doc_items = list(documents.items())
         total_batches = (len(doc_items) - 1) // batch_size + 1
 
+        def evaluate(item):
+            _, document = item
+            # Slots are shared with every abstract checked concurrently
+            with self._scoring_slots:
+                return self.scoring_agent.evaluate_document(
+                    user_question=scoring_question,
+                    document=document
+                )
+
         for batch_idx in range(0, len(doc_items), batch_size):
             batch = doc_items[batch_idx:batch_idx + batch_size]
             current_batch_num = batch_idx // batch_size + 1
 
             logger.debug(f"Scoring batch {current_batch_num}/{total_batches}")
 
-            for doc_id, document in batch:
+            evaluations = ordered_concurrent_map(
+                evaluate,
+                batch,
+                max_in_flight=self.max_concurrent_scoring,
+                thread_name_prefix="paper-check-scoring",
+            )
+            for (doc_id, document), scoring_result, error in evaluations:
+                if error is not None:
+                    logger.error(f"Failed to score document {doc_id}: {error}")
+                    # Continue with other documents
+                    continue
+
                 try:
                     # Get provenance for this document
                     found_by = search_results.provenance.get(doc_id, [])
 
-                    # Score using DocumentScoringAgent
-                    scoring_result = self.scoring_agent.evaluate_document(
-                        user_question=scoring_question,
-                        document=document
-                    )
-
                     score = scoring_result['score']
                     reasoning = scoring_result['reasoning']
 
@@ -1689,6 +1756,21 @@ Write ONLY the summary text in markdown format. Do not include headers, do not a
 
     # ==================== UTILITIES ====================
 
+    @contextmanager
+    def _stage_timer(self, timings: Dict[str, float], stage: str) -> Iterator[None]:
+        """
+        Add the wall-clock time of a ``with`` block to ``timings[stage]``.
+
+        Args:
+            timings: Accumulated seconds per stage
+            stage: Stage name
+        """
+        stage_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - stage_start
+
     def _report_progress(
         self,
         callback: Optional[Callable[[str, float], None]],
@@ -23,10 +23,13 @@ Example:
 
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from bmlibrarian.database import get_db_manager, DatabaseManager
+from bmlibrarian.db_vector import vector_param
 
+from ...llm import LLMClient
 from ..data_models import CounterStatement, SearchResults
 
 logger = logging.getLogger(__name__)
@@ -43,18 +46,20 @@ KEYWORD_SEARCH_OPERATOR: str = "|"  # OR operator for keyword search
 # Database query timeout in milliseconds (5 minutes default)
 # This prevents queries from hanging indefinitely on large embedding tables
 DEFAULT_QUERY_TIMEOUT_MS: int = 300000  # 5 minutes
+# Run the three strategies concurrently (each uses its own pooled connection)
+DEFAULT_PARALLEL_STRATEGIES: bool = True
 
 
 class SearchCoordinator:
     """
     Component for coordinating multi-strategy document search.
 
-    Executes three parallel search strategies (semantic, HyDE, keyword)
+    Executes three search strategies (semantic, HyDE, keyword) concurrently
     and combines results with deduplication and provenance tracking.
 
     The coordinator uses the bmlibrarian database manager for all database
-    operations and the ollama library for embedding generation, following
-    the project's golden rules.
+    operations and the LLM abstraction for HyDE embedding generation,
+    following the project's golden rules.
 
     Attributes:
         config: Search configuration dictionary with limits
@@ -81,8 +86,8 @@ class SearchCoordinator:
         self,
         config: Dict[str, Any],
         db_connection: Optional[Any] = None,  # Legacy parameter, not used
-        embedding_model: Optional[str] = None,  # Legacy - embedding done server-side
-        ollama_host: Optional[str] = None  # Legacy - embedding done server-side
+        embedding_model: Optional[str] = None,
+        ollama_host: Optional[str] = None
     ) -> None:
         """
         Initialize SearchCoordinator.
@@ -90,24 +95,33 @@ class SearchCoordinator:
         Args:
             config: Search configuration with limits and parameters.
                    Expected keys: semantic_limit, hyde_limit, keyword_limit,
-                                 max_deduplicated, query_timeout_ms
+                                 max_deduplicated, query_timeout_ms,
+                                 parallel_strategies
             db_connection: Legacy parameter, ignored. Uses DatabaseManager.
-            embedding_model: Legacy parameter. Embedding is now done server-side
-                           by PostgreSQL's ollama_embedding() function.
-            ollama_host: Legacy parameter. Embedding is now done server-side.
+            embedding_model: Embedding model for HyDE abstracts. Overrides
+                           config["embedding_model"]. Must match the model
+                           that produced the emb_1024 vectors.
+            ollama_host: Ollama server used to embed HyDE abstracts.
 
         Note:
-            Semantic and HyDE searches now use PostgreSQL's semantic_docsearch()
-            function which handles embedding generation server-side using the
-            HNSW index for fast approximate nearest neighbor search.
+            Semantic search uses PostgreSQL's semantic_docsearch() function,
+            which embeds the query server-side. HyDE search embeds all its
+            abstracts in one client-side batch and searches with every
+            vector in a single statement, falling back to semantic_docsearch()
+            per abstract if client-side embedding fails.
         """
         self.config = config
 
         # Get database manager (Golden Rule 5 - Use DatabaseManager)
         self.db_manager: DatabaseManager = get_db_manager()
 
-        # Store embedding model for reference (actual model used by server-side function)
-        self.embedding_model = config.get("embedding_model", DEFAULT_EMBEDDING_MODEL)
+        # Embedding model for HyDE abstracts (semantic search embeds server-side)
+        self.embedding_model = embedding_model or config.get(
+            "embedding_model", DEFAULT_EMBEDDING_MODEL
+        )
+        self.ollama_host = ollama_host
+        # Created on first HyDE search so construction stays offline
+        self._llm_client: Optional[LLMClient] = None
 
         # Extract limits from config with defaults (Golden Rule 2)
         self.semantic_limit: int = config.get("semantic_limit", DEFAULT_SEMANTIC_LIMIT)
@@ -115,6 +129,9 @@ class SearchCoordinator:
         self.keyword_limit: int = config.get("keyword_limit", DEFAULT_KEYWORD_LIMIT)
         self.max_deduplicated: int = config.get("max_deduplicated", DEFAULT_MAX_DEDUPLICATED)
         self.query_timeout_ms: int = config.get("query_timeout_ms", DEFAULT_QUERY_TIMEOUT_MS)
+        self.parallel_strategies: bool = config.get(
+            "parallel_strategies", DEFAULT_PARALLEL_STRATEGIES
+        )
 
         logger.info(
             f"Initialized SearchCoordinator with limits: "
@@ -149,61 +166,34 @@ class SearchCoordinator:
         logger.info("Executing multi-strategy search")
         start_time = time.time()
 
-        semantic_docs: List[int] = []
-        hyde_docs: List[int] = []
-        keyword_docs: List[int] = []
-        errors: List[str] = []
-
-        # Strategy 1: Semantic search
-        try:
-            semantic_start = time.time()
-            semantic_docs = self.search_semantic(
-                text=counter_stmt.negated_text,
-                limit=self.semantic_limit
-            )
-            semantic_time = time.time() - semantic_start
-            logger.info(
-                f"Semantic search found {len(semantic_docs)} documents "
-                f"in {semantic_time:.2f}s"
-            )
-        except Exception as e:
-            error_msg = f"Semantic search failed: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
-
-        # Strategy 2: HyDE search
-        try:
-            hyde_start = time.time()
-            hyde_docs = self.search_hyde(
-                hyde_abstracts=counter_stmt.hyde_abstracts,
-                limit=self.hyde_limit
-            )
-            hyde_time = time.time() - hyde_start
-            logger.info(
-                f"HyDE search found {len(hyde_docs)} documents "
-                f"in {hyde_time:.2f}s"
-            )
-        except Exception as e:
-            error_msg = f"HyDE search failed: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+        strategies: List[Tuple[str, str, Callable[[], List[int]]]] = [
+            ("semantic", "Semantic", lambda: self.search_semantic(
+                text=counter_stmt.negated_text, limit=self.semantic_limit
+            )),
+            ("hyde", "HyDE", lambda: self.search_hyde(
+                hyde_abstracts=counter_stmt.hyde_abstracts, limit=self.hyde_limit
+            )),
+            ("keyword", "Keyword", lambda: self.search_keyword(
+                keywords=counter_stmt.keywords, limit=self.keyword_limit
+            )),
+        ]
 
-        # Strategy 3: Keyword search
-        try:
-            keyword_start = time.time()
-            keyword_docs = self.search_keyword(
-                keywords=counter_stmt.keywords,
-                limit=self.keyword_limit
-            )
-            keyword_time = time.time() - keyword_start
-            logger.info(
-                f"Keyword search found {len(keyword_docs)} documents "
-                f"in {keyword_time:.2f}s"
-            )
-        except Exception as e:
-            error_msg = f"Keyword search failed: {e}"
-            logger.error(error_msg)
-            errors.append(error_msg)
+        if self.parallel_strategies:
+            # Each strategy is mostly database (and embedding) wait time and
+            # checks out its own pooled connection, so they overlap cleanly
+            with ThreadPoolExecutor(
+                max_workers=len(strategies), thread_name_prefix="search-strategy"
+            ) as executor:
+                futures = [
+                    executor.submit(self._run_strategy, label, run)
+                    for _, label, run in strategies
+                ]
+                outcomes = [future.result() for future in futures]
+        else:
+            outcomes = [self._run_strategy(label, run) for _, label, run in strategies]
+
+        errors: List[str] = [error for _, error, _ in outcomes if error]
+        semantic_docs, hyde_docs, keyword_docs = (docs for docs, _, _ in outcomes)
 
         # Check that at least one strategy succeeded
         if not (semantic_docs or hyde_docs or keyword_docs):
@@ -217,6 +207,10 @@ class SearchCoordinator:
             "hyde_limit": self.hyde_limit,
             "keyword_limit": self.keyword_limit,
             "embedding_model": self.embedding_model,
+            "parallel_strategies": self.parallel_strategies,
+            "strategy_times_seconds": {
+                name: elapsed for (name, _, _), (_, _, elapsed) in zip(strategies, outcomes)
+            },
             "total_search_time_seconds": total_time,
             "errors": errors if errors else None
         }
@@ -252,6 +246,31 @@ class SearchCoordinator:
 
         return results
 
+    def _run_strategy(
+        self, label: str, run: Callable[[], List[int]]
+    ) -> Tuple[List[int], Optional[str], float]:
+        """
+        Run one search strategy, timing it and capturing its failure.
+
+        Args:
+            label: Strategy name for log and error messages
+            run: Zero-argument callable executing the strategy
+
+        Returns:
+            Tuple of (document IDs, error message or None, elapsed seconds)
+        """
+        strategy_start = time.time()
+        try:
+            doc_ids = run()
+        except Exception as e:
+            error_msg = f"{label} search failed: {e}"
+            logger.error(error_msg)
+            return [], error_msg, time.time() - strategy_start
+
+        elapsed = time.time() - strategy_start
+        logger.info(f"{label} search found {len(doc_ids)} documents in {elapsed:.2f}s")
+        return doc_ids, None, elapsed
+
     def search_semantic(self, text: str, limit: int) -> List[int]:
         """
         Execute semantic (embedding-based) search.
@@ -325,9 +344,11 @@ class SearchCoordinator:
         """
         Execute HyDE (hypothetical document embedding) search.
 
-        Uses the PostgreSQL semantic_docsearch() function for each hypothetical
-        abstract. Results are deduplicated across all HyDE abstracts while
-        preserving order.
+        Embeds all hypothetical abstracts in one batch request and runs one
+        nearest-neighbour search per vector inside a single SQL statement.
+        If client-side embedding fails, falls back to semantic_docsearch()
+        per abstract (server-side embedding). Results are deduplicated
+        across all HyDE abstracts while preserving order.
 
         Args:
             hyde_abstracts: List of hypothetical abstracts to search with
@@ -344,6 +365,139 @@ class SearchCoordinator:
             f"HyDE search: {len(hyde_abstracts)} abstracts, limit={limit} each"
         )
 
+        embeddings = self._embed_abstracts(hyde_abstracts)
+        if embeddings is None:
+            all_docs = self._search_hyde_server_side(hyde_abstracts, limit)
+        else:
+            all_docs = self._search_hyde_embeddings(embeddings, limit)
+
+        # Deduplicate while preserving order (first occurrence wins)
+        seen: Set[int] = set()
+        deduplicated: List[int] = []
+        for doc_id in all_docs:
+            if doc_id not in seen:
+                seen.add(doc_id)
+                deduplicated.append(doc_id)
+
+        logger.debug(
+            f"HyDE search found {len(deduplicated)} unique documents "
+            f"for {len(hyde_abstracts)} abstracts"
+        )
+
+        return deduplicated
+
+    def _embed_abstracts(self, hyde_abstracts: List[str]) -> Optional[List[List[float]]]:
+        """
+        Embed all HyDE abstracts in one batch request.
+
+        Args:
+            hyde_abstracts: Hypothetical abstracts to embed
+
+        Returns:
+            One vector per abstract, or None if embedding failed (the caller
+            then falls back to server-side embedding)
+        """
+        try:
+            if self._llm_client is None:
+                self._llm_client = LLMClient(ollama_host=self.ollama_host)
+            response = self._llm_client.embed_batch(
+                hyde_abstracts, model=self.embedding_model
+            )
+            embeddings = response.embeddings
+            if len(embeddings) != len(hyde_abstracts) or not all(embeddings):
+                raise ValueError(
+                    f"expected {len(hyde_abstracts)} embeddings, "
+                    f"got {sum(1 for e in embeddings if e)}"
+                )
+            return embeddings
+        except Exception as e:
+            logger.warning(
+                f"Failed to embed HyDE abstracts client-side ({e}), "
+                "falling back to server-side embedding"
+            )
+            return None
+
+    def _search_hyde_embeddings(
+        self, embeddings: List[List[float]], limit: int
+    ) -> List[int]:
+        """
+        Search with every HyDE vector in a single statement.
+
+        Each vector is one VALUES row; a LATERAL subquery runs the same
+        HNSW-ordered scan as semantic_docsearch() for it. The statement does
+        the work of one query per vector, so its timeout is
+        query_timeout_ms per vector.
+
+        Args:
+            embeddings: One query vector per HyDE abstract
+            limit: Maximum chunks to consider per vector
+
+        Returns:
+            Document IDs per vector (best score first), concatenated in
+            abstract order; may contain duplicates across vectors
+        """
+        values = ", ".join("(%s, %s::vector)" for _ in embeddings)
+        sql = f"""
+            SELECT q.ord, r.document_id, MAX(r.score) AS best_score
+            FROM (VALUES {values}) AS q(ord, embedding)
+            CROSS JOIN LATERAL (
+                SELECT c.document_id,
+                       (1 - (e.embedding <=> q.embedding))::FLOAT AS score
+                FROM emb_1024 e
+                JOIN chunks c ON e.chunk_id = c.id
+                JOIN document d ON c.document_id = d.id
+                WHERE (1 - (e.embedding <=> q.embedding)) >= %s
+                  AND d.withdrawn_date IS NULL
+                ORDER BY e.embedding <=> q.embedding
+                LIMIT %s
+            ) r
+            GROUP BY q.ord, r.document_id
+            ORDER BY q.ord, best_score DESC
+        """
+
+        timeout_ms = self.query_timeout_ms * len(embeddings)
+        try:
+            with self.db_manager.get_connection() as conn:
+                params: List[Any] = []
+                for index, embedding in enumerate(embeddings):
+                    params.extend((index, vector_param(conn, embedding)))
+                params.extend((DEFAULT_SIMILARITY_THRESHOLD, limit))
+                with conn.cursor() as cur:
+                    # Note: SET LOCAL doesn't support parameterized values ($1),
+                    # so we format directly. timeout_ms is a validated int.
+                    cur.execute(f"SET LOCAL statement_timeout = '{timeout_ms}ms'")
+                    cur.execute(sql, params)
+                    return [row[1] for row in cur.fetchall()]
+
+        except Exception as e:
+            error_str = str(e).lower()
+            if "statement timeout" in error_str or "canceling statement" in error_str:
+                logger.warning(
+                    f"HyDE search of {len(embeddings)} vectors timed out "
+                    f"after {timeout_ms}ms"
+                )
+            else:
+                logger.error(f"HyDE search failed: {e}")
+            # Don't raise - continue with other strategies
+            return []
+
+    def _search_hyde_server_side(
+        self, hyde_abstracts: List[str], limit: int
+    ) -> List[int]:
+        """
+        Search with each HyDE abstract via semantic_docsearch().
+
+        Fallback for when client-side embedding is unavailable; PostgreSQL
+        embeds each abstract itself.
+
+        Args:
+            hyde_abstracts: Hypothetical abstracts to search with
+            limit: Maximum documents to return per abstract
+
+        Returns:
+            Document IDs per abstract, concatenated in abstract order; may
+            contain duplicates across abstracts
+        """
         all_docs: List[int] = []
         successful_searches = 0
 
@@ -400,20 +554,7 @@ class SearchCoordinator:
             )
             # Don't raise - continue with other strategies
 
-        # Deduplicate while preserving order (first occurrence wins)
-        seen: Set[int] = set()
-        deduplicated: List[int] = []
-        for doc_id in all_docs:
-            if doc_id not in seen:
-                seen.add(doc_id)
-                deduplicated.append(doc_id)
-
-        logger.debug(
-            f"HyDE search found {len(deduplicated)} unique documents "
-            f"from {successful_searches}/{len(hyde_abstracts)} successful searches"
-        )
-
-        return deduplicated
+        return all_docs
 
     def search_keyword(self, keywords: List[str], limit: int) -> List[int]:
         """
@@ -28,6 +28,9 @@ import concurrent.futures
 from pathlib import Path
 from typing import Optional, List, Tuple, TYPE_CHECKING
 
+from psycopg.errors import UndefinedFunction
+
+from bmlibrarian.db_vector import vector_param
 from bmlibrarian.llm import LLMClient, LLMMessage
 
 if TYPE_CHECKING:
@@ -204,23 +207,47 @@ def _semantic_search_fulltext(
     threshold: float,
     max_chunks: int,
     db_manager: "DatabaseManager",
+    ollama_host: Optional[str] = None,
+    embedding_model: str = DEFAULT_EMBEDDING_MODEL,
 ) -> List[ChunkContext]:
     """
     Perform semantic search on full-text chunks within a document.
 
+    The question is embedded once on the client and passed to
+    semantic.chunksearch_document_by_embedding() for both the thresholded
+    search and the diagnostic re-query. If embedding fails or migration
+    032 is missing, the text function embeds server-side instead.
+
     Args:
         document_id: The document's database ID.
         question: The question to search for.
         threshold: Minimum similarity threshold (0.0 to 1.0).
         max_chunks: Maximum number of chunks to return.
         db_manager: Database manager instance.
+        ollama_host: Ollama server URL for the query embedding.
+        embedding_model: Model of the stored chunk embeddings.
 
     Returns:
         List of ChunkContext objects sorted by score descending.
     """
+    try:
+        query_embedding = LLMClient(ollama_host=ollama_host).embed_batch(
+            [question], model=embedding_model
+        ).embeddings[0]
+    except Exception as e:
+        logger.warning(f"Query embedding failed, using server-side embedding: {e}")
+        query_embedding = None
+
     try:
         with db_manager.get_connection() as conn:
             with conn.cursor() as cur:
+                if query_embedding is not None:
+                    search_function = "semantic.chunksearch_document_by_embedding"
+                    query_arg = vector_param(conn, query_embedding)
+                else:
+                    search_function = "semantic.chunksearch_document"
+                    query_arg = question
+
                 # First, check how many chunks exist for this document
                 cur.execute(
                     "SELECT COUNT(*) FROM semantic.chunks WHERE document_id = %s",
@@ -244,14 +271,27 @@ def _semantic_search_fulltext(
                     f"'{question[:100]}...' threshold={threshold}, max_chunks={max_chunks}"
                 )
 
-                cur.execute(
-                    """
+                search_sql = """
                     SELECT chunk_id, chunk_no, score, chunk_text
-                    FROM semantic.chunksearch_document(%s, %s, %s, %s)
+                    FROM {function}(%s, %s, %s, %s)
                     ORDER BY score DESC
-                    """,
-                    (document_id, question, threshold, max_chunks),
-                )
+                    """
+                try:
+                    cur.execute(
+                        search_sql.format(function=search_function),
+                        (document_id, query_arg, threshold, max_chunks),
+                    )
+                except UndefinedFunction:
+                    logger.warning(
+                        f"{search_function}() not installed (migration 032); "
+                        f"using server-side embedding"
+                    )
+                    conn.rollback()
+                    search_function, query_arg = "semantic.chunksearch_document", question
+                    cur.execute(
+                        search_sql.format(function=search_function),
+                        (document_id, query_arg, threshold, max_chunks),
+                    )
                 rows = cur.fetchall()
 
                 if not rows:
@@ -262,13 +302,13 @@ def _semantic_search_fulltext(
                     )
                     # Query without threshold to see actual scores
                     cur.execute(
-                        """
+                        f"""
                         SELECT chunk_id, chunk_no, score,
                                LEFT(chunk_text, 100) as preview
-                        FROM semantic.chunksearch_document(%s, %s, %s, %s)
+                        FROM {search_function}(%s, %s, %s, %s)
                         ORDER BY score DESC
                         """,
-                        (document_id, question, 0.0, 5),  # No threshold
+                        (document_id, query_arg, 0.0, 5),  # No threshold
                     )
                     debug_rows = cur.fetchall()
                     if debug_rows:
@@ -1098,6 +1138,10 @@ def answer_from_document(
                         similarity_threshold,
                         max_chunks,
                         db_manager,
+                        ollama_host=ollama_host,
+                        embedding_model=qa_config.get(
+                            "embedding_model", DEFAULT_EMBEDDING_MODEL
+                        ),
                     )
                 if chunks:
                     source = AnswerSource.FULLTEXT_SEMANTIC
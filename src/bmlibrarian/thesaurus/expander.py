@@ -8,7 +8,9 @@ enabling improved search recall through synonym, abbreviation, and hierarchical
 import logging
 import re
 import time
-from typing import List, Set, Dict, Optional, Tuple
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, List, Set, Dict, Optional, Union
 from dataclasses import dataclass, field
 
 import psycopg
@@ -22,8 +24,46 @@ DEFAULT_MAX_EXPANSIONS_PER_TERM = 10
 DEFAULT_CACHE_MAX_SIZE = 1000
 DEFAULT_CACHE_TTL_SECONDS = 3600  # 1 hour
 DEFAULT_MAX_QUERY_TERMS = 50  # Maximum terms to expand in a single query
-CACHE_EVICTION_CHECK_INTERVAL = 100  # Check for expired entries every N additions
-CACHE_EVICTION_PERCENTAGE = 10  # Evict this percentage of entries when cache is full
+DEFAULT_BATCH_EXPANSION_SIZE = 200  # Terms resolved per batched SQL call
+DEFAULT_WARM_CACHE_TERMS = 500  # Most frequent query-log terms to preload
+
+# Relation codes returned by the batched expansion query, in output order
+_RELATION_SYNONYM = 0
+_RELATION_BROADER = 1
+_RELATION_NARROWER = 2
+
+# Resolves many terms in one round trip: unnest() numbers the inputs, and each
+# LATERAL call runs the same per-term functions expand_term() would, so the
+# result matches term-by-term expansion. WITH ORDINALITY keeps each function's
+# own row order for the ORDER BY.
+_BATCH_EXPANSION_SQL = """
+    WITH input AS (
+        SELECT input_term, ord
+        FROM unnest(%(terms)s::text[]) WITH ORDINALITY AS i(input_term, ord)
+    )
+    SELECT i.ord, %(synonym)s AS relation, e.term, e.preferred_term, e.concept_id, e.pos
+    FROM input i
+    CROSS JOIN LATERAL (
+        SELECT x.term, x.preferred_term, x.concept_id, x.pos
+        FROM thesaurus.expand_term(i.input_term)
+            WITH ORDINALITY AS x(term, term_type, preferred_term, concept_id, is_input_term, pos)
+        ORDER BY x.pos
+        LIMIT %(limit)s
+    ) e
+    UNION ALL
+    SELECT i.ord, %(broader)s, b.broader_term, NULL, b.concept_id, b.pos
+    FROM input i
+    CROSS JOIN LATERAL thesaurus.get_broader_terms(i.input_term)
+        WITH ORDINALITY AS b(broader_term, tree_number, tree_level, concept_id, pos)
+    WHERE %(include_broader)s
+    UNION ALL
+    SELECT i.ord, %(narrower)s, n.narrower_term, NULL, n.concept_id, n.pos
+    FROM input i
+    CROSS JOIN LATERAL thesaurus.get_narrower_terms(i.input_term)
+        WITH ORDINALITY AS n(narrower_term, tree_number, tree_level, concept_id, pos)
+    WHERE %(include_narrower)s
+    ORDER BY 1, 2, 6
+"""
 
 
 @dataclass
@@ -111,8 +151,9 @@ class ThesaurusExpander:
         self.cache_ttl = cache_ttl
         self.max_query_terms = max_query_terms
 
-        # Cache for term expansions with TTL tracking
-        self._expansion_cache: Dict[str, CacheEntry] = {}
+        # LRU cache for term expansions with TTL tracking: most recently used
+        # entries live at the end, so eviction pops from the front in O(1)
+        self._expansion_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
 
         # Statistics for tracking expansion effectiveness
         self._stats = ExpansionStats()
@@ -154,53 +195,90 @@ class ThesaurusExpander:
         """
         return (time.time() - entry.timestamp) < self.cache_ttl
 
-    def _evict_expired_entries(self) -> None:
-        """Remove expired entries from the cache."""
-        current_time = time.time()
-        expired_keys = [
-            key for key, entry in self._expansion_cache.items()
-            if (current_time - entry.timestamp) >= self.cache_ttl
-        ]
-        for key in expired_keys:
-            del self._expansion_cache[key]
-
-    def _evict_oldest_entries(self, count: int = 1) -> None:
+    def _get_cached_expansion(self, normalized_term: str) -> Optional[TermExpansion]:
         """
-        Evict the oldest entries from the cache.
+        Look up a cached expansion, dropping it if expired.
 
         Args:
-            count: Number of entries to evict
-        """
-        if count <= 0 or not self._expansion_cache:
-            return
+            normalized_term: The normalized term key
 
-        # Sort by timestamp and remove oldest
-        sorted_entries = sorted(
-            self._expansion_cache.items(),
-            key=lambda x: x[1].timestamp
-        )
-        for key, _ in sorted_entries[:count]:
-            del self._expansion_cache[key]
+        Returns:
+            The cached expansion, or None on a miss
+        """
+        entry = self._expansion_cache.get(normalized_term)
+        if entry is None:
+            return None
+        if not self._is_cache_entry_valid(entry):
+            del self._expansion_cache[normalized_term]
+            return None
+        self._expansion_cache.move_to_end(normalized_term)
+        return entry.expansion
 
     def _cache_expansion(self, normalized_term: str, expansion: TermExpansion) -> None:
         """
-        Store an expansion in the cache with max size enforcement.
+        Store an expansion in the cache, evicting the least recently used entry.
 
         Args:
             normalized_term: The normalized term key
             expansion: The expansion to cache
         """
-        # Evict expired entries periodically
-        if len(self._expansion_cache) % CACHE_EVICTION_CHECK_INTERVAL == 0:
-            self._evict_expired_entries()
+        self._expansion_cache[normalized_term] = CacheEntry(expansion=expansion)
+        self._expansion_cache.move_to_end(normalized_term)
+        while len(self._expansion_cache) > self.cache_max_size:
+            self._expansion_cache.popitem(last=False)
+
+    @staticmethod
+    def _no_expansion(term: str) -> TermExpansion:
+        """Build the expansion returned for terms with no thesaurus match."""
+        return TermExpansion(
+            original_term=term,
+            all_variants=[term],
+            preferred_term=None,
+            concept_ids=[],
+            expansion_type='none'
+        )
 
-        # Evict oldest entries if at max size
-        if len(self._expansion_cache) >= self.cache_max_size:
-            # Evict percentage of entries to avoid frequent evictions
-            evict_count = max(1, self.cache_max_size // CACHE_EVICTION_PERCENTAGE)
-            self._evict_oldest_entries(evict_count)
+    def _build_expansion(
+        self,
+        term: str,
+        results: List[Dict[str, Any]],
+        hierarchy_terms: List[str]
+    ) -> TermExpansion:
+        """
+        Build a TermExpansion from thesaurus.expand_term() rows.
 
-        self._expansion_cache[normalized_term] = CacheEntry(expansion=expansion)
+        Args:
+            term: The term that was expanded
+            results: Rows with 'term', 'preferred_term' and 'concept_id'
+            hierarchy_terms: Broader/narrower terms to append
+
+        Returns:
+            TermExpansion ('none' if there were no rows)
+        """
+        if not results:
+            return self._no_expansion(term)
+
+        # Extract all variants and metadata
+        all_variants = [row['term'] for row in results] + hierarchy_terms
+        preferred_term = results[0]['preferred_term']
+        concept_ids = list(set(row['concept_id'] for row in results))
+
+        # Remove duplicates while preserving order
+        seen = set()
+        unique_variants = []
+        for variant in all_variants:
+            variant_lower = variant.lower()
+            if variant_lower not in seen:
+                seen.add(variant_lower)
+                unique_variants.append(variant)
+
+        return TermExpansion(
+            original_term=term,
+            all_variants=unique_variants[:self.max_expansions_per_term],
+            preferred_term=preferred_term,
+            concept_ids=concept_ids,
+            expansion_type='exact'
+        )
 
     def expand_term(self, term: str, use_cache: bool = True) -> TermExpansion:
         """
@@ -217,27 +295,18 @@ class ThesaurusExpander:
         normalized_term = term.strip().lower()
 
         # Check cache with TTL validation
-        if use_cache and normalized_term in self._expansion_cache:
-            entry = self._expansion_cache[normalized_term]
-            if self._is_cache_entry_valid(entry):
+        if use_cache:
+            cached = self._get_cached_expansion(normalized_term)
+            if cached is not None:
                 self._stats.cache_hits += 1
-                return entry.expansion
-            else:
-                # Entry expired, remove it
-                del self._expansion_cache[normalized_term]
+                return cached
 
         self._stats.cache_misses += 1
         self._stats.expansions_performed += 1
 
         # Skip very short terms
         if len(normalized_term) < self.min_term_length:
-            expansion = TermExpansion(
-                original_term=term,
-                all_variants=[term],
-                preferred_term=None,
-                concept_ids=[],
-                expansion_type='none'
-            )
+            expansion = self._no_expansion(term)
             self._cache_expansion(normalized_term, expansion)
             return expansion
 
@@ -261,46 +330,14 @@ class ThesaurusExpander:
 
                     results = cur.fetchall()
 
-                    if not results:
-                        # No expansion found
-                        expansion = TermExpansion(
-                            original_term=term,
-                            all_variants=[term],
-                            preferred_term=None,
-                            concept_ids=[],
-                            expansion_type='none'
-                        )
-                    else:
-                        # Extract all variants and metadata
-                        all_variants = [row['term'] for row in results]
-                        preferred_term = results[0]['preferred_term']
-                        concept_ids = list(set(row['concept_id'] for row in results))
-
-                        # Optionally add hierarchical terms
-                        if self.include_broader_terms:
-                            broader_terms = self._get_broader_terms(term, cur)
-                            all_variants.extend(broader_terms)
-
-                        if self.include_narrower_terms:
-                            narrower_terms = self._get_narrower_terms(term, cur)
-                            all_variants.extend(narrower_terms)
-
-                        # Remove duplicates while preserving order
-                        seen = set()
-                        unique_variants = []
-                        for variant in all_variants:
-                            variant_lower = variant.lower()
-                            if variant_lower not in seen:
-                                seen.add(variant_lower)
-                                unique_variants.append(variant)
-
-                        expansion = TermExpansion(
-                            original_term=term,
-                            all_variants=unique_variants[:self.max_expansions_per_term],
-                            preferred_term=preferred_term,
-                            concept_ids=concept_ids,
-                            expansion_type='exact'
-                        )
+                    # Optionally add hierarchical terms
+                    hierarchy_terms: List[str] = []
+                    if results and self.include_broader_terms:
+                        hierarchy_terms.extend(self._get_broader_terms(term, cur))
+                    if results and self.include_narrower_terms:
+                        hierarchy_terms.extend(self._get_narrower_terms(term, cur))
+
+                    expansion = self._build_expansion(term, results, hierarchy_terms)
 
                     # Cache the result
                     if use_cache:
@@ -315,14 +352,117 @@ class ThesaurusExpander:
         except Exception as e:
             logger.warning(f"Failed to expand term '{term}': {e}")
             # Return minimal expansion on error
-            expansion = TermExpansion(
-                original_term=term,
-                all_variants=[term],
-                preferred_term=None,
-                concept_ids=[],
-                expansion_type='none'
-            )
-            return expansion
+            return self._no_expansion(term)
+
+    def expand_terms(
+        self,
+        terms: Iterable[str],
+        use_cache: bool = True
+    ) -> Dict[str, TermExpansion]:
+        """
+        Expand many terms, resolving all cache misses in one batched SQL call.
+
+        Equivalent to calling expand_term() for each term, but uncached terms
+        (including their broader/narrower lookups) cost a single round trip
+        per DEFAULT_BATCH_EXPANSION_SIZE terms instead of up to three each.
+
+        Args:
+            terms: Terms to expand
+            use_cache: Whether to use and populate the cache (default: True)
+
+        Returns:
+            Dictionary mapping each input term to its TermExpansion
+        """
+        terms = list(terms)
+        expansions: Dict[str, TermExpansion] = {}
+        # Normalized term -> first input spelling that still needs the database
+        pending: Dict[str, str] = {}
+
+        for term in terms:
+            if term in expansions:
+                continue
+            normalized_term = term.strip().lower()
+
+            if normalized_term in pending:
+                # Same term, different spelling: share the lookup
+                continue
+            if use_cache:
+                cached = self._get_cached_expansion(normalized_term)
+                if cached is not None:
+                    self._stats.cache_hits += 1
+                    expansions[term] = cached
+                    continue
+
+            self._stats.cache_misses += 1
+            self._stats.expansions_performed += 1
+            if len(normalized_term) < self.min_term_length:
+                expansions[term] = self._no_expansion(term)
+                self._cache_expansion(normalized_term, expansions[term])
+            else:
+                pending[normalized_term] = term
+
+        lookup_terms = list(pending.values())
+        for start in range(0, len(lookup_terms), DEFAULT_BATCH_EXPANSION_SIZE):
+            batch = lookup_terms[start:start + DEFAULT_BATCH_EXPANSION_SIZE]
+            try:
+                fetched = self._fetch_expansions(batch)
+            except Exception as e:
+                logger.warning(f"Failed to expand {len(batch)} terms in batch: {e}")
+                for term in batch:
+                    expansions[term] = self._no_expansion(term)
+                continue
+
+            for term, expansion in zip(batch, fetched):
+                expansions[term] = expansion
+                if use_cache:
+                    self._cache_expansion(term.strip().lower(), expansion)
+                if expansion.expansion_type != 'none':
+                    self._stats.terms_expanded += 1
+
+        # Other spellings of a term looked up above reuse its expansion
+        for term in terms:
+            if term not in expansions:
+                expansions[term] = expansions[pending[term.strip().lower()]]
+
+        return expansions
+
+    def _fetch_expansions(self, terms: List[str]) -> List[TermExpansion]:
+        """
+        Expand terms with one set-returning query.
+
+        Args:
+            terms: Terms to look up (already length-filtered)
+
+        Returns:
+            One TermExpansion per input term, in input order
+        """
+        synonyms: List[List[Dict[str, Any]]] = [[] for _ in terms]
+        hierarchy: List[List[str]] = [[] for _ in terms]
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(_BATCH_EXPANSION_SQL, {
+                    'terms': terms,
+                    'limit': self.max_expansions_per_term,
+                    'synonym': _RELATION_SYNONYM,
+                    'broader': _RELATION_BROADER,
+                    'narrower': _RELATION_NARROWER,
+                    'include_broader': self.include_broader_terms,
+                    'include_narrower': self.include_narrower_terms,
+                })
+                for row in cur.fetchall():
+                    index = row['ord'] - 1
+                    if row['relation'] == _RELATION_SYNONYM:
+                        synonyms[index].append(row)
+                    else:
+                        hierarchy[index].append(row['term'])
+
+        # Hierarchy terms only extend terms that matched a concept, as in
+        # expand_term()
+        return [
+            self._build_expansion(term, synonyms[i], hierarchy[i] if synonyms[i] else [])
+            for i, term in enumerate(terms)
+        ]
 
     def _get_broader_terms(self, term: str, cursor: psycopg.Cursor) -> List[str]:
         """Get broader hierarchical terms."""
@@ -386,10 +526,9 @@ class ThesaurusExpander:
             self._stats.queries_limited += 1
             return ts_query
 
-        # Build expansion map
+        # Build expansion map (all uncached terms resolved in one round trip)
         expansion_map: Dict[str, List[str]] = {}
-        for term in terms:
-            expansion = self.expand_term(term)
+        for term, expansion in self.expand_terms(terms).items():
             if expansion.expansion_type != 'none' and len(expansion.all_variants) > 1:
                 expansion_map[term.lower()] = expansion.all_variants
 
@@ -507,6 +646,62 @@ class ThesaurusExpander:
 
         return expanded
 
+    def warm_cache(
+        self,
+        queries: Iterable[str],
+        max_terms: int = DEFAULT_WARM_CACHE_TERMS
+    ) -> int:
+        """
+        Preload the cache with the most frequent terms from past queries.
+
+        Args:
+            queries: to_tsquery strings, e.g. from a query log
+            max_terms: Number of most frequent terms to expand (default: 500)
+
+        Returns:
+            Number of terms expanded into the cache
+        """
+        counts: Counter = Counter()
+        spellings: Dict[str, str] = {}
+        for query in queries:
+            for term in self._extract_terms(query):
+                normalized_term = term.strip().lower()
+                counts[normalized_term] += 1
+                spellings.setdefault(normalized_term, term)
+
+        top_terms = [spellings[term] for term, _ in counts.most_common(max_terms)]
+        self.expand_terms(top_terms)
+        logger.info(f"Warmed thesaurus cache with {len(top_terms)} terms")
+        return len(top_terms)
+
+    def warm_cache_from_log(
+        self,
+        log_path: Union[str, Path],
+        max_terms: int = DEFAULT_WARM_CACHE_TERMS
+    ) -> int:
+        """
+        Preload the cache from a query log file.
+
+        The log holds one to_tsquery string per line; blank lines and lines
+        starting with '#' are ignored.
+
+        Args:
+            log_path: Path to the query log
+            max_terms: Number of most frequent terms to expand (default: 500)
+
+        Returns:
+            Number of terms expanded into the cache
+
+        Raises:
+            OSError: If the log file cannot be read
+        """
+        with open(log_path, encoding='utf-8') as f:
+            queries = [
+                line.strip() for line in f
+                if line.strip() and not line.lstrip().startswith('#')
+            ]
+        return self.warm_cache(queries, max_terms=max_terms)
+
     def clear_cache(self) -> None:
         """Clear the term expansion cache."""
         self._expansion_cache.clear()
@@ -58,6 +58,11 @@ from .download_utils import (
     discard_partial_download
 )
 
+from .rate_limit import (
+    DEFAULT_MIN_HOST_INTERVAL,
+    HostRateLimiter
+)
+
 __all__ = [
     # Path utilities
     'expand_path',
@@ -103,5 +108,8 @@ __all__ = [
     'PARTIAL_DOWNLOAD_SUFFIX',
     'partial_download_path',
     'promote_partial_download',
-    'discard_partial_download'
+    'discard_partial_download',
+    # Per-host request spacing
+    'DEFAULT_MIN_HOST_INTERVAL',
+    'HostRateLimiter'
 ]
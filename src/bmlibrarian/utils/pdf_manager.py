@@ -12,6 +12,8 @@ Supports multiple download strategies:
 import os
 import logging
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple, Callable
 from datetime import datetime
@@ -23,9 +25,13 @@ from .download_utils import (
     promote_partial_download,
     discard_partial_download,
 )
+from .rate_limit import DEFAULT_MIN_HOST_INTERVAL, HostRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent downloads in download_missing_pdfs()
+DEFAULT_DOWNLOAD_WORKERS = 1
+
 
 class PDFManager:
     """Manages PDF storage and retrieval with year-based organization."""
@@ -61,6 +67,7 @@ class PDFManager:
 
         self.base_dir = Path(base_dir).expanduser()
         self.db_conn = db_conn
+        self._db_lock = threading.Lock()
 
         # Handle backward compatibility with old openathens_config dict
         if openathens_config is not None and openathens_auth is None:
@@ -155,7 +162,8 @@ class PDFManager:
         document: Dict[str, Any],
         timeout: int = 30,
         max_retries: int = 3,
-        use_browser_fallback: bool = True
+        use_browser_fallback: bool = True,
+        rate_limiter: Optional[HostRateLimiter] = None
     ) -> Optional[Path]:
         """Download PDF from URL and save to organized storage with retry logic.
 
@@ -164,6 +172,8 @@ class PDFManager:
             timeout: Download timeout in seconds
             max_retries: Maximum number of retry attempts
             use_browser_fallback: If True, use browser automation when regular download fails
+            rate_limiter: Optional per-host limiter consulted before every
+                HTTP attempt (shared by concurrent batch downloads)
 
         Returns:
             Path to downloaded file, or None if download failed
@@ -216,6 +226,9 @@ class PDFManager:
 
                     logger.info("Using OpenAthens authenticated session")
 
+                if rate_limiter is not None:
+                    rate_limiter.wait(pdf_url)
+
                 response = requests.get(
                     pdf_url,
                     timeout=timeout,
@@ -860,19 +873,23 @@ class PDFManager:
             logger.error("No database connection available")
             return False
 
-        try:
-            with self.db_conn.cursor() as cursor:
-                cursor.execute(
-                    "UPDATE document SET pdf_filename = %s WHERE id = %s",
-                    (relative_path, doc_id)
-                )
-                self.db_conn.commit()
-                logger.info(f"Updated document {doc_id} pdf_filename to: {relative_path}")
-                return True
-        except Exception as e:
-            logger.error(f"Failed to update database for document {doc_id}: {e}")
-            self.db_conn.rollback()
-            return False
+        # Concurrent batch downloads share db_conn; serialize the
+        # update/commit (or rollback) so one thread never ends another's
+        # transaction.
+        with self._db_lock:
+            try:
+                with self.db_conn.cursor() as cursor:
+                    cursor.execute(
+                        "UPDATE document SET pdf_filename = %s WHERE id = %s",
+                        (relative_path, doc_id)
+                    )
+                    self.db_conn.commit()
+                    logger.info(f"Updated document {doc_id} pdf_filename to: {relative_path}")
+                    return True
+            except Exception as e:
+                logger.error(f"Failed to update database for document {doc_id}: {e}")
+                self.db_conn.rollback()
+                return False
 
     def migrate_pdfs_to_year_structure(
         self,
@@ -1110,19 +1127,28 @@ class PDFManager:
         max_batches: Optional[int] = None,
         timeout: int = 30,
         update_database: bool = True,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        min_host_interval: float = DEFAULT_MIN_HOST_INTERVAL
     ) -> Dict[str, Any]:
         """Download missing PDFs in batches.
 
         Finds documents that have pdf_url but no local PDF file, then downloads them
-        in batches.
+        in batches. Within a batch, up to ``max_workers`` downloads run at once;
+        with more than one worker, requests to the same host are spaced at
+        least ``min_host_interval`` seconds apart. The sequential path
+        (max_workers=1) is not rate limited.
 
         Args:
             batch_size: Number of PDFs to download per batch (default: 100)
             max_batches: Maximum number of batches to process (None = all)
             timeout: Download timeout in seconds per PDF
             update_database: If True, update pdf_filename in database after download
-            progress_callback: Optional callback(current, total, doc_id, status)
+            progress_callback: Optional callback(current, total, doc_id, status),
+                always called from the calling thread
+            max_workers: Maximum concurrent downloads (1 = sequential)
+            min_host_interval: Minimum seconds between requests to one host
+                when downloading concurrently (0 disables limiting)
 
         Returns:
             Dictionary with download statistics and details
@@ -1137,6 +1163,7 @@ class PDFManager:
                 'skipped': 0
             }
 
+        executor: Optional[ThreadPoolExecutor] = None
         stats = {
             'total_missing': 0,
             'processed': 0,
@@ -1184,6 +1211,16 @@ class PDFManager:
             stats['total_missing'] = len(missing_pdfs)
             logger.info(f"Found {stats['total_missing']} missing PDFs to download")
 
+            # Sequential downloads keep their original pacing; only concurrent
+            # workers need per-host spacing
+            rate_limiter = (
+                HostRateLimiter(min_host_interval) if max_workers > 1 else None
+            )
+            executor = (
+                ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf-download")
+                if max_workers > 1 else None
+            )
+
             # Process in batches
             batch_num = 0
             for i in range(0, len(missing_pdfs), batch_size):
@@ -1197,6 +1234,18 @@ class PDFManager:
 
                 logger.info(f"Processing batch {batch_num} ({len(batch)} documents)")
 
+                # Start the whole batch on the worker pool; results are
+                # consumed below in document order
+                futures = None
+                if executor is not None:
+                    futures = [
+                        executor.submit(
+                            self._download_single_pdf, doc, timeout,
+                            update_database, rate_limiter
+                        )
+                        for doc in batch
+                    ]
+
                 # Download each PDF in batch
                 for j, doc in enumerate(batch):
                     stats['processed'] += 1
@@ -1207,8 +1256,13 @@ class PDFManager:
                         progress_callback(stats['processed'], stats['total_missing'],
                                         doc_id, 'downloading')
 
-                    # Download PDF
-                    result = self._download_single_pdf(doc, timeout, update_database)
+                    # Download PDF (or collect the pooled download)
+                    if futures is not None:
+                        result = futures[j].result()
+                    else:
+                        result = self._download_single_pdf(
+                            doc, timeout, update_database, rate_limiter
+                        )
 
                     # Update stats
                     if result['status'] == 'downloaded':
@@ -1231,20 +1285,28 @@ class PDFManager:
             logger.error(f"Download process failed: {e}", exc_info=True)
             stats['error'] = str(e)
 
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
         return stats
 
     def _download_single_pdf(
         self,
         doc: Dict[str, Any],
         timeout: int,
-        update_database: bool
+        update_database: bool,
+        rate_limiter: Optional[HostRateLimiter] = None
     ) -> Dict[str, Any]:
         """Download a single PDF and optionally update database.
 
+        Safe to call from worker threads; no exception escapes.
+
         Args:
             doc: Document dictionary
             timeout: Download timeout in seconds
             update_database: If True, update database with pdf_filename
+            rate_limiter: Optional per-host limiter shared across workers
 
         Returns:
             Dictionary with download result details
@@ -1265,7 +1327,9 @@ class PDFManager:
                 doc['pdf_filename'] = self._generate_filename(doc)
 
             # Download PDF with retry logic
-            pdf_path = self.download_pdf(doc, timeout=timeout, max_retries=3)
+            pdf_path = self.download_pdf(
+                doc, timeout=timeout, max_retries=3, rate_limiter=rate_limiter
+            )
 
             if not pdf_path:
                 return {
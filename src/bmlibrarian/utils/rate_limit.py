@@ -0,0 +1,64 @@
+"""Per-host request spacing for concurrent downloads.
+
+Downloading many PDFs in parallel is only polite (and only avoids HTTP 429
+responses and temporary IP bans) if no single publisher or repository
+sees a burst. HostRateLimiter lets any number of worker threads share one
+limiter: requests to different hosts proceed freely, while requests to
+the same host are spaced at least ``min_interval`` seconds apart.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Default minimum spacing between requests to one host (seconds)
+DEFAULT_MIN_HOST_INTERVAL = 1.0
+
+
+class HostRateLimiter:
+    """Thread-safe minimum interval between requests to the same host."""
+
+    def __init__(self, min_interval: float = DEFAULT_MIN_HOST_INTERVAL) -> None:
+        """Initialize the limiter.
+
+        Args:
+            min_interval: Minimum seconds between request starts per host;
+                0 disables limiting
+
+        Raises:
+            ValueError: If min_interval is negative
+        """
+        if min_interval < 0:
+            raise ValueError(f"min_interval must be non-negative, got {min_interval}")
+        self.min_interval = min_interval
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> float:
+        """Block until a request to ``url``'s host may start.
+
+        Slots are reserved under the lock and the sleep happens outside
+        it, so waiting on one host never delays another.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            Seconds slept
+        """
+        if self.min_interval <= 0:
+            return 0.0
+        host = (urlparse(url).hostname or "").lower()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = start + self.min_interval
+        delay = start - now
+        if delay > 0:
+            logger.debug(f"Rate limiting {host}: waiting {delay:.2f}s")
+            time.sleep(delay)
+        return delay
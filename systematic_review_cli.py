@@ -143,6 +143,10 @@ Examples:
 
     # Automatic mode (no checkpoints)
     python systematic_review_cli.py --question "..." --auto
+
+    # Distributed scoring: start the review, then add workers on other hosts
+    python systematic_review_cli.py --question "..." --auto --distributed
+    python systematic_review_cli.py --join-run 42
         """,
     )
 
@@ -303,6 +307,20 @@ Examples:
         help="Resume review from checkpoint file (provide review ID or path to checkpoint JSON)",
     )
 
+    # Distributed scoring
+    parser.add_argument(
+        "--distributed",
+        action="store_true",
+        help="Score through the shared run work queue so other workers can join (--join-run)",
+    )
+
+    parser.add_argument(
+        "--join-run",
+        type=int,
+        metavar="RUN_ID",
+        help="Join an in-progress evaluation run as an extra relevance scoring worker",
+    )
+
     # Display status
     parser.add_argument(
         "--status",
@@ -687,6 +705,9 @@ def run_review(args: argparse.Namespace) -> int:
         if args.quality_threshold:
             config.quality_threshold = args.quality_threshold
 
+        if args.distributed:
+            config.distributed_scoring = True
+
         if args.quick:
             config.max_results_per_query = 50
             config.run_study_assessment = False
@@ -780,6 +801,51 @@ def run_review(args: argparse.Namespace) -> int:
         return 1
 
 
+def join_run(args: argparse.Namespace) -> int:
+    """
+    Join an in-progress evaluation run as a distributed scoring worker.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    from bmlibrarian.database import get_db_manager
+    from bmlibrarian.evaluations import EvaluationStore
+    from bmlibrarian.agents.systematic_review.distributed import DistributedScoringWorker
+
+    print_banner()
+
+    try:
+        store = EvaluationStore(get_db_manager())
+        worker = DistributedScoringWorker.from_run(
+            store,
+            run_id=args.join_run,
+            config=get_systematic_review_config(),
+            callback=progress_callback,
+        )
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    print(f"Worker {worker.worker_id} joining run {args.join_run}")
+    print()
+
+    try:
+        result = worker.run(wait_for_others=False)
+    except KeyboardInterrupt:
+        # Claims held by this worker are recovered by the others once
+        # their leases expire
+        print("\nWorker interrupted; unfinished claims will be recovered by other workers.")
+        return 130
+
+    print()
+    print(f"Scored {result.scored} papers, {result.failed} failed, "
+          f"{result.batches} batches in {result.execution_time_seconds:.1f}s")
+    return 0
+
+
 def show_status() -> int:
     """
     Show status of reviews (placeholder for future implementation).
@@ -1003,6 +1069,10 @@ def main() -> int:
     if args.resume:
         return resume_review(args)
 
+    # Handle distributed worker
+    if args.join_run:
+        return join_run(args)
+
     # Validate we have something to do
     if not args.question and not args.criteria_file:
         print("Error: Either --question or --criteria-file is required.")
@@ -0,0 +1,207 @@
+"""Tests for concurrent resolver fan-out and the resolver result cache.
+
+Resolver HTTP traffic goes to a local stub server, so no test touches the
+network.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List
+
+import pytest
+
+from bmlibrarian.discovery import FullTextFinder, ResolverCache
+from bmlibrarian.discovery.data_types import (
+    AccessType, DocumentIdentifiers, PDFSource, ResolutionResult,
+    ResolutionStatus, SourceType
+)
+from bmlibrarian.discovery.resolvers import BaseResolver, UnpaywallResolver
+
+DOI = "10.1234/example"
+
+
+class FakeResolver(BaseResolver):
+    """Resolver that sleeps, then returns one source of the given access type."""
+
+    def __init__(self, name: str, delay: float, access: AccessType, priority: int):
+        super().__init__(timeout=1)
+        self._name = name
+        self.delay = delay
+        self.access = access
+        self.priority = priority
+        self.calls = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def resolve(self, identifiers: DocumentIdentifiers) -> ResolutionResult:
+        self.calls += 1
+        time.sleep(self.delay)
+        source = PDFSource(
+            url=f"https://{self._name}.example/paper.pdf",
+            source_type=SourceType.UNKNOWN,
+            access_type=self.access,
+            priority=self.priority,
+        )
+        return self._create_result(ResolutionStatus.SUCCESS, sources=[source])
+
+
+def make_finder(resolvers: List[BaseResolver], **kwargs) -> FullTextFinder:
+    finder = FullTextFinder(skip_resolvers=["pmc", "unpaywall", "doi", "direct_url"], **kwargs)
+    finder.resolvers = resolvers
+    return finder
+
+
+class TestConcurrentDiscover:
+    """discover(concurrent=True) matches sequential results, faster."""
+
+    def test_results_match_sequential_order(self):
+        resolvers = [
+            FakeResolver("slow", 0.2, AccessType.UNKNOWN, 10),
+            FakeResolver("fast", 0.0, AccessType.UNKNOWN, 20),
+            FakeResolver("mid", 0.1, AccessType.INSTITUTIONAL, 30),
+        ]
+        finder = make_finder(resolvers)
+        identifiers = DocumentIdentifiers(doi=DOI)
+
+        sequential = finder.discover(identifiers, concurrent=False)
+        start = time.monotonic()
+        concurrent = finder.discover(identifiers, concurrent=True)
+        elapsed = time.monotonic() - start
+
+        assert [r.resolver_name for r in concurrent.resolution_results] == [
+            "slow", "fast", "mid"
+        ]
+        assert [s.url for s in concurrent.sources] == [s.url for s in sequential.sources]
+        assert elapsed < 0.28  # max(latencies), not their 0.3s sum
+
+    def test_stop_on_first_oa_discards_lower_priority_resolvers(self):
+        resolvers = [
+            FakeResolver("oa", 0.05, AccessType.OPEN, 0),
+            FakeResolver("later", 0.0, AccessType.UNKNOWN, 10),
+        ]
+        finder = make_finder(resolvers, concurrent_discovery=True)
+        statuses = []
+
+        result = finder.discover(
+            DocumentIdentifiers(doi=DOI),
+            progress_callback=lambda name, status: statuses.append((name, status)),
+        )
+
+        assert [r.resolver_name for r in result.resolution_results] == ["oa"]
+        assert result.best_source.access_type == AccessType.OPEN
+        assert ("oa", "found_oa") in statuses
+
+    def test_failing_resolver_does_not_abort_discovery(self):
+        broken = FakeResolver("broken", 0.0, AccessType.UNKNOWN, 0)
+        broken.resolve = lambda identifiers: (_ for _ in ()).throw(RuntimeError("boom"))
+        finder = make_finder([broken, FakeResolver("ok", 0.0, AccessType.UNKNOWN, 5)])
+
+        result = finder.discover(DocumentIdentifiers(doi=DOI), concurrent=True)
+
+        assert [r.resolver_name for r in result.resolution_results] == ["ok"]
+
+    def test_resolvers_share_one_session(self):
+        finder = FullTextFinder(unpaywall_email="test@example.com")
+
+        assert len({id(r.session) for r in finder.resolvers}) == 1
+
+    def test_injected_session_replaces_private_one(self, monkeypatch):
+        from bmlibrarian.discovery import full_text_finder, resolvers
+
+        created = []
+        original = resolvers.create_resolver_session
+
+        def counting_create(*args, **kwargs):
+            created.append(1)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(resolvers, "create_resolver_session", counting_create)
+        monkeypatch.setattr(full_text_finder, "create_resolver_session", counting_create)
+
+        finder = FullTextFinder(unpaywall_email="test@example.com")
+
+        assert len(finder.resolvers) > 1
+        assert len(created) == 1
+        assert finder.resolvers[0].session is finder._resolver_session
+
+
+class UnpaywallStub(BaseHTTPRequestHandler):
+    """Answers every request with an OA Unpaywall record."""
+
+    requests_seen: List[str] = []
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        type(self).requests_seen.append(self.path)
+        body = json.dumps({
+            "is_oa": True,
+            "oa_status": "gold",
+            "best_oa_location": {
+                "url_for_pdf": "https://publisher.example/paper.pdf",
+                "host_type": "publisher",
+                "version": "publishedVersion",
+                "license": "cc-by",
+            },
+            "oa_locations": [],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def unpaywall_server() -> Iterator[str]:
+    UnpaywallStub.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UnpaywallStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v2"
+    server.shutdown()
+    server.server_close()
+
+
+class TestResolverCache:
+    """ResolverCache answers repeat lookups without HTTP."""
+
+    def test_second_discovery_is_served_from_cache(self, tmp_path, unpaywall_server):
+        cache = ResolverCache(tmp_path / "resolver_cache.sqlite")
+        resolver = UnpaywallResolver(email="test@example.com", timeout=5)
+        resolver.API_URL = unpaywall_server
+        finder = make_finder([resolver], resolver_cache=cache)
+
+        first = finder.discover(DocumentIdentifiers(doi=DOI))
+        second = finder.discover(DocumentIdentifiers(doi=DOI.upper()))
+
+        assert len(UnpaywallStub.requests_seen) == 1
+        assert [s.url for s in second.sources] == [s.url for s in first.sources]
+        assert second.sources[0].access_type == AccessType.OPEN
+        assert second.resolution_results[0].metadata["cached"] is True
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        cache = ResolverCache(tmp_path / "cache.sqlite", ttl_seconds=0.05)
+        identifiers = DocumentIdentifiers(pmid="123")
+        result = ResolutionResult(resolver_name="pmc", status=ResolutionStatus.NOT_FOUND)
+
+        assert cache.put(identifiers, result)
+        assert cache.get("pmc", identifiers).status == ResolutionStatus.NOT_FOUND
+        time.sleep(0.1)
+        assert cache.get("pmc", identifiers) is None
+        assert cache.purge_expired() == 1
+
+    def test_errors_are_not_cached(self, tmp_path):
+        cache = ResolverCache(tmp_path / "cache.sqlite")
+        identifiers = DocumentIdentifiers(doi=DOI)
+        result = ResolutionResult(
+            resolver_name="doi", status=ResolutionStatus.ERROR, error_message="503"
+        )
+
+        assert not cache.put(identifiers, result)
+        assert cache.get("doi", identifiers) is None
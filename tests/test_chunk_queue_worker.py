@@ -0,0 +1,304 @@
+"""
+Tests for the pipelined chunk queue worker.
+
+Hermetic: the embedding backend and database are replaced with in-memory
+stand-ins; no Ollama or PostgreSQL required.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+import bmlibrarian.embeddings.chunk_queue_worker as chunk_queue_worker
+from bmlibrarian.embeddings.adaptive_chunker_optimized import (
+    adaptive_chunker_with_positions,
+)
+from bmlibrarian.embeddings.chunk_queue_worker import (
+    NO_CHUNKS_ERROR,
+    ChunkQueueWorker,
+    _QueuedDocument,
+)
+
+SENTENCE = "Aspirin reduces the risk of myocardial infarction in adults. "
+
+
+class _FakeEmbedder:
+    """ChunkEmbedder stand-in recording the texts of each embedding call."""
+
+    def __init__(self) -> None:
+        self.db_manager = None
+        self.model_id = 3
+        self.calls: List[List[str]] = []
+        self._lock = threading.Lock()
+
+    def create_embeddings_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        with self._lock:
+            self.calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+
+class _InMemoryWorker(ChunkQueueWorker):
+    """Worker whose queue and chunk table live in memory."""
+
+    def __init__(self, documents: Dict[int, Optional[str]], **kwargs: Any) -> None:
+        super().__init__(_FakeEmbedder(), chunk_size=200, overlap=20, **kwargs)
+        self.queue = list(documents.items())
+        self.stored: Dict[int, int] = {}
+        self.failures: Dict[int, str] = {}
+        self.released: List[int] = []
+        self.write_groups: List[List[int]] = []
+
+    def claim_documents(self, limit: int) -> List[Tuple[int, Optional[str]]]:
+        claimed, self.queue = self.queue[:limit], self.queue[limit:]
+        return claimed
+
+    def write_documents(self, documents) -> int:
+        self.write_groups.append([doc.document_id for doc in documents])
+        written = 0
+        for doc in documents:
+            count = sum(1 for e in doc.embeddings if e)
+            self.stored[doc.document_id] = count
+            written += count
+        return written
+
+    def record_failure(self, document_id: int, error: str) -> None:
+        self.failures[document_id] = error
+        with self._lock:
+            self._failed += 1
+
+    def release_documents(self, document_ids: List[int]) -> None:
+        self.released.extend(document_ids)
+
+
+def test_pipeline_batches_chunks_across_documents() -> None:
+    """Small documents share embedding calls; every chunk is written once."""
+    documents = {doc_id: SENTENCE * 5 for doc_id in range(1, 9)}
+    worker = _InMemoryWorker(documents, embed_batch_size=6, claim_size=3)
+
+    stats = worker.run()
+
+    assert stats["processed"] == 8
+    assert stats["failed"] == 0
+    assert stats["claimed"] == 8
+    assert sum(worker.stored.values()) == stats["chunks_created"] > 8
+    calls = worker.embedder.calls
+    assert all(len(call) <= 6 for call in calls)
+    assert len(calls) < 8, "chunks must be batched across documents"
+
+
+def test_documents_without_text_are_recorded_as_failures() -> None:
+    """Missing full text fails the queue entry without blocking others."""
+    worker = _InMemoryWorker({1: None, 2: SENTENCE})
+
+    stats = worker.run()
+
+    assert (stats["processed"], stats["failed"]) == (1, 1)
+    assert worker.failures == {1: NO_CHUNKS_ERROR}
+    assert set(worker.stored) == {2}
+
+
+def test_max_documents_limits_claims() -> None:
+    """run(max_documents=N) never claims more than N documents."""
+    worker = _InMemoryWorker({i: SENTENCE for i in range(1, 11)}, claim_size=4)
+    progress: List[Tuple[str, int, int]] = []
+
+    stats = worker.run(max_documents=5, progress_callback=lambda *a: progress.append(a))
+
+    assert stats["claimed"] == 5
+    assert len(worker.queue) == 5
+    assert progress[-1] == ("chunking", 5, 5)
+
+
+def test_failed_group_write_isolates_bad_document() -> None:
+    """A write error on one document does not fail the rest of its group."""
+    worker = _InMemoryWorker({i: SENTENCE for i in range(1, 5)}, write_batch_documents=4)
+    original = worker.write_documents
+
+    def flaky(documents) -> int:
+        if any(doc.document_id == 3 for doc in documents):
+            raise RuntimeError("constraint violation")
+        return original(documents)
+
+    worker.write_documents = flaky
+
+    stats = worker.run()
+
+    assert (stats["processed"], stats["failed"]) == (3, 1)
+    assert "constraint violation" in worker.failures[3]
+
+
+def test_failed_embedding_call_fails_its_documents_only() -> None:
+    """An embedding error is recorded per document; the run carries on."""
+    worker = _InMemoryWorker({i: SENTENCE for i in range(1, 5)}, embed_batch_size=1)
+    original = worker.embedder.create_embeddings_batch
+
+    def broken(texts):
+        if len(worker.embedder.calls) == 1:
+            worker.embedder.calls.append(texts)
+            raise ConnectionError("backend exploded")
+        return original(texts)
+
+    worker.embedder.create_embeddings_batch = broken
+
+    stats = worker.run()
+
+    assert (stats["processed"], stats["failed"], stats["released"]) == (3, 1, 0)
+    (failed_id, error), = worker.failures.items()
+    assert "backend exploded" in error
+    assert failed_id not in worker.stored
+    assert worker.released == []
+
+
+def test_stage_crash_releases_unprocessed_claims() -> None:
+    """A crashed stage stops the run; claimed documents are un-leased."""
+    worker = _InMemoryWorker({i: SENTENCE for i in range(1, 4)}, claim_size=3)
+    claim = worker.claim_documents
+
+    def claim_then_fail(limit: int) -> List[Tuple[int, Optional[str]]]:
+        if worker.queue:
+            return claim(limit)
+        raise ConnectionError("database went away")
+
+    def embed_after_crash(texts):
+        # Hold the batch until the claim stage has stopped the pipeline
+        assert worker._stop.wait(5)
+        return [[1.0] for _ in texts]
+
+    worker.claim_documents = claim_then_fail
+    worker.embedder.create_embeddings_batch = embed_after_crash
+
+    with pytest.raises(RuntimeError, match="database went away"):
+        worker.run()
+
+    assert sorted(worker.released) == [1, 2, 3]
+    assert worker.stored == {}
+
+
+class _RecordingCursor:
+    """Cursor stand-in recording SQL and COPY rows."""
+
+    def __init__(self, log: Dict[str, List]) -> None:
+        self._log = log
+        self._result: List[Tuple] = []
+
+    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+        self._log["sql"].append(query)
+        if "FOR UPDATE SKIP LOCKED" in query:
+            self._result = [(7, 0, 2), (5, 10, 1)]
+        elif "full_text" in query:
+            self._result = [(5, "text five")]
+        else:
+            self._result = []
+
+    def fetchall(self) -> List[Tuple]:
+        return self._result
+
+    @contextmanager
+    def copy(self, statement: str) -> Iterator[Any]:
+        self._log["copy"].append(statement)
+
+        class _Copy:
+            def set_types(_self, types: List[str]) -> None:
+                self._log["types"].append(types)
+
+            def write_row(_self, row: Tuple) -> None:
+                self._log["rows"].append(row)
+
+        yield _Copy()
+
+    def __enter__(self) -> "_RecordingCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _RecordingDB:
+    """DatabaseManager stand-in with one recording connection."""
+
+    def __init__(self) -> None:
+        self.log: Dict[str, List] = {"sql": [], "copy": [], "rows": [], "types": []}
+        self.connections = 0
+
+    @contextmanager
+    def get_connection(self) -> Iterator[Any]:
+        self.connections += 1
+        log = self.log
+
+        class _Conn:
+            def cursor(self) -> _RecordingCursor:
+                return _RecordingCursor(log)
+
+        yield _Conn()
+
+
+def _db_worker() -> Tuple[ChunkQueueWorker, _RecordingDB]:
+    embedder = _FakeEmbedder()
+    embedder.db_manager = _RecordingDB()
+    worker = ChunkQueueWorker(embedder, chunk_size=200, overlap=20, lease_seconds=60)
+    return worker, embedder.db_manager
+
+
+def test_claim_uses_skip_locked_lease_in_priority_order() -> None:
+    """Claims skip locked rows, honour leases and keep queue order."""
+    worker, db = _db_worker()
+
+    claimed = worker.claim_documents(2)
+
+    assert claimed == [(5, "text five"), (7, None)]
+    claim_sql = db.log["sql"][0]
+    assert "FOR UPDATE SKIP LOCKED" in claim_sql
+    assert "SET last_attempt_at = NOW()" in claim_sql
+    assert db.connections == 1
+
+
+def test_release_clears_lease_without_counting_an_attempt() -> None:
+    """Released entries become claimable again immediately."""
+    worker, db = _db_worker()
+
+    worker.release_documents([5, 7])
+
+    (sql,) = db.log["sql"]
+    assert "SET last_attempt_at = NULL" in sql
+    assert "attempts" not in sql
+
+
+def test_write_copies_chunks_and_dequeues_in_one_transaction(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Old chunks are replaced with one COPY and the queue entry removed."""
+    monkeypatch.setattr(chunk_queue_worker, "register_vector_adapters", lambda conn: False)
+    worker, db = _db_worker()
+    text = SENTENCE * 5
+    chunks = adaptive_chunker_with_positions(text, max_chars=200, overlap_chars=20)
+    doc = _QueuedDocument(9, None, chunks, [[0.5, 0.25]] * len(chunks))
+
+    written = worker.write_documents([doc])
+
+    assert written == len(chunks)
+    assert db.connections == 1
+    assert len(db.log["copy"]) == 1 and "semantic.chunks" in db.log["copy"][0]
+    assert db.log["rows"][0][:5] == (9, 3, 200, 20, 0)
+    assert db.log["rows"][0][-1] == "[0.5,0.25]"
+    assert "DELETE FROM semantic.chunks" in db.log["sql"][0]
+    assert "DELETE FROM semantic.chunk_queue" in db.log["sql"][-1]
+
+
+def test_write_uses_binary_copy_when_pgvector_adapters_available(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Embeddings are streamed as float32 arrays in a binary COPY."""
+    monkeypatch.setattr(chunk_queue_worker, "register_vector_adapters", lambda conn: True)
+    worker, db = _db_worker()
+    chunks = adaptive_chunker_with_positions(SENTENCE, max_chars=200, overlap_chars=20)
+    doc = _QueuedDocument(9, None, chunks, [[0.5, 0.25]] * len(chunks))
+
+    worker.write_documents([doc])
+
+    assert "FORMAT BINARY" in db.log["copy"][0]
+    assert db.log["types"] == [chunk_queue_worker.CHUNK_COPY_TYPES]
+    embedding = db.log["rows"][0][-1]
+    assert isinstance(embedding, np.ndarray) and embedding.dtype == np.float32
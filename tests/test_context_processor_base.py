@@ -9,6 +9,8 @@ Tests the hierarchical map-reduce processing algorithm including:
 - Progress tracking
 """
 
+import threading
+import time
 import unittest
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, call
@@ -477,6 +479,113 @@ class TestFullProcessing(unittest.TestCase):
         self.assertIn("batches_per_level", result.processing_stats)
 
 
+class TestTokenBatching(unittest.TestCase):
+    """Tests for batching by token count."""
+
+    @staticmethod
+    def count_words(text: str) -> int:
+        """Toy tokenizer: one token per whitespace-separated word."""
+        return len(text.split())
+
+    def test_requires_token_counter(self):
+        """max_context_tokens without a token_counter should be rejected."""
+        with self.assertRaises(ValueError):
+            ProcessingConfig(max_context_tokens=100)
+        with self.assertRaises(ValueError):
+            ProcessingConfig(max_context_tokens=0, token_counter=self.count_words)
+
+    def test_batches_packed_by_tokens_not_chars(self):
+        """Long words pack by token count even when chars exceed the char limit."""
+        config = ProcessingConfig(
+            max_context_chars=10,  # Would force one item per batch
+            max_context_tokens=8,
+            token_counter=self.count_words,
+            separator="\n",
+        )
+        processor = SimpleTestProcessor(config=config)
+        # "[i] word word" is 3 tokens; two fit in 8 tokens, three do not
+        items = ["alphabetical characteristically"] * 5
+
+        batches = processor._create_batches(items, config)
+
+        self.assertEqual([b.size for b in batches], [2, 2, 1])
+        self.assertEqual(batches[0].total_tokens, 6)
+        self.assertGreater(batches[0].total_chars, config.max_context_chars)
+
+    def test_oversized_item_split_to_token_budget(self):
+        """Oversized items are split into pieces that fit the token limit."""
+        config = ProcessingConfig(
+            max_context_tokens=20,
+            token_counter=self.count_words,
+        )
+        processor = SimpleTestProcessor(config=config)
+        items = [" ".join(f"w{i}" for i in range(100))]
+
+        batches = processor._create_batches(items, config)
+
+        self.assertGreater(len(batches), 1)
+        for batch in batches:
+            self.assertLessEqual(batch.total_tokens, 20)
+
+
+class TestConcurrentExtraction(unittest.TestCase):
+    """Tests for the parallel map phase."""
+
+    def test_results_in_batch_order(self):
+        """Concurrent extraction should overlap batches but keep result order."""
+        config = ProcessingConfig(
+            max_context_chars=20,
+            max_concurrent_batches=4,
+        )
+        processor = SimpleTestProcessor(config=config)
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+        original_extract = processor.extract_from_batch
+
+        def slow_extract(batch_content, query, batch_metadata):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            # Earlier batches finish later
+            time.sleep(0.05 * (4 - batch_metadata["batch_index"]))
+            with lock:
+                active["now"] -= 1
+            return original_extract(batch_content, query, batch_metadata)
+
+        processor.extract_from_batch = slow_extract
+        items = [f"item-{i:02d}-xxxx" for i in range(4)]
+
+        results, _, successful = processor._process_level(
+            items, "q", config, 0, None, [], []
+        )
+
+        self.assertEqual(successful, 4)
+        self.assertEqual([r.batch_index for r in results], [0, 1, 2, 3])
+        self.assertEqual([r.source_indices for r in results], [[0], [1], [2], [3]])
+        self.assertEqual(active["peak"], 4)
+
+    def test_failure_isolated_to_its_batch(self):
+        """A failing batch should not affect concurrently extracted batches."""
+        config = ProcessingConfig(max_context_chars=20, max_concurrent_batches=3)
+        processor = SimpleTestProcessor(config=config)
+        processor.should_fail_batch = 1
+
+        failed: List[int] = []
+
+        results, _, successful = processor._process_level(
+            ["a" * 15, "b" * 15, "c" * 15], "q", config, 0, None, failed, []
+        )
+
+        self.assertEqual(failed, [1])
+        self.assertEqual(successful, 2)
+        self.assertEqual([r.is_error for r in results], [False, True, False])
+
+    def test_invalid_max_concurrent_batches(self):
+        """Should reject max_concurrent_batches < 1."""
+        with self.assertRaises(ValueError):
+            ProcessingConfig(max_concurrent_batches=0)
+
+
 class TestExtractionResult(unittest.TestCase):
     """Tests for ExtractionResult dataclass."""
 
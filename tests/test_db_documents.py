@@ -0,0 +1,304 @@
+"""Tests for the batched, cached document fetch layer (no database required)."""
+
+import datetime
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import bmlibrarian.db_documents as db_documents
+from bmlibrarian.database import (
+    fetch_documents_by_ids,
+    get_document_details,
+    get_document_details_batch,
+)
+from bmlibrarian.db_documents import (
+    DocumentFetcher,
+    DocumentRow,
+    DocumentRowCache,
+)
+
+COLUMNS = (
+    "id", "title", "abstract", "authors", "publication", "publication_date",
+    "doi", "external_id", "source_id", "url", "pdf_url", "pdf_filename",
+    "full_text", "keywords", "mesh_terms", "updated_date", "source_name",
+)
+
+T0 = datetime.datetime(2024, 1, 1, 12, 0)
+
+
+def _doc(doc_id: int, **overrides: Any) -> Dict[str, Any]:
+    doc = {
+        "id": doc_id,
+        "title": f"Paper {doc_id}",
+        "abstract": "An abstract.",
+        "authors": ["Smith J", "Jones A"],
+        "publication": "BMJ",
+        "publication_date": datetime.date(2020, 1, doc_id % 28 + 1),
+        "doi": None,
+        "external_id": str(30000000 + doc_id),
+        "source_id": 1,
+        "url": None,
+        "pdf_url": None,
+        "pdf_filename": None,
+        "full_text": None,
+        "keywords": None,
+        "mesh_terms": None,
+        "updated_date": T0,
+        "source_name": "pubmed",
+    }
+    doc.update(overrides)
+    return doc
+
+
+class _FakeCursor:
+    """Cursor answering the two db_documents statements from a dict table."""
+
+    def __init__(self, db: "_FakeDatabase", row_factory: Any = None) -> None:
+        self.db = db
+        self.row_factory = row_factory
+        self.description: Optional[List[SimpleNamespace]] = None
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def execute(self, sql: str, params: Tuple[Any, ...], prepare: bool = False) -> None:
+        ids = params[0]
+        self.db.statements.append((sql, list(ids), prepare, self.db.in_pipeline))
+        if sql is db_documents._FRESHNESS_SQL:
+            columns: Tuple[str, ...] = ("id", "updated_date")
+        else:
+            columns = COLUMNS
+        self.description = [SimpleNamespace(name=name) for name in columns]
+        self._rows = [
+            tuple(self.db.table[i][c] for c in columns)
+            for i in ids if i in self.db.table
+        ]
+
+    def fetchall(self) -> List[Any]:
+        if self.row_factory is None:
+            return list(self._rows)
+        make_row = self.row_factory(self)
+        return [make_row(values) for values in self._rows]
+
+    def close(self) -> None:
+        pass
+
+
+class _FakeDatabase:
+    """DatabaseManager stand-in with an in-memory document table."""
+
+    def __init__(self, docs: List[Dict[str, Any]]) -> None:
+        self.table = {doc["id"]: doc for doc in docs}
+        self.statements: List[Tuple[str, List[int], bool, bool]] = []
+        self.connections = 0
+        self.in_pipeline = False
+
+    @contextmanager
+    def get_connection(self):
+        self.connections += 1
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda row_factory=None: _FakeCursor(self, row_factory)
+
+        @contextmanager
+        def pipeline():
+            self.in_pipeline = True
+            try:
+                yield
+            finally:
+                self.in_pipeline = False
+
+        conn.pipeline.side_effect = pipeline
+        yield conn
+
+    @property
+    def row_fetches(self) -> List[List[int]]:
+        return [ids for sql, ids, _, _ in self.statements if sql is db_documents._ROWS_SQL]
+
+
+@pytest.fixture(autouse=True)
+def _pipeline_supported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db_documents.psycopg.Pipeline, "is_supported", lambda: True)
+
+
+# ============================================================================
+# DocumentRow
+# ============================================================================
+
+def test_document_row_is_a_read_only_mapping() -> None:
+    row = DocumentRow.from_mapping({"id": 7, "title": "T", "updated_date": T0})
+
+    assert row["title"] == "T"
+    assert row.get("missing", "x") == "x"
+    assert "title" in row and "missing" not in row
+    assert dict(row) == {"id": 7, "title": "T", "updated_date": T0}
+    assert row.id == 7 and row.updated_date == T0
+    with pytest.raises(TypeError):
+        row["title"] = "changed"  # type: ignore[index]
+
+
+def test_rows_of_one_shape_share_a_layout() -> None:
+    a = DocumentRow.from_mapping({"id": 1, "title": "A"})
+    b = DocumentRow.from_mapping({"id": 2, "title": "B"})
+
+    assert a._layout is b._layout
+    assert not hasattr(a, "__dict__")
+
+
+def test_to_dict_returns_an_independent_copy() -> None:
+    row = DocumentRow.from_mapping({"id": 1, "title": "A"})
+    copy = row.to_dict()
+    copy["title"] = "changed"
+
+    assert row["title"] == "A"
+
+
+# ============================================================================
+# DocumentRowCache
+# ============================================================================
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = DocumentRowCache(max_size=2)
+    cache.put_many(DocumentRow.from_mapping({"id": i}) for i in (1, 2))
+    cache.get_many([1])
+    cache.put_many([DocumentRow.from_mapping({"id": 3})])
+
+    assert sorted(cache.get_many([1, 2, 3])) == [1, 3]
+
+
+def test_zero_size_cache_stores_nothing() -> None:
+    cache = DocumentRowCache(max_size=0)
+    cache.put_many([DocumentRow.from_mapping({"id": 1})])
+
+    assert len(cache) == 0
+
+
+# ============================================================================
+# DocumentFetcher
+# ============================================================================
+
+def test_fetch_uses_prepared_array_statements_in_one_pipeline() -> None:
+    db = _FakeDatabase([_doc(i) for i in range(1, 8)])
+    fetcher = DocumentFetcher(db, chunk_size=3)
+
+    rows = fetcher.fetch_rows([5, 1, 5, 99, 2, 3, 4])
+
+    assert list(rows) == [5, 1, 2, 3, 4]
+    assert isinstance(rows[5], DocumentRow)
+    assert db.connections == 1
+    assert db.row_fetches == [[5, 1, 99], [2, 3, 4]]
+    assert all(prepare and in_pipeline for _, _, prepare, in_pipeline in db.statements)
+
+
+def test_cached_rows_are_validated_not_refetched() -> None:
+    db = _FakeDatabase([_doc(1), _doc(2)])
+    fetcher = DocumentFetcher(db)
+    fetcher.fetch_rows([1])
+    db.statements.clear()
+
+    rows = fetcher.fetch_rows([1, 2])
+
+    assert sorted(rows) == [1, 2]
+    assert db.row_fetches == [[2]]
+    freshness = [ids for sql, ids, _, _ in db.statements if sql is db_documents._FRESHNESS_SQL]
+    assert freshness == [[1]]
+    assert fetcher.cache.hits == 1
+
+
+def test_changed_updated_date_refetches_row() -> None:
+    db = _FakeDatabase([_doc(1)])
+    fetcher = DocumentFetcher(db)
+    fetcher.fetch_rows([1])
+    db.table[1] = _doc(1, title="Corrected", updated_date=T0 + datetime.timedelta(hours=1))
+
+    rows = fetcher.fetch_rows([1])
+
+    assert rows[1]["title"] == "Corrected"
+    assert fetcher.cache.stale == 1
+    assert fetcher.cache.get_many([1])[1]["title"] == "Corrected"
+
+
+def test_deleted_document_is_evicted() -> None:
+    db = _FakeDatabase([_doc(1)])
+    fetcher = DocumentFetcher(db)
+    fetcher.fetch_rows([1])
+    del db.table[1]
+
+    assert fetcher.fetch_rows([1]) == {}
+    assert len(fetcher.cache) == 0
+
+
+def test_unvalidated_cache_skips_database() -> None:
+    db = _FakeDatabase([_doc(1)])
+    fetcher = DocumentFetcher(db, validate_cached=False)
+    fetcher.fetch_rows([1])
+
+    fetcher.fetch_rows([1])
+
+    assert db.connections == 1
+
+
+def test_runs_without_pipeline_support(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(db_documents.psycopg.Pipeline, "is_supported", lambda: False)
+    db = _FakeDatabase([_doc(1), _doc(2)])
+
+    rows = DocumentFetcher(db).fetch_rows([1, 2])
+
+    assert sorted(rows) == [1, 2]
+    assert not any(in_pipeline for _, _, _, in_pipeline in db.statements)
+
+
+# ============================================================================
+# database.py entry points
+# ============================================================================
+
+@pytest.fixture
+def shared_fetcher():
+    """Point the process-wide fetcher at a fake database."""
+    db = _FakeDatabase([
+        _doc(1, publication_date=datetime.date(2019, 5, 1)),
+        _doc(2, publication_date=None),
+        _doc(3, publication_date=datetime.date(2023, 2, 1),
+             authors=["A", "B", "C", "D"], full_text="  body  ", keywords=["k"]),
+    ])
+    fetcher = DocumentFetcher(db)
+    with patch.object(db_documents, "_fetcher", fetcher):
+        yield db
+
+
+def test_fetch_documents_by_ids_orders_newest_first(shared_fetcher) -> None:
+    docs = fetch_documents_by_ids({1, 2, 3})
+
+    assert [d["id"] for d in docs] == [3, 1, 2]
+    assert all(isinstance(d, dict) for d in docs)
+
+
+def test_fetch_documents_by_ids_compact(shared_fetcher) -> None:
+    docs = fetch_documents_by_ids({1, 3}, compact=True)
+
+    assert all(isinstance(d, DocumentRow) for d in docs)
+
+
+def test_document_details_format(shared_fetcher) -> None:
+    doc = get_document_details(3)
+
+    assert doc["authors"] == "A, B, C, et al."
+    assert doc["authors_list"] == ["A", "B", "C", "D"]
+    assert doc["journal"] == "BMJ"
+    assert doc["year"] == 2023
+    assert doc["publication_date"] == "2023-02-01"
+    assert doc["pmid"] == "30000003"
+    assert doc["mesh_terms"] == [] and doc["keywords"] == ["k"]
+    assert doc["has_full_text"] is True
+
+
+def test_document_details_missing_returns_none(shared_fetcher) -> None:
+    assert get_document_details(404) is None
+
+
+def test_document_details_batch_is_one_round_trip(shared_fetcher) -> None:
+    details = get_document_details_batch([1, 2, 3, 404])
+
+    assert sorted(details) == [1, 2, 3]
+    assert details[2]["year"] is None
+    assert shared_fetcher.connections == 1
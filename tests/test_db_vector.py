@@ -0,0 +1,92 @@
+"""Tests for binary pgvector transfer helpers (no database required)."""
+
+import struct
+from types import SimpleNamespace
+
+import numpy as np
+import psycopg
+import pytest
+from psycopg.adapt import AdaptersMap, PyFormat
+from psycopg.types import TypeInfo
+
+import bmlibrarian.db_vector as db_vector
+from bmlibrarian.db_vector import (
+    VectorParam,
+    encode_vector_binary,
+    format_vector_literal,
+    register_vector_adapters,
+    to_vector_array,
+    vector_param,
+)
+
+VECTOR_OID = 91234
+
+
+def _fake_conn() -> SimpleNamespace:
+    """Connection stand-in with real psycopg adapters."""
+    return SimpleNamespace(adapters=AdaptersMap(psycopg.adapters))
+
+
+def test_binary_encoding_matches_pgvector_wire_format() -> None:
+    """int16 dims, int16 unused, then big-endian float32 values."""
+    payload = encode_vector_binary([1.0, -2.5, 0.25])
+
+    dims, unused = struct.unpack(">HH", payload[:4])
+    assert (dims, unused) == (3, 0)
+    assert struct.unpack(">3f", payload[4:]) == (1.0, -2.5, 0.25)
+
+
+def test_binary_payload_is_smaller_than_text() -> None:
+    """A 1024-dim vector is ~4 KB binary versus far more as text."""
+    vector = np.random.default_rng(0).standard_normal(1024).tolist()
+
+    assert len(encode_vector_binary(vector)) == 4 + 4 * 1024
+    assert len(format_vector_literal(vector)) > 3 * len(encode_vector_binary(vector))
+
+
+def test_rejects_non_vector_shapes() -> None:
+    with pytest.raises(ValueError, match="1-D"):
+        to_vector_array([[1.0, 2.0]])
+
+
+def test_register_adds_binary_dumper(monkeypatch: pytest.MonkeyPatch) -> None:
+    """VectorParams dump as binary with the database's vector OID."""
+    info = TypeInfo("vector", VECTOR_OID, 0)
+    monkeypatch.setattr(db_vector, "_fetch_type_info", lambda conn: info)
+    conn = _fake_conn()
+
+    assert register_vector_adapters(conn)
+
+    param = vector_param(conn, [0.5, 0.5])
+    assert isinstance(param, VectorParam) and param.array.dtype == np.float32
+    dumper = conn.adapters.get_dumper(VectorParam, PyFormat.BINARY)(VectorParam)
+    assert dumper.oid == VECTOR_OID
+    assert dumper.dump(param) == encode_vector_binary([0.5, 0.5])
+    by_oid = conn.adapters.get_dumper_by_oid(VECTOR_OID, psycopg.pq.Format.BINARY)
+    assert by_oid(list).dump([1.0]) == encode_vector_binary([1.0])
+
+
+def test_register_leaves_plain_arrays_alone(monkeypatch: pytest.MonkeyPatch) -> None:
+    """numpy arrays from unrelated code keep psycopg's default adaptation."""
+    monkeypatch.setattr(db_vector, "_fetch_type_info",
+                        lambda conn: TypeInfo("vector", VECTOR_OID, 0))
+    conn = _fake_conn()
+    default = AdaptersMap(psycopg.adapters)
+
+    assert register_vector_adapters(conn)
+
+    for fmt in (PyFormat.AUTO, PyFormat.BINARY, PyFormat.TEXT):
+        try:
+            expected = default.get_dumper(np.ndarray, fmt)
+        except psycopg.ProgrammingError:
+            with pytest.raises(psycopg.ProgrammingError):
+                conn.adapters.get_dumper(np.ndarray, fmt)
+        else:
+            assert conn.adapters.get_dumper(np.ndarray, fmt) is expected
+
+
+def test_falls_back_to_text_without_extension(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without pgvector's type the literal text form is used."""
+    monkeypatch.setattr(db_vector, "_fetch_type_info", lambda conn: None)
+
+    assert vector_param(_fake_conn(), [1.0, 2.0]) == "[1.0,2.0]"
@@ -0,0 +1,432 @@
+"""
+Tests for the distributed evaluation work queue and scoring worker.
+
+Hermetic: the database is mocked and the work queue is replaced with an
+in-memory fake where worker behaviour is under test; no PostgreSQL or
+Ollama required.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from bmlibrarian.agents.systematic_review import (
+    BatchScoringResult,
+    DistributedScoringWorker,
+    InclusionDecision,
+    InclusionStatus,
+    ExclusionStage,
+    PaperData,
+    ScoredPaper,
+    SystematicReviewConfig,
+)
+from bmlibrarian.evaluations import (
+    CheckpointType,
+    EvaluationStore,
+    EvaluationType,
+    LeaseRecovery,
+    RunWorkQueue,
+    WorkQueueStatus,
+)
+
+
+def _mock_db(fetchall: Optional[List[Any]] = None) -> Mock:
+    """Create a mock DatabaseManager whose cursor returns ``fetchall``."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = fetchall or []
+    cursor.fetchone.return_value = (1,)
+    cursor.rowcount = len(fetchall or [])
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    db = Mock()
+    db.get_connection = MagicMock()
+    db.get_connection.return_value.__enter__.return_value = conn
+    db.cursor = cursor
+    db.conn = conn
+    return db
+
+
+# ============================================================================
+# EvaluationStore.save_evaluations_batch
+# ============================================================================
+
+class TestSaveEvaluationsBatch:
+    """Batch saves share one connection and one commit."""
+
+    def test_single_commit_for_batch(self) -> None:
+        db = _mock_db()
+        db.cursor.fetchone.side_effect = [(10,), (11,), (12,)]
+        store = EvaluationStore(db)
+
+        ids = store.save_evaluations_batch(
+            run_id=1,
+            evaluations=[
+                {"document_id": d, "evaluation_data": {"score": 4, "rationale": "x"},
+                 "evaluator_id": 7}
+                for d in (101, 102, 103)
+            ],
+            evaluation_type=EvaluationType.RELEVANCE_SCORE,
+        )
+
+        assert ids == [10, 11, 12]
+        assert db.get_connection.call_count == 1
+        assert db.conn.commit.call_count == 1
+        first_params = db.cursor.execute.call_args_list[0][0][1]
+        assert first_params[1] == 101
+        assert first_params[3] == 4.0  # primary score extracted from data
+        assert first_params[5] == 7
+
+    def test_validation_fails_before_any_write(self) -> None:
+        db = _mock_db()
+        store = EvaluationStore(db)
+
+        with pytest.raises(ValueError, match="doc=102"):
+            store.save_evaluations_batch(
+                run_id=1,
+                evaluations=[
+                    {"document_id": 101, "evaluation_data": {"score": 4}},
+                    {"document_id": 102, "evaluation_data": {"rationale": "no score"}},
+                ],
+                evaluation_type=EvaluationType.RELEVANCE_SCORE,
+            )
+
+        db.get_connection.assert_not_called()
+
+
+# ============================================================================
+# RunWorkQueue
+# ============================================================================
+
+class TestRunWorkQueue:
+    """SQL-level behaviour of the work queue with a mocked database."""
+
+    def test_rejects_non_positive_lease(self) -> None:
+        with pytest.raises(ValueError):
+            RunWorkQueue(EvaluationStore(_mock_db()), lease_seconds=0)
+
+    def test_claim_uses_skip_locked_and_sorts(self) -> None:
+        db = _mock_db(fetchall=[(30,), (10,), (20,)])
+        queue = RunWorkQueue(EvaluationStore(db), worker_id="w1", lease_seconds=60)
+
+        claimed = queue.claim_documents(5, EvaluationType.RELEVANCE_SCORE, limit=3)
+
+        assert claimed == [10, 20, 30]
+        sql, params = db.cursor.execute.call_args[0]
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert params[:5] == (5, "relevance_score", 3, "w1", 60)
+        db.conn.commit.assert_called_once()
+
+    def test_claim_with_zero_limit_skips_database(self) -> None:
+        db = _mock_db()
+        queue = RunWorkQueue(EvaluationStore(db))
+
+        assert queue.claim_documents(5, EvaluationType.RELEVANCE_SCORE, limit=0) == []
+        db.get_connection.assert_not_called()
+
+    def test_complete_saves_before_marking_done(self) -> None:
+        db = _mock_db()
+        store = EvaluationStore(db)
+        calls: List[str] = []
+        store.save_evaluations_batch = Mock(
+            side_effect=lambda **kwargs: calls.append("save") or [1]
+        )
+        db.cursor.execute.side_effect = lambda *args: calls.append("mark_done")
+        queue = RunWorkQueue(store)
+
+        queue.complete_documents(
+            5,
+            EvaluationType.RELEVANCE_SCORE,
+            [{"document_id": 101, "evaluation_data": {"score": 3}}],
+        )
+
+        assert calls == ["save", "mark_done"]
+
+    def test_recovery_records_checkpoint(self) -> None:
+        db = _mock_db(fetchall=[("pending",), ("done",), ("failed",), ("pending",)])
+        store = EvaluationStore(db)
+        store.save_checkpoint = Mock(return_value=1)
+        queue = RunWorkQueue(store, worker_id="w1")
+
+        recovery = queue.recover_abandoned_leases(5, EvaluationType.RELEVANCE_SCORE)
+
+        assert recovery == LeaseRecovery(requeued=2, completed=1, failed=1)
+        sql = db.cursor.execute.call_args[0][0]
+        assert "get_unevaluated_documents" in sql
+        kwargs = store.save_checkpoint.call_args.kwargs
+        assert kwargs["checkpoint_type"] == CheckpointType.CUSTOM
+        assert kwargs["checkpoint_data"]["requeued"] == 2
+
+    def test_recovery_without_expired_leases_is_silent(self) -> None:
+        store = EvaluationStore(_mock_db(fetchall=[]))
+        store.save_checkpoint = Mock()
+        queue = RunWorkQueue(store)
+
+        recovery = queue.recover_abandoned_leases(5, EvaluationType.RELEVANCE_SCORE)
+
+        assert recovery.total == 0
+        store.save_checkpoint.assert_not_called()
+
+    def test_status_counts(self) -> None:
+        db = _mock_db(fetchall=[("pending", 4, 0), ("claimed", 2, 1), ("done", 10, 0)])
+        queue = RunWorkQueue(EvaluationStore(db))
+
+        status = queue.get_status(5, EvaluationType.RELEVANCE_SCORE)
+
+        assert (status.pending, status.claimed, status.done) == (4, 2, 10)
+        assert status.expired_leases == 1
+        assert status.remaining == 6
+        assert not status.is_drained
+
+
+# ============================================================================
+# DistributedScoringWorker
+# ============================================================================
+
+class _FakeQueue:
+    """In-memory stand-in for RunWorkQueue shared by several workers."""
+
+    def __init__(self, document_ids: List[int]) -> None:
+        self.lock = threading.Lock()
+        self.pending = list(document_ids)
+        self.claimed: Dict[int, str] = {}
+        self.done: Dict[int, Dict[str, Any]] = {}
+        self.failed: List[int] = []
+
+    def view(self, worker_id: str) -> "_QueueView":
+        return _QueueView(self, worker_id)
+
+
+class _QueueView:
+    """One worker's handle on a _FakeQueue (mirrors RunWorkQueue's API)."""
+
+    lease_seconds = 300
+
+    def __init__(self, shared: _FakeQueue, worker_id: str) -> None:
+        self.shared = shared
+        self.worker_id = worker_id
+
+    def claim_documents(self, run_id, evaluation_type, limit=8) -> List[int]:
+        with self.shared.lock:
+            batch, self.shared.pending = self.shared.pending[:limit], self.shared.pending[limit:]
+            for doc_id in batch:
+                self.shared.claimed[doc_id] = self.worker_id
+            return batch
+
+    def complete_documents(self, run_id, evaluation_type, evaluations, validate=True):
+        with self.shared.lock:
+            for evaluation in evaluations:
+                self.shared.claimed.pop(evaluation["document_id"], None)
+                self.shared.done[evaluation["document_id"]] = evaluation
+        return list(range(len(evaluations)))
+
+    def release_documents(self, run_id, evaluation_type, document_ids, error=None) -> int:
+        with self.shared.lock:
+            for doc_id in document_ids:
+                self.shared.claimed.pop(doc_id, None)
+                self.shared.failed.append(doc_id)
+        return len(document_ids)
+
+    def recover_abandoned_leases(self, run_id, evaluation_type) -> LeaseRecovery:
+        return LeaseRecovery()
+
+    def get_status(self, run_id, evaluation_type) -> WorkQueueStatus:
+        with self.shared.lock:
+            return WorkQueueStatus(
+                pending=len(self.shared.pending),
+                claimed=len(self.shared.claimed),
+                done=len(self.shared.done),
+                failed=len(self.shared.failed),
+            )
+
+    def sync_run_progress(self, run_id, evaluation_type) -> WorkQueueStatus:
+        return self.get_status(run_id, evaluation_type)
+
+    def heartbeat(self, run_id=None) -> int:
+        return 0
+
+
+def _paper(doc_id: int) -> PaperData:
+    return PaperData(document_id=doc_id, title=f"Paper {doc_id}", authors=[], year=2020)
+
+
+def _scorer() -> Mock:
+    """RelevanceScorer double that scores every paper 4."""
+    def score_batch(papers, evaluate_inclusion=True):
+        return BatchScoringResult(
+            scored_papers=[
+                ScoredPaper(
+                    paper=paper,
+                    relevance_score=4.0,
+                    relevance_rationale="relevant",
+                    inclusion_decision=InclusionDecision(
+                        status=InclusionStatus.INCLUDED,
+                        stage=ExclusionStage.RELEVANCE_SCORING,
+                        reasons=[],
+                        rationale="meets criteria",
+                    ),
+                    processing_time_ms=5,
+                )
+                for paper in papers
+            ],
+            failed_papers=[],
+            total_processed=len(papers),
+            execution_time_seconds=0.0,
+            average_score=4.0,
+        )
+
+    scorer = Mock()
+    scorer.score_batch.side_effect = score_batch
+    return scorer
+
+
+def _worker(shared: _FakeQueue, worker_id: str, loader=None) -> DistributedScoringWorker:
+    worker = DistributedScoringWorker(
+        store=EvaluationStore(_mock_db()),
+        run_id=5,
+        scorer=_scorer(),
+        evaluator_id=7,
+        config=SystematicReviewConfig(worker_claim_batch_size=3, worker_poll_interval=0.01),
+        paper_loader=loader or (lambda ids: {d: _paper(d) for d in ids}),
+    )
+    worker.queue = shared.view(worker_id)
+    return worker
+
+
+class TestDistributedScoringWorker:
+    """Worker loop behaviour against an in-memory queue."""
+
+    def test_drains_queue_in_claim_batches(self) -> None:
+        shared = _FakeQueue(list(range(1, 8)))
+        worker = _worker(shared, "w1")
+
+        result = worker.run()
+
+        assert result.scored == 7
+        assert result.batches == 3
+        assert sorted(shared.done) == list(range(1, 8))
+        saved = shared.done[1]
+        assert saved["evaluator_id"] == 7
+        assert saved["evaluation_data"]["inclusion_decision"] == "included"
+
+    def test_missing_documents_are_released(self) -> None:
+        shared = _FakeQueue([1, 2, 3])
+        worker = _worker(shared, "w1", loader=lambda ids: {d: _paper(d) for d in ids if d != 2})
+
+        result = worker.run()
+
+        assert result.scored == 2
+        assert result.failed == 1
+        assert shared.failed == [2]
+
+    def test_workers_share_a_run_without_overlap(self) -> None:
+        shared = _FakeQueue(list(range(1, 41)))
+        workers = [_worker(shared, f"w{i}") for i in range(4)]
+        results: List[Any] = []
+
+        threads = [
+            threading.Thread(target=lambda w=w: results.append(w.run()))
+            for w in workers
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        assert sum(r.scored for r in results) == 40
+        assert sorted(shared.done) == list(range(1, 41))
+
+    def test_waits_for_other_workers_claims(self) -> None:
+        shared = _FakeQueue([])
+        shared.claimed[99] = "other"
+        worker = _worker(shared, "w1")
+
+        def finish_other() -> None:
+            with shared.lock:
+                shared.claimed.pop(99)
+                shared.done[99] = {}
+
+        timer = threading.Timer(0.05, finish_other)
+        timer.start()
+        result = worker.run(wait_for_others=True)
+        timer.join()
+
+        assert result.scored == 0
+        assert 99 in shared.done
+
+    def test_waits_when_pending_rows_cannot_be_claimed(self) -> None:
+        """Pending rows locked by another claim are retried after the poll interval."""
+        shared = _FakeQueue([])
+        worker = _worker(shared, "w1")
+        locked_status = WorkQueueStatus(pending=1)
+        statuses = [locked_status, locked_status, WorkQueueStatus(done=1)]
+        worker.queue.get_status = lambda run_id, evaluation_type: statuses.pop(0)
+        waits: List[float] = []
+
+        class _StopEvent:
+            def is_set(self) -> bool:
+                return False
+
+            def wait(self, timeout: float) -> bool:
+                waits.append(timeout)
+                return False
+
+        worker.run(stop_event=_StopEvent())
+
+        assert waits == [0.01, 0.01]
+
+    def test_no_wait_returns_when_nothing_to_claim(self) -> None:
+        shared = _FakeQueue([])
+        shared.claimed[99] = "other"
+        worker = _worker(shared, "w1")
+
+        result = worker.run(wait_for_others=False)
+
+        assert result.batches == 0
+
+
+class TestAgentDistributedScoring:
+    """SystematicReviewAgent._score_papers_distributed paper loading."""
+
+    def test_claimed_papers_missing_from_run_are_loaded_from_db(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from bmlibrarian.agents.systematic_review import agent as agent_module
+        from bmlibrarian.agents.systematic_review import distributed
+
+        captured: Dict[str, Any] = {}
+
+        class _Worker:
+            def __init__(self, **kwargs: Any) -> None:
+                captured.update(kwargs)
+
+            def enqueue(self, document_ids: List[int]) -> int:
+                return len(document_ids)
+
+            def run(self, wait_for_others: bool = True) -> str:
+                return "done"
+
+        db_calls: List[List[int]] = []
+
+        def load_from_db(document_ids: List[int]) -> Dict[int, PaperData]:
+            db_calls.append(list(document_ids))
+            return {d: _paper(d) for d in document_ids}
+
+        monkeypatch.setattr(distributed, "DistributedScoringWorker", _Worker)
+        monkeypatch.setattr(distributed, "load_papers", load_from_db)
+
+        agent = agent_module.SystematicReviewAgent.__new__(agent_module.SystematicReviewAgent)
+        agent._evaluation_run = Mock(run_id=5)
+        agent._evaluation_store = Mock()
+        agent._evaluator_id = 7
+        agent.config = SystematicReviewConfig()
+        agent.callback = None
+
+        assert agent._score_papers_distributed([_paper(1), _paper(2)], _scorer()) == "done"
+
+        loaded = captured["paper_loader"]([1, 3, 4])
+
+        assert sorted(loaded) == [1, 3, 4]
+        assert loaded[1].title == "Paper 1"
+        assert db_calls == [[3, 4]]
@@ -15,6 +15,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 from bmlib.llm import (
+    BatchEmbeddingResponse as BmlibBatchEmbeddingResponse,
     EmbeddingResponse as BmlibEmbeddingResponse,
     LLMResponse as BmlibResponse,
 )
@@ -44,6 +45,14 @@ def llm_response(content: str) -> BmlibResponse:
     )
 
 
+def batch_embeddings(*vectors) -> BmlibBatchEmbeddingResponse:
+    """Build a bmlib batch embedding response with the given vectors."""
+    return BmlibBatchEmbeddingResponse(
+        embeddings=[list(v) for v in vectors], model="test-embedding",
+        dimensions=len(vectors[0]),
+    )
+
+
 class TestDocumentInterrogationAgentLLMIntegration:
     """
     Exercise the agent against the real LLMClient.
@@ -167,15 +176,15 @@ class TestDatabaseChunkStateIsolation:
                 show_model_info=False,
             )
 
-    @patch('bmlib.llm.client.LLMClient.embed')
+    @patch('bmlib.llm.client.LLMClient.embed_batch')
     @patch('bmlib.llm.client.LLMClient.chat')
     def test_text_call_does_not_reuse_previous_document_embeddings(
-        self, mock_chat, mock_embed, agent,
+        self, mock_chat, mock_embed_batch, agent,
     ):
         """A document_text call must embed its own chunks, not inherited ones."""
         mock_chat.return_value = llm_response('[]')
-        mock_embed.return_value = BmlibEmbeddingResponse(
-            embedding=[0.1, 0.2, 0.3], model="test-embedding", dimensions=3,
+        mock_embed_batch.side_effect = lambda texts, model, **kwargs: batch_embeddings(
+            *([0.1, 0.2, 0.3] for _ in texts)
         )
 
         db_chunks = [
@@ -290,6 +299,12 @@ class TestDocumentInterrogationAgent:
         with patch('bmlib.llm.client.LLMClient.embed') as mock:
             yield mock
 
+    @pytest.fixture
+    def mock_embed_batch(self):
+        """Stub bmlib's embed_batch, keeping bmlibrarian's LLMClient in the path."""
+        with patch('bmlib.llm.client.LLMClient.embed_batch') as mock:
+            yield mock
+
     @pytest.fixture
     def agent(self, mock_chat):
         """Create a DocumentInterrogationAgent with a stubbed LLM backend."""
@@ -400,45 +415,79 @@ class TestDocumentInterrogationAgent:
         assert result.chunks_total >= 1
         assert result.confidence == 0.85
 
-    def test_cosine_similarity_identical_vectors(self, agent):
-        """Test cosine similarity with identical vectors."""
-        vec1 = [1.0, 2.0, 3.0, 4.0]
-        vec2 = [1.0, 2.0, 3.0, 4.0]
-
-        similarity = agent._cosine_similarity(vec1, vec2)
-        assert abs(similarity - 1.0) < 0.0001  # Should be 1.0
-
-    def test_cosine_similarity_orthogonal_vectors(self, agent):
-        """Test cosine similarity with orthogonal vectors."""
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [0.0, 1.0, 0.0]
+    @staticmethod
+    def _similarities(agent, mock_embed_batch, question_vector, *chunk_vectors):
+        """Score chunks against a question through the vectorized embedding path."""
+        chunks = [
+            TextChunk(content=f"chunk {i}", start_pos=0, end_pos=7, chunk_index=i,
+                      total_chunks=len(chunk_vectors))
+            for i in range(len(chunk_vectors))
+        ]
+        agent._db_chunks = None
+        agent._chunk_cache_key = None
+        mock_embed_batch.return_value = batch_embeddings(question_vector, *chunk_vectors)
 
-        similarity = agent._cosine_similarity(vec1, vec2)
-        assert abs(similarity - 0.0) < 0.0001  # Should be 0.0
+        question, matrix = agent._embed_question_and_chunks(chunks, "Question?")
 
-    def test_cosine_similarity_opposite_vectors(self, agent):
-        """Test cosine similarity with opposite vectors."""
-        vec1 = [1.0, 2.0, 3.0]
-        vec2 = [-1.0, -2.0, -3.0]
+        return (matrix @ question).tolist()
 
-        similarity = agent._cosine_similarity(vec1, vec2)
-        assert abs(similarity - (-1.0)) < 0.0001  # Should be -1.0
+    def test_similarity_identical_vectors(self, agent, mock_embed_batch):
+        """Identical vectors score 1."""
+        (similarity,) = self._similarities(
+            agent, mock_embed_batch, [1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0]
+        )
+        assert abs(similarity - 1.0) < 0.0001
 
-    def test_cosine_similarity_different_lengths_raises_error(self, agent):
-        """Test that cosine similarity with different length vectors raises error."""
-        vec1 = [1.0, 2.0, 3.0]
-        vec2 = [1.0, 2.0]
+    def test_similarity_orthogonal_and_opposite_vectors(self, agent, mock_embed_batch):
+        """Orthogonal vectors score 0 and opposite vectors -1."""
+        orthogonal, opposite = self._similarities(
+            agent, mock_embed_batch, [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [-1.0, 0.0, 0.0]
+        )
+        assert abs(orthogonal) < 0.0001
+        assert abs(opposite + 1.0) < 0.0001
 
-        with pytest.raises(ValueError, match="Vectors must have same length"):
-            agent._cosine_similarity(vec1, vec2)
+    def test_similarity_zero_vector(self, agent, mock_embed_batch):
+        """A zero chunk vector scores 0 instead of dividing by zero."""
+        (similarity,) = self._similarities(
+            agent, mock_embed_batch, [1.0, 2.0, 3.0], [0.0, 0.0, 0.0]
+        )
+        assert similarity == 0.0
+
+    def test_stored_embedding_dimension_mismatch_raises_error(self, agent, mock_embed_batch):
+        """A stored chunk embedding of the wrong size is rejected."""
+        chunks = [TextChunk(content="chunk", start_pos=0, end_pos=5, chunk_index=0,
+                            total_chunks=1)]
+        agent._db_chunks = [DatabaseChunk(chunk_id=1, text="chunk", chunk_no=0,
+                                          embedding=[1.0, 2.0])]
+        agent._chunk_cache_key = None
+        mock_embed_batch.return_value = batch_embeddings([1.0, 2.0, 3.0])
+
+        with pytest.raises(ValueError, match="2 dimensions"):
+            agent._embed_question_and_chunks(chunks, "Question?")
+
+    def test_embeddings_use_configured_model(self, agent, mock_embed_batch):
+        """The configured embedding model reaches the backend, Ollama-qualified."""
+        self._similarities(agent, mock_embed_batch, [1.0, 0.0], [0.0, 1.0])
+
+        assert mock_embed_batch.call_args.kwargs["model"] == "ollama:test-embedding"
+
+    def test_chunk_embedding_cache_is_per_model(self, agent, mock_chat, mock_embed_batch):
+        """Switching embedding models re-embeds the chunks."""
+        mock_embed_batch.side_effect = [
+            batch_embeddings([1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.1, 0.9, 0.0]),
+            batch_embeddings([1.0, 0.0], [0.9, 0.1], [0.1, 0.9]),
+        ]
+        mock_chat.return_value = llm_response('[]')
+        document = "A" * 150
 
-    def test_cosine_similarity_zero_vectors(self, agent):
-        """Test cosine similarity with zero vectors."""
-        vec1 = [0.0, 0.0, 0.0]
-        vec2 = [1.0, 2.0, 3.0]
+        agent.process_document(question="First?", document_text=document,
+                               mode=ProcessingMode.EMBEDDING)
+        agent.embedding_model = "other-embedding"
+        agent.process_document(question="First?", document_text=document,
+                               mode=ProcessingMode.EMBEDDING)
 
-        similarity = agent._cosine_similarity(vec1, vec2)
-        assert similarity == 0.0  # Should handle division by zero
+        texts = [call.kwargs["texts"] for call in mock_embed_batch.call_args_list]
+        assert [len(batch) for batch in texts] == [3, 3]
 
     def test_extract_relevant_sections_valid_json(self, agent, mock_chat):
         """Test extracting relevant sections with valid JSON response."""
@@ -612,30 +661,14 @@ class TestDocumentInterrogationAgent:
                 mode="invalid_mode"  # This will fail type checking, but test runtime behavior
             )
 
-    def test_get_embedding(self, agent, mock_embed):
-        """Test getting embeddings from LLM."""
-        mock_embed.return_value = BmlibEmbeddingResponse(
-            embedding=[0.1, 0.2, 0.3, 0.4, 0.5],
-            model="test-embedding",
-            dimensions=5,
-        )
-
-        embedding = agent._get_embedding("Test text")
-
-        assert embedding == [0.1, 0.2, 0.3, 0.4, 0.5]
-        # The configured embedding model must reach the backend, Ollama-qualified.
-        assert mock_embed.call_args.kwargs["model"] == "ollama:test-embedding"
-
-    def test_process_with_embeddings_mode(self, agent, mock_chat, mock_embed):
+    def test_process_with_embeddings_mode(self, agent, mock_chat, mock_embed_batch):
         """Test document processing with embedding-based mode."""
-        mock_embed.side_effect = [
-            BmlibEmbeddingResponse(embedding=e, model="test-embedding", dimensions=3)
-            for e in (
-                [1.0, 0.0, 0.0],  # Question embedding
-                [0.9, 0.1, 0.0],  # Chunk 1 (high similarity)
-                [0.1, 0.9, 0.0],  # Chunk 2 (low similarity)
-            )
-        ]
+        # Question and both chunks are embedded in one batch request
+        mock_embed_batch.return_value = batch_embeddings(
+            [1.0, 0.0, 0.0],  # Question embedding
+            [0.9, 0.1, 0.0],  # Chunk 1 (high similarity)
+            [0.1, 0.9, 0.0],  # Chunk 2 (low similarity)
+        )
 
         mock_chat.side_effect = [
             llm_response('[{"text": "Found it!", "relevance_score": 0.9, "reasoning": "Match"}]'),
@@ -652,6 +685,38 @@ class TestDocumentInterrogationAgent:
 
         assert isinstance(result, DocumentAnswer)
         assert result.processing_mode == ProcessingMode.EMBEDDING
+        assert mock_embed_batch.call_count == 1
+        # Only chunk 1 clears the 0.5 threshold: one extraction + synthesis
+        assert mock_chat.call_count == 2
+
+    def test_follow_up_question_reuses_chunk_embeddings(self, agent, mock_chat, mock_embed_batch):
+        """A second question on the same text embeds only the question."""
+        mock_embed_batch.side_effect = [
+            batch_embeddings([1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.1, 0.9, 0.0]),
+            batch_embeddings([0.0, 1.0, 0.0]),
+        ]
+        mock_chat.return_value = llm_response('[]')
+        document = "A" * 150
+
+        agent.process_document(question="First?", document_text=document,
+                               mode=ProcessingMode.EMBEDDING)
+        agent.process_document(question="Second?", document_text=document,
+                               mode=ProcessingMode.EMBEDDING)
+
+        texts = [call.kwargs["texts"] for call in mock_embed_batch.call_args_list]
+        assert len(texts[0]) == 3
+        assert texts[1] == ["Second?"]
+
+    def test_embedding_selection_ranks_and_limits_chunks(self, agent):
+        """Chunks above threshold are returned best first, capped at max_sections."""
+        from bmlibrarian.agents.document_interrogation_agent import _top_k_above_threshold
+        import numpy as np
+
+        scores = np.array([0.6, 0.9, 0.2, 0.9, 0.7], dtype=np.float32)
+
+        assert _top_k_above_threshold(scores, 0.5, 3) == [1, 3, 4]
+        assert _top_k_above_threshold(scores, 0.5, 10) == [1, 3, 4, 0]
+        assert _top_k_above_threshold(scores, 0.95, 3) == []
 
     @patch("bmlibrarian.llm.client.LLMClient.test_provider", return_value=True)
     @patch("bmlibrarian.llm.client.LLMClient.list_models")
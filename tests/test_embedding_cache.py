@@ -0,0 +1,167 @@
+"""
+Tests for the persistent embedding cache.
+
+The cache lives in a temporary SQLite file per test. LLMClient tests patch
+the bmlib provider boundary, as in test_llm_embed_batch.py, so model
+normalization and usage tracking stay live.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import bmlib.llm.client as _bmlib_llm_client
+from bmlib.llm import BatchEmbeddingResponse as BmlibBatchEmbeddingResponse
+from bmlib.llm import EmbeddingResponse as BmlibEmbeddingResponse
+
+from bmlibrarian.embeddings.embedding_server import EmbeddingServer
+from bmlibrarian.llm import LLMClient, TokenTracker
+from bmlibrarian.llm.embedding_cache import EmbeddingCache, normalize_text, text_key
+
+MODEL = "snowflake-arctic-embed2:latest"
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> EmbeddingCache:
+    """A fresh cache in a temporary file."""
+    cache = EmbeddingCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache storage, eviction and statistics."""
+
+    def test_round_trip_ignores_whitespace_differences(self, cache: EmbeddingCache) -> None:
+        """Texts that normalize identically share one entry."""
+        cache.put(MODEL, "heart  failure\n", [0.5, 0.25])
+
+        assert cache.get(MODEL, " heart failure") == [0.5, 0.25]
+        assert normalize_text("a \t b ") == "a b"
+        assert text_key("a  b") == text_key("a b")
+
+    def test_models_do_not_share_entries(self, cache: EmbeddingCache) -> None:
+        """The same text under another model is a miss."""
+        cache.put(MODEL, "text", [1.0])
+
+        assert cache.get("other-model", "text") is None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Vectors survive closing and reopening the cache file."""
+        path = tmp_path / "cache.sqlite"
+        first = EmbeddingCache(path)
+        first.put(MODEL, "text", [1.0, 2.0])
+        first.close()
+
+        second = EmbeddingCache(path)
+        assert second.get(MODEL, "text") == [1.0, 2.0]
+        assert second.get_stats().entries == 1
+        second.close()
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Exceeding max_entries drops the entries read longest ago."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite", max_entries=3)
+        for name in ("a", "b", "c"):
+            cache.put(MODEL, name, [1.0])
+        cache.get(MODEL, "a")  # refresh "a" so "b" is now oldest
+
+        cache.put(MODEL, "d", [1.0])
+
+        assert cache.get(MODEL, "b") is None
+        assert cache.get(MODEL, "a") == [1.0]
+        stats = cache.get_stats()
+        assert stats.evictions >= 1
+        assert stats.entries <= 3
+        cache.close()
+
+    def test_get_or_compute_only_computes_misses(self, cache: EmbeddingCache) -> None:
+        """Cached and repeated texts are not passed to the backend."""
+        cache.put(MODEL, "cached", [1.0])
+        compute = MagicMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+
+        vectors = cache.get_or_compute(MODEL, ["cached", "new", "new"], compute)
+
+        assert vectors == [[1.0], [3.0], [3.0]]
+        compute.assert_called_once_with(["new"])
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_failed_embeddings_are_not_cached(self, cache: EmbeddingCache) -> None:
+        """A None from the backend is returned but not stored."""
+        cache.get_or_compute(MODEL, ["text"], lambda texts: [None])
+
+        assert cache.get_stats().entries == 0
+
+
+class TestLLMClientCache:
+    """Tests for LLMClient embedding through the cache."""
+
+    def test_embed_batch_sends_only_misses(self, cache: EmbeddingCache) -> None:
+        """A second batch reuses cached vectors and records no usage for them."""
+        tracker = TokenTracker()
+        client = LLMClient(track_usage=False, embedding_cache=cache)
+        client._token_tracker = tracker
+        cache.put(MODEL, "seen", [0.5, 0.5])
+
+        with patch.object(
+            _bmlib_llm_client.LLMClient,
+            "embed_batch",
+            return_value=BmlibBatchEmbeddingResponse(
+                embeddings=[[0.25, 0.75]], model=MODEL, dimensions=2, input_tokens=4,
+            ),
+        ) as mock_batch:
+            response = client.embed_batch(["seen", "unseen"], model=MODEL)
+
+        assert mock_batch.call_args.kwargs["texts"] == ["unseen"]
+        assert response.embeddings == [[0.5, 0.5], [0.25, 0.75]]
+        assert response.cache_hits == 1
+
+        with patch.object(_bmlib_llm_client.LLMClient, "embed_batch") as mock_batch:
+            response = client.embed_batch(["seen", "unseen"], model=MODEL)
+
+        mock_batch.assert_not_called()
+        assert response.cache_hits == 2
+        assert tracker.get_summary().request_count == 1
+
+    def test_embed_hit_skips_provider(self, cache: EmbeddingCache) -> None:
+        """embed() on a cached text returns without contacting the provider."""
+        client = LLMClient(track_usage=False, embedding_cache=cache)
+        with patch.object(
+            _bmlib_llm_client.LLMClient,
+            "embed",
+            return_value=BmlibEmbeddingResponse(
+                embedding=[0.5, 0.5], model=MODEL, dimensions=2, input_tokens=1,
+            ),
+        ) as mock_embed:
+            first = client.embed("query", model=f"ollama:{MODEL}")
+            second = client.embed("query", model=MODEL)
+
+        assert mock_embed.call_count == 1
+        assert not first.cached and second.cached
+        assert second.embedding == [0.5, 0.5]
+        assert client.get_embedding_cache_stats()["hits"] == 1
+
+    def test_cache_can_be_disabled(self, cache: EmbeddingCache) -> None:
+        """use_embedding_cache=False bypasses an explicitly supplied cache."""
+        client = LLMClient(
+            track_usage=False, embedding_cache=cache, use_embedding_cache=False,
+        )
+
+        assert client.get_embedding_cache_stats() is None
+
+
+def test_embedding_server_checks_cache(cache: EmbeddingCache) -> None:
+    """EmbeddingServer only posts texts missing from the cache."""
+    server = EmbeddingServer(model=MODEL, use_embedding_cache=False)
+    server._embedding_cache = cache
+    cache.put(MODEL, "seen", [1.0])
+    reply = MagicMock(status_code=200)
+    reply.json.return_value = {"embeddings": [[2.0]]}
+    server._session = MagicMock()
+    server._session.post.return_value = reply
+
+    vectors = server.embed_batch(["seen", "unseen"])
+
+    assert vectors == [[1.0], [2.0]]
+    assert server._session.post.call_args.kwargs["json"]["input"] == ["unseen"]
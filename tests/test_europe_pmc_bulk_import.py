@@ -0,0 +1,190 @@
+"""Tests for the COPY ingest mode and parallel package parsing of EuropePMCImporter.
+
+Hermetic: a fake connection records COPY rows and SQL; no PostgreSQL needed.
+"""
+
+import gzip
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bmlibrarian.importers import europe_pmc_importer
+from bmlibrarian.importers.europe_pmc_importer import (
+    INGEST_MODE_COPY,
+    STAGING_COLUMNS,
+    STAGING_TABLE,
+    ArticleMetadata,
+    EuropePMCImporter,
+    _validate_article,
+)
+
+
+class _FakeCopy:
+    def __init__(self, rows: List[Tuple]) -> None:
+        self._rows = rows
+
+    def set_types(self, types: List[str]) -> None:
+        pass
+
+    def write_row(self, row: Tuple) -> None:
+        self._rows.append(row)
+
+    def __enter__(self) -> "_FakeCopy":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeCursor:
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self._conn = conn
+
+    def execute(self, query: str, params: Any = None) -> None:
+        self._conn.executed.append((query, params))
+        if "WITH batch AS" in query and self._conn.merge_error:
+            raise self._conn.merge_error
+
+    def copy(self, statement: str) -> _FakeCopy:
+        return _FakeCopy(self._conn.copied)
+
+    def fetchone(self) -> Tuple[int, int]:
+        return self._conn.merge_result
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeConnection:
+    def __init__(self, merge_result: Tuple[int, int] = (0, 0)) -> None:
+        self.executed: List[Tuple[str, Any]] = []
+        self.copied: List[Tuple] = []
+        self.merge_result = merge_result
+        self.merge_error: Optional[Exception] = None
+        self.commits = 0
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+def _db(conn: _FakeConnection) -> MagicMock:
+    db = MagicMock()
+    db.get_connection.return_value.__enter__.return_value = conn
+    return db
+
+
+def _importer(tmp_path: Path, **kwargs: Any) -> EuropePMCImporter:
+    return EuropePMCImporter(packages_dir=tmp_path / "packages", **kwargs)
+
+
+def test_rejects_unknown_ingest_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="ingest_mode"):
+        _importer(tmp_path, ingest_mode="bogus")
+
+
+@pytest.mark.parametrize("article, reason", [
+    (ArticleMetadata(pmcid=""), "missing PMCID"),
+    (ArticleMetadata(pmcid="PMC1", publication_date="2020-02-30"), "publication_date"),
+    (ArticleMetadata(pmcid="PMC1", full_text="a\x00b"), "full_text"),
+    (ArticleMetadata(pmcid="PMC1", authors=["Smith\x00"]), "authors"),
+])
+def test_validation_rejects_unloadable_rows(article: ArticleMetadata, reason: str) -> None:
+    assert reason in _validate_article(article)
+
+
+def test_validation_accepts_normal_article() -> None:
+    article = ArticleMetadata(pmcid="PMC1", title="T", publication_date="2020-02-29")
+
+    assert _validate_article(article) is None
+
+
+def test_copy_batch_is_one_merge_statement(tmp_path: Path) -> None:
+    conn = _FakeConnection(merge_result=(2, 1))
+    importer = _importer(tmp_path, ingest_mode=INGEST_MODE_COPY)
+    articles = [
+        ArticleMetadata(pmcid="PMC1", title="A", publication_date="2021-05-01", authors=["X Y"]),
+        ArticleMetadata(pmcid="PMC2", title="B"),
+        ArticleMetadata(pmcid="PMC3", title="C", full_text="body"),
+        ArticleMetadata(pmcid="PMC4", title="D"),
+        ArticleMetadata(pmcid="PMC5", publication_date="2021-13-01"),
+    ]
+
+    stats = importer._upsert_batch(articles, _db(conn), source_id=7)
+
+    assert stats == {'inserted': 2, 'updated': 1, 'skipped': 1, 'failed': 1}
+    assert [row[1] for row in conn.copied] == ["PMC1", "PMC2", "PMC3", "PMC4"]
+    assert all(len(row) == len(STAGING_COLUMNS) for row in conn.copied)
+    first = conn.copied[0]
+    assert str(first[7]) == "2021-05-01"
+    assert first[11] == "https://europepmc.org/article/PMC/1"
+    assert conn.copied[1][5] is None  # empty authors -> NULL keeps existing
+    merges = [(q, p) for q, p in conn.executed if "WITH batch AS" in q]
+    assert len(merges) == 1
+    assert merges[0][1] == {'source_id': 7, 'update_existing': True}
+    assert any(f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE}" in q for q, _ in conn.executed)
+    assert not any("SAVEPOINT" in q.upper() for q, _ in conn.executed)
+    assert conn.commits == 1
+
+
+def test_failed_merge_falls_back_to_per_article_path(tmp_path: Path) -> None:
+    conn = _FakeConnection()
+    conn.merge_error = RuntimeError("deadlock detected")
+    importer = _importer(tmp_path, ingest_mode=INGEST_MODE_COPY)
+    articles = [ArticleMetadata(pmcid="PMC1"), ArticleMetadata(pmcid="")]
+
+    with patch.object(
+        importer, "_upsert_batch_rows",
+        return_value={'inserted': 1, 'updated': 0, 'skipped': 0, 'failed': 0},
+    ) as rows:
+        stats = importer._upsert_batch(articles, _db(conn), source_id=7)
+
+    assert [a.pmcid for a in rows.call_args[0][0]] == ["PMC1"]
+    assert stats == {'inserted': 1, 'updated': 0, 'skipped': 0, 'failed': 1}
+
+
+def _write_package(path: Path, pmcids: List[int]) -> Path:
+    articles = "".join(
+        f"""<article><front><article-meta>
+              <article-id pub-id-type="pmcid">PMC{n}</article-id>
+              <title-group><article-title>Title {n}</article-title></title-group>
+            </article-meta></front></article>"""
+        for n in pmcids
+    )
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(f"<articles>{articles}</articles>")
+    return path
+
+
+def test_parallel_import_reports_each_package(tmp_path: Path) -> None:
+    packages_dir = tmp_path / "packages"
+    packages_dir.mkdir()
+    _write_package(packages_dir / "PMC1_2.xml.gz", [1, 2, 3])
+    _write_package(packages_dir / "PMC4_5.xml.gz", [4, 5])
+    importer = _importer(tmp_path, batch_size=2)
+    written: List[List[str]] = []
+
+    def upsert(batch: List[ArticleMetadata], db: Any, source_id: int) -> Dict[str, int]:
+        written.append([a.pmcid for a in batch])
+        return {'inserted': len(batch), 'updated': 0, 'skipped': 0, 'failed': 0}
+
+    with patch("bmlibrarian.database.get_db_manager", return_value=MagicMock()), \
+            patch.object(importer, "_get_source_id", return_value=7), \
+            patch.object(importer, "_upsert_batch", side_effect=upsert):
+        result = importer.import_all_packages(parser_processes=2)
+
+    assert sorted(p for batch in written for p in batch) == [f"PMC{n}" for n in range(1, 6)]
+    assert max(len(batch) for batch in written) == 2
+    reports = {r['package']: r for r in result['package_stats']}
+    assert reports["PMC1_2.xml.gz"]['articles'] == 3
+    assert reports["PMC4_5.xml.gz"]['inserted'] == 2
+    assert all(r['articles_per_second'] > 0 for r in reports.values())
+    assert result['imported_packages'] == 2
+    assert result['imported_articles'] == 5
@@ -0,0 +1,147 @@
+"""Tests for find_abstracts() streaming, keyset pagination and top-k ranking.
+
+The database is mocked; tests check the SQL and bound parameters.
+"""
+
+import datetime
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import bmlibrarian.database as database
+from bmlibrarian.database import SearchPosition, build_keyset_clause, find_abstracts
+
+
+def _row(doc_id: int, pub: str = "2021-03-04", rank: Optional[float] = None) -> Dict[str, Any]:
+    row = {
+        "id": doc_id, "title": f"Paper {doc_id}", "source_id": 1, "external_id": "123",
+        "publication_date": datetime.date.fromisoformat(pub) if pub else None,
+    }
+    if rank is not None:
+        row["rank_score"] = rank
+    return row
+
+
+def _run(rows: List[Dict[str, Any]], **kwargs: Any):
+    """Run find_abstracts against a mocked connection; return (docs, conn, cursor)."""
+    cursor = MagicMock()
+    cursor.fetchmany.side_effect = [rows, []]
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    db = MagicMock()
+    db.get_connection.return_value.__enter__.return_value = conn
+
+    with patch.object(database, "get_db_manager", return_value=db), \
+            patch.object(database, "_default_source_ids", return_value={}), \
+            patch.object(database, "_default_source_id_names", return_value={1: "pubmed"}):
+        docs = list(find_abstracts("covid", **kwargs))
+    return docs, conn, cursor
+
+
+def _sql_and_params(cursor: MagicMock):
+    sql, params = cursor.execute.call_args[0]
+    assert sql.count("%s") == len(params)
+    return sql, params
+
+
+class TestSearchPosition:
+    """Page tokens and row positions."""
+
+    def test_token_round_trip(self) -> None:
+        position = SearchPosition(42, datetime.date(2020, 1, 2), 0.123456789)
+
+        assert SearchPosition.from_token(position.to_token()) == position
+
+    def test_token_without_rank_or_date(self) -> None:
+        position = SearchPosition(7)
+
+        assert SearchPosition.from_token(position.to_token()) == position
+
+    def test_malformed_token(self) -> None:
+        with pytest.raises(ValueError, match="Invalid search page token"):
+            SearchPosition.from_token("not-a-token")
+
+    def test_from_yielded_row(self) -> None:
+        row = {"id": 9, "publication_date": "2021-03-04", "rank_score": 0.5}
+
+        assert SearchPosition.from_row(row) == SearchPosition(9, datetime.date(2021, 3, 4), 0.5)
+
+
+class TestKeysetClause:
+    """Keyset filters mirror the ORDER BY used by find_abstracts."""
+
+    def test_dated_position(self) -> None:
+        clause, params = build_keyset_clause(SearchPosition(5, datetime.date(2020, 1, 1)))
+
+        assert "d.publication_date IS NULL" in clause
+        assert params == [datetime.date(2020, 1, 1), datetime.date(2020, 1, 1), 5]
+
+    def test_undated_position_only_scans_undated_tail(self) -> None:
+        clause, params = build_keyset_clause(SearchPosition(5))
+
+        assert clause == "AND (d.publication_date IS NULL AND d.id > %s)"
+        assert params == [5]
+
+    def test_ranked_position_requires_rank(self) -> None:
+        with pytest.raises(ValueError):
+            build_keyset_clause(SearchPosition(5), "rank(%s)", "q")
+
+    def test_ranked_position_binds_query_for_each_rank_expression(self) -> None:
+        clause, params = build_keyset_clause(SearchPosition(5, None, 0.25), "rank(%s)", "q")
+
+        assert clause.count("%s") == len(params)
+        assert params[:4] == ["q", 0.25, "q", 0.25]
+
+
+class TestFindAbstractsModes:
+    """SQL shape of the streaming, keyset and top-k paths."""
+
+    def test_default_uses_client_cursor_and_offset(self) -> None:
+        docs, conn, cursor = _run([_row(1)], max_rows=10, offset=20)
+
+        assert conn.cursor.call_args.kwargs["name"] == ""
+        sql, params = _sql_and_params(cursor)
+        assert "OFFSET %s" in sql
+        assert params[-2:] == (10, 20)
+        assert docs[0]["publication_date"] == "2021-03-04"
+
+    def test_stream_uses_named_cursor_with_itersize(self) -> None:
+        docs, conn, cursor = _run([_row(1), _row(2)], max_rows=0, batch_size=25, stream=True)
+
+        assert conn.cursor.call_args.kwargs["name"]
+        assert cursor.itersize == 25
+        assert [d["id"] for d in docs] == [1, 2]
+
+    def test_keyset_page_has_no_offset(self) -> None:
+        last = SearchPosition.from_row({"id": 9, "publication_date": "2021-03-04"})
+
+        _, _, cursor = _run([], max_rows=10, after=last)
+
+        sql, params = _sql_and_params(cursor)
+        assert "OFFSET" not in sql
+        assert params == ("covid", datetime.date(2021, 3, 4), datetime.date(2021, 3, 4), 9, 10)
+
+    def test_ranked_keyset_page(self) -> None:
+        _, _, cursor = _run([], max_rows=10, use_ranking=True,
+                            after=SearchPosition(9, None, 0.5))
+
+        sql, params = _sql_and_params(cursor)
+        assert "::real" in sql
+        assert params[-1] == 10
+
+    def test_top_k_limits_before_reading_full_rows(self) -> None:
+        _, _, cursor = _run([_row(1, rank=0.9)], max_rows=10, use_ranking=True, rank_top_k=True)
+
+        sql, params = _sql_and_params(cursor)
+        outer_select, rest = sql.split("FROM (", 1)
+        inner, outer_tail = rest.split(") r", 1)
+        assert "LIMIT %s" in inner and "LIMIT" not in outer_tail
+        assert "d.*" in outer_select and "d.*" not in inner
+        assert params == ("covid", "covid", 10)
+
+    def test_top_k_needs_a_limit(self) -> None:
+        _, _, cursor = _run([], max_rows=0, use_ranking=True, rank_top_k=True)
+
+        sql, _ = _sql_and_params(cursor)
+        assert ") r" not in sql
@@ -0,0 +1,100 @@
+"""
+Tests for concurrent strategy execution in search_hybrid.
+
+Hermetic: the three search functions are replaced with in-memory fakes;
+no PostgreSQL required.
+"""
+
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+import bmlibrarian.database as database
+from bmlibrarian.database import search_hybrid
+
+STRATEGY_DELAY_SECONDS = 0.3
+
+
+def _config(**execution: Any) -> Dict[str, Any]:
+    return {
+        'semantic': {'enabled': True, 'max_results': 10},
+        'bm25': {'enabled': True, 'max_results': 10},
+        'fulltext': {'enabled': True, 'max_results': 10},
+        'execution': execution,
+    }
+
+
+@pytest.fixture
+def fake_searches(monkeypatch: pytest.MonkeyPatch) -> Dict[str, Any]:
+    """Replace the search functions with slow in-memory generators."""
+    state: Dict[str, Any] = {'delays': {}, 'errors': {}}
+
+    def make(name: str, score_key: str, ids: List[int]):
+        def search(*args: Any, **kwargs: Any) -> Iterator[Dict]:
+            time.sleep(state['delays'].get(name, STRATEGY_DELAY_SECONDS))
+            if name in state['errors']:
+                raise state['errors'][name]
+            for doc_id in ids:
+                yield {'id': doc_id, 'title': f'{name} {doc_id}', score_key: 1.0}
+        return search
+
+    monkeypatch.setattr(database, 'search_with_semantic', make('semantic', 'semantic_score', [1, 2]))
+    monkeypatch.setattr(database, 'search_with_bm25', make('bm25', 'rank', [2, 3]))
+    monkeypatch.setattr(database, 'search_with_fulltext_function', make('fulltext', 'rank', [3, 4]))
+    return state
+
+
+def test_strategies_run_concurrently(fake_searches: Dict[str, Any]) -> None:
+    """Three slow strategies take about as long as one."""
+    start = time.perf_counter()
+    documents, metadata = search_hybrid('q', 'q', search_config=_config())
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 2 * STRATEGY_DELAY_SECONDS
+    assert metadata['execution_mode'] == 'parallel'
+    assert metadata['strategies_used'] == ['semantic', 'bm25', 'fulltext']
+    assert {d['id'] for d in documents} == {1, 2, 3, 4}
+    timings = metadata['strategy_timings']
+    assert all(t['status'] == 'ok' and t['seconds'] >= STRATEGY_DELAY_SECONDS for t in timings.values())
+
+
+def test_parallel_merge_matches_sequential(fake_searches: Dict[str, Any]) -> None:
+    """Priority order decides which strategy supplies shared documents."""
+    fake_searches['delays'] = {'semantic': 0.2, 'bm25': 0.0, 'fulltext': 0.0}
+
+    parallel_docs, _ = search_hybrid('q', 'q', search_config=_config())
+    sequential_docs, metadata = search_hybrid('q', 'q', search_config=_config(parallel=False))
+
+    assert metadata['execution_mode'] == 'sequential'
+    assert [d['id'] for d in parallel_docs] == [d['id'] for d in sequential_docs]
+    shared = next(d for d in parallel_docs if d['id'] == 2)
+    assert shared['title'] == 'semantic 2'
+    assert set(shared['_search_scores']) == {'semantic', 'bm25'}
+
+
+def test_slow_strategy_times_out_with_partial_results(fake_searches: Dict[str, Any]) -> None:
+    """A strategy over its time limit is dropped; the rest are returned."""
+    fake_searches['delays'] = {'semantic': 1.0, 'bm25': 0.0, 'fulltext': 0.0}
+
+    documents, metadata = search_hybrid(
+        'q', 'q', search_config=_config(strategy_timeout_seconds=0.2)
+    )
+
+    assert metadata['strategies_used'] == ['bm25', 'fulltext']
+    assert metadata['strategy_timings']['semantic']['status'] == 'timeout'
+    assert metadata['semantic_search_params'] is None
+    assert {d['id'] for d in documents} == {2, 3, 4}
+
+
+def test_failed_strategies_fall_back_to_fulltext(fake_searches: Dict[str, Any]) -> None:
+    """With fulltext disabled and every strategy failing, fulltext still runs."""
+    fake_searches['errors'] = {'semantic': RuntimeError('no embeddings'), 'bm25': RuntimeError('bad query')}
+    config = _config()
+    config['fulltext']['enabled'] = False
+
+    documents, metadata = search_hybrid('q', 'q', search_config=config)
+
+    assert metadata['strategies_used'] == ['fulltext']
+    assert metadata['strategy_timings']['semantic']['status'] == 'failed'
+    assert {d['id'] for d in documents} == {3, 4}
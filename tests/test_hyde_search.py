@@ -12,17 +12,20 @@ that ``LLMClient`` does not have.
 These tests call the functions, so that class of break fails the build.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import psycopg
 import pytest
-from bmlib.llm import EmbeddingResponse as BmlibEmbeddingResponse
+from bmlib.llm import BatchEmbeddingResponse as BmlibBatchEmbeddingResponse
 
 import bmlib.llm.client as _bmlib_llm_client
 from llm_test_support import patch_llm
 
+from bmlibrarian import database
 from bmlibrarian.agents.utils.hyde_search import (
     embed_documents,
     generate_hypothetical_documents,
+    search_with_embeddings,
 )
 from bmlibrarian.llm import LLMClient
 
@@ -94,25 +97,30 @@ class TestEmbedDocuments:
     """Tests for embed_documents."""
 
     def test_returns_one_vector_per_document(self, client: LLMClient) -> None:
-        """Every document gets an embedding, in order."""
+        """Every document gets an embedding, in order, from one batch call."""
         with patch.object(
             _bmlib_llm_client.LLMClient,
-            "embed",
-            return_value=BmlibEmbeddingResponse(
-                embedding=[0.1, 0.2, 0.3], model=EMBEDDING_MODEL, dimensions=3
+            "embed_batch",
+            return_value=BmlibBatchEmbeddingResponse(
+                embeddings=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                model=EMBEDDING_MODEL,
+                dimensions=3,
             ),
-        ) as mock_embed:
+        ) as mock_embed_batch:
             vectors = embed_documents(["doc one", "doc two"], client, EMBEDDING_MODEL)
 
-        assert vectors == [[0.1, 0.2, 0.3], [0.1, 0.2, 0.3]]
-        assert mock_embed.call_count == 2
+        assert vectors == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        mock_embed_batch.assert_called_once()
+        assert mock_embed_batch.call_args.kwargs["texts"] == ["doc one", "doc two"]
 
     def test_empty_embedding_raises(self, client: LLMClient) -> None:
         """An empty vector is a failure, not a usable result."""
         with patch.object(
             _bmlib_llm_client.LLMClient,
-            "embed",
-            return_value=BmlibEmbeddingResponse(embedding=[], model=EMBEDDING_MODEL),
+            "embed_batch",
+            return_value=BmlibBatchEmbeddingResponse(
+                embeddings=[[]], model=EMBEDDING_MODEL, dimensions=0
+            ),
         ):
             with pytest.raises(ConnectionError, match="Failed to generate embedding"):
                 embed_documents(["doc one"], client, EMBEDDING_MODEL)
@@ -122,7 +130,60 @@ class TestEmbedDocuments:
     ) -> None:
         """A transport failure is reported rather than silently skipped."""
         with patch.object(
-            _bmlib_llm_client.LLMClient, "embed", side_effect=OSError("no route")
+            _bmlib_llm_client.LLMClient, "embed_batch", side_effect=OSError("no route")
         ):
             with pytest.raises(ConnectionError, match="Failed to generate embedding"):
                 embed_documents(["doc one"], client, EMBEDDING_MODEL)
+
+
+class TestSearchByEmbeddings:
+    """Tests for the single-statement multi-vector search."""
+
+    def test_rows_are_bucketed_per_embedding(self) -> None:
+        """Each embedding gets its own ranked list, in input order."""
+        db_manager = MagicMock()
+        conn = db_manager.get_connection.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [
+            {"ord": 0, "id": 1, "title": "A", "similarity": 0.9},
+            {"ord": 0, "id": 2, "title": "B", "similarity": 0.8},
+            {"ord": 2, "id": 3, "title": "C", "similarity": 0.7},
+        ]
+
+        with patch.object(database, "get_db_manager", return_value=db_manager), \
+                patch.object(database, "vector_param", side_effect=lambda conn, v: v):
+            results = search_with_embeddings([[0.1], [0.2], [0.3]], max_results=5)
+
+        assert results == [[(1, "A", 0.9), (2, "B", 0.8)], [], [(3, "C", 0.7)]]
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("%s") == len(params) == 8
+        assert params[-1] == 5
+
+    def test_timeout_falls_back_to_one_query_per_embedding(self) -> None:
+        """A cancelled multi-vector statement is retried vector by vector."""
+        db_manager = MagicMock()
+        conn = db_manager.get_connection.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = psycopg.errors.QueryCanceled(
+            "canceling statement due to statement timeout"
+        )
+
+        with patch.object(database, "get_db_manager", return_value=db_manager), \
+                patch.object(database, "vector_param", side_effect=lambda conn, v: v), \
+                patch.object(
+                    database, "search_by_embedding",
+                    side_effect=lambda embedding, max_results, model_id: [
+                        {"id": int(embedding[0] * 10), "title": "T", "similarity": 0.5}
+                    ],
+                ) as single:
+            results = search_with_embeddings([[0.1], [0.2]], max_results=5)
+
+        assert results == [[(1, "T", 0.5)], [(2, "T", 0.5)]]
+        assert single.call_count == 2
+
+    def test_no_embeddings_skips_the_database(self) -> None:
+        """An empty batch returns immediately."""
+        with patch.object(database, "get_db_manager") as mock_get_db:
+            assert search_with_embeddings([], max_results=5) == []
+        mock_get_db.assert_not_called()
@@ -0,0 +1,77 @@
+"""Tests for the single-pass KeywordMatcher."""
+
+import pickle
+import random
+
+import pytest
+
+from bmlibrarian.agents.utils import KeywordMatcher
+
+
+def _naive_find_all(keywords, text):
+    """Reference: every occurrence of every keyword via str.find."""
+    hits = []
+    for keyword in set(keywords):
+        if not keyword:
+            continue
+        i = text.find(keyword)
+        while i >= 0:
+            hits.append((i, keyword))
+            i = text.find(keyword, i + 1)
+    return sorted(hits, key=lambda hit: (hit[0], -len(hit[1])))
+
+
+def test_finds_all_occurrences_in_order() -> None:
+    matcher = KeywordMatcher(["case report", "case reports", "rat model"])
+
+    assert matcher.find_all("two case reports and a rat model") == {
+        'case reports': [4], 'case report': [4], 'rat model': [23],
+    }
+
+
+def test_overlapping_keywords_are_all_reported() -> None:
+    matcher = KeywordMatcher(["in vitro", "vitro study", "study"])
+
+    assert list(matcher.finditer("an in vitro study")) == [
+        (3, "in vitro"), (6, "vitro study"), (12, "study"),
+    ]
+
+
+def test_search_returns_leftmost_longest() -> None:
+    matcher = KeywordMatcher(["rat", "rat model", "model"])
+
+    assert matcher.search("a rat model") == (2, "rat model")
+    assert matcher.search("nothing here") is None
+
+
+def test_regex_metacharacters_are_literal() -> None:
+    matcher = KeywordMatcher(["p < 0.05", "(n="])
+
+    assert matcher.find_all("p < 0.05 (n=12); p<0x05") == {'p < 0.05': [0], '(n=': [9]}
+
+
+def test_empty_matcher() -> None:
+    matcher = KeywordMatcher(["", ""])
+
+    assert not matcher
+    assert len(matcher) == 0
+    assert matcher.find_all("anything") == {}
+    assert matcher.search("anything") is None
+
+
+def test_is_picklable() -> None:
+    matcher = pickle.loads(pickle.dumps(KeywordMatcher(["abc", "ab"])))
+
+    assert matcher.find_all("xabc") == {'abc': [1], 'ab': [1]}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_naive_scan(seed: int) -> None:
+    rng = random.Random(seed)
+    alphabet = "ab c"
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(12)]
+    matcher = KeywordMatcher(keywords)
+
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+        assert list(matcher.finditer(text)) == _naive_find_all(keywords, text)
@@ -0,0 +1,166 @@
+"""
+Tests for the deterministic LLM response cache.
+
+Patched at ``bmlib.llm.client.LLMClient.chat``, the provider boundary, so
+cache keying and bmlibrarian's response adaptation stay live.
+"""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import bmlib.llm.client as _bmlib_llm_client
+from bmlib.llm import LLMResponse as BmlibLLMResponse
+
+from bmlibrarian.llm import (
+    LLMClient,
+    LLMMessage,
+    MemoryResponseCacheBackend,
+    ResponseCache,
+    SQLiteResponseCacheBackend,
+    TokenTracker,
+)
+from bmlibrarian.llm.response_cache import make_cache_key
+
+MODEL = "gpt-oss:20b"
+MESSAGES = [LLMMessage(role="user", content="Is aspirin effective?")]
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache(MemoryResponseCacheBackend(max_entries=10), ttl_seconds=None)
+
+
+def _provider_response(content: str = '{"score": 4}') -> BmlibLLMResponse:
+    return BmlibLLMResponse(content=content, model=MODEL, input_tokens=100, output_tokens=20)
+
+
+def _chat(client: LLMClient, **kwargs) -> object:
+    return client.chat(messages=MESSAGES, model=MODEL, temperature=0.0, **kwargs)
+
+
+def test_repeat_request_is_served_from_cache(cache: ResponseCache) -> None:
+    """An identical opted-in request does not reach the provider again."""
+    client = LLMClient(track_usage=False, response_cache=cache)
+    with patch.object(
+        _bmlib_llm_client.LLMClient, "chat", return_value=_provider_response()
+    ) as mock_chat:
+        first = _chat(client, use_cache=True)
+        second = _chat(client, use_cache=True)
+
+    assert mock_chat.call_count == 1
+    assert (first.cached, second.cached) == (False, True)
+    assert second.content == first.content
+    assert second.prompt_tokens == 100
+    assert cache.get_stats().hits == 1
+
+
+def test_cache_is_opt_in_and_options_change_the_key(cache: ResponseCache) -> None:
+    """Without use_cache, or with different options, the model is called."""
+    client = LLMClient(track_usage=False, response_cache=cache)
+    with patch.object(
+        _bmlib_llm_client.LLMClient, "chat", return_value=_provider_response()
+    ) as mock_chat:
+        _chat(client, use_cache=True)
+        _chat(client)
+        _chat(client, use_cache=True, max_tokens=50)
+        client.chat(messages=MESSAGES, model=MODEL, temperature=0.7, use_cache=True)
+
+    assert mock_chat.call_count == 4
+
+
+def test_refresh_bypasses_lookup_but_stores(cache: ResponseCache) -> None:
+    """refresh_cache replaces the stored answer with a fresh one."""
+    client = LLMClient(track_usage=False, response_cache=cache)
+    with patch.object(
+        _bmlib_llm_client.LLMClient, "chat",
+        side_effect=[_provider_response("old"), _provider_response("new")],
+    ):
+        _chat(client, use_cache=True)
+        refreshed = _chat(client, use_cache=True, refresh_cache=True)
+        replayed = _chat(client, use_cache=True)
+
+    assert refreshed.content == "new"
+    assert replayed.cached and replayed.content == "new"
+
+
+def test_token_tracker_reports_cache_hits(cache: ResponseCache) -> None:
+    """Cache hits are counted separately and add no tokens or cost."""
+    client = LLMClient(track_usage=True, response_cache=cache)
+    client._token_tracker = TokenTracker()
+    with patch.object(_bmlib_llm_client.LLMClient, "chat", return_value=_provider_response()):
+        for _ in range(3):
+            _chat(client, use_cache=True)
+
+    summary = client.get_usage_summary()
+    assert summary["request_count"] == 1
+    assert summary["total_tokens"] == 120
+    assert summary["cache_hits"] == 2
+    assert summary["cached_tokens_saved"] == 240
+    assert "Response cache hits: 2" in client.get_usage_report()
+
+
+def test_memory_backend_ttl_and_lru() -> None:
+    """Expired entries miss; the least recently used entry is evicted."""
+    backend = MemoryResponseCacheBackend(max_entries=2)
+    backend.put("expired", "x", expires_at=0.0)
+    assert backend.get("expired") is None
+
+    backend.put("a", "1", None)
+    backend.put("b", "2", None)
+    backend.get("a")
+    backend.put("c", "3", None)
+
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == ("1", None, "3")
+
+
+def test_sqlite_backend_persists_across_instances(tmp_path: Path) -> None:
+    """A second process opening the same file sees stored responses."""
+    path = tmp_path / "responses.sqlite"
+    key = make_cache_key(MODEL, MESSAGES, {"temperature": 0.0})
+    first = SQLiteResponseCacheBackend(path)
+    first.put(key, "payload", None)
+    first.put("stale", "old", expires_at=1.0)
+    first.close()
+
+    second = SQLiteResponseCacheBackend(path)
+    assert second.get(key) == "payload"
+    assert second.get("stale") is None
+    second.close()
+
+
+def test_backend_errors_degrade_to_misses() -> None:
+    """A failing backend never fails the request."""
+    class _BrokenBackend(MemoryResponseCacheBackend):
+        def get(self, key):
+            raise OSError("disk gone")
+
+    cache = ResponseCache(_BrokenBackend())
+    client = LLMClient(track_usage=False, response_cache=cache)
+    with patch.object(_bmlib_llm_client.LLMClient, "chat", return_value=_provider_response()):
+        response = _chat(client, use_cache=True)
+
+    assert response.content == '{"score": 4}'
+    assert cache.get_stats().errors == 1
+
+
+def test_agent_json_retry_does_not_replay_cached_bad_answer(cache: ResponseCache) -> None:
+    """A JSON-parse retry refreshes the cache instead of replaying the bad answer."""
+    from bmlibrarian.agents.base import BaseAgent
+
+    class _Agent(BaseAgent):
+        def get_agent_type(self) -> str:
+            return "test_agent"
+
+    agent = _Agent(model=MODEL, show_model_info=False)
+    agent.use_response_cache = True
+    agent._llm_client.response_cache = cache
+    with patch.object(
+        _bmlib_llm_client.LLMClient, "chat",
+        side_effect=[_provider_response("not json"), _provider_response('{"ok": true}')],
+    ) as mock_chat:
+        first = agent._generate_and_parse_json("prompt", max_retries=1)
+        second = agent._generate_and_parse_json("prompt", max_retries=1)
+
+    assert first == second == {"ok": True}
+    assert mock_chat.call_count == 2
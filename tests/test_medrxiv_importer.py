@@ -140,6 +140,66 @@ class TestMedRxivImporter:
             # Should expand the tilde
             assert 'test_pdfs' in str(importer.pdf_base_dir)
 
+    @staticmethod
+    def _fetch_missing_pdfs(mock_db, records, downloads, chunk_size):
+        """Run fetch_missing_pdfs, logging conversions and UPDATEs in call order."""
+        mock_db.return_value.get_cached_source_ids.return_value = {'medrxiv': 1}
+        importer = MedRxivImporter()
+        log = []
+        cur = (mock_db.return_value.get_connection.return_value.__enter__.return_value
+               .cursor.return_value.__enter__.return_value)
+        cur.execute.side_effect = lambda sql, params: log.append(('update', params[3], params[1]))
+
+        def extract(filenames):
+            log.append(('convert', list(filenames)))
+            return {filename: f'text of {filename}' for filename in filenames}
+
+        with patch('src.bmlibrarian.importers.medrxiv_importer.tqdm', None), \
+                patch.object(importer, 'get_preprints_without_pdfs', return_value=records), \
+                patch.object(importer, 'download_pdf',
+                             side_effect=lambda paper: downloads[paper['doi']]), \
+                patch.object(importer, 'extract_full_text_batch', side_effect=extract):
+            count = importer.fetch_missing_pdfs(chunk_size=chunk_size)
+        return count, log
+
+    @patch('src.bmlibrarian.importers.medrxiv_importer.get_db_manager')
+    def test_fetch_missing_pdfs_saves_each_chunk(self, mock_db):
+        """Each chunk is converted and saved before the next is downloaded."""
+        records = [{'doi': f'10.1101/{i}', 'has_full_text': False} for i in range(3)]
+        downloads = {r['doi']: (f"{r['doi'].replace('/', '_')}.pdf", True) for r in records}
+
+        count, log = self._fetch_missing_pdfs(mock_db, records, downloads, chunk_size=2)
+
+        assert count == 3
+        assert log == [
+            ('convert', ['10.1101_0.pdf', '10.1101_1.pdf']),
+            ('update', '10.1101/0', 'text of 10.1101_0.pdf'),
+            ('update', '10.1101/1', 'text of 10.1101_1.pdf'),
+            ('convert', ['10.1101_2.pdf']),
+            ('update', '10.1101/2', 'text of 10.1101_2.pdf'),
+        ]
+
+    @patch('src.bmlibrarian.importers.medrxiv_importer.get_db_manager')
+    def test_fetch_missing_pdfs_converts_existing_pdfs_without_text(self, mock_db):
+        """PDFs left on disk by an interrupted run are converted if the record has no text."""
+        records = [
+            {'doi': '10.1101/a', 'has_full_text': False},
+            {'doi': '10.1101/b', 'has_full_text': True},
+        ]
+        downloads = {
+            '10.1101/a': ('10.1101_a.pdf', False),
+            '10.1101/b': ('10.1101_b.pdf', False),
+        }
+
+        count, log = self._fetch_missing_pdfs(mock_db, records, downloads, chunk_size=16)
+
+        assert count == 2
+        assert log == [
+            ('convert', ['10.1101_a.pdf']),
+            ('update', '10.1101/a', 'text of 10.1101_a.pdf'),
+            ('update', '10.1101/b', ''),
+        ]
+
 
 def test_module_constants():
     """Test that module constants are correctly defined."""
@@ -0,0 +1,211 @@
+"""Tests for the COPY-based descriptor ingest mode of MeSHImporter.
+
+Hermetic: uses a fake connection that records COPY rows and SQL; no
+PostgreSQL or network required.
+"""
+
+import gzip
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bmlibrarian.importers import mesh_importer
+from bmlibrarian.importers.mesh_importer import (
+    INGEST_MODE_COPY,
+    INGEST_MODE_ROW,
+    STAGING_TABLES,
+    MeSHImporter,
+)
+
+
+def _descriptor_xml(ui: str, trees: List[str], concepts: int = 1, terms: int = 2) -> str:
+    concept_xml = "".join(
+        f"""
+        <Concept PreferredConceptYN="{'Y' if c == 0 else 'N'}">
+          <ConceptUI>M{ui}{c}</ConceptUI>
+          <ConceptName><String>Concept {ui} {c}</String></ConceptName>
+          <TermList>
+            {''.join(
+                f'<Term ConceptPreferredTermYN="{"Y" if t == 0 else "N"}" '
+                f'IsPermutedTermYN="N" LexicalTag="NON">'
+                f'<TermUI>T{ui}{c}{t}</TermUI><String>Term {t}</String></Term>'
+                for t in range(terms)
+            )}
+          </TermList>
+        </Concept>"""
+        for c in range(concepts)
+    )
+    tree_xml = "".join(f"<TreeNumber>{t}</TreeNumber>" for t in trees)
+    return f"""
+    <DescriptorRecord>
+      <DescriptorUI>{ui}</DescriptorUI>
+      <DescriptorName><String>Name {ui}</String></DescriptorName>
+      <DateCreated><Year>1999</Year></DateCreated>
+      <TreeNumberList>{tree_xml}</TreeNumberList>
+      <ConceptList>{concept_xml}</ConceptList>
+    </DescriptorRecord>"""
+
+
+def _write_desc_file(path: Path, count: int) -> Path:
+    records = "".join(
+        _descriptor_xml(f"D{i:06d}", [f"C{i % 90 + 10:02d}.{i}"]) for i in range(count)
+    )
+    xml = f'<?xml version="1.0"?><DescriptorRecordSet>{records}</DescriptorRecordSet>'
+    path.write_bytes(xml.encode())
+    return path
+
+
+class _FakeCopy:
+    """Stand-in for a psycopg Copy object recording written rows."""
+
+    def __init__(self, rows: List[Tuple]) -> None:
+        self._rows = rows
+
+    def set_types(self, types: List[str]) -> None:
+        pass
+
+    def write_row(self, row: Tuple) -> None:
+        self._rows.append(row)
+
+    def __enter__(self) -> "_FakeCopy":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeCursor:
+    """Cursor recording SQL and COPY rows per staging table."""
+
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self._conn = conn
+
+    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+        self._conn.executed.append((query, params))
+
+    def copy(self, statement: str) -> _FakeCopy:
+        table = statement.split()[1]
+        return _FakeCopy(self._conn.copied.setdefault(table, []))
+
+    def fetchone(self) -> Tuple:
+        return (1,)
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.executed: List[Tuple[str, Any]] = []
+        self.copied: Dict[str, List[Tuple]] = {}
+        self.commits = 0
+
+    def cursor(self) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def statements(self, fragment: str) -> List[str]:
+        return [q for q, _ in self.executed if fragment in q]
+
+
+@pytest.fixture
+def conn() -> _FakeConnection:
+    return _FakeConnection()
+
+
+def _importer(tmp_path: Path, conn: _FakeConnection, mode: str = INGEST_MODE_COPY) -> MeSHImporter:
+    db = MagicMock()
+    db.get_connection.return_value.__enter__.return_value = conn
+    with patch.object(mesh_importer, "get_db_manager", return_value=db):
+        return MeSHImporter(download_dir=tmp_path, ingest_mode=mode)
+
+
+def test_rejects_unknown_ingest_mode(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="ingest_mode"):
+        _importer(tmp_path, _FakeConnection(), mode="bogus")
+
+
+def test_copy_mode_stages_all_tables_and_merges_set_based(tmp_path: Path, conn) -> None:
+    desc_file = _write_desc_file(tmp_path / "desc2025.xml", 3)
+
+    stats = _importer(tmp_path, conn).import_descriptors(desc_file, 2025)
+
+    assert (stats.descriptors, stats.concepts, stats.terms, stats.tree_numbers) == (3, 3, 6, 3)
+    assert stats.status == "completed"
+    assert len(conn.copied["mesh_descriptor_staging"]) == 3
+    assert len(conn.copied["mesh_term_staging"]) == 6
+    assert conn.copied["mesh_tree_staging"][0] == ("D000000", "C10.0", 2)
+    # One statement per target table, not per record
+    assert len(conn.statements("INSERT INTO mesh.descriptors")) == 1
+    assert len(conn.statements("INSERT INTO mesh.terms")) == 1
+    assert len(conn.statements("DELETE FROM mesh.tree_numbers")) == 1
+    assert conn.commits == 1
+
+
+def test_staged_rows_match_column_layout(tmp_path: Path, conn) -> None:
+    desc_file = _write_desc_file(tmp_path / "desc2025.xml", 1)
+
+    _importer(tmp_path, conn).import_descriptors(desc_file, 2025)
+
+    for table, (columns, types) in STAGING_TABLES.items():
+        assert len(columns) == len(types)
+        assert all(len(row) == len(columns) for row in conn.copied[table])
+    descriptor_row = conn.copied["mesh_descriptor_staging"][0]
+    assert descriptor_row[8] == "1999-01-01"
+
+
+def test_copy_mode_merges_in_batches(tmp_path: Path, conn, monkeypatch) -> None:
+    monkeypatch.setattr(mesh_importer, "BULK_DESCRIPTOR_BATCH_SIZE", 2)
+    desc_file = _write_desc_file(tmp_path / "desc2025.xml", 5)
+
+    _importer(tmp_path, conn).import_descriptors(desc_file, 2025)
+
+    assert len(conn.statements("INSERT INTO mesh.descriptors")) == 3
+
+
+def test_row_mode_uses_per_record_statements(tmp_path: Path, conn) -> None:
+    desc_file = _write_desc_file(tmp_path / "desc2025.xml", 2)
+
+    stats = _importer(tmp_path, conn, INGEST_MODE_ROW).import_descriptors(desc_file, 2025)
+
+    assert stats.terms == 4
+    assert not conn.copied
+    assert len(conn.statements("INSERT INTO mesh.descriptors")) == 2
+
+
+def test_single_pass_progress_from_file_position(tmp_path: Path, conn, monkeypatch) -> None:
+    monkeypatch.setattr(mesh_importer, "DESCRIPTOR_BATCH_SIZE", 10)
+    desc_file = _write_desc_file(tmp_path / "desc2025.xml", 40)
+    importer = _importer(tmp_path, conn)
+    parses = []
+    original = importer._iter_xml_records_with_position
+    importer._iter_xml_records_with_position = lambda *a: parses.append(a) or original(*a)
+    calls: List[Tuple[int, int]] = []
+
+    importer.import_descriptors(desc_file, 2025, lambda p, t: calls.append((p, t)))
+
+    assert len(parses) == 1
+    assert [p for p, _ in calls] == [10, 20, 30, 40, 40]
+    assert all(total >= processed for processed, total in calls)
+    assert calls[-1] == (40, 40)
+
+
+def test_gzip_position_uses_compressed_bytes(tmp_path: Path, conn) -> None:
+    plain = _write_desc_file(tmp_path / "desc2025.xml", 5)
+    gz_path = tmp_path / "desc2025.xml.gz"
+    with gzip.open(gz_path, "wb") as f:
+        f.write(plain.read_bytes())
+
+    positions = list(_importer(tmp_path, conn)._iter_xml_records_with_position(
+        gz_path, "DescriptorRecord"
+    ))
+
+    assert len(positions) == 5
+    assert all(0 < read <= total == gz_path.stat().st_size for _, read, total in positions)
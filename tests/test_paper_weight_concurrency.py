@@ -0,0 +1,308 @@
+"""
+Tests for concurrent dimension assessment and batch pipelining in
+PaperWeightAssessmentAgent, and for the shared DocumentChunkCache.
+
+Hermetic: database and LLM calls are patched; no PostgreSQL or Ollama needed.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bmlibrarian.agents.paper_weight import agent as agent_module
+from bmlibrarian.agents.paper_weight import validators
+from bmlibrarian.agents.paper_weight.agent import (
+    DEFAULT_CONFIG,
+    PaperWeightAssessmentAgent,
+)
+from bmlibrarian.agents.paper_weight.models import (
+    DIMENSION_METHODOLOGICAL_QUALITY,
+    DIMENSION_REPLICATION_STATUS,
+    DIMENSION_RISK_OF_BIAS,
+    DIMENSION_SAMPLE_SIZE,
+    DIMENSION_STUDY_DESIGN,
+    DimensionScore,
+)
+from bmlibrarian.agents.paper_weight.validators import DocumentChunkCache
+
+WAIT_SECONDS = 5
+
+
+def _agent(max_concurrent_dimensions: int = 4, max_concurrent_papers: int = 1):
+    """Agent with BaseAgent initialisation (LLM client setup) skipped."""
+    agent = PaperWeightAssessmentAgent.__new__(PaperWeightAssessmentAgent)
+    agent.config = dict(DEFAULT_CONFIG)
+    agent.version = "1.0.0"
+    agent.model = "test-model"
+    agent.max_tokens = 100
+    agent._llm_client = MagicMock()
+    agent.max_concurrent_dimensions = max_concurrent_dimensions
+    agent.max_concurrent_papers = max_concurrent_papers
+    return agent
+
+
+class _Patched:
+    """Patch the agent's DB and LLM entry points with simple fakes."""
+
+    def __init__(self, barrier: Optional[threading.Barrier] = None):
+        self.barrier = barrier
+        self.stored: List[int] = []
+        self.chunk_caches: List[DocumentChunkCache] = []
+
+    def score(self, name: str, value: float = 5.0) -> DimensionScore:
+        if self.barrier is not None:
+            self.barrier.wait()
+        return DimensionScore(name, value)
+
+    def study_type(self, document_id: int, chunk_cache: DocumentChunkCache, **kwargs: Any) -> DimensionScore:
+        self.chunk_caches.append(chunk_cache)
+        return self.score(DIMENSION_STUDY_DESIGN, 8.0)
+
+    def sample_size(self, document_id: int, chunk_cache: DocumentChunkCache, **kwargs: Any) -> DimensionScore:
+        self.chunk_caches.append(chunk_cache)
+        return self.score(DIMENSION_SAMPLE_SIZE, 6.0)
+
+    def patches(self, agent: PaperWeightAssessmentAgent) -> List[Any]:
+        return [
+            patch.object(agent_module, "get_cached_assessment", return_value=None),
+            patch.object(agent_module, "get_document", side_effect=lambda i: {'id': i, 'abstract': 'a'}),
+            patch.object(agent_module, "ensure_document_embeddings", return_value=True),
+            patch.object(agent_module, "extract_study_type_llm", side_effect=self.study_type),
+            patch.object(agent_module, "extract_sample_size_llm", side_effect=self.sample_size),
+            patch.object(agent_module, "check_replication_status",
+                         side_effect=lambda i: DimensionScore(DIMENSION_REPLICATION_STATUS, 0.0)),
+            patch.object(agent_module, "store_assessment",
+                         side_effect=lambda r: self.stored.append(r.document_id)),
+            patch.object(agent, "_assess_methodological_quality",
+                         side_effect=lambda d, s: self.score(DIMENSION_METHODOLOGICAL_QUALITY)),
+            patch.object(agent, "_assess_risk_of_bias",
+                         side_effect=lambda d, s: self.score(DIMENSION_RISK_OF_BIAS)),
+        ]
+
+    def __call__(self, agent: PaperWeightAssessmentAgent) -> "_Patched":
+        self._active = self.patches(agent)
+        return self
+
+    def __enter__(self) -> "_Patched":
+        for p in self._active:
+            p.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        for p in reversed(self._active):
+            p.stop()
+
+
+class TestConcurrentDimensions:
+    """Tests for running independent dimensions in parallel."""
+
+    def test_llm_dimensions_run_concurrently(self):
+        """All four LLM dimensions must be in flight at once to pass the barrier."""
+        agent = _agent(max_concurrent_dimensions=4)
+        fakes = _Patched(threading.Barrier(4, timeout=WAIT_SECONDS))
+
+        with fakes(agent):
+            result = agent.assess_paper(1)
+
+        assert result.study_design.score == 8.0
+        assert result.sample_size.score == 6.0
+        assert result.methodological_quality.dimension_name == DIMENSION_METHODOLOGICAL_QUALITY
+        assert fakes.stored == [1]
+
+    def test_single_worker_runs_inline(self):
+        """max_concurrent_dimensions=1 keeps the sequential behaviour."""
+        agent = _agent(max_concurrent_dimensions=1)
+        fakes = _Patched()
+        threads = set()
+        original = fakes.score
+
+        def record(name: str, value: float = 5.0) -> DimensionScore:
+            threads.add(threading.current_thread())
+            return original(name, value)
+
+        fakes.score = record
+        with fakes(agent):
+            agent.assess_paper(1)
+
+        assert threads == {threading.current_thread()}
+
+    def test_extractors_share_one_chunk_cache(self):
+        """Study type and sample size extraction read the same chunk cache."""
+        agent = _agent()
+        fakes = _Patched()
+
+        with fakes(agent):
+            agent.assess_paper(1)
+
+        assert len(fakes.chunk_caches) == 2
+        assert fakes.chunk_caches[0] is fakes.chunk_caches[1]
+        assert fakes.chunk_caches[0].document_id == 1
+
+    def test_failing_dimension_yields_error_result(self):
+        """An exception in one dimension fails the assessment, as before."""
+        agent = _agent()
+        fakes = _Patched()
+
+        with fakes(agent), patch.object(
+            agent_module, "check_replication_status", side_effect=RuntimeError("db down")
+        ):
+            result = agent.assess_paper(1)
+
+        assert result.final_weight == 0.0
+        assert "db down" in result.study_design.details[0].reasoning
+        assert fakes.stored == []
+
+
+class TestAssessPapers:
+    """Tests for the pipelined batch mode."""
+
+    def test_next_document_fetched_while_llm_stage_runs(self):
+        """Document 2 is fetched while document 1's dimensions are still running."""
+        agent = _agent()
+        fakes = _Patched()
+        second_fetched = threading.Event()
+        original_study_type = fakes.study_type
+
+        def get_document(document_id: int) -> Dict[str, Any]:
+            if document_id == 2:
+                second_fetched.set()
+            return {'id': document_id, 'abstract': 'a'}
+
+        def study_type(document_id: int, **kwargs: Any) -> DimensionScore:
+            if document_id == 1:
+                assert second_fetched.wait(WAIT_SECONDS)
+            return original_study_type(document_id, **kwargs)
+
+        fakes.study_type = study_type
+        progress: List[Tuple[int, int]] = []
+        with fakes(agent), patch.object(agent_module, "get_document", side_effect=get_document):
+            results = agent.assess_papers([1, 2, 3], progress_callback=lambda c, t: progress.append((c, t)))
+
+        assert [r.document_id for r in results] == [1, 2, 3]
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert sorted(fakes.stored) == [1, 2, 3]
+
+    def test_failures_are_isolated_per_paper(self):
+        """A paper whose fetch fails gets an error result; the rest complete."""
+        agent = _agent()
+        fakes = _Patched()
+
+        def get_document(document_id: int) -> Dict[str, Any]:
+            if document_id == 2:
+                raise ValueError("Document 2 not found")
+            return {'id': document_id, 'abstract': 'a'}
+
+        with fakes(agent), patch.object(agent_module, "get_document", side_effect=get_document):
+            results = agent.assess_papers([1, 2, 3], max_concurrent_papers=2)
+
+        assert [r.document_id for r in results] == [1, 2, 3]
+        assert results[1].final_weight == 0.0
+        assert "not found" in results[1].study_design.details[0].reasoning
+        assert sorted(fakes.stored) == [1, 3]
+
+    def test_cached_results_skip_the_llm_stage(self):
+        """Cached assessments are returned without running any dimension."""
+        agent = _agent()
+        fakes = _Patched()
+        cached = agent._create_error_result(5, "cached")
+
+        with fakes(agent), patch.object(agent_module, "get_cached_assessment", return_value=cached):
+            results = agent.assess_papers([5])
+
+        assert results == [cached]
+        assert fakes.chunk_caches == []
+
+
+class _FakeCursor:
+    def __init__(self, db: "_FakeDB") -> None:
+        self._db = db
+        self._rows: List[Tuple] = []
+
+    def execute(self, query: str, params: Tuple) -> None:
+        self._db.queries.append(query)
+        if "ollama_embedding" in query:
+            min_threshold, limit = params[2], params[3]
+            ranked = sorted(self._db.similarity.items(), key=lambda kv: -kv[1])
+            self._rows = [(no, sim) for no, sim in ranked if sim >= min_threshold][:limit]
+        else:
+            self._rows = [(no, f"chunk {no}") for no in sorted(self._db.similarity)]
+
+    def fetchall(self) -> List[Tuple]:
+        return self._rows
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeDB:
+    def __init__(self, similarity: Dict[int, float]) -> None:
+        self.similarity = similarity
+        self.queries: List[str] = []
+
+    def get_connection(self) -> MagicMock:
+        conn = MagicMock()
+        conn.cursor.side_effect = lambda: _FakeCursor(self)
+        context = MagicMock()
+        context.__enter__.return_value = conn
+        return context
+
+
+class TestDocumentChunkCache:
+    """Tests for the shared per-assessment chunk cache."""
+
+    @pytest.fixture
+    def db(self):
+        db = _FakeDB({0: 0.2, 1: 0.42, 2: 0.38, 3: 0.1})
+        with patch("bmlibrarian.database.get_db_manager", return_value=db):
+            yield db
+
+    def test_chunk_texts_fetched_once(self, db):
+        """Positional reads and searches share one chunk text fetch."""
+        cache = DocumentChunkCache(7)
+
+        assert [c['chunk_no'] for c in cache.get_all(limit=2)] == [0, 1]
+        cache.search("study design")
+        cache.search("sample size")
+
+        text_queries = [q for q in db.queries if "ollama_embedding" not in q]
+        assert len(text_queries) == 1
+
+    def test_search_steps_threshold_down_like_uncached_search(self, db):
+        """Hits at the first threshold that has any, texts from the cache."""
+        cache = DocumentChunkCache(7)
+
+        results = cache.search("q", similarity_threshold=0.5, min_threshold=0.3,
+                               threshold_decrement=0.05)
+
+        # 0.50 and 0.45 find nothing; 0.40 finds chunk 1 (0.42) but not chunk 2 (0.38)
+        assert [(r['chunk_no'], r['chunk_text']) for r in results] == [(1, "chunk 1")]
+        assert len([q for q in db.queries if "ollama_embedding" in q]) == 1
+
+    def test_searches_are_memoized(self, db):
+        """Repeating a search does not hit the database again."""
+        cache = DocumentChunkCache(7)
+
+        first = cache.search("q")
+        first[0]['chunk_text'] = "mutated"
+        second = cache.search("q")
+
+        assert second[0]['chunk_text'] != "mutated"
+        assert len([q for q in db.queries if "ollama_embedding" in q]) == 1
+
+    def test_module_functions_delegate_to_cache(self, db):
+        """search_chunks_by_query/get_all_document_chunks use a given cache."""
+        cache = DocumentChunkCache(7)
+
+        validators.search_chunks_by_query(7, "q", chunk_cache=cache)
+        validators.get_all_document_chunks(7, limit=5, chunk_cache=cache)
+
+        assert len(db.queries) == 2
+
+    def test_rejects_invalid_document_id(self):
+        with pytest.raises(ValueError, match="document_id"):
+            DocumentChunkCache(0)
@@ -647,6 +647,71 @@ class TestPaperCheckerBatchProcessing:
         assert results == []
 
 
+    @patch('bmlibrarian.paperchecker.agent.get_config')
+    @patch('bmlibrarian.paperchecker.agent.get_model')
+    @patch('bmlibrarian.paperchecker.agent.get_agent_config')
+    @patch('bmlibrarian.paperchecker.agent.get_ollama_host')
+    @patch('bmlibrarian.paperchecker.agent.PaperCheckDB')
+    @patch('bmlibrarian.paperchecker.agent.DocumentScoringAgent')
+    @patch('bmlibrarian.paperchecker.agent.CitationFinderAgent')
+    @patch('bmlibrarian.paperchecker.agent.SearchCoordinator')
+    def test_batch_concurrent_keeps_order_and_skips_failures(
+        self,
+        mock_search_coord,
+        mock_citation,
+        mock_scoring,
+        mock_db,
+        mock_host,
+        mock_agent_config,
+        mock_model,
+        mock_config_fn
+    ):
+        """Test concurrent batch checks return successes in input order."""
+        import threading
+        import time
+
+        mock_config_fn.return_value = MagicMock(_config={})
+        mock_model.return_value = "gpt-oss:20b"
+        mock_host.return_value = "http://localhost:11434"
+        mock_agent_config.return_value = {}
+        mock_db.return_value = MagicMock()
+
+        agent = PaperCheckerAgent(show_model_info=False)
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def fake_check(abstract, source_metadata):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            try:
+                # Earlier abstracts finish last
+                time.sleep(0.05 * (4 - source_metadata["n"]))
+                if abstract == "bad":
+                    raise RuntimeError("LLM failure")
+                return abstract
+            finally:
+                with lock:
+                    in_flight["now"] -= 1
+
+        agent.check_abstract = fake_check
+        abstracts = [
+            {"abstract": text, "metadata": {"n": n}}
+            for n, text in enumerate(["a", "bad", "c", "d"])
+        ]
+        progress = []
+
+        results = agent.check_abstracts_batch(
+            abstracts,
+            progress_callback=lambda done, total: progress.append(done),
+            max_concurrent=2
+        )
+
+        assert results == ["a", "c", "d"]
+        assert progress == [1, 3, 4]
+        assert in_flight["peak"] == 2
+
 # ==================== DOCUMENT SCORING TESTS ====================
 
 class TestPaperCheckerDocumentScoring:
@@ -1157,6 +1222,85 @@ class TestPaperCheckerDocumentScoring:
             assert set(scored_doc.found_by) == set(expected_provenance)
 
 
+    @patch('bmlibrarian.paperchecker.agent.get_config')
+    @patch('bmlibrarian.paperchecker.agent.get_model')
+    @patch('bmlibrarian.paperchecker.agent.get_agent_config')
+    @patch('bmlibrarian.paperchecker.agent.get_ollama_host')
+    @patch('bmlibrarian.paperchecker.agent.PaperCheckDB')
+    @patch('bmlibrarian.paperchecker.agent.DocumentScoringAgent')
+    @patch('bmlibrarian.paperchecker.agent.CitationFinderAgent')
+    @patch('bmlibrarian.paperchecker.agent.SearchCoordinator')
+    @patch('bmlibrarian.paperchecker.agent.get_db_manager')
+    def test_score_documents_bounded_concurrency(
+        self,
+        mock_db_manager,
+        mock_search_coord,
+        mock_citation,
+        mock_scoring,
+        mock_db,
+        mock_host,
+        mock_agent_config,
+        mock_model,
+        mock_config_fn,
+        sample_counter_statement
+    ):
+        """Test scoring runs in parallel without exceeding max_concurrent_requests."""
+        import threading
+        import time
+
+        mock_config_fn.return_value = MagicMock(_config={})
+        mock_model.return_value = "gpt-oss:20b"
+        mock_host.return_value = "http://localhost:11434"
+        mock_agent_config.return_value = {
+            "score_threshold": 3.0,
+            "scoring": {"batch_size": 10, "early_stop_count": 0, "max_concurrent_requests": 2}
+        }
+        mock_db.return_value = MagicMock()
+
+        mock_db_mgr = MagicMock()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [
+            {"id": i, "title": f"Doc {i}", "abstract": f"Abstract {i}"}
+            for i in range(1, 6)
+        ]
+        mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
+        mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=None)
+        mock_db_mgr.get_connection.return_value.__enter__ = MagicMock(return_value=mock_conn)
+        mock_db_mgr.get_connection.return_value.__exit__ = MagicMock(return_value=None)
+        mock_db_manager.return_value = mock_db_mgr
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def evaluate_document(user_question, document):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            return {"score": document["id"], "reasoning": "ok"}
+
+        agent = PaperCheckerAgent(show_model_info=False)
+        agent.scoring_agent = MagicMock()
+        agent.scoring_agent.evaluate_document.side_effect = evaluate_document
+
+        search_results = SearchResults(
+            semantic_docs=[1, 2, 3, 4, 5],
+            hyde_docs=[],
+            keyword_docs=[],
+            deduplicated_docs=[1, 2, 3, 4, 5],
+            provenance={i: ["semantic"] for i in range(1, 6)},
+            search_metadata={}
+        )
+
+        result = agent._score_documents(sample_counter_statement, search_results)
+
+        assert agent.max_concurrent_scoring == 2
+        assert in_flight["peak"] == 2
+        assert [doc.doc_id for doc in result] == [5, 4, 3]
+
 # ==================== COUNTER-REPORT GENERATION TESTS ====================
 
 class TestPaperCheckerCounterReportGeneration:
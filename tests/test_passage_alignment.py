@@ -0,0 +1,92 @@
+"""
+Tests for pruned fuzzy passage alignment.
+
+The pruned search must pick the same window as scoring every window with
+SequenceMatcher whenever the match clears the similarity threshold.
+"""
+
+import random
+
+import pytest
+
+from bmlibrarian.agents.citation_agent import CitationFinderAgent
+from bmlibrarian.agents.utils.passage_alignment import (
+    exhaustive_best_window,
+    find_best_window,
+    normalized_offsets,
+)
+
+ABSTRACT = (
+    "background: statins lower ldl cholesterol, but their effect on mortality in older adults "
+    "remains uncertain. methods: we randomized 1,204 patients aged 75 or older to atorvastatin "
+    "20 mg daily or placebo and followed them for a median of 4.1 years. results: all-cause "
+    "mortality was 12.3% with atorvastatin versus 14.0% with placebo (hazard ratio 0.87; 95% ci "
+    "0.71-1.06). myalgia was more common with atorvastatin. conclusions: atorvastatin did not "
+    "significantly reduce mortality in this population."
+)
+
+
+def _perturb(text: str, rng: random.Random, edits: int) -> str:
+    chars = list(text)
+    for _ in range(edits):
+        pos = rng.randrange(len(chars))
+        op = rng.choice(("swap", "drop", "insert"))
+        if op == "swap":
+            chars[pos] = rng.choice(",.;:- ")
+        elif op == "drop":
+            del chars[pos]
+        else:
+            chars.insert(pos, rng.choice("aeiou,"))
+    return "".join(chars)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_exhaustive_scan(seed: int) -> None:
+    """Same window and score as the exhaustive scan for accepted matches."""
+    # A prefix keeps the exhaustive reference scan fast
+    source = ABSTRACT[:240]
+    rng = random.Random(seed)
+    start = rng.randrange(0, len(source) - 60)
+    passage = _perturb(source[start:start + rng.randrange(25, 60)], rng, edits=rng.randrange(0, 3))
+    min_similarity = rng.choice((0.0, 0.9, 0.95))
+
+    expected = exhaustive_best_window(passage, source)
+    actual = find_best_window(passage, source, min_similarity)
+
+    if expected.score >= min_similarity:
+        assert (actual.score, actual.start, actual.length) == (expected.score, expected.start, expected.length)
+    else:
+        assert actual.score <= expected.score
+    assert actual.windows_scored < expected.windows_scored
+
+
+def test_prunes_unrelated_passages() -> None:
+    """A hallucinated passage is rejected after scoring only a few windows."""
+    match = find_best_window("quantum chromodynamics of gluon plasma", ABSTRACT, 0.95)
+
+    assert match.score < 0.95
+    assert match.windows_scored <= 16
+
+
+def test_normalized_offsets_map_back_to_original_text() -> None:
+    """Normalized characters, including joining spaces, map to the original."""
+    text = " Ab\n cd  E"
+    normalized = " ".join(text.lower().split())
+
+    offsets = normalized_offsets(text)
+
+    assert normalized == "ab cd e"
+    assert offsets == [1, 2, 4, 5, 6, 8, 9]
+    assert all(text[o].lower() == c for o, c in zip(offsets, normalized) if c != " ")
+
+
+def test_agent_extracts_same_text_for_fuzzy_match() -> None:
+    """The agent still returns the source text for a lightly edited passage."""
+    agent = CitationFinderAgent(model="gpt-oss:20b", show_model_info=False)
+    passage = "Myalgia was more common with atorvastatin;"
+
+    is_valid, similarity, exact_text = agent._validate_and_extract_exact_match(passage, ABSTRACT, 0.9)
+
+    assert is_valid
+    assert 0.9 <= similarity < 1.0
+    assert exact_text.startswith("myalgia was more common with atorvastatin")
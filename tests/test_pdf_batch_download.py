@@ -0,0 +1,123 @@
+"""Tests for concurrent batch PDF downloads and per-host rate limiting.
+
+PDFs are served by a local stub HTTP server; the database connection is a
+mock that returns the candidate documents.
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from bmlibrarian.utils.pdf_manager import PDFManager
+from bmlibrarian.utils.rate_limit import HostRateLimiter
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 1024 + b"\n%%EOF\n"
+RESPONSE_DELAY = 0.2
+
+
+class SlowPDFHandler(BaseHTTPRequestHandler):
+    """Serves a small PDF after a fixed delay; tracks peak concurrency."""
+
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(RESPONSE_DELAY)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(PDF_BYTES)))
+            self.end_headers()
+            self.wfile.write(PDF_BYTES)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def pdf_server() -> Iterator[str]:
+    SlowPDFHandler.active = SlowPDFHandler.peak = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowPDFHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_manager(tmp_path, base_url: str, count: int) -> PDFManager:
+    rows = [
+        (i, f"{base_url}/paper{i}.pdf", None, "2024-01-01", None, f"Paper {i}")
+        for i in range(1, count + 1)
+    ]
+    db_conn = MagicMock()
+    db_conn.cursor.return_value.__enter__.return_value.fetchall.return_value = rows
+    return PDFManager(base_dir=str(tmp_path), db_conn=db_conn)
+
+
+def test_worker_pool_downloads_concurrently(tmp_path, pdf_server):
+    manager = make_manager(tmp_path, pdf_server, count=6)
+    progress = []
+
+    start = time.monotonic()
+    stats = manager.download_missing_pdfs(
+        update_database=False,
+        max_workers=3,
+        min_host_interval=0,
+        progress_callback=lambda current, total, doc_id, status: progress.append(doc_id),
+    )
+    elapsed = time.monotonic() - start
+
+    assert stats["downloaded"] == 6 and stats["failed"] == 0
+    assert [d["doc_id"] for d in stats["details"]] == [1, 2, 3, 4, 5, 6]
+    assert progress == [1, 2, 3, 4, 5, 6]
+    assert SlowPDFHandler.peak == 3
+    assert elapsed < 6 * RESPONSE_DELAY
+    assert len(list(tmp_path.rglob("*.pdf"))) == 6
+
+
+def test_same_host_requests_are_spaced(tmp_path, pdf_server):
+    manager = make_manager(tmp_path, pdf_server, count=3)
+
+    start = time.monotonic()
+    stats = manager.download_missing_pdfs(
+        update_database=False, max_workers=3, min_host_interval=0.3
+    )
+    elapsed = time.monotonic() - start
+
+    assert stats["downloaded"] == 3
+    # Request starts at 0, 0.3 and 0.6s despite three free workers
+    assert elapsed >= 0.6
+
+
+def test_sequential_downloads_are_not_rate_limited(tmp_path, pdf_server):
+    manager = make_manager(tmp_path, pdf_server, count=3)
+
+    start = time.monotonic()
+    stats = manager.download_missing_pdfs(
+        update_database=False, max_workers=1, min_host_interval=5
+    )
+    elapsed = time.monotonic() - start
+
+    assert stats["downloaded"] == 3
+    assert elapsed < 5
+
+
+def test_rate_limiter_does_not_delay_other_hosts():
+    limiter = HostRateLimiter(min_interval=0.5)
+
+    assert limiter.wait("https://a.example/1.pdf") == 0
+    assert limiter.wait("https://b.example/1.pdf") == 0
+    assert limiter.wait("https://a.example/2.pdf") > 0.4
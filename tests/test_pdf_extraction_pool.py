@@ -0,0 +1,216 @@
+"""Tests for the shared sandboxed PDF extraction pool.
+
+Dispatch, timeout, crash and recycling behaviour is tested with in-process
+fake workers; one test round-trips through a real spawned worker process.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import pytest
+
+from bmlibrarian.importers import pdf_extraction_pool
+from bmlibrarian.importers.pdf_converter import ConversionResult
+from bmlibrarian.importers.pdf_extraction_pool import (
+    ExtractionStatus,
+    PDFExtractionPool,
+    PDFExtractionResult,
+)
+
+
+def _conversion(text: str) -> ConversionResult:
+    return ConversionResult(
+        success=True, text=text, format="markdown", page_count=1,
+        converted_pages=1, char_count=len(text), converter_name="fake",
+    )
+
+
+class _FakeConn:
+    """Pool end of a worker pipe, scripted by the PDF file name."""
+
+    def __init__(self, worker: "_FakeWorker") -> None:
+        self.worker = worker
+        self._task: Optional[Tuple[str, str]] = None
+
+    def send(self, task: Tuple[str, str]) -> None:
+        self._task = task
+        self.worker.received.append(task)
+
+    def poll(self, timeout: float) -> bool:
+        return not self._task[0].endswith("slow.pdf")
+
+    def recv(self) -> Tuple[Any, ...]:
+        pdf_path, _ = self._task
+        if pdf_path.endswith("crash.pdf"):
+            self.worker.alive = False
+            raise EOFError
+        if pdf_path.endswith("bad.pdf"):
+            return None, None, "FileNotFoundError: missing"
+        fd, text_path = tempfile.mkstemp(dir=self.worker.spool_dir, suffix=".txt")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"# {Path(pdf_path).name}")
+        return _conversion(""), text_path, None
+
+
+class _FakeWorker:
+    """Stand-in for pdf_extraction_pool._Worker."""
+
+    def __init__(self, pid: int, spool_dir: str) -> None:
+        self.pid = pid
+        self.spool_dir = spool_dir
+        self.tasks_done = 0
+        self.alive = True
+        self.stopped = False
+        self.received: List[Tuple[str, str]] = []
+        self.conn = _FakeConn(self)
+
+    def stop(self) -> None:
+        self.stopped = True
+        self.alive = False
+
+    def kill(self) -> Optional[int]:
+        self.alive = False
+        return -11
+
+
+@pytest.fixture
+def fake_pool(monkeypatch: pytest.MonkeyPatch):
+    """Single-slot pool whose workers are _FakeWorker instances."""
+    pool = PDFExtractionPool(workers=1, max_tasks_per_worker=3, task_timeout=1)
+    spawned: List[_FakeWorker] = []
+
+    def spawn(index: int) -> _FakeWorker:
+        pool._count('workers_started')
+        worker = _FakeWorker(1000 + len(spawned), pool._spool_dir)
+        spawned.append(worker)
+        return worker
+
+    monkeypatch.setattr(pool, "_spawn_worker", spawn)
+    pool.spawned = spawned
+    yield pool
+    pool.close()
+
+
+def test_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        PDFExtractionPool(workers=0)
+    with pytest.raises(ValueError, match="max_tasks_per_worker"):
+        PDFExtractionPool(max_tasks_per_worker=0)
+
+
+def test_batch_reuses_worker_and_returns_text_in_order(fake_pool) -> None:
+    results = fake_pool.extract_batch(["a.pdf", "b.pdf"], converter_name="pymupdf4llm")
+
+    assert [r.text for r in results] == ["# a.pdf", "# b.pdf"]
+    assert all(r.status is ExtractionStatus.OK for r in results)
+    assert len(fake_pool.spawned) == 1
+    assert fake_pool.spawned[0].received[0] == ("a.pdf", "pymupdf4llm")
+    assert os.listdir(fake_pool._spool_dir) == []
+
+
+def test_worker_recycled_after_max_tasks(fake_pool) -> None:
+    results = fake_pool.extract_batch([f"{i}.pdf" for i in range(4)])
+
+    assert [r.worker_pid for r in results] == [1000, 1000, 1000, 1001]
+    assert fake_pool.spawned[0].stopped
+    assert fake_pool.stats()['workers_started'] == 2
+
+
+def test_timeout_kills_worker_and_next_task_gets_a_new_one(fake_pool) -> None:
+    slow, after = fake_pool.extract_batch(["slow.pdf", "next.pdf"])
+
+    assert slow.status is ExtractionStatus.TIMEOUT
+    assert slow.killed_worker and not slow.success and slow.text == ""
+    assert "timed out" in slow.error_message
+    assert not fake_pool.spawned[0].alive
+    assert after.success and after.worker_pid == 1001
+    assert fake_pool.stats()['timeouts'] == 1
+
+
+def test_crash_is_contained(fake_pool) -> None:
+    crashed, after = fake_pool.extract_batch(["crash.pdf", "ok.pdf"])
+
+    assert crashed.status is ExtractionStatus.CRASHED
+    assert "exit code -11" in crashed.error_message
+    assert after.success
+    assert fake_pool.stats()['crashes'] == 1
+
+
+def test_converter_exception_keeps_worker(fake_pool) -> None:
+    bad, ok = fake_pool.extract_batch(["bad.pdf", "ok.pdf"])
+
+    assert bad.status is ExtractionStatus.FAILED and not bad.killed_worker
+    assert bad.to_conversion_result().error_message == "FileNotFoundError: missing"
+    assert ok.worker_pid == bad.worker_pid
+
+
+def test_closed_pool_rejects_work(fake_pool) -> None:
+    fake_pool.close()
+
+    assert fake_pool.closed
+    with pytest.raises(RuntimeError, match="closed"):
+        fake_pool.submit("a.pdf")
+
+
+def test_to_conversion_result_passes_through_converter_output() -> None:
+    conversion = _conversion("text")
+    result = PDFExtractionResult(Path("a.pdf"), ExtractionStatus.OK, conversion=conversion)
+
+    assert result.to_conversion_result() is conversion
+
+
+def test_worker_main_spools_text(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Converter:
+        def convert(self, pdf_path: Path) -> ConversionResult:
+            return _conversion(f"text of {pdf_path.name}")
+
+    class _Pipe:
+        def __init__(self) -> None:
+            self.inbox: List[Any] = [("/x/a.pdf", "fake"), None]
+            self.sent: List[Any] = []
+
+        def recv(self) -> Any:
+            return self.inbox.pop(0)
+
+        def send(self, reply: Any) -> None:
+            self.sent.append(reply)
+
+    monkeypatch.setattr(pdf_extraction_pool, "get_converter", lambda name: _Converter())
+    pipe = _Pipe()
+
+    pdf_extraction_pool._worker_main(pipe, str(tmp_path), 0)
+
+    (conversion, text_path, error), = pipe.sent
+    assert error is None and conversion.text == ""
+    assert Path(text_path).read_text() == "text of a.pdf"
+
+
+def test_real_worker_process_round_trip(tmp_path: Path) -> None:
+    with PDFExtractionPool(workers=1, task_timeout=60) as pool:
+        first, second = pool.extract_batch([tmp_path / "missing.pdf"] * 2)
+
+    # The converter raises (missing file or missing PyMuPDF) inside the worker
+    assert first.status is ExtractionStatus.FAILED
+    assert first.worker_pid == second.worker_pid
+    assert pool.stats()['workers_started'] == 1
+
+
+def test_medrxiv_quarantines_pdfs_that_kill_a_worker(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fake_pool
+) -> None:
+    from bmlibrarian.importers import medrxiv_importer
+
+    for name in ("ok.pdf", "crash.pdf"):
+        (tmp_path / name).write_bytes(b"%PDF-1.4")
+    importer = medrxiv_importer.MedRxivImporter.__new__(medrxiv_importer.MedRxivImporter)
+    importer.pdf_base_dir = tmp_path
+    monkeypatch.setattr(medrxiv_importer, "pymupdf4llm", object())
+    monkeypatch.setattr(medrxiv_importer, "get_extraction_pool", lambda: fake_pool)
+
+    texts = importer.extract_full_text_batch(["ok.pdf", "crash.pdf", "gone.pdf"])
+
+    assert texts == {"ok.pdf": "# ok.pdf", "crash.pdf": "", "gone.pdf": ""}
+    assert (tmp_path / "failed" / "crash.pdf").exists()
+    assert fake_pool.spawned[0].received[0][1] == "pymupdf4llm"
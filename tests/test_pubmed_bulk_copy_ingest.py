@@ -0,0 +1,270 @@
+"""Tests for the COPY-based bulk ingest mode of PubMedBulkImporter.
+
+Hermetic: uses a fake connection that records COPY rows and SQL; no
+PostgreSQL required.
+"""
+
+import gzip
+import inspect
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pytest
+
+from bmlibrarian.importers.pubmed_bulk_importer import (
+    INGEST_MODE_COPY,
+    INGEST_MODE_ROW,
+    STAGING_COLUMNS,
+    STAGING_TABLE,
+    PubMedBulkImporter,
+)
+
+
+class _FakeCopy:
+    """Stand-in for a psycopg Copy object recording written rows."""
+
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self._conn = conn
+
+    def set_types(self, types: List[str]) -> None:
+        self._conn.copy_types = types
+
+    def write_row(self, row: Tuple) -> None:
+        self._conn.copied_rows.append(row)
+
+    def __enter__(self) -> "_FakeCopy":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeCursor:
+    """Cursor stand-in recording queries, COPY rows and merge results."""
+
+    def __init__(self, conn: "_FakeConnection") -> None:
+        self._conn = conn
+        self.rowcount = 0
+        self._last: List[Tuple] = []
+
+    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+        self._conn.executed.append((query, params))
+        if "information_schema.tables" in query:
+            self._last = [(self._conn.transparency_exists,)]
+        elif "INSERT INTO document" in query:
+            self._last = [(flag,) for flag in self._conn.merge_flags]
+        elif "transparency.document_metadata" in query:
+            self.rowcount = self._conn.metadata_rowcount
+            self._last = []
+        else:
+            self._last = []
+
+    def copy(self, statement: str) -> _FakeCopy:
+        self._conn.copy_statements.append(statement)
+        return _FakeCopy(self._conn)
+
+    def fetchone(self) -> Tuple:
+        return self._last[0]
+
+    def fetchall(self) -> List[Tuple]:
+        return self._last
+
+    def __enter__(self) -> "_FakeCursor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+
+class _FakeConnection:
+    """Connection stand-in shared by the fake DB manager."""
+
+    def __init__(self, merge_flags: List[bool], transparency_exists: bool = True) -> None:
+        self.executed: List[Tuple[str, Optional[tuple]]] = []
+        self.copy_statements: List[str] = []
+        self.copied_rows: List[Tuple] = []
+        self.copy_types: Optional[List[str]] = None
+        self.merge_flags = merge_flags
+        self.transparency_exists = transparency_exists
+        self.metadata_rowcount = 1
+        self.commits = 0
+
+    def cursor(self, *args: Any, **kwargs: Any) -> _FakeCursor:
+        return _FakeCursor(self)
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        yield
+
+    def commit(self) -> None:
+        self.commits += 1
+
+
+class _FakeDBManager:
+    """DatabaseManager stand-in exposing get_connection() as a context manager."""
+
+    def __init__(self, conn: _FakeConnection) -> None:
+        self.conn = conn
+
+    @contextmanager
+    def get_connection(self) -> Iterator[_FakeConnection]:
+        yield self.conn
+
+
+def _make_importer(conn: _FakeConnection, ingest_mode: str = INGEST_MODE_COPY) -> PubMedBulkImporter:
+    """Build an importer bypassing __init__'s database lookups."""
+    importer = PubMedBulkImporter.__new__(PubMedBulkImporter)
+    importer.db_manager = _FakeDBManager(conn)
+    importer.source_id = 7
+    importer.tracker = None
+    importer.ingest_mode = ingest_mode
+    importer._transparency_schema_exists = None
+    return importer
+
+
+def _article(pmid: str, **overrides: Any) -> dict:
+    article = {
+        'pmid': pmid,
+        'doi': '',
+        'title': f'Title {pmid}',
+        'abstract': '',
+        'authors': ['Smith J'],
+        'publication': 'J Test',
+        'publication_date': '2024-01-02',
+        'url': f'https://pubmed.ncbi.nlm.nih.gov/{pmid}/',
+        'mesh_terms': ['Humans'],
+        'keywords': [],
+        'transparency_metadata': {},
+    }
+    article.update(overrides)
+    return article
+
+
+def test_invalid_ingest_mode_rejected(tmp_path: Path) -> None:
+    """Unknown ingest modes fail fast before touching the database."""
+    with pytest.raises(ValueError, match="ingest_mode"):
+        PubMedBulkImporter(data_dir=str(tmp_path), ingest_mode='turbo')
+
+
+def test_copy_mode_streams_batch_and_merges_once() -> None:
+    """One COPY and one set-based merge per batch, no per-article SELECTs."""
+    conn = _FakeConnection(merge_flags=[True, False, True])
+    importer = _make_importer(conn)
+
+    count = importer._store_article_batch([_article('1'), _article('2'), _article('3')])
+
+    assert count == 3
+    assert len(conn.copy_statements) == 1
+    assert STAGING_TABLE in conn.copy_statements[0]
+    assert len(conn.copied_rows) == 3
+
+    merges = [q for q, _ in conn.executed if "INSERT INTO document" in q]
+    assert len(merges) == 1
+    assert "ON CONFLICT (source_id, external_id) DO UPDATE" in merges[0]
+    assert not any(
+        "SELECT id FROM document" in q for q, _ in conn.executed
+    ), "COPY mode must not look up articles one by one"
+    assert conn.commits == 1
+
+
+def test_staging_row_normalizes_empty_values() -> None:
+    """Empty strings become NULL so the merge keeps existing values."""
+    metadata = {
+        'grants': [{'agency': 'NIH', 'grant_id': 'R01', 'country': 'US'}],
+        'publication_types': ['Journal Article'],
+        'is_retracted': True,
+    }
+    row = PubMedBulkImporter._staging_row(
+        4, _article('42', doi='', abstract='', publication='', transparency_metadata=metadata)
+    )
+    values = dict(zip(STAGING_COLUMNS, row))
+
+    assert values['seq'] == 4
+    assert values['external_id'] == '42'
+    assert values['doi'] is None
+    assert values['abstract'] is None
+    assert values['publication'] is None
+    assert values['grants'][0]['agency'] == 'NIH'
+    assert values['publication_types'] == ['Journal Article']
+    assert values['is_retracted'] is True
+    assert values['author_affiliations'] is None
+
+
+def test_jsonb_columns_are_not_pre_serialized() -> None:
+    """COPY's jsonb dumper encodes values itself; strings would be double-encoded."""
+    metadata = {
+        'grants': [{'agency': 'NIH', 'grant_id': 'R01', 'country': 'US'}],
+        'author_affiliations': [{'author': 'A B', 'affiliations': ['Uni']}],
+    }
+    conn = _FakeConnection(merge_flags=[True])
+    importer = _make_importer(conn)
+
+    importer._store_article_batch([_article('7', transparency_metadata=metadata)])
+
+    copy_types = dict(zip(STAGING_COLUMNS, conn.copy_types))
+    row = dict(zip(STAGING_COLUMNS, conn.copied_rows[0]))
+    jsonb_columns = [name for name, col_type in copy_types.items() if col_type == 'jsonb']
+    assert jsonb_columns == ['grants', 'author_affiliations']
+    for name in jsonb_columns:
+        assert not isinstance(row[name], str)
+        assert row[name] == metadata[name]
+
+
+def test_duplicate_pmids_resolved_to_last_occurrence() -> None:
+    """A PMID repeated within a batch must not hit ON CONFLICT twice."""
+    conn = _FakeConnection(merge_flags=[True])
+    importer = _make_importer(conn)
+
+    importer._store_article_batch([_article('9', title='old'), _article('9', title='new')])
+
+    merge = next(q for q, _ in conn.executed if "INSERT INTO document" in q)
+    assert "DISTINCT ON (s.external_id)" in merge
+    assert "s.seq DESC" in merge
+    assert [row[0] for row in conn.copied_rows] == [0, 1]
+
+
+def test_transparency_merge_skipped_without_schema() -> None:
+    """Missing transparency schema is probed once and then skipped."""
+    conn = _FakeConnection(merge_flags=[True], transparency_exists=False)
+    importer = _make_importer(conn)
+
+    importer._store_article_batch([_article('1')])
+    importer._store_article_batch([_article('2')])
+
+    probes = [q for q, _ in conn.executed if "information_schema.tables" in q]
+    assert len(probes) == 1
+    assert not any(
+        "INSERT INTO transparency.document_metadata" in q for q, _ in conn.executed
+    )
+
+
+def test_import_file_reports_rows_per_second(tmp_path: Path) -> None:
+    """import_file() reports elapsed time and throughput in its stats."""
+    xml = (
+        "<PubmedArticleSet>"
+        "<PubmedArticle><MedlineCitation><PMID>101</PMID>"
+        "<Article><ArticleTitle>First</ArticleTitle>"
+        "<Journal><Title>J</Title></Journal></Article>"
+        "</MedlineCitation></PubmedArticle>"
+        "</PubmedArticleSet>"
+    )
+    filepath = tmp_path / "pubmed25n0001.xml.gz"
+    with gzip.open(filepath, 'wt') as fh:
+        fh.write(xml)
+
+    conn = _FakeConnection(merge_flags=[True])
+    importer = _make_importer(conn)
+
+    stats = importer.import_file(filepath, batch_size=10)
+
+    assert stats['articles_parsed'] == 1
+    assert stats['articles_imported'] == 1
+    assert stats['elapsed_seconds'] > 0
+    assert stats['rows_per_second'] > 0
+
+
+def test_row_mode_still_default() -> None:
+    """The per-row path remains the default ingest mode."""
+    default = inspect.signature(PubMedBulkImporter.__init__).parameters['ingest_mode'].default
+    assert default == INGEST_MODE_ROW
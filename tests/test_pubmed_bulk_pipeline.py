@@ -0,0 +1,148 @@
+"""Tests for the parallel PubMed parse/write pipeline.
+
+Runs real parser processes over small generated .xml.gz files; the DB writer
+stage stores batches in memory instead of PostgreSQL.
+"""
+
+import gzip
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+
+from bmlibrarian.importers.pubmed_bulk_importer import PubMedBulkImporter
+from bmlibrarian.importers.pubmed_bulk_pipeline import (
+    ParallelImportPipeline,
+    PipelineStats,
+)
+
+
+def _write_pubmed_file(path: Path, articles: List[Tuple[str, str]]) -> Path:
+    """Write a minimal PubMed XML file with (pmid, title) articles."""
+    parts = ["<PubmedArticleSet>"]
+    for pmid, title in articles:
+        parts.append(
+            "<PubmedArticle><MedlineCitation>"
+            f"<PMID>{pmid}</PMID>"
+            f"<Article><ArticleTitle>{title}</ArticleTitle>"
+            "<Journal><Title>J Test</Title></Journal></Article>"
+            "</MedlineCitation></PubmedArticle>"
+        )
+    parts.append("</PubmedArticleSet>")
+    with gzip.open(path, 'wt') as fh:
+        fh.write("".join(parts))
+    return path
+
+
+class _RecordingTracker:
+    """Download tracker stand-in recording mark_processed calls."""
+
+    def __init__(self) -> None:
+        self.processed: List[Tuple[str, int, object]] = []
+
+    def mark_processed(self, filename: str, articles_count: int = 0, error=None) -> None:
+        self.processed.append((filename, articles_count, error))
+
+
+def _make_importer() -> Tuple[PubMedBulkImporter, List[Dict]]:
+    """Importer whose batch store appends to an in-memory write log."""
+    importer = PubMedBulkImporter.__new__(PubMedBulkImporter)
+    importer.tracker = _RecordingTracker()
+    writes: List[Dict] = []
+    lock = threading.Lock()
+
+    def store(articles: List[Dict]) -> int:
+        with lock:
+            writes.extend(articles)
+        return len(articles)
+
+    importer._store_article_batch = store
+    return importer, writes
+
+
+@pytest.mark.slow
+def test_later_files_never_overwrite_newer_records(tmp_path: Path) -> None:
+    """Writes for a PMID follow file order even with parallel parsers and writers."""
+    files = [
+        _write_pubmed_file(
+            tmp_path / f"pubmed25n{n:04d}.xml.gz",
+            [(str(pmid), f"v{n}") for pmid in range(1, 41)],
+        )
+        for n in range(1, 5)
+    ]
+    importer, writes = _make_importer()
+
+    pipeline = ParallelImportPipeline(
+        importer, parser_processes=3, writer_threads=2, batch_size=7, queue_depth=4
+    )
+    stats = pipeline.run(files)
+
+    assert stats['files_processed'] == 4
+    assert stats['total_articles'] == 160
+    assert stats['total_errors'] == 0
+
+    # Every PMID was written once per file, in file order
+    versions: Dict[str, List[str]] = {}
+    for article in writes:
+        versions.setdefault(article['pmid'], []).append(article['title'])
+    assert set(versions) == {str(pmid) for pmid in range(1, 41)}
+    for titles in versions.values():
+        assert titles == ['v1', 'v2', 'v3', 'v4']
+
+    assert [name for name, _, _ in importer.tracker.processed] == [f.name for f in files]
+
+    pipeline_stats = stats['pipeline']
+    assert pipeline_stats['parse_articles'] == 160
+    assert pipeline_stats['write_articles'] == 160
+    assert pipeline_stats['write_rows_per_second'] > 0
+
+
+@pytest.mark.slow
+def test_corrupt_file_marked_failed_without_blocking_later_files(tmp_path: Path) -> None:
+    """A file that fails to parse is recorded as an error; later files still import."""
+    bad = tmp_path / "pubmed25n0001.xml.gz"
+    bad.write_bytes(b"not a gzip file")
+    good = _write_pubmed_file(tmp_path / "pubmed25n0002.xml.gz", [("5", "ok")])
+    importer, writes = _make_importer()
+
+    stats = ParallelImportPipeline(importer, parser_processes=2).run([bad, good])
+
+    assert [a['pmid'] for a in writes] == ['5']
+    assert stats['total_errors'] == 1
+    (bad_name, _, bad_error), (good_name, good_count, good_error) = importer.tracker.processed
+    assert bad_name == bad.name and "Invalid gzip file" in bad_error
+    assert good_name == good.name and good_count == 1 and good_error is None
+
+
+def test_pmid_sharding_is_stable() -> None:
+    """A PMID always maps to the same writer."""
+    importer, _ = _make_importer()
+    pipeline = ParallelImportPipeline(importer, parser_processes=1, writer_threads=3)
+
+    assert pipeline._writer_for('30') == 0
+    assert pipeline._writer_for('31') == 1
+    assert pipeline._writer_for('PMC77') == pipeline._writer_for('PMC77')
+
+
+def test_invalid_sizes_rejected() -> None:
+    importer, _ = _make_importer()
+    with pytest.raises(ValueError, match="writer_threads"):
+        ParallelImportPipeline(importer, writer_threads=0)
+
+
+def test_stats_snapshot_rates() -> None:
+    """Per-worker rates divide by busy time; wall rates by elapsed time."""
+    stats = PipelineStats(files_total=2)
+    stats.record_parsed_batch(100)
+    stats.record_parsed_file(parse_seconds=2.0)
+    stats.record_written_batch(100, seconds=0.5)
+    stats.record_queue_depth(3)
+    stats.record_queue_depth(1)
+
+    snap = stats.snapshot()
+
+    assert snap['parse_rows_per_second_per_worker'] == pytest.approx(50.0)
+    assert snap['write_rows_per_second_per_worker'] == pytest.approx(200.0)
+    assert snap['write_rows_per_second'] > 0
+    assert snap['max_queue_depth'] == 3
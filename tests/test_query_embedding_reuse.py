@@ -0,0 +1,142 @@
+"""
+Tests for client-side query embedding reuse in semantic search.
+
+Hermetic: the database cursor and the embedding client are mocks, and
+vector_param is bypassed (it needs a live connection to look up pgvector).
+"""
+
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg.errors import UndefinedFunction
+
+import bmlibrarian.agents.semantic_query_agent as semantic_query_agent
+import bmlibrarian.qa.document_qa as document_qa
+from bmlibrarian.agents.semantic_query_agent import SearchMode, SemanticQueryAgent
+
+VECTOR = [0.25, 0.5, 0.75, 1.0]
+
+
+def _db_manager(fetch_rows: List[list], execute=None) -> tuple:
+    """Return (db_manager, cursor) mocks; fetchall() returns fetch_rows in turn."""
+    db_manager = MagicMock()
+    conn = db_manager.get_connection.return_value.__enter__.return_value
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.side_effect = fetch_rows
+    if execute is not None:
+        cursor.execute.side_effect = execute
+    return db_manager, cursor
+
+
+def _executed_sql(cursor: MagicMock) -> List[str]:
+    return [call.args[0] for call in cursor.execute.call_args_list]
+
+
+@pytest.fixture(autouse=True)
+def _plain_vector_param(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(semantic_query_agent, "vector_param", lambda conn, vector: vector)
+    monkeypatch.setattr(document_qa, "vector_param", lambda conn, vector: vector)
+
+
+@pytest.fixture
+def agent() -> SemanticQueryAgent:
+    agent = SemanticQueryAgent(max_query_rephrasings=0)
+    agent._llm_client = MagicMock()
+    agent._llm_client.embed_batch.side_effect = lambda texts, model: SimpleNamespace(
+        embeddings=[VECTOR for _ in texts]
+    )
+    return agent
+
+
+def test_threshold_sweep_embeds_query_once(agent: SemanticQueryAgent) -> None:
+    """Every threshold retry reuses one client-side embedding."""
+    db_manager, cursor = _db_manager([[]] * agent.max_threshold_iterations)
+
+    result = agent.search_document(document_id=1, query="q", db_manager=db_manager)
+
+    assert not result.success
+    assert cursor.execute.call_count > 1
+    assert agent._llm_client.embed_batch.call_count == 1
+    assert all(
+        "chunksearch_document_by_embedding" in sql for sql in _executed_sql(cursor)
+    )
+    params = cursor.execute.call_args_list[0].args[1]
+    assert params[0] == 1 and list(params[1]) == VECTOR
+
+
+def test_hybrid_passes_vector_and_text(agent: SemanticQueryAgent) -> None:
+    """The hybrid variant still receives the text for keyword matching."""
+    row = (7, 0, 0.9, "text", 0.8, 0.1, "both")
+    db_manager, cursor = _db_manager([[row]])
+
+    result = agent.search_document(
+        document_id=1, query="heart rate", db_manager=db_manager,
+        search_mode=SearchMode.HYBRID,
+    )
+
+    assert result.success and result.chunks[0].match_source == "both"
+    sql, params = cursor.execute.call_args.args
+    assert "hybrid_chunksearch_document_by_embedding" in sql
+    assert sql.count("%s") == len(params) == 7
+    assert params[2] == "heart rate"
+
+
+def test_expansion_embeds_both_variants_in_one_call(
+    agent: SemanticQueryAgent, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Expanded and original queries share one embed_batch round trip."""
+    monkeypatch.setattr(agent, "expand_query", lambda query: {"expanded": "expanded q"})
+    db_manager, _ = _db_manager([[]] * (2 * agent.max_threshold_iterations))
+
+    agent.search_with_expansion(document_id=1, query="q", db_manager=db_manager)
+
+    agent._llm_client.embed_batch.assert_called_once()
+    assert agent._llm_client.embed_batch.call_args.args[0] == ["expanded q", "q"]
+
+
+def test_missing_migration_falls_back_to_text_functions(agent: SemanticQueryAgent) -> None:
+    """Without migration 032 the agent switches to the text functions for good."""
+    def execute(sql, params):
+        if "_by_embedding" in sql:
+            raise UndefinedFunction("function does not exist")
+
+    db_manager, cursor = _db_manager([[(1, 0, 0.9, "text")]] * 2, execute=execute)
+
+    first = agent.search_document(document_id=1, query="q", db_manager=db_manager)
+    second = agent.search_document(document_id=1, query="q", db_manager=db_manager)
+
+    assert first.success and second.success
+    assert agent._embedding_functions_available is False
+    assert [("_by_embedding" in sql) for sql in _executed_sql(cursor)] == [True, False, False]
+
+
+def test_embedding_failure_uses_server_side_embedding(agent: SemanticQueryAgent) -> None:
+    """If Ollama cannot embed the query, the text function is called instead."""
+    agent._llm_client.embed_batch.side_effect = ConnectionError("ollama down")
+    db_manager, cursor = _db_manager([[(1, 0, 0.9, "text")]])
+
+    result = agent.search_document(document_id=1, query="q", db_manager=db_manager)
+
+    assert result.success
+    sql, params = cursor.execute.call_args.args
+    assert "chunksearch_document(" in sql and params[1] == "q"
+
+
+def test_document_qa_fulltext_search_reuses_embedding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The thresholded search and the diagnostic re-query share one embedding."""
+    client = MagicMock()
+    client.embed_batch.return_value = SimpleNamespace(embeddings=[VECTOR])
+    monkeypatch.setattr(document_qa, "LLMClient", lambda **kwargs: client)
+    db_manager, cursor = _db_manager([[], [(1, 0, 0.2, "preview")]])
+    cursor.fetchone.return_value = (3,)
+
+    chunks = document_qa._semantic_search_fulltext(1, "q", 0.5, 5, db_manager)
+
+    assert chunks == []
+    client.embed_batch.assert_called_once_with(["q"], model=document_qa.DEFAULT_EMBEDDING_MODEL)
+    searches = cursor.execute.call_args_list[1:]
+    assert len(searches) == 2
+    assert all("chunksearch_document_by_embedding" in call.args[0] for call in searches)
+    assert all(call.args[1][1] == VECTOR for call in searches)
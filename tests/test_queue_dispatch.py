@@ -0,0 +1,145 @@
+"""
+Tests for batched task claiming and event-driven dispatch in the agent queue.
+
+Hermetic: uses temporary SQLite files and a trivial in-process agent.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from bmlibrarian.agents import AgentOrchestrator, QueueManager, TaskPriority, TaskStatus
+
+# Long enough that a test finishing well inside it proves no polling sleep ran
+IDLE_POLL_SECONDS = 5.0
+
+
+@pytest.fixture
+def queue(tmp_path: Path) -> QueueManager:
+    manager = QueueManager(str(tmp_path / "queue.db"))
+    yield manager
+    manager.close()
+
+
+class _EchoAgent:
+    """Stand-in agent whose method returns its input."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def echo(self, value: int) -> dict:
+        self.calls.append(value)
+        return {"value": value}
+
+
+def test_batch_claim_respects_priority_and_never_duplicates(queue: QueueManager) -> None:
+    """Batched claims return tasks in dequeue order, each exactly once."""
+    low = queue.add_batch_tasks("agent", "echo", [{"value": i} for i in range(3)],
+                                priority=TaskPriority.LOW)
+    urgent = queue.add_task("agent", "echo", {"value": 99}, priority=TaskPriority.URGENT)
+
+    first = queue.get_next_tasks("agent", limit=2)
+    second = queue.get_next_tasks("agent", limit=10)
+
+    assert [t.id for t in first] == [urgent, low[0]]
+    assert [t.id for t in second] == low[1:]
+    assert all(t.status == TaskStatus.PROCESSING for t in first + second)
+    assert queue.get_next_tasks("agent") == []
+
+
+def test_release_returns_claimed_tasks_to_pending(queue: QueueManager) -> None:
+    """Released tasks can be claimed again without consuming a retry."""
+    queue.add_batch_tasks("agent", "echo", [{"value": i} for i in range(3)])
+    claimed = queue.get_next_tasks("agent", limit=3)
+
+    assert queue.release_tasks([t.id for t in claimed[1:]]) == 2
+
+    task = queue.get_task_status(claimed[1].id)
+    assert task.status == TaskStatus.PENDING and task.retry_count == 0
+    assert {t.id for t in queue.get_next_tasks("agent")} == {t.id for t in claimed[1:]}
+
+
+def test_start_task_resets_started_at_for_stuck_detection(queue: QueueManager) -> None:
+    """A task waiting behind its batch is not reported stuck once it starts."""
+    queue.add_batch_tasks("agent", "echo", [{"value": i} for i in range(2)])
+    claimed = queue.get_next_tasks("agent", limit=2)
+    with queue._connection() as conn:
+        conn.execute("UPDATE queue_tasks SET started_at = '2000-01-01T00:00:00+00:00'")
+        conn.commit()
+
+    assert queue.start_task(claimed[1].id)
+    assert queue.recover_stuck_tasks(stuck_timeout_minutes=30) == 1
+
+    assert queue.get_task_status(claimed[0].id).status == TaskStatus.PENDING
+    assert queue.get_task_status(claimed[1].id).status == TaskStatus.PROCESSING
+    # The recovered claim can no longer be started by this worker
+    assert not queue.start_task(claimed[0].id)
+
+
+def test_wait_for_tasks_is_woken_by_producer(queue: QueueManager) -> None:
+    """A waiter returns as soon as another thread adds a task."""
+    generation = queue.get_task_generation()
+    threading.Timer(0.05, queue.add_task, args=("agent", "echo", {"value": 1})).start()
+
+    start = time.perf_counter()
+    woken = queue.wait_for_tasks(IDLE_POLL_SECONDS, since_generation=generation)
+
+    assert woken
+    assert time.perf_counter() - start < 1.0
+    # A task added before the wait began is not missed either
+    assert queue.wait_for_tasks(IDLE_POLL_SECONDS, since_generation=generation)
+
+
+def test_thread_connection_is_reused(queue: QueueManager) -> None:
+    """Repeated calls on one thread share a connection; threads do not."""
+    other = []
+    thread = threading.Thread(target=lambda: other.append(queue._thread_connection()))
+    thread.start()
+    thread.join()
+
+    assert queue._thread_connection() is queue._thread_connection()
+    assert other[0] is not queue._thread_connection()
+
+
+def test_idle_orchestrator_dispatches_without_polling_delay(queue: QueueManager) -> None:
+    """Work submitted to an idle worker runs long before the poll interval."""
+    agent = _EchoAgent()
+    orchestrator = AgentOrchestrator(queue, polling_interval=IDLE_POLL_SECONDS)
+    orchestrator.register_agent("agent", agent)
+    orchestrator.start_processing()
+    try:
+        time.sleep(0.1)  # let the worker go idle
+        start = time.perf_counter()
+        task_ids = orchestrator.submit_batch_tasks("agent", "echo", [{"value": i} for i in range(20)])
+        while queue.get_queue_stats("agent")[TaskStatus.COMPLETED.value] < 20:
+            assert time.perf_counter() - start < 2.0, "tasks were not dispatched promptly"
+            time.sleep(0.01)
+    finally:
+        stop_start = time.perf_counter()
+        orchestrator.stop_processing()
+
+    assert time.perf_counter() - stop_start < 1.0
+    assert agent.calls == list(range(20))
+    assert queue.get_task_status(task_ids[-1]).result == {"value": 19}
+
+
+def test_stop_mid_batch_releases_unstarted_tasks(queue: QueueManager) -> None:
+    """Tasks claimed but not started when stopping go back to pending."""
+    orchestrator = AgentOrchestrator(queue, polling_interval=IDLE_POLL_SECONDS, claim_batch_size=5)
+
+    class _StoppingAgent(_EchoAgent):
+        def echo(self, value: int) -> dict:
+            orchestrator._stop_processing.set()
+            return super().echo(value)
+
+    agent = _StoppingAgent()
+    queue.add_batch_tasks("agent", "echo", [{"value": i} for i in range(5)])
+
+    orchestrator._process_agent_tasks("agent", agent)
+
+    stats = queue.get_queue_stats("agent")
+    assert agent.calls == [0]
+    assert stats[TaskStatus.COMPLETED.value] == 1
+    assert stats[TaskStatus.PENDING.value] == 4
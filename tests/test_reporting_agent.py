@@ -404,5 +404,47 @@ class TestReportingAgentIntegration(unittest.TestCase):
         self.assertEqual(len(errors), 0)
 
 
+    def test_map_phase_runs_batches_concurrently_in_order(self):
+        """Map-phase batches overlap but summaries reach reduce in batch order."""
+        import threading
+        import time
+
+        citations = [
+            Citation(
+                passage=f"Finding {i}",
+                summary=f"Summary {i}",
+                relevance_score=1.0 - i / 100,
+                document_id=str(1000 + i),
+                document_title=f"Study {i}",
+                authors=["Author, A."],
+                publication_date="2023-01-01",
+            )
+            for i in range(12)
+        ]
+        self.agent.map_batch_size = 3
+        self.agent.map_max_concurrent = 4
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def summarize(user_question, batch_citation_refs, batch_number, total_batches):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05 * (total_batches - batch_number))
+            with lock:
+                active["now"] -= 1
+            if batch_number == 2:
+                raise RuntimeError("LLM timeout")
+            return {"batch_number": batch_number, "themes": []}
+
+        reduce_mock = Mock(return_value=None)
+        with patch.object(self.agent, "_map_phase_summarize_batch", side_effect=summarize), \
+                patch.object(self.agent, "_reduce_phase_synthesize", reduce_mock):
+            self.agent.map_reduce_synthesis("question", citations, {})
+
+        summaries = reduce_mock.call_args.kwargs["batch_summaries"]
+        self.assertEqual([s["batch_number"] for s in summaries], [1, 3, 4])
+        self.assertEqual(active["peak"], 4)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,227 @@
+"""
+Tests for bounded-concurrency relevance scoring.
+
+Hermetic: LLM calls are replaced with sleeps; no Ollama required.
+"""
+
+import json
+import re
+import threading
+import time
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from bmlibrarian.agents.scoring_agent import DocumentScoringAgent
+from bmlibrarian.agents.systematic_review import PaperData, RelevanceScorer
+from bmlibrarian.agents.utils.concurrency import ordered_concurrent_map
+
+
+class _ConcurrencyProbe:
+    """Callable that records the peak number of simultaneous calls."""
+
+    def __init__(self, delay_for) -> None:
+        self._delay_for = delay_for
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def __call__(self, item: Any) -> Any:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self._delay_for(item))
+            return item
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_ordered_map_keeps_input_order_and_bounds_in_flight() -> None:
+    """Later items finishing first are still yielded in input order."""
+    probe = _ConcurrencyProbe(lambda i: 0.05 * (5 - i))
+
+    results = [result for _, result, _ in ordered_concurrent_map(probe, range(6), max_in_flight=3)]
+
+    assert results == list(range(6))
+    assert probe.peak == 3
+
+
+def test_ordered_map_yields_errors_per_item() -> None:
+    """One failing call does not abort the others."""
+    def func(i: int) -> int:
+        if i == 1:
+            raise ValueError("boom")
+        return i * 10
+
+    outcomes = list(ordered_concurrent_map(func, [0, 1, 2], max_in_flight=2))
+
+    assert [(item, result) for item, result, _ in outcomes] == [(0, 0), (1, None), (2, 20)]
+    assert isinstance(outcomes[1][2], ValueError)
+
+
+def test_batch_evaluate_documents_scores_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Documents are scored in parallel but results stay in input order."""
+    agent = DocumentScoringAgent(show_model_info=False, max_concurrent_requests=4)
+    probe = _ConcurrencyProbe(lambda doc: 0.1 if doc['id'] % 2 else 0.01)
+    monkeypatch.setattr(
+        agent, 'evaluate_document',
+        lambda question, doc: {'score': probe(doc)['id'] % 6, 'reasoning': doc['title']},
+    )
+    documents = [{'id': i, 'title': f'Doc {i}'} for i in range(8)]
+    progress: List[str] = []
+    agent.callback = lambda step, data: progress.append(data) if step == 'document_evaluation_progress' else None
+
+    results = agent.batch_evaluate_documents("question", documents)
+
+    assert [doc['id'] for doc, _ in results] == list(range(8))
+    assert [r['reasoning'] for _, r in results] == [d['title'] for d in documents]
+    assert progress == [f"Document {i}/8" for i in range(1, 9)]
+    assert probe.peak == 4
+
+
+def test_round_robin_across_ollama_hosts() -> None:
+    """Requests alternate between the configured hosts."""
+    agent = DocumentScoringAgent(
+        show_model_info=False,
+        ollama_hosts=["http://gpu1:11434", "http://gpu2:11434"],
+    )
+
+    hosts = [agent._next_llm_client().ollama_host for _ in range(4)]
+
+    assert agent.host == "http://gpu1:11434"
+    assert hosts == ["http://gpu1:11434", "http://gpu2:11434"] * 2
+
+
+def _fake_ollama_request(messages: List[dict], **kwargs: Any) -> str:
+    """Score document N as N % 6, finishing later documents first."""
+    doc_id = int(re.search(r"Title: \w+ (\d+)", messages[0]['content']).group(1))
+    time.sleep(0.02 * (6 - doc_id % 6))
+    return json.dumps({'score': doc_id % 6, 'reasoning': f'doc {doc_id}'})
+
+
+def _event_recorder(events: List[tuple]):
+    """Callback that records (thread, step, data) for every event."""
+    return lambda step, data: events.append((threading.current_thread(), step, data))
+
+
+def test_batch_evaluate_documents_callbacks_on_caller_thread_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Per-document evaluation events replay on the caller's thread in input order."""
+    events: List[tuple] = []
+    agent = DocumentScoringAgent(
+        show_model_info=False, max_concurrent_requests=3, callback=_event_recorder(events)
+    )
+    monkeypatch.setattr(agent, '_make_ollama_request', _fake_ollama_request)
+    documents = [{'id': i, 'title': f'Doc {i}'} for i in range(5)]
+
+    agent.batch_evaluate_documents("question", documents)
+
+    assert {thread for thread, _, _ in events} == {threading.current_thread()}
+    per_document = [
+        (step, data) for _, step, data in events
+        if step in ('evaluation_completed', 'document_evaluation_progress')
+    ]
+    assert per_document == [
+        pair for i in range(5)
+        for pair in (('evaluation_completed', f'Score: {i}'),
+                     ('document_evaluation_progress', f'Document {i + 1}/5'))
+    ]
+
+
+def test_score_batch_callbacks_on_caller_thread_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Scorer and scoring-agent events replay on the caller's thread in input order."""
+    events: List[tuple] = []
+    scorer = RelevanceScorer(
+        research_question="q", max_concurrent=3, callback=_event_recorder(events)
+    )
+    agent = DocumentScoringAgent(show_model_info=False, callback=scorer._call_callback)
+    monkeypatch.setattr(agent, '_make_ollama_request', _fake_ollama_request)
+    scorer._scoring_agent = agent
+    papers = [PaperData(document_id=i, title=f"Paper {i}", authors=[], year=2020) for i in range(5)]
+
+    scorer.score_batch(papers, evaluate_inclusion=False)
+
+    assert {thread for thread, _, _ in events} == {threading.current_thread()}
+    per_paper = [
+        step if step != 'scoring_completed' else data
+        for _, step, data in events
+        if step in ('scoring_started', 'evaluation_started', 'scoring_completed')
+    ]
+    assert per_paper == [
+        step for i in range(5)
+        for step in ('scoring_started', 'evaluation_started', f'Score: {float(i)}/5')
+    ]
+
+
+def test_score_batch_saves_in_order_while_scoring_concurrently() -> None:
+    """save_callback and progress see papers in input order."""
+    papers = [
+        PaperData(document_id=i, title=f"Paper {i}", authors=["Smith J"], year=2020)
+        for i in range(6)
+    ]
+    probe = _ConcurrencyProbe(lambda document: 0.1 if document['id'] == 0 else 0.01)
+    agent = MagicMock()
+    agent.evaluate_document.side_effect = lambda user_question, document: {
+        'score': 1 + probe(document)['id'] % 5,
+        'reasoning': 'ok',
+    }
+    scorer = RelevanceScorer(research_question="q", max_concurrent=3)
+    scorer._scoring_agent = agent
+    saved: List[int] = []
+    progress: List[int] = []
+
+    result = scorer.score_batch(
+        papers,
+        evaluate_inclusion=False,
+        progress_callback=lambda current, total: progress.append(current),
+        save_callback=lambda scored: saved.append(scored.paper.document_id),
+    )
+
+    assert saved == list(range(6))
+    assert progress == list(range(1, 7))
+    assert [p.paper.document_id for p in result.scored_papers] == list(range(6))
+    assert probe.peak == 3
+
+
+def test_score_batch_save_failure_marks_paper_failed() -> None:
+    """A save error still fails only that paper, as in sequential scoring."""
+    papers = [PaperData(document_id=i, title=f"Paper {i}", authors=[], year=2020) for i in range(3)]
+    agent = MagicMock()
+    agent.evaluate_document.return_value = {'score': 4, 'reasoning': 'ok'}
+    scorer = RelevanceScorer(research_question="q", max_concurrent=2)
+    scorer._scoring_agent = agent
+
+    def save(scored: Any) -> None:
+        if scored.paper.document_id == 1:
+            raise RuntimeError("db down")
+
+    result = scorer.score_batch(papers, evaluate_inclusion=False, save_callback=save)
+
+    assert [p.paper.document_id for p in result.scored_papers] == [0, 2]
+    assert [paper.document_id for paper, _ in result.failed_papers] == [1]
+
+
+def test_review_agent_scoring_agent_uses_all_ollama_hosts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """SystematicReviewAgent builds its scoring agent over every configured host."""
+    from bmlibrarian import config
+    from bmlibrarian.agents.systematic_review.agent import SystematicReviewAgent
+
+    hosts = ["http://gpu1:11434", "http://gpu2:11434"]
+    monkeypatch.setattr(config, "get_model", lambda name: "test-model")
+    monkeypatch.setattr(config, "get_ollama_host", lambda: hosts[0])
+    monkeypatch.setattr(config, "get_ollama_hosts", lambda: list(hosts))
+    monkeypatch.setattr(config, "get_agent_config",
+                        lambda name: {"max_concurrent_requests": 2})
+    review_agent = SystematicReviewAgent.__new__(SystematicReviewAgent)
+    review_agent._scoring_agent = None
+    review_agent.callback = None
+    review_agent.orchestrator = None
+
+    agent = review_agent._get_scoring_agent()
+
+    assert review_agent._get_scoring_agent() is agent
+    assert [agent._next_llm_client().ollama_host for _ in range(2)] == hosts
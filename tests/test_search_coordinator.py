@@ -6,6 +6,8 @@ including unit tests with mocked database and Ollama responses, and integration
 that can optionally run against a real database and Ollama server.
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, List, Any
@@ -248,12 +250,17 @@ class TestSemanticSearch:
 
 
 class TestHyDESearch:
-    """Tests for HyDE search functionality.
+    """Tests for the server-side HyDE fallback.
 
-    Note: HyDE search now uses PostgreSQL's semantic_docsearch() function
-    which handles embedding generation server-side.
+    Client-side embedding is forced to fail, so each abstract goes through
+    PostgreSQL's semantic_docsearch() function.
     """
 
+    @pytest.fixture(autouse=True)
+    def no_client_embeddings(self):
+        with patch.object(SearchCoordinator, "_embed_abstracts", return_value=None):
+            yield
+
     @patch("bmlibrarian.paperchecker.components.search_coordinator.get_db_manager")
     def test_hyde_search_returns_deduplicated_ids(self, mock_get_db, search_config):
         """Test HyDE search returns deduplicated document IDs."""
@@ -367,6 +374,83 @@ class TestHyDESearch:
         assert results == []
 
 
+class TestBatchedHyDESearch:
+    """Tests for HyDE search with client-side batch embedding."""
+
+    @pytest.fixture
+    def coordinator(self, search_config):
+        with patch(
+            "bmlibrarian.paperchecker.components.search_coordinator.get_db_manager"
+        ):
+            coordinator = SearchCoordinator(config=search_config)
+        coordinator._llm_client = MagicMock()
+        coordinator._llm_client.embed_batch.side_effect = lambda texts, model: Mock(
+            embeddings=[[0.1, 0.2] for _ in texts]
+        )
+        conn = coordinator.db_manager.get_connection.return_value.__enter__.return_value
+        self.cursor = conn.cursor.return_value.__enter__.return_value
+        with patch(
+            "bmlibrarian.paperchecker.components.search_coordinator.vector_param",
+            side_effect=lambda conn, vector: vector,
+        ):
+            yield coordinator
+
+    def test_all_abstracts_share_one_embed_call_and_one_query(self, coordinator):
+        """Abstracts are embedded together and searched in one statement."""
+        self.cursor.fetchall.return_value = [
+            (0, 123, 0.9), (0, 456, 0.8), (1, 123, 0.85), (1, 789, 0.7),
+        ]
+
+        results = coordinator.search_hyde(
+            hyde_abstracts=["abstract1", "abstract2"], limit=10
+        )
+
+        assert results == [123, 456, 789]
+        coordinator._llm_client.embed_batch.assert_called_once()
+        assert coordinator._llm_client.embed_batch.call_args.args[0] == [
+            "abstract1", "abstract2"
+        ]
+        # SET LOCAL statement_timeout, then the multi-vector search
+        assert self.cursor.execute.call_count == 2
+        sql, params = self.cursor.execute.call_args.args
+        assert "semantic_docsearch" not in sql
+        assert sql.count("%s") == len(params) == 6
+        assert params[-1] == 10
+
+    def test_timeout_scales_with_vector_count(self, coordinator):
+        """The single statement gets the per-query timeout once per vector."""
+        self.cursor.fetchall.return_value = []
+
+        coordinator.search_hyde(hyde_abstracts=["a1", "a2", "a3"], limit=10)
+
+        set_timeout = self.cursor.execute.call_args_list[0].args[0]
+        assert set_timeout == (
+            f"SET LOCAL statement_timeout = '{coordinator.query_timeout_ms * 3}ms'"
+        )
+
+    def test_timeout_returns_empty(self, coordinator):
+        """A timed-out search does not fail the whole strategy."""
+        self.cursor.execute.side_effect = [
+            None, Exception("canceling statement due to statement timeout")
+        ]
+
+        assert coordinator.search_hyde(hyde_abstracts=["abstract1"], limit=10) == []
+
+    def test_embedding_failure_falls_back_to_server_side(self, coordinator):
+        """Without client-side vectors each abstract uses semantic_docsearch()."""
+        coordinator._llm_client.embed_batch.side_effect = ConnectionError("down")
+        self.cursor.fetchall.return_value = [(123, 0.9)]
+
+        results = coordinator.search_hyde(
+            hyde_abstracts=["abstract1", "abstract2"], limit=10
+        )
+
+        assert results == [123]
+        searches = [c.args[0] for c in self.cursor.execute.call_args_list[1::2]]
+        assert len(searches) == 2
+        assert all("semantic_docsearch" in sql for sql in searches)
+
+
 # Unit Tests - Keyword Search
 
 
@@ -546,6 +630,54 @@ class TestFullSearch:
                         coordinator.search(sample_counter_statement)
 
 
+    @patch("bmlibrarian.paperchecker.components.search_coordinator.get_db_manager")
+    def test_search_runs_strategies_concurrently(
+        self, mock_get_db, search_config, sample_counter_statement
+    ):
+        """Test that strategies overlap and per-strategy times are recorded."""
+        mock_get_db.return_value = MagicMock()
+
+        coordinator = SearchCoordinator(config=search_config)
+
+        def slow(docs):
+            def run(**kwargs):
+                time.sleep(0.2)
+                return docs
+            return run
+
+        with patch.object(coordinator, "search_semantic", side_effect=slow([1, 2])):
+            with patch.object(coordinator, "search_hyde", side_effect=slow([2, 3])):
+                with patch.object(coordinator, "search_keyword", side_effect=slow([4])):
+                    start = time.monotonic()
+                    results = coordinator.search(sample_counter_statement)
+                    elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5  # not the 0.6s sum
+        assert results.semantic_docs == [1, 2]
+        assert results.hyde_docs == [2, 3]
+        assert results.keyword_docs == [4]
+        times = results.search_metadata["strategy_times_seconds"]
+        assert set(times) == {"semantic", "hyde", "keyword"}
+        assert all(t >= 0.2 for t in times.values())
+
+    @patch("bmlibrarian.paperchecker.components.search_coordinator.get_db_manager")
+    def test_search_sequential_when_parallel_disabled(
+        self, mock_get_db, search_config, sample_counter_statement
+    ):
+        """Test parallel_strategies=False runs strategies one after another."""
+        mock_get_db.return_value = MagicMock()
+
+        coordinator = SearchCoordinator(config={**search_config, "parallel_strategies": False})
+        calls = []
+
+        with patch.object(coordinator, "search_semantic", side_effect=lambda **kw: calls.append("semantic") or [1]):
+            with patch.object(coordinator, "search_hyde", side_effect=lambda **kw: calls.append("hyde") or [2]):
+                with patch.object(coordinator, "search_keyword", side_effect=lambda **kw: calls.append("keyword") or [3]):
+                    results = coordinator.search(sample_counter_statement)
+
+        assert calls == ["semantic", "hyde", "keyword"]
+        assert results.search_metadata["parallel_strategies"] is False
+
 # Unit Tests - Prioritization
 
 
@@ -1479,6 +1479,94 @@ class TestFilterPerformance:
         assert result.total_processed == 1000
 
 
+class TestSinglePassKeywordMatching:
+    """Tests for the compiled keyword matchers and windowed context checks."""
+
+    @pytest.fixture
+    def filter_obj(self) -> InitialFilter:
+        criteria = SearchCriteria(
+            research_question="Test question",
+            purpose="Matching test",
+            inclusion_criteria=["Human studies"],
+            exclusion_criteria=["Animal studies", "Case reports"],
+            target_study_types=[StudyTypeFilter.RCT],
+        )
+        return InitialFilter(criteria, custom_exclusion_keywords=["double-blind"])
+
+    def test_negative_context_does_not_cross_punctuation(
+        self, filter_obj: InitialFilter
+    ) -> None:
+        """Negative context before the keyword's sentence does not protect it."""
+        text = "we excluded adults. this case report describes a patient"
+
+        assert not filter_obj._has_negative_context(text, "case report")
+        assert filter_obj._has_negative_context(
+            "we excluded case reports", "case report"
+        )
+
+    def test_any_protected_occurrence_protects_keyword(
+        self, filter_obj: InitialFilter
+    ) -> None:
+        """As with a whole-text search, one protected hit is enough."""
+        text = "a case report. we excluded case reports from the review"
+
+        assert filter_obj._has_negative_context(text, "case report")
+
+    def test_keyword_containing_punctuation(self, filter_obj: InitialFilter) -> None:
+        """Context windows start and end outside the keyword itself."""
+        assert filter_obj._has_negative_context(
+            "unlike double-blind trials, we", "double-blind"
+        )
+
+    def test_study_type_matcher(self, filter_obj: InitialFilter) -> None:
+        paper = PaperData(
+            document_id=1, title="A randomized controlled trial", authors=[], year=2020,
+        )
+
+        assert filter_obj._check_study_type_keywords(paper) is None
+        assert filter_obj._study_type_matcher.search("a randomized controlled trial")
+
+    def test_process_pool_batch_matches_in_process(
+        self, filter_obj: InitialFilter
+    ) -> None:
+        """Filtering in worker processes gives the same results, in order."""
+        titles = [
+            "Randomized trial of drug X",
+            "Case report: rare reaction",
+            "Drug X in a mouse model",
+            "We excluded animal studies and pooled trials",
+        ]
+        papers = [
+            PaperData(
+                document_id=i,
+                title=titles[i % len(titles)],
+                authors=["Author A"],
+                year=2020,
+                abstract="This is a sufficiently long test abstract. " * 3,
+                full_text="Full text is not sent to workers.",
+            )
+            for i in range(40)
+        ]
+        progress: List[Any] = []
+
+        sequential = filter_obj.filter_batch(papers)
+        parallel = filter_obj.filter_batch(
+            papers,
+            progress_callback=lambda c, t: progress.append((c, t)),
+            processes=2,
+            chunk_size=15,
+        )
+
+        assert parallel.passed == sequential.passed
+        assert parallel.rejected == sequential.rejected
+        assert parallel.passed[0].full_text == "Full text is not sent to workers."
+        assert progress == [(15, 40), (30, 40), (40, 40)]
+
+    def test_rejects_invalid_chunk_size(self, filter_obj: InitialFilter) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            filter_obj.filter_batch([], chunk_size=0)
+
+
 # =============================================================================
 # Edge Case Tests
 # =============================================================================
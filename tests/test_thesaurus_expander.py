@@ -248,17 +248,15 @@ class TestThesaurusExpander:
         """Test query expansion with expandable terms."""
         cursor = expander._mock_cursor
 
-        # Setup mock to return different results for different terms
+        # Setup mock to return batched rows only for "mi"
         def mock_execute(query, params):
-            term = params[0] if params else ""
-            if term.lower() == "mi":
-                cursor.fetchall.return_value = [
-                    {'term': 'MI', 'term_type': 'abbreviation', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'is_input_term': True},
-                    {'term': 'Myocardial Infarction', 'term_type': 'preferred', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'is_input_term': False},
-                    {'term': 'Heart Attack', 'term_type': 'synonym', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'is_input_term': False}
-                ]
-            else:
-                cursor.fetchall.return_value = []
+            terms = [t.lower() for t in params['terms']]
+            ord_ = terms.index("mi") + 1 if "mi" in terms else None
+            cursor.fetchall.return_value = [] if ord_ is None else [
+                {'ord': ord_, 'relation': 0, 'term': 'MI', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'pos': 1},
+                {'ord': ord_, 'relation': 0, 'term': 'Myocardial Infarction', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'pos': 2},
+                {'ord': ord_, 'relation': 0, 'term': 'Heart Attack', 'preferred_term': 'Myocardial Infarction', 'concept_id': 1, 'pos': 3}
+            ]
 
         cursor.execute.side_effect = mock_execute
 
@@ -268,6 +266,49 @@ class TestThesaurusExpander:
         # Should contain expanded terms for "mi"
         assert "Myocardial Infarction" in expanded.lower() or "myocardial infarction" in expanded.lower()
 
+    def test_expand_terms_uses_one_batched_call(self, expander):
+        """Uncached terms and their hierarchy lookups share one SQL call."""
+        cursor = expander._mock_cursor
+        expander.include_broader_terms = True
+        cursor.fetchall.return_value = [
+            {'ord': 2, 'relation': 0, 'term': 'aspirin', 'preferred_term': 'Aspirin', 'concept_id': 2, 'pos': 1},
+            {'ord': 2, 'relation': 0, 'term': 'ASA', 'preferred_term': 'Aspirin', 'concept_id': 2, 'pos': 2},
+            {'ord': 2, 'relation': 1, 'term': 'Salicylates', 'preferred_term': None, 'concept_id': 3, 'pos': 1},
+            {'ord': 1, 'relation': 1, 'term': 'Ignored', 'preferred_term': None, 'concept_id': 4, 'pos': 1},
+        ]
+
+        expansions = expander.expand_terms(["unknownterm", "aspirin", "a"])
+        again = expander.expand_terms(["Aspirin", "unknownterm"])
+
+        assert cursor.execute.call_count == 1
+        assert cursor.execute.call_args[0][1]['terms'] == ["unknownterm", "aspirin"]
+        assert expansions["aspirin"].all_variants == ["aspirin", "ASA", "Salicylates"]
+        assert expansions["unknownterm"].expansion_type == "none"
+        assert expansions["a"].expansion_type == "none"
+        assert again["Aspirin"] is expansions["aspirin"]
+
+    def test_cache_evicts_least_recently_used(self, expander):
+        """A cache hit protects an entry from the next eviction."""
+        expander.cache_max_size = 2
+        expander._mock_cursor.fetchall.return_value = []
+
+        expander.expand_terms(["first", "second"])
+        expander.expand_term("first")
+        expander.expand_term("third")
+
+        assert list(expander._expansion_cache) == ["first", "third"]
+
+    def test_warm_cache_preloads_most_frequent_terms(self, expander, tmp_path):
+        """Warming expands the top query-log terms in a single call."""
+        log = tmp_path / "queries.log"
+        log.write_text("# past queries\naspirin & heart\naspirin | stroke\n\naspirin & heart\n")
+        expander._mock_cursor.fetchall.return_value = []
+
+        assert expander.warm_cache_from_log(log, max_terms=2) == 2
+
+        assert expander._mock_cursor.execute.call_count == 1
+        assert set(expander._expansion_cache) == {"aspirin", "heart"}
+
     def test_expand_query_empty_string(self, expander):
         """Test query expansion with empty string."""
         expanded = expander.expand_query("")